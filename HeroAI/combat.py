@@ -3,12 +3,11 @@ from Py4GWCoreLib import GLOBAL_CACHE, SpiritModelID, Timer, ThrottledTimer, Rou
 from Py4GWCoreLib import Weapon
 from Py4GWCoreLib.enums import SPIRIT_BUFF_MAP
 from .custom_skill import CustomSkillClass
-from .targeting import TargetLowestAlly, TargetLowestAllyEnergy, TargetClusteredEnemy, TargetLowestAllyCaster, TargetLowestAllyMartial, TargetLowestAllyMelee, TargetLowestAllyRanged, GetAllAlliesArray
+from .targeting import TargetLowestAlly, TargetLowestAllyEnergy, TargetClusteredEnemy, TargetLowestAllyCaster, TargetLowestAllyMartial, TargetLowestAllyMelee, GetAllAlliesArray
 from .targeting import GetEnemyAttacking, GetEnemyCasting, GetEnemyCastingSpell, GetEnemyInjured, GetEnemyConditioned, GetEnemyHealthy
 from .targeting import GetEnemyHexed, GetEnemyDegenHexed, GetEnemyEnchanted, GetEnemyMoving, GetEnemyKnockedDown
 from .targeting import GetEnemyBleeding, GetEnemyPoisoned, GetEnemyCrippled
 from .types import SkillNature, Skilltarget, SkillType
-from .constants import MAX_NUM_PLAYERS
 from typing import Optional
 
 
@@ -57,6 +56,11 @@ class CombatClass:
         self.nearest_spirit = Routines.Agents.GetNearestSpirit(Range.Spellcast.value)
         self.lowest_minion = Routines.Agents.GetLowestMinion(Range.Spellcast.value)
         self.nearest_corpse = Routines.Agents.GetNearestCorpse(Range.Spellcast.value)
+
+        # Target candidates shared by all skill slots until the agent arrays refresh
+        self.targeting_generation = -1
+        self.target_candidates = {}
+        self.target_dispatch = self._BuildTargetDispatch()
         
         self.energy_drain = GLOBAL_CACHE.Skill.GetID("Energy_Drain") 
         self.energy_tap = GLOBAL_CACHE.Skill.GetID("Energy_Tap")
@@ -265,10 +269,9 @@ class CombatClass:
         return self.skill_pointer
             
     def GetEnergyValues(self,agent_id):
-        for i in range(MAX_NUM_PLAYERS):
-            player_data = self.shared_memory_handler.get_player(i)
-            if player_data and player_data["IsActive"] and player_data["PlayerID"] == agent_id:
-                return player_data["Energy"]
+        player_data = self.shared_memory_handler.get_player_by_agent_id(agent_id)
+        if player_data is not None:
+            return player_data.Energy
         return 1.0 #default return full energy to prevent issues
 
     def IsSkillReady(self, slot):
@@ -326,146 +329,113 @@ class CombatClass:
     def get_combat_distance(self):
         return Range.Spellcast.value if self.in_aggro else Range.Earshot.value
 
-    def GetAppropiateTarget(self, slot):
-        v_target = 0
+    #region Targeting
+    def _BuildTargetDispatch(self):
+        """Skilltarget -> (resolver, candidate getter). Anything not listed resolves like Skilltarget.Enemy."""
+        agents = Routines.Agents
+        return {
+            Skilltarget.Enemy: (self._ResolvePartyTarget, None),
+            Skilltarget.EnemyCaster: (self._ResolveEnemy, agents.GetNearestEnemyCaster),
+            Skilltarget.EnemyMartial: (self._ResolveEnemy, agents.GetNearestEnemyMartial),
+            Skilltarget.EnemyMartialMelee: (self._ResolveEnemy, agents.GetNearestEnemyMelee),
+            Skilltarget.EnemyClustered: (self._ResolveEnemy, TargetClusteredEnemy),
+            Skilltarget.EnemyAttacking: (self._ResolveEnemy, GetEnemyAttacking),
+            Skilltarget.EnemyCasting: (self._ResolveEnemy, GetEnemyCasting),
+            Skilltarget.EnemyCastingSpell: (self._ResolveEnemy, GetEnemyCastingSpell),
+            Skilltarget.EnemyInjured: (self._ResolveEnemy, GetEnemyInjured),
+            Skilltarget.EnemyConditioned: (self._ResolveEnemy, GetEnemyConditioned),
+            Skilltarget.EnemyBleeding: (self._ResolveEnemy, GetEnemyBleeding),
+            Skilltarget.EnemyPoisoned: (self._ResolveEnemy, GetEnemyPoisoned),
+            Skilltarget.EnemyCrippled: (self._ResolveEnemy, GetEnemyCrippled),
+            Skilltarget.EnemyHexed: (self._ResolveEnemy, GetEnemyHexed),
+            Skilltarget.EnemyDegenHexed: (self._ResolveEnemy, GetEnemyDegenHexed),
+            Skilltarget.EnemyEnchanted: (self._ResolveEnemy, GetEnemyEnchanted),
+            Skilltarget.EnemyMoving: (self._ResolveEnemy, GetEnemyMoving),
+            Skilltarget.EnemyKnockedDown: (self._ResolveEnemy, GetEnemyKnockedDown),
+            # AllyMartialRanged has always picked the nearest ranged enemy; kept as is
+            Skilltarget.AllyMartialRanged: (self._ResolveEnemy, agents.GetNearestEnemyRanged),
+            Skilltarget.Ally: (self._ResolveAlly, TargetLowestAlly),
+            Skilltarget.AllyCaster: (self._ResolveAlly, TargetLowestAllyCaster),
+            Skilltarget.AllyMartial: (self._ResolveAlly, TargetLowestAllyMartial),
+            Skilltarget.AllyMartialMelee: (self._ResolveAlly, TargetLowestAllyMelee),
+            Skilltarget.OtherAlly: (self._ResolveOtherAlly, None),
+            Skilltarget.Self: (self._ResolveSelf, None),
+            Skilltarget.Pet: (self._ResolvePet, None),
+            Skilltarget.DeadAlly: (self._ResolveInSpellcastRange, agents.GetDeadAlly),
+            Skilltarget.Spirit: (self._ResolveInSpellcastRange, agents.GetNearestSpirit),
+            Skilltarget.Minion: (self._ResolveInSpellcastRange, agents.GetLowestMinion),
+            Skilltarget.Corpse: (self._ResolveInSpellcastRange, agents.GetNearestCorpse),
+        }
+
+    def _GetCandidate(self, getter, *args, **kwargs):
+        """
+        Result of a targeting query, computed at most once until the agent arrays are refreshed.
+        Every skill slot handled in between shares the same candidates.
+        """
+        generation = GLOBAL_CACHE._RawAgentArray.generation
+        if generation != self.targeting_generation:
+            self.targeting_generation = generation
+            self.target_candidates.clear()
+
+        key = (getter, args, tuple(kwargs.items()))
+        if key not in self.target_candidates:
+            self.target_candidates[key] = getter(*args, **kwargs)
+        return self.target_candidates[key]
+
+    def _NearestEnemy(self):
+        return self._GetCandidate(Routines.Agents.GetNearestEnemy, self.get_combat_distance())
+
+    def _LowestAlly(self, skill_id):
+        return self._GetCandidate(TargetLowestAlly, filter_skill_id=skill_id)
+
+    def _ResolvePartyTarget(self, skill, getter, targeting_strict):
+        v_target = self.GetPartyTarget()
+        if v_target == 0:
+            v_target = self._NearestEnemy()
+        return v_target
+
+    def _ResolveEnemy(self, skill, getter, targeting_strict):
+        v_target = self._GetCandidate(getter, self.get_combat_distance())
+        if v_target == 0 and not targeting_strict:
+            v_target = self._NearestEnemy()
+        return v_target
+
+    def _ResolveAlly(self, skill, getter, targeting_strict):
+        v_target = self._GetCandidate(getter, filter_skill_id=skill.skill_id)
+        if v_target == 0 and not targeting_strict:
+            v_target = self._LowestAlly(skill.skill_id)
+        return v_target
+
+    def _ResolveOtherAlly(self, skill, getter, targeting_strict):
+        if skill.custom_skill_data.Nature == SkillNature.EnergyBuff.value:
+            return self._GetCandidate(TargetLowestAllyEnergy, other_ally=True, filter_skill_id=skill.skill_id)
+        return self._GetCandidate(TargetLowestAlly, other_ally=True, filter_skill_id=skill.skill_id)
+
+    def _ResolveSelf(self, skill, getter, targeting_strict):
+        return GLOBAL_CACHE.Player.GetAgentID()
+
+    def _ResolvePet(self, skill, getter, targeting_strict):
+        return GLOBAL_CACHE.Party.Pets.GetPetID(GLOBAL_CACHE.Player.GetAgentID())
 
+    def _ResolveInSpellcastRange(self, skill, getter, targeting_strict):
+        return self._GetCandidate(getter, Range.Spellcast.value)
+
+    def GetAppropiateTarget(self, slot):
         if not self.is_targeting_enabled:
             return GLOBAL_CACHE.Player.GetTargetID()
 
-        targeting_strict = self.skills[slot].custom_skill_data.Conditions.TargetingStrict
-        target_allegiance = self.skills[slot].custom_skill_data.TargetAllegiance
-        
-        
-        nearest_enemy = Routines.Agents.GetNearestEnemy(self.get_combat_distance())
-        lowest_ally = TargetLowestAlly(filter_skill_id=self.skills[slot].skill_id)
-
-        if self.skills[slot].skill_id == self.heroic_refrain:
+        skill = self.skills[slot]
+        if skill.skill_id == self.heroic_refrain:
             if not self.HasEffect(GLOBAL_CACHE.Player.GetAgentID(), self.heroic_refrain):
                 return GLOBAL_CACHE.Player.GetAgentID()
 
-        if target_allegiance == Skilltarget.Enemy:
-            v_target = self.GetPartyTarget()
-            if v_target == 0:
-                v_target = nearest_enemy
-        elif target_allegiance == Skilltarget.EnemyCaster:
-            v_target = Routines.Agents.GetNearestEnemyCaster(self.get_combat_distance())
-            if v_target == 0 and not targeting_strict:
-                v_target =nearest_enemy
-        elif target_allegiance == Skilltarget.EnemyMartial:
-            v_target = Routines.Agents.GetNearestEnemyMartial(self.get_combat_distance())
-            if v_target == 0 and not targeting_strict:
-                v_target = nearest_enemy
-        elif target_allegiance == Skilltarget.EnemyMartialMelee:
-            v_target = Routines.Agents.GetNearestEnemyMelee(self.get_combat_distance())
-            if v_target == 0 and not targeting_strict:
-                v_target = nearest_enemy
-        elif target_allegiance == Skilltarget.EnemyClustered:
-            v_target = TargetClusteredEnemy(self.get_combat_distance())
-            if v_target == 0 and not targeting_strict:
-                v_target = nearest_enemy
-        elif target_allegiance == Skilltarget.EnemyAttacking:
-            v_target = GetEnemyAttacking(self.get_combat_distance())
-            if v_target == 0 and not targeting_strict:
-                v_target = nearest_enemy
-        elif target_allegiance == Skilltarget.EnemyCasting:
-            v_target = GetEnemyCasting(self.get_combat_distance())
-            if v_target == 0 and not targeting_strict:
-                v_target = nearest_enemy          
-        elif target_allegiance == Skilltarget.EnemyCastingSpell:
-            v_target = GetEnemyCastingSpell(self.get_combat_distance())
-            if v_target == 0 and not targeting_strict:
-                v_target = nearest_enemy
-        elif target_allegiance == Skilltarget.EnemyInjured:
-            v_target = GetEnemyInjured(self.get_combat_distance())
-            if v_target == 0 and not targeting_strict:
-                v_target = nearest_enemy
-        elif target_allegiance == Skilltarget.EnemyConditioned:
-            v_target = GetEnemyConditioned(self.get_combat_distance())
-            if v_target == 0 and not targeting_strict:
-                v_target = nearest_enemy
-        elif target_allegiance == Skilltarget.EnemyBleeding:
-            v_target = GetEnemyBleeding(self.get_combat_distance())
-            if v_target == 0 and not targeting_strict:
-                v_target = nearest_enemy
-        elif target_allegiance == Skilltarget.EnemyPoisoned:
-            v_target = GetEnemyPoisoned(self.get_combat_distance())
-            if v_target == 0 and not targeting_strict:
-                v_target = nearest_enemy
-        elif target_allegiance == Skilltarget.EnemyCrippled:
-            v_target = GetEnemyCrippled(self.get_combat_distance())
-            if v_target == 0 and not targeting_strict:
-                v_target = nearest_enemy
-        elif target_allegiance == Skilltarget.EnemyHexed:
-            v_target = GetEnemyHexed(self.get_combat_distance())
-            if v_target == 0 and not targeting_strict:
-                v_target = nearest_enemy
-        elif target_allegiance == Skilltarget.EnemyDegenHexed:
-            v_target = GetEnemyDegenHexed(self.get_combat_distance())
-            if v_target == 0 and not targeting_strict:
-                v_target = nearest_enemy
-        elif target_allegiance == Skilltarget.EnemyEnchanted:
-            v_target = GetEnemyEnchanted(self.get_combat_distance())
-            if v_target == 0 and not targeting_strict:
-                v_target = nearest_enemy
-        elif target_allegiance == Skilltarget.EnemyMoving:
-            v_target = GetEnemyMoving(self.get_combat_distance())
-            if v_target == 0 and not targeting_strict:
-                v_target = nearest_enemy
-        elif target_allegiance == Skilltarget.EnemyKnockedDown:
-            v_target = GetEnemyKnockedDown(self.get_combat_distance())
-            if v_target == 0 and not targeting_strict:
-                v_target = nearest_enemy           
-        elif target_allegiance == Skilltarget.AllyMartialRanged:
-            v_target = Routines.Agents.GetNearestEnemyRanged(self.get_combat_distance())
-            if v_target == 0 and not targeting_strict:
-                v_target = nearest_enemy
-        elif target_allegiance == Skilltarget.Ally:
-            v_target = lowest_ally
-        elif target_allegiance == Skilltarget.AllyCaster:
-            v_target = TargetLowestAllyCaster(filter_skill_id=self.skills[slot].skill_id)
-            if v_target == 0 and not targeting_strict:
-                v_target = lowest_ally
-        elif target_allegiance == Skilltarget.AllyMartial:
-            v_target = TargetLowestAllyMartial(filter_skill_id=self.skills[slot].skill_id)
-            if v_target == 0 and not targeting_strict:
-                v_target = lowest_ally
-        elif target_allegiance == Skilltarget.AllyMartialMelee:
-            v_target = TargetLowestAllyMelee(filter_skill_id=self.skills[slot].skill_id)
-            if v_target == 0 and not targeting_strict:
-                v_target = lowest_ally
-        elif target_allegiance == Skilltarget.AllyMartialRanged:
-            v_target = TargetLowestAllyRanged(filter_skill_id=self.skills[slot].skill_id)
-            if v_target == 0 and not targeting_strict:
-                v_target = lowest_ally
-        elif target_allegiance == Skilltarget.OtherAlly:
-            if self.skills[slot].custom_skill_data.Nature == SkillNature.EnergyBuff.value:
-                v_target = TargetLowestAllyEnergy(other_ally=True, filter_skill_id=self.skills[slot].skill_id)
-                #print("Energy Buff Target: ", RawAgentArray().get_name(v_target))
-            else:
-                v_target = TargetLowestAlly(other_ally=True, filter_skill_id=self.skills[slot].skill_id)
-        elif target_allegiance == Skilltarget.Self:
-            v_target = GLOBAL_CACHE.Player.GetAgentID()
-        elif target_allegiance == Skilltarget.Pet:
-            v_target = GLOBAL_CACHE.Party.Pets.GetPetID(GLOBAL_CACHE.Player.GetAgentID())
-        elif target_allegiance == Skilltarget.DeadAlly:
-            v_target = Routines.Agents.GetDeadAlly(Range.Spellcast.value)
-        elif target_allegiance == Skilltarget.Spirit:
-            v_target = Routines.Agents.GetNearestSpirit(Range.Spellcast.value)
-        elif target_allegiance == Skilltarget.Minion:
-            v_target = Routines.Agents.GetLowestMinion(Range.Spellcast.value)
-        elif target_allegiance == Skilltarget.Corpse:
-            v_target = Routines.Agents.GetNearestCorpse(Range.Spellcast.value)
-        else:
-            v_target = self.GetPartyTarget()
-            if v_target == 0:
-                v_target = nearest_enemy
-        return v_target
+        resolver, getter = self.target_dispatch.get(skill.custom_skill_data.TargetAllegiance, (self._ResolvePartyTarget, None))
+        return resolver(skill, getter, skill.custom_skill_data.Conditions.TargetingStrict)
+    #endregion
 
     def IsPartyMember(self, agent_id):
-        for i in range(MAX_NUM_PLAYERS):
-            player_data = self.shared_memory_handler.get_player(i)
-            if player_data and player_data["IsActive"] and player_data["PlayerID"] == agent_id:
-                return True
+        if self.shared_memory_handler.get_player_index(agent_id) != -1:
+            return True
             
         allegiance , _ = GLOBAL_CACHE.Agent.GetAllegiance(agent_id)
         if (allegiance == Allegiance.SpiritPet.value and 
@@ -482,10 +452,8 @@ class CombatClass:
 
 
         if self.IsPartyMember(agent_id):
-            player_buffs = self.shared_memory_handler.get_agent_buffs(agent_id)
-            for buff in player_buffs:                
-                if buff == skill_id or buff in shared_effects:
-                    result = True
+            player_buffs = self.shared_memory_handler.get_agent_buff_set(agent_id)
+            result = skill_id in player_buffs or any(shared_buff in player_buffs for shared_buff in shared_effects)
         else:
             result = (
                 GLOBAL_CACHE.Effects.BuffExists(agent_id, skill_id) 
@@ -832,11 +800,9 @@ class CombatClass:
         
         if Conditions.LessEnergy != 0:
             if self.IsPartyMember(vTarget):
-                for i in range(MAX_NUM_PLAYERS):
-                    player_data = self.shared_memory_handler.get_player(i)
-                    if player_data and player_data["IsActive"] and player_data["PlayerID"] == vTarget:
-                        if player_data["Energy"] < Conditions.LessEnergy:
-                            number_of_features += 1
+                player_data = self.shared_memory_handler.get_player_by_agent_id(vTarget)
+                if player_data is not None and player_data.Energy < Conditions.LessEnergy:
+                    number_of_features += 1
             else:
                 number_of_features += 1 #henchmen, allies, pets or something else thats not reporting energy
 
@@ -14,7 +14,8 @@ WINDOWS_MODULE_NAME = "HeroAI - Window - "
 """shared memory constants"""
 MAX_NUM_PLAYERS = 12
 NUMBER_OF_SKILLS = 8
-MAX_NUMBER_OF_BUFFS = 240
+MAX_NUMBER_OF_BUFF_AGENTS = 24 # party members and pets with a buff bucket
+MAX_BUFFS_PER_AGENT = 40
 SHARED_MEMORY_FILE_NAME = "HeroAI_Mem"
 LOCK_MUTEX_TIMEOUT = 1 #SECONDS
 SUBSCRIBE_TIMEOUT_SECONDS = 500 # milliseconds
@@ -100,7 +100,7 @@ class Settings:
             self.save_requested = True  
         
         self.account_ini_handler : IniHandler | None = None
-        self.ini_handler = IniHandler(self.ini_path)
+        self.ini_handler = IniHandler(self.ini_path, flush_delay_ms=1000)
             
         self.Anonymous_PanelNames = False
         self.ShowCommandPanel = True
@@ -188,7 +188,7 @@ class Settings:
             config_dir = os.path.join(base_path, "Widgets", "Config", "Accounts", account_email)
             os.makedirs(config_dir, exist_ok=True)
             self.account_ini_path = os.path.join(config_dir, "HeroAI.ini")
-            self.account_ini_handler = IniHandler(self.account_ini_path)
+            self.account_ini_handler = IniHandler(self.account_ini_path, flush_delay_ms=1000)
             self.account_email = account_email
                     
         self._initialized = True if account_email and account_email == self.account_email else False
@@ -216,42 +216,44 @@ class Settings:
         
         ConsoleLog("HeroAI", "Saving HeroAI settings...")
         
-        self.ini_handler.write_key("General", "ShowCommandPanel", str(self.ShowCommandPanel))
-        self.ini_handler.write_key("General", "ShowCommandPanelOnlyOnLeaderAccount", str(self.ShowCommandPanelOnlyOnLeaderAccount))
-        self.ini_handler.write_key("General", "Anonymous_PanelNames", str(self.Anonymous_PanelNames))
+        with self.ini_handler.batch():
+            self.ini_handler.write_key("General", "ShowCommandPanel", str(self.ShowCommandPanel))
+            self.ini_handler.write_key("General", "ShowCommandPanelOnlyOnLeaderAccount", str(self.ShowCommandPanelOnlyOnLeaderAccount))
+            self.ini_handler.write_key("General", "Anonymous_PanelNames", str(self.Anonymous_PanelNames))
         
-        self.ini_handler.write_key("General", "ShowPanelOnlyOnLeaderAccount", str(self.ShowPanelOnlyOnLeaderAccount))
-        self.ini_handler.write_key("General", "DisableAutomationOnLeaderAccount", str(self.DisableAutomationOnLeaderAccount))
-        self.ini_handler.write_key("General", "ShowDialogOverlay", str(self.ShowDialogOverlay))
+            self.ini_handler.write_key("General", "ShowPanelOnlyOnLeaderAccount", str(self.ShowPanelOnlyOnLeaderAccount))
+            self.ini_handler.write_key("General", "DisableAutomationOnLeaderAccount", str(self.DisableAutomationOnLeaderAccount))
+            self.ini_handler.write_key("General", "ShowDialogOverlay", str(self.ShowDialogOverlay))
         
-        self.ini_handler.write_key("General", "CombinePanels", str(self.CombinePanels))
-        self.ini_handler.write_key("General", "ShowHeroPanels", str(self.ShowHeroPanels))
-        self.ini_handler.write_key("General", "ShowLeaderPanel", str(self.ShowLeaderPanel))
+            self.ini_handler.write_key("General", "CombinePanels", str(self.CombinePanels))
+            self.ini_handler.write_key("General", "ShowHeroPanels", str(self.ShowHeroPanels))
+            self.ini_handler.write_key("General", "ShowLeaderPanel", str(self.ShowLeaderPanel))
         
         
-        self.ini_handler.write_key("General", "ShowHeroEffects", str(self.ShowHeroEffects))
-        self.ini_handler.write_key("General", "ShowEffectDurations", str(self.ShowEffectDurations))
-        self.ini_handler.write_key("General", "ShowShortEffectDurations", str(self.ShowShortEffectDurations))
-        self.ini_handler.write_key("General", "ShowHeroUpkeeps", str(self.ShowHeroUpkeeps))
-        self.ini_handler.write_key("General", "MaxEffectRows", str(self.MaxEffectRows))
+            self.ini_handler.write_key("General", "ShowHeroEffects", str(self.ShowHeroEffects))
+            self.ini_handler.write_key("General", "ShowEffectDurations", str(self.ShowEffectDurations))
+            self.ini_handler.write_key("General", "ShowShortEffectDurations", str(self.ShowShortEffectDurations))
+            self.ini_handler.write_key("General", "ShowHeroUpkeeps", str(self.ShowHeroUpkeeps))
+            self.ini_handler.write_key("General", "MaxEffectRows", str(self.MaxEffectRows))
         
-        self.ini_handler.write_key("General", "ShowHeroButtons", str(self.ShowHeroButtons))
-        self.ini_handler.write_key("General", "ShowHeroBars", str(self.ShowHeroBars))
-        self.ini_handler.write_key("General", "ShowFloatingTargets", str(self.ShowFloatingTargets))
-        self.ini_handler.write_key("General", "ShowHeroSkills", str(self.ShowHeroSkills))
-        self.ini_handler.write_key("General", "ShowPartyPanelUI", str(self.ShowPartyPanelUI))
+            self.ini_handler.write_key("General", "ShowHeroButtons", str(self.ShowHeroButtons))
+            self.ini_handler.write_key("General", "ShowHeroBars", str(self.ShowHeroBars))
+            self.ini_handler.write_key("General", "ShowFloatingTargets", str(self.ShowFloatingTargets))
+            self.ini_handler.write_key("General", "ShowHeroSkills", str(self.ShowHeroSkills))
+            self.ini_handler.write_key("General", "ShowPartyPanelUI", str(self.ShowPartyPanelUI))
 
-        self.ini_handler.write_key("General", "ConfirmFollowPoint", str(self.ConfirmFollowPoint))
+            self.ini_handler.write_key("General", "ConfirmFollowPoint", str(self.ConfirmFollowPoint))
 
-        for hotbar_id, hotbar in self.CommandHotBars.items():
-            self.ini_handler.write_key("CommandHotBars", hotbar_id, hotbar.to_ini_string())
+            for hotbar_id, hotbar in self.CommandHotBars.items():
+                self.ini_handler.write_key("CommandHotBars", hotbar_id, hotbar.to_ini_string())
             
         if self.account_ini_handler is not None:
-            for hero_email, (x, y, w, h, collapsed) in self.HeroPanelPositions.items():
-                self.account_ini_handler.write_key("HeroPanelPositions", hero_email, f"{x},{y},{w},{h},{collapsed}")
+            with self.account_ini_handler.batch():
+                for hero_email, (x, y, w, h, collapsed) in self.HeroPanelPositions.items():
+                    self.account_ini_handler.write_key("HeroPanelPositions", hero_email, f"{x},{y},{w},{h},{collapsed}")
                             
-            for hotbar_id, hotbar in self.CommandHotBars.items():
-                self.account_ini_handler.write_key("CommandHotBars", hotbar_id, hotbar.to_pos_string())
+                for hotbar_id, hotbar in self.CommandHotBars.items():
+                    self.account_ini_handler.write_key("CommandHotBars", hotbar_id, hotbar.to_pos_string())
             
         self.save_requested = False
         
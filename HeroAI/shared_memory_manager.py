@@ -12,11 +12,16 @@ from .constants import (
     SHARED_MEMORY_FILE_NAME,
     LOCK_MUTEX_TIMEOUT,
     SUBSCRIBE_TIMEOUT_SECONDS,
-    MAX_NUMBER_OF_BUFFS,
+    MAX_NUMBER_OF_BUFF_AGENTS,
+    MAX_BUFFS_PER_AGENT,
 )
 
 from .types import (
     GameStruct,
+    PlayerView,
+    CandidateView,
+    GameOptionView,
+    BuffBucketView,
 )
 
 def get_base_timestamp():
@@ -52,6 +57,20 @@ class SharedMemoryManager:
             if self.shm.buf:
                 self.game_struct = GameStruct.from_buffer(self.shm.buf)
 
+            # Read-only views, created once and reused by every get_* call
+            self._player_views = [PlayerView(self.game_struct.Players[i]) for i in range(self.num_players)]
+            self._candidate_views = [CandidateView(self.game_struct.Candidates[i]) for i in range(self.num_players)]
+            self._game_option_views = [GameOptionView(self.game_struct.GameOptions[i]) for i in range(self.num_players)]
+            self._buff_bucket_views = [BuffBucketView(self.game_struct.BuffBuckets[i]) for i in range(MAX_NUMBER_OF_BUFF_AGENTS)]
+
+            # agent_id -> player index of the active players, rebuilt once per frame
+            self._player_index = {}
+            self._player_index_generation = -1
+
+            # Process local views of the buff buckets
+            self._buff_bucket_index = {}  # agent_id -> bucket index
+            self._buff_sets = {}          # bucket index -> (agent_id, generation, frozenset of buff ids)
+
             # Initialize default values
             for i in range(self.num_players):
                 self.reset_candidate(i)
@@ -94,7 +113,7 @@ class SharedMemoryManager:
             Py4GW.Console.Log(SMM_MODULE_NAME, f"Failed to set candidate {index}: {e}", Py4GW.Console.MessageType.Error)
 
     def get_candidate(self, index):
-        """Get a candidate structure and timeout check."""
+        """Read-only view of a candidate, after a timeout check."""
         try:
             if index < 0 or index >= self.num_players:
                 raise IndexError("Invalid candidate index.")
@@ -105,16 +124,7 @@ class SharedMemoryManager:
             if (current_offset - candidate.LastUpdated) > SUBSCRIBE_TIMEOUT_SECONDS:
                 self.reset_candidate(index)
 
-            # Return candidate data
-            return {
-                "PlayerID": candidate.PlayerID,
-                "MapID": candidate.MapID,
-                "MapRegion": candidate.MapRegion,
-                "MapDistrict": candidate.MapDistrict,
-                "InvitedBy": candidate.InvitedBy,
-                "SummonedBy": candidate.SummonedBy,
-                "LastUpdated": candidate.LastUpdated,
-            }
+            return self._candidate_views[index]
 
         except Exception as e:
             Py4GW.Console.Log(SMM_MODULE_NAME, f"Failed to get candidate {index}: {e}", Py4GW.Console.MessageType.Error)
@@ -223,7 +233,7 @@ class SharedMemoryManager:
             Py4GW.Console.Log(SMM_MODULE_NAME, f"Write failed for property {property_name} at index {player_index}: {e}", Py4GW.Console.MessageType.Error)
 
     def get_player(self, index):
-        """Read player data and timeout check."""
+        """Read-only view of the player data, after a timeout check."""
         try:
 
             player = self.game_struct.Players[index]
@@ -233,24 +243,39 @@ class SharedMemoryManager:
             if (current_offset - player.LastUpdated) > SUBSCRIBE_TIMEOUT_SECONDS:
                 self.reset_player(index)
 
-            data = {
-                "PlayerID": player.PlayerID,
-                "Energy_Regen": player.Energy_Regen,
-                "Energy": player.Energy,
-                "IsActive": player.IsActive,
-                "IsHero": player.IsHero,
-                "IsFlagged": player.IsFlagged,
-                "FlagPosX": player.FlagPosX,
-                "FlagPosY": player.FlagPosY,
-                "FollowAngle": player.FollowAngle,
-                "LastUpdated": player.LastUpdated,
-            }
-
-            return data
+            return self._player_views[index]
         except Exception as e:
             Py4GW.Console.Log(SMM_MODULE_NAME, f"Read failed for player {index}: {e}", Py4GW.Console.MessageType.Error)
             return None
 
+    def _refresh_player_index(self):
+        """Map the agent id of every active player to its index, at most once per frame."""
+        generation = GLOBAL_CACHE.FrameMemo.generation
+        if generation == self._player_index_generation:
+            return
+        self._player_index_generation = generation
+        self._player_index.clear()
+
+        current_offset = get_base_timestamp()
+        players = self.game_struct.Players
+        for index in range(self.num_players):
+            player = players[index]
+            if (current_offset - player.LastUpdated) > SUBSCRIBE_TIMEOUT_SECONDS:
+                self.reset_player(index)
+                continue
+            if player.IsActive and player.PlayerID != 0:
+                self._player_index.setdefault(player.PlayerID, index)
+
+    def get_player_index(self, agent_id):
+        """Index of the active player with this agent id, or -1."""
+        self._refresh_player_index()
+        return self._player_index.get(agent_id, -1)
+
+    def get_player_by_agent_id(self, agent_id):
+        """Read-only view of the active player with this agent id, or None."""
+        index = self.get_player_index(agent_id)
+        return self._player_views[index] if index != -1 else None
+
 
     # ---------------------
     # Game Option Management
@@ -293,24 +318,12 @@ class SharedMemoryManager:
 
 
     def get_game_option(self, index):
-        """Read game option data and timeout check."""
+        """Read-only view of the game options of a player."""
         try:
             if index < 0 or index >= self.num_players:
                 raise IndexError("Invalid game option index.")
 
-            game_option = self.game_struct.GameOptions[index]
-            # Collect data
-            data = {
-                "Following": game_option.Following,
-                "Avoidance": game_option.Avoidance,
-                "Looting": game_option.Looting,
-                "Targeting": game_option.Targeting,
-                "Combat": game_option.Combat,
-                "WindowVisible": game_option.WindowVisible,
-                "Skills": [skill.Active for skill in game_option.Skills],
-            }
-
-            return data
+            return self._game_option_views[index]
 
         except Exception as e:
             Py4GW.Console.Log(SMM_MODULE_NAME, f"Read failed for game option {index}: {e}", Py4GW.Console.MessageType.Error)
@@ -345,130 +358,183 @@ class SharedMemoryManager:
     # ---------------------
     # Party Buffs Management
     # ---------------------
+    # Buffs live in one bucket per agent. Buckets are placed by agent id with linear
+    # probing; each process also remembers where it last found an agent, so a lookup
+    # is normally a single bucket read. A bucket whose LastUpdated is older than
+    # SUBSCRIBE_TIMEOUT_SECONDS is expired and free for another agent.
+
+    def _buff_bucket_expired(self, bucket, current_offset):
+        return bucket.PlayerID == 0 or current_offset - bucket.LastUpdated > SUBSCRIBE_TIMEOUT_SECONDS
+
     def reset_party_buffs(self):
-        """Reset all buffs for a specific player."""
-        buff_index = 0
+        """Reset the buffs of every agent."""
+        bucket_index = 0
         try:
-            for buff_index in range(MAX_NUMBER_OF_BUFFS):
-                self.reset_buff(buff_index)
+            for bucket_index in range(MAX_NUMBER_OF_BUFF_AGENTS):
+                self.reset_buff_bucket(bucket_index)
+            self._buff_bucket_index.clear()
+            self._buff_sets.clear()
 
         except Exception as e:
-            Py4GW.Console.Log(SMM_MODULE_NAME, f"Failed to reset buffs for player {buff_index}: {e}", Py4GW.Console.MessageType.Error)
+            Py4GW.Console.Log(SMM_MODULE_NAME, f"Failed to reset buff bucket {bucket_index}: {e}", Py4GW.Console.MessageType.Error)
 
-    def reset_buff(self, index):
-        """Reset a specific party buff."""
+    def reset_buff_bucket(self, index):
+        """Reset the buffs of the agent stored in a specific bucket."""
         try:
-
-            buff = self.game_struct.PlayerBuffs[index]
-            buff.PlayerID = 0
-            buff.Buff_id = 0
-            buff.LastUpdated = 0
+            bucket = self.game_struct.BuffBuckets[index]
+            bucket.PlayerID = 0
+            bucket.LastUpdated = 0
+            bucket.Count = 0
+            bucket.Generation += 1
 
         except Exception as e:
-            Py4GW.Console.Log(SMM_MODULE_NAME, f"Failed to reset buff {index}: {e}", Py4GW.Console.MessageType.Error)
+            Py4GW.Console.Log(SMM_MODULE_NAME, f"Failed to reset buff bucket {index}: {e}", Py4GW.Console.MessageType.Error)
+
+    def _find_buff_bucket(self, agent_id):
+        """Index of the live bucket holding agent_id, or -1. Expired buckets found on the way are released."""
+        if agent_id == 0:
+            return -1
+        buckets = self.game_struct.BuffBuckets
+        current_offset = get_base_timestamp()
+
+        index = self._buff_bucket_index.get(agent_id)
+        if index is not None and buckets[index].PlayerID == agent_id:
+            if not self._buff_bucket_expired(buckets[index], current_offset):
+                return index
+            self.reset_buff_bucket(index)
+            self._buff_bucket_index.pop(agent_id, None)
+            return -1
+
+        start = agent_id % MAX_NUMBER_OF_BUFF_AGENTS
+        for probe in range(MAX_NUMBER_OF_BUFF_AGENTS):
+            index = (start + probe) % MAX_NUMBER_OF_BUFF_AGENTS
+            bucket = buckets[index]
+            if bucket.PlayerID != agent_id:
+                continue
+            if self._buff_bucket_expired(bucket, current_offset):
+                self.reset_buff_bucket(index)
+                return -1
+            self._buff_bucket_index[agent_id] = index
+            return index
+        return -1
+
+    def _claim_buff_bucket(self, agent_id):
+        """Bucket for agent_id, taking the first free one along its probe sequence if it has none yet."""
+        index = self._find_buff_bucket(agent_id)
+        if index != -1:
+            return index
+
+        buckets = self.game_struct.BuffBuckets
+        current_offset = get_base_timestamp()
+        start = agent_id % MAX_NUMBER_OF_BUFF_AGENTS
+        for probe in range(MAX_NUMBER_OF_BUFF_AGENTS):
+            index = (start + probe) % MAX_NUMBER_OF_BUFF_AGENTS
+            bucket = buckets[index]
+            if self._buff_bucket_expired(bucket, current_offset):
+                bucket.PlayerID = agent_id
+                bucket.Count = 0
+                bucket.LastUpdated = current_offset
+                bucket.Generation += 1
+                self._buff_bucket_index[agent_id] = index
+                return index
+        return -1
+
+    def get_agent_buff_set(self, agent_id):
+        """Buff ids of the agent as a set, rebuilt only when its bucket has been written since the last call."""
+        index = self._find_buff_bucket(agent_id)
+        if index == -1:
+            return frozenset()
+        bucket = self.game_struct.BuffBuckets[index]
+        # Read the generation before copying the ids: if another client writes in between, the
+        # copy is cached under the older generation and rebuilt on the next call instead of kept
+        generation = bucket.Generation
+        cached = self._buff_sets.get(index)
+        if cached is not None and cached[0] == agent_id and cached[1] == generation:
+            return cached[2]
+        buff_set = frozenset(bucket.Buff_ids[:bucket.Count])
+        self._buff_sets[index] = (agent_id, generation, buff_set)
+        return buff_set
 
     def get_buff(self,agent_id, skill_id):
-        """Retrieve a specific buff with timeout checks."""
-        buff_index = 0
+        """Read-only view of the agent's buff bucket if it holds skill_id, after a timeout check."""
         try:
-
-            for buff_index, buff in enumerate(self.game_struct.PlayerBuffs):
-                if buff.PlayerID == agent_id and buff.Buff_id == skill_id:
-                    current_offset = get_base_timestamp()
-                    if current_offset - buff.LastUpdated > SUBSCRIBE_TIMEOUT_SECONDS:
-                        self.reset_buff(buff_index)
-                        return None
-                    return {
-                        "PlayerID": buff.PlayerID,
-                        "Buff_id": buff.Buff_id,
-                        "LastUpdated": buff.LastUpdated,
-                    }
-
-            return None
+            if skill_id not in self.get_agent_buff_set(agent_id):
+                return None
+            return self._buff_bucket_views[self._buff_bucket_index[agent_id]]
 
         except Exception as e:
-            Py4GW.Console.Log(SMM_MODULE_NAME, f"Failed to retrieve buff {buff_index}: {e}", Py4GW.Console.MessageType.Error)
+            Py4GW.Console.Log(SMM_MODULE_NAME, f"Failed to retrieve buff {skill_id} of agent {agent_id}: {e}", Py4GW.Console.MessageType.Error)
             return None
   
     def get_agent_buffs(self, agent_id):
         """Retrieve all buffs for a specific agent."""
         try:
-            buff_list = []
-            for buff_index, buff in enumerate(self.game_struct.PlayerBuffs):
-                if buff.PlayerID == agent_id:
-                    current_offset = get_base_timestamp()
-                    if (current_offset - buff.LastUpdated) > SUBSCRIBE_TIMEOUT_SECONDS:
-                        self.reset_buff(buff_index)
-                    else:
-                        buff_list.append(buff.Buff_id)
-            return buff_list
+            index = self._find_buff_bucket(agent_id)
+            if index == -1:
+                return []
+            bucket = self.game_struct.BuffBuckets[index]
+            return list(bucket.Buff_ids[:bucket.Count])
         except Exception as e:
             Py4GW.Console.Log(
                 SMM_MODULE_NAME, f"Failed to retrieve buffs for agent {agent_id}: {e}", Py4GW.Console.MessageType.Error)
             return []
 
-    def set_buff(self, buff_data):
-        """Set or update a party buff."""
+    def set_agent_buffs(self, agent_id, buff_ids, last_updated=None):
+        """Replace the whole buff set of an agent in one write."""
         try:
+            index = self._claim_buff_bucket(agent_id)
+            if index == -1:
+                Py4GW.Console.Log(SMM_MODULE_NAME, "No available buckets for registering buffs.", Py4GW.Console.MessageType.Warning)
+                return False
+
+            bucket = self.game_struct.BuffBuckets[index]
+            count = 0
+            for buff_id in buff_ids:
+                if count >= MAX_BUFFS_PER_AGENT:
+                    break
+                bucket.Buff_ids[count] = buff_id
+                count += 1
+            bucket.Count = count
+            bucket.LastUpdated = get_base_timestamp() if last_updated is None else last_updated
+            bucket.Generation += 1
+            return True
 
-            # Check for an existing buff with the same Buff_id and PlayerID
-            for buff_index, buff in enumerate(self.game_struct.PlayerBuffs):
-                if buff.Buff_id == buff_data["Buff_id"] and buff.PlayerID == buff_data["PlayerID"]:
-                    buff.LastUpdated = buff_data["LastUpdated"]
-                    return True
-
-            # Reset expired buffs
-            for buff_index, buff in enumerate(self.game_struct.PlayerBuffs):
-                current_offset = get_base_timestamp()
-                if current_offset - buff.LastUpdated > SUBSCRIBE_TIMEOUT_SECONDS:
-                    self.reset_buff(buff_index)
-                    # Use the reset slot for the new buff
-                    buff.PlayerID = buff_data["PlayerID"]
-                    buff.Buff_id = buff_data["Buff_id"]
-                    buff.LastUpdated = buff_data["LastUpdated"]
-                    return True
-
-            # Find an empty slot for the new buff
-            for buff_index, buff in enumerate(self.game_struct.PlayerBuffs):
-                if buff.Buff_id == 0:
-                    buff.PlayerID = buff_data["PlayerID"]
-                    buff.Buff_id = buff_data["Buff_id"]
-                    buff.LastUpdated = buff_data["LastUpdated"]
-                    return True
-
-            # No available slots
-            Py4GW.Console.Log(SMM_MODULE_NAME, "No available slots for registering buff.", Py4GW.Console.MessageType.Warning)
+        except Exception as e:
+            Py4GW.Console.Log(SMM_MODULE_NAME, f"Failed to set buffs for agent {agent_id}: {e}", Py4GW.Console.MessageType.Error)
             return False
 
+    def set_buff(self, buff_data):
+        """Set or update a party buff. Refreshing a buff refreshes every buff of the same agent."""
+        try:
+            agent_id = buff_data["PlayerID"]
+            buff_id = buff_data["Buff_id"]
+            index = self._claim_buff_bucket(agent_id)
+            if index == -1:
+                Py4GW.Console.Log(SMM_MODULE_NAME, "No available slots for registering buff.", Py4GW.Console.MessageType.Warning)
+                return False
+
+            bucket = self.game_struct.BuffBuckets[index]
+            if buff_id not in self.get_agent_buff_set(agent_id):
+                if bucket.Count >= MAX_BUFFS_PER_AGENT:
+                    Py4GW.Console.Log(SMM_MODULE_NAME, "No available slots for registering buff.", Py4GW.Console.MessageType.Warning)
+                    return False
+                bucket.Buff_ids[bucket.Count] = buff_id
+                bucket.Count += 1
+                bucket.Generation += 1
+            bucket.LastUpdated = buff_data["LastUpdated"]
+            return True
+
         except Exception as e:
             Py4GW.Console.Log(SMM_MODULE_NAME, f"Failed to set buff: {e}", Py4GW.Console.MessageType.Error)
             return False
 
         
     def register_buffs(self, agent_id):
-        """Register new buffs or update existing ones for the agent."""
+        """Publish the current buffs and effects of the agent, replacing the previous set."""
         try:
-            # Process buffs
-            buff_list = GLOBAL_CACHE.Effects.GetBuffs(agent_id)
-            for buff in buff_list:
-                buff_data = {
-                    "PlayerID": agent_id,
-                    "Buff_id": buff.skill_id,  # Adjust according to the property name in the Buff object
-                    "LastUpdated": get_base_timestamp(),
-                    # Add other common properties if needed
-                }
-                self.set_buff(buff_data)
-
-            # Process effects
-            effect_list = GLOBAL_CACHE.Effects.GetEffects(agent_id)
-            for effect in effect_list:
-                buff_data = {
-                    "PlayerID": agent_id,
-                    "Buff_id": effect.skill_id,  # Adjust according to the property name in the Effect object
-                    "LastUpdated": get_base_timestamp(),
-                    # Add other common properties if needed
-                }
-                self.set_buff(buff_data)
+            buff_ids = [buff.skill_id for buff in GLOBAL_CACHE.Effects.GetBuffs(agent_id)]
+            buff_ids.extend(effect.skill_id for effect in GLOBAL_CACHE.Effects.GetEffects(agent_id))
+            self.set_agent_buffs(agent_id, dict.fromkeys(buff_ids))
 
         except Exception as e:
             Py4GW.Console.Log(
@@ -478,10 +544,7 @@ class SharedMemoryManager:
     def buff_exists(self, agent_id, skill_id):
         """Check if a specific buff exists for the agent."""
         try:
-            buff = self.get_buff(agent_id,skill_id)
-            if buff is not None and buff["PlayerID"] == agent_id:
-                return True
-            return False
+            return skill_id in self.get_agent_buff_set(agent_id)
         except Exception as e:
             Py4GW.Console.Log(
                 SMM_MODULE_NAME, f"Failed to check buff existence: {e}", Py4GW.Console.MessageType.Error)
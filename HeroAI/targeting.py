@@ -1,9 +1,8 @@
-from Py4GWCoreLib import GLOBAL_CACHE, Utils, AgentArray, Routines
+from Py4GWCoreLib import GLOBAL_CACHE, AgentArray, Routines
 from .constants import (
     Range,
     BLOOD_IS_POWER,
     BLOOD_RITUAL,
-    MAX_NUM_PLAYERS,
 )
 
 def GetAllAlliesArray(distance=Range.SafeCompass.value):
@@ -11,106 +10,91 @@ def GetAllAlliesArray(distance=Range.SafeCompass.value):
     ally_array = Routines.Targeting.GetAllAlliesArray(distance)
     return ally_array
 
-def FilterAllyArray(array, distance, other_ally=False, filter_skill_id=0):
+def AllyCondition(distance, other_ally=False, filter_skill_id=0):
     #this is multibox!
     from .utils import CheckForEffect
-    array = AgentArray.Filter.ByDistance(array, GLOBAL_CACHE.Player.GetXY(), distance)
-    array = AgentArray.Filter.ByCondition(array, lambda agent_id: GLOBAL_CACHE.Agent.IsAlive(agent_id))
-        
-    if other_ally:
-        array = AgentArray.Filter.ByCondition(array, lambda agent_id: GLOBAL_CACHE.Player.GetAgentID() != agent_id)
-    
-    if filter_skill_id != 0:
-        array = AgentArray.Filter.ByCondition(array, lambda agent_id: not CheckForEffect(agent_id, filter_skill_id))
-    
-    return array
+    px, py = GLOBAL_CACHE.Player.GetXY()
+    player_id = GLOBAL_CACHE.Player.GetAgentID()
+    max_sq = distance * distance
+
+    def _condition(agent_id):
+        x, y = GLOBAL_CACHE.Agent.GetXY(agent_id)
+        if (x - px) * (x - px) + (y - py) * (y - py) > max_sq:
+            return False
+        if not GLOBAL_CACHE.Agent.IsAlive(agent_id):
+            return False
+        if other_ally and agent_id == player_id:
+            return False
+        if filter_skill_id != 0 and CheckForEffect(agent_id, filter_skill_id):
+            return False
+        return True
+
+    return _condition
+
+def FilterAllyArray(array, distance, other_ally=False, filter_skill_id=0):
+    return AgentArray.Filter.ByCondition(array, AllyCondition(distance, other_ally, filter_skill_id))
+
+def _LowestAllyOrPet(other_ally, filter_skill_id, condition=None):
+    # one pass over allies and one over spirits/pets instead of filter + merge + sort
+    is_valid = AllyCondition(Range.Spellcast.value, other_ally, filter_skill_id)
+    if condition is not None:
+        ally_condition = lambda agent_id: is_valid(agent_id) and condition(agent_id)
+    else:
+        ally_condition = is_valid
+    # condition (IsMartial/IsMelee) reads weapon data pets don't have, so pets are only checked for validity
+    pet_condition = lambda agent_id: is_valid(agent_id) and not GLOBAL_CACHE.Agent.IsSpawned(agent_id) #filter spirits
+
+    lowest_ally = AgentArray.Select.LowestHealth(GLOBAL_CACHE.AgentArray.GetAllyArray(), ally_condition)
+    lowest_pet = AgentArray.Select.LowestHealth(GLOBAL_CACHE.AgentArray.GetSpiritPetArray(), pet_condition)
+    if lowest_ally == 0 or lowest_pet == 0:
+        return lowest_ally or lowest_pet
+    if GLOBAL_CACHE.Agent.GetHealth(lowest_pet) < GLOBAL_CACHE.Agent.GetHealth(lowest_ally):
+        return lowest_pet
+    return lowest_ally
 
 def TargetLowestAlly(other_ally=False,filter_skill_id=0):
-    distance = Range.Spellcast.value
-    ally_array = GLOBAL_CACHE.AgentArray.GetAllyArray()
-    ally_array = FilterAllyArray(ally_array, distance, other_ally, filter_skill_id) 
-     
-    
-    spirit_pet_array = GLOBAL_CACHE.AgentArray.GetSpiritPetArray()
-    spirit_pet_array = FilterAllyArray(spirit_pet_array, distance, other_ally, filter_skill_id)
-    spirit_pet_array = AgentArray.Filter.ByCondition(spirit_pet_array, lambda agent_id: not GLOBAL_CACHE.Agent.IsSpawned(agent_id)) #filter spirits
-    ally_array = AgentArray.Manipulation.Merge(ally_array, spirit_pet_array) #added Pets
-    
-    ally_array = AgentArray.Sort.ByHealth(ally_array)   
-    return Utils.GetFirstFromArray(ally_array)
+    return _LowestAllyOrPet(other_ally, filter_skill_id)
     
 
 def TargetLowestAllyEnergy(other_ally=False, filter_skill_id=0):
     global BLOOD_IS_POWER, BLOOD_RITUAL
     from .utils import (CheckForEffect)
-    def GetEnergyValues(agent_id):
-        import HeroAI.shared_memory_manager as shared_memory_manager
-        shared_memory_handler = shared_memory_manager.SharedMemoryManager()
+    import HeroAI.shared_memory_manager as shared_memory_manager
+    shared_memory_handler = shared_memory_manager.SharedMemoryManager()
 
-        for i in range(MAX_NUM_PLAYERS):
-            player_data = shared_memory_handler.get_player(i)
-            if player_data and player_data["IsActive"] and player_data["PlayerID"] == agent_id:
-                return player_data["Energy"]
+    def GetEnergyValues(agent_id):
+        player_data = shared_memory_handler.get_player_by_agent_id(agent_id)
+        if player_data is not None:
+            return player_data.Energy
         return 1.0 #default return full energy to prevent issues
     
-    distance = Range.Spellcast.value
+    is_valid = AllyCondition(Range.Spellcast.value, other_ally, filter_skill_id)
     ally_array = GLOBAL_CACHE.AgentArray.GetAllyArray()
-    ally_array = FilterAllyArray(ally_array, distance, other_ally, filter_skill_id)
-    ally_array = AgentArray.Filter.ByCondition(ally_array, lambda agent_id: not CheckForEffect(agent_id, BLOOD_IS_POWER))
-    ally_array = AgentArray.Filter.ByCondition(ally_array, lambda agent_id: not CheckForEffect(agent_id, BLOOD_RITUAL))
-    
-    ally_array = AgentArray.Sort.ByCondition(ally_array, lambda agent_id: GetEnergyValues(agent_id))
-    return Utils.GetFirstFromArray(ally_array)
+    return AgentArray.Select.ArgMin(
+        ally_array, GetEnergyValues,
+        lambda agent_id: (is_valid(agent_id)
+                          and not CheckForEffect(agent_id, BLOOD_IS_POWER)
+                          and not CheckForEffect(agent_id, BLOOD_RITUAL)))
 
 
 def TargetLowestAllyCaster(other_ally=False, filter_skill_id=0):
-    distance = Range.Spellcast.value
+    is_valid = AllyCondition(Range.Spellcast.value, other_ally, filter_skill_id)
     ally_array = GLOBAL_CACHE.AgentArray.GetAllyArray()
-    ally_array = FilterAllyArray(ally_array, distance, other_ally, filter_skill_id)
-    ally_array = AgentArray.Filter.ByCondition(ally_array, lambda agent_id: GLOBAL_CACHE.Agent.IsCaster(agent_id))
-
-    ally_array = AgentArray.Sort.ByHealth(ally_array)
-    return Utils.GetFirstFromArray(ally_array)
+    return AgentArray.Select.LowestHealth(ally_array, lambda agent_id: is_valid(agent_id) and GLOBAL_CACHE.Agent.IsCaster(agent_id))
 
 
 def TargetLowestAllyMartial(other_ally=False, filter_skill_id=0):
-    distance = Range.Spellcast.value
-    ally_array = GLOBAL_CACHE.AgentArray.GetAllyArray()
-    ally_array = FilterAllyArray(ally_array, distance, other_ally, filter_skill_id)
-    ally_array = AgentArray.Filter.ByCondition(ally_array, lambda agent_id: GLOBAL_CACHE.Agent.IsMartial(agent_id))
-    
-    spirit_pet_array = GLOBAL_CACHE.AgentArray.GetSpiritPetArray()
-    spirit_pet_array = FilterAllyArray(spirit_pet_array, distance, other_ally, filter_skill_id)
-    spirit_pet_array = AgentArray.Filter.ByCondition(spirit_pet_array, lambda agent_id: not GLOBAL_CACHE.Agent.IsSpawned(agent_id)) #filter spirits
-    ally_array = AgentArray.Manipulation.Merge(ally_array, spirit_pet_array) #added Pets
-    
-    ally_array = AgentArray.Sort.ByHealth(ally_array)
-    return Utils.GetFirstFromArray(ally_array)
+    return _LowestAllyOrPet(other_ally, filter_skill_id, GLOBAL_CACHE.Agent.IsMartial)
 
 
 def TargetLowestAllyMelee(other_ally=False, filter_skill_id=0):
-    distance = Range.Spellcast.value
-    ally_array = GLOBAL_CACHE.AgentArray.GetAllyArray()
-    ally_array = FilterAllyArray(ally_array, distance, other_ally, filter_skill_id)
-    ally_array = AgentArray.Filter.ByCondition(ally_array, lambda agent_id: GLOBAL_CACHE.Agent.IsMelee(agent_id))
-    
-    spirit_pet_array = GLOBAL_CACHE.AgentArray.GetSpiritPetArray()
-    spirit_pet_array = FilterAllyArray(spirit_pet_array, distance, other_ally, filter_skill_id)
-    spirit_pet_array = AgentArray.Filter.ByCondition(spirit_pet_array, lambda agent_id: not GLOBAL_CACHE.Agent.IsSpawned(agent_id)) #filter spirits
-    ally_array = AgentArray.Manipulation.Merge(ally_array, spirit_pet_array) #added Pets
-    
-    ally_array = AgentArray.Sort.ByHealth(ally_array)
-    return Utils.GetFirstFromArray(ally_array)
+    return _LowestAllyOrPet(other_ally, filter_skill_id, GLOBAL_CACHE.Agent.IsMelee)
 
 
 def TargetLowestAllyRanged(other_ally=False, filter_skill_id=0):
-    distance = Range.Spellcast.value
+    is_valid = AllyCondition(Range.Spellcast.value, other_ally, filter_skill_id)
     ally_array = GLOBAL_CACHE.AgentArray.GetAllyArray()
-    ally_array = FilterAllyArray(ally_array, distance, other_ally, filter_skill_id)
-    ally_array = AgentArray.Filter.ByCondition(ally_array, lambda agent_id: GLOBAL_CACHE.Agent.IsRanged(agent_id))
-    
-    ally_array = AgentArray.Sort.ByHealth(ally_array)
-    return Utils.GetFirstFromArray(ally_array)
+    return AgentArray.Select.LowestHealth(ally_array, lambda agent_id: is_valid(agent_id) and GLOBAL_CACHE.Agent.IsRanged(agent_id))
 
    
 def TargetNearestItem():
@@ -1,23 +1,29 @@
-from ctypes import Structure, c_int, c_float, c_bool
+from ctypes import Structure, c_int, c_uint, c_float, c_bool
 from enum import Enum, IntEnum, auto
 from .constants import (
     MAX_NUM_PLAYERS,
     NUMBER_OF_SKILLS,
-    MAX_NUMBER_OF_BUFFS
+    MAX_NUMBER_OF_BUFF_AGENTS,
+    MAX_BUFFS_PER_AGENT,
 )
 
 
-class PlayerBuff(Structure):
+class AgentBuffBucket(Structure):
+    """All buffs and effects of one agent, replaced as a whole on every refresh."""
     _fields_ = [
         ("PlayerID", c_int),
-        ("Buff_id", c_int),
         ("LastUpdated", c_int),
+        ("Generation", c_uint),   # bumped on every write so readers can keep a local copy
+        ("Count", c_int),
+        ("Buff_ids", c_int * MAX_BUFFS_PER_AGENT),
     ]
     
     # Type hints for IntelliSense
     PlayerID: int
-    Buff_id: int
     LastUpdated: int
+    Generation: int
+    Count: int
+    Buff_ids: list[int]
     
 
 class PlayerStruct(Structure):
@@ -102,14 +108,96 @@ class GameStruct(Structure):
         ("Players", PlayerStruct * MAX_NUM_PLAYERS),
         ("Candidates", CandidateStruct * MAX_NUM_PLAYERS),
         ("GameOptions", GameOptionStruct * MAX_NUM_PLAYERS),
-        ("PlayerBuffs", PlayerBuff * MAX_NUMBER_OF_BUFFS),
+        ("BuffBuckets", AgentBuffBucket * MAX_NUMBER_OF_BUFF_AGENTS),
     ]    
     
     # Type hints for IntelliSense
     Players: list[PlayerStruct]
     Candidates: list[CandidateStruct]
     GameOptions: list[GameOptionStruct]
-    PlayerBuffs: list[PlayerBuff]
+    BuffBuckets: list[AgentBuffBucket]
+
+
+class SharedStructView:
+    """
+    Read-only view over one shared ctypes structure. Fields are read straight from shared
+    memory, either as attributes or as view["Field"] like the dicts these views replace.
+    """
+    __slots__ = ("_struct",)
+
+    def __init__(self, struct):
+        object.__setattr__(self, "_struct", struct)
+
+    def __getattr__(self, name):
+        return getattr(self._struct, name)
+
+    def __getitem__(self, name):
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name) from None
+
+    def get(self, name, default=None):
+        return getattr(self, name, default)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+
+class PlayerView(SharedStructView):
+    __slots__ = ()
+
+    # Type hints for IntelliSense
+    PlayerID: int
+    Energy_Regen: float
+    Energy: float
+    IsActive: bool
+    IsHero: bool
+    IsFlagged: bool
+    FlagPosX: float
+    FlagPosY: float
+    FollowAngle: float
+    LastUpdated: int
+
+
+class CandidateView(SharedStructView):
+    __slots__ = ()
+
+    # Type hints for IntelliSense
+    PlayerID: int
+    MapID: int
+    MapRegion: int
+    MapDistrict: int
+    InvitedBy: int
+    SummonedBy: int
+    LastUpdated: int
+
+
+class BuffBucketView(SharedStructView):
+    __slots__ = ()
+
+    # Type hints for IntelliSense
+    PlayerID: int
+    LastUpdated: int
+    Generation: int
+    Count: int
+    Buff_ids: list[int]
+
+
+class GameOptionView(SharedStructView):
+    __slots__ = ()
+
+    @property
+    def Skills(self) -> list[bool]:
+        return [skill.Active for skill in self._struct.Skills]
+
+    # Type hints for IntelliSense
+    Following: bool
+    Avoidance: bool
+    Looting: bool
+    Targeting: bool
+    Combat: bool
+    WindowVisible: bool
 
 
 class Skilltarget (IntEnum):
@@ -17,7 +17,7 @@ from HeroAI.utils import IsHeroFlagged
 from HeroAI.windows import CompareAndSubmitGameOptions
 from Py4GWCoreLib import ImGui
 from Py4GWCoreLib.GlobalCache import GLOBAL_CACHE
-from Py4GWCoreLib.GlobalCache.SharedMemory import AccountData, SharedMessage
+from Py4GWCoreLib.GlobalCache.SharedMemory import SHMEM_SECTION_BUFFS, AccountData, SharedMessage
 from Py4GWCoreLib.ImGui_src.IconsFontAwesome5 import IconsFontAwesome5
 from Py4GWCoreLib.ImGui_src.Textures import GameTexture, GameTexture, TextureState, ThemeTexture, ThemeTextures
 from Py4GWCoreLib.ImGui_src.WindowModule import WindowModule
@@ -68,6 +68,9 @@ class CachedSkillInfo:
 
 
 skill_cache: dict[int, CachedSkillInfo] = {}
+# slot address -> (buff section generation, effects, upkeeps, buff ids); the entries are views
+# into shared memory, so effect time remaining stays live without re-reading the section
+buff_section_cache: dict[int, tuple[int, list, list, list[int]]] = {}
 message_cache : dict[str, dict[SharedCommandType, dict[int, tuple]]] = {}
 template_popup_open: bool = False
 template_account: str = ""
@@ -777,12 +780,25 @@ def draw_buffs_bar(account_data: AccountData, win_pos: tuple, win_size: tuple, m
     PyImGui.end()
     pass  # Implementation of buffs bar drawing logic goes here
 
+def get_buff_section(account_data: AccountData) -> tuple[list, list, list[int]]:
+    """Effects, upkeeps and buff ids of an account, re-read only when its buff section generation moved."""
+    key = ctypes.addressof(account_data)
+    generation = account_data.SectionGenerations[SHMEM_SECTION_BUFFS]
+    cached = buff_section_cache.get(key)
+    if cached is None or cached[0] != generation:
+        buffs = account_data.PlayerBuffs[:account_data.BuffCount]
+        cached = (generation,
+                  [effect for effect in buffs if effect.Type == 2],
+                  [effect for effect in buffs if effect.Type == 1],
+                  [buff.SkillId for buff in buffs])
+        buff_section_cache[key] = cached
+    return cached[1], cached[2], cached[3]
+
 def draw_buffs_and_upkeeps(account_data: AccountData, skill_size: float = 28):
     style = ImGui.get_style()
     HARD_MODE_EFFECT_ID = 1912 
     
-    effects = [effect for effect in account_data.PlayerBuffs if effect.Type == 2]
-    upkeeps = [effect for effect in account_data.PlayerBuffs if effect.Type == 1]
+    effects, upkeeps, _ = get_buff_section(account_data)
     
     def draw_buff(effect: CachedSkillInfo, duration: float, remaining: float, draw_effect_frame: bool = True, skill_size: float = skill_size):
         if not effect.texture_path:
@@ -1274,7 +1290,7 @@ def get_display_name(account_data: AccountData) -> str:
     return name if settings.Anonymous_PanelNames else account_data.CharacterName
 
 def get_conditioned(account_data: AccountData) -> tuple[HealthState, bool, bool, bool, bool, bool]:
-    buff_ids = [buff.SkillId for buff in account_data.PlayerBuffs]
+    _, _, buff_ids = get_buff_section(account_data)
     same_map = GLOBAL_CACHE.Map.GetMapID() == account_data.MapID and GLOBAL_CACHE.Map.GetRegion()[0] == account_data.MapRegion and GLOBAL_CACHE.Map.GetDistrict() == account_data.MapDistrict
     
     deep_wounded = 482 in buff_ids
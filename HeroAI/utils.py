@@ -1,5 +1,4 @@
-from Py4GWCoreLib import GLOBAL_CACHE, Allegiance, Overlay, Weapon
-from .constants import MAX_NUM_PLAYERS
+from Py4GWCoreLib import GLOBAL_CACHE, Allegiance, Overlay, Utils, Weapon
 from .targeting import *
 from .cache_data import CacheData
 
@@ -20,10 +19,8 @@ def CheckForEffect(agent_id, skill_id):
     shared_memory_handler = shared_memory_manager.SharedMemoryManager()   
     
     def _IsPartyMember(agent_id):
-        for i in range(MAX_NUM_PLAYERS):
-            player_data = shared_memory_handler.get_player(i)
-            if player_data and player_data["IsActive"] and player_data["PlayerID"] == agent_id:
-                return True
+        if shared_memory_handler.get_player_index(agent_id) != -1:
+            return True
             
         allegiance , _ = GLOBAL_CACHE.Agent.GetAllegiance(agent_id)
         if allegiance == Allegiance.SpiritPet.value and not GLOBAL_CACHE.Agent.IsSpawned(agent_id):
@@ -38,10 +35,7 @@ def CheckForEffect(agent_id, skill_id):
     """
     result = False
     if _IsPartyMember(agent_id):
-        player_buffs = shared_memory_handler.get_agent_buffs(agent_id)
-        for buff in player_buffs:
-            if buff == skill_id:
-                result = True
+        result = shared_memory_handler.buff_exists(agent_id, skill_id)
     else:
         result = GLOBAL_CACHE.Effects.BuffExists(agent_id, skill_id) or GLOBAL_CACHE.Effects.EffectExists(agent_id, skill_id)
     
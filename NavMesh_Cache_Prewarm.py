@@ -0,0 +1,91 @@
+from Py4GWCoreLib import GLOBAL_CACHE, Routines, ConsoleLog
+from Py4GWCoreLib.Pathing import PATHING_MAP_GROUPS, NavMesh, NavMeshCache
+import PyImGui
+import PyPathing
+import os
+
+module_name = "NavMesh Cache Prewarm"
+
+# Pathing data is only readable for the map the client is currently in, so this tool
+# travels to every map of PATHING_MAP_GROUPS it can reach and writes its NavMesh cache.
+# Explorable areas can't be travelled to; use "Cache current map" while standing in one.
+
+class PrewarmState:
+    def __init__(self):
+        self.running = False
+        self.current_map_id = 0
+        self.built: list[int] = []
+        self.cached: list[int] = []
+        self.skipped: list[int] = []
+        self.coroutine = None
+
+state = PrewarmState()
+
+
+def cache_current_map():
+    map_id = GLOBAL_CACHE.Map.GetMapID()
+    folder = NavMeshCache.default_folder()
+    had_cache = os.path.isfile(NavMeshCache.get_filepath(folder, map_id))
+    NavMesh.load_or_build(PyPathing.get_pathing_maps(), map_id, folder)
+    (state.cached if had_cache else state.built).append(map_id)
+    ConsoleLog(module_name, f"NavMesh cache ready for {GLOBAL_CACHE.Map.GetMapName(map_id)} ({map_id})")
+
+
+def prewarm_all():
+    state.running = True
+    state.built.clear()
+    state.cached.clear()
+    state.skipped.clear()
+
+    for group in PATHING_MAP_GROUPS:
+        for map_id in group:
+            state.current_map_id = map_id
+            if GLOBAL_CACHE.Map.GetMapID() != map_id:
+                traveled = yield from Routines.Yield.Map.TravelToOutpost(map_id)
+                if not traveled or GLOBAL_CACHE.Map.GetMapID() != map_id:
+                    state.skipped.append(map_id)
+                    continue
+            yield from Routines.Yield.wait(1000)
+            cache_current_map()
+            yield
+
+    state.current_map_id = 0
+    state.running = False
+    ConsoleLog(module_name, f"Prewarm done: {len(state.built)} built, {len(state.cached)} already cached, {len(state.skipped)} skipped.")
+
+
+def draw_window():
+    if PyImGui.begin(module_name):
+        PyImGui.text(f"Cache folder: {NavMeshCache.default_folder()}")
+        PyImGui.separator()
+
+        if not state.running:
+            if PyImGui.button("Prewarm all pathing map groups"):
+                state.coroutine = prewarm_all()
+                GLOBAL_CACHE.Coroutines.append(state.coroutine)
+            PyImGui.same_line(0, -1)
+            if PyImGui.button("Cache current map"):
+                cache_current_map()
+        else:
+            PyImGui.text(f"Working on map {state.current_map_id}...")
+            if PyImGui.button("Stop"):
+                if state.coroutine in GLOBAL_CACHE.Coroutines:
+                    GLOBAL_CACHE.Coroutines.remove(state.coroutine)
+                state.running = False
+
+        PyImGui.separator()
+        PyImGui.text(f"Built: {len(state.built)}")
+        PyImGui.text(f"Already cached: {len(state.cached)}")
+        PyImGui.text(f"Skipped (not reachable by travel): {len(state.skipped)}")
+        if state.skipped:
+            PyImGui.text_wrapped(", ".join(str(map_id) for map_id in state.skipped))
+
+    PyImGui.end()
+
+
+def main():
+    draw_window()
+
+
+if __name__ == "__main__":
+    main()
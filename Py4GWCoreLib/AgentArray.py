@@ -1,10 +1,22 @@
 import PyAgent
+import heapq
+from array import array
 
 from .Agent import *
 from .Player import *
 
 from .Py4GWcorelib import Utils
 
+_GLOBAL_CACHE = None
+
+def _global_cache():
+    """GLOBAL_CACHE imports this module, so it is bound on first use instead of at import time."""
+    global _GLOBAL_CACHE
+    if _GLOBAL_CACHE is None:
+        from .GlobalCache import GLOBAL_CACHE
+        _GLOBAL_CACHE = GLOBAL_CACHE
+    return _GLOBAL_CACHE
+
 
 class AgentArray:
     @staticmethod
@@ -166,7 +178,7 @@ class AgentArray:
 
         @staticmethod
         def ByDistance(agent_array, pos, descending=False):
-            from .GlobalCache import GLOBAL_CACHE
+            GLOBAL_CACHE = _global_cache()
             """
             Sorts agents by their distance to a given (x, y) position.
             sorted_agents_by_distance = Sort.ByDistance(agent_array, (100, 200))
@@ -184,7 +196,7 @@ class AgentArray:
 
         @staticmethod
         def ByHealth(agent_array, descending=False):
-            from .GlobalCache import GLOBAL_CACHE
+            GLOBAL_CACHE = _global_cache()
             """
             Sorts agents by their health (HP).
             sorted_agents_by_health_desc = Sort.ByHealth(agent_array, descending=True)
@@ -197,6 +209,28 @@ class AgentArray:
                 reverse=descending
             )
 
+        @staticmethod
+        def ByDistanceSnapshot(agent_array, pos, descending=False):
+            """
+            Same as ByDistance, but reads positions from the per-frame AgentSnapshot columns.
+            sorted_agents_by_distance = Sort.ByDistanceSnapshot(agent_array, (100, 200))
+            """
+            GLOBAL_CACHE = _global_cache()
+            if agent_array is None:
+                return []
+            return GLOBAL_CACHE.AgentArray.GetSnapshot().SortByDistance(agent_array, pos, descending)
+
+        @staticmethod
+        def ByHealthSnapshot(agent_array, descending=False):
+            """
+            Same as ByHealth, but reads health from the per-frame AgentSnapshot columns.
+            sorted_agents_by_health_desc = Sort.ByHealthSnapshot(agent_array, descending=True)
+            """
+            GLOBAL_CACHE = _global_cache()
+            if agent_array is None:
+                return []
+            return GLOBAL_CACHE.AgentArray.GetSnapshot().SortByHealth(agent_array, descending)
+
     class Filter:
         @staticmethod
         def ByAttribute(agent_array, attribute, condition_func=None, negate=False):
@@ -238,7 +272,7 @@ class AgentArray:
 
         @staticmethod
         def ByDistance(agent_array, pos, max_distance, negate=False):
-            from .GlobalCache import GLOBAL_CACHE
+            GLOBAL_CACHE = _global_cache()
             """
             Filters agents based on their distance from a given position.
             agents_within_range = AgentArray.Filter.ByDistance(agent_array, (100, 200), 500)
@@ -252,12 +286,155 @@ class AgentArray:
 
             return AgentArray.Filter.ByCondition(agent_array, distance_filter)
 
+        @staticmethod
+        def ByDistanceSnapshot(agent_array, pos, max_distance, negate=False):
+            """
+            Same as ByDistance, but reads positions from the per-frame AgentSnapshot columns.
+            agents_within_range = AgentArray.Filter.ByDistanceSnapshot(agent_array, (100, 200), 500)
+            """
+            GLOBAL_CACHE = _global_cache()
+            if agent_array is None:
+                return []
+            return GLOBAL_CACHE.AgentArray.GetSnapshot().FilterByDistance(agent_array, pos, max_distance, negate)
+
+        @staticmethod
+        def ByDistanceIndexed(agent_array, pos, max_distance, negate=False):
+            """
+            Same as ByDistance, but asks the agent spatial index for the agents in range
+            and only does a set membership test per agent of agent_array.
+            agents_within_range = AgentArray.Filter.ByDistanceIndexed(agent_array, (100, 200), 500)
+            """
+            GLOBAL_CACHE = _global_cache()
+            if agent_array is None:
+                return []
+            in_range = set(GLOBAL_CACHE.AgentArray.GetSpatialIndex().QueryRadius(pos, max_distance))
+            if negate:
+                return [agent_id for agent_id in agent_array if agent_id not in in_range]
+            return [agent_id for agent_id in agent_array if agent_id in in_range]
+
+    class Select:
+        # Single pass selectors for the "filter, sort, take the first" pattern.
+        # Ties keep the agent that comes first in agent_array, same as a stable sort would.
+
+        @staticmethod
+        def ArgMin(agent_array, key_func, filter_func=None):
+            """
+            Returns the agent with the smallest key among the ones passing filter_func, or 0.
+            lowest_energy = AgentArray.Select.ArgMin(agent_array, lambda agent_id: Agent.GetEnergy(agent_id))
+            """
+            if agent_array is None:
+                return 0
+            best_id = 0
+            best_key = None
+            for agent_id in agent_array:
+                if filter_func is not None and not filter_func(agent_id):
+                    continue
+                key = key_func(agent_id)
+                if best_key is None or key < best_key:
+                    best_id = agent_id
+                    best_key = key
+            return best_id
+
+        @staticmethod
+        def ArgMax(agent_array, key_func, filter_func=None):
+            """
+            Returns the agent with the largest key among the ones passing filter_func, or 0.
+            highest_health = AgentArray.Select.ArgMax(agent_array, lambda agent_id: Agent.GetHealth(agent_id))
+            """
+            if agent_array is None:
+                return 0
+            best_id = 0
+            best_key = None
+            for agent_id in agent_array:
+                if filter_func is not None and not filter_func(agent_id):
+                    continue
+                key = key_func(agent_id)
+                if best_key is None or key > best_key:
+                    best_id = agent_id
+                    best_key = key
+            return best_id
+
+        @staticmethod
+        def TopK(agent_array, k, key_func, filter_func=None, descending=False):
+            """
+            Returns the k agents with the smallest (or largest) keys, in order, using a bounded heap.
+            three_nearest = AgentArray.Select.TopK(agent_array, 3, lambda agent_id: Utils.Distance(Agent.GetXY(agent_id), (100, 200)))
+            """
+            if agent_array is None or k <= 0:
+                return []
+            candidates = agent_array if filter_func is None else filter(filter_func, agent_array)
+            if descending:
+                return heapq.nlargest(k, candidates, key=key_func)
+            return heapq.nsmallest(k, candidates, key=key_func)
+
+        @staticmethod
+        def Nearest(agent_array, pos, max_distance=float('inf'), filter_func=None):
+            """
+            Returns the agent closest to pos within max_distance that passes filter_func, or 0.
+            The distance check runs first, so filter_func is only called on agents in range.
+            nearest_enemy = AgentArray.Select.Nearest(enemy_array, player_pos, 1250, lambda agent_id: Agent.IsAlive(agent_id))
+            """
+            GLOBAL_CACHE = _global_cache()
+            if agent_array is None:
+                return 0
+            get_xy = GLOBAL_CACHE.Agent.GetXY
+            px, py = pos[0], pos[1]
+            best_id = 0
+            best_sq = max_distance * max_distance
+            found = False
+            for agent_id in agent_array:
+                x, y = get_xy(agent_id)
+                dx = x - px
+                dy = y - py
+                dist_sq = dx * dx + dy * dy
+                if dist_sq > best_sq or (found and dist_sq == best_sq):
+                    continue
+                if filter_func is not None and not filter_func(agent_id):
+                    continue
+                best_id = agent_id
+                best_sq = dist_sq
+                found = True
+            return best_id
+
+        @staticmethod
+        def NearestK(agent_array, pos, k, max_distance=float('inf'), filter_func=None):
+            """
+            Returns up to k agents within max_distance of pos that pass filter_func, nearest first.
+            nearest_items = AgentArray.Select.NearestK(item_array, player_pos, 5, 2500)
+            """
+            GLOBAL_CACHE = _global_cache()
+            if agent_array is None or k <= 0:
+                return []
+            get_xy = GLOBAL_CACHE.Agent.GetXY
+            px, py = pos[0], pos[1]
+            max_sq = max_distance * max_distance
+            keyed = []
+            for order, agent_id in enumerate(agent_array):
+                x, y = get_xy(agent_id)
+                dx = x - px
+                dy = y - py
+                dist_sq = dx * dx + dy * dy
+                if dist_sq > max_sq:
+                    continue
+                if filter_func is not None and not filter_func(agent_id):
+                    continue
+                keyed.append((dist_sq, order, agent_id))
+            return [agent_id for _, _, agent_id in heapq.nsmallest(k, keyed)]
+
+        @staticmethod
+        def LowestHealth(agent_array, filter_func=None):
+            """
+            Returns the agent with the lowest health that passes filter_func, or 0.
+            lowest_ally = AgentArray.Select.LowestHealth(ally_array, lambda agent_id: Agent.IsAlive(agent_id))
+            """
+            GLOBAL_CACHE = _global_cache()
+            return AgentArray.Select.ArgMin(agent_array, GLOBAL_CACHE.Agent.GetHealth, filter_func)
+
 
     class Routines:
             @staticmethod
             def DetectLargestAgentCluster(agent_array, cluster_radius):
-                from .GlobalCache import GLOBAL_CACHE
-                from .Py4GWcorelib import Utils
+                GLOBAL_CACHE = _global_cache()
 
                 """
                 Detects the largest cluster of agents based on proximity and returns
@@ -274,32 +451,14 @@ class AgentArray:
                 if not agent_array:
                     return 0  # no agents
 
-                cluster_radius_sq = cluster_radius ** 2
-
-                def is_in_radius(agent1, agent2):
-                    x1, y1 = GLOBAL_CACHE.Agent.GetXY(agent1)
-                    x2, y2 = GLOBAL_CACHE.Agent.GetXY(agent2)
-                    dx, dy = x1 - x2, y1 - y2
-                    return (dx * dx + dy * dy) <= cluster_radius_sq
-
-                # --- Group agents into clusters ---
-                unvisited = set(agent_array)
-                clusters = []
-
-                while unvisited:
-                    current = unvisited.pop()
-                    cluster = [current]
-                    stack = [current]
-
-                    while stack:
-                        node = stack.pop()
-                        neighbors = [a for a in list(unvisited) if is_in_radius(node, a)]
-                        for n in neighbors:
-                            unvisited.remove(n)
-                            cluster.append(n)
-                            stack.append(n)
+                spatial_index = GLOBAL_CACHE.AgentArray.GetSpatialIndex()
+                positions = {}
+                for agent_id in agent_array:
+                    pos = spatial_index.GetXY(agent_id)
+                    positions[agent_id] = pos if pos is not None else GLOBAL_CACHE.Agent.GetXY(agent_id)
 
-                    clusters.append(cluster)
+                # --- Group agents into clusters (grid bucketed, no pairwise scan) ---
+                clusters = AgentSpatialIndex.FindClusters(positions, cluster_radius)
 
                 # --- Find largest cluster ---
                 largest_cluster = max(clusters, key=len)
@@ -307,22 +466,338 @@ class AgentArray:
                 # --- Compute cluster center (average XY) ---
                 total_x = total_y = 0
                 for agent_id in largest_cluster:
-                    x, y = GLOBAL_CACHE.Agent.GetXY(agent_id)
+                    x, y = positions[agent_id]
                     total_x += x
                     total_y += y
                 center_x = total_x / len(largest_cluster)
                 center_y = total_y / len(largest_cluster)
-                center_pos = (center_x, center_y)
 
                 # --- Find agent closest to center ---
-                def dist(agent_id):
-                    ax, ay = GLOBAL_CACHE.Agent.GetXY(agent_id)
-                    return Utils.Distance((ax, ay), center_pos)
+                def dist_sq(agent_id):
+                    ax, ay = positions[agent_id]
+                    return (ax - center_x) ** 2 + (ay - center_y) ** 2
 
-                closest_agent_id = min(largest_cluster, key=dist)
+                closest_agent_id = min(largest_cluster, key=dist_sq)
                 return closest_agent_id
 
 
+class AgentSnapshot:
+    """
+    Frame-coherent, columnar copy of the agent array.
+
+    Every field is read from the native agent once per rebuild and stored in a
+    contiguous typed array, so range checks and sorts become plain index lookups
+    instead of a PyAgent attribute fetch per agent per call.
+    Columns support the buffer protocol (numpy.frombuffer works without copying).
+    """
+    FLAG_LIVING = 0x1
+    FLAG_ITEM = 0x2
+    FLAG_GADGET = 0x4
+
+    def __init__(self):
+        self.ids = array('I')
+        self.x = array('f')
+        self.y = array('f')
+        self.z = array('f')
+        self.hp = array('f')
+        self.energy = array('f')
+        self.allegiance = array('i')
+        self.model_id = array('i')
+        self.flags = array('I')
+        self.effects = array('I')
+        self.index: dict[int, int] = {}  # agent_id -> row
+        self.generation = 0
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, agent_id):
+        return agent_id in self.index
+
+    def clear(self):
+        for column in (self.ids, self.x, self.y, self.z, self.hp, self.energy,
+                       self.allegiance, self.model_id, self.flags, self.effects):
+            del column[:]
+        self.index.clear()
+        self.generation += 1
+
+    def rebuild(self, agents):
+        """Copy every agent field into the columns. agents is a list of PyAgent."""
+        self.clear()
+        ids, xs, ys, zs = self.ids, self.x, self.y, self.z
+        hps, energies, allegiances = self.hp, self.energy, self.allegiance
+        model_ids, flags, effects = self.model_id, self.flags, self.effects
+
+        for agent in agents:
+            agent_id = agent.id
+            if not agent_id:
+                continue
+            self.index[agent_id] = len(ids)
+            ids.append(agent_id)
+            xs.append(agent.x)
+            ys.append(agent.y)
+            zs.append(agent.z)
+            if agent.is_living:
+                living = agent.living_agent
+                hps.append(living.hp)
+                energies.append(living.energy)
+                allegiances.append(living.allegiance.ToInt())
+                model_ids.append(living.player_number)
+                flags.append(AgentSnapshot.FLAG_LIVING)
+                effects.append(living.effects)
+            else:
+                hps.append(0.0)
+                energies.append(0.0)
+                allegiances.append(0)
+                model_ids.append(0)
+                flags.append(AgentSnapshot.FLAG_ITEM if agent.is_item else
+                             AgentSnapshot.FLAG_GADGET if agent.is_gadget else 0)
+                effects.append(0)
+
+    def GetRow(self, agent_id) -> int:
+        return self.index.get(agent_id, -1)
+
+    def GetXY(self, agent_id):
+        row = self.index.get(agent_id)
+        if row is None:
+            return 0.0, 0.0
+        return self.x[row], self.y[row]
+
+    def GetHealth(self, agent_id):
+        row = self.index.get(agent_id)
+        return self.hp[row] if row is not None else 0.0
+
+    def GetEnergy(self, agent_id):
+        row = self.index.get(agent_id)
+        return self.energy[row] if row is not None else 0.0
+
+    def GetAllegiance(self, agent_id):
+        row = self.index.get(agent_id)
+        return self.allegiance[row] if row is not None else 0
+
+    def GetModelID(self, agent_id):
+        row = self.index.get(agent_id)
+        return self.model_id[row] if row is not None else 0
+
+    def FilterByDistance(self, agent_array, pos, max_distance, negate=False):
+        """Agents of agent_array within max_distance of pos. Agents missing from the snapshot are dropped."""
+        index, xs, ys = self.index, self.x, self.y
+        px, py = pos[0], pos[1]
+        max_sq = max_distance * max_distance
+        result = []
+        for agent_id in agent_array:
+            row = index.get(agent_id)
+            if row is None:
+                continue
+            dx = xs[row] - px
+            dy = ys[row] - py
+            if (dx * dx + dy * dy > max_sq) if negate else (dx * dx + dy * dy <= max_sq):
+                result.append(agent_id)
+        return result
+
+    def SortByDistance(self, agent_array, pos, descending=False):
+        index, xs, ys = self.index, self.x, self.y
+        px, py = pos[0], pos[1]
+        keyed = []
+        for agent_id in agent_array:
+            row = index.get(agent_id)
+            if row is None:
+                continue
+            dx = xs[row] - px
+            dy = ys[row] - py
+            keyed.append((dx * dx + dy * dy, agent_id))
+        keyed.sort(reverse=descending)
+        return [agent_id for _, agent_id in keyed]
+
+    def SortByHealth(self, agent_array, descending=False):
+        index, hps = self.index, self.hp
+        keyed = [(hps[index[agent_id]], agent_id) for agent_id in agent_array if agent_id in index]
+        keyed.sort(reverse=descending)
+        return [agent_id for _, agent_id in keyed]
+
+
+class AgentSpatialIndex:
+    """
+    Uniform grid over agent positions, kept in sync with the AgentSnapshot.
+
+    Only agents that changed cell (or appeared/disappeared) are touched on update,
+    radius queries only visit the cells overlapping the query circle and
+    nearest-neighbour queries expand ring by ring from the query cell.
+    """
+    def __init__(self, cell_size: float = 1000.0):
+        self.cell_size = float(cell_size)
+        self.cells: dict[tuple[int, int], set[int]] = {}
+        self.agent_cell: dict[int, tuple[int, int]] = {}
+        self.positions: dict[int, tuple[float, float]] = {}
+        self.allegiance: dict[int, int] = {}
+        self.generation = -1
+        self.min_cell = (0, 0)
+        self.max_cell = (0, 0)
+
+    def __len__(self):
+        return len(self.positions)
+
+    def _cell_of(self, x, y):
+        size = self.cell_size
+        return int(x // size), int(y // size)
+
+    def clear(self):
+        self.cells.clear()
+        self.agent_cell.clear()
+        self.positions.clear()
+        self.allegiance.clear()
+        self.generation = -1
+        self.min_cell = (0, 0)
+        self.max_cell = (0, 0)
+
+    def update(self, snapshot: "AgentSnapshot"):
+        """Bring the grid in line with snapshot, moving only agents whose cell changed."""
+        if snapshot.generation == self.generation:
+            return
+        self.generation = snapshot.generation
+
+        cells, agent_cell, positions = self.cells, self.agent_cell, self.positions
+        size = self.cell_size
+        ids, xs, ys, allegiances = snapshot.ids, snapshot.x, snapshot.y, snapshot.allegiance
+
+        for agent_id in [agent_id for agent_id in agent_cell if agent_id not in snapshot.index]:
+            cell = agent_cell.pop(agent_id)
+            bucket = cells[cell]
+            bucket.discard(agent_id)
+            if not bucket:
+                del cells[cell]
+            positions.pop(agent_id, None)
+            self.allegiance.pop(agent_id, None)
+
+        for row in range(len(ids)):
+            agent_id = ids[row]
+            x, y = xs[row], ys[row]
+            cell = (int(x // size), int(y // size))
+            positions[agent_id] = (x, y)
+            self.allegiance[agent_id] = allegiances[row]
+            old_cell = agent_cell.get(agent_id)
+            if old_cell == cell:
+                continue
+            if old_cell is not None:
+                bucket = cells[old_cell]
+                bucket.discard(agent_id)
+                if not bucket:
+                    del cells[old_cell]
+            agent_cell[agent_id] = cell
+            cells.setdefault(cell, set()).add(agent_id)
+
+        if cells:
+            cell_xs = [cell[0] for cell in cells]
+            cell_ys = [cell[1] for cell in cells]
+            self.min_cell = (min(cell_xs), min(cell_ys))
+            self.max_cell = (max(cell_xs), max(cell_ys))
+
+    def GetXY(self, agent_id):
+        return self.positions.get(agent_id)
+
+    def QueryRadius(self, pos, radius, allegiance=None) -> list[int]:
+        """Agent ids within radius of pos, optionally restricted to one allegiance (int)."""
+        px, py = pos[0], pos[1]
+        radius_sq = radius * radius
+        min_cx, min_cy = self._cell_of(px - radius, py - radius)
+        max_cx, max_cy = self._cell_of(px + radius, py + radius)
+        min_cx, min_cy = max(min_cx, self.min_cell[0]), max(min_cy, self.min_cell[1])
+        max_cx, max_cy = min(max_cx, self.max_cell[0]), min(max_cy, self.max_cell[1])
+
+        cells, positions, allegiances = self.cells, self.positions, self.allegiance
+        result = []
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for agent_id in bucket:
+                    if allegiance is not None and allegiances[agent_id] != allegiance:
+                        continue
+                    x, y = positions[agent_id]
+                    dx = x - px
+                    dy = y - py
+                    if dx * dx + dy * dy <= radius_sq:
+                        result.append(agent_id)
+        return result
+
+    def QueryNearest(self, pos, k: int = 1, max_distance: float = float('inf'), filter_func=None) -> list[int]:
+        """Up to k agent ids nearest to pos (closest first), within max_distance and passing filter_func."""
+        if k <= 0 or not self.cells:
+            return []
+        px, py = pos[0], pos[1]
+        size = self.cell_size
+        ccx, ccy = self._cell_of(px, py)
+        max_ring = max(abs(ccx - self.min_cell[0]), abs(ccx - self.max_cell[0]),
+                       abs(ccy - self.min_cell[1]), abs(ccy - self.max_cell[1]))
+        max_distance_sq = max_distance * max_distance
+        cells, positions = self.cells, self.positions
+
+        found: list[tuple[float, int]] = []
+        for ring in range(max_ring + 1):
+            # Every agent outside the visited rings is at least this far from pos.
+            ring_min_dist = max(0.0, (ring - 1) * size)
+            if ring_min_dist * ring_min_dist > max_distance_sq:
+                break
+            if len(found) >= k and ring_min_dist * ring_min_dist > found[k - 1][0]:
+                break
+            for cx in range(ccx - ring, ccx + ring + 1):
+                for cy in range(ccy - ring, ccy + ring + 1):
+                    if ring and abs(cx - ccx) != ring and abs(cy - ccy) != ring:
+                        continue
+                    bucket = cells.get((cx, cy))
+                    if not bucket:
+                        continue
+                    for agent_id in bucket:
+                        x, y = positions[agent_id]
+                        d_sq = (x - px) ** 2 + (y - py) ** 2
+                        if d_sq > max_distance_sq:
+                            continue
+                        if filter_func is not None and not filter_func(agent_id):
+                            continue
+                        found.append((d_sq, agent_id))
+            found.sort()
+        return [agent_id for _, agent_id in found[:k]]
+
+    @staticmethod
+    def FindClusters(positions: dict, cluster_radius: float) -> list[list[int]]:
+        """
+        Connected components of agents where neighbours are within cluster_radius.
+        positions maps agent_id -> (x, y). Bucketing by cluster_radius means each agent
+        only compares against the 3x3 cells around it instead of every other agent.
+        """
+        if not positions:
+            return []
+        size = max(float(cluster_radius), 1.0)
+        radius_sq = cluster_radius * cluster_radius
+        buckets: dict[tuple[int, int], list[int]] = {}
+        for agent_id, (x, y) in positions.items():
+            buckets.setdefault((int(x // size), int(y // size)), []).append(agent_id)
+
+        unvisited = set(positions)
+        clusters = []
+        while unvisited:
+            current = unvisited.pop()
+            cluster = [current]
+            stack = [current]
+            while stack:
+                node = stack.pop()
+                nx, ny = positions[node]
+                ncx, ncy = int(nx // size), int(ny // size)
+                for cx in (ncx - 1, ncx, ncx + 1):
+                    for cy in (ncy - 1, ncy, ncy + 1):
+                        for other in buckets.get((cx, cy), ()):
+                            if other not in unvisited:
+                                continue
+                            ox, oy = positions[other]
+                            if (ox - nx) ** 2 + (oy - ny) ** 2 <= radius_sq:
+                                unvisited.remove(other)
+                                cluster.append(other)
+                                stack.append(other)
+            clusters.append(cluster)
+        return clusters
+
+
 class RawAgentArray:
     _instance = None
 
@@ -354,6 +829,10 @@ class RawAgentArray:
         self.agent_cache = {}           # id -> agent instance
         self.current_map_id = 0
         self.owner_cache = {}            # id -> owner_id (for items)
+        self.snapshot = AgentSnapshot()
+        self.snapshot_dirty = True
+        self.spatial_index = AgentSpatialIndex()
+        self.generation = 0             # bumped every time the arrays are rebuilt or cleared
 
         # === Name handling ===
         self.agent_name_map: dict[int, Tuple[str, float]] = {}  # id -> (name, timestamp)
@@ -467,6 +946,9 @@ class RawAgentArray:
                     else:
                         self.neutral_array.append(agent)
 
+        self.snapshot_dirty = True
+        self.generation += 1
+
         # === Step 7: Clear names if map changes ===
         map_id = Map.GetMapID()
         if self.current_map_id != map_id:
@@ -497,6 +979,10 @@ class RawAgentArray:
         self.agent_cache.clear()
         self.agent_name_map.clear()
         self.name_requested.clear()
+        self.snapshot.clear()
+        self.snapshot_dirty = True
+        self.generation += 1
+        self.spatial_index.clear()
 
         # === Reset map state ===
         self.current_map_id = 0
@@ -538,6 +1024,19 @@ class RawAgentArray:
         self.update()
         return self.gadget_array
 
+    def get_snapshot(self) -> AgentSnapshot:
+        """Columnar snapshot of the current agent array, rebuilt at most once per update."""
+        self.update()
+        if self.snapshot_dirty:
+            self.snapshot.rebuild(self.agent_array)
+            self.snapshot_dirty = False
+        return self.snapshot
+
+    def get_spatial_index(self) -> AgentSpatialIndex:
+        """Grid index over the current snapshot, updated incrementally once per update."""
+        self.spatial_index.update(self.get_snapshot())
+        return self.spatial_index
+
     def get_agent(self, agent_id: int) -> PyAgent.PyAgent:
         self.update()
         return self.agent_dict.get(agent_id) or PyAgent.PyAgent(agent_id)
@@ -63,4 +63,10 @@ class AgentArrayCache:
     def GetRawGadgetArray(self):
         return self._raw_agent_array.get_gadget_array()
     
+    def GetSnapshot(self):
+        return self._raw_agent_array.get_snapshot()
+    
+    def GetSpatialIndex(self):
+        return self._raw_agent_array.get_spatial_index()
+    
    
\ No newline at end of file
@@ -3,10 +3,12 @@ from Py4GWCoreLib.AgentArray import RawAgentArray
 import time
 
 from Py4GWCoreLib.py4gwcorelib_src.Utils import Utils
+from .FrameMemo import FrameMemo, frame_memoized
 
 class AgentCache:
-    def __init__(self, raw_agent_array):
+    def __init__(self, raw_agent_array, frame_memo: FrameMemo | None = None):
         self.raw_agent_array:RawAgentArray = raw_agent_array
+        self._frame_memo = frame_memo  # per-frame memo for the @frame_memoized getters
         self.name_cache: dict[int, tuple[str, float]] = {}  # agent_id -> (name, timestamp)
         self.name_requested: set[int] = set()
         self.name_timeout_ms = 1_000
@@ -29,6 +31,7 @@ class AgentCache:
         self.name_cache.clear()
         self.name_requested.clear()
 
+    @frame_memoized
     def IsValid(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.IsValid(agent_id)
@@ -43,14 +46,17 @@ class AgentCache:
     def GetAgentByID(self, agent_id):
         return self.raw_agent_array.get_agent(agent_id)
     
+    @frame_memoized
     def GetAgentEffects(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.living_agent.effects
     
+    @frame_memoized
     def GetTypeMap(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.living_agent.type_map
     
+    @frame_memoized
     def GetModelState(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.living_agent.model_state
@@ -80,66 +86,82 @@ class AgentCache:
                 
         return attributes
 
+    @frame_memoized
     def GetModelID(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.living_agent.player_number
     
+    @frame_memoized
     def IsLiving(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.is_living
     
+    @frame_memoized
     def IsItem(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.is_item
     
+    @frame_memoized
     def IsGadget(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.is_gadget
     
+    @frame_memoized
     def GetPlayerNumber(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.living_agent.player_number
     
+    @frame_memoized
     def GetLoginNumber(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.living_agent.login_number
 
+    @frame_memoized
     def IsSpirit(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.living_agent.allegiance.GetName() == "Spirit/Pet"
 
+    @frame_memoized
     def IsMinion(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.living_agent.allegiance.GetName() == "Minion"
     
+    @frame_memoized
     def GetOwnerID(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.living_agent.owner_id
 
+    @frame_memoized
     def GetXY(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.x, agent.y
     
+    @frame_memoized
     def GetXYZ(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.x, agent.y, agent.z
     
+    @frame_memoized
     def GetZPlane(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.zplane
     
+    @frame_memoized
     def GetRotationAngle(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.rotation_angle
     
+    @frame_memoized
     def GetRotationCos(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.rotation_cos
     
+    @frame_memoized
     def GetRotationSin(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.rotation_sin
     
+    @frame_memoized
     def GetVelocityXY(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.velocity_x, agent.velocity_y
@@ -188,6 +210,7 @@ class AgentCache:
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.living_agent.profession.GetShortName(), agent.living_agent.secondary_profession.GetShortName()
     
+    @frame_memoized
     def GetProfessionIDs(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.living_agent.profession.ToInt(), agent.living_agent.secondary_profession.ToInt()
@@ -211,18 +234,22 @@ class AgentCache:
         return primary_texture, secondary_texture
     
     
+    @frame_memoized
     def GetLevel(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.living_agent.level
     
+    @frame_memoized
     def GetEnergy(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.living_agent.energy
     
+    @frame_memoized
     def GetMaxEnergy(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.living_agent.max_energy
     
+    @frame_memoized
     def GetEnergyRegen(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.living_agent.energy_regen
@@ -231,14 +258,17 @@ class AgentCache:
         agent = self.raw_agent_array.get_agent(agent_id)
         return Utils.calculate_energy_pips(agent.living_agent.max_energy, agent.living_agent.energy_regen)
     
+    @frame_memoized
     def GetHealth(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.living_agent.hp
     
+    @frame_memoized
     def GetMaxHealth(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.living_agent.max_hp
     
+    @frame_memoized
     def GetHealthRegen(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.living_agent.hp_regen
@@ -326,6 +356,7 @@ class AgentCache:
         type_map = self.GetTypeMap(agent_id)
         return (type_map & 0x000400) != 0
     
+    @frame_memoized
     def GetWeaponType(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.living_agent.weapon_type.ToInt(), agent.living_agent.weapon_type.GetName()
@@ -350,16 +381,19 @@ class AgentCache:
     def IsRanged(self, agent_id):
         return not self.IsMelee(agent_id)
     
+    @frame_memoized
     def GetCastingSkill(self, agent_id):
         if not self.IsCasting(agent_id):
             return 0
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.living_agent.casting_skill_id
     
+    @frame_memoized
     def GetDaggerStatus(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.living_agent.dagger_status
     
+    @frame_memoized
     def GetAllegiance(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return  agent.living_agent.allegiance.ToInt(), agent.living_agent.allegiance.GetName()
@@ -400,6 +434,7 @@ class AgentCache:
         type_map = self.GetTypeMap(agent_id)
         return (type_map & 0x400000) != 0
 
+    @frame_memoized
     def GetOvercast(self, agent_id):
         agent = self.raw_agent_array.get_agent(agent_id)
         return agent.living_agent.overcast
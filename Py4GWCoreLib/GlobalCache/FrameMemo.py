@@ -0,0 +1,65 @@
+from collections import defaultdict
+from functools import wraps
+from typing import Dict, List, Tuple
+
+
+class FrameMemo:
+    """
+    Per-frame memo shared by the GLOBAL_CACHE getters.
+    Entries are stamped with the generation they were computed in; advancing the
+    generation once per frame invalidates all of them without touching the table.
+    """
+    def __init__(self):
+        self.generation = 0
+        self.entries: Dict[Tuple[str, int], tuple] = {}  # (field, id) -> (generation, value)
+        self.hits: Dict[str, int] = defaultdict(int)
+        self.misses: Dict[str, int] = defaultdict(int)
+
+    def NextGeneration(self):
+        self.generation += 1
+
+    def Clear(self):
+        """Drop every entry, e.g. on map change when the ids stop meaning anything."""
+        self.entries.clear()
+        self.generation += 1
+
+    def GetStats(self) -> List[dict]:
+        """Hit/miss counters per field, most used first."""
+        stats = []
+        for field in set(self.hits) | set(self.misses):
+            hits = self.hits[field]
+            misses = self.misses[field]
+            stats.append({
+                "field": field,
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            })
+        stats.sort(key=lambda s: s["hits"] + s["misses"], reverse=True)
+        return stats
+
+    def ResetStats(self):
+        self.hits.clear()
+        self.misses.clear()
+
+
+def frame_memoized(method):
+    """Memoize a getter taking a single id on (generation, id, field) through self._frame_memo."""
+    field = method.__qualname__
+
+    @wraps(method)
+    def wrapper(self, object_id):
+        memo: FrameMemo = self._frame_memo
+        if memo is None:
+            return method(self, object_id)
+        key = (field, object_id)
+        entry = memo.entries.get(key)
+        if entry is not None and entry[0] == memo.generation:
+            memo.hits[field] += 1
+            return entry[1]
+        value = method(self, object_id)
+        memo.entries[key] = (memo.generation, value)
+        memo.misses[field] += 1
+        return value
+
+    return wrapper
@@ -0,0 +1,144 @@
+import heapq
+import time
+import traceback
+import Py4GW
+from typing import Callable, Dict, List, Optional
+
+
+class ScheduledJob:
+    def __init__(self, name: str, callback: Callable[[], None], period_ms: float,
+                 priority: int = 0, map_loaded_only: bool = False, refresh_while_loading: bool = False):
+        self.name = name
+        self.callback = callback
+        self.period_ms = period_ms
+        self.priority = priority                              # lower runs first when deadlines tie
+        self.map_loaded_only = map_loaded_only                # skipped while the map is loading
+        self.refresh_while_loading = refresh_while_loading    # runs every frame while the map is loading
+        self.deadline = 0.0
+        self.active = True
+
+        # === Cost report ===
+        self.runs = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms = 0.0
+
+    def _record(self, elapsed_ms: float):
+        self.runs += 1
+        self.total_ms += elapsed_ms
+        self.last_ms = elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+
+    def ResetStats(self):
+        self.runs = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms = 0.0
+
+    def __repr__(self):
+        return f"<ScheduledJob {self.name} every {self.period_ms}ms>"
+
+
+class FrameScheduler:
+    """
+    Runs refresh jobs when their deadline comes up instead of polling one timer per job.
+    Deadlines live in a heap, so a frame where nothing is due costs one clock read and one heap peek.
+    """
+    def __init__(self):
+        self._jobs: Dict[str, ScheduledJob] = {}
+        self._heap: List[tuple] = []      # (deadline, priority, sequence, job)
+        self._sequence = 0
+        self.frame = 0
+
+    def _now_ms(self) -> float:
+        return time.perf_counter() * 1000
+
+    def _push(self, job: ScheduledJob):
+        self._sequence += 1
+        heapq.heappush(self._heap, (job.deadline, job.priority, self._sequence, job))
+
+    def Register(self, name: str, callback: Callable[[], None], period_ms: float, priority: int = 0,
+                 map_loaded_only: bool = False, refresh_while_loading: bool = False) -> ScheduledJob:
+        """Register a job, replacing any job with the same name. It first runs on the next tick."""
+        self.Unregister(name)
+        job = ScheduledJob(name, callback, period_ms, priority, map_loaded_only, refresh_while_loading)
+        job.deadline = self._now_ms()
+        self._jobs[name] = job
+        self._push(job)
+        return job
+
+    def Unregister(self, name: str):
+        job = self._jobs.pop(name, None)
+        if job is not None:
+            job.active = False  # dropped lazily when it reaches the top of the heap
+
+    def GetJob(self, name: str) -> Optional[ScheduledJob]:
+        return self._jobs.get(name)
+
+    def Reset(self):
+        """Push every deadline one full period away, as if all jobs had just run."""
+        now = self._now_ms()
+        self._heap.clear()
+        for job in self._jobs.values():
+            job.deadline = now + job.period_ms
+            self._push(job)
+
+    def _run(self, job: ScheduledJob):
+        start = time.perf_counter()
+        try:
+            job.callback()
+        except Exception as e:
+            # A failing refresh is logged and retried next period; it must not drop out of the heap
+            Py4GW.Console.Log("FrameScheduler", f"Job {job.name} raised: {e}\n{traceback.format_exc()}", Py4GW.Console.MessageType.Error)
+        job._record((time.perf_counter() - start) * 1000)
+
+    def Tick(self, map_loading: bool = False):
+        """Run the jobs that are due this frame, earliest deadline first."""
+        self.frame += 1
+        now = self._now_ms()
+
+        if map_loading:
+            for job in list(self._jobs.values()):
+                if job.refresh_while_loading:
+                    self._run(job)
+
+        heap = self._heap
+        skipped = []
+        while heap and heap[0][0] <= now:
+            _, _, _, job = heapq.heappop(heap)
+            if not job.active:
+                continue
+            if map_loading and job.map_loaded_only:
+                skipped.append(job)
+                continue
+            if not (map_loading and job.refresh_while_loading):
+                self._run(job)
+            # Keep the cadence, but never try to catch up on periods that were missed
+            job.deadline += job.period_ms
+            if job.deadline <= now:
+                job.deadline = now + job.period_ms
+            self._push(job)
+
+        # Map-loaded-only jobs stay due and run on the first frame after loading
+        for job in skipped:
+            self._push(job)
+
+    def GetStats(self) -> List[dict]:
+        """Per-job cost report, most expensive first."""
+        stats = [{
+            "name": job.name,
+            "period_ms": job.period_ms,
+            "priority": job.priority,
+            "runs": job.runs,
+            "total_ms": job.total_ms,
+            "average_ms": job.total_ms / job.runs if job.runs else 0.0,
+            "max_ms": job.max_ms,
+            "last_ms": job.last_ms,
+        } for job in self._jobs.values()]
+        stats.sort(key=lambda s: s["total_ms"], reverse=True)
+        return stats
+
+    def ResetStats(self):
+        for job in self._jobs.values():
+            job.ResetStats()
@@ -1,6 +1,7 @@
 
-from Py4GWCoreLib import ThrottledTimer
 from Py4GWCoreLib.Py4GWcorelib import ActionQueueManager
+from Py4GWCoreLib.py4gwcorelib_src.IniHandler import IniHandler
+from Py4GWCoreLib.py4gwcorelib_src.CoroutineRunner import CoroutineRunner
 from Py4GWCoreLib import RawAgentArray
 
 from .PlayerCache import PlayerCache
@@ -17,8 +18,9 @@ from .QuestCache import QuestCache
 from .SkillCache import SkillCache
 from .SkillbarCache import SkillbarCache
 from .SharedMemory import Py4GWSharedMemoryManager
+from .FrameScheduler import FrameScheduler
+from .FrameMemo import FrameMemo
 
-from typing import Generator, List
 
 class GlobalCache:
     _instance = None
@@ -31,16 +33,18 @@ class GlobalCache:
 
     def _init_namespaces(self):
         self._ActionQueueManager = ActionQueueManager()
-        self._TrottleTimers = self.TrottleTimers()
+        self.Scheduler = FrameScheduler()
+        self.FrameMemo = FrameMemo()
+        self._map_was_loading = False
         self._RawAgentArray = RawAgentArray()
         self._RawItemCache = RawItemCache()
         self.Player = PlayerCache(self._ActionQueueManager)
         self.Map = MapCache(self._ActionQueueManager)
-        self.Agent = AgentCache(self._RawAgentArray)
+        self.Agent = AgentCache(self._RawAgentArray, self.FrameMemo)
         self.AgentArray = AgentArrayCache(self._RawAgentArray)
         self.Camera = CameraCache(self._ActionQueueManager)
         self.Effects = EffectsCache()
-        self.Item = ItemCache(self._RawItemCache)
+        self.Item = ItemCache(self._RawItemCache, self.FrameMemo)
         self.ItemArray = ItemArray()
         self.Inventory = InventoryCache(self._ActionQueueManager, self._RawItemCache, self.Item)
         self.Trading = TradingCache(self._ActionQueueManager)
@@ -49,7 +53,8 @@ class GlobalCache:
         self.Skill = SkillCache()
         self.SkillBar = SkillbarCache(self._ActionQueueManager)
         self.ShMem = Py4GWSharedMemoryManager()
-        self.Coroutines: List[Generator] = []
+        self.Coroutines: CoroutineRunner = CoroutineRunner("GLOBAL_CACHE")
+        self._register_jobs()
         
       
     def _reset(self):
@@ -57,67 +62,38 @@ class GlobalCache:
         self.Effects._reset_cache()
         self._RawAgentArray.reset()
         self.Item._reset_cache()
-        self._TrottleTimers.Reset()
+        self.Scheduler.Reset()
+        self.FrameMemo.Clear()
         
-    def _update_cache(self):
-        self.Map._update_cache()
-        if self.Map.IsMapLoading() or self.Map.IsInCinematic():
+    def _register_jobs(self):
+        def _update_party_and_player():
             self.Party._update_cache()
             self.Player._update_cache()
+            
+        def _update_items():
             self._RawItemCache.update()
             self.Item._update_cache()
-            self._RawAgentArray.update()
-            self.Agent._update_cache()
-            self.AgentArray._update_cache()
-            self.SkillBar._update_cache()
-               
-        if self._TrottleTimers._75ms.IsExpired():
-            self._TrottleTimers._75ms.Reset()
-            if self._TrottleTimers._500ms.IsExpired():
-                self._TrottleTimers._500ms.Reset()
-                
-   
             
-            if self._TrottleTimers._150ms.IsExpired():   
-                self._TrottleTimers._150ms.Reset()
-                self.Party._update_cache()
-                self.Player._update_cache()
-                self._RawItemCache.update()
-                self.Item._update_cache()
-                self.Camera._update_cache()
-
-             
+        def _update_agents():
             self._RawAgentArray.update()
             self.Agent._update_cache()
             self.AgentArray._update_cache()
             self.SkillBar._update_cache()
             
-            
-                  
-
-    class TrottleTimers:
-        def __init__(self):
-            self._50ms = ThrottledTimer(50)
-            self._63ms = ThrottledTimer(63) #4 frames
-            self._75ms = ThrottledTimer(75)
-            self._100ms = ThrottledTimer(100)
-            self._150ms = ThrottledTimer(150)
-            self._250ms = ThrottledTimer(250)
-            self._500ms = ThrottledTimer(500)
-            self._1_000ms = ThrottledTimer(1000)
-            self._5_000ms = ThrottledTimer(5000)
-            self._10_000ms = ThrottledTimer(10000)         
-
-        def Reset(self):
-            self._50ms.Reset()
-            self._63ms.Reset()
-            self._75ms.Reset()
-            self._100ms.Reset()
-            self._150ms.Reset()
-            self._250ms.Reset()
-            self._500ms.Reset()
-            self._1_000ms.Reset()
-            self._5_000ms.Reset()
-            self._10_000ms.Reset()
-    
-        
\ No newline at end of file
+        self.Scheduler.Register("PartyPlayer", _update_party_and_player, 150, priority=0, refresh_while_loading=True)
+        self.Scheduler.Register("Items", _update_items, 150, priority=1, refresh_while_loading=True)
+        self.Scheduler.Register("Camera", self.Camera._update_cache, 150, priority=2)
+        self.Scheduler.Register("Agents", _update_agents, 75, priority=3, refresh_while_loading=True)
+        self.Scheduler.Register("ShMemContext", self.ShMem._refresh_party_and_player_context, 150, priority=4, map_loaded_only=True)
+        self.Scheduler.Register("ShMemAgentContext", self.ShMem._refresh_agent_context, 63, priority=5, map_loaded_only=True)
+        self.Scheduler.Register("IniWriteBehind", IniHandler.FlushPending, 250, priority=6)
+        
+    def _update_cache(self):
+        self.FrameMemo.NextGeneration()  # values memoized last frame are stale from here on
+        self.Map._update_cache()
+        map_loading = self.Map.IsMapLoading()
+        if map_loading and not self._map_was_loading:
+            # Agent and item ids mean nothing in the next instance, drop what was memoized for them
+            self.FrameMemo.Clear()
+        self._map_was_loading = map_loading
+        self.Scheduler.Tick(map_loading=map_loading or self.Map.IsInCinematic())
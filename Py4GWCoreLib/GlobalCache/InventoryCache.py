@@ -105,15 +105,10 @@ class InventoryCache:
             Bag_enum.Bag_2.value
         ]
 
-        bags = self._raw_item_cache.get_bags(bags_to_check)
-        total_quantity = 0
-
-        for bag in bags:
-            for item in bag.GetItems():
-                if item.item_id == item_id:
-                    total_quantity += item.quantity
-
-        return total_quantity
+        location = self._raw_item_cache.get_item_location(item_id)
+        if location is None or location[0] not in bags_to_check:
+            return 0
+        return location[2]
 
     def GetModelCount(self, model_id: int) -> int:
         """
@@ -135,15 +130,7 @@ class InventoryCache:
             Bag_enum.Bag_2.value
         ]
 
-        bags = self._raw_item_cache.get_bags(bags_to_check)
-        total_quantity = 0
-
-        for bag in bags:
-            for item in bag.GetItems():
-                if item.model_id == model_id:
-                    total_quantity += item.quantity
-
-        return total_quantity
+        return self._raw_item_cache.get_model_quantity(model_id, bags_to_check)
     
     def GetModelCountInStorage(self, model_id: int, Anniversary_panel: bool = True) -> int:
         """
@@ -176,15 +163,7 @@ class InventoryCache:
             Bag_enum.Storage_14.value,
         ]
 
-        bags = self._raw_item_cache.get_bags([bag for bag in bags_to_check if bag is not None])
-        total_quantity = 0
-
-        for bag in bags:
-            for item in bag.GetItems():
-                if item.model_id == model_id:
-                    total_quantity += item.quantity
-
-        return total_quantity
+        return self._raw_item_cache.get_model_quantity(model_id, [bag for bag in bags_to_check if bag is not None])
 
     def GetModelCountInEquipped(self, model_id: int) -> int:
         """
@@ -194,13 +173,8 @@ class InventoryCache:
         if model_id <= 0:
             return 0
 
-        bags= self._raw_item_cache.get_bags([EQUIPPED_BAG_ID]) or []
-        total = 0
-        for bag in bags:
-            for item in bag.GetItems():
-                if item.model_id == model_id:
-                    total += int(getattr(item, "quantity", 1) or 1)
-        return total
+        entries = self._raw_item_cache.get_model_entries(model_id, [EQUIPPED_BAG_ID])
+        return sum(int(quantity or 1) for _, _, _, quantity in entries)
 
     def GetFirstIDKit(self) -> int:
         """
@@ -325,14 +299,8 @@ class InventoryCache:
             Bag_enum.Bag_2.value
         ]
 
-        bags = self._raw_item_cache.get_bags(bags_to_check)
-
-        for bag in bags:
-            for item in bag.GetItems():
-                if item.model_id == model_id:
-                    return item.item_id
-
-        return 0
+        entries = self._raw_item_cache.get_model_entries(model_id, bags_to_check)
+        return entries[0][2] if entries else 0
     
     def GetAllItemIdsByModelID(self, model_id: int) -> list[int]:
         """
@@ -348,15 +316,7 @@ class InventoryCache:
             Bag_enum.Bag_1.value,
             Bag_enum.Bag_2.value
         ]
-        item_ids = []
-
-        bags = self._raw_item_cache.get_bags(bags_to_check)
-
-        for bag in bags:
-            for item in bag.GetItems():
-                if item.model_id == model_id:
-                    item_ids.append(item.item_id)
-        return item_ids
+        return [item_id for _, _, item_id, _ in self._raw_item_cache.get_model_entries(model_id, bags_to_check)]
     
     def GetfirstModelIDInStorage(self, model_id: int) -> int:
         """
@@ -383,14 +343,8 @@ class InventoryCache:
             Bag_enum.Storage_14.value
         ]
 
-        bags = self._raw_item_cache.get_bags(bags_to_check)
-
-        for bag in bags:
-            for item in bag.GetItems():
-                if item.model_id == model_id:
-                    return item.item_id
-
-        return 0
+        entries = self._raw_item_cache.get_model_entries(model_id, bags_to_check)
+        return entries[0][2] if entries else 0
 
     def IdentifyItem (self, item_id, id_kit_id):
         """
@@ -525,14 +479,11 @@ class InventoryCache:
         Locate the bag ID and slot of the given item ID in inventory bags (1, 2, 3, 4).
         """
         bags_to_check = [1, 2, 3, 4]
-        bags = self._raw_item_cache.get_bags(bags_to_check)
-
-        for bag in bags:
-            for item in bag.GetItems():
-                if item.item_id == item_id:
-                    return bag.id, item.slot
+        location = self._raw_item_cache.get_item_location(item_id)
+        if location is None or location[0] not in bags_to_check:
+            return None, None
 
-        return None, None
+        return location[0], location[1]
 
     def DepositItemToStorage(self, item_id: int, Anniversary_panel: bool = True, ammount:int = -1) -> bool:
         """
@@ -4,7 +4,8 @@ import Py4GW
 
 from Py4GWCoreLib.Py4GWcorelib import ThrottledTimer
 from Py4GWCoreLib import Bag
-from typing import Dict, List
+from .FrameMemo import FrameMemo, frame_memoized
+from typing import Dict, List, Tuple
 import time
 from enum import Enum
 
@@ -37,6 +38,46 @@ class Bag_enum(Enum):
     Equipped_Items = 22
     Max = 23
 
+class ItemSnapshot:
+    """
+    The properties inventory planners look at, copied from one item in a single read.
+    Taken through RawItemCache.get_inventory_snapshot / ItemCache.GetInventorySnapshot.
+    """
+    __slots__ = (
+        "item_id", "bag", "slot", "model_id", "quantity", "value",
+        "rarity", "item_type", "item_type_name",
+        "is_customized", "is_identified", "is_salvageable",
+        "is_material", "is_material_salvageable", "is_rare_material",
+        "is_tome", "is_usable",
+    )
+
+    def __init__(self, bag: int, item: PyItem.PyItem):
+        self.item_id: int = item.item_id
+        self.bag: int = bag
+        self.slot: int = item.slot
+        self.model_id: int = item.model_id
+        self.quantity: int = item.quantity
+        self.value: int = item.value
+        self.rarity: str = item.rarity.name
+        self.item_type: int = item.item_type.ToInt()
+        self.item_type_name: str = item.item_type.GetName()
+        self.is_customized: bool = item.is_customized
+        self.is_identified: bool = item.is_identified
+        self.is_salvageable: bool = item.is_salvageable
+        self.is_material: bool = item.is_material
+        self.is_material_salvageable: bool = item.is_material_salvageable != 0
+        self.is_rare_material: bool = item.is_rare_material
+        self.is_tome: bool = item.is_tome
+        self.is_usable: bool = item.is_usable
+
+    @property
+    def is_trophy(self) -> bool:
+        return self.item_type_name == "Trophy"
+
+    def __repr__(self):
+        return f"<ItemSnapshot {self.item_id} model={self.model_id} bag={self.bag} qty={self.quantity}>"
+
+
 class RawItemCache:
     _instance = None
 
@@ -56,6 +97,15 @@ class RawItemCache:
         self.transitory_items: Dict[int, PyItem.PyItem] = {}
         self.update_throttle = ThrottledTimer(throttle)
         self.map_valid = False
+
+        # === Inventory indexes ===
+        # Rebuilt in update() only when the contents of a bag changed, so counts and
+        # lookups by model or item id are dictionary reads instead of bag walks.
+        self._bag_signatures: Dict[int, tuple] = {}                  # bag -> ((item_id, slot, quantity), ...)
+        self._bag_entries: Dict[int, List[Tuple[int, int, int, int]]] = {}  # bag -> [(model_id, slot, item_id, quantity)]
+        self.model_index: Dict[int, List[Tuple[int, int, int, int]]] = {}   # model_id -> [(bag, slot, item_id, quantity)]
+        self.item_index: Dict[int, Tuple[int, int, int]] = {}        # item_id -> (bag, slot, quantity)
+        self.index_generation = 0
         self._initialized = True
         
     def reset(self):
@@ -63,6 +113,11 @@ class RawItemCache:
         self.transitory_items.clear()
         self.update_throttle.Reset()
         self.map_valid = False
+        self._bag_signatures.clear()
+        self._bag_entries.clear()
+        self.model_index.clear()
+        self.item_index.clear()
+        self.index_generation += 1
         
     def update(self):
         
@@ -78,6 +133,8 @@ class RawItemCache:
                 self.bags[bag] = bag_instance
             except Exception:
                 continue  # Skip invalid bags
+
+        self._update_indexes()
             
         # Clean up transitory items that no longer exist
         to_remove = []
@@ -93,6 +150,60 @@ class RawItemCache:
         for item_id in to_remove:
             del self.transitory_items[item_id]
             
+    def _update_indexes(self):
+        changed = False
+        for bag, bag_instance in self.bags.items():
+            items = bag_instance.GetItems()
+            signature = tuple((item.item_id, item.slot, item.quantity) for item in items)
+            if self._bag_signatures.get(bag) == signature:
+                continue
+            self._bag_signatures[bag] = signature
+            self._bag_entries[bag] = [(item.model_id, item.slot, item.item_id, item.quantity) for item in items]
+            changed = True
+
+        for bag in [bag for bag in self._bag_signatures if bag not in self.bags]:
+            del self._bag_signatures[bag]
+            del self._bag_entries[bag]
+            changed = True
+
+        if not changed:
+            return
+
+        # Bags are walked in id order so the first entry of a model matches the old bag scans
+        model_index: Dict[int, List[Tuple[int, int, int, int]]] = {}
+        item_index: Dict[int, Tuple[int, int, int]] = {}
+        for bag in sorted(self._bag_entries):
+            for model_id, slot, item_id, quantity in self._bag_entries[bag]:
+                model_index.setdefault(model_id, []).append((bag, slot, item_id, quantity))
+                item_index[item_id] = (bag, slot, quantity)
+        self.model_index = model_index
+        self.item_index = item_index
+        self.index_generation += 1
+
+    def get_model_entries(self, model_id: int, bag_list: List[int] | None = None) -> List[Tuple[int, int, int, int]]:
+        """
+        Returns (bag, slot, item_id, quantity) for every item of the given model, in bag order.
+        Restricted to bag_list when given.
+        """
+        entries = self.model_index.get(model_id)
+        if not entries:
+            return []
+        if bag_list is None:
+            return entries
+        return [entry for entry in entries if entry[0] in bag_list]
+
+    def get_model_quantity(self, model_id: int, bag_list: List[int] | None = None) -> int:
+        """
+        Returns the total quantity of the given model, restricted to bag_list when given.
+        """
+        return sum(entry[3] for entry in self.get_model_entries(model_id, bag_list))
+
+    def get_item_location(self, item_id: int) -> Tuple[int, int, int] | None:
+        """
+        Returns (bag, slot, quantity) of an item held in any bag, or None.
+        """
+        return self.item_index.get(item_id)
+            
     def add_transitory_item(self, item_id: int):
         """
         Manually adds an item to the transitory cache if it is not already in any bag.
@@ -166,10 +277,38 @@ class RawItemCache:
         Returns a list of all Bag instances.
         """
         return list(self.bags.values())
+
+    def get_inventory_snapshot(self, bag_list: List[int]) -> List[ItemSnapshot]:
+        """
+        Returns an ItemSnapshot for every item in the given bags, reading each bag once.
+        """
+        snapshot = []
+        for bag in bag_list:
+            bag_instance = self.get_bag(bag)
+            if bag_instance is None:
+                continue
+            for item in bag_instance.GetItems():
+                snapshot.append(ItemSnapshot(bag, item))
+        return snapshot
+
+    def recheck_item(self, bag: int, item_id: int) -> ItemSnapshot | None:
+        """
+        Re-reads a single item from the bag it was seen in.
+        Returns None once the item has left that bag.
+        """
+        bag_instance = self.get_bag(bag)
+        if bag_instance is None:
+            return None
+        item = bag_instance.FindItemById(item_id)
+        if not item:
+            return None
+        return ItemSnapshot(bag, item)
     
     def get_item_by_id(self, item_id: int):
-        for bag in self.bags.values():
-            item = bag.FindItemById(item_id)
+        location = self.item_index.get(item_id)
+        if location is not None:
+            bag = self.bags.get(location[0])
+            item = bag.FindItemById(item_id) if bag is not None else None
             if item:
                 return item
         
@@ -187,8 +326,9 @@ class RawItemCache:
         return None  # Item not found
     
 class ItemCache:
-    def __init__(self, raw_item_array):
+    def __init__(self, raw_item_array, frame_memo: FrameMemo | None = None):
         self.raw_item_array:RawItemCache = raw_item_array
+        self._frame_memo = frame_memo  # per-frame memo for the @frame_memoized getters
         self.name_cache: dict[int, tuple[str, float]] = {}  # agent_id -> (name, timestamp)
         self.name_requested: set[int] = set()
         self.name_timeout_ms = 1_000
@@ -217,49 +357,58 @@ class ItemCache:
         self.name_cache.clear()
         self.name_requested.clear()
         
+    @frame_memoized
+    def _get_item(self, item_id: int):
+        """Resolve an item once per frame; every getter below goes through here."""
+        return self.raw_item_array.get_item_by_id(item_id)
+        
     def GetAgentID(self, item_id: int) -> int:
-        item = self.raw_item_array.get_item_by_id(item_id)
+        item = self._get_item(item_id)
         if item is None:
             return 0
         return item.agent_id
     
     def GetAgentItemID(self, item_id: int) -> int:
-        item = self.raw_item_array.get_item_by_id(item_id)
+        item = self._get_item(item_id)
         if item is None:
             return 0
         return item.agent_item_id
     
     def GetItemIdFromModelID(self, model_id):
         """Purpose: Retrieve the item ID from the model ID."""
-        bags = self.raw_item_array.get_all_bags()
-
-        for bag in bags:
-            for item in bag.GetItems():
-                # Check if the item's model ID matches the given model ID
-                if item.model_id == model_id:
-                    return item.item_id  # Return the item ID if a match is found
+        entries = self.raw_item_array.get_model_entries(model_id)
+        if entries:
+            return entries[0][2]  # Item ID of the first match in bag order
 
         return 0  # Return 0 if no matching item is found
     
     def GetItemByAgentID(self, agent_id: int):
-        item = self.raw_item_array.get_item_by_id(agent_id)
+        item = self._get_item(agent_id)
         return item
+
+    def GetInventorySnapshot(self, bag_list: List[int]) -> List[ItemSnapshot]:
+        """Purpose: Read the planner properties of every item in the given bags in one pass."""
+        return self.raw_item_array.get_inventory_snapshot([getattr(bag, "value", bag) for bag in bag_list])
+
+    def RecheckItem(self, item: ItemSnapshot) -> ItemSnapshot | None:
+        """Purpose: Refresh one snapshot entry after acting on it. None once the item is gone."""
+        return self.raw_item_array.recheck_item(item.bag, item.item_id)
     
     def RequestName(self, item_id: int):
-        item = self.raw_item_array.get_item_by_id(item_id)
+        item = self._get_item(item_id)
         if item is None:
             return
         item.RequestName()
         
     def IsNameReady(self, item_id: int) -> bool:
-        item = self.raw_item_array.get_item_by_id(item_id)
+        item = self._get_item(item_id)
         if item is None:
             return False
         return item.IsItemNameReady()
         
     def GetName(self, item_id: int) -> str:
         now = time.time() * 1500  # current time in ms
-        item = self.raw_item_array.get_item_by_id(item_id)
+        item = self._get_item(item_id)
         if item is None:
             return ""
 
@@ -281,31 +430,31 @@ class ItemCache:
         return ""  
         
     def GetItemType(self, item_id: int):
-        item = self.raw_item_array.get_item_by_id(item_id)
+        item = self._get_item(item_id)
         if item is None:
             return 0, ""
         return item.item_type.ToInt(), item.item_type.GetName()
         
     def GetModelID(self, item_id: int) -> int:
-        item = self.raw_item_array.get_item_by_id(item_id)
+        item = self._get_item(item_id)
         if item is None:
             return 0
         return item.model_id
 
     def GetModelFileID(self, item_id: int) -> int:
-        item = self.raw_item_array.get_item_by_id(item_id)
+        item = self._get_item(item_id)
         if item is None:
             return 0
         return item.model_file_id
 
     def GetSlot(self, item_id: int) -> int:
-        item = self.raw_item_array.get_item_by_id(item_id)
+        item = self._get_item(item_id)
         if item is None:
             return 0
         return item.slot   
     
     def GetDyeColor(self, item_id: int) -> int: 
-        item = self.raw_item_array.get_item_by_id(item_id)   
+        item = self._get_item(item_id)   
         if item is None:
             return 0    
         mods = item.modifiers
@@ -320,41 +469,41 @@ class ItemCache:
             self._parent = parent
         
         def GetRarity(self, item_id: int):
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return 0, ""
             return item.rarity.value, item.rarity.name
         
         def IsWhite(self,item_id):
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             rarity_name  = item.rarity.name
             return rarity_name == "White"
         
         def IsBlue(self,item_id):
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             rarity_name  = item.rarity.name
             return rarity_name == "Blue"
 
         def IsPurple(self,item_id):
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             rarity_name  = item.rarity.name
             return rarity_name == "Purple"
         
         def IsGold(self,item_id):
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             rarity_name  = item.rarity.name
             return rarity_name == "Gold"
         
         def IsGreen(self,item_id):
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             rarity_name  = item.rarity.name
@@ -365,37 +514,37 @@ class ItemCache:
             self._parent = parent
         
         def IsCustomized(self, item_id: int) -> bool:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             return item.is_customized 
         
         def GetValue(self, item_id: int) -> int:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return 0
             return item.value
         
         def GetQuantity(self, item_id: int) -> int:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return 0
             return item.quantity
         
         def IsEquipped(self, item_id: int) -> bool:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             return False if item.equipped == 0 else True
         
         def GetProfession(self, item_id: int) -> int:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return 0
             return item.profession
         
         def GetInteraction(self, item_id: int) -> int:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return 0
             return item.interaction
@@ -405,55 +554,55 @@ class ItemCache:
             self._parent = parent
         
         def IsWeapon(self, item_id: int) -> bool:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             return item.is_weapon
         
         def IsArmor(self, item_id: int) -> bool:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             return item.is_armor
         
         def IsInventoryItem(self, item_id: int) -> bool:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             return item.is_inventory_item
         
         def IsStorageItem(self, item_id: int) -> bool:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             return item.is_storage_item
         
         def IsMaterial(self, item_id: int) -> bool:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             return item.is_material
         
         def IsRareMaterial(self, item_id: int) -> bool:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             return item.is_rare_material    
         
         def IsZCoin(self, item_id: int) -> bool:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             return item.is_zcoin
         
         def IsTome(self, item_id: int) -> bool:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             return item.is_tome
         
         def IsTrophy(self, item_id: int) -> bool:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             _, item_type_name = self._parent.GetItemType(item_id)
@@ -467,61 +616,61 @@ class ItemCache:
             self._parent = parent
         
         def IsUsable(self, item_id: int) -> bool:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             return item.is_usable   
         
         def GetUses(self, item_id: int) -> int:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return 0
             return item.uses
         
         def IsSalvageable(self, item_id: int) -> bool:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             return item.is_salvageable
         
         def IsMaterialSalvageable(self, item_id: int) -> bool:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             return False if item.is_material_salvageable == 0 else True
         
         def IsSalvageKit(self, item_id: int) -> bool:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             return False if item.is_salvage_kit == 0 else True
         
         def IsLesserKit(self, item_id: int) -> bool:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             return item.is_lesser_kit
         
         def IsExpertSalvageKit(self, item_id: int) -> bool:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             return item.is_expert_salvage_kit
         
         def IsPerfectSalvageKit(self, item_id: int) -> bool:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             return item.is_perfect_salvage_kit
         
         def IsIDKit(self, item_id: int) -> bool:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             return item.is_id_kit
         
         def IsIdentified(self, item_id: int) -> bool:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             return item.is_identified
@@ -532,25 +681,25 @@ class ItemCache:
             self.Modifiers = self._Modifiers(parent)
         
         def IsInscription(self, item_id: int) -> bool:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             return item.is_inscription   
         
         def IsInscribable(self, item_id: int) -> bool:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             return item.is_inscribable
         
         def IsPrefixUpgradable(self, item_id: int) -> bool:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             return item.is_prefix_upgradable
         
         def IsSuffixUpgradable(self, item_id: int) -> bool:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             return item.is_suffix_upgradable
@@ -560,19 +709,19 @@ class ItemCache:
                 self._parent = parent
             
             def GetModifierCount(self, item_id):
-                item = self._parent.raw_item_array.get_item_by_id(item_id)
+                item = self._parent._get_item(item_id)
                 if item is None:
                     return 0
                 return len(item.modifiers)
             
             def GetModifiers(self, item_id):
-                item = self._parent.raw_item_array.get_item_by_id(item_id)
+                item = self._parent._get_item(item_id)
                 if item is None:
                     return []
                 return item.modifiers
         
             def ModifierExists(self, item_id, mod_id):
-                item = self._parent.raw_item_array.get_item_by_id(item_id)
+                item = self._parent._get_item(item_id)
                 if item is None:
                     return False
                 for mod in item.modifiers:
@@ -581,7 +730,7 @@ class ItemCache:
                 return False
 
             def GetModifierValues(self, item_id,identifier_lookup):
-                item = self._parent.raw_item_array.get_item_by_id(item_id)
+                item = self._parent._get_item(item_id)
                 if item is None:
                     return None, None, None
                 for modifier in item.modifiers:
@@ -595,25 +744,25 @@ class ItemCache:
                 return None, None, None
         
         def GetDyeInfo(self, item_id):
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return PyItem.PyItem(item_id).dye_info
             return item.dye_info
         
         def GetItemFormula(self, item_id):
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return 0
             return item.item_formula
         
         def IsStackable(self, item_id):
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             return (item.interaction & 0x80000) != 0
         
         def IsSparkly(self, item_id):
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             return item.is_sparkly
@@ -623,13 +772,13 @@ class ItemCache:
             self._parent = parent
         
         def IsOfferedInTrade(self, item_id: int) -> bool:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             return item.is_offered_in_trade
         
         def IsTradable(self, item_id: int) -> bool:
-            item = self._parent.raw_item_array.get_item_by_id(item_id)
+            item = self._parent._get_item(item_id)
             if item is None:
                 return False
             return item.is_tradable
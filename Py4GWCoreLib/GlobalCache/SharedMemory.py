@@ -5,11 +5,12 @@ from PyParty import HeroPartyMember
 from PyEffects import BuffType, EffectType
 from PyPlayer import LoginCharacterInfo
 from typing import Tuple, List
-from Py4GWCoreLib import ConsoleLog, Map, Party, Player, Agent, Effects, SharedCommandType, Skill, ThrottledTimer
+from Py4GWCoreLib import ConsoleLog, Map, Party, Player, Agent, Effects, SharedCommandType, Skill
 from Py4GWCoreLib.enums import FactionType
-from ctypes import Array, Structure, addressof, c_int, c_uint, c_float, c_bool, c_wchar, memmove
+from ctypes import Array, Structure, addressof, c_int, c_uint, c_ulonglong, c_float, c_bool, c_wchar, memmove
 from multiprocessing import shared_memory
 import ctypes
+import os
 from ctypes import sizeof
 from datetime import datetime, timezone
 
@@ -27,6 +28,22 @@ SMM_MODULE_NAME = "Py4GW - Shared Memory"
 SHMEM_SHARED_MEMORY_FILE_NAME = "Py4GW_Shared_Mem"
 SHMEM_ZERO_EPOCH = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
 SHMEM_SUBSCRIBE_TIMEOUT_MILLISECONDS = 500 # milliseconds
+SHMEM_MESSAGE_QUEUE_CAPACITY = 64 # messages waiting per receiver slot
+
+# Sections of AccountData that carry their own generation counter in SectionGenerations.
+# Writers bump a counter only when the section content changed, readers compare it to
+# the last value they saw to skip unchanged sections.
+SHMEM_SECTION_BUFFS = 0
+SHMEM_SECTION_ATTRIBUTES = 1
+SHMEM_SECTION_SKILLBAR = 2
+SHMEM_SECTION_RANK = 3
+SHMEM_SECTION_FACTIONS = 4
+SHMEM_SECTION_TITLES = 5
+SHMEM_SECTION_QUESTS = 6
+SHMEM_SECTION_EXPERIENCE = 7
+SHMEM_SECTION_AVAILABLE_CHARACTERS = 8
+SHMEM_SECTION_UNLOCKS = 9  # unlocked skills and mission flags
+SHMEM_NUMBER_OF_SECTIONS = 10
 
 SHMEM_NUMBER_OF_SKILLS = 8
 SHMEM_NUMBER_OF_ATTRIBUTES = len(Attribute) #5 primary + 3 secondary + 1 from of Profession Mod
@@ -428,6 +445,9 @@ class AccountData(Structure):
         
         #Restructure Structures
         ("PlayerData", PlayerStruct),
+        
+        ("BuffCount", c_uint),  # used entries of PlayerBuffs / BuffData
+        ("SectionGenerations", c_uint * SHMEM_NUMBER_OF_SECTIONS),
     ]
     
     # Type hints for IntelliSense
@@ -472,6 +492,9 @@ class AccountData(Structure):
     LastUpdated: int
     
     PlayerData: PlayerStruct
+    
+    BuffCount: int
+    SectionGenerations: list[int]
         
     def clone(self) -> "AccountData":
         """Return a deep copy of this AccountData as a real ctypes structure."""
@@ -502,6 +525,38 @@ class SharedMessage(Structure):
     Running: bool
     Timestamp: int
     
+class MessageQueueStruct(Structure):
+    """Inbox of one receiver slot.
+    Tickets[i] is the send ticket of a published entry, 0 while it is free or being written.
+    Readers order entries by ticket, so any finished entry can be reused right away
+    without a long-running message at the front holding up the ones behind it.
+    """
+    _pack_ = 1
+    _fields_ = [
+        ("Initialized", c_bool),
+        ("LastTicket", c_uint),
+        ("Tickets", c_uint * SHMEM_MESSAGE_QUEUE_CAPACITY),
+        ("ClaimTokens", c_uint * SHMEM_MESSAGE_QUEUE_CAPACITY),
+        ("Messages", SharedMessage * SHMEM_MESSAGE_QUEUE_CAPACITY),
+        ("Sent", c_uint),
+        ("Delivered", c_uint),
+        ("Dropped", c_uint),
+        ("LatencyTotal", c_ulonglong),  # milliseconds from send to pickup, summed
+        ("LatencyMax", c_uint),
+    ]
+    
+    # Type hints for IntelliSense
+    Initialized: bool
+    LastTicket: int
+    Tickets: list[int]
+    ClaimTokens: list[int]
+    Messages: list[SharedMessage]
+    Sent: int
+    Delivered: int
+    Dropped: int
+    LatencyTotal: int
+    LatencyMax: int
+    
 class HeroAIOptionStruct(Structure):
     _pack_ = 1
     _fields_ = [
@@ -533,13 +588,13 @@ class AllAccounts(Structure):
     _pack_ = 1
     _fields_ = [
         ("AccountData", AccountData * SHMEM_MAX_NUM_PLAYERS),
-        ("SharedMessage", SharedMessage * SHMEM_MAX_NUM_PLAYERS),  # Messages for each player
+        ("MessageQueues", MessageQueueStruct * SHMEM_MAX_NUM_PLAYERS),  # Inbox of each player slot
         ("HeroAIOptions", HeroAIOptionStruct * SHMEM_MAX_NUM_PLAYERS),  # Game options for HeroAI
     ]
     
     # Type hints for IntelliSense
     AccountData: list[AccountData]
-    SharedMessage: list[SharedMessage]
+    MessageQueues: list[MessageQueueStruct]
     HeroAIOptions: list[HeroAIOptionStruct]
     
     
@@ -565,8 +620,6 @@ class Py4GWSharedMemoryManager:
             self._title_instances: dict[int, PyPlayer.PyTitle] = {}
             self.quest_instance = None
             self._quest_instances: dict[int, PyQuest.PyQuest] = {}
-            self.throttle_timer_150 = ThrottledTimer(150)
-            self.throttle_timer_63 = ThrottledTimer(63) # 4 frames at 15 FPS
         
         # Create or attach shared memory
         try:
@@ -576,8 +629,12 @@ class Py4GWSharedMemoryManager:
             self.shm = shared_memory.SharedMemory(name=self.shm_name, create=True, size=self.size)
             ConsoleLog(SMM_MODULE_NAME, "Shared memory area created.", Py4GW.Console.MessageType.Success)
 
-        # Attach the shared memory structure
-        #self.game_struct = AllAccounts.from_buffer(self.shm.buf)
+        # Attach the shared memory structure once; every accessor reads through this view
+        self._struct = AllAccounts.from_buffer(self.shm.buf)
+        self._account_slots: dict[str, int] = {}  # email -> slot, validated on read
+        self._claim_base = (os.getpid() & 0xFFFF) << 16  # makes inbox claim tokens unique per client
+        self._claim_counter = 0
+        self._section_signatures: dict[tuple[int, int], tuple] = {}  # (slot, section) -> (signature, generation written)
         self.ResetAllData()  # Initialize all player data
         
         self._initialized = True
@@ -585,7 +642,19 @@ class Py4GWSharedMemoryManager:
     def GetStruct(self) -> AllAccounts:
         if self.shm.buf is None:
             raise RuntimeError("Shared memory is not initialized.")
-        return AllAccounts.from_buffer(self.shm.buf)
+        return self._struct
+    
+    def GetAccountDataBySlot(self, index: int) -> AccountData:
+        """Get the AccountData living in the given slot."""
+        return self._struct.AccountData[index]
+    
+    def GetHeroAIOptionsBySlot(self, index: int) -> HeroAIOptionStruct:
+        """Get the HeroAI options living in the given slot."""
+        return self._struct.HeroAIOptions[index]
+    
+    def GetMessageQueueBySlot(self, index: int) -> MessageQueueStruct:
+        """Get the inbox of the given slot."""
+        return self._struct.MessageQueues[index]
         
     def GetBaseTimestamp(self):
         # Return milliseconds since ZERO_EPOCH
@@ -622,6 +691,8 @@ class Py4GWSharedMemoryManager:
         for i in range(self.max_num_players):
             self.ResetPlayerData(i)
             self.ResetHeroAIData(i)
+            if not self._struct.MessageQueues[i].Initialized:
+                self.ResetMessageQueue(i)
         
     def ResetPlayerData(self, index):
         """Reset data for a specific player."""
@@ -666,6 +737,7 @@ class Py4GWSharedMemoryManager:
         
         def _reset_buff_data(index):
             player : AccountData = self.GetStruct().AccountData[index]
+            player.BuffCount = 0
             for j in range(SHMEM_MAX_NUMBER_OF_BUFFS):
                 player.PlayerData.BuffData[j].SkillId = 0
                 player.PlayerData.BuffData[j].Type = 0
@@ -829,6 +901,7 @@ class Py4GWSharedMemoryManager:
         if 0 <= index < self.max_num_players:
             player : AccountData = self.GetStruct().AccountData[index]
             player.IsSlotActive = False
+            self._forget_account_slot(index)
             _reset_account_data(index)
             _reset_hero_data(index)
             _reset_pet_data(index)
@@ -846,6 +919,7 @@ class Py4GWSharedMemoryManager:
             _reset_experience_data(index)
             _reset_agent_data(index)
             _reset_available_characters_data(index)
+            self._invalidate_sections(index)
                 
             player.LastUpdated = self.GetBaseTimestamp()
            
@@ -866,30 +940,154 @@ class Py4GWSharedMemoryManager:
        
     def _is_slot_active(self, index: int) -> bool:
         """Check if the slot at the given index is active."""
-        slot_active = self.GetStruct().AccountData[index].IsSlotActive    
-        last_updated = self.GetStruct().AccountData[index].LastUpdated
-        
-        base_timestamp = self.GetBaseTimestamp()
-        if slot_active and (base_timestamp - last_updated) < SHMEM_SUBSCRIBE_TIMEOUT_MILLISECONDS:
+        player = self._struct.AccountData[index]
+        if not player.IsSlotActive:
+            return False
+        return (self.GetBaseTimestamp() - player.LastUpdated) < SHMEM_SUBSCRIBE_TIMEOUT_MILLISECONDS
+    
+    def _forget_account_slot(self, index: int):
+        """Drop every email that the index maps to the given slot."""
+        for email in [email for email, slot in self._account_slots.items() if slot == index]:
+            del self._account_slots[email]
+
+    #region Section Publishing
+    def _section_changed(self, index: int, section: int, signature: tuple) -> bool:
+        """Check whether a section has to be written again.
+        True when the content differs from what this client wrote last, or when
+        somebody else touched the section since then.
+        """
+        last = self._section_signatures.get((index, section))
+        if last is None:
             return True
-        return False
+        last_signature, last_generation = last
+        return (last_signature != signature or
+                self._struct.AccountData[index].SectionGenerations[section] != last_generation)
+    
+    def _section_written(self, index: int, section: int, signature: tuple):
+        """Publish a section that was just written by bumping its generation."""
+        generations = self._struct.AccountData[index].SectionGenerations
+        generation = (generations[section] + 1) & UINT32_MAX
+        generations[section] = generation
+        self._section_signatures[(index, section)] = (signature, generation)
+        
+    def _invalidate_sections(self, index: int):
+        """Forget what was written to a slot and tell readers every section changed."""
+        generations = self._struct.AccountData[index].SectionGenerations
+        for section in range(SHMEM_NUMBER_OF_SECTIONS):
+            generations[section] = (generations[section] + 1) & UINT32_MAX
+            self._section_signatures.pop((index, section), None)
+            
+    def GetSectionGeneration(self, index: int, section: int) -> int:
+        """Get the generation of a section of the given slot. It changes whenever the section content does."""
+        return self._struct.AccountData[index].SectionGenerations[section]
+    
+    def _write_buff_data(self, index: int, buffs: list):
+        rows = []
+        remaining = []
+        for buff in buffs[:SHMEM_MAX_NUMBER_OF_BUFFS]:
+            effect = buff if isinstance(buff, EffectType) else None
+            upkeep = buff if isinstance(buff, BuffType) else None
+            rows.append((buff.skill_id,
+                         2 if effect else (1 if upkeep else 0),
+                         effect.duration if effect else 0.0,
+                         upkeep.target_agent_id if upkeep else 0))
+            remaining.append(effect.time_remaining if effect else 0.0)
+        # time_remaining ticks every frame while an effect is up, so it is left out of the
+        # signature: the generation only moves when the buff list itself changes.
+        signature = tuple(rows)
+        player : AccountData = self._struct.AccountData[index]
+        buff_data = player.PlayerData.BuffData
+        player_buffs = player.PlayerBuffs
+        count = len(rows)
+        if not self._section_changed(index, SHMEM_SECTION_BUFFS, signature):
+            for j in range(count):
+                if rows[j][1] == 2:  # only effects carry a time remaining
+                    buff_data[j].Remaining = remaining[j]
+                    player_buffs[j].Remaining = remaining[j]
+            return
+        
+        # Entries past the previous count are already empty
+        for j in range(min(max(count, player.BuffCount), SHMEM_MAX_NUMBER_OF_BUFFS)):
+            skill_id, buff_type, duration, target_agent_id = rows[j] if j < count else (0, 0, 0.0, 0)
+            time_remaining = remaining[j] if j < count else 0.0
+            for buff in (buff_data[j], player_buffs[j]):
+                buff.SkillId = skill_id
+                buff.Type = buff_type
+                buff.Duration = duration
+                buff.TargetAgentID = target_agent_id
+                buff.Remaining = time_remaining
+        player.BuffCount = count
+        self._section_written(index, SHMEM_SECTION_BUFFS, signature)
+        
+    def _write_attribute_data(self, index: int, attributes: list):
+        by_id = {}
+        for attribute in attributes:
+            by_id.setdefault(int(attribute.attribute_id), attribute)
+        signature = tuple(
+            (attribute_id, by_id[attribute_id].level, by_id[attribute_id].level_base) if attribute_id in by_id else (0, 0, 0)
+            for attribute_id in range(SHMEM_NUMBER_OF_ATTRIBUTES))
+        if not self._section_changed(index, SHMEM_SECTION_ATTRIBUTES, signature):
+            return
+        
+        attributes_data = self._struct.AccountData[index].PlayerData.AttributesData
+        for attribute_id, (id, value, base_value) in enumerate(signature):
+            attributes_data[attribute_id].Id = id
+            attributes_data[attribute_id].Value = value
+            attributes_data[attribute_id].BaseValue = base_value
+        self._section_written(index, SHMEM_SECTION_ATTRIBUTES, signature)
+        
+    def _write_skillbar_data(self, index: int, skills: list[tuple[int, float, float]], casting_skill: int):
+        """skills holds (id, recharge, adrenaline) per skillbar slot."""
+        if casting_skill not in [skill_id for skill_id, _, _ in skills]:
+            casting_skill = 0
+        # Recharge and adrenaline tick every refresh while a skill recharges or charges, so like
+        # time_remaining on buffs they are left out of the signature and refreshed in place:
+        # the generation only moves when the bar itself changes.
+        signature = (tuple(skill_id for skill_id, _, _ in skills), casting_skill)
+        skillbar_data = self._struct.AccountData[index].PlayerData.SkillbarData
+        if not self._section_changed(index, SHMEM_SECTION_SKILLBAR, signature):
+            for slot in range(min(len(skills), SHMEM_NUMBER_OF_SKILLS)):
+                _, recharge, adrenaline = skills[slot]
+                skillbar_data.Skills[slot].Recharge = recharge
+                skillbar_data.Skills[slot].Adrenaline = adrenaline
+            return
+        
+        for slot in range(SHMEM_NUMBER_OF_SKILLS):
+            skill_id, recharge, adrenaline = skills[slot] if slot < len(skills) else (0, 0.0, 0.0)
+            skillbar_data.Skills[slot].Id = skill_id
+            skillbar_data.Skills[slot].Recharge = recharge
+            skillbar_data.Skills[slot].Adrenaline = adrenaline
+        skillbar_data.CastingSkillID = casting_skill
+        self._section_written(index, SHMEM_SECTION_SKILLBAR, signature)
 
     #region Find and Get Slot Methods
     def FindAccount(self, account_email: str) -> int:
         """Find the index of the account with the given email."""
+        # Other clients write the same segment, so a remembered slot is only a hint
+        # and is checked against the struct before it is trusted.
+        index = self._account_slots.get(account_email, -1)
+        if index != -1:
+            player = self._struct.AccountData[index]
+            if player.IsAccount and player.AccountEmail == account_email and self._is_slot_active(index):
+                return index
+            del self._account_slots[account_email]
+            
+        accounts = self._struct.AccountData
         for i in range(self.max_num_players):
-            player = self.GetStruct().AccountData[i]
+            player = accounts[i]
             #if not player.IsSlotActive:
             if not self._is_slot_active(i):
                 continue
-            if self.GetStruct().AccountData[i].AccountEmail == account_email and player.IsAccount:
+            if player.AccountEmail == account_email and player.IsAccount:
+                self._account_slots[account_email] = i
                 return i
         return -1
     
     def FindHero(self, hero_data) -> int:
         """Find the index of the hero with the given ID."""
+        accounts = self._struct.AccountData
         for i in range(self.max_num_players):
-            player = self.GetStruct().AccountData[i]
+            player = accounts[i]
             #if not player.IsSlotActive:
             if not self._is_slot_active(i):
                 continue
@@ -899,8 +1097,9 @@ class Py4GWSharedMemoryManager:
     
     def FindPet(self, pet_data) -> int:
         """Find the index of the pet with the given ID."""
+        accounts = self._struct.AccountData
         for i in range(self.max_num_players):
-            player = self.GetStruct().AccountData[i]
+            player = accounts[i]
             #if not player.IsSlotActive:
             if not self._is_slot_active(i):
                 continue
@@ -910,13 +1109,12 @@ class Py4GWSharedMemoryManager:
 
     def FindEmptySlot(self) -> int:
         """Find the first empty slot in shared memory."""
+        accounts = self._struct.AccountData
+        base_timestamp = self.GetBaseTimestamp()
         for i in range(self.max_num_players):
-            slot_active = self.GetStruct().AccountData[i].IsSlotActive    
-            last_updated = self.GetStruct().AccountData[i].LastUpdated
-            
-            base_timestamp = self.GetBaseTimestamp()
-            if ( not self.GetStruct().AccountData[i].IsSlotActive or 
-                (slot_active and (base_timestamp - last_updated) > SHMEM_SUBSCRIBE_TIMEOUT_MILLISECONDS)):
+            player = accounts[i]
+            if (not player.IsSlotActive or 
+                (base_timestamp - player.LastUpdated) > SHMEM_SUBSCRIBE_TIMEOUT_MILLISECONDS):
                 return i
         return -1
     
@@ -927,10 +1125,19 @@ class Py4GWSharedMemoryManager:
         index = self.FindAccount(account_email)
         if index == -1:
             index = self.FindEmptySlot()
+            if index == -1:
+                return -1
             player = self.GetStruct().AccountData[index]
+            previous_email = player.AccountEmail
             player.IsSlotActive = True
             player.AccountEmail = account_email
             player.LastUpdated = self.GetBaseTimestamp()
+            self._forget_account_slot(index)
+            self._account_slots[account_email] = index
+            if previous_email != account_email:
+                # An account re-registering into its own slot (e.g. after a LastUpdated timeout)
+                # keeps its inbox, only what was meant for a previous owner is dropped.
+                self._drop_foreign_messages(index, account_email)
         return index
     
     def GetHeroSlot(self, hero_data) -> int:
@@ -995,29 +1202,25 @@ class Py4GWSharedMemoryManager:
         if self.quest_instance is None and self.player_instance is not None:
             self.quest_instance = PyQuest.PyQuest()
             
-        if self.throttle_timer_150.IsExpired():   
-            self.throttle_timer_150.Reset()
-            self.party_instance.GetContext()
-            self.player_instance.GetContext()
-
-            
-            title_array = self.player_instance.GetTitleArray()
-            for title_id in title_array:
-                if title_id in self._title_instances:
-                    self._title_instances[title_id].GetContext()
-                    continue
-                title = PyPlayer.PyTitle(title_id)
-                if title:
-                    self._title_instances[title_id] = title
-                    
-                    
-        
-        if self.throttle_timer_63.IsExpired():
-            self.throttle_timer_63.Reset()
-            if self.agent_instance is not None:
-                self.agent_instance.GetContext()
+    # Context refreshes are run by GLOBAL_CACHE.Scheduler (150ms and 63ms, map loaded only)
+    def _refresh_party_and_player_context(self):
+        if self.party_instance is None or self.player_instance is None:
+            return
+        self.party_instance.GetContext()
+        self.player_instance.GetContext()
 
-            
+        title_array = self.player_instance.GetTitleArray()
+        for title_id in title_array:
+            if title_id in self._title_instances:
+                self._title_instances[title_id].GetContext()
+                continue
+            title = PyPlayer.PyTitle(title_id)
+            if title:
+                self._title_instances[title_id] = title
+                
+    def _refresh_agent_context(self):
+        if self.agent_instance is not None:
+            self.agent_instance.GetContext()
         
      
     def GetLoginNumber(self):
@@ -1044,59 +1247,29 @@ class Py4GWSharedMemoryManager:
     def SetPlayerData(self, account_email: str):
         """Set player data for the account with the given email."""  
         def _set_buff_data(index):
-            player : AccountData = self.GetStruct().AccountData[index]
             if self.effects_instance is None:
                 return
-            buffs = self.effects_instance.GetEffects() + self.effects_instance.GetBuffs()
-            for j in range(SHMEM_MAX_NUMBER_OF_BUFFS):
-                buff = buffs[j] if j < len(buffs) else None
-                effect = buff if isinstance(buff, EffectType) else None
-                upkeep = buff if isinstance(buff, BuffType) else None
-                
-                player.PlayerData.BuffData[j].SkillId = buff.skill_id if buff else 0
-                player.PlayerData.BuffData[j].Type = 2 if effect else (1 if upkeep else 0)
-                player.PlayerData.BuffData[j].Duration = effect.duration if effect else 0.0
-                player.PlayerData.BuffData[j].TargetAgentID = upkeep.target_agent_id if upkeep else 0
-                player.PlayerData.BuffData[j].Remaining = effect.time_remaining if effect else 0.0
-                
-                player.PlayerBuffs[j].SkillId = buff.skill_id if buff else 0
-                player.PlayerBuffs[j].Type = 2 if effect else (1 if upkeep else 0)
-                player.PlayerBuffs[j].Duration = effect.duration if effect else 0.0
-                player.PlayerBuffs[j].TargetAgentID = upkeep.target_agent_id if upkeep else 0
-                player.PlayerBuffs[j].Remaining = effect.time_remaining if effect else 0.0
-                
-                
+            self._write_buff_data(index, self.effects_instance.GetEffects() + self.effects_instance.GetBuffs())
         
         def _set_attribute_data(index):
-            player : AccountData = self.GetStruct().AccountData[index]
             if self.agent_instance is None:
                 return
             #attributes = Agent.GetAttributes(self.agent_instance.id)
-            attributes = self.agent_instance.attributes
-            for attribute_id in range(SHMEM_NUMBER_OF_ATTRIBUTES):
-                attribute = next((attr for attr in attributes if int(attr.attribute_id) == attribute_id), None)
-                player.PlayerData.AttributesData[attribute_id].Id = attribute_id if attribute else 0
-                player.PlayerData.AttributesData[attribute_id].Value = attribute.level if attribute else 0
-                player.PlayerData.AttributesData[attribute_id].BaseValue = attribute.level_base if attribute else 0
+            self._write_attribute_data(index, self.agent_instance.attributes)
                 
         def _set_skill_data(index):
             # Skills            
+            skills = []
             for slot in range(SHMEM_NUMBER_OF_SKILLS):        
                 skill = SkillBar.GetSkillData(slot + 1)
-                
-                if skill is None:
-                    player.PlayerData.SkillbarData.Skills[slot].Id = 0
-                    player.PlayerData.SkillbarData.Skills[slot].Recharge = 0.0
-                    player.PlayerData.SkillbarData.Skills[slot].Adrenaline = 0.0
+                if skill is None or skill.id.id == 0:
+                    skills.append((0, 0.0, 0.0))
                     continue
-                            
-                player.PlayerData.SkillbarData.Skills[slot].Id = skill.id.id
-                player.PlayerData.SkillbarData.Skills[slot].Recharge = skill.get_recharge if skill.id.id != 0 else 0.0
-                player.PlayerData.SkillbarData.Skills[slot].Adrenaline = skill.adrenaline_a if skill.id.id != 0 else 0.0  
+                skills.append((skill.id.id, skill.get_recharge, skill.adrenaline_a))
                         
             #casting_skill = Agent.GetCastingSkill(agent_id)
             casting_skill = self.agent_instance.living_agent.casting_skill_id if self.agent_instance and self.agent_instance.living_agent.is_casting else 0
-            player.PlayerData.SkillbarData.CastingSkillID = casting_skill if casting_skill in [skill.Id for skill in player.PlayerData.SkillbarData.Skills] else 0
+            self._write_skillbar_data(index, skills, casting_skill)
         
         def _set_rank_data(index):
             rank_data: RankStruct = self.GetStruct().AccountData[index].PlayerData.RankData
@@ -1104,12 +1277,13 @@ class Py4GWSharedMemoryManager:
                 return
             if self.player_instance is None:
                 return
-            rank_data.Rank = self.player_instance.rank
-            rank_data.Rating = self.player_instance.rating
-            rank_data.QualifierPoints = self.player_instance.qualifier_points
-            rank_data.Wins = self.player_instance.wins
-            rank_data.Losses = self.player_instance.losses
-            rank_data.TournamentRewardPoints = self.player_instance.tournament_reward_points
+            signature = (self.player_instance.rank, self.player_instance.rating, self.player_instance.qualifier_points,
+                         self.player_instance.wins, self.player_instance.losses, self.player_instance.tournament_reward_points)
+            if not self._section_changed(index, SHMEM_SECTION_RANK, signature):
+                return
+            (rank_data.Rank, rank_data.Rating, rank_data.QualifierPoints,
+             rank_data.Wins, rank_data.Losses, rank_data.TournamentRewardPoints) = signature
+            self._section_written(index, SHMEM_SECTION_RANK, signature)
             
         def _set_factions_data(index):
             factions_data: FactionsStruct = self.GetStruct().AccountData[index].PlayerData.FactionsData
@@ -1118,25 +1292,21 @@ class Py4GWSharedMemoryManager:
             if self.player_instance is None:
                 return
             
-            factions_data.Factions[FactionType.Kurzick.value].FactionType = FactionType.Kurzick.value
-            factions_data.Factions[FactionType.Kurzick.value].Current = self.player_instance.current_kurzick
-            factions_data.Factions[FactionType.Kurzick.value].TotalEarned = self.player_instance.total_earned_kurzick
-            factions_data.Factions[FactionType.Kurzick.value].Max = self.player_instance.max_kurzick
-            
-            factions_data.Factions[FactionType.Luxon.value].FactionType = FactionType.Luxon.value
-            factions_data.Factions[FactionType.Luxon.value].Current = self.player_instance.current_luxon
-            factions_data.Factions[FactionType.Luxon.value].TotalEarned = self.player_instance.total_earned_luxon
-            factions_data.Factions[FactionType.Luxon.value].Max = self.player_instance.max_luxon
-            
-            factions_data.Factions[FactionType.Imperial.value].FactionType = FactionType.Imperial.value
-            factions_data.Factions[FactionType.Imperial.value].Current = self.player_instance.current_imperial
-            factions_data.Factions[FactionType.Imperial.value].TotalEarned = self.player_instance.total_earned_imperial
-            factions_data.Factions[FactionType.Imperial.value].Max = self.player_instance.max_imperial
-            
-            factions_data.Factions[FactionType.Balthazar.value].FactionType = FactionType.Balthazar.value
-            factions_data.Factions[FactionType.Balthazar.value].Current = self.player_instance.current_balth
-            factions_data.Factions[FactionType.Balthazar.value].TotalEarned = self.player_instance.total_earned_balth
-            factions_data.Factions[FactionType.Balthazar.value].Max = self.player_instance.max_balth
+            signature = (
+                (FactionType.Kurzick.value, self.player_instance.current_kurzick, self.player_instance.total_earned_kurzick, self.player_instance.max_kurzick),
+                (FactionType.Luxon.value, self.player_instance.current_luxon, self.player_instance.total_earned_luxon, self.player_instance.max_luxon),
+                (FactionType.Imperial.value, self.player_instance.current_imperial, self.player_instance.total_earned_imperial, self.player_instance.max_imperial),
+                (FactionType.Balthazar.value, self.player_instance.current_balth, self.player_instance.total_earned_balth, self.player_instance.max_balth),
+            )
+            if not self._section_changed(index, SHMEM_SECTION_FACTIONS, signature):
+                return
+            for faction_type, current, total_earned, max_points in signature:
+                faction = factions_data.Factions[faction_type]
+                faction.FactionType = faction_type
+                faction.Current = current
+                faction.TotalEarned = total_earned
+                faction.Max = max_points
+            self._section_written(index, SHMEM_SECTION_FACTIONS, signature)
             
         def _set_titles_data(index):
             titles_data: TitlesStruct = self.GetStruct().AccountData[index].PlayerData.TitlesData
@@ -1145,11 +1315,15 @@ class Py4GWSharedMemoryManager:
             if self.player_instance is None:
                 return
             
-            for title_id, title_instance in self._title_instances.items():
-                if title_id < 0 or title_id >= 48:
-                    continue
+            signature = tuple((title_id, title_instance.current_points)
+                              for title_id, title_instance in self._title_instances.items()
+                              if 0 <= title_id < 48)
+            if not self._section_changed(index, SHMEM_SECTION_TITLES, signature):
+                return
+            for title_id, current_points in signature:
                 titles_data.Titles[title_id].TitleID = title_id
-                titles_data.Titles[title_id].CurrentPoints = title_instance.current_points
+                titles_data.Titles[title_id].CurrentPoints = current_points
+            self._section_written(index, SHMEM_SECTION_TITLES, signature)
 
         def _set_quests_data(index):
             quests_data: QuestsStruct = self.GetStruct().AccountData[index].PlayerData.QuestsData
@@ -1159,12 +1333,18 @@ class Py4GWSharedMemoryManager:
                 return
             
             active_quest = self.quest_instance.get_active_quest_id() if self.quest_instance else 0
-            quests_data.ActiveQuestID = active_quest
-            
             quest_log = self.quest_instance.get_quest_log_ids() if self.quest_instance else []
-            for i, quest_id in enumerate(quest_log):
+            quests = tuple((quest_id, self.quest_instance.is_quest_completed(quest_id) if self.quest_instance else False)
+                           for quest_id in quest_log)
+            signature = (active_quest, quests)
+            if not self._section_changed(index, SHMEM_SECTION_QUESTS, signature):
+                return
+            
+            quests_data.ActiveQuestID = active_quest
+            for i, (quest_id, is_completed) in enumerate(quests):
                 quests_data.Quests[i].QuestID = quest_id
-                quests_data.Quests[i].IsCompleted = self.quest_instance.is_quest_completed(quest_id) if self.quest_instance else False
+                quests_data.Quests[i].IsCompleted = is_completed
+            self._section_written(index, SHMEM_SECTION_QUESTS, signature)
 
         def _set_experience_data(index):
             experience_data: ExperienceStruct = self.GetStruct().AccountData[index].PlayerData.ExperienceData
@@ -1173,11 +1353,16 @@ class Py4GWSharedMemoryManager:
             if self.player_instance is None:
                 return
             
+            signature = (self.player_instance.level, self.player_instance.experience,
+                         self.player_instance.current_skill_points, self.player_instance.total_earned_skill_points)
+            if not self._section_changed(index, SHMEM_SECTION_EXPERIENCE, signature):
+                return
             experience_data.Level = self.player_instance.level
             experience_data.Experience = self.player_instance.experience
             experience_data.ProgressPct = Utils.GetExperienceProgression(self.player_instance.experience)
             experience_data.CurrentSkillPoints = self.player_instance.current_skill_points
             experience_data.TotalEarnedSkillPoints = self.player_instance.total_earned_skill_points
+            self._section_written(index, SHMEM_SECTION_EXPERIENCE, signature)
             
         def _set_agent_data(index):
             agent_data : AgentDataStruct = self.GetStruct().AccountData[index].PlayerData.AgentData
@@ -1248,22 +1433,15 @@ class Py4GWSharedMemoryManager:
             if self.player_instance is None:
                 return
             available_characters: list [LoginCharacterInfo]= self.player_instance.GetAvailableCharacters()
+            signature = tuple((char.player_name, char.level, char.is_pvp, char.map_id, (char.primary, char.secondary), char.campaign)
+                              for char in available_characters[:SHMEM_MAX_AVAILABLE_CHARS])
+            if not self._section_changed(index, SHMEM_SECTION_AVAILABLE_CHARACTERS, signature):
+                return
             for j in range(SHMEM_MAX_AVAILABLE_CHARS):
-                char = available_characters[j] if j < len(available_characters) else None
-                if char:
-                    player.PlayerData.AvailableCharacters[j].Name = char.player_name
-                    player.PlayerData.AvailableCharacters[j].Level = char.level
-                    player.PlayerData.AvailableCharacters[j].IsPvP = char.is_pvp
-                    player.PlayerData.AvailableCharacters[j].MapID = char.map_id
-                    player.PlayerData.AvailableCharacters[j].Professions = (char.primary, char.secondary)
-                    player.PlayerData.AvailableCharacters[j].CampaignID = char.campaign
-                else:
-                    player.PlayerData.AvailableCharacters[j].Name = ""
-                    player.PlayerData.AvailableCharacters[j].Level = 0
-                    player.PlayerData.AvailableCharacters[j].IsPvP = False
-                    player.PlayerData.AvailableCharacters[j].MapID = 0 
-                    player.PlayerData.AvailableCharacters[j].Professions = (0, 0)
-                    player.PlayerData.AvailableCharacters[j].CampaignID = 0
+                character = player.PlayerData.AvailableCharacters[j]
+                (character.Name, character.Level, character.IsPvP, character.MapID,
+                 character.Professions, character.CampaignID) = signature[j] if j < len(signature) else ("", 0, False, 0, (0, 0), 0)
+            self._section_written(index, SHMEM_SECTION_AVAILABLE_CHARACTERS, signature)
             
         def _set_account_data(index):
             player : AccountData = self.GetStruct().AccountData[index]
@@ -1316,20 +1494,26 @@ class Py4GWSharedMemoryManager:
             player.PartyPosition = party_number
             player.PlayerIsPartyLeader = self.party_instance.is_party_leader
             
-            for j in range(SKILL_FLAG_ENTRIES):
-                unlocked_character_skills = self.player_instance.unlocked_character_skills
-                player.PlayerData.UnlockedSkills[j] = unlocked_character_skills[j] if j < len(unlocked_character_skills) else 0
-                
+            unlocked_character_skills = self.player_instance.unlocked_character_skills
             missions_completed = self.player_instance.missions_completed
             missions_bonus = self.player_instance.missions_bonus
             missions_completed_hm = self.player_instance.missions_completed_hm
             missions_bonus_hm = self.player_instance.missions_bonus_hm
             
+            signature = (tuple(unlocked_character_skills), tuple(missions_completed), tuple(missions_bonus),
+                         tuple(missions_completed_hm), tuple(missions_bonus_hm))
+            if not self._section_changed(index, SHMEM_SECTION_UNLOCKS, signature):
+                return
+            
+            for j in range(SKILL_FLAG_ENTRIES):
+                player.PlayerData.UnlockedSkills[j] = unlocked_character_skills[j] if j < len(unlocked_character_skills) else 0
+            
             for entry in range(MISSION_FLAG_ENTRIES):
                 player.PlayerData.MissionData.NormalModeCompleted[entry] = missions_completed[entry] if entry < len(missions_completed) else 0
                 player.PlayerData.MissionData.NormalModeBonus[entry] = missions_bonus[entry] if entry < len(missions_bonus) else 0
                 player.PlayerData.MissionData.HardModeCompleted[entry] = missions_completed_hm[entry] if entry < len(missions_completed_hm) else 0
                 player.PlayerData.MissionData.HardModeBonus[entry] = missions_bonus_hm[entry] if entry < len(missions_bonus_hm) else 0
+            self._section_written(index, SHMEM_SECTION_UNLOCKS, signature)
 
         if not account_email:
             return    
@@ -1508,49 +1692,22 @@ class Py4GWSharedMemoryManager:
             hero.PlayerIsPartyLeader = False
             effects_instance = Effects.get_instance(agent_id)
             
-            buffs = effects_instance.GetEffects() + effects_instance.GetBuffs()
-            for j in range(SHMEM_MAX_NUMBER_OF_BUFFS):
-                buff = buffs[j] if j < len(buffs) else None
-                effect = buff if isinstance(buff, EffectType) else None
-                upkeep = buff if isinstance(buff, BuffType) else None
-                
-                hero.PlayerData.BuffData[j].SkillId = buff.skill_id if buff else 0
-                hero.PlayerData.BuffData[j].Type = 2 if effect else (1 if upkeep else 0)
-                hero.PlayerData.BuffData[j].Duration = effect.duration if effect else 0.0
-                hero.PlayerData.BuffData[j].TargetAgentID = upkeep.target_agent_id if upkeep else 0
-                hero.PlayerData.BuffData[j].Remaining = effect.time_remaining if effect else 0.0
-                
-                hero.PlayerBuffs[j].SkillId = buff.skill_id if buff else 0
-                hero.PlayerBuffs[j].Type = 2 if effect else (1 if upkeep else 0)
-                hero.PlayerBuffs[j].Duration = effect.duration if effect else 0.0
-                hero.PlayerBuffs[j].TargetAgentID = upkeep.target_agent_id if upkeep else 0
-                hero.PlayerBuffs[j].Remaining = effect.time_remaining if effect else 0.0
+            self._write_buff_data(index, effects_instance.GetEffects() + effects_instance.GetBuffs())
                 
             # Attributes
-            attributes = Agent.GetAttributes(agent_id)
-            for attribute_id in range(SHMEM_NUMBER_OF_ATTRIBUTES):
-                attribute = next((attr for attr in attributes if int(attr.attribute_id) == attribute_id), None)
-                hero.PlayerData.AttributesData[attribute_id].Id = attribute_id if attribute else 0
-                hero.PlayerData.AttributesData[attribute_id].Value = attribute.level if attribute else 0
-                hero.PlayerData.AttributesData[attribute_id].BaseValue = attribute.level_base if attribute else 0
+            self._write_attribute_data(index, Agent.GetAttributes(agent_id))
                 
             # Skills                   
-            skills = SkillBar.GetHeroSkillbar(hero.SlotNumber)       
+            hero_skills = SkillBar.GetHeroSkillbar(hero.SlotNumber)       
+            skills = []
             for slot in range(SHMEM_NUMBER_OF_SKILLS):        
-                skill = skills[slot] if len(skills) > slot else None
-                
-                if skill is None:
-                    hero.PlayerData.SkillbarData.Skills[slot].Id = 0
-                    hero.PlayerData.SkillbarData.Skills[slot].Recharge = 0.0
-                    hero.PlayerData.SkillbarData.Skills[slot].Adrenaline = 0.0
+                skill = hero_skills[slot] if len(hero_skills) > slot else None
+                if skill is None or skill.id.id == 0:
+                    skills.append((0, 0.0, 0.0))
                     continue
-                            
-                hero.PlayerData.SkillbarData.Skills[slot].Id = skill.id.id
-                hero.PlayerData.SkillbarData.Skills[slot].Recharge = skill.get_recharge if skill.id.id != 0 else 0.0
-                hero.PlayerData.SkillbarData.Skills[slot].Adrenaline = skill.adrenaline_a if skill.id.id != 0 else 0.0  
+                skills.append((skill.id.id, skill.get_recharge, skill.adrenaline_a))
                         
-            casting_skill = Agent.GetCastingSkill(agent_id)
-            hero.PlayerData.SkillbarData.CastingSkillID = casting_skill if casting_skill in [skill.Id for skill in hero.PlayerData.SkillbarData.Skills] else 0
+            self._write_skillbar_data(index, skills, Agent.GetCastingSkill(agent_id))
             
             _set_agent_data(index)
             
@@ -1693,39 +1850,13 @@ class Py4GWSharedMemoryManager:
             pet.PlayerTargetID = pet_info.locked_target_id
             
             effects_instance = Effects.get_instance(self.player_instance.id)
-            buffs = effects_instance.GetEffects() + effects_instance.GetBuffs()
-            for j in range(SHMEM_MAX_NUMBER_OF_BUFFS):
-                buff = buffs[j] if j < len(buffs) else None
-                effect = buff if isinstance(buff, EffectType) else None
-                upkeep = buff if isinstance(buff, BuffType) else None
-                
-                pet.PlayerData.BuffData[j].SkillId = buff.skill_id if buff else 0
-                pet.PlayerData.BuffData[j].Type = 2 if effect else (1 if upkeep else 0)
-                pet.PlayerData.BuffData[j].Duration = effect.duration if effect else 0.0
-                pet.PlayerData.BuffData[j].TargetAgentID = upkeep.target_agent_id if upkeep else 0
-                pet.PlayerData.BuffData[j].Remaining = effect.time_remaining if effect else 0.0
-                
-                pet.PlayerBuffs[j].SkillId = buff.skill_id if buff else 0
-                pet.PlayerBuffs[j].Type = 2 if effect else (1 if upkeep else 0)
-                pet.PlayerBuffs[j].Duration = effect.duration if effect else 0.0
-                pet.PlayerBuffs[j].TargetAgentID = upkeep.target_agent_id if upkeep else 0
-                pet.PlayerBuffs[j].Remaining = effect.time_remaining if effect else 0.0
+            self._write_buff_data(index, effects_instance.GetEffects() + effects_instance.GetBuffs())
                 
             # Attributes
-            attributes = Agent.GetAttributes(agent_id)
-            for attribute_id in range(SHMEM_NUMBER_OF_ATTRIBUTES):
-                attribute = next((attr for attr in attributes if int(attr.attribute_id) == attribute_id), None)
-                pet.PlayerData.AttributesData[attribute_id].Id = attribute_id if attribute else 0
-                pet.PlayerData.AttributesData[attribute_id].Value = attribute.level if attribute else 0
-                pet.PlayerData.AttributesData[attribute_id].BaseValue = attribute.level_base if attribute else 0
+            self._write_attribute_data(index, Agent.GetAttributes(agent_id))
                 
             # Skills   
-            pet.PlayerData.SkillbarData.CastingSkillID = 0             
-            
-            for slot in range(SHMEM_NUMBER_OF_SKILLS):
-                pet.PlayerData.SkillbarData.Skills[slot].Id = 0
-                pet.PlayerData.SkillbarData.Skills[slot].Recharge = 0.0
-                pet.PlayerData.SkillbarData.Skills[slot].Adrenaline = 0.0   
+            self._write_skillbar_data(index, [(0, 0.0, 0.0)] * SHMEM_NUMBER_OF_SKILLS, 0)
                 
             _set_agent_data(index)
                 
@@ -1746,8 +1877,9 @@ class Py4GWSharedMemoryManager:
     def GetAllActivePlayers(self) -> list[AccountData]:
         """Get all active players in shared memory."""
         players = []
+        accounts = self._struct.AccountData
         for i in range(self.max_num_players):
-            player = self.GetStruct().AccountData[i]
+            player = accounts[i]
             if self._is_slot_active(i) and player.IsAccount:
                 players.append(player)
         return players
@@ -1755,8 +1887,9 @@ class Py4GWSharedMemoryManager:
     def GetNumActivePlayers(self) -> int:
         """Get the number of active players in shared memory."""
         count = 0
+        accounts = self._struct.AccountData
         for i in range(self.max_num_players):
-            player = self.GetStruct().AccountData[i]
+            player = accounts[i]
             if self._is_slot_active(i) and player.IsAccount:
                 count += 1
         return count
@@ -1772,8 +1905,9 @@ class Py4GWSharedMemoryManager:
     def GetAllAccountData(self) -> list[AccountData]:
         """Get all player data, ordered by PartyID, PartyPosition, PlayerLoginNumber, CharacterName."""
         players = []
+        accounts = self._struct.AccountData
         for i in range(self.max_num_players):
-            player = self.GetStruct().AccountData[i]
+            player = accounts[i]
             if self._is_slot_active(i) and player.IsAccount:
                 players.append(player)
 
@@ -1804,8 +1938,9 @@ class Py4GWSharedMemoryManager:
      
     def GetAccountDataFromPartyNumber(self, party_number: int) -> AccountData | None:
         """Get player data for the account with the given party number."""
+        accounts = self._struct.AccountData
         for i in range(self.max_num_players):
-            player = self.GetStruct().AccountData[i]
+            player = accounts[i]
             if self._is_slot_active(i) and player.PartyPosition == party_number:
                 return player
         ConsoleLog(SMM_MODULE_NAME, f"Party number {party_number} not found.", Py4GW.Console.MessageType.Error)
@@ -1818,7 +1953,7 @@ class Py4GWSharedMemoryManager:
         
         player = self.GetAccountDataFromEmail(account_email)
         if player:
-            for buff in player.PlayerData.BuffData:
+            for buff in player.PlayerData.BuffData[:player.BuffCount]:
                 if buff.SkillId == effect_id:
                     return True
         return False
@@ -1826,10 +1961,11 @@ class Py4GWSharedMemoryManager:
     def GetAllAccountHeroAIOptions(self) -> list[HeroAIOptionStruct]:
         """Get HeroAI options for all accounts."""
         options = []
+        accounts = self._struct.AccountData
         for i in range(self.max_num_players):
-            player = self.GetStruct().AccountData[i]
+            player = accounts[i]
             if self._is_slot_active(i) and player.IsAccount:
-                options.append(self.GetStruct().HeroAIOptions[i])
+                options.append(self._struct.HeroAIOptions[i])
         return options
         
     def GetHeroAIOptions(self, account_email: str) -> HeroAIOptionStruct | None:
@@ -1845,10 +1981,11 @@ class Py4GWSharedMemoryManager:
         
     def GetGerHeroAIOptionsByPartyNumber(self, party_number: int) -> HeroAIOptionStruct | None:
         """Get HeroAI options for the account with the given party number."""
+        accounts = self._struct.AccountData
         for i in range(self.max_num_players):
-            player = self.GetStruct().AccountData[i]
+            player = accounts[i]
             if self._is_slot_active(i) and player.PartyPosition == party_number:
-                return self.GetStruct().HeroAIOptions[i]
+                return self._struct.HeroAIOptions[i]
         return None    
         
         
@@ -1888,8 +2025,9 @@ class Py4GWSharedMemoryManager:
     def GetMapsFromPlayers(self):
         """Get a list of unique maps from all active players."""
         maps = set()
+        accounts = self._struct.AccountData
         for i in range(self.max_num_players):
-            player = self.GetStruct().AccountData[i]
+            player = accounts[i]
             if self._is_slot_active(i) and player.IsAccount:
                 maps.add((player.MapID, player.MapRegion, player.MapDistrict, player.MapLanguage))
         return list(maps)
@@ -1899,8 +2037,9 @@ class Py4GWSharedMemoryManager:
         Get a list of unique PartyIDs for players in the specified map/region/district.
         """
         parties = set()
+        accounts = self._struct.AccountData
         for i in range(self.max_num_players):
-            player = self.GetStruct().AccountData[i]
+            player = accounts[i]
             if (self._is_slot_active(i) and player.IsAccount and
                 player.MapID == map_id and
                 player.MapRegion == map_region and
@@ -1913,8 +2052,9 @@ class Py4GWSharedMemoryManager:
     def GetPlayersFromParty(self, party_id: int, map_id: int, map_region: int, map_district: int, map_language: int):
         """Get a list of players in a specific party on a specific map."""
         players = []
+        accounts = self._struct.AccountData
         for i in range(self.max_num_players):
-            player = self.GetStruct().AccountData[i]
+            player = accounts[i]
             if (self._is_slot_active(i) and player.IsAccount and
                 player.MapID == map_id and
                 player.MapRegion == map_region and
@@ -1927,8 +2067,9 @@ class Py4GWSharedMemoryManager:
     def GetHeroesFromPlayers(self, owner_player_id: int):
         """Get a list of heroes owned by the specified player."""
         heroes = []
+        accounts = self._struct.AccountData
         for i in range(self.max_num_players):
-            player = self.GetStruct().AccountData[i]
+            player = accounts[i]
             if (self._is_slot_active(i) and player.IsHero and
                 player.OwnerPlayerID == owner_player_id):
                 heroes.append(player)
@@ -1941,8 +2082,9 @@ class Py4GWSharedMemoryManager:
     def GetPetsFromPlayers(self, owner_agent_id: int):
         """Get a list of pets owned by the specified player."""
         pets = []
+        accounts = self._struct.AccountData
         for i in range(self.max_num_players):
-            player = self.GetStruct().AccountData[i]
+            player = accounts[i]
             if (self._is_slot_active(i) and player.IsPet and
                 player.OwnerPlayerID == owner_agent_id):
                 pets.append(player)
@@ -1965,31 +2107,110 @@ class Py4GWSharedMemoryManager:
                     #ConsoleLog(SMM_MODULE_NAME, f"Player {player.AccountEmail} has timed out after {delta} ms.", Py4GW.Console.MessageType.Warning)
                     self.ResetPlayerData(index)
 
-    #("ExtraData", c_wchar * 4 * SHMEM_MAX_CHAR_LEN),
-    
+    #region Messaging
+    # Every slot owns an inbox in MessageQueues. Message indices handed out by
+    # SendMessage/GetNextMessage are slot * SHMEM_MESSAGE_QUEUE_CAPACITY + entry, so
+    # they stay unique across inboxes and can be passed back to MarkMessageAs*.
+
+    def ResetMessageQueue(self, index: int):
+        """Drop every message waiting in the inbox of the given slot."""
+        queue = self._struct.MessageQueues[index]
+        queue.LastTicket = 0
+        for i in range(SHMEM_MESSAGE_QUEUE_CAPACITY):
+            queue.Tickets[i] = 0
+            queue.ClaimTokens[i] = 0
+            queue.Messages[i].Active = False
+            queue.Messages[i].Running = False
+        queue.Sent = 0
+        queue.Delivered = 0
+        queue.Dropped = 0
+        queue.LatencyTotal = 0
+        queue.LatencyMax = 0
+        queue.Initialized = True
+
+    def _drop_foreign_messages(self, index: int, account_email: str):
+        """Free every entry in the inbox of the given slot that is not addressed to account_email."""
+        queue = self._struct.MessageQueues[index]
+        if not queue.Initialized:
+            self.ResetMessageQueue(index)
+            return
+        for entry in self._published_entries(queue):
+            message = queue.Messages[entry]
+            if message.ReceiverEmail != account_email:
+                message.Active = False
+                message.Running = False
+                queue.Tickets[entry] = 0
+                queue.ClaimTokens[entry] = 0
+
+    def _next_claim_token(self) -> int:
+        self._claim_counter = (self._claim_counter + 1) & 0xFFFF
+        return self._claim_base | self._claim_counter | 1
+
+    def _published_entries(self, queue: MessageQueueStruct) -> list[int]:
+        """Every published entry, oldest send first."""
+        tickets = queue.Tickets
+        published = [(tickets[entry], entry) for entry in range(SHMEM_MESSAGE_QUEUE_CAPACITY) if tickets[entry]]
+        if len(published) > 1:
+            # Tickets wrap around, so order them by distance back from the newest one
+            last = queue.LastTicket
+            published.sort(key=lambda item: (item[0] - last - 1) & UINT32_MAX)
+        return [entry for _, entry in published]
+
+    def _find_free_entry(self, queue: MessageQueueStruct) -> int:
+        tickets = queue.Tickets
+        claims = queue.ClaimTokens
+        for entry in range(SHMEM_MESSAGE_QUEUE_CAPACITY):
+            if not tickets[entry] and not claims[entry]:
+                return entry
+        return -1
+
+    def _next_ticket(self, queue: MessageQueueStruct) -> int:
+        ticket = (queue.LastTicket + 1) & UINT32_MAX or 1  # 0 marks a free entry
+        queue.LastTicket = ticket
+        return ticket
+
+    def _record_pickup(self, queue: MessageQueueStruct, message: SharedMessage):
+        latency = max(0, self.GetBaseTimestamp() - message.Timestamp)
+        queue.Delivered += 1
+        queue.LatencyTotal += latency
+        if latency > queue.LatencyMax:
+            queue.LatencyMax = latency
+
+    def _split_message_index(self, message_index: int) -> tuple[int, int]:
+        return divmod(message_index, SHMEM_MESSAGE_QUEUE_CAPACITY)
+
     def SendMessage(self, sender_email: str, receiver_email: str, command: SharedCommandType, params: tuple = (0.0, 0.0, 0.0, 0.0), ExtraData: tuple = ()) -> int:
         """Send a message to another player. Returns the message index or -1 on failure."""
-        
+
         import ctypes as ct
         index = self.FindAccount(receiver_email)
-        
+
         if index == -1:
             ConsoleLog(SMM_MODULE_NAME, f"Receiver account {receiver_email} not found.", Py4GW.Console.MessageType.Error)
             return -1
-        
+
         if not receiver_email:
             ConsoleLog(SMM_MODULE_NAME, "Receiver email is empty.", Py4GW.Console.MessageType.Error)
             return -1
-        
+
         if not sender_email:
             ConsoleLog(SMM_MODULE_NAME, "Sender email is empty.", Py4GW.Console.MessageType.Error)
             return -1
-        
-        for i in range(self.max_num_players):
-            message = self.GetStruct().SharedMessage[i]
-            if message.Active:
-                continue  # Find the first unfinished message slot
-            
+
+        queue = self._struct.MessageQueues[index]
+        # Python has no compare-and-swap over shared memory, so several clients writing the
+        # same inbox claim a free entry by stamping a token, and check the token is still
+        # theirs before publishing. A claim lost to another client is retried on another entry.
+        for _ in range(SHMEM_MESSAGE_QUEUE_CAPACITY):
+            entry = self._find_free_entry(queue)
+            if entry == -1:
+                queue.Dropped += 1
+                ConsoleLog(SMM_MODULE_NAME, f"Message queue of {receiver_email} is full.", Py4GW.Console.MessageType.Warning)
+                return -1
+            token = self._next_claim_token()
+            queue.ClaimTokens[entry] = token
+
+            message = queue.Messages[entry]
             message.SenderEmail = sender_email
             message.ReceiverEmail = receiver_email
             message.Command = command.value
@@ -2004,42 +2225,80 @@ class Py4GWSharedMemoryManager:
             message.Active = True
             message.Running = False
             message.Timestamp = self.GetBaseTimestamp()
-            return i
 
+            if queue.ClaimTokens[entry] != token:
+                continue
+            queue.Tickets[entry] = self._next_ticket(queue)
+            queue.ClaimTokens[entry] = 0
+            queue.Sent += 1
+            return index * SHMEM_MESSAGE_QUEUE_CAPACITY + entry
+
+        queue.Dropped += 1
         return -1
 
     def GetNextMessage(self, account_email: str) -> tuple[int, SharedMessage | None]:
         """Read the next message for the given account.
         Returns the raw SharedMessage. Use self._c_wchar_array_to_str() to read ExtraData safely.
         """
-        for index in range(self.max_num_players):
-            message = self.GetStruct().SharedMessage[index]
-            if message.ReceiverEmail == account_email and message.Active and not message.Running:
-                return index, message
+        index = self.FindAccount(account_email)
+        if index == -1:
+            return -1, None
+        queue = self._struct.MessageQueues[index]
+        for entry in self._published_entries(queue):
+            message = queue.Messages[entry]
+            if message.Active and not message.Running and message.ReceiverEmail == account_email:
+                return index * SHMEM_MESSAGE_QUEUE_CAPACITY + entry, message
         return -1, None
 
+    def DrainMessages(self, account_email: str) -> list[tuple[int, SharedMessage]]:
+        """Take every pending message for the given account in one pass, in send order.
+        The messages are marked as running; finish each one with MarkMessageAsFinished.
+        """
+        index = self.FindAccount(account_email)
+        if index == -1:
+            return []
+        queue = self._struct.MessageQueues[index]
+        messages = []
+        timestamp = self.GetBaseTimestamp()
+        for entry in self._published_entries(queue):
+            message = queue.Messages[entry]
+            if not message.Active or message.Running or message.ReceiverEmail != account_email:
+                continue
+            self._record_pickup(queue, message)
+            message.Running = True
+            message.Timestamp = timestamp
+            messages.append((index * SHMEM_MESSAGE_QUEUE_CAPACITY + entry, message))
+        return messages
+
 
-    
     def PreviewNextMessage(self, account_email: str, include_running: bool = True) -> tuple[int, SharedMessage | None]:
         """Preview the next message for the given account.
         If include_running is True, will also return a running message.
         Ensures ExtraData is returned as tuple[str] using existing helpers.
         """
-        for index in range(self.max_num_players):
-            message = self.GetStruct().SharedMessage[index]
+        index = self.FindAccount(account_email)
+        if index == -1:
+            return -1, None
+        queue = self._struct.MessageQueues[index]
+        for entry in self._published_entries(queue):
+            message = queue.Messages[entry]
             if message.ReceiverEmail != account_email or not message.Active:
                 continue
             if not message.Running or include_running:
-                return index, message
+                return index * SHMEM_MESSAGE_QUEUE_CAPACITY + entry, message
         return -1, None
 
 
-    
+
     def MarkMessageAsRunning(self, account_email: str, message_index: int):
         """Mark a specific message as running."""
-        if 0 <= message_index < self.max_num_players:
-            message = self.GetStruct().SharedMessage[message_index]
+        if 0 <= message_index < self.max_num_players * SHMEM_MESSAGE_QUEUE_CAPACITY:
+            index, entry = self._split_message_index(message_index)
+            queue = self._struct.MessageQueues[index]
+            message = queue.Messages[entry]
             if message.ReceiverEmail == account_email:
+                if not message.Running:
+                    self._record_pickup(queue, message)
                 message.Running = True
                 message.Active = True
                 message.Timestamp = self.GetBaseTimestamp()
@@ -2047,13 +2306,17 @@ class Py4GWSharedMemoryManager:
                 ConsoleLog(SMM_MODULE_NAME, f"Message at index {message_index} does not belong to {account_email}.", Py4GW.Console.MessageType.Error)
         else:
             ConsoleLog(SMM_MODULE_NAME, f"Invalid message index: {message_index}.", Py4GW.Console.MessageType.Error)
-            
+
     def MarkMessageAsFinished(self, account_email: str, message_index: int):
         """Mark a specific message as finished."""
         import ctypes as ct
-        if 0 <= message_index < self.max_num_players:
-            message = self.GetStruct().SharedMessage[message_index]
+        if 0 <= message_index < self.max_num_players * SHMEM_MESSAGE_QUEUE_CAPACITY:
+            index, entry = self._split_message_index(message_index)
+            queue = self._struct.MessageQueues[index]
+            message = queue.Messages[entry]
             if message.ReceiverEmail == account_email:
+                if message.Active and not message.Running:
+                    self._record_pickup(queue, message)
                 message.SenderEmail = ""
                 message.ReceiverEmail = ""
                 message.Command = SharedCommandType.NoCommand
@@ -2067,6 +2330,8 @@ class Py4GWSharedMemoryManager:
                 message.Timestamp = self.GetBaseTimestamp()
                 message.Running = False
                 message.Active = False
+                queue.Tickets[entry] = 0  # free for the next sender
+                queue.ClaimTokens[entry] = 0
             else:
                 ConsoleLog(
                     SMM_MODULE_NAME,
@@ -2080,12 +2345,34 @@ class Py4GWSharedMemoryManager:
                 Py4GW.Console.MessageType.Error
             )
 
-            
+
     def GetAllMessages(self) -> list[tuple[int, SharedMessage]]:
         """Get all messages in shared memory with their index."""
         messages = []
+        queues = self._struct.MessageQueues
+        accounts = self._struct.AccountData
         for index in range(self.max_num_players):
-            message = self.GetStruct().SharedMessage[index]
-            if message.Active:
-                messages.append((index, message))  # Add index and message
+            if not accounts[index].IsSlotActive:
+                continue  # messages can only be sent to active slots
+            queue = queues[index]
+            for entry in self._published_entries(queue):
+                message = queue.Messages[entry]
+                if message.Active:
+                    messages.append((index * SHMEM_MESSAGE_QUEUE_CAPACITY + entry, message))  # Add index and message
         return messages
+
+    def GetMessageStats(self, account_email: str) -> dict:
+        """Get delivery counters of the inbox of the given account."""
+        index = self.FindAccount(account_email)
+        if index == -1:
+            return {}
+        queue = self._struct.MessageQueues[index]
+        pending = len(self._published_entries(queue))
+        return {
+            "sent": queue.Sent,
+            "delivered": queue.Delivered,
+            "dropped": queue.Dropped,
+            "pending": pending,
+            "average_latency_ms": queue.LatencyTotal / queue.Delivered if queue.Delivered else 0.0,
+            "max_latency_ms": queue.LatencyMax,
+        }
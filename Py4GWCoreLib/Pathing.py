@@ -4,11 +4,15 @@ import PyOverlay
 import PyMap
 import math
 import heapq
-import pickle
+import os
+import mmap
+import struct
+import hashlib
+from array import array
 
 from .enums import name_to_map_id
 from typing import List, Tuple, Optional, Dict
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from Py4GWCoreLib import Utils
 
 PathingMap = PyPathing.PathingMap
@@ -40,7 +44,16 @@ class NavMesh:
         self.trap_id_to_layer: Dict[int, int] = {}         # trap id -> layer z
         self.layer_portals: Dict[int, List[PathingPortal]] = {}
         self.spatial_grid: Dict[Tuple[float, float], List[PathingTrapezoid]] = {}
+        self._graph: Optional["NavGraph"] = None
+        self._astar_engine: Optional["AStarEngine"] = None
+        self._hierarchy: Optional["NavHierarchy"] = None
+        self._load_layers(pathing_maps)
 
+        self.create_all_local_portals()
+        self.create_all_cross_layer_portals()
+        self._populate_spatial_grid()
+
+    def _load_layers(self, pathing_maps):
         # Index data — use index, not pmap.zplane
         for i, layer in enumerate(pathing_maps):
             plane_index = i  # actual plane ID
@@ -50,10 +63,6 @@ class NavMesh:
             self.trapezoids.update({t.id: t for t in traps})
             self.trap_id_to_layer.update({t.id: plane_index for t in traps})
 
-        self.create_all_local_portals()
-        self.create_all_cross_layer_portals()
-        self._populate_spatial_grid()
-
     
     def get_adjacent_side(self, a: PathingTrapezoid, b: PathingTrapezoid) -> Optional[str]:
         if abs(a.YB - b.YT) < 1.0: return 'bottom_top'
@@ -201,52 +210,91 @@ class NavMesh:
 
     def get_neighbors(self, t_id: int) -> List[int]:
         return self.portal_graph.get(t_id, [])
+
+    def get_graph(self) -> "NavGraph":
+        """Integer-indexed CSR form of portal_graph, built on first use."""
+        if self._graph is None:
+            self._graph = NavGraph(self)
+        return self._graph
+
+    def get_astar_engine(self) -> "AStarEngine":
+        """A* engine over get_graph(); its scratch buffers are reused by every query on this mesh."""
+        if self._astar_engine is None:
+            self._astar_engine = AStarEngine(self.get_graph())
+        return self._astar_engine
+
+    def get_hierarchy(self) -> "NavHierarchy":
+        """Cluster-level abstraction of get_graph(), built on first use."""
+        if self._hierarchy is None:
+            self._hierarchy = NavHierarchy(self.get_graph())
+        return self._hierarchy
     
-    def find_trapezoid_id_by_coord(self, point: Tuple[float, float], tol: float = 20.0) -> Optional[int]:
+    def find_trapezoid_id_by_coord(self, point: Tuple[float, float], tol: float = 20.0, exclude: Optional[int] = None) -> Optional[int]:
         """
         Returns the trapezoid ID containing (x, y), using a small tolerance to avoid
         floating-point misses when the point lies exactly on a border or corner.
+        Only the point grid cells overlapping the tolerance box are tested; when several
+        trapezoids match, the one the full map scan would have found first wins.
+        exclude skips one trapezoid ID (used to find the neighbour across a shared edge).
         """
         x, y = point
+        gs = self.GRID_SIZE
+        best_order = -1
+        best_id = None
+
+        for gx in range(int((x - tol) // gs), int((x + tol) // gs) + 1):
+            for gy in range(int((y - tol) // gs), int((y + tol) // gs) + 1):
+                for yb, yt, xbl, xtl, xbr, xtr, order, trap_id in self.point_grid.get((gx, gy), ()):
+                    if best_id is not None and order >= best_order:
+                        break  # cell lists are in map order, nothing better follows
+                    if trap_id == exclude:
+                        continue
+                    if yb - tol <= y <= yt + tol:
+                        ratio = (y - yb) / (yt - yb) if yt != yb else 0
+                        left_x = xbl + (xtl - xbl) * ratio
+                        right_x = xbr + (xtr - xbr) * ratio
+                        if left_x - tol <= x <= right_x + tol:
+                            best_order = order
+                            best_id = trap_id
+                            break
+
+        return best_id
+
+    def find_trapezoid_ids_by_coords(self, points: List[Tuple[float, float]], tol: float = 20.0) -> List[Optional[int]]:
+        """
+        Batched find_trapezoid_id_by_coord. Returns one trapezoid ID (or None) per point,
+        resolving repeated points only once.
+        """
+        resolved: Dict[Tuple[float, float], Optional[int]] = {}
+        result: List[Optional[int]] = []
+        for point in points:
+            key = (point[0], point[1])
+            if key not in resolved:
+                resolved[key] = self.find_trapezoid_id_by_coord(key, tol)
+            result.append(resolved[key])
+        return result
 
-        # 1. Normal trapezoids (floor & standard geometry)
-        for t in self.trapezoids.values():
-            if t.YB - tol <= y <= t.YT + tol:
-                ratio = (y - t.YB) / (t.YT - t.YB) if t.YT != t.YB else 0
-                left_x = t.XBL + (t.XTL - t.XBL) * ratio
-                right_x = t.XBR + (t.XTR - t.XBR) * ratio
-                if left_x - tol <= x <= right_x + tol:
-                    return t.id
-
-        # 2. Cross-layer portals (bridge, stairs, elevated geometry)
-        for portal in self.portals:
-            for trap in (portal.a.m_t, portal.b.m_t):
-                if trap.YB - tol <= y <= trap.YT + tol:
-                    ratio = (y - trap.YB) / (trap.YT - trap.YB) if trap.YT != trap.YB else 0
-                    left_x = trap.XBL + (trap.XTL - trap.XBL) * ratio
-                    right_x = trap.XBR + (trap.XTR - trap.XBR) * ratio
-                    if left_x - tol <= x <= right_x + tol:
-                        return trap.id
-
-        # 3. Nothing found
-        return None
-
-
-
-    
     def _populate_spatial_grid(self):
-        for trap in self.trapezoids.values():
+        # point_grid holds plain geometry tuples in map order so point location never
+        # touches the native trapezoid objects: (YB, YT, XBL, XTL, XBR, XTR, order, id)
+        self.point_grid: Dict[Tuple[int, int], List[Tuple[float, float, float, float, float, float, int, int]]] = {}
+        self.trap_geometry: Dict[int, Tuple[float, float, float, float, float, float, int, int]] = {}
+        for order, trap in enumerate(self.trapezoids.values()):
             min_x = int(min(trap.XBL, trap.XTL) // self.GRID_SIZE)
             max_x = int(max(trap.XBR, trap.XTR) // self.GRID_SIZE)
             min_y = int(trap.YB // self.GRID_SIZE)
             max_y = int(trap.YT // self.GRID_SIZE)
+            geometry = (trap.YB, trap.YT, trap.XBL, trap.XTL, trap.XBR, trap.XTR, order, trap.id)
+            self.trap_geometry[trap.id] = geometry
 
             for gx in range(min_x, max_x + 1):
                 for gy in range(min_y, max_y + 1):
                     key = (gx, gy)
                     if key not in self.spatial_grid:
                         self.spatial_grid[key] = []
+                        self.point_grid[key] = []
                     self.spatial_grid[key].append(trap)
+                    self.point_grid[key].append(geometry)
 
 
 
@@ -286,93 +334,656 @@ class NavMesh:
 
 
     
+    @staticmethod
+    def _segment_exit(geometry, x0: float, y0: float, dx: float, dy: float, t_min: float) -> float:
+        """
+        Cyrus-Beck clip: the segment parameter at which P(t) = (x0, y0) + t * (dx, dy)
+        leaves the trapezoid, searching from t_min on.
+        """
+        yb, yt, xbl, xtl, xbr, xtr = geometry[:6]
+        t_exit = math.inf
+        # Edges in counter-clockwise order: bottom, right, top, left.
+        for ax, ay, bx, by in ((xbl, yb, xbr, yb), (xbr, yb, xtr, yt), (xtr, yt, xtl, yt), (xtl, yt, xbl, yb)):
+            nx, ny = ay - by, bx - ax  # inward normal
+            denom = nx * dx + ny * dy
+            if denom < 0:
+                t = -(nx * (x0 - ax) + ny * (y0 - ay)) / denom
+                if t_min <= t < t_exit:
+                    t_exit = t
+        return t_exit if t_exit != math.inf else t_min
+
+    @staticmethod
+    def _geometry_contains(geometry, x: float, y: float, tol: float) -> bool:
+        yb, yt, xbl, xtl, xbr, xtr = geometry[:6]
+        if not (yb - tol <= y <= yt + tol):
+            return False
+        ratio = (y - yb) / (yt - yb) if yt != yb else 0
+        return xbl + (xtl - xbl) * ratio - tol <= x <= xbr + (xtr - xbr) * ratio + tol
+
+    def has_exact_line_of_sight(self, p1: Tuple[float, float], p2: Tuple[float, float], tol: float = 1.0) -> bool:
+        """
+        Exact walkability test for the segment p1 -> p2.
+        Walks the segment trapezoid by trapezoid: clips it against the current trapezoid,
+        then continues in the portal neighbour that contains the exit point. The segment
+        is blocked as soon as it leaves a trapezoid into no walkable area.
+        """
+        current = self.find_trapezoid_id_by_coord(p1, tol)
+        if current is None:
+            return False
+
+        x0, y0 = p1
+        dx, dy = p2[0] - x0, p2[1] - y0
+        length = math.hypot(dx, dy)
+        if length == 0:
+            return True
+        step = 2.0 * tol / length  # step past each exit far enough to leave the current trapezoid's tolerance
+        geometry_of = self.trap_geometry
+        t = 0.0
+
+        for _ in range(len(geometry_of) + 1):
+            t_exit = self._segment_exit(geometry_of[current], x0, y0, dx, dy, t)
+            if t_exit >= 1.0:
+                return True
+            t = t_exit + step
+            if t >= 1.0:
+                return True
+            qx, qy = x0 + dx * t, y0 + dy * t
+            if self._geometry_contains(geometry_of[current], qx, qy, 0.0):
+                continue
+
+            next_id = None
+            for neighbor in self.portal_graph.get(current, ()):
+                if self._geometry_contains(geometry_of[neighbor], qx, qy, tol):
+                    next_id = neighbor
+                    break
+            if next_id is None:
+                next_id = self.find_trapezoid_id_by_coord((qx, qy), tol, exclude=current)
+            if next_id is None:
+                return False
+            current = next_id
+        return False
+
     def smooth_path_by_los(self, 
                            path: List[Tuple[float, float]],
                            margin: float = 100,
-                           step_dist: float = 200.0) -> List[Tuple[float, float]]:
+                           step_dist: float = 200.0,
+                           exact: bool = False) -> List[Tuple[float, float]]:
         if len(path) <= 2:
             return path
 
+        def _los(a, b):
+            if exact:
+                return self.has_exact_line_of_sight(a, b)
+            return self.has_line_of_sight(a, b, margin, step_dist)
+
         result = [path[0]]
         i = 0
         while i < len(path) - 1:
             j = len(path) - 1
             while j > i + 1:
-                if self.has_line_of_sight(path[i], path[j], margin, step_dist):
+                if _los(path[i], path[j]):
                     break
                 j -= 1
             result.append(path[j])
             i = j
         return result
+
+    def _get_portal_edge(self, a_id: int, b_id: int, margin: float) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+        """(left, right) edge shared by consecutive corridor trapezoids a -> b, shrunk by margin."""
+        a = self.trap_geometry[a_id]
+        b = self.trap_geometry[b_id]
+        if abs(a[0] - b[1]) < 1.0:      # b is below a, crossing a's bottom edge
+            y = a[0]
+            lo, hi = max(a[2], b[3]), min(a[4], b[5])
+            going_up = False
+        elif abs(a[1] - b[0]) < 1.0:    # b is above a, crossing a's top edge
+            y = a[1]
+            lo, hi = max(a[3], b[2]), min(a[5], b[4])
+            going_up = True
+        else:
+            # Cross-layer or non-aligned neighbours: pass through the midpoint of the centroids.
+            ax, ay = self.get_position(a_id)
+            bx, by = self.get_position(b_id)
+            mid = ((ax + bx) / 2, (ay + by) / 2)
+            return mid, mid
+
+        if hi - lo <= 2 * margin:
+            mid = ((lo + hi) / 2, y)
+            return mid, mid
+        lo, hi = lo + margin, hi - margin
+        if going_up:
+            return (lo, y), (hi, y)
+        return (hi, y), (lo, y)
+
+    def funnel_smooth_path(self,
+                           trap_path: List[int],
+                           start: Tuple[float, float],
+                           goal: Tuple[float, float],
+                           margin: float = 0.0) -> List[Tuple[float, float]]:
+        """
+        String-pulls the shortest polyline from start to goal through a corridor of
+        trapezoid ids (as returned by AStar.get_trapezoid_path()), using the simple
+        stupid funnel algorithm over the shared trapezoid edges.
+        """
+        if len(trap_path) < 2:
+            return [start, goal]
+
+        portals = [(start, start)]
+        for a_id, b_id in zip(trap_path, trap_path[1:]):
+            portals.append(self._get_portal_edge(a_id, b_id, margin))
+        portals.append((goal, goal))
+
+        def triarea2(a, b, c):
+            return (c[0] - a[0]) * (b[1] - a[1]) - (b[0] - a[0]) * (c[1] - a[1])
+
+        path = [start]
+        apex, left, right = start, start, start
+        apex_index = left_index = right_index = 0
+        i = 1
+        while i < len(portals):
+            new_left, new_right = portals[i]
+
+            # Update right vertex.
+            if triarea2(apex, right, new_right) <= 0.0:
+                if apex == right or triarea2(apex, left, new_right) > 0.0:
+                    right, right_index = new_right, i
+                else:
+                    # Right crossed over left: left becomes a path corner and the new apex.
+                    path.append(left)
+                    apex, apex_index = left, left_index
+                    left = right = apex
+                    left_index = right_index = apex_index
+                    i = apex_index + 1
+                    continue
+
+            # Update left vertex.
+            if triarea2(apex, left, new_left) >= 0.0:
+                if apex == left or triarea2(apex, right, new_left) < 0.0:
+                    left, left_index = new_left, i
+                else:
+                    # Left crossed over right: right becomes a path corner and the new apex.
+                    path.append(right)
+                    apex, apex_index = right, right_index
+                    left = right = apex
+                    left_index = right_index = apex_index
+                    i = apex_index + 1
+                    continue
+            i += 1
+
+        if path[-1] != goal:
+            path.append(goal)
+        return path
     
-    def save_to_file(self, folder: str):
-        filepath = f"{folder}/navmesh_{self.map_id}.bin"
-        data = {
-            "map_id": self.map_id,
-            "portals": [((p.p1.x, p.p1.y), (p.p2.x, p.p2.y), p.a.m_t.id, p.b.m_t.id) for p in self.portals],
-            "portal_graph": self.portal_graph
-        }
-        with open(filepath, "wb") as f:
-            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    def save_to_file(self, folder: str, data_hash: Optional[bytes] = None):
+        """Writes the derived portal/adjacency/grid data to the binary NavMesh cache."""
+        NavMeshCache.save(self, folder, data_hash)
+
+    @staticmethod
+    def load_from_file(pathing_maps, map_id: int, folder: str, GRID_SIZE: float = 1000) -> Optional["NavMesh"]:
+        """Loads a NavMesh from the binary cache. Returns None when missing, stale or from another format version."""
+        data_hash = NavMeshCache.hash_pathing_maps(pathing_maps, GRID_SIZE)
+        return NavMeshCache.load(pathing_maps, map_id, folder, data_hash, GRID_SIZE)
+
+    @staticmethod
+    def load_or_build(pathing_maps, map_id: int, folder: Optional[str] = None, GRID_SIZE: float = 1000) -> "NavMesh":
+        """
+        Returns the cached NavMesh for these pathing maps when one exists on disk,
+        otherwise builds it and writes the cache for the next visit.
+        """
+        folder = folder or NavMeshCache.default_folder()
+        data_hash = NavMeshCache.hash_pathing_maps(pathing_maps, GRID_SIZE)
+        navmesh = NavMeshCache.load(pathing_maps, map_id, folder, data_hash, GRID_SIZE)
+        if navmesh is not None:
+            return navmesh
+
+        navmesh = NavMesh(pathing_maps, map_id, GRID_SIZE)
+        try:
+            NavMeshCache.save(navmesh, folder, data_hash)
+        except OSError as e:
+            Py4GW.Console.Log("NavMesh", f"Could not write NavMesh cache for map {map_id}: {e}", Py4GW.Console.MessageType.Warning)
+        return navmesh
+
+
+#region NavMeshCache
+class NavMeshCache:
+    """
+    Versioned binary cache of everything NavMesh derives from the raw pathing maps.
+
+    File layout (little endian, every section 4-byte aligned so it can be cast
+    straight out of an mmap):
+        header   magic, version, map_id, grid_size, 16-byte pathing data hash, section lengths
+        trap_ids        int32[T]        trapezoid ids in map order
+        portal_points   float32[P*4]    x1, y1, x2, y2
+        portal_traps    int32[P*2]      trap_a, trap_b
+        adj_nodes       int32[N]        portal_graph keys in insertion order
+        adj_offsets     int32[N+1]      CSR offsets into adj_edges
+        adj_edges       int32[E]        neighbour trapezoid ids
+        cell_keys       int32[C*2]      grid cell (gx, gy)
+        cell_offsets    int32[C+1]      CSR offsets into cell_entries
+        cell_entries    int32[K]        trapezoid map order per cell
+
+    Trapezoid geometry and layers are not stored: _load_layers reads them from
+    the raw pathing maps, which have to be walked for the hash anyway.
+
+    The file is keyed by map id and a hash of the pathing data, so a patched map
+    simply misses the cache and gets rebuilt.
+    """
+    MAGIC = b"P4NM"
+    VERSION = 2
+    HEADER = struct.Struct("<4sIId16s8I")
+
+    @staticmethod
+    def default_folder() -> str:
+        return os.path.join(Py4GW.Console.get_projects_path(), "NavMeshCache")
+
+    @staticmethod
+    def get_filepath(folder: str, map_id: int) -> str:
+        return os.path.join(folder, f"navmesh_{map_id}.bin")
+
+    @staticmethod
+    def hash_pathing_maps(pathing_maps, GRID_SIZE: float = 1000) -> bytes:
+        h = hashlib.blake2b(digest_size=16)
+        h.update(struct.pack("<If", NavMeshCache.VERSION, GRID_SIZE))
+        trap_struct = struct.Struct("<i6f")
+        for layer in pathing_maps:
+            traps = layer.trapezoids
+            h.update(struct.pack("<I", len(traps)))
+            for t in traps:
+                h.update(trap_struct.pack(t.id, t.XTL, t.XTR, t.YT, t.XBL, t.XBR, t.YB))
+                neighbor_ids = t.neighbor_ids
+                h.update(struct.pack(f"<{len(neighbor_ids)}i", *neighbor_ids))
+            for p in layer.portals:
+                indices = p.trapezoid_indices
+                h.update(struct.pack(f"<i{len(indices)}i", p.pair_index, *indices))
+        return h.digest()
+
+    @staticmethod
+    def save(navmesh: NavMesh, folder: str, data_hash: Optional[bytes] = None):
+        if data_hash is None:
+            data_hash = b"\x00" * 16
+
+        trap_ids = array('i')
+        order_of: Dict[int, int] = {}
+        for order, t in enumerate(navmesh.trapezoids.values()):
+            order_of[t.id] = order
+            trap_ids.append(t.id)
+
+        portal_points, portal_traps = array('f'), array('i')
+        for p in navmesh.portals:
+            portal_points.extend((p.p1.x, p.p1.y, p.p2.x, p.p2.y))
+            portal_traps.extend((p.a.m_t.id, p.b.m_t.id))
+
+        adj_nodes, adj_offsets, adj_edges = array('i'), array('i', [0]), array('i')
+        for node_id, neighbors in navmesh.portal_graph.items():
+            adj_nodes.append(node_id)
+            adj_edges.extend(neighbors)
+            adj_offsets.append(len(adj_edges))
+
+        cell_keys, cell_offsets, cell_entries = array('i'), array('i', [0]), array('i')
+        for (gx, gy), traps in navmesh.spatial_grid.items():
+            cell_keys.extend((int(gx), int(gy)))
+            cell_entries.extend(order_of[t.id] for t in traps)
+            cell_offsets.append(len(cell_entries))
+
+        header = NavMeshCache.HEADER.pack(
+            NavMeshCache.MAGIC, NavMeshCache.VERSION, navmesh.map_id, navmesh.GRID_SIZE, data_hash,
+            len(trap_ids), len(navmesh.portals), len(adj_nodes), len(adj_edges),
+            len(cell_offsets) - 1, len(cell_entries), 0, 0,
+        )
 
+        os.makedirs(folder, exist_ok=True)
+        filepath = NavMeshCache.get_filepath(folder, navmesh.map_id)
+        # Multiboxed clients entering the same map save at the same time, each through its own temp file
+        tmp_path = f"{filepath}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(header)
+                for section in (trap_ids, portal_points, portal_traps,
+                                adj_nodes, adj_offsets, adj_edges, cell_keys, cell_offsets, cell_entries):
+                    f.write(section.tobytes())
+            os.replace(tmp_path, filepath)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
 
     @staticmethod
-    def load_from_file(pathing_maps, map_id: int, folder: str) -> "NavMesh":
-        filepath = f"{folder}/navmesh_{map_id}.bin"
+    def load(pathing_maps, map_id: int, folder: str, data_hash: bytes, GRID_SIZE: float = 1000) -> Optional[NavMesh]:
+        filepath = NavMeshCache.get_filepath(folder, map_id)
+        if not os.path.isfile(filepath):
+            return None
+
+        with open(filepath, "rb") as f:
+            file_size = os.fstat(f.fileno()).st_size
+            if file_size < NavMeshCache.HEADER.size:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                (magic, version, cached_map_id, grid_size, cached_hash,
+                 n_traps, n_portals, n_nodes, n_edges, n_cells, n_entries, _, _) = NavMeshCache.HEADER.unpack_from(mm, 0)
+                if (magic != NavMeshCache.MAGIC or version != NavMeshCache.VERSION or cached_map_id != map_id
+                        or cached_hash != data_hash or grid_size != GRID_SIZE):
+                    return None
+
+                counts = (n_traps, n_portals * 4, n_portals * 2,
+                          n_nodes, n_nodes + 1, n_edges,
+                          n_cells * 2, n_cells + 1, n_entries)
+                if NavMeshCache.HEADER.size + sum(counts) * 4 != file_size:
+                    return None  # truncated or padded, rebuild it
+
+                view = memoryview(mm)
+                sections = []
+                try:
+                    offset = NavMeshCache.HEADER.size
+                    for fmt, count in zip(('i', 'f', 'i', 'i', 'i', 'i', 'i', 'i', 'i'), counts):
+                        size = count * 4
+                        sections.append(view[offset:offset + size].cast(fmt))
+                        offset += size
+                    return NavMeshCache._build(pathing_maps, map_id, GRID_SIZE, sections)
+                except (TypeError, ValueError, IndexError, KeyError) as e:
+                    Py4GW.Console.Log("NavMesh", f"Discarding corrupt NavMesh cache for map {map_id}: {e}", Py4GW.Console.MessageType.Warning)
+                    return None
+                finally:
+                    # Every view has to be released before the mmap can close
+                    for section in sections:
+                        section.release()
+                    view.release()
+
+    @staticmethod
+    def _build(pathing_maps, map_id: int, GRID_SIZE: float, sections) -> Optional[NavMesh]:
+        (trap_ids, portal_points, portal_traps,
+         adj_nodes, adj_offsets, adj_edges, cell_keys, cell_offsets, cell_entries) = sections
 
         nav = NavMesh.__new__(NavMesh)
         nav.map_id = map_id
+        nav.GRID_SIZE = GRID_SIZE
         nav.trapezoids = {}
         nav.portals = []
         nav.portal_graph = {}
         nav.trap_id_to_layer = {}
         nav.layer_portals = {}
+        nav.spatial_grid = {}
+        nav.point_grid = {}
+        nav._graph = None
+        nav._astar_engine = None
+        nav._hierarchy = None
+        nav._load_layers(pathing_maps)
+
+        traps_in_order = list(nav.trapezoids.values())
+        if len(traps_in_order) != len(trap_ids):
+            return None
+
+        boxes: Dict[int, AABB] = {}
+        for i in range(len(portal_traps) // 2):
+            x1, y1, x2, y2 = portal_points[4 * i:4 * i + 4]
+            a_id, b_id = portal_traps[2 * i:2 * i + 2]
+            a = boxes.get(a_id) or boxes.setdefault(a_id, AABB(nav.trapezoids[a_id]))
+            b = boxes.get(b_id) or boxes.setdefault(b_id, AABB(nav.trapezoids[b_id]))
+            nav.portals.append(Portal(Point2D(x1, y1), Point2D(x2, y2), a, b))
+
+        for i, node_id in enumerate(adj_nodes):
+            nav.portal_graph[node_id] = adj_edges[adj_offsets[i]:adj_offsets[i + 1]].tolist()
+
+        geometry = [(t.YB, t.YT, t.XBL, t.XTL, t.XBR, t.XTR, order, t.id) for order, t in enumerate(traps_in_order)]
+        nav.trap_geometry = {g[7]: g for g in geometry}
+        for c in range(len(cell_offsets) - 1):
+            key = (cell_keys[2 * c], cell_keys[2 * c + 1])
+            orders = cell_entries[cell_offsets[c]:cell_offsets[c + 1]].tolist()
+            nav.spatial_grid[key] = [traps_in_order[o] for o in orders]
+            nav.point_grid[key] = [geometry[o] for o in orders]
+
+        Py4GW.Console.Log("NavMesh", f"Loaded cached NavMesh for map {map_id} with {len(nav.portals)} portals and {len(nav.trapezoids)} trapezoids.", Py4GW.Console.MessageType.Info)
+        return nav
 
-        for layer in pathing_maps:
-            z = layer.zplane
-            traps = layer.trapezoids
-            nav.layer_portals[z] = layer.portals
-            nav.trapezoids.update({t.id: t for t in traps})
-            nav.trap_id_to_layer.update({t.id: z for t in traps})
+#endregion
 
-        with open(filepath, "rb") as f:
-            data = pickle.load(f)
 
-        for (x1, y1), (x2, y2), a_id, b_id in data["portals"]:
-            a = AABB(nav.trapezoids[a_id])
-            b = AABB(nav.trapezoids[b_id])
-            p1 = Point2D(x1, y1)
-            p2 = Point2D(x2, y2)
-            nav.portals.append(Portal(p1, p2, a, b))
+#region AStar
 
-        nav.portal_graph = data["portal_graph"]
+class NavGraph:
+    """
+    Compact graph over the NavMesh trapezoids.
 
-        Py4GW.Console.Log("NavMesh", f"Loaded NavMesh for map {map_id} with {len(nav.portals)} portals and {len(nav.trapezoids)} trapezoids.", Py4GW.Console.MessageType.Info)
-        return nav
-    
-    
+    Nodes are trapezoids in map order (node index != trapezoid id), with their
+    centroid precomputed. Edges come from portal_graph and are stored in CSR form:
+    the neighbours of node i are targets[offsets[i]:offsets[i + 1]], each with the
+    centroid-to-centroid distance in weights.
+    """
+    def __init__(self, navmesh: NavMesh):
+        self.node_ids = array('i')
+        self.node_x = array('d')
+        self.node_y = array('d')
+        self.index_of: Dict[int, int] = {}
+
+        for index, t in enumerate(navmesh.trapezoids.values()):
+            self.index_of[t.id] = index
+            self.node_ids.append(t.id)
+            self.node_x.append((t.XTL + t.XTR + t.XBL + t.XBR) / 4)
+            self.node_y.append((t.YT + t.YB) / 2)
+
+        self.offsets = array('i', [0])
+        self.targets = array('i')
+        self.weights = array('d')
+        index_of, node_x, node_y = self.index_of, self.node_x, self.node_y
+        for index, trap_id in enumerate(self.node_ids):
+            x, y = node_x[index], node_y[index]
+            for neighbor_id in navmesh.portal_graph.get(trap_id, ()):
+                neighbor = index_of.get(neighbor_id)
+                if neighbor is None:
+                    continue
+                self.targets.append(neighbor)
+                self.weights.append(math.hypot(node_x[neighbor] - x, node_y[neighbor] - y))
+            self.offsets.append(len(self.targets))
+
+    def __len__(self):
+        return len(self.node_ids)
+
+    def get_position(self, index: int) -> Tuple[float, float]:
+        return (self.node_x[index], self.node_y[index])
+
+
+class AStarEngine:
+    """
+    A* over a NavGraph with scratch buffers that live as long as the engine.
+
+    Costs and parents are flat arrays indexed by node; a generation stamp marks
+    which entries belong to the current query, so nothing is cleared between searches.
+    """
+    def __init__(self, graph: NavGraph):
+        n = len(graph)
+        self.graph = graph
+        self.g_cost = array('d', bytes(8 * n))
+        self.parent = array('i', [-1]) * n
+        self.stamp = array('I', bytes(4 * n))
+        self.generation = 0
+        self.open_heap: List[Tuple[float, float, int]] = []
+        self.last_expanded = 0
+
+    def _next_generation(self):
+        self.generation += 1
+        if self.generation >= 0xFFFFFFFF:
+            self.stamp = array('I', bytes(4 * len(self.graph)))
+            self.generation = 1
+
+    def search(self, start: int, goal: int,
+               cluster_of: Optional[array] = None, allowed_clusters: Optional[bytearray] = None) -> List[int]:
+        """
+        Returns the node indices from start to goal (inclusive), or [] when unreachable.
+        When cluster_of/allowed_clusters are given, only nodes whose cluster is flagged in
+        allowed_clusters are expanded (used by NavHierarchy to search inside a corridor).
+        """
+        self._next_generation()
+        generation = self.generation
+        graph = self.graph
+        node_x, node_y = graph.node_x, graph.node_y
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        g_cost, parent, stamp = self.g_cost, self.parent, self.stamp
+        goal_x, goal_y = node_x[goal], node_y[goal]
+        hypot = math.hypot
+        heappush, heappop = heapq.heappush, heapq.heappop
+
+        open_heap = self.open_heap
+        open_heap.clear()
+        stamp[start] = generation
+        g_cost[start] = 0.0
+        parent[start] = -1
+        heappush(open_heap, (hypot(goal_x - node_x[start], goal_y - node_y[start]), 0.0, start))
+        expanded = 0
+
+        while open_heap:
+            _, current_g, current = heappop(open_heap)
+            if current == goal:
+                self.last_expanded = expanded
+                path = [goal]
+                while parent[path[-1]] != -1:
+                    path.append(parent[path[-1]])
+                path.reverse()
+                return path
+
+            # Stale heap entry: a cheaper route to current was already found.
+            if current_g > g_cost[current]:
+                continue
+            expanded += 1
+
+            for e in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[e]
+                if allowed_clusters is not None and not allowed_clusters[cluster_of[neighbor]]:
+                    continue
+                new_cost = current_g + weights[e]
+                if stamp[neighbor] != generation or new_cost < g_cost[neighbor]:
+                    stamp[neighbor] = generation
+                    g_cost[neighbor] = new_cost
+                    parent[neighbor] = current
+                    heappush(open_heap, (new_cost + hypot(goal_x - node_x[neighbor], goal_y - node_y[neighbor]), new_cost, neighbor))
+
+        self.last_expanded = expanded
+        return []
+
+
+class NavHierarchy:
+    """
+    Two-level abstraction of a NavGraph.
+
+    Trapezoids are grouped into clusters: connected pieces of the mesh inside one
+    coarse grid cell. Clusters form a small graph of their own, so a long query first
+    routes between clusters (memoized per cluster pair) and then runs the full A*
+    only inside that corridor of clusters and their direct neighbours.
+    """
+    def __init__(self, graph: NavGraph, cluster_size: float = 4000.0):
+        self.graph = graph
+        self.cluster_size = cluster_size
+        n = len(graph)
+        self.cluster_of = array('i', [-1]) * n
+        self.cluster_x = array('d')
+        self.cluster_y = array('d')
+        self.cluster_edges: List[Dict[int, float]] = []
+        self.routes: Dict[Tuple[int, int], Optional[List[int]]] = {}
+
+        node_x, node_y = graph.node_x, graph.node_y
+        offsets, targets = graph.offsets, graph.targets
+        cell_of = [(int(node_x[i] // cluster_size), int(node_y[i] // cluster_size)) for i in range(n)]
+
+        for seed in range(n):
+            if self.cluster_of[seed] != -1:
+                continue
+            cluster = len(self.cluster_x)
+            cell = cell_of[seed]
+            self.cluster_of[seed] = cluster
+            stack = [seed]
+            total_x = total_y = 0.0
+            count = 0
+            while stack:
+                node = stack.pop()
+                total_x += node_x[node]
+                total_y += node_y[node]
+                count += 1
+                for e in range(offsets[node], offsets[node + 1]):
+                    neighbor = targets[e]
+                    if self.cluster_of[neighbor] == -1 and cell_of[neighbor] == cell:
+                        self.cluster_of[neighbor] = cluster
+                        stack.append(neighbor)
+            self.cluster_x.append(total_x / count)
+            self.cluster_y.append(total_y / count)
+            self.cluster_edges.append({})
+
+        for node in range(n):
+            a = self.cluster_of[node]
+            for e in range(offsets[node], offsets[node + 1]):
+                b = self.cluster_of[targets[e]]
+                if a != b and b not in self.cluster_edges[a]:
+                    self.cluster_edges[a][b] = math.hypot(self.cluster_x[b] - self.cluster_x[a],
+                                                          self.cluster_y[b] - self.cluster_y[a])
+
+    def __len__(self):
+        return len(self.cluster_x)
+
+    def get_route(self, start_cluster: int, goal_cluster: int) -> Optional[List[int]]:
+        """Cluster sequence from start_cluster to goal_cluster, or None when they are not connected."""
+        key = (start_cluster, goal_cluster)
+        if key in self.routes:
+            return self.routes[key]
+
+        cx, cy = self.cluster_x, self.cluster_y
+        gx, gy = cx[goal_cluster], cy[goal_cluster]
+        cost: Dict[int, float] = {start_cluster: 0.0}
+        came_from: Dict[int, int] = {}
+        open_heap = [(0.0, 0.0, start_cluster)]
+        route = None
+        while open_heap:
+            _, g, current = heapq.heappop(open_heap)
+            if current == goal_cluster:
+                route = [current]
+                while route[-1] in came_from:
+                    route.append(came_from[route[-1]])
+                route.reverse()
+                break
+            if g > cost[current]:
+                continue
+            for neighbor, weight in self.cluster_edges[current].items():
+                new_cost = g + weight
+                if new_cost < cost.get(neighbor, math.inf):
+                    cost[neighbor] = new_cost
+                    came_from[neighbor] = current
+                    heapq.heappush(open_heap, (new_cost + math.hypot(gx - cx[neighbor], gy - cy[neighbor]), new_cost, neighbor))
+
+        self.routes[key] = route
+        if route is not None:
+            self.routes[(goal_cluster, start_cluster)] = route[::-1]
+        return route
+
+    def search(self, engine: AStarEngine, start: int, goal: int) -> List[int]:
+        """Node path from start to goal, searching the full graph only inside the cluster corridor."""
+        start_cluster, goal_cluster = self.cluster_of[start], self.cluster_of[goal]
+        if start_cluster == goal_cluster:
+            return engine.search(start, goal)
+
+        route = self.get_route(start_cluster, goal_cluster)
+        if route is None:
+            return []
+
+        allowed = bytearray(len(self))
+        for cluster in route:
+            allowed[cluster] = 1
+            for neighbor in self.cluster_edges[cluster]:
+                allowed[neighbor] = 1
+
+        path = engine.search(start, goal, self.cluster_of, allowed)
+        return path or engine.search(start, goal)
 
-#region AStar
 
-class AStarNode:
-    def __init__(self, node_id, g, f, parent=None):
-        self.id = node_id
-        self.g = g
-        self.f = f
-        self.parent = parent
-    def __lt__(self, other): return self.f < other.f
-    
 class AStar:
     def __init__(self, navmesh: NavMesh):
         self.navmesh = navmesh
         self.path: List[Tuple[float, float]] = []
+        self.trap_path: List[int] = []
 
     def heuristic(self, a: int, b: int) -> float:
         ax, ay = self.navmesh.get_position(a)
         bx, by = self.navmesh.get_position(b)
         return math.hypot(bx - ax, by - ay)
 
-    def search(self, start_pos: Tuple[float, float], goal_pos: Tuple[float, float]) -> bool:
+    def search(self, start_pos: Tuple[float, float], goal_pos: Tuple[float, float], hierarchical: bool = False) -> bool:
         start_id = self.navmesh.find_trapezoid_id_by_coord(start_pos)
         goal_id = self.navmesh.find_trapezoid_id_by_coord(goal_pos)
 
@@ -380,41 +991,28 @@ class AStar:
             Py4GW.Console.Log("A-Star", f"Invalid start or goal trapezoid: {start_id}, {goal_id}", Py4GW.Console.MessageType.Error)
             return False
 
-        open_list: List[AStarNode] = []
-        heapq.heappush(open_list, AStarNode(start_id, 0, self.heuristic(start_id, goal_id)))
-        came_from: Dict[int, int] = {}
-        cost_so_far: Dict[int, float] = {start_id: 0}
-
-        while open_list:
-            current = heapq.heappop(open_list)
-            if current.id == goal_id:
-                self._reconstruct(came_from, goal_id)
-                # Prepend exact start position, append exact goal position
-                self.path.insert(0, start_pos)
-                self.path.append(goal_pos)
-                return True
-
-            for neighbor in self.navmesh.get_neighbors(current.id):
-                new_cost = cost_so_far[current.id] + self.heuristic(current.id, neighbor)
-                if neighbor not in cost_so_far or new_cost < cost_so_far[neighbor]:
-                    cost_so_far[neighbor] = new_cost
-                    priority = new_cost + self.heuristic(neighbor, goal_id)
-                    heapq.heappush(open_list, AStarNode(neighbor, new_cost, priority, current.id))
-                    came_from[neighbor] = current.id
-
-        Py4GW.Console.Log("A-Star", f"Path not found from {start_id} to {goal_id}", Py4GW.Console.MessageType.Warning)
-        return False
+        graph = self.navmesh.get_graph()
+        engine = self.navmesh.get_astar_engine()
+        if hierarchical:
+            nodes = self.navmesh.get_hierarchy().search(engine, graph.index_of[start_id], graph.index_of[goal_id])
+        else:
+            nodes = engine.search(graph.index_of[start_id], graph.index_of[goal_id])
+        if not nodes:
+            Py4GW.Console.Log("A-Star", f"Path not found from {start_id} to {goal_id}", Py4GW.Console.MessageType.Warning)
+            return False
 
-    def _reconstruct(self, came_from: Dict[int, int], end_id: int):
-        self.path = []
-        while end_id in came_from:
-            self.path.append(self.navmesh.get_position(end_id))
-            end_id = came_from[end_id]
-        self.path.append(self.navmesh.get_position(end_id))  # Add start node
-        self.path.reverse()
+        self.trap_path = [graph.node_ids[node] for node in nodes]
+        self.path = [graph.get_position(node) for node in nodes]
+        # Prepend exact start position, append exact goal position
+        self.path.insert(0, start_pos)
+        self.path.append(goal_pos)
+        return True
 
     def get_path(self) -> List[Tuple[float, float]]:
         return self.path
+
+    def get_trapezoid_path(self) -> List[int]:
+        return self.trap_path
     
     
 def chaikin_smooth_path(points: List[Tuple[float, float]], iterations: int = 1) -> List[Tuple[float, float]]:
@@ -554,6 +1152,53 @@ PATHING_MAP_GROUPS = [
     ],
 ]
 
+class PathCache:
+    """
+    LRU cache of finished paths keyed by (map group, start cell, goal cell, options).
+    Start and goal are bucketed into cell_size squares so repeated queries between the
+    same waypoints hit even when the player stops a few units off.
+    """
+    def __init__(self, max_entries: int = 256, cell_size: float = 200.0):
+        self.max_entries = max_entries
+        self.cell_size = cell_size
+        self.entries: "OrderedDict[tuple, List[Tuple[float, float]]]" = OrderedDict()
+        self.map_id = 0
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, group_key: tuple, start: Tuple[float, float], goal: Tuple[float, float], *options) -> tuple:
+        size = self.cell_size
+        return (group_key,
+                int(start[0] // size), int(start[1] // size),
+                int(goal[0] // size), int(goal[1] // size)) + options
+
+    def get(self, key: tuple) -> Optional[List[Tuple[float, float]]]:
+        path = self.entries.get(key)
+        if path is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return list(path)
+
+    def put(self, key: tuple, path: List[Tuple[float, float]]):
+        if not path:
+            return
+        self.entries[key] = list(path)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def invalidate(self, map_id: int):
+        """Drops every entry when the map changed since the last call."""
+        if map_id != self.map_id:
+            self.map_id = map_id
+            self.entries.clear()
+
+    def clear(self):
+        self.entries.clear()
+
+
 class AutoPathing:
     _instance = None
 
@@ -570,6 +1215,7 @@ class AutoPathing:
         self.is_ready: bool = False
         self.pathing_map_cache: dict[tuple[int, ...], NavMesh] = {}
         self._last_group_key: Optional[tuple[int, ...]] = None
+        self.path_cache = PathCache()
         self._initialized = True
 
     def _get_group_key(self, map_id: int) -> tuple[int, ...]:
@@ -588,15 +1234,9 @@ class AutoPathing:
             return  # Already loaded
 
         pathing_maps = PyPathing.get_pathing_maps()
-        navmesh = NavMesh(pathing_maps, map_id)
+        navmesh = NavMesh.load_or_build(pathing_maps, map_id)
         self.pathing_map_cache[group_key] = navmesh
         yield
-        
-        """try:
-            navmesh = NavMesh.load_from_file(pathing_maps, map_id, folder="NavMeshCache")
-        except FileNotFoundError:
-            navmesh = NavMesh(pathing_maps, map_id)
-            navmesh.save_to_file("NavMeshCache")"""
 
     def get_navmesh(self) -> Optional[NavMesh]:
         map_id = PyMap.PyMap().map_id.ToInt()
@@ -610,7 +1250,10 @@ class AutoPathing:
                  margin: float = 100,
                  step_dist: float = 200.0,
                  smooth_by_chaikin: bool = False,
-                 chaikin_iterations: int = 1):
+                 chaikin_iterations: int = 1,
+                 use_cache: bool = True,
+                 hierarchical: bool = False,
+                 smooth_by_funnel: bool = False):
         from . import Routines
         
         def _prepend_start(path2d: list[tuple[float, float]], sx: float, sy: float, tol: float = 250.0):
@@ -631,6 +1274,18 @@ class AutoPathing:
         map_id = PyMap.PyMap().map_id.ToInt()
         group_key = self._get_group_key(map_id)
 
+        # --- Reuse a path planned earlier between the same cells ---
+        self.path_cache.invalidate(map_id)
+        cache_key = self.path_cache.make_key(group_key, start, goal, smooth_by_los, margin, step_dist,
+                                             smooth_by_chaikin, chaikin_iterations, smooth_by_funnel, hierarchical)
+        if use_cache:
+            cached = self.path_cache.get(cache_key)
+            if cached is not None:
+                cached[-1] = (goal[0], goal[1])
+                path2d = densify_path2d(_prepend_start(cached, start[0], start[1]))
+                yield
+                return [(x, y, start[2]) for (x, y) in path2d]
+
         # --- Try fast planner first ---
         path_planner = PyPathing.PathPlanner()
         path_planner.reset()
@@ -652,6 +1307,7 @@ class AutoPathing:
                 if smooth_by_chaikin:
                     path2d = chaikin_smooth_path(path2d, chaikin_iterations)
 
+                self.path_cache.put(cache_key, path2d)
                 path2d = densify_path2d(path2d)  # split long hops into ≤750
                 return [(x, y, start[2]) for (x, y) in path2d]
             
@@ -670,14 +1326,16 @@ class AutoPathing:
 
         yield
         astar = AStar(navmesh)
-        success = astar.search((start[0], start[1]), (goal[0], goal[1]))
+        success = astar.search((start[0], start[1]), (goal[0], goal[1]), hierarchical=hierarchical)
         yield
 
         if success:
             raw_path = astar.get_path()
             yield
             raw_path = _prepend_start(raw_path, start[0], start[1])
-            if smooth_by_los:
+            if smooth_by_funnel:
+                smoothed = navmesh.funnel_smooth_path(astar.get_trapezoid_path(), (start[0], start[1]), (goal[0], goal[1]))
+            elif smooth_by_los:
                 smoothed = navmesh.smooth_path_by_los(raw_path, margin, step_dist)
             else:
                 smoothed = raw_path
@@ -685,6 +1343,7 @@ class AutoPathing:
             if smooth_by_chaikin:
                 smoothed = chaikin_smooth_path(smoothed, chaikin_iterations)
 
+            self.path_cache.put(cache_key, smoothed)
             path2d = densify_path2d(smoothed)  # split long hops into ≤750
 
             return [(x, y, start[2]) for (x, y) in path2d]
@@ -696,7 +1355,10 @@ class AutoPathing:
                     margin: float = 100,
                     step_dist: float = 200.0,
                     smooth_by_chaikin: bool = False,
-                    chaikin_iterations: int = 1):
+                    chaikin_iterations: int = 1,
+                    use_cache: bool = True,
+                    hierarchical: bool = False,
+                    smooth_by_funnel: bool = False):
         import PyPlayer
         import PyAgent
 
@@ -715,7 +1377,10 @@ class AutoPathing:
                                         margin=margin,
                                         step_dist=step_dist,
                                         smooth_by_chaikin=smooth_by_chaikin,
-                                        chaikin_iterations=chaikin_iterations)
+                                        chaikin_iterations=chaikin_iterations,
+                                        use_cache=use_cache,
+                                        hierarchical=hierarchical,
+                                        smooth_by_funnel=smooth_by_funnel)
         return [(x, y) for (x, y, _) in path]
 
 
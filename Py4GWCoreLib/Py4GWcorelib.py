@@ -9,6 +9,7 @@ from .py4gwcorelib_src.Keystroke import Keystroke
 from .py4gwcorelib_src.ActionQueue import ActionQueue, ActionQueueNode, ActionQueueManager, QueueTypes
 from .py4gwcorelib_src.BehaviorTree import BehaviorTree
 from .py4gwcorelib_src.FSM import FSM
+from .py4gwcorelib_src.CoroutineRunner import CoroutineRunner, WaitUntil
 from .py4gwcorelib_src.MultiThreading import MultiThreading
 from .py4gwcorelib_src.Lootconfig_src import LootConfig
 from .py4gwcorelib_src.AutoInventoryHandler import AutoInventoryHandler
@@ -23,6 +24,7 @@ __all__ = ["IniHandler", #IniHandler
               "ActionQueue", "ActionQueueNode", "ActionQueueManager", "QueueTypes", #ActionQueue
               "BehaviorTree", #BehaviorTree
               "FSM", #FSM
+              "CoroutineRunner", "WaitUntil", #CoroutineRunner
               "MultiThreading", #MultiThreading
               "LootConfig", #LootConfig
               "AutoInventoryHandler", #AutoInventoryHandler
@@ -2,9 +2,11 @@ import PySkill
 import json
 import os
 from .enums import SkillTextureMap
+from .py4gwcorelib_src import SkillDescriptionStore as _sds
 
 class Skill:
-    _desc_cache = None  # Cache JSON data once loaded
+    _desc_store = None  # mmap-backed skill_descriptions.bin, built from the JSON on first use
+    _desc_cache = None  # whole JSON, only loaded if the binary store can't be used
     
     @staticmethod
     def _load_descriptions():
@@ -13,6 +15,25 @@ class Skill:
             with open(path, encoding="utf-8") as f:
                 Skill._desc_cache = json.load(f)
         return Skill._desc_cache
+
+    @staticmethod
+    def _get_description_store():
+        if Skill._desc_store is None and Skill._desc_cache is None:
+            path = os.path.join(os.path.dirname(__file__), "skill_descriptions.json")
+            try:
+                Skill._desc_store = _sds.SkillDescriptionStore.Open(path)
+            except Exception:
+                # e.g. a read-only install or another client holding the old file open on rebuild
+                Skill._load_descriptions()
+        return Skill._desc_store
+
+    @staticmethod
+    def _get_description_field(skill_id, field):
+        """One field of one skill's wiki entry, None if the skill has no entry."""
+        store = Skill._get_description_store()
+        if store is not None:
+            return store.GetField(int(skill_id), _sds.FIELDS.index(field))
+        return Skill._desc_cache.get(str(skill_id), {}).get(field)
     
     @staticmethod
     def skill_instance(skill_id):
@@ -26,14 +47,14 @@ class Skill:
     @staticmethod
     def GetNameFromWiki(skill_id):
         """Purpose: Retrieve the name of a skill by its ID from the wiki."""
-        data = Skill._load_descriptions()
-        return data.get(str(skill_id), {}).get("name", Skill.GetName(skill_id))
+        name = Skill._get_description_field(skill_id, "name")
+        return name if name is not None else Skill.GetName(skill_id)
     
     @staticmethod
     def GetURL(skill_id):
         """Purpose: Retrieve the URL of a skill by its ID."""
-        data = Skill._load_descriptions()
-        return data.get(str(skill_id), {}).get("url", "")
+        url = Skill._get_description_field(skill_id, "url")
+        return url if url is not None else ""
     
     @staticmethod
     def GetProgressionData(skill_id):
@@ -41,9 +62,11 @@ class Skill:
         Purpose: Retrieve the progression data for a given skill.
         Returns a list of (attribute_name, field_name, values_dict)
         """
-        data = Skill._load_descriptions()
-        entry = data.get(str(skill_id), {})
-        progressions = entry.get("progression")
+        store = Skill._get_description_store()
+        if store is not None:
+            progressions = store.GetProgression(int(skill_id))
+        else:
+            progressions = Skill._desc_cache.get(str(skill_id), {}).get("progression")
 
         if not progressions:
             return []
@@ -70,14 +93,14 @@ class Skill:
     @staticmethod
     def GetDescription(skill_id: int) -> str:
         """Return full description from skill_descriptions.json."""
-        data = Skill._load_descriptions()
-        return data.get(str(skill_id), {}).get("desc_full", "No description available.")
+        description = Skill._get_description_field(skill_id, "desc_full")
+        return description if description is not None else "No description available."
 
     @staticmethod
     def GetConciseDescription(skill_id: int) -> str:
         """Return concise description from skill_descriptions.json."""
-        data = Skill._load_descriptions()
-        return data.get(str(skill_id), {}).get("desc_concise", "No description available.")
+        description = Skill._get_description_field(skill_id, "desc_concise")
+        return description if description is not None else "No description available."
 
     @staticmethod
     def GetType(skill_id):
@@ -6,6 +6,8 @@ from time import sleep
 import inspect
 import sys
 from dataclasses import dataclass, field
+from types import ModuleType
+from typing import Optional, TYPE_CHECKING
 
 import Py4GW
 import PyScanner
@@ -29,36 +31,42 @@ import PyUIManager
 import PyCamera
 import Py2DRenderer
 
-from .enums import *
-from .ImGui_src.IconsFontAwesome5 import IconsFontAwesome5
-from .Map import *
-from .ImGui import *
-from .model_data import *
-from .Agent import *
-from .Player import *
-from .AgentArray import *
-from .Party import *
-from .Item import *
-from .ItemArray import *
-from .Inventory import *
-from .Skill import *
-from .Skillbar import *
-from .Effect import *
-from .Merchant import *
-from .Quest import *
-from .Camera import *
-from .Scanner import *
-
-from .Py4GWcorelib import *
-from .Overlay import *
-from .DXOverlay import *
-from .UIManager import *
-from .Routines import *
-from .SkillManager import *
-from .GlobalCache import GLOBAL_CACHE
-from .Pathing import AutoPathing
-from .BuildMgr import BuildMgr
-from .Botting import BottingClass as Botting
+from .py4gwcorelib_src.ImportProfiler import ImportProfiler
+
+# Times every submodule import below; read it with IMPORT_PROFILER.LogReport()
+IMPORT_PROFILER = ImportProfiler(__name__)
+IMPORT_PROFILER.start()
+
+# Stop it even when a submodule fails to import (e.g. during a script reload), otherwise
+# every later import in the client keeps going through the profiler's hook
+try:
+    from .enums import *
+    from .ImGui_src.IconsFontAwesome5 import IconsFontAwesome5
+    from .Map import *
+    from .ImGui import *
+    from .model_data import *
+    from .Agent import *
+    from .Player import *
+    from .AgentArray import *
+    from .Party import *
+    from .Item import *
+    from .ItemArray import *
+    from .Inventory import *
+    from .Skill import *
+    from .Skillbar import *
+    from .Effect import *
+    from .Merchant import *
+    from .Quest import *
+    from .Camera import *
+    from .Scanner import *
+
+    from .Py4GWcorelib import *
+    from .Overlay import *
+    from .UIManager import *
+    from .Routines import *
+    from .GlobalCache import GLOBAL_CACHE
+finally:
+    IMPORT_PROFILER.stop()
 
 traceback = traceback
 math = math
@@ -68,6 +76,7 @@ sleep = sleep
 inspect = inspect
 dataclass = dataclass
 field = field
+Optional = Optional
 
 Py4Gw = Py4GW
 Py4GW = Py4GW
@@ -91,9 +100,86 @@ PyUIManager = PyUIManager
 PyCamera = PyCamera
 Py2DRenderer = Py2DRenderer
 GLOBAL_CACHE = GLOBAL_CACHE
-AutoPathing = AutoPathing
 IconsFontAwesome5 = IconsFontAwesome5
 
+#region Lazy imports
+# The heavy, rarely needed modules are only imported the first time one of their names is
+# looked up on the package, so a widget that never touches SkillManager or Botting doesn't
+# pay for them at startup. A star import still lists them in __all__ and loads them.
+_SKILLMANAGER_NAMES = (
+    "SkillManager", "CustomSkillClass", "SkillNature", "Skilltarget",
+    "TargetLowestAlly", "TargetLowestAllyEnergy", "TargetClusteredEnemy",
+    "TargetLowestAllyCaster", "TargetLowestAllyMartial", "TargetLowestAllyMelee", "TargetLowestAllyRanged",
+    "GetAllAlliesArray", "GetEnemyAttacking", "GetEnemyCasting", "GetEnemyCastingSpell",
+    "GetEnemyInjured", "GetEnemyConditioned", "GetEnemyHealthy", "GetEnemyHexed", "GetEnemyDegenHexed",
+    "GetEnemyEnchanted", "GetEnemyMoving", "GetEnemyKnockedDown", "GetEnemyBleeding",
+    "GetEnemyPoisoned", "GetEnemyCrippled",
+    "MAX_NUM_PLAYERS", "CacheData", "RegisterPlayer", "RegisterHeroes", "UpdatePlayers",
+    "MAX_SKILLS", "UniqueSkills",
+    # the star import of SkillManager used to rebind SkillType to the HeroAI.types Enum,
+    # replacing the GameData_enums IntEnum that .enums exports
+    "SkillType",
+)
+
+# name -> (module, attribute in that module), attribute None for the submodule itself
+_LAZY_ATTRIBUTES = {
+    "DXOverlay": (".DXOverlay", "DXOverlay"),
+    "AutoPathing": (".Pathing", "AutoPathing"),
+    "BuildMgr": (".BuildMgr", "BuildMgr"),
+    "Botting": (".Botting", "BottingClass"),
+    **{name: (".SkillManager", name) for name in _SKILLMANAGER_NAMES},
+    # submodules the eager imports used to bind on the package as a side effect
+    "Pathing": (".Pathing", None),
+    "Builds": (".Builds", None),
+    "botting_src": (".botting_src", None),
+}
+
+# Names imported only to implement the lazy loading and profiling, kept out of a star import
+_PRIVATE_NAMES = {"ModuleType", "TYPE_CHECKING", "ImportProfiler", "IMPORT_PROFILER"}
+
+# Unbind the eager SkillType so lookups resolve to the HeroAI one through __getattr__, as before
+del SkillType
+
+if TYPE_CHECKING:
+    from .DXOverlay import DXOverlay
+    from .Pathing import AutoPathing
+    from .BuildMgr import BuildMgr
+    from .Botting import BottingClass as Botting
+    from .SkillManager import *
+
+
+def __getattr__(name: str):
+    target = _LAZY_ATTRIBUTES.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = target
+    module = IMPORT_PROFILER.import_lazy(module_name)
+    value = module if attribute is None else getattr(module, attribute)
+    # Bind it so later lookups are plain module attribute reads. This also replaces the
+    # submodule object the import system just bound under the same name (e.g. Botting).
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+class _LazyPackage(ModuleType):
+    def __setattr__(self, name, value):
+        # Importing e.g. Py4GWCoreLib.SkillManager directly makes the import system bind the
+        # submodule on the package, which would shadow the SkillManager class it used to export.
+        target = _LAZY_ATTRIBUTES.get(name)
+        if (target is not None and target[1] is not None
+                and isinstance(value, ModuleType) and value.__name__ == __name__ + target[0]):
+            value = getattr(value, target[1])
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyPackage
+
+#endregion
+
 
 #redirect print output to Py4GW Console
 class Py4GWLogger:
@@ -114,4 +200,8 @@ class Py4GWLoggerError:
 
 # Redirect Python's print output to Py4GW Console
 sys.stdout = Py4GWLogger()
-sys.stderr = Py4GWLoggerError()
\ No newline at end of file
+sys.stderr = Py4GWLoggerError()
+
+__all__ = [name for name in globals() if not name.startswith("_") and name not in _PRIVATE_NAMES] + [
+    name for name in _LAZY_ATTRIBUTES if name not in globals()
+]
\ No newline at end of file
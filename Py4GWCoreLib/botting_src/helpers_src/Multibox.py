@@ -52,7 +52,7 @@ class _Multibox:
             self.PartyID = account_data.PartyID
             self.PartyPosition = account_data.PartyPosition
             self.PlayerIsPartyLeader = account_data.PlayerIsPartyLeader
-            self.PlayerBuffs = list(account_data.PlayerBuffs)
+            self.PlayerBuffs = list(account_data.PlayerBuffs[:account_data.BuffCount])
             self.LastUpdated = account_data.LastUpdated
 
         
@@ -1,2091 +1,172 @@
-ModelData = {
-    107: {'name': 'Canthan Guard', 'profession': ['Warrior', 'Ranger'], 'attributes': [{'level': '14...16', 'name': 'Tactics'}], 'skills_used': ['Troll Unguent', 'Endure Pain', 'Triple Chop', 'Distracting Shot', 'Healing Spring', "Protector's Defense", "Bull's Strike", '"Watch Yourself!"', 'Barrage', 'Healing Signet', 'Seeking Blade', 'Cyclone Axe', 'Lightning Touch', "Dryder's Defenses", 'Dancing Daggers', 'Dark Prison', 'Dismember', 'Gash', 'Crippling Slash', 'Poison Tip Signet', "Lion's Comfort", 'Splinter Weapon'], 'armor_levels': {}, 'items_dropped': []},
-    188: {'name': 'Canthan Guard', 'profession': ['Warrior', 'Ranger'], 'attributes': [{'level': '14...16', 'name': 'Tactics'}], 'skills_used': ['Troll Unguent', 'Endure Pain', 'Triple Chop', 'Distracting Shot', 'Healing Spring', "Protector's Defense", "Bull's Strike", '"Watch Yourself!"', 'Barrage', 'Healing Signet', 'Seeking Blade', 'Cyclone Axe', 'Lightning Touch', "Dryder's Defenses", 'Dancing Daggers', 'Dark Prison', 'Dismember', 'Gash', 'Crippling Slash', 'Poison Tip Signet', "Lion's Comfort", 'Splinter Weapon'], 'armor_levels': {}, 'items_dropped': []},
-    3064: {'name': 'Canthan Guard', 'profession': ['Warrior', 'Ranger'], 'attributes': [{'level': '14...16', 'name': 'Tactics'}], 'skills_used': ['Troll Unguent', 'Endure Pain', 'Triple Chop', 'Distracting Shot', 'Healing Spring', "Protector's Defense", "Bull's Strike", '"Watch Yourself!"', 'Barrage', 'Healing Signet', 'Seeking Blade', 'Cyclone Axe', 'Lightning Touch', "Dryder's Defenses", 'Dancing Daggers', 'Dark Prison', 'Dismember', 'Gash', 'Crippling Slash', 'Poison Tip Signet', "Lion's Comfort", 'Splinter Weapon'], 'armor_levels': {}, 'items_dropped': []},
-    3096: {'name': 'Canthan Guard', 'profession': ['Warrior', 'Ranger'], 'attributes': [{'level': '14...16', 'name': 'Tactics'}], 'skills_used': ['Troll Unguent', 'Endure Pain', 'Triple Chop', 'Distracting Shot', 'Healing Spring', "Protector's Defense", "Bull's Strike", '"Watch Yourself!"', 'Barrage', 'Healing Signet', 'Seeking Blade', 'Cyclone Axe', 'Lightning Touch', "Dryder's Defenses", 'Dancing Daggers', 'Dark Prison', 'Dismember', 'Gash', 'Crippling Slash', 'Poison Tip Signet', "Lion's Comfort", 'Splinter Weapon'], 'armor_levels': {}, 'items_dropped': []},
-    3228: {'name': 'Canthan Guard', 'profession': ['Warrior', 'Ranger'], 'attributes': [{'level': '14...16', 'name': 'Tactics'}], 'skills_used': ['Troll Unguent', 'Endure Pain', 'Triple Chop', 'Distracting Shot', 'Healing Spring', "Protector's Defense", "Bull's Strike", '"Watch Yourself!"', 'Barrage', 'Healing Signet', 'Seeking Blade', 'Cyclone Axe', 'Lightning Touch', "Dryder's Defenses", 'Dancing Daggers', 'Dark Prison', 'Dismember', 'Gash', 'Crippling Slash', 'Poison Tip Signet', "Lion's Comfort", 'Splinter Weapon'], 'armor_levels': {}, 'items_dropped': []},
-    3234: {'name': 'Canthan Guard', 'profession': ['Warrior', 'Ranger'], 'attributes': [{'level': '14...16', 'name': 'Tactics'}], 'skills_used': ['Troll Unguent', 'Endure Pain', 'Triple Chop', 'Distracting Shot', 'Healing Spring', "Protector's Defense", "Bull's Strike", '"Watch Yourself!"', 'Barrage', 'Healing Signet', 'Seeking Blade', 'Cyclone Axe', 'Lightning Touch', "Dryder's Defenses", 'Dancing Daggers', 'Dark Prison', 'Dismember', 'Gash', 'Crippling Slash', 'Poison Tip Signet', "Lion's Comfort", 'Splinter Weapon'], 'armor_levels': {}, 'items_dropped': []},
-    3235: {'name': 'Canthan Guard', 'profession': ['Warrior', 'Ranger'], 'attributes': [{'level': '14...16', 'name': 'Tactics'}], 'skills_used': ['Troll Unguent', 'Endure Pain', 'Triple Chop', 'Distracting Shot', 'Healing Spring', "Protector's Defense", "Bull's Strike", '"Watch Yourself!"', 'Barrage', 'Healing Signet', 'Seeking Blade', 'Cyclone Axe', 'Lightning Touch', "Dryder's Defenses", 'Dancing Daggers', 'Dark Prison', 'Dismember', 'Gash', 'Crippling Slash', 'Poison Tip Signet', "Lion's Comfort", 'Splinter Weapon'], 'armor_levels': {}, 'items_dropped': []},
-    3237: {'name': 'Canthan Guard', 'profession': ['Warrior', 'Ranger'], 'attributes': [{'level': '14...16', 'name': 'Tactics'}], 'skills_used': ['Troll Unguent', 'Endure Pain', 'Triple Chop', 'Distracting Shot', 'Healing Spring', "Protector's Defense", "Bull's Strike", '"Watch Yourself!"', 'Barrage', 'Healing Signet', 'Seeking Blade', 'Cyclone Axe', 'Lightning Touch', "Dryder's Defenses", 'Dancing Daggers', 'Dark Prison', 'Dismember', 'Gash', 'Crippling Slash', 'Poison Tip Signet', "Lion's Comfort", 'Splinter Weapon'], 'armor_levels': {}, 'items_dropped': []},
-    111: {'name': 'Zaishen Representative', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    216: {'name': 'Canthan Ambassador', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', 'Healing Signet', 'Seeking Blade'], 'armor_levels': {}, 'items_dropped': []},
-    218: {'name': 'Priest of Balthazar', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    219: {'name': 'Tolkano', 'profession': ['Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    220: {'name': 'Xunlai Agent', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    221: {'name': 'Xunlai Agent', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3287: {'name': 'Xunlai Agent', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    224: {'name': 'Vabbian Commoner', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    5659: {'name': 'Vabbian Commoner', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    5662: {'name': 'Vabbian Commoner', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    5661: {'name': 'Vabbian Commoner', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    5653: {'name': 'Vabbian Commoner', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    5656: {'name': 'Vabbian Commoner', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    5657: {'name': 'Vabbian Commoner', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    1202: {'name': 'Projects/NPC models/Humans/Vabbians', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1338: {'name': "Abaddon's Cursed", 'profession': ['Elementalist', 'Necromancer'], 'attributes': [{'level': '16', 'name': 'Fire Magic'}, {'level': '16', 'name': 'Blood Magic'}], 'skills_used': ['Unholy Feast', 'Vampiric Touch', 'Soul Taker', 'Over the Limit', 'Phoenix', 'Lava Font', 'Conjure Flame'], 'armor_levels': {}, 'items_dropped': []},
-    1342: {'name': 'Lynx', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    8029: {'name': 'Lynx', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1343: {'name': 'Moa Bird', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1345: {'name': "Melandru's Stalker", 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1346: {'name': 'Wolf', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1347: {'name': 'Warthog', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1348: {'name': 'Warthog', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1349: {'name': 'Black Bear', 'profession': [], 'attributes': [{'level': 'A level 3 Black Bear can be found in', 'name': 'pre-Searing Ascalon'}], 'skills_used': ['Brutal Mauling', 'Breaking Charm'], 'armor_levels': {}, 'items_dropped': ['Bear Pelt', 'Ascalon (pre-Searing)']},
-    1352: {'name': 'Black Bear', 'profession': [], 'attributes': [{'level': 'A level 3 Black Bear can be found in', 'name': 'pre-Searing Ascalon'}], 'skills_used': ['Brutal Mauling', 'Breaking Charm'], 'armor_levels': {}, 'items_dropped': ['Bear Pelt', 'Ascalon (pre-Searing)']},
-    1351: {'name': 'Dune Lizard', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1354: {'name': 'Moss Spider', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2316: {'name': 'Moss Spider', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1393: {'name': 'Moa Bird', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1344: {'name': 'Moa Bird', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1399: {'name': 'Prize-Winning Hog', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1401: {'name': 'Giant Needle Spider', 'profession': ['Ranger'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': ['Spider Leg', 'Spider Web']},
-    1402: {'name': 'Deadly Crypt Spider', 'profession': ['Ranger'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': ['Spider Leg', 'Spider Web']},
-    1403: {'name': 'Giant Tree Spider', 'profession': ['Ranger'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': ['Spider Leg', 'Spider Web']},
-    1405: {'name': 'Carrion Devourer', 'profession': ['Warrior'], 'attributes': [{'level': 'Level\xa0?:20', 'name': 'energy'}], 'skills_used': ['Skull Crack', 'Power Attack', 'Dismember', 'Endure Pain', 'Flurry', 'Cleave'], 'armor_levels': {'Blunt damage': '37', 'Piercing damage': '37', 'Slashing damage': '37', 'Cold damage': '20', 'Earth damage': '40', 'Fire damage': '40', 'Lightning damage': '40'}, 'items_dropped': ['Dull Carapace']},
-    1406: {'name': 'Snapping Devourer', 'profession': ['Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': ['Dull Carapace']},
-    1408: {'name': 'Diseased Devourer', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': ['Dull Carapace']},
-    1409: {'name': 'Lash Devourer', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': ['Dull Carapace']},
-    1412: {'name': 'Ice Elemental', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Swirling Aura', 'Glowing Ice', 'Aura of Restoration', 'Shard Storm', 'Elemental Attunement', 'Deep Freeze'], 'armor_levels': {}, 'items_dropped': []},
-    1414: {'name': 'Stone Elemental', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Ward Against Melee', 'Eruption', 'Earthquake'], 'armor_levels': {'Blunt damage': '18 (60)', 'Piercing damage': '18 (60)', 'Slashing damage': '18 (60)', 'Cold damage': '18 (60)', 'Earth damage': '18 (60)', 'Fire damage': '18 (60)', 'Lightning damage': '58 (60)'}, 'items_dropped': ['Enchanted Lodestone']},
-    1415: {'name': 'Hulking Stone Elemental', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Crude Swing', "Warrior's Endurance"], 'armor_levels': {'Blunt damage': '3', 'Piercing damage': '43', 'Slashing damage': '43', 'Cold damage': '43', 'Earth damage': '43', 'Fire damage': '43', 'Lightning damage': '43'}, 'items_dropped': ['Enchanted Lodestone']},
-    1417: {'name': 'Gargoyle', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1418: {'name': 'Shatter Gargoyle', 'profession': ['Mesmer'], 'attributes': [{'level': '3', 'name': 'Domination Magic'}], 'skills_used': ['Backfire', 'Echo', 'Energy Tap', 'Conjure Phantasm', 'Imagined Burden', 'Crippling Anguish', 'Energy Burn'], 'armor_levels': {'Blunt damage': '18', 'Piercing damage': '18', 'Slashing damage': '18', 'Cold damage': '18', 'Earth damage': '18', 'Fire damage': '18', 'Lightning damage': '58'}, 'items_dropped': ['Gargoyle Skull']},
-    2445: {'name': 'Shatter Gargoyle', 'profession': ['Mesmer'], 'attributes': [{'level': '3', 'name': 'Domination Magic'}], 'skills_used': ['Backfire', 'Echo', 'Energy Tap', 'Conjure Phantasm', 'Imagined Burden', 'Crippling Anguish', 'Energy Burn'], 'armor_levels': {'Blunt damage': '18', 'Piercing damage': '18', 'Slashing damage': '18', 'Cold damage': '18', 'Earth damage': '18', 'Fire damage': '18', 'Lightning damage': '58'}, 'items_dropped': ['Gargoyle Skull']},
-    1420: {'name': 'Bandit Firestarter', 'profession': ['Elementalist'], 'attributes': [{'level': '0', 'name': 'Fire Magic'}], 'skills_used': ['Mark of Rodgort', 'Phoenix', 'Flare'], 'armor_levels': {}, 'items_dropped': ['Worn Belt']},
-    1421: {'name': 'Bandit Raider', 'profession': ['Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': ['Worn Belt']},
-    1422: {'name': 'Bandit Blood Sworn', 'profession': ['Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': ['Worn Belt']},
-    1424: {'name': 'Nightmare', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1426: {'name': 'Aloe Husk', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Shielding Hands', 'Healing Breeze'], 'armor_levels': {}, 'items_dropped': ['Unnatural Seed']},
-    1427: {'name': 'Large Aloe Seed', 'profession': ['Monk'], 'attributes': [{'level': '0', 'name': 'Protection Prayers'}], 'skills_used': ['Shielding Hands', 'Healing Breeze'], 'armor_levels': {}, 'items_dropped': ['Aloe Root', 'Unnatural Seed']},
-    1428: {'name': 'Aloe Seed', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Orison of Healing', 'Healing Breeze'], 'armor_levels': {}, 'items_dropped': ['Unnatural Seed']},
-    1429: {'name': 'Oakheart', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1733: {'name': 'Oakheart', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1430: {'name': 'River Skale', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': ['Skale Fin']},
-    1431: {'name': 'Skale Broodcaller', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': ['Skale Fin']},
-    1432: {'name': 'River Skale Tad', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': ['Skale Fin']},
-    1436: {'name': 'Grawl Invader', 'profession': ['Ranger'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': ['Grawl Longspear Gear', 'Grawl Necklace']},
-    1437: {'name': 'Grawl Longspear', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Precision Shot', 'Apply Poison'], 'armor_levels': {}, 'items_dropped': ['Grawl Longspear Gear', 'Grawl Necklace', 'Ornate Grawl Necklace']},
-    1438: {'name': 'Grawl Shaman', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Infuse Health', 'Heal Area'], 'armor_levels': {}, 'items_dropped': ['Grawl Necklace', 'Grawl Shaman Gear']},
-    1448: {'name': 'Red Eye the Unholy', 'profession': ['Necromancer'], 'attributes': [{'level': '0', 'name': 'Blood Magic'}, {'level': '6', 'name': 'Curses'}, {'level': '10', 'name': 'Soul Reaping'}], 'skills_used': ['Life Siphon', 'Mark of Pain', 'Faintheartedness'], 'armor_levels': {}, 'items_dropped': ['Ash Fiend Trappings', 'Charr Bag', 'unique', 'pre-Searing', 'Charr Carving', 'Charr Hide', 'Charr Salvage Kit']},
-    1449: {'name': 'Jaw Smokeskin', 'profession': ['Elementalist'], 'attributes': [{'level': '9', 'name': 'Fire Magic'}], 'skills_used': ['Aura of Restoration', 'Conjure Flame', 'Lava Font', 'Flare'], 'armor_levels': {}, 'items_dropped': ['Charr Bag', 'unique', 'Charr Carving', 'Charr Hide', 'Charr Salvage Kit', 'Flame Wielder Trappings']},
-    1450: {'name': 'Blaze Bloodbane', 'profession': ['Monk'], 'attributes': [{'level': '6', 'name': 'Healing Prayers'}, {'level': '10', 'name': 'Smiting Prayers'}], 'skills_used': ['Infuse Health', 'Heal Area', 'Bane Signet', 'Banish'], 'armor_levels': {}, 'items_dropped': ['Charr Bag', 'unique', 'Charr Carving', 'Charr Hide', 'Charr Salvage Kit', 'Shaman Garb']},
-    1455: {'name': 'Haversdan', 'profession': ['Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1456: {'name': 'Warmaster Tydus', 'profession': ['Ranger'], 'attributes': [{'level': '9', 'name': 'Expertise'}], 'skills_used': ['Screaming Shot', 'Savage Shot', 'Troll Unguent', 'Burning Arrow', 'Apply Poison', 'Distracting Shot'], 'armor_levels': {}, 'items_dropped': []},
-    2856: {'name': 'Warmaster Tydus', 'profession': ['Ranger'], 'attributes': [{'level': '9', 'name': 'Expertise'}], 'skills_used': ['Screaming Shot', 'Savage Shot', 'Troll Unguent', 'Burning Arrow', 'Apply Poison', 'Distracting Shot'], 'armor_levels': {}, 'items_dropped': []},
-    2097: {'name': 'Warmaster Tydus', 'profession': ['Ranger'], 'attributes': [{'level': '9', 'name': 'Expertise'}], 'skills_used': ['Screaming Shot', 'Savage Shot', 'Troll Unguent', 'Burning Arrow', 'Apply Poison', 'Distracting Shot'], 'armor_levels': {}, 'items_dropped': []},
-    1461: {'name': 'Projects/NPC models/Humans/Ascalon', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2083: {'name': 'Projects/NPC models/Humans/Ascalon', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1464: {'name': 'Ascalonian Guard', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Shield Stance'], 'armor_levels': {}, 'items_dropped': []},
-    2091: {'name': 'Ascalonian Guard', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Shield Stance'], 'armor_levels': {}, 'items_dropped': []},
-    1466: {'name': 'Projects/NPC models/Humans/Ascalon', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1644: {'name': 'Projects/NPC models/Humans/Ascalon', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1467: {'name': 'Projects/NPC models/Humans/Ascalon', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1480: {'name': 'Projects/NPC models/Humans/Ascalon', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2090: {'name': 'Projects/NPC models/Humans/Ascalon', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1468: {'name': 'Projects/NPC models/Humans/Ascalon', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1469: {'name': 'Projects/NPC models/Humans/Ascalon', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1470: {'name': 'Projects/NPC models/Humans/Ascalon', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1471: {'name': 'Ralena Stormbringer', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1474: {'name': 'Projects/NPC models/Humans/Ascalon', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1475: {'name': 'Projects/NPC models/Humans/Ascalon', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1477: {'name': 'Ascalon Guard', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Shield Stance'], 'armor_levels': {}, 'items_dropped': []},
-    7758: {'name': 'Ascalon Guard', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Shield Stance'], 'armor_levels': {}, 'items_dropped': []},
-    1479: {'name': 'Ascalonian Farmer', 'profession': [], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    2070: {'name': 'Ascalonian Farmer', 'profession': [], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    1482: {'name': 'Projects/NPC models/Humans/Ascalon', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1483: {'name': 'Academy Monk', 'profession': ['Monk'], 'attributes': [{'level': '6', 'name': 'Divine Favor'}, {'level': '7', 'name': 'Healing Prayers'}], 'skills_used': ['Heal Other', 'Orison of Healing'], 'armor_levels': {}, 'items_dropped': []},
-    1484: {'name': 'Academy Monk', 'profession': ['Monk'], 'attributes': [{'level': '6', 'name': 'Divine Favor'}, {'level': '7', 'name': 'Healing Prayers'}], 'skills_used': ['Heal Other', 'Orison of Healing'], 'armor_levels': {}, 'items_dropped': []},
-    6028: {'name': 'Academy Monk', 'profession': ['Monk'], 'attributes': [{'level': '6', 'name': 'Divine Favor'}, {'level': '7', 'name': 'Healing Prayers'}], 'skills_used': ['Heal Other', 'Orison of Healing'], 'armor_levels': {}, 'items_dropped': []},
-    1485: {'name': 'Ascalonian Townsfolk', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1487: {'name': 'Ascalonian Townsfolk', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1488: {'name': 'Ascalonian Peasant', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    1490: {'name': 'Ascalonian Peasant', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    1492: {'name': 'Krytan', 'profession': ['Warrior', 'Ranger', 'Monk'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Mend Ailment', 'Banish', 'Healing Signet', 'Signet of Judgment', 'Castigation Signet', 'Lightning Reflexes', 'Shielding Hands', "Melandru's Arrows", 'Penetrating Attack', 'Poison Tip Signet', 'Signet of Rage', 'Spear of Light', "Marauder's Shot"], 'armor_levels': {}, 'items_dropped': []},
-    1960: {'name': 'Krytan', 'profession': ['Warrior', 'Ranger', 'Monk'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Mend Ailment', 'Banish', 'Healing Signet', 'Signet of Judgment', 'Castigation Signet', 'Lightning Reflexes', 'Shielding Hands', "Melandru's Arrows", 'Penetrating Attack', 'Poison Tip Signet', 'Signet of Rage', 'Spear of Light', "Marauder's Shot"], 'armor_levels': {}, 'items_dropped': []},
-    1964: {'name': 'Krytan', 'profession': ['Warrior', 'Ranger', 'Monk'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Mend Ailment', 'Banish', 'Healing Signet', 'Signet of Judgment', 'Castigation Signet', 'Lightning Reflexes', 'Shielding Hands', "Melandru's Arrows", 'Penetrating Attack', 'Poison Tip Signet', 'Signet of Rage', 'Spear of Light', "Marauder's Shot"], 'armor_levels': {}, 'items_dropped': []},
-    1966: {'name': 'Krytan', 'profession': ['Warrior', 'Ranger', 'Monk'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Mend Ailment', 'Banish', 'Healing Signet', 'Signet of Judgment', 'Castigation Signet', 'Lightning Reflexes', 'Shielding Hands', "Melandru's Arrows", 'Penetrating Attack', 'Poison Tip Signet', 'Signet of Rage', 'Spear of Light', "Marauder's Shot"], 'armor_levels': {}, 'items_dropped': []},
-    1967: {'name': 'Krytan', 'profession': ['Warrior', 'Ranger', 'Monk'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Mend Ailment', 'Banish', 'Healing Signet', 'Signet of Judgment', 'Castigation Signet', 'Lightning Reflexes', 'Shielding Hands', "Melandru's Arrows", 'Penetrating Attack', 'Poison Tip Signet', 'Signet of Rage', 'Spear of Light', "Marauder's Shot"], 'armor_levels': {}, 'items_dropped': []},
-    1991: {'name': 'Krytan', 'profession': ['Warrior', 'Ranger', 'Monk'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Mend Ailment', 'Banish', 'Healing Signet', 'Signet of Judgment', 'Castigation Signet', 'Lightning Reflexes', 'Shielding Hands', "Melandru's Arrows", 'Penetrating Attack', 'Poison Tip Signet', 'Signet of Rage', 'Spear of Light', "Marauder's Shot"], 'armor_levels': {}, 'items_dropped': []},
-    2008: {'name': 'Krytan', 'profession': ['Warrior', 'Ranger', 'Monk'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Mend Ailment', 'Banish', 'Healing Signet', 'Signet of Judgment', 'Castigation Signet', 'Lightning Reflexes', 'Shielding Hands', "Melandru's Arrows", 'Penetrating Attack', 'Poison Tip Signet', 'Signet of Rage', 'Spear of Light', "Marauder's Shot"], 'armor_levels': {}, 'items_dropped': []},
-    2009: {'name': 'Krytan', 'profession': ['Warrior', 'Ranger', 'Monk'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Mend Ailment', 'Banish', 'Healing Signet', 'Signet of Judgment', 'Castigation Signet', 'Lightning Reflexes', 'Shielding Hands', "Melandru's Arrows", 'Penetrating Attack', 'Poison Tip Signet', 'Signet of Rage', 'Spear of Light', "Marauder's Shot"], 'armor_levels': {}, 'items_dropped': []},
-    2020: {'name': 'Krytan', 'profession': ['Warrior', 'Ranger', 'Monk'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Mend Ailment', 'Banish', 'Healing Signet', 'Signet of Judgment', 'Castigation Signet', 'Lightning Reflexes', 'Shielding Hands', "Melandru's Arrows", 'Penetrating Attack', 'Poison Tip Signet', 'Signet of Rage', 'Spear of Light', "Marauder's Shot"], 'armor_levels': {}, 'items_dropped': []},
-    2032: {'name': 'Krytan', 'profession': ['Warrior', 'Ranger', 'Monk'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Mend Ailment', 'Banish', 'Healing Signet', 'Signet of Judgment', 'Castigation Signet', 'Lightning Reflexes', 'Shielding Hands', "Melandru's Arrows", 'Penetrating Attack', 'Poison Tip Signet', 'Signet of Rage', 'Spear of Light', "Marauder's Shot"], 'armor_levels': {}, 'items_dropped': []},
-    2049: {'name': 'Krytan', 'profession': ['Warrior', 'Ranger', 'Monk'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Mend Ailment', 'Banish', 'Healing Signet', 'Signet of Judgment', 'Castigation Signet', 'Lightning Reflexes', 'Shielding Hands', "Melandru's Arrows", 'Penetrating Attack', 'Poison Tip Signet', 'Signet of Rage', 'Spear of Light', "Marauder's Shot"], 'armor_levels': {}, 'items_dropped': []},
-    2120: {'name': 'Krytan', 'profession': ['Warrior', 'Ranger', 'Monk'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Mend Ailment', 'Banish', 'Healing Signet', 'Signet of Judgment', 'Castigation Signet', 'Lightning Reflexes', 'Shielding Hands', "Melandru's Arrows", 'Penetrating Attack', 'Poison Tip Signet', 'Signet of Rage', 'Spear of Light', "Marauder's Shot"], 'armor_levels': {}, 'items_dropped': []},
-    2858: {'name': 'Krytan', 'profession': ['Warrior', 'Ranger', 'Monk'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Mend Ailment', 'Banish', 'Healing Signet', 'Signet of Judgment', 'Castigation Signet', 'Lightning Reflexes', 'Shielding Hands', "Melandru's Arrows", 'Penetrating Attack', 'Poison Tip Signet', 'Signet of Rage', 'Spear of Light', "Marauder's Shot"], 'armor_levels': {}, 'items_dropped': []},
-    2867: {'name': 'Krytan', 'profession': ['Warrior', 'Ranger', 'Monk'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Mend Ailment', 'Banish', 'Healing Signet', 'Signet of Judgment', 'Castigation Signet', 'Lightning Reflexes', 'Shielding Hands', "Melandru's Arrows", 'Penetrating Attack', 'Poison Tip Signet', 'Signet of Rage', 'Spear of Light', "Marauder's Shot"], 'armor_levels': {}, 'items_dropped': []},
-    2869: {'name': 'Krytan', 'profession': ['Warrior', 'Ranger', 'Monk'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Mend Ailment', 'Banish', 'Healing Signet', 'Signet of Judgment', 'Castigation Signet', 'Lightning Reflexes', 'Shielding Hands', "Melandru's Arrows", 'Penetrating Attack', 'Poison Tip Signet', 'Signet of Rage', 'Spear of Light', "Marauder's Shot"], 'armor_levels': {}, 'items_dropped': []},
-    2095: {'name': 'Krytan', 'profession': ['Warrior', 'Ranger', 'Monk'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Mend Ailment', 'Banish', 'Healing Signet', 'Signet of Judgment', 'Castigation Signet', 'Lightning Reflexes', 'Shielding Hands', "Melandru's Arrows", 'Penetrating Attack', 'Poison Tip Signet', 'Signet of Rage', 'Spear of Light', "Marauder's Shot"], 'armor_levels': {}, 'items_dropped': []},
-    1493: {'name': 'Gwen', 'profession': ['Mesmer'], 'attributes': [{'level': '12', 'name': 'Domination Magic'}, {'level': '6', 'name': 'Fast Casting'}, {'level': '11', 'name': 'Inspiration Magic'}], 'skills_used': ["Wastrel's Demise", 'Hide', 'Spiritual Pain', 'Shatter Enchantment', 'Energy Burn', 'Distortion (Gwen)', 'Power Spike', 'Flee', "Wastrel's Worry", 'Throw Rock', 'Hex Breaker', 'Ether Feast', 'Diversion', 'Feign Death', 'Shared Burden (Gwen)', 'Signet of Midnight', 'Resurrection Signet', 'Cry of Frustration', 'Power Drain', 'Leech Signet', 'Sum of All Fears (Gwen)', 'Illusion of Haste'], 'armor_levels': {}, 'items_dropped': []},
-    1494: {'name': 'Gwen', 'profession': ['Mesmer'], 'attributes': [{'level': '12', 'name': 'Domination Magic'}, {'level': '6', 'name': 'Fast Casting'}, {'level': '11', 'name': 'Inspiration Magic'}], 'skills_used': ["Wastrel's Demise", 'Hide', 'Spiritual Pain', 'Shatter Enchantment', 'Energy Burn', 'Distortion (Gwen)', 'Power Spike', 'Flee', "Wastrel's Worry", 'Throw Rock', 'Hex Breaker', 'Ether Feast', 'Diversion', 'Feign Death', 'Shared Burden (Gwen)', 'Signet of Midnight', 'Resurrection Signet', 'Cry of Frustration', 'Power Drain', 'Leech Signet', 'Sum of All Fears (Gwen)', 'Illusion of Haste'], 'armor_levels': {}, 'items_dropped': []},
-    5966: {'name': 'Gwen', 'profession': ['Mesmer'], 'attributes': [{'level': '12', 'name': 'Domination Magic'}, {'level': '6', 'name': 'Fast Casting'}, {'level': '11', 'name': 'Inspiration Magic'}], 'skills_used': ["Wastrel's Demise", 'Hide', 'Spiritual Pain', 'Shatter Enchantment', 'Energy Burn', 'Distortion (Gwen)', 'Power Spike', 'Flee', "Wastrel's Worry", 'Throw Rock', 'Hex Breaker', 'Ether Feast', 'Diversion', 'Feign Death', 'Shared Burden (Gwen)', 'Signet of Midnight', 'Resurrection Signet', 'Cry of Frustration', 'Power Drain', 'Leech Signet', 'Sum of All Fears (Gwen)', 'Illusion of Haste'], 'armor_levels': {}, 'items_dropped': []},
-    5970: {'name': 'Gwen', 'profession': ['Mesmer'], 'attributes': [{'level': '12', 'name': 'Domination Magic'}, {'level': '6', 'name': 'Fast Casting'}, {'level': '11', 'name': 'Inspiration Magic'}], 'skills_used': ["Wastrel's Demise", 'Hide', 'Spiritual Pain', 'Shatter Enchantment', 'Energy Burn', 'Distortion (Gwen)', 'Power Spike', 'Flee', "Wastrel's Worry", 'Throw Rock', 'Hex Breaker', 'Ether Feast', 'Diversion', 'Feign Death', 'Shared Burden (Gwen)', 'Signet of Midnight', 'Resurrection Signet', 'Cry of Frustration', 'Power Drain', 'Leech Signet', 'Sum of All Fears (Gwen)', 'Illusion of Haste'], 'armor_levels': {}, 'items_dropped': []},
-    1497: {'name': 'Farrah Cappo', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Sever Artery', 'Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    2863: {'name': 'Farrah Cappo', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Sever Artery', 'Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    2138: {'name': 'Farrah Cappo', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Sever Artery', 'Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    1501: {'name': 'Cynn', 'profession': ['Elementalist', 'Paragon'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1924: {'name': 'Cynn', 'profession': ['Elementalist', 'Paragon'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2128: {'name': 'Cynn', 'profession': ['Elementalist', 'Paragon'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2853: {'name': 'Cynn', 'profession': ['Elementalist', 'Paragon'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3489: {'name': 'Cynn', 'profession': ['Elementalist', 'Paragon'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4565: {'name': 'Cynn', 'profession': ['Elementalist', 'Paragon'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4575: {'name': 'Cynn', 'profession': ['Elementalist', 'Paragon'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5988: {'name': 'Cynn', 'profession': ['Elementalist', 'Paragon'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4585: {'name': 'Cynn', 'profession': ['Elementalist', 'Paragon'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1502: {'name': 'Devona', 'profession': ['Warrior', 'Necromancer', 'Assassin'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1932: {'name': 'Devona', 'profession': ['Warrior', 'Necromancer', 'Assassin'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2132: {'name': 'Devona', 'profession': ['Warrior', 'Necromancer', 'Assassin'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2854: {'name': 'Devona', 'profession': ['Warrior', 'Necromancer', 'Assassin'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3492: {'name': 'Devona', 'profession': ['Warrior', 'Necromancer', 'Assassin'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3509: {'name': 'Devona', 'profession': ['Warrior', 'Necromancer', 'Assassin'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4569: {'name': 'Devona', 'profession': ['Warrior', 'Necromancer', 'Assassin'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4579: {'name': 'Devona', 'profession': ['Warrior', 'Necromancer', 'Assassin'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5993: {'name': 'Devona', 'profession': ['Warrior', 'Necromancer', 'Assassin'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4589: {'name': 'Devona', 'profession': ['Warrior', 'Necromancer', 'Assassin'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1504: {'name': 'Projects/NPC models/Humans/Ascalon', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1511: {'name': 'Projects/NPC models/Humans/Ascalon', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1505: {'name': 'Prince Rurik', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Hundred Blades', 'Defensive Stance', 'Knock', 'Healing Signet', 'Endure Pain', 'Stormcaller (skill)'], 'armor_levels': {}, 'items_dropped': []},
-    1507: {'name': 'Lady Althea', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast'], 'armor_levels': {}, 'items_dropped': []},
-    1508: {'name': 'Necromancer Munne', 'profession': ['Necromancer'], 'attributes': [{'level': 'Location:', 'name': 'Sardelac Sanitarium'}], 'skills_used': ['Life Siphon'], 'armor_levels': {}, 'items_dropped': []},
-    1509: {'name': 'Elementalist Aziure', 'profession': ['Elementalist'], 'attributes': [{'level': '6', 'name': 'Water Magic'}], 'skills_used': ['Aura of Restoration', 'Ward Against Harm'], 'armor_levels': {}, 'items_dropped': []},
-    1512: {'name': 'Ascalonian Ranger', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Power Shot', 'Troll Unguent', 'Savage Shot', 'Barrage', 'Dual Shot', 'Read the Wind', 'Penetrating Attack', 'Crippling Shot', 'Pin Down', 'Concussion Shot'], 'armor_levels': {}, 'items_dropped': []},
-    1513: {'name': 'Ascalonian Ranger', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Power Shot', 'Troll Unguent', 'Savage Shot', 'Barrage', 'Dual Shot', 'Read the Wind', 'Penetrating Attack', 'Crippling Shot', 'Pin Down', 'Concussion Shot'], 'armor_levels': {}, 'items_dropped': []},
-    1481: {'name': 'Ascalonian Ranger', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Power Shot', 'Troll Unguent', 'Savage Shot', 'Barrage', 'Dual Shot', 'Read the Wind', 'Penetrating Attack', 'Crippling Shot', 'Pin Down', 'Concussion Shot'], 'armor_levels': {}, 'items_dropped': []},
-    1514: {'name': 'Skullreaver', 'profession': ['Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': ['Dead Bow', 'Sephis Axe', 'Skeletal Limb']},
-    1515: {'name': 'Restless Corpse', 'profession': ['Warrior'], 'attributes': [{'level': 'During', 'name': 'Annihilator 2: Searing Day'}], 'skills_used': ['Hundred Blades', 'Hamstring', 'Pure Strike', 'Sprint'], 'armor_levels': {}, 'items_dropped': ['Bone', 'Decayed Orr Emblem', 'Pile of Glittering Dust', 'Skeletal Limb']},
-    1517: {'name': 'Raging Cadaver', 'profession': ['Necromancer'], 'attributes': [{'level': 'During', 'name': 'Annihilator 2: Searing Day'}], 'skills_used': ['Price of Failure', 'Weaken Armor', 'Deathly Swarm', 'Barbs'], 'armor_levels': {}, 'items_dropped': ['Bone', 'Pile of Glittering Dust', 'Skeletal Limb']},
-    1519: {'name': 'Ventari', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1520: {'name': 'Shining Blade Scout', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Troll Unguent'], 'armor_levels': {}, 'items_dropped': []},
-    1521: {'name': 'Evennia', 'profession': ['Monk'], 'attributes': [{'level': '15', 'name': 'Healing Prayers'}], 'skills_used': ['Heal Other', 'Heal Area', 'Mend Ailment', 'Reversal of Fortune', 'Cure Hex', 'Patient Spirit', 'Word of Healing'], 'armor_levels': {}, 'items_dropped': []},
-    1530: {'name': 'Evennia', 'profession': ['Monk'], 'attributes': [{'level': '15', 'name': 'Healing Prayers'}], 'skills_used': ['Heal Other', 'Heal Area', 'Mend Ailment', 'Reversal of Fortune', 'Cure Hex', 'Patient Spirit', 'Word of Healing'], 'armor_levels': {}, 'items_dropped': []},
-    2841: {'name': 'Evennia', 'profession': ['Monk'], 'attributes': [{'level': '15', 'name': 'Healing Prayers'}], 'skills_used': ['Heal Other', 'Heal Area', 'Mend Ailment', 'Reversal of Fortune', 'Cure Hex', 'Patient Spirit', 'Word of Healing'], 'armor_levels': {}, 'items_dropped': []},
-    1528: {'name': 'Saidra', 'profession': ['Ranger', 'Monk'], 'attributes': [], 'skills_used': ['Heal Area', 'Troll Unguent'], 'armor_levels': {}, 'items_dropped': []},
-    1532: {'name': 'Shining Blade Mesmer', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Mistrust', 'Unnatural Signet', 'Resurrection Signet', 'Cry of Frustration', 'Panic', 'Power Drain', "Wastrel's Worry", 'Waste Not, Want Not'], 'armor_levels': {}, 'items_dropped': []},
-    1533: {'name': 'Shining Blade Necromancer', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Reckless Haste', 'Vampiric Gaze', 'Blood Renewal', 'Price of Failure', 'Resurrection Signet', 'Blood is Power', 'Life Siphon', 'Vampiric Swarm'], 'armor_levels': {}, 'items_dropped': []},
-    1534: {'name': 'Shining Blade Elementalist', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Immolate', 'Flare', 'Aura of Restoration', "Flame Djinn's Haste", 'Savannah Heat', 'Conjure Flame', 'Fire Attunement', 'Meteor Shower', 'Fireball'], 'armor_levels': {}, 'items_dropped': []},
-    1536: {'name': 'Gareth Quickblade', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Distracting Strike', 'Endure Pain', "Warrior's Endurance", "Lion's Comfort", 'Flail', 'Disarm'], 'armor_levels': {}, 'items_dropped': []},
-    1538: {'name': 'Shining Blade Warrior', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ["Lion's Comfort", 'Power Attack', "Soldier's Strike", "Executioner's Strike", 'Shield Stance', 'Healing Signet', 'Endure Pain', 'Disrupting Chop', 'Swift Chop', 'Dismember', 'Cleave'], 'armor_levels': {}, 'items_dropped': []},
-    1996: {'name': 'Shining Blade Warrior', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ["Lion's Comfort", 'Power Attack', "Soldier's Strike", "Executioner's Strike", 'Shield Stance', 'Healing Signet', 'Endure Pain', 'Disrupting Chop', 'Swift Chop', 'Dismember', 'Cleave'], 'armor_levels': {}, 'items_dropped': []},
-    2039: {'name': 'Shining Blade Warrior', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ["Lion's Comfort", 'Power Attack', "Soldier's Strike", "Executioner's Strike", 'Shield Stance', 'Healing Signet', 'Endure Pain', 'Disrupting Chop', 'Swift Chop', 'Dismember', 'Cleave'], 'armor_levels': {}, 'items_dropped': []},
-    1539: {'name': 'Alari Doubleblade', 'profession': ['Ranger', 'Assassin', 'Dervish'], 'attributes': [], 'skills_used': ['Intimidating Aura', 'Troll Unguent', 'Golden Lotus Strike', 'Fox Fangs', 'Smoke Powder Defense', 'Critical Strike', 'Way of Perfection', 'Twisting Fangs', 'Way of the Assassin'], 'armor_levels': {}, 'items_dropped': []},
-    1541: {'name': 'Shining Blade Ranger', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Arcing Shot', 'Power Shot', 'Troll Unguent', 'Magebane Shot', 'Called Shot', 'Lightning Reflexes', 'Antidote Signet', 'Point Blank Shot', 'Apply Poison', 'Distracting Shot'], 'armor_levels': {}, 'items_dropped': []},
-    2045: {'name': 'Shining Blade Ranger', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Arcing Shot', 'Power Shot', 'Troll Unguent', 'Magebane Shot', 'Called Shot', 'Lightning Reflexes', 'Antidote Signet', 'Point Blank Shot', 'Apply Poison', 'Distracting Shot'], 'armor_levels': {}, 'items_dropped': []},
-    1548: {'name': 'Projects/NPC models/Dwarves', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1553: {'name': 'Projects/NPC models/Dwarves', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1555: {'name': 'Projects/NPC models/Dwarves', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1556: {'name': 'Projects/NPC models/Dwarves', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2840: {'name': 'Projects/NPC models/Dwarves', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6180: {'name': 'Projects/NPC models/Dwarves', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6215: {'name': 'Projects/NPC models/Dwarves', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6216: {'name': 'Projects/NPC models/Dwarves', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1554: {'name': 'Dwarven Soldier', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Mighty Blow', 'Wild Blow', 'Healing Signet', 'Staggering Blow', 'Cyclone Axe', 'Distracting Blow', 'Frenzy', 'Dwarven Battle Stance'], 'armor_levels': {}, 'items_dropped': []},
-    1569: {'name': 'Dwarven Soldier', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Mighty Blow', 'Wild Blow', 'Healing Signet', 'Staggering Blow', 'Cyclone Axe', 'Distracting Blow', 'Frenzy', 'Dwarven Battle Stance'], 'armor_levels': {}, 'items_dropped': []},
-    1557: {'name': 'Projects/NPC models/Dwarves', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1558: {'name': 'Projects/NPC models/Dwarves', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6271: {'name': 'Projects/NPC models/Dwarves', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1562: {'name': 'King Jalis Ironhammer', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Mighty Blow', '"To the Limit!"', 'Claim Resource', 'Healing Signet', '"I Will Avenge You!"', 'Dwarven Battle Stance', 'Crude Swing'], 'armor_levels': {}, 'items_dropped': []},
-    2839: {'name': 'King Jalis Ironhammer', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Mighty Blow', '"To the Limit!"', 'Claim Resource', 'Healing Signet', '"I Will Avenge You!"', 'Dwarven Battle Stance', 'Crude Swing'], 'armor_levels': {}, 'items_dropped': []},
-    1564: {'name': 'Brechnar Ironhammer', 'profession': ['Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1565: {'name': 'Dwarven Sage', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Shatter Enchantment', 'Crippling Anguish', 'Conjure Phantasm'], 'armor_levels': {}, 'items_dropped': []},
-    1567: {'name': 'Dwarven Scout', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Savage Shot', 'Dual Shot', 'Called Shot', "Tiger's Fury", "Melandru's Arrows"], 'armor_levels': {}, 'items_dropped': []},
-    1635: {'name': 'Charr Chaot', 'profession': ['Mesmer', 'Elementalist'], 'attributes': [{'level': '4', 'name': 'Domination Magic'}], 'skills_used': ['Shell Shock', 'Steam', 'Power Block', 'Glyph of Immolation', 'Shatter Enchantment', 'Shard Storm', 'Blurred Vision', 'Expel Hexes', 'Energy Burn', 'Shatter Hex', 'Drain Enchantment', 'Ice Prison'], 'armor_levels': {'Blunt damage': '26', 'Piercing damage': '26', 'Slashing damage': '26', 'Cold damage': '26', 'Earth damage': '26', 'Fire damage': '26', 'Lightning damage': '26'}, 'items_dropped': ['Charr Carving', 'Charr Hide', 'Mind Spark Garb']},
-    1638: {'name': 'Charr Ashen Claw', 'profession': ['Necromancer'], 'attributes': [{'level': '0', 'name': 'Blood Magic'}, {'level': '3', 'name': 'Curses'}, {'level': '8', 'name': 'Soul Reaping'}, {'level': '16 Curses in', 'name': 'Hard mode'}], 'skills_used': ['Life Siphon', 'Mark of Pain', 'Faintheartedness', 'Lingering Curse'], 'armor_levels': {'Blunt damage': '26', 'Piercing damage': '26', 'Slashing damage': '26', 'Cold damage': '26', 'Earth damage': '26', 'Fire damage': '26', 'Lightning damage': '26'}, 'items_dropped': ['Ash Fiend Trappings', 'Charr Carvings', 'Charr Hides']},
-    1646: {'name': 'Charr Shaman', 'profession': ['Monk', 'Warrior'], 'attributes': [{'level': '0', 'name': 'Healing Prayers'}, {'level': '4', 'name': 'Smiting Prayers'}, {'level': '17 Smiting Prayers in', 'name': 'Hard mode'}], 'skills_used': ['Infuse Health', 'Heal Area', 'Reversal of Fortune', 'Shield of Judgment', 'Holy Veil', 'Castigation Signet', 'Cure Hex', 'Spirit Bond', 'Guardian', 'Patient Spirit', 'Restore Condition', 'Word of Healing', 'Disciplined Stance', 'Bane Signet', 'Banish', 'Signet of Rejuvenation'], 'armor_levels': {'Blunt damage': '23', 'Piercing damage': '23', 'Slashing damage': '23', 'Cold damage': '23', 'Earth damage': '23', 'Fire damage': '23', 'Lightning damage': '23'}, 'items_dropped': ['Charr Carvings', 'Charr Hides', 'Shaman Garb']},
-    5711: {'name': 'Charr Shaman', 'profession': ['Monk', 'Warrior'], 'attributes': [{'level': '0', 'name': 'Healing Prayers'}, {'level': '4', 'name': 'Smiting Prayers'}, {'level': '17 Smiting Prayers in', 'name': 'Hard mode'}], 'skills_used': ['Infuse Health', 'Heal Area', 'Reversal of Fortune', 'Shield of Judgment', 'Holy Veil', 'Castigation Signet', 'Cure Hex', 'Spirit Bond', 'Guardian', 'Patient Spirit', 'Restore Condition', 'Word of Healing', 'Disciplined Stance', 'Bane Signet', 'Banish', 'Signet of Rejuvenation'], 'armor_levels': {'Blunt damage': '23', 'Piercing damage': '23', 'Slashing damage': '23', 'Cold damage': '23', 'Earth damage': '23', 'Fire damage': '23', 'Lightning damage': '23'}, 'items_dropped': ['Charr Carvings', 'Charr Hides', 'Shaman Garb']},
-    4972: {'name': 'Charr Shaman', 'profession': ['Monk', 'Warrior'], 'attributes': [{'level': '0', 'name': 'Healing Prayers'}, {'level': '4', 'name': 'Smiting Prayers'}, {'level': '17 Smiting Prayers in', 'name': 'Hard mode'}], 'skills_used': ['Infuse Health', 'Heal Area', 'Reversal of Fortune', 'Shield of Judgment', 'Holy Veil', 'Castigation Signet', 'Cure Hex', 'Spirit Bond', 'Guardian', 'Patient Spirit', 'Restore Condition', 'Word of Healing', 'Disciplined Stance', 'Bane Signet', 'Banish', 'Signet of Rejuvenation'], 'armor_levels': {'Blunt damage': '23', 'Piercing damage': '23', 'Slashing damage': '23', 'Cold damage': '23', 'Earth damage': '23', 'Fire damage': '23', 'Lightning damage': '23'}, 'items_dropped': ['Charr Carvings', 'Charr Hides', 'Shaman Garb']},
-    1651: {'name': 'Charr Axe Fiend', 'profession': ['Warrior', 'Elementalist'], 'attributes': [], 'skills_used': ["Lion's Comfort", 'Eviscerate', "Executioner's Strike", 'Sprint', 'Disrupting Chop', 'Cyclone Axe', 'Shock', 'Frenzy', 'Dismember', 'Triple Chop', 'Primal Rage'], 'armor_levels': {'Blunt damage': '73 to 75', 'Piercing damage': '73 to 75', 'Slashing damage': '73 to 75', 'Cold damage': '53 to 55', 'Earth damage': '53 to 55', 'Fire damage': '53 to 55', 'Lightning damage': '53 to 55'}, 'items_dropped': ['Axe Fiend Armor', 'Charr Carving', 'Charr Hide']},
-    7802: {'name': 'Charr Axe Fiend', 'profession': ['Warrior', 'Elementalist'], 'attributes': [], 'skills_used': ["Lion's Comfort", 'Eviscerate', "Executioner's Strike", 'Sprint', 'Disrupting Chop', 'Cyclone Axe', 'Shock', 'Frenzy', 'Dismember', 'Triple Chop', 'Primal Rage'], 'armor_levels': {'Blunt damage': '73 to 75', 'Piercing damage': '73 to 75', 'Slashing damage': '73 to 75', 'Cold damage': '53 to 55', 'Earth damage': '53 to 55', 'Fire damage': '53 to 55', 'Lightning damage': '53 to 55'}, 'items_dropped': ['Axe Fiend Armor', 'Charr Carving', 'Charr Hide']},
-    1653: {'name': 'Charr Blade Storm', 'profession': ['Warrior'], 'attributes': [{'level': '(16', 'name': 'Swordsmanship'}], 'skills_used': ['Hundred Blades', 'Wild Blow', 'Frenzy'], 'armor_levels': {'Blunt damage': '73 to 75', 'Piercing damage': '73 to 75', 'Slashing damage': '73 to 75', 'Cold damage': '53 to 55', 'Earth damage': '53 to 55', 'Fire damage': '53 to 55', 'Lightning damage': '53 to 55'}, 'items_dropped': ['Charr Carving', 'Charr Hide', 'Axe Fiend Armor']},
-    1656: {'name': 'Charr Hunter', 'profession': ['Ranger'], 'attributes': [{'level': '5', 'name': 'Wilderness Survival'}], 'skills_used': ['Savage Shot', 'Distracting Shot', 'Resurrection Signet', 'Read the Wind', 'Lightning Reflexes', 'Penetrating Attack', 'Burning Arrow', 'Ignite Arrows', "Hunter's Shot"], 'armor_levels': {'Blunt damage': '41', 'Piercing damage': '41', 'Slashing damage': '41', 'Cold damage': '41', 'Earth damage': '41', 'Fire damage': '41', 'Lightning damage': '41'}, 'items_dropped': ['Charr Carvings', 'Charr Hides', 'Stalker Armor']},
-    1685: {'name': 'Squaw Nimblecrest', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ["Tiger's Fury", 'Troll Unguent', 'Point Blank Shot', 'Read the Wind'], 'armor_levels': {}, 'items_dropped': ['Feathered Caromi Scalp']},
-    1715: {'name': 'Gypsie Ettin', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Earth Shaker', 'Healing Signet', 'Endure Pain', 'Irresistible Blow', 'Balanced Stance'], 'armor_levels': {'Blunt damage': '86', 'Piercing damage': '86', 'Slashing damage': '86', 'Cold damage': '66', 'Earth damage': '66', 'Fire damage': '66', 'Lightning damage': '66'}, 'items_dropped': ['Ettin Hide', "Ettin's Pauldron", 'Hardened Hump']},
-    1724: {'name': 'Hill Giant', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Crushing Blow', 'Stun on Critical Hit', 'Giant Stomp', 'Stun Immunity'], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '80', 'Slashing damage': '80', 'Cold damage': '80', 'Earth damage': '80', 'Fire damage': '60', 'Lightning damage': '80'}, 'items_dropped': ['Gargantuan Jawbone', "Giant's Boots", "Hill Giant's Bracer"]},
-    1725: {'name': 'Inferno Imp', 'profession': ['Elementalist'], 'attributes': [{'level': '12', 'name': 'Fire Magic'}], 'skills_used': ['Immolate', "Rodgort's Invocation", 'Aura of Restoration', 'Incendiary Bonds', 'Elemental Attunement'], 'armor_levels': {'Blunt damage': '34', 'Piercing damage': '34', 'Slashing damage': '34', 'Cold damage': '34', 'Earth damage': '34', 'Fire damage': '64', 'Lightning damage': '34'}, 'items_dropped': ['Glowing Heart', 'Lump of Charcoal', 'Ruby', 'Sapphire', 'Scale']},
-    1726: {'name': 'Fire Imp', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Immolate', "Rodgort's Invocation", 'Inferno'], 'armor_levels': {'Blunt damage': '29', 'Piercing damage': '29', 'Slashing damage': '29', 'Cold damage': '29', 'Earth damage': '29', 'Fire damage': '59', 'Lightning damage': '29'}, 'items_dropped': ['Glowing Heart', 'Lump of Charcoal', 'Ruby', 'Sapphire', 'Scale']},
-    1737: {'name': 'Bog Skale', 'profession': ['Necromancer'], 'attributes': [{'level': '6', 'name': 'Blood Magic'}, {'level': '11', 'name': 'Curses'}, {'level': '8', 'name': 'Soul Reaping'}, {'level': '20 Curses in', 'name': 'Hard mode'}], 'skills_used': ['Price of Failure', 'Spiteful Spirit', 'Life Siphon', 'Demonic Flesh', 'Soul Barbs'], 'armor_levels': {'Blunt damage': '29', 'Piercing damage': '29', 'Slashing damage': '29', 'Cold damage': '59', 'Earth damage': '29', 'Fire damage': '29', 'Lightning damage': '29'}, 'items_dropped': ['Bog Skale Fin', 'Bone', 'Half-Eaten Blob', 'Monstrous Claw', 'Monstrous Fang', 'Scale']},
-    1739: {'name': 'Caromi Tengu Wild', 'profession': ['Mesmer'], 'attributes': [{'level': '10', 'name': 'Illusion Magic'}, {'level': '4', 'name': 'Domination Magic'}, {'level': '16 Domination Magic in', 'name': 'Hard mode'}], 'skills_used': ['Shatter Enchantment', 'Cry of Frustration', 'Conjure Phantasm', 'Ineptitude'], 'armor_levels': {'Blunt damage': '37', 'Piercing damage': '37', 'Slashing damage': '37', 'Cold damage': '37', 'Earth damage': '37', 'Fire damage': '37', 'Lightning damage': '17'}, 'items_dropped': ['Bone', 'Feather', 'Feathered Caromi Scalp', 'Monstrous Claw', 'Monstrous Eye', 'Tengu Robes']},
-    1741: {'name': 'Caromi Tengu Brave', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ["Executioner's Strike", 'Defensive Stance', 'Riposte', 'Swift Chop', 'Galrath Slash', 'Seeking Blade'], 'armor_levels': {'Blunt damage': '90 to 91', 'Piercing damage': '90 to 91', 'Slashing damage': '90 to 91', 'Cold damage': '70 to 71', 'Earth damage': '70 to 71', 'Fire damage': '70 to 71', 'Lightning damage': '50 to 51'}, 'items_dropped': ['Bone', 'Feather', 'Feathered Caromi Scalp', 'Heavy Tengu Armor', 'Monstrous Eye']},
-    1744: {'name': 'Caromi Tengu Brave', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ["Executioner's Strike", 'Defensive Stance', 'Riposte', 'Swift Chop', 'Galrath Slash', 'Seeking Blade'], 'armor_levels': {'Blunt damage': '90 to 91', 'Piercing damage': '90 to 91', 'Slashing damage': '90 to 91', 'Cold damage': '70 to 71', 'Earth damage': '70 to 71', 'Fire damage': '70 to 71', 'Lightning damage': '50 to 51'}, 'items_dropped': ['Bone', 'Feather', 'Feathered Caromi Scalp', 'Heavy Tengu Armor', 'Monstrous Eye']},
-    1746: {'name': 'Caromi Tengu Scout', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ["Tiger's Fury", 'Point Blank Shot', 'Read the Wind', 'Dual Shot'], 'armor_levels': {'Blunt damage': '50', 'Piercing damage': '50', 'Slashing damage': '50', 'Cold damage': '80', 'Earth damage': '80', 'Fire damage': '80', 'Lightning damage': '40'}, 'items_dropped': ['Bone', 'Feather', 'Feathered Caromi Scalp', 'Monstrous Claw', 'Monstrous Eye', 'Tengu Armor']},
-    1754: {'name': 'Trech Schmoogle', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Mantra of Lightning', 'Blackout', 'Ether Feast', 'Illusion of Haste'], 'armor_levels': {}, 'items_dropped': ['Jade Mandible']},
-    1756: {'name': 'Cootle Sizzlehorn', 'profession': ['Necromancer'], 'attributes': [{'level': '14', 'name': 'Blood Magic'}], 'skills_used': ['Vampiric Touch', 'Signet of Agony', 'Vile Touch', 'Plague Touch'], 'armor_levels': {}, 'items_dropped': ['Minotaur Hide', 'Minotaur Horn']},
-    1770: {'name': 'Mina Brillianthaunch', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Heal Other', 'Protective Spirit', 'Reversal of Fortune'], 'armor_levels': {}, 'items_dropped': ['Losaru Mane']},
-    1771: {'name': 'Aguo Gruffmane', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Shield Stance', 'Seeking Blade', 'Sprint', 'Riposte'], 'armor_levels': {}, 'items_dropped': ['Losaru Bladehand Armor', 'Losaru Mane']},
-    1775: {'name': 'Sheg Zamn Mada', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Meteor', 'Stun Immunity', 'Inferno', 'Fireball'], 'armor_levels': {}, 'items_dropped': ['Dessicated Hydra Claw']},
-    1779: {'name': 'Vision of Glint', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1781: {'name': 'Ghostly Hero', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1782: {'name': 'Ghostly Hero', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1785: {'name': 'Storm Kin', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Illusion Magic'}, {'level': '20 Illusion Magic in', 'name': 'Hard mode'}], 'skills_used': ['Shame', 'Power Drain', 'Clumsiness', 'Conjure Phantasm', 'Soothing Images'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Shriveled Eye']},
-    1786: {'name': 'Dune Burrower', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Healing Spring', 'Precision Shot', "Serpent's Quickness", 'Incendiary Arrows', "Hunter's Shot"], 'armor_levels': {'Blunt damage': '76', 'Piercing damage': '76', 'Slashing damage': '76', 'Cold damage': '106', 'Earth damage': '106', 'Fire damage': '106', 'Lightning damage': '106'}, 'items_dropped': ['Dune Burrower Jaw']},
-    1787: {'name': 'Losaru Windcaster', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Domination Magic'}], 'skills_used': ['Backfire', 'Panic', 'Diversion', 'Chaos Storm'], 'armor_levels': {'Blunt damage': '50', 'Piercing damage': '50', 'Slashing damage': '50', 'Cold damage': '70', 'Earth damage': '50', 'Fire damage': '50', 'Lightning damage': '50'}, 'items_dropped': ['Losaru Hide', 'Losaru Mane', 'Losaru Windcaster Robes']},
-    1788: {'name': 'Losaru Lifeband', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Shield of Deflection', 'Heal Other', 'Protective Spirit', 'Reversal of Fortune'], 'armor_levels': {'Blunt damage': '50', 'Piercing damage': '50', 'Slashing damage': '50', 'Cold damage': '70', 'Earth damage': '50', 'Fire damage': '50', 'Lightning damage': '50'}, 'items_dropped': ['Losaru Hide', 'Losaru Lifeband Robes', 'Losaru Mane']},
-    1789: {'name': 'Losaru Bladehand', 'profession': ['Warrior'], 'attributes': [{'level': '12..13', 'name': 'Strength'}, {'level': '15', 'name': 'Tactics'}], 'skills_used': ['Flourish', 'Shield Stance', 'Sprint', 'Seeking Blade', 'Riposte'], 'armor_levels': {'Blunt damage': '106', 'Piercing damage': '106', 'Slashing damage': '106', 'Cold damage': '106', 'Earth damage': '86', 'Fire damage': '86', 'Lightning damage': '86'}, 'items_dropped': ['Losaru Bladehand Armor', 'Losaru Hide', 'Losaru Mane']},
-    1790: {'name': 'Losaru Bowmaster', 'profession': ['Ranger'], 'attributes': [{'level': '(17', 'name': 'Wilderness Survival'}], 'skills_used': ['Read the Wind', 'Storm Chaser', 'Concussion Shot', "Hunter's Shot"], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '100', 'Earth damage': '60', 'Fire damage': '90', 'Lightning damage': '90'}, 'items_dropped': ['Losaru Bowmaster Vest', 'Losaru Hide', 'Losaru Mane']},
-    1791: {'name': 'Sand Elemental', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Earth Magic'}, {'level': '13', 'name': 'Energy Storage'}], 'skills_used': ['Aftershock', 'Shock', 'Eruption', 'Ward Against Foes'], 'armor_levels': {'Blunt damage': '30', 'Piercing damage': '70', 'Slashing damage': '70', 'Cold damage': '70', 'Earth damage': '70', 'Fire damage': '70', 'Lightning damage': '70'}, 'items_dropped': ['Encrusted Lodestone']},
-    1792: {'name': 'Rockshot Devourer', 'profession': ['Ranger'], 'attributes': [{'level': '13', 'name': 'Expertise'}, {'level': '13', 'name': 'Marksmanship'}, {'level': '11', 'name': 'Wilderness Survival'}], 'skills_used': ['Flame Trap', 'Dust Trap', 'Distracting Shot', 'Barrage'], 'armor_levels': {'Blunt damage': '70', 'Piercing damage': '70', 'Slashing damage': '70', 'Cold damage': '100', 'Earth damage': '100', 'Fire damage': '100', 'Lightning damage': '100'}, 'items_dropped': ['Bleached Carapace']},
-    1793: {'name': 'Sand Drake', 'profession': ['Elementalist'], 'attributes': [{'level': '16', 'name': 'Earth Magic'}, {'level': '11', 'name': 'Energy Storage'}], 'skills_used': ['Earth Attunement', 'Stoning', 'Ward Against Melee', 'Earthquake', 'Aftershock'], 'armor_levels': {'Blunt damage': '103', 'Piercing damage': '103', 'Slashing damage': '103', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '83', 'Lightning damage': '83'}, 'items_dropped': ['Topaz Crest']},
-    1794: {'name': 'Desert Griffon', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"I Will Survive!"', 'Final Thrust', 'Healing Signet', 'Berserker Stance'], 'armor_levels': {'Blunt damage': '103', 'Piercing damage': '103', 'Slashing damage': '103', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '83', 'Lightning damage': '83'}, 'items_dropped': ['Feather', 'Iridescent Griffon Wing']},
-    1796: {'name': 'Hydra', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2438: {'name': 'Hydra', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1797: {'name': 'Minotaur', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2493: {'name': 'Minotaur', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2486: {'name': 'Minotaur', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1799: {'name': 'Jade Scarab', 'profession': ['Necromancer'], 'attributes': [{'level': '11', 'name': 'Curses'}, {'level': '15', 'name': 'Death Magic'}, {'level': '13', 'name': 'Soul Reaping'}, {'level': '20 Death Magic in', 'name': 'Hard mode'}], 'skills_used': ['Vile Touch', 'Chilblains', 'Plague Touch', 'Parasitic Bond', 'Feast of Corruption'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Jade Mandible']},
-    1800: {'name': 'Rock-Eater Scarab', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Penetrating Blow', 'Wild Blow', 'Frenzy'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Jade Mandible']},
-    1802: {'name': 'Siege Wurm', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Natural Resistance', 'Wurm Siege (Dunes of Despair)'], 'armor_levels': {'Blunt damage': '160', 'Piercing damage': '160', 'Slashing damage': '160', 'Cold damage': '160', 'Earth damage': '160', 'Fire damage': '160', 'Lightning damage': '160'}, 'items_dropped': ['Bleached Shell']},
-    1803: {'name': 'Sand Giant', 'profession': ['Necromancer'], 'attributes': [{'level': '11', 'name': 'Death Magic'}], 'skills_used': ['Vampiric Touch', 'Vile Touch', 'Stun Immunity', 'Plague Touch', 'Giant Stomp', 'Signet of Agony'], 'armor_levels': {'Blunt damage': '106', 'Piercing damage': '106', 'Slashing damage': '106', 'Cold damage': '86', 'Earth damage': '86', 'Fire damage': '86', 'Lightning damage': '86'}, 'items_dropped': ['Giant Slayers Hammer', "Giant's Boots", 'Massive Jawbone', "Sand Giant's Bracer"]},
-    1810: {'name': 'Marrow Scarab', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Vampiric Touch', 'Well of the Profane', 'Virulence', 'Plague Touch'], 'armor_levels': {'Blunt damage': '66', 'Piercing damage': '66', 'Slashing damage': '66', 'Cold damage': '66', 'Earth damage': '66', 'Fire damage': '66', 'Lightning damage': '66'}, 'items_dropped': []},
-    1811: {'name': 'Scarab Nest Builder', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Flame Trap', 'Dust Trap', 'Distracting Shot', 'Barbed Trap'], 'armor_levels': {'Blunt damage': '66', 'Piercing damage': '66', 'Slashing damage': '66', 'Cold damage': '66', 'Earth damage': '66', 'Fire damage': '66', 'Lightning damage': '66'}, 'items_dropped': []},
-    1835: {'name': 'Ayassah Hess', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Chaos Storm', 'Mantra of Recovery', 'Ethereal Burden', 'Energy Burn'], 'armor_levels': {}, 'items_dropped': ['Illusionist Wrappings']},
-    1836: {'name': 'Byssha Hisst', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Life Siphon', 'Deathly Chill', 'Order of the Vampire', 'Consume Corpse'], 'armor_levels': {}, 'items_dropped': ['Cursebearer Wrappings', 'Forgotten Seal']},
-    1837: {'name': 'Cyss Gresshla', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Stoning', 'Aura of Restoration', 'Kinetic Armor', 'Earthquake', 'Ether Renewal'], 'armor_levels': {}, 'items_dropped': ['Arcanist Wrappings', 'Scale']},
-    1840: {'name': 'Custodian Kora', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Throw Dirt', 'Troll Unguent', "Marksman's Wager", 'Penetrating Attack', 'Concussion Shot'], 'armor_levels': {}, 'items_dropped': []},
-    1841: {'name': 'Goss Aleessh', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Domination Magic'}, {'level': '12', 'name': 'Fast Casting'}, {'level': '20 Fast Casting in', 'name': 'Hard Mode'}], 'skills_used': ['Ether Feast', 'Chaos Storm', 'Mantra of Recovery', 'Ethereal Burden', 'Energy Burn'], 'armor_levels': {}, 'items_dropped': ['Monstrous Claw', 'Monstrous Fang']},
-    1842: {'name': 'Hessper Sasso', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Blood Magic'}, {'level': '15', 'name': 'Death Magic'}], 'skills_used': ['Life Siphon', 'Deathly Chill', 'Order of the Vampire', 'Consume Corpse'], 'armor_levels': {}, 'items_dropped': ['Cursebearer Wrappings']},
-    1843: {'name': 'Issah Sshay', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Stoning', 'Aura of Restoration', 'Kinetic Armor', 'Earthquake', 'Ether Renewal'], 'armor_levels': {}, 'items_dropped': ['Forgotten Seal']},
-    1844: {'name': 'Josso Essher', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Orison of Healing', 'Aegis', 'Vigorous Spirit', 'Word of Healing'], 'armor_levels': {}, 'items_dropped': ['Sage Wrappings']},
-    1845: {'name': 'Custodian Hulgar', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Thrill of Victory', 'Hamstring', 'Endure Pain', "Warrior's Endurance"], 'armor_levels': {}, 'items_dropped': ['Bone', 'Forgotten Seal', 'Scale', 'Seared Breastplate']},
-    1846: {'name': 'Custodian Phebus', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Throw Dirt', 'Troll Unguent', "Marksman's Wager", 'Penetrating Attack', 'Concussion Shot'], 'armor_levels': {}, 'items_dropped': []},
-    1848: {'name': 'Facet of Darkness', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Unholy Feast', "Grenth's Balance", 'Blood Renewal', 'Blood Magic', 'Parasitic Bond'], 'armor_levels': {'Blunt damage': '77', 'Piercing damage': '77', 'Slashing damage': '77', 'Cold damage': '77', 'Earth damage': '77', 'Fire damage': '77', 'Lightning damage': '77'}, 'items_dropped': ['Cursebearer Wrappings', 'Scales']},
-    1853: {'name': 'Tiss Danssir', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Chaos Storm', 'Mantra of Recovery', 'Ethereal Burden', 'Energy Burn'], 'armor_levels': {}, 'items_dropped': ['Forgotten Seal', 'Monstrous Fang']},
-    1854: {'name': 'Uussh Visshta', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Life Siphon', 'Deathly Chill', 'Order of the Vampire', 'Consume Corpse'], 'armor_levels': {}, 'items_dropped': ['Cursebearer Wrappings', 'Forgotten Seal']},
-    1855: {'name': 'Vassa Ssiss', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Stoning', 'Aura of Restoration', 'Kinetic Armor', 'Earthquake', 'Ether Renewal'], 'armor_levels': {}, 'items_dropped': ['Forgotten Seal', 'Scale']},
-    1856: {'name': 'Wissper Inssani', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Orison of Healing', 'Aegis', 'Vigorous Spirit', 'Word of Healing'], 'armor_levels': {}, 'items_dropped': ['Bone']},
-    1857: {'name': 'Custodian Dellus', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Thrill of Victory', 'Hamstring', 'Endure Pain', "Warrior's Endurance"], 'armor_levels': {}, 'items_dropped': ['Forgotten Seal', 'Scale']},
-    1858: {'name': 'Custodian Jenus', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Throw Dirt', 'Troll Unguent', "Marksman's Wager", 'Penetrating Attack', 'Concussion Shot'], 'armor_levels': {}, 'items_dropped': ['Forgotten Seal', 'Scale', 'Seared Armguard']},
-    1862: {'name': 'Forgotten Cursebearer', 'profession': ['Necromancer'], 'attributes': [{'level': '11', 'name': 'Death Magic'}], 'skills_used': ['Deathly Chill', 'Order of the Vampire', 'Consume Corpse', 'Strip Enchantment'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Cursebearer Wrappings', 'Forgotten Seal', 'Scale']},
-    1863: {'name': 'Forgotten Arcanist', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Earth Magic'}, {'level': '12', 'name': 'Energy Storage'}], 'skills_used': ['Stoning', 'Kinetic Armor', 'Earthquake', 'Ether Renewal', 'Stone Daggers'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Arcanist Wrappings', 'Bone', 'Forgotten Seal', 'Monstrous Fang']},
-    1864: {'name': 'Forgotten Sage', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Orison of Healing', 'Vigorous Spirit', 'Restore Life', 'Word of Healing', 'Aegis'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Forgotten Seal', 'Sage Wrappings', 'Scale']},
-    1865: {'name': 'Enchanted Hammer', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1866: {'name': 'Enchanted Sword', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6869: {'name': 'Enchanted Sword', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1867: {'name': 'Enchanted Bow', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1871: {'name': 'Enemy Priest', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Aegis', 'Restore Life', 'Vigorous Spirit', 'Word of Healing'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Forgotten Seal', 'Sage Wrappings', 'Scale']},
-    1872: {'name': 'Forgotten Champion', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Thrill of Victory', 'Hamstring', 'Endure Pain', "Warrior's Endurance"], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '100', 'Slashing damage': '100', 'Cold damage': '80', 'Earth damage': '80', 'Fire damage': '80', 'Lightning damage': '80'}, 'items_dropped': ['Forgotten Seal']},
-    1873: {'name': 'Forgotten Avenger', 'profession': ['Ranger'], 'attributes': [{'level': '15', 'name': 'Marksmanship'}], 'skills_used': ['Throw Dirt', "Marksman's Wager", 'Penetrating Attack', 'Concussion Shot'], 'armor_levels': {}, 'items_dropped': ['Forgotten Seal', 'Seared Armguard', 'Bones']},
-    1874: {'name': 'Forgotten', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5002: {'name': 'Forgotten', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1890: {'name': 'Dunham', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1897: {'name': 'Dunham', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1904: {'name': 'Dunham', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1911: {'name': 'Dunham', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1919: {'name': 'Dunham', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1920: {'name': 'Dunham', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2847: {'name': 'Dunham', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1891: {'name': 'Claude', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1898: {'name': 'Claude', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1905: {'name': 'Claude', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1912: {'name': 'Claude', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1921: {'name': 'Claude', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2848: {'name': 'Claude', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1892: {'name': 'Orion', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Fire Magic'}], 'skills_used': ['Fire Storm', 'Flare', 'Aura of Restoration', 'Mark of Rodgort', 'Elemental Attunement', 'Fire Attunement'], 'armor_levels': {}, 'items_dropped': []},
-    1899: {'name': 'Orion', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Fire Magic'}], 'skills_used': ['Fire Storm', 'Flare', 'Aura of Restoration', 'Mark of Rodgort', 'Elemental Attunement', 'Fire Attunement'], 'armor_levels': {}, 'items_dropped': []},
-    1906: {'name': 'Orion', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Fire Magic'}], 'skills_used': ['Fire Storm', 'Flare', 'Aura of Restoration', 'Mark of Rodgort', 'Elemental Attunement', 'Fire Attunement'], 'armor_levels': {}, 'items_dropped': []},
-    1913: {'name': 'Orion', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Fire Magic'}], 'skills_used': ['Fire Storm', 'Flare', 'Aura of Restoration', 'Mark of Rodgort', 'Elemental Attunement', 'Fire Attunement'], 'armor_levels': {}, 'items_dropped': []},
-    1923: {'name': 'Orion', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Fire Magic'}], 'skills_used': ['Fire Storm', 'Flare', 'Aura of Restoration', 'Mark of Rodgort', 'Elemental Attunement', 'Fire Attunement'], 'armor_levels': {}, 'items_dropped': []},
-    2849: {'name': 'Orion', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Fire Magic'}], 'skills_used': ['Fire Storm', 'Flare', 'Aura of Restoration', 'Mark of Rodgort', 'Elemental Attunement', 'Fire Attunement'], 'armor_levels': {}, 'items_dropped': []},
-    1885: {'name': 'Orion', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Fire Magic'}], 'skills_used': ['Fire Storm', 'Flare', 'Aura of Restoration', 'Mark of Rodgort', 'Elemental Attunement', 'Fire Attunement'], 'armor_levels': {}, 'items_dropped': []},
-    1879: {'name': 'Orion', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Fire Magic'}], 'skills_used': ['Fire Storm', 'Flare', 'Aura of Restoration', 'Mark of Rodgort', 'Elemental Attunement', 'Fire Attunement'], 'armor_levels': {}, 'items_dropped': []},
-    1875: {'name': 'Orion', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Fire Magic'}], 'skills_used': ['Fire Storm', 'Flare', 'Aura of Restoration', 'Mark of Rodgort', 'Elemental Attunement', 'Fire Attunement'], 'armor_levels': {}, 'items_dropped': []},
-    1893: {'name': 'Alesia', 'profession': ['Monk', 'Warrior'], 'attributes': [{'level': '2', 'name': 'Divine Favor'}, {'level': '4', 'name': 'Healing Prayers'}], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1900: {'name': 'Alesia', 'profession': ['Monk', 'Warrior'], 'attributes': [{'level': '2', 'name': 'Divine Favor'}, {'level': '4', 'name': 'Healing Prayers'}], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1907: {'name': 'Alesia', 'profession': ['Monk', 'Warrior'], 'attributes': [{'level': '2', 'name': 'Divine Favor'}, {'level': '4', 'name': 'Healing Prayers'}], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1914: {'name': 'Alesia', 'profession': ['Monk', 'Warrior'], 'attributes': [{'level': '2', 'name': 'Divine Favor'}, {'level': '4', 'name': 'Healing Prayers'}], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1925: {'name': 'Alesia', 'profession': ['Monk', 'Warrior'], 'attributes': [{'level': '2', 'name': 'Divine Favor'}, {'level': '4', 'name': 'Healing Prayers'}], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2850: {'name': 'Alesia', 'profession': ['Monk', 'Warrior'], 'attributes': [{'level': '2', 'name': 'Divine Favor'}, {'level': '4', 'name': 'Healing Prayers'}], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1886: {'name': 'Alesia', 'profession': ['Monk', 'Warrior'], 'attributes': [{'level': '2', 'name': 'Divine Favor'}, {'level': '4', 'name': 'Healing Prayers'}], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1880: {'name': 'Alesia', 'profession': ['Monk', 'Warrior'], 'attributes': [{'level': '2', 'name': 'Divine Favor'}, {'level': '4', 'name': 'Healing Prayers'}], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1876: {'name': 'Alesia', 'profession': ['Monk', 'Warrior'], 'attributes': [{'level': '2', 'name': 'Divine Favor'}, {'level': '4', 'name': 'Healing Prayers'}], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1894: {'name': 'Little Thom', 'profession': ['Warrior', 'Elementalist'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1901: {'name': 'Little Thom', 'profession': ['Warrior', 'Elementalist'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1908: {'name': 'Little Thom', 'profession': ['Warrior', 'Elementalist'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1916: {'name': 'Little Thom', 'profession': ['Warrior', 'Elementalist'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1929: {'name': 'Little Thom', 'profession': ['Warrior', 'Elementalist'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1930: {'name': 'Little Thom', 'profession': ['Warrior', 'Elementalist'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2844: {'name': 'Little Thom', 'profession': ['Warrior', 'Elementalist'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1895: {'name': 'Stefan', 'profession': ['Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1902: {'name': 'Stefan', 'profession': ['Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1909: {'name': 'Stefan', 'profession': ['Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1917: {'name': 'Stefan', 'profession': ['Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1931: {'name': 'Stefan', 'profession': ['Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2845: {'name': 'Stefan', 'profession': ['Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1888: {'name': 'Stefan', 'profession': ['Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1881: {'name': 'Stefan', 'profession': ['Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1877: {'name': 'Stefan', 'profession': ['Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1896: {'name': 'Reyna', 'profession': ['Ranger'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1903: {'name': 'Reyna', 'profession': ['Ranger'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1910: {'name': 'Reyna', 'profession': ['Ranger'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1918: {'name': 'Reyna', 'profession': ['Ranger'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1933: {'name': 'Reyna', 'profession': ['Ranger'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2846: {'name': 'Reyna', 'profession': ['Ranger'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1889: {'name': 'Reyna', 'profession': ['Ranger'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1882: {'name': 'Reyna', 'profession': ['Ranger'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1878: {'name': 'Reyna', 'profession': ['Ranger'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1915: {'name': 'Lina', 'profession': ['Monk', 'Assassin'], 'attributes': [{'level': '8', 'name': 'Divine Favor'}, {'level': '6', 'name': 'Healing Prayers'}, {'level': '10', 'name': 'Protection Prayers'}], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1927: {'name': 'Lina', 'profession': ['Monk', 'Assassin'], 'attributes': [{'level': '8', 'name': 'Divine Favor'}, {'level': '6', 'name': 'Healing Prayers'}, {'level': '10', 'name': 'Protection Prayers'}], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1928: {'name': 'Lina', 'profession': ['Monk', 'Assassin'], 'attributes': [{'level': '8', 'name': 'Divine Favor'}, {'level': '6', 'name': 'Healing Prayers'}, {'level': '10', 'name': 'Protection Prayers'}], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2851: {'name': 'Lina', 'profession': ['Monk', 'Assassin'], 'attributes': [{'level': '8', 'name': 'Divine Favor'}, {'level': '6', 'name': 'Healing Prayers'}, {'level': '10', 'name': 'Protection Prayers'}], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5991: {'name': 'Lina', 'profession': ['Monk', 'Assassin'], 'attributes': [{'level': '8', 'name': 'Divine Favor'}, {'level': '6', 'name': 'Healing Prayers'}, {'level': '10', 'name': 'Protection Prayers'}], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1922: {'name': 'Eve', 'profession': ['Necromancer', 'Mesmer'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2873: {'name': 'Eve', 'profession': ['Necromancer', 'Mesmer'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3488: {'name': 'Eve', 'profession': ['Necromancer', 'Mesmer'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4564: {'name': 'Eve', 'profession': ['Necromancer', 'Mesmer'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4574: {'name': 'Eve', 'profession': ['Necromancer', 'Mesmer'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5987: {'name': 'Eve', 'profession': ['Necromancer', 'Mesmer'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4584: {'name': 'Eve', 'profession': ['Necromancer', 'Mesmer'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1926: {'name': 'Mhenlo', 'profession': ['Monk', 'Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2136: {'name': 'Mhenlo', 'profession': ['Monk', 'Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2855: {'name': 'Mhenlo', 'profession': ['Monk', 'Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3121: {'name': 'Mhenlo', 'profession': ['Monk', 'Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4577: {'name': 'Mhenlo', 'profession': ['Monk', 'Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5990: {'name': 'Mhenlo', 'profession': ['Monk', 'Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4587: {'name': 'Mhenlo', 'profession': ['Monk', 'Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1503: {'name': 'Mhenlo', 'profession': ['Monk', 'Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1934: {'name': 'Aidan', 'profession': ['Ranger', 'Elementalist'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2124: {'name': 'Aidan', 'profession': ['Ranger', 'Elementalist'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2852: {'name': 'Aidan', 'profession': ['Ranger', 'Elementalist'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3493: {'name': 'Aidan', 'profession': ['Ranger', 'Elementalist'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4570: {'name': 'Aidan', 'profession': ['Ranger', 'Elementalist'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4580: {'name': 'Aidan', 'profession': ['Ranger', 'Elementalist'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5994: {'name': 'Aidan', 'profession': ['Ranger', 'Elementalist'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4590: {'name': 'Aidan', 'profession': ['Ranger', 'Elementalist'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2123: {'name': 'Aidan', 'profession': ['Ranger', 'Elementalist'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1935: {'name': 'Olias', 'profession': ['Necromancer'], 'attributes': [{'level': '10', 'name': 'Blood Magic'}, {'level': '9', 'name': 'Death Magic'}, {'level': '5', 'name': 'Soul Reaping'}], 'skills_used': ['Vampiric Gaze', 'Resurrection Signet', 'Strip Enchantment', 'Shadow Strike', 'Animate Bone Minions', 'Death Nova'], 'armor_levels': {}, 'items_dropped': []},
-    1938: {'name': 'Olias', 'profession': ['Necromancer'], 'attributes': [{'level': '10', 'name': 'Blood Magic'}, {'level': '9', 'name': 'Death Magic'}, {'level': '5', 'name': 'Soul Reaping'}], 'skills_used': ['Vampiric Gaze', 'Resurrection Signet', 'Strip Enchantment', 'Shadow Strike', 'Animate Bone Minions', 'Death Nova'], 'armor_levels': {}, 'items_dropped': []},
-    1944: {'name': "Lyssa's Muse", 'profession': ['Mesmer'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1945: {'name': 'Voice of Grenth', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Holiday Blues', 'Snowball', 'Mega Snowball'], 'armor_levels': {}, 'items_dropped': []},
-    1946: {'name': 'Avatar of Dwayna', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1950: {'name': 'Projects/NPC models/Humans/Kryta', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1993: {'name': 'Projects/NPC models/Humans/Kryta', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1997: {'name': 'Projects/NPC models/Humans/Kryta', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2007: {'name': 'Projects/NPC models/Humans/Kryta', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2021: {'name': 'Projects/NPC models/Humans/Kryta', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2037: {'name': 'Projects/NPC models/Humans/Kryta', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2040: {'name': 'Projects/NPC models/Humans/Kryta', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2048: {'name': 'Projects/NPC models/Humans/Kryta', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1958: {'name': 'Krytan Herald', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Seeking Blade'], 'armor_levels': {}, 'items_dropped': []},
-    1961: {'name': 'Lionguard', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1969: {'name': 'Lionguard', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2868: {'name': 'Lionguard', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1964: {'name': 'Projects/NPC models/Humans/Kryta', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1965: {'name': 'Restless Spirit', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1986: {'name': 'Ascalonian Settler', 'profession': ['Warrior', 'Monk'], 'attributes': [], 'skills_used': ['Orison of Healing', 'Power Attack', "Dwayna's Kiss", 'Healing Signet', '"I Will Avenge You!"', 'Endure Pain', 'Shield of Absorption', 'Words of Comfort', 'Signet of Rejuvenation'], 'armor_levels': {}, 'items_dropped': []},
-    1987: {'name': 'Ascalonian Settler', 'profession': ['Warrior', 'Monk'], 'attributes': [], 'skills_used': ['Orison of Healing', 'Power Attack', "Dwayna's Kiss", 'Healing Signet', '"I Will Avenge You!"', 'Endure Pain', 'Shield of Absorption', 'Words of Comfort', 'Signet of Rejuvenation'], 'armor_levels': {}, 'items_dropped': []},
-    1986: {'name': 'Ascalonian Settler', 'profession': ['Warrior', 'Monk'], 'attributes': [], 'skills_used': ['Orison of Healing', 'Power Attack', "Dwayna's Kiss", 'Healing Signet', '"I Will Avenge You!"', 'Endure Pain', 'Shield of Absorption', 'Words of Comfort', 'Signet of Rejuvenation'], 'armor_levels': {}, 'items_dropped': []},
-    1987: {'name': 'Ascalonian Settler', 'profession': ['Warrior', 'Monk'], 'attributes': [], 'skills_used': ['Orison of Healing', 'Power Attack', "Dwayna's Kiss", 'Healing Signet', '"I Will Avenge You!"', 'Endure Pain', 'Shield of Absorption', 'Words of Comfort', 'Signet of Rejuvenation'], 'armor_levels': {}, 'items_dropped': []},
-    1989: {'name': 'Settlement Guard', 'profession': ['Warrior', 'Ranger'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', '"I Will Survive!"', 'Troll Unguent', 'Healing Signet', 'Galrath Slash', "Bull's Strike", 'Sever Artery', "Bonetti's Defense"], 'armor_levels': {}, 'items_dropped': []},
-    1990: {'name': 'Captain Greywind', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ["Griffon's Sweep", 'Hundred Blades', '"I Will Survive!"', 'Defensive Stance', 'Healing Signet', '"I Will Avenge You!"', 'Endure Pain', 'Galrath Slash', 'Sever Artery', 'Gash', 'Crippling Slash', "Lion's Comfort"], 'armor_levels': {}, 'items_dropped': []},
-    1998: {'name': 'Projects/NPC models/Ghosts', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2141: {'name': 'Projects/NPC models/Ghosts', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2353: {'name': 'Projects/NPC models/Ghosts', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2354: {'name': 'Projects/NPC models/Ghosts', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2355: {'name': 'Projects/NPC models/Ghosts', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2534: {'name': 'Projects/NPC models/Ghosts', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5617: {'name': 'Projects/NPC models/Ghosts', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4975: {'name': 'Projects/NPC models/Ghosts', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2000: {'name': 'Projects/NPC models/Humans/Kryta', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2006: {'name': 'White Mantle Zealot', 'profession': ['Warrior', 'Monk', 'Elementalist', 'Paragon'], 'attributes': [{'level': '11', 'name': 'Smiting Prayers'}], 'skills_used': ["Bull's Charge", 'Signet of Aggression', 'Castigation Signet', 'Mending Touch', 'Signet of Return', 'Triple Chop', 'Signet of Strength', 'Purge Signet', '"You\'re All Alone!"', '"I Will Survive!"', 'Axe Rake', 'Barbarous Slice', 'Symbolic Strike', 'Bane Signet', 'Flail', 'Anthem of Flame', "Soldier's Strike", 'Healing Signet', 'Conjure Flame', '"To the Limit!"', 'Eviscerate', 'Furious Axe', 'Sever Artery', 'Gash', 'Vengeance', 'Dismember', '"None Shall Pass!"', 'Keen Chop'], 'armor_levels': {'Blunt damage': '113 to 121', 'Piercing damage': '113 to 121', 'Slashing damage': '113 to 121', 'Cold damage': '93 to 101', 'Earth damage': '93 to 101', 'Fire damage': '93 to 101', 'Lightning damage': '93 to 101'}, 'items_dropped': ["Confessor's Orders", 'War in Kryta', "Justiciar's Armor", "Knight's Armor", 'The Holy Avenger', 'unique', 'The Interdictor', 'White Mantle Badge', 'White Mantle Emblem', "Zealot's Armor"]},
-    2206: {'name': 'White Mantle Zealot', 'profession': ['Warrior', 'Monk', 'Elementalist', 'Paragon'], 'attributes': [{'level': '11', 'name': 'Smiting Prayers'}], 'skills_used': ["Bull's Charge", 'Signet of Aggression', 'Castigation Signet', 'Mending Touch', 'Signet of Return', 'Triple Chop', 'Signet of Strength', 'Purge Signet', '"You\'re All Alone!"', '"I Will Survive!"', 'Axe Rake', 'Barbarous Slice', 'Symbolic Strike', 'Bane Signet', 'Flail', 'Anthem of Flame', "Soldier's Strike", 'Healing Signet', 'Conjure Flame', '"To the Limit!"', 'Eviscerate', 'Furious Axe', 'Sever Artery', 'Gash', 'Vengeance', 'Dismember', '"None Shall Pass!"', 'Keen Chop'], 'armor_levels': {'Blunt damage': '113 to 121', 'Piercing damage': '113 to 121', 'Slashing damage': '113 to 121', 'Cold damage': '93 to 101', 'Earth damage': '93 to 101', 'Fire damage': '93 to 101', 'Lightning damage': '93 to 101'}, 'items_dropped': ["Confessor's Orders", 'War in Kryta', "Justiciar's Armor", "Knight's Armor", 'The Holy Avenger', 'unique', 'The Interdictor', 'White Mantle Badge', 'White Mantle Emblem', "Zealot's Armor"]},
-    2207: {'name': 'White Mantle Zealot', 'profession': ['Warrior', 'Monk', 'Elementalist', 'Paragon'], 'attributes': [{'level': '11', 'name': 'Smiting Prayers'}], 'skills_used': ["Bull's Charge", 'Signet of Aggression', 'Castigation Signet', 'Mending Touch', 'Signet of Return', 'Triple Chop', 'Signet of Strength', 'Purge Signet', '"You\'re All Alone!"', '"I Will Survive!"', 'Axe Rake', 'Barbarous Slice', 'Symbolic Strike', 'Bane Signet', 'Flail', 'Anthem of Flame', "Soldier's Strike", 'Healing Signet', 'Conjure Flame', '"To the Limit!"', 'Eviscerate', 'Furious Axe', 'Sever Artery', 'Gash', 'Vengeance', 'Dismember', '"None Shall Pass!"', 'Keen Chop'], 'armor_levels': {'Blunt damage': '113 to 121', 'Piercing damage': '113 to 121', 'Slashing damage': '113 to 121', 'Cold damage': '93 to 101', 'Earth damage': '93 to 101', 'Fire damage': '93 to 101', 'Lightning damage': '93 to 101'}, 'items_dropped': ["Confessor's Orders", 'War in Kryta', "Justiciar's Armor", "Knight's Armor", 'The Holy Avenger', 'unique', 'The Interdictor', 'White Mantle Badge', 'White Mantle Emblem', "Zealot's Armor"]},
-    2016: {'name': 'Captain Grumby', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2034: {'name': 'Captured Chosen', 'profession': ['Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2066: {'name': 'Ascalon', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2071: {'name': 'Ascalon', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2872: {'name': 'Ascalon', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2077: {'name': 'Projects/NPC models/Humans/Kryta', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2111: {'name': 'Projects/NPC models/Dwarves', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2140: {'name': 'Projects/NPC models/Dwarves', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2112: {'name': 'Projects/NPC models/Dwarves', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2117: {'name': 'Projects/NPC models/Humans/Canthans', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2118: {'name': 'Projects/NPC models/Humans/Canthans', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2119: {'name': 'Projects/NPC models/Humans/Canthans', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2121: {'name': 'Projects/NPC models/Humans/Canthans', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3276: {'name': 'Projects/NPC models/Humans/Canthans', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3277: {'name': 'Projects/NPC models/Humans/Canthans', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3291: {'name': 'Projects/NPC models/Humans/Canthans', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2168: {'name': 'Irwyn the Severe', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Guilt', 'Shame', 'Shatter Enchantment', 'Empathy'], 'armor_levels': {}, 'items_dropped': ["Sycophant's Robes", 'White Mantle Badge']},
-    2169: {'name': 'Selwin the Fervent', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Heal Area', "Judge's Insight", 'Restore Life', 'Convert Hexes', 'Divine Intervention', 'Shielding Hands'], 'armor_levels': {}, 'items_dropped': ["Abbot's Robes", 'White Mantle Badge']},
-    2170: {'name': 'Edgar the Iron Fist', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Savage Shot', 'Troll Unguent', 'Antidote Signet', "Dryder's Defenses", 'Pin Down'], 'armor_levels': {}, 'items_dropped': ["Seeker's Vest", 'White Mantle Badge']},
-    2171: {'name': 'Inner Council Member Argyle', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Shatter Enchantment', 'Ether Feast', 'Shame', 'Guilt'], 'armor_levels': {}, 'items_dropped': []},
-    2173: {'name': 'Braima the Callous', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Aura of Restoration', 'Glyph of Elemental Power', 'Searing Heat', 'Ward Against Elements'], 'armor_levels': {}, 'items_dropped': []},
-    2175: {'name': 'Cyrus the Unflattering', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', '"I Will Avenge You!"', "Executioner's Strike", 'Galrath Slash'], 'armor_levels': {}, 'items_dropped': []},
-    2177: {'name': 'Inner Council Member Cuthbert', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Shatter Enchantment', 'Ether Feast', 'Shame', 'Guilt'], 'armor_levels': {}, 'items_dropped': ["Sycophant's Robes"]},
-    2179: {'name': 'Manton the Indulgent', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Aura of Restoration', 'Glyph of Elemental Power', 'Searing Heat', 'Ward Against Elements'], 'armor_levels': {}, 'items_dropped': ["Savant's Robes"]},
-    2181: {'name': 'Projects/NPC models/Humans/Kryta', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2182: {'name': 'Cuthbert the Chaste', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ["Dryder's Defenses", 'Troll Unguent', 'Savage Shot', 'Antidote Signet'], 'armor_levels': {}, 'items_dropped': ["Seeker's Vest", 'White Mantle Badge', 'White Mantle Emblem']},
-    2185: {'name': 'Pleoh the Ugly', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Aura of Restoration', 'Glyph of Elemental Power', 'Searing Heat', 'Ward Against Elements'], 'armor_levels': {}, 'items_dropped': ["Savant's Robes", 'White Mantle Emblem']},
-    2187: {'name': 'Justiciar Hablion', 'profession': ['Warrior'], 'attributes': [{'level': '12', 'name': 'Tactics'}], 'skills_used': ['Wild Blow', "Executioner's Strike", 'Axe Rake', "Protector's Defense", 'Healing Signet', 'Cyclone Axe', 'Dismember', 'Cleave'], 'armor_levels': {}, 'items_dropped': ["Justiciar's Armor", "Knight's Armor", 'White Mantle Emblem']},
-    2189: {'name': 'Markis', 'profession': ['Ranger', 'Monk'], 'attributes': [{'level': '16', 'name': 'Marksmanship'}], 'skills_used': ['Troll Unguent', 'Heal Area', 'Concussion Shot', 'Barrage'], 'armor_levels': {}, 'items_dropped': ["Seeker's Vest"]},
-    2190: {'name': 'Confessor Dorian', 'profession': ['Monk'], 'attributes': [{'level': '15', 'name': 'Healing Prayers'}], 'skills_used': ['Orison of Healing', 'Heal Area', 'Banish', 'Word of Healing', 'Healing Breeze'], 'armor_levels': {}, 'items_dropped': ["Priest's Robes"]},
-    2197: {'name': 'White Mantle Sycophant', 'profession': ['Mesmer', 'Necromancer', 'Ritualist', 'Monk', 'Warrior', 'Ranger'], 'attributes': [{'level': '13', 'name': 'Domination Magic'}], 'skills_used': ['Mantra of Persistence', 'Shame', 'Spirit Shackles', 'Unnatural Signet', 'Extend Conditions', 'Shatter Enchantment', 'Cure Hex', 'Energy Burn', 'Mistrust', 'Psychic Instability', 'Malaise', 'Resurrection Chant', 'Conjure Phantasm', 'Illusion of Pain', 'Destruction', 'Healing Ribbon', 'Feedback', 'Images of Remorse', 'Meekness', 'Phantom Pain', 'Well of Silence', 'Ether Feast', 'Guilt', 'Energy Surge', 'Hex Eater Vortex', 'Healing Signet', 'Clumsiness', 'Brambles', 'Energy Tap', 'Word of Healing', 'Signet of Humility', 'Drain Enchantment', 'Shrinking Armor', 'Fragility', 'Arcane Conundrum', 'Gaze from Beyond', 'Spirit Burn', 'Sympathetic Visage', 'Power Drain', 'Mantra of Signets', 'Empathy', "Kitah's Burden", 'Well of Weariness', 'Leech Signet', 'Crippling Anguish', 'Antidote Signet'], 'armor_levels': {'Blunt damage': '49', 'Piercing damage': '49', 'Slashing damage': '49', 'Cold damage': '49', 'Earth damage': '49', 'Fire damage': '49', 'Lightning damage': '49'}, 'items_dropped': ["Confessor's Orders", "Sycophant's Robes", 'The Rapture', 'unique', 'White Mantle Badge', 'White Mantle Emblem']},
-    2198: {'name': 'White Mantle Ritualist', 'profession': ['Necromancer', 'Elementalist', 'Ritualist', 'Assassin'], 'attributes': [{'level': '13', 'name': 'Blood Magic'}, {'level': '9', 'name': 'Death Magic'}, {'level': '17 Death Magic in', 'name': 'Hard mode'}], 'skills_used': ['Shell Shock', 'Discord', 'Mark of Subversion', 'Order of Pain', 'Glyph of Swiftness', 'Animate Flesh Golem', 'Vampiric Gaze', 'Oppressive Gaze', 'Spoil Victor', 'Taste of Pain', 'Strip Enchantment', 'Animate Bone Horror', 'Barbed Signet', 'Shadow Strike', 'Life Siphon', "Verata's Aura", 'Weaken Knees', 'Infuse Condition', 'Reckless Haste', 'Vile Miasma', 'Jaundiced Gaze', 'Blood of the Aggressor', 'Well of Blood', 'Shameful Fear', 'Bitter Chill', 'Rising Bile', 'Death Pact Signet', 'Enduring Toxin', 'Well of the Profane', 'Splinter Weapon'], 'armor_levels': {'Blunt damage': '49', 'Piercing damage': '49', 'Slashing damage': '49', 'Cold damage': '49', 'Earth damage': '49', 'Fire damage': '49', 'Lightning damage': '49'}, 'items_dropped': ["Ritualist's Tunic", 'Shining Maul', 'The Soul Reaper', 'unique', 'War in Kryta', 'White Mantle Badge', 'White Mantle Emblem']},
-    2199: {'name': 'White Mantle Savant', 'profession': ['Elementalist', 'Dervish', 'Ritualist', 'Assassin'], 'attributes': [{'level': '11', 'name': 'Fire Magic'}], 'skills_used': ['Glyph of Lesser Energy', 'Aura of Restoration', 'Conviction', 'Signet of Shadows', 'Ride the Lightning', "Grenth's Fingers", 'Searing Heat', 'Meteor Shower', 'Deep Freeze', 'Immolate', 'Lightning Strike', 'Shock', 'Spirit Boon Strike', 'Liquid Flame', 'Fire Storm', 'Mystic Twister', 'Invoke Lightning', 'Incendiary Bonds', 'Phoenix', 'Blinding Flash', 'Savannah Heat', 'Agony', 'Lightning Touch', 'Lightning Javelin', 'Glyph of Renewal', 'Fire Attunement', 'Ward Against Elements', 'Lightning Orb', 'Glyph of Elemental Power', 'Air Attunement', 'Aftershock', 'Mark of Death', 'Fireball'], 'armor_levels': {'Blunt damage': '49', 'Piercing damage': '49', 'Slashing damage': '49', 'Cold damage': '49', 'Earth damage': '49', 'Fire damage': '49', 'Lightning damage': '49'}, 'items_dropped': ["Confessor's Orders", "Savant's Robes", 'Shining Maul', 'White Mantle Badge', 'White Mantle Emblem']},
-    2200: {'name': 'White Mantle Abbot', 'profession': ['Monk', 'Paragon', 'Mesmer', 'Warrior'], 'attributes': [{'level': '16', 'name': 'Healing Prayers'}], 'skills_used': ['Heal Other', 'Infuse Health', 'Draw Conditions', 'Contemplation of Purity', 'Divine Healing', 'Watchful Healing', 'Deny Hexes', 'Mend Condition', 'Divine Boon', "Smiter's Boon", 'Mantra of Recall', 'Spirit Bond', 'Shielding Hands', 'Boon Signet', 'Return', 'Signet of Devotion', 'Smite Hex', 'Healing Breeze', 'Shield of Regeneration', 'Heal Area', 'Ballad of Restoration', "Judge's Insight", 'Divine Intervention', 'Reversal of Damage', 'Guardian', 'Remedy Signet', 'Restore Condition', 'Protective Spirit', 'Spear of Light', 'Smite Condition', 'Convert Hexes', "Heaven's Delight", 'Zealous Benediction', 'Reversal of Fortune', 'Aegis', 'Disciplined Stance'], 'armor_levels': {'Blunt damage': '54', 'Piercing damage': '54', 'Slashing damage': '54', 'Cold damage': '54', 'Earth damage': '54', 'Fire damage': '54', 'Lightning damage': '54'}, 'items_dropped': ["Abbot's Robes", "Priest's Robes", 'White Mantle Badge', 'White Mantle Emblem']},
-    2201: {'name': 'White Mantle Priest', 'profession': ['Monk', 'Ritualist', 'Warrior', 'Mesmer', 'Elementalist'], 'attributes': [{'level': '0', 'name': 'Spawning Power'}], 'skills_used': ['Healing Touch', 'Heal Other', 'Scourge Healing', 'Castigation Signet', 'Cure Hex', 'Shield Bash', 'Patient Spirit', 'Smite', 'Steam', 'Orison of Healing', "Healer's Boon", 'Union', 'Hex Eater Signet', 'Shielding Hands', 'Ray of Judgment', 'Healing Whisper', 'Ethereal Light', 'Shield of Regeneration', 'Ether Signet', "Judge's Insight", 'Divine Intervention', 'Healing Burst', 'Word of Healing', 'Signet of Rage', 'Heal Party', 'Holy Haste', 'Signet of Rejuvenation', 'Recuperation', 'Armor of Frost', 'Convert Hexes', 'Spotless Mind', 'Signet of Binding', 'Words of Comfort', 'Balanced Stance'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ["Abbot's Robes", "Confessor's Orders", 'War in Kryta', 'Harmony', 'unique', 'Peace', "Priest's Robes", 'Shining Maul', 'White Mantle Badge', 'White Mantle Emblem']},
-    2202: {'name': 'White Mantle Knight', 'profession': ['Warrior', 'Ranger', 'Dervish', 'Elementalist', 'Monk'], 'attributes': [{'level': '11', 'name': 'Water Magic'}], 'skills_used': ['Hundred Blades', 'Steady Stance', "Bull's Charge", '"I Will Avenge You!"', 'Rending Touch', 'Endure Pain', 'Steelfang Slash', 'Galrath Slash', "Bull's Strike", '"Coward!"', 'Flail', '"Watch Yourself!"', "Griffon's Sweep", '"I Meant to Do That!"', '"You Will Die!"', 'Desperation Blow', 'Sun and Moon Slash', "Judge's Insight", 'Holy Strike', 'Frozen Burst', 'Rending Aura', 'Knee Cutter', 'Resurrection Signet', 'Grapple', 'Gash', 'Crippling Slash', 'Poison Tip Signet', 'Standing Slash', 'Conjure Frost', 'Disarm'], 'armor_levels': {'Blunt damage': '100 to 101', 'Piercing damage': '100 to 101', 'Slashing damage': '100 to 101', 'Cold damage': '80 to 81', 'Earth damage': '80 to 81', 'Fire damage': '80 to 81', 'Lightning damage': '80 to 81'}, 'items_dropped': ["Confessor's Orders", 'War in Kryta', "Justiciar's Armor", "Knight's Armor", 'Shining Maul', 'The Interdictor', 'unique', 'The Hammer of Justice', 'The Holy Avenger', 'White Mantle Badge', 'White Mantle Emblem', "Zealot's Armor"]},
-    2204: {'name': 'White Mantle Justiciar', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', "Executioner's Strike", "Bull's Charge", '"I Will Avenge You!"', 'Galrath Slash'], 'armor_levels': {'Blunt damage': '106 to 112', 'Piercing damage': '106 to 112', 'Slashing damage': '106 to 112', 'Cold damage': '86 to 92', 'Earth damage': '86 to 92', 'Fire damage': '86 to 92', 'Lightning damage': '86 to 92'}, 'items_dropped': ['Broken Armor', "Justiciar's Armor", "Knight's Armor", 'Leather Belt', 'White Mantle Badge', 'White Mantle Emblem']},
-    2205: {'name': 'White Mantle Justiciar', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', "Executioner's Strike", "Bull's Charge", '"I Will Avenge You!"', 'Galrath Slash'], 'armor_levels': {'Blunt damage': '106 to 112', 'Piercing damage': '106 to 112', 'Slashing damage': '106 to 112', 'Cold damage': '86 to 92', 'Earth damage': '86 to 92', 'Fire damage': '86 to 92', 'Lightning damage': '86 to 92'}, 'items_dropped': ['Broken Armor', "Justiciar's Armor", "Knight's Armor", 'Leather Belt', 'White Mantle Badge', 'White Mantle Emblem']},
-    2208: {'name': 'White Mantle Seeker', 'profession': ['Ranger', 'Warrior', 'Mesmer', 'Elementalist', 'Ritualist'], 'attributes': [{'level': '15', 'name': 'Wilderness Survival'}], 'skills_used': ['Piercing Trap', 'Shadow Refuge', 'Troll Unguent', 'Deflect Arrows', 'Barbed Trap', 'Signet of Weariness', 'Read the Wind', 'Needling Shot', 'Debilitating Shot', 'Oath Shot', 'Sundering Weapon', "Trapper's Focus", 'Chaos Storm', 'Tranquility', 'Blinding Powder', 'Lightning Reflexes', 'Mark of Instability', 'Throw Dirt', 'Savage Shot', "Serpent's Quickness", 'Crossfire', 'Dual Shot', 'Determined Shot', 'Called Shot', 'Fox Fangs', 'Black Mantis Thrust', 'Conjure Flame', 'Barbed Arrows', 'Penetrating Attack', "Dryder's Defenses", 'Death Blossom', 'Glass Arrows', 'Pin Down', 'Sundering Attack', 'Escape', 'Flame Trap', 'Incendiary Arrows', 'Tripwire', 'Antidote Signet', '"Shields Up!"'], 'armor_levels': {'Blunt damage': '69', 'Piercing damage': '69', 'Slashing damage': '69', 'Cold damage': '69', 'Earth damage': '69', 'Fire damage': '69', 'Lightning damage': '69'}, 'items_dropped': ['The Adjudicator', 'unique', 'War in Kryta', "Confessor's Orders", "Seeker's Vest", 'Shining Maul', 'White Mantle Badge', 'White Mantle Emblem']},
-    2227: {'name': 'White Mantle Seeker', 'profession': ['Ranger', 'Warrior', 'Mesmer', 'Elementalist', 'Ritualist'], 'attributes': [{'level': '15', 'name': 'Wilderness Survival'}], 'skills_used': ['Piercing Trap', 'Shadow Refuge', 'Troll Unguent', 'Deflect Arrows', 'Barbed Trap', 'Signet of Weariness', 'Read the Wind', 'Needling Shot', 'Debilitating Shot', 'Oath Shot', 'Sundering Weapon', "Trapper's Focus", 'Chaos Storm', 'Tranquility', 'Blinding Powder', 'Lightning Reflexes', 'Mark of Instability', 'Throw Dirt', 'Savage Shot', "Serpent's Quickness", 'Crossfire', 'Dual Shot', 'Determined Shot', 'Called Shot', 'Fox Fangs', 'Black Mantis Thrust', 'Conjure Flame', 'Barbed Arrows', 'Penetrating Attack', "Dryder's Defenses", 'Death Blossom', 'Glass Arrows', 'Pin Down', 'Sundering Attack', 'Escape', 'Flame Trap', 'Incendiary Arrows', 'Tripwire', 'Antidote Signet', '"Shields Up!"'], 'armor_levels': {'Blunt damage': '69', 'Piercing damage': '69', 'Slashing damage': '69', 'Cold damage': '69', 'Earth damage': '69', 'Fire damage': '69', 'Lightning damage': '69'}, 'items_dropped': ['The Adjudicator', 'unique', 'War in Kryta', "Confessor's Orders", "Seeker's Vest", 'Shining Maul', 'White Mantle Badge', 'White Mantle Emblem']},
-    2209: {'name': 'Projects/NPC models/Humans/Kryta', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2219: {'name': 'Projects/NPC models/Humans/Kryta', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2223: {'name': 'Justiciar Thommis', 'profession': ['Warrior'], 'attributes': [{'level': '12', 'name': 'Swordsmanship'}], 'skills_used': ['Hundred Blades', "Protector's Defense", 'Sun and Moon Slash', 'Healing Signet', "Thommis's Blessing", 'Sever Artery', 'Gash', 'Final Thrust', 'Disarm'], 'armor_levels': {'Blunt damage': '139', 'Piercing damage': '139', 'Slashing damage': '139', 'Cold damage': '119', 'Earth damage': '119', 'Fire damage': '119', 'Lightning damage': '119'}, 'items_dropped': []},
-    2230: {'name': 'Bone Horror', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2231: {'name': 'Bone Fiend', 'profession': ['Ranger'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2235: {'name': 'Mursaat Mesmer (boss)', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Physical Resistance', 'Ether Feast', 'Energy Surge', 'Spectral Agony', 'Power Leak'], 'armor_levels': {}, 'items_dropped': ['Mursaat Garments', 'Mursaat Token']},
-    2236: {'name': 'Mursaat Necromancer (boss)', 'profession': ['Necromancer'], 'attributes': [{'level': '', 'name': 'Curses'}], 'skills_used': ['Life Transfer', 'Blood Renewal', 'Spectral Agony', 'Life Siphon', 'Insidious Parasite'], 'armor_levels': {}, 'items_dropped': ['Mursaat Garments', 'Mursaat Token']},
-    2237: {'name': 'Mursaat Elementalist (boss)', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Enervating Charge', 'Chain Lightning', 'Thunderclap', 'Spectral Agony', 'Glyph of Concentration'], 'armor_levels': {}, 'items_dropped': ['Mursaat Garments', 'Mursaat Token']},
-    2238: {'name': 'Mursaat Monk (boss)', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Aura of Faith', 'Orison of Healing', 'Contemplation of Purity', 'Draw Conditions', 'Spectral Agony'], 'armor_levels': {}, 'items_dropped': ['Mursaat Garments', 'Mursaat Token']},
-    2239: {'name': 'Jade Armor (boss)', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Devastating Hammer', 'Wild Blow', 'Crushing Blow'], 'armor_levels': {}, 'items_dropped': ['Mursaat Garments', 'Mursaat Hammer', 'Mursaat Token']},
-    2240: {'name': 'Jade Bow (boss)', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Oath Shot', 'Determined Shot', 'Healing Spring', 'Whirling Defense'], 'armor_levels': {}, 'items_dropped': ['Mursaat Garments', 'Mursaat Token']},
-    2241: {'name': 'Mursaat Mesmer', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Domination Magic'}], 'skills_used': ['Physical Resistance', 'Ether Feast', 'Energy Surge', 'Spectral Agony', 'Power Leak', 'Mantra of Flame'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Hornbow (Mursaat)', 'Mursaat Garments', 'Mursaat Token']},
-    2242: {'name': 'Mursaat Necromancer', 'profession': ['Necromancer'], 'attributes': [{'level': '16', 'name': 'Blood Magic'}, {'level': '12', 'name': 'Curses'}, {'level': '16', 'name': 'Soul Reaping'}], 'skills_used': ['Life Transfer', 'Blood Renewal', 'Mark of Subversion', 'Spectral Agony', 'Life Siphon', 'Insidious Parasite'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Mursaat Garments', 'Mursaat Token']},
-    2243: {'name': 'Mursaat Elementalist', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Air Magic'}, {'level': '15', 'name': 'Energy Storage'}], 'skills_used': ['Lightning Orb', 'Enervating Charge', 'Chain Lightning', 'Thunderclap', 'Spectral Agony', 'Glyph of Concentration'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Mursaat Garments', 'Mursaat Hammer', 'Mursaat Token']},
-    2245: {'name': 'Mursaat Monk', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Aura of Faith', 'Orison of Healing', 'Contemplation of Purity', 'Draw Conditions', 'Vigorous Spirit', 'Spectral Agony'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Mursaat Garments', 'Mursaat Token']},
-    2249: {'name': 'Jade Armor', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Forceful Blow', 'Irresistible Blow', 'Thrill of Victory', 'Devastating Hammer', 'Signet of Strength', 'Enraged Smash', "Protector's Strike", 'Spectral Agony', '"For Great Justice!"', 'Overbearing Smash', 'Wild Blow', 'Natural Resistance', 'Healing Signet', 'Fierce Blow', 'Staggering Blow', 'Crude Swing', 'Counter Blow', 'Auspicious Blow', 'Pulverizing Smash', 'Crushing Blow', 'Body Blow', 'Backbreaker', "Lion's Comfort", "Warrior's Cunning"], 'armor_levels': {}, 'items_dropped': ['Hornbow (Mursaat)', 'Mursaat Garments', 'Mursaat Hammer', 'Mursaat Token']},
-    2250: {'name': 'Jade Bow', 'profession': ['Ranger'], 'attributes': [{'level': '0', 'name': 'Expertise'}], 'skills_used': ['Troll Unguent', 'Oath Shot', 'Kindle Arrows', "Marauder's Shot", 'Healing Spring', 'Precision Shot', 'Prepared Shot', 'Splinter Shot', 'Spectral Agony', 'Whirling Defense', 'Throw Dirt', 'Rapid Fire', 'Barrage', 'Crossfire', 'Determined Shot', 'Natural Resistance', 'Penetrating Attack', 'Spike Trap', 'Screaming Shot', 'Arcing Shot'], 'armor_levels': {'Blunt damage': '111', 'Piercing damage': '111', 'Slashing damage': '111', 'Cold damage': '91', 'Earth damage': '91', 'Fire damage': '91', 'Lightning damage': '91'}, 'items_dropped': ['Hornbow (Mursaat)', 'Mursaat Garments', 'Mursaat Hammer', 'Mursaat Token']},
-    2251: {'name': 'Ether Seal', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Air Magic'}, {'level': '15', 'name': 'Energy Storage'}], 'skills_used': ['Glyph of Concentration', 'Natural Resistance', 'Chain Lightning', 'Mind Shock'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Hornbow (Mursaat)', 'Mursaat Hammer', 'Mursaat Token']},
-    2255: {'name': 'Hepp Bilespitter', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Domination Magic'}], 'skills_used': ['Ether Feast', 'Cry of Frustration', 'Shatter Enchantment', 'Empathy', 'Hex Breaker'], 'armor_levels': {}, 'items_dropped': ['Ancient Eye']},
-    2256: {'name': 'Mossk Rottail', 'profession': ['Necromancer'], 'attributes': [{'level': '20', 'name': 'Blood Magic'}], 'skills_used': ['Life Siphon', 'Deathly Chill', 'Well of Suffering', 'Enfeebling Blood'], 'armor_levels': {}, 'items_dropped': []},
-    2257: {'name': 'Thornwrath', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Aftershock', 'Aura of Restoration', 'Stoning', 'Earthquake'], 'armor_levels': {}, 'items_dropped': ['Plant Fiber', 'Tangled Seed']},
-    2261: {'name': 'List of rider bosses', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2262: {'name': 'Grech Trundle', 'profession': ['Necromancer'], 'attributes': [{'level': '20', 'name': 'Blood Magic'}], 'skills_used': ['Life Siphon', 'Soul Feast', 'Deathly Swarm', 'Mark of Subversion'], 'armor_levels': {}, 'items_dropped': ['Mossy Mandible']},
-    2263: {'name': 'Wydd Kindlerun', 'profession': ['Elementalist'], 'attributes': [{'level': '(20', 'name': 'Water Magic'}], 'skills_used': ['Aura of Restoration', 'Ice Spikes', 'Maelstrom', 'Glyph of Lesser Energy'], 'armor_levels': {}, 'items_dropped': ['Ancient Eye']},
-    2264: {'name': 'Tree of Vitality', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Orison of Healing', 'Restore Life', 'Guardian', 'Blessed Signet', 'Protective Bond'], 'armor_levels': {}, 'items_dropped': ['Plant Fiber', 'Tangled Seed']},
-    2268: {'name': 'Kara Bloodtail', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Life Siphon', 'Parasitic Bond', 'Order of Pain'], 'armor_levels': {}, 'items_dropped': []},
-    2269: {'name': 'List of centaur bosses', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2273: {'name': 'List of centaur bosses', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2285: {'name': 'Drogo Greatmane', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Flame Trap', 'Healing Spring', 'Symbiosis', "Hunter's Shot"], 'armor_levels': {}, 'items_dropped': ['Bloody Heart', 'quest item', 'Maguuma Mane']},
-    2287: {'name': 'Gale Stormsend', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Cry of Frustration', 'Shatter Enchantment', 'Empathy', 'Hex Breaker'], 'armor_levels': {}, 'items_dropped': ['Lilac Eye', 'quest item']},
-    2289: {'name': 'Wind Rider', 'profession': ['Mesmer'], 'attributes': [{'level': '4', 'name': 'Domination Magic'}, {'level': '10', 'name': 'Illusion Magic'}, {'level': '20 Illusion Magic (', 'name': 'hard mode'}], 'skills_used': ['Arcane Conundrum', 'Soothing Images', 'Shame', 'Cry of Frustration', 'Shatter Enchantment', 'Power Spike', 'Conjure Phantasm', 'Crippling Anguish'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Ancient Eye', 'Forgotten Fan', 'unique']},
-    2290: {'name': 'Wind Rider', 'profession': ['Mesmer'], 'attributes': [{'level': '4', 'name': 'Domination Magic'}, {'level': '10', 'name': 'Illusion Magic'}, {'level': '20 Illusion Magic (', 'name': 'hard mode'}], 'skills_used': ['Arcane Conundrum', 'Soothing Images', 'Shame', 'Cry of Frustration', 'Shatter Enchantment', 'Power Spike', 'Conjure Phantasm', 'Crippling Anguish'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Ancient Eye', 'Forgotten Fan', 'unique']},
-    6302: {'name': 'Wind Rider', 'profession': ['Mesmer'], 'attributes': [{'level': '4', 'name': 'Domination Magic'}, {'level': '10', 'name': 'Illusion Magic'}, {'level': '20 Illusion Magic (', 'name': 'hard mode'}], 'skills_used': ['Arcane Conundrum', 'Soothing Images', 'Shame', 'Cry of Frustration', 'Shatter Enchantment', 'Power Spike', 'Conjure Phantasm', 'Crippling Anguish'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Ancient Eye', 'Forgotten Fan', 'unique']},
-    2292: {'name': 'Root Behemoth', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"I Will Survive!"', 'Earth Shaker', 'Wild Blow', 'Deflect Arrows'], 'armor_levels': {'Blunt damage': '97', 'Piercing damage': '97', 'Slashing damage': '97', 'Cold damage': '77', 'Earth damage': '77', 'Fire damage': '77', 'Lightning damage': '77'}, 'items_dropped': ['Behemoth Jaw', 'Chitin Fragment', 'Monstrous Claw', 'Totem Axe', 'unique']},
-    2294: {'name': 'Maguuma Enchanter', 'profession': ['Mesmer'], 'attributes': [{'level': '(18', 'name': 'Domination Magic'}], 'skills_used': ['Blackout', 'Energy Burn', 'Leech Signet', 'Mantra of Earth'], 'armor_levels': {'Blunt damage': '40', 'Piercing damage': '40', 'Slashing damage': '40', 'Cold damage': '60', 'Earth damage': '40', 'Fire damage': '40', 'Lightning damage': '40'}, 'items_dropped': ['Centaur Harness', 'Centaur Hide', 'Maguuma Mane']},
-    2295: {'name': 'Maguuma Warlock', 'profession': ['Necromancer'], 'attributes': [{'level': '(18', 'name': 'Curses'}], 'skills_used': ['Well of Blood', 'Parasitic Bond', 'Order of Pain', 'Signet of Agony'], 'armor_levels': {'Blunt damage': '40', 'Piercing damage': '40', 'Slashing damage': '40', 'Cold damage': '60', 'Earth damage': '40', 'Fire damage': '40', 'Lightning damage': '40'}, 'items_dropped': ['Centaur Hide', 'Maguuma Mane']},
-    2296: {'name': 'Maguuma Avenger', 'profession': ['Elementalist'], 'attributes': [{'level': '(20', 'name': 'Water Magic'}], 'skills_used': ['Shard Storm', 'Rust', 'Glyph of Renewal', 'Ice Prison'], 'armor_levels': {'Blunt damage': '40', 'Piercing damage': '40', 'Slashing damage': '40', 'Cold damage': '60', 'Earth damage': '40', 'Fire damage': '40', 'Lightning damage': '40'}, 'items_dropped': ['Centaur Harness', 'Maguuma Mane']},
-    2297: {'name': 'Maguuma Protector', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Heal Other', 'Watchful Spirit', 'Life Bond', 'Blessed Signet', 'Succor'], 'armor_levels': {'Blunt damage': '40', 'Piercing damage': '40', 'Slashing damage': '40', 'Cold damage': '60', 'Earth damage': '40', 'Fire damage': '40', 'Lightning damage': '40'}, 'items_dropped': ['Centaur Harness', 'Maguuma Mane']},
-    2298: {'name': 'Maguuma Warrior', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Eviscerate', "Executioner's Strike", '"I Will Avenge You!"', 'Seeking Blade', 'Swift Chop', 'Final Thrust', "Warrior's Cunning"], 'armor_levels': {'Blunt damage': '91', 'Piercing damage': '91', 'Slashing damage': '91', 'Cold damage': '91', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Centaur Harness', 'Centaur Hide', 'Maguuma Mane']},
-    2299: {'name': 'Maguuma Warrior', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Eviscerate', "Executioner's Strike", '"I Will Avenge You!"', 'Seeking Blade', 'Swift Chop', 'Final Thrust', "Warrior's Cunning"], 'armor_levels': {'Blunt damage': '91', 'Piercing damage': '91', 'Slashing damage': '91', 'Cold damage': '91', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Centaur Harness', 'Centaur Hide', 'Maguuma Mane']},
-    2300: {'name': 'Maguuma Hunter', 'profession': ['Ranger'], 'attributes': [{'level': '12', 'name': 'Beast Mastery'}], 'skills_used': ['Flame Trap', "Melandru's Resilience", 'Symbiosis', "Hunter's Shot"], 'armor_levels': {'Blunt damage': '49', 'Piercing damage': '49', 'Slashing damage': '49', 'Cold damage': '88', 'Earth damage': '49', 'Fire damage': '79', 'Lightning damage': '79'}, 'items_dropped': ['Centaur Harness', 'Centaur Hide', 'Maguuma Mane']},
-    2301: {'name': 'Fevered Devourer', 'profession': ['Necromancer'], 'attributes': [{'level': '9', 'name': 'Death Magic'}], 'skills_used': ['Deathly Chill', 'Enfeebling Blood', 'Virulence'], 'armor_levels': {'Blunt damage': '54', 'Piercing damage': '54', 'Slashing damage': '54', 'Cold damage': '54', 'Earth damage': '54', 'Fire damage': '54', 'Lightning damage': '54'}, 'items_dropped': ['Chitin Fragment', 'Monstrous Claw', 'Thorny Carapace']},
-    2302: {'name': 'Thorn Devourer', 'profession': ['Ranger'], 'attributes': [{'level': '0', 'name': 'Marksmanship'}], 'skills_used': ['Power Shot', 'Storm Chaser', 'Quick Shot'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Chitin Fragment', 'Monstrous Claw', 'Thorny Carapace']},
-    2303: {'name': 'Thorn Devourer Drone', 'profession': ['Ranger'], 'attributes': [{'level': '11', 'name': 'Marksmanship'}], 'skills_used': ['Power Shot', 'Storm Chaser', 'Quick Shot'], 'armor_levels': {'Blunt damage': '63', 'Piercing damage': '63', 'Slashing damage': '63', 'Cold damage': '63', 'Earth damage': '63', 'Fire damage': '63', 'Lightning damage': '63'}, 'items_dropped': ['Chitin Fragment', 'Monstrous Claw', 'Thorny Carapace']},
-    2304: {'name': 'Thorn Stalker', 'profession': ['Elementalist'], 'attributes': [{'level': '6', 'name': 'Earth Magic'}], 'skills_used': ['Earth Attunement', 'Stoning', 'Whirlwind', 'Mist Form', 'Aftershock'], 'armor_levels': {}, 'items_dropped': ['Monstrous Eye', 'Plant Fiber', 'Tangled Seed', 'Wood Plank']},
-    2305: {'name': 'Thorn Stalker Sprout', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Earth Attunement', 'Stoning', 'Whirlwind', 'Mist Form', 'Aftershock'], 'armor_levels': {'Blunt damage': '53', 'Piercing damage': '53', 'Slashing damage': '-1', 'Cold damage': '53', 'Earth damage': '53', 'Fire damage': '13', 'Lightning damage': '53'}, 'items_dropped': ['Plant Fiber', 'Tangled Seed']},
-    2306: {'name': 'Life Pod', 'profession': ['Monk'], 'attributes': [{'level': '8', 'name': 'Smiting Prayers'}], 'skills_used': ['Heal Other', 'Orison of Healing', 'Mend Condition', 'Holy Wrath', 'Signet of Judgment'], 'armor_levels': {'Blunt damage': '61', 'Piercing damage': '61', 'Slashing damage': '21', 'Cold damage': '61', 'Earth damage': '61', 'Fire damage': '21', 'Lightning damage': '61'}, 'items_dropped': ['Monstrous Eye', 'Plant Fiber', 'Tangled Seed', 'Wood Plank']},
-    2307: {'name': 'Entangling Roots', 'profession': ['Ranger'], 'attributes': [{'level': '(20', 'name': 'Wilderness Survival'}], 'skills_used': ['Penetrating Attack', 'Muddy Terrain', 'Barbed Trap'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '43', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '43', 'Lightning damage': '83'}, 'items_dropped': ['Plant Fiber', 'Tangled Seed']},
-    2308: {'name': 'Redwood Shepherd', 'profession': ['Ranger'], 'attributes': [{'level': '0', 'name': 'Beast Mastery'}, {'level': '9', 'name': 'Marksmanship'}, {'level': '20', 'name': 'Wilderness Survival'}], 'skills_used': ['Primal Echoes', 'Debilitating Shot', 'Barbed Trap'], 'armor_levels': {'Blunt damage': '86', 'Piercing damage': '86', 'Slashing damage': '46', 'Cold damage': '86', 'Earth damage': '86', 'Fire damage': '56', 'Lightning damage': '86'}, 'items_dropped': ['Monstrous Eye', 'Plant Fiber', 'Tangled Seed', 'Wood Plank']},
-    2309: {'name': 'Moss Scarab', 'profession': ['Necromancer'], 'attributes': [{'level': 'Level 12:11', 'name': 'Blood Magic'}, {'level': 'at least 5', 'name': 'Death Magic'}], 'skills_used': ["Verata's Gaze", 'Vampiric Touch'], 'armor_levels': {'Blunt damage': '48', 'Piercing damage': '48', 'Slashing damage': '48', 'Cold damage': '48', 'Earth damage': '48', 'Fire damage': '48', 'Lightning damage': '48'}, 'items_dropped': ['Chitin Fragment', 'Monstrous Claw', 'Mossy Mandible']},
-    2310: {'name': 'Moss Scarab', 'profession': ['Necromancer'], 'attributes': [{'level': 'Level 12:11', 'name': 'Blood Magic'}, {'level': 'at least 5', 'name': 'Death Magic'}], 'skills_used': ["Verata's Gaze", 'Vampiric Touch'], 'armor_levels': {'Blunt damage': '48', 'Piercing damage': '48', 'Slashing damage': '48', 'Cold damage': '48', 'Earth damage': '48', 'Fire damage': '48', 'Lightning damage': '48'}, 'items_dropped': ['Chitin Fragment', 'Monstrous Claw', 'Mossy Mandible']},
-    2312: {'name': 'Maguuma Spider', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Punishing Shot', 'Pin Down', 'Charm Animal', 'Storm Chaser', 'Apply Poison'], 'armor_levels': {'Blunt damage': '64', 'Piercing damage': '64', 'Slashing damage': '64', 'Cold damage': '64', 'Earth damage': '64', 'Fire damage': '64', 'Lightning damage': '64'}, 'items_dropped': ['Chitin Fragment', 'Ebon Spider Leg', 'Maguuma Spider Web', 'Monstrous Claw']},
-    2313: {'name': 'Jungle Troll', 'profession': ['Warrior', 'Ranger'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Power Attack', 'Backbreaker', 'Endure Pain'], 'armor_levels': {'Blunt damage': '94', 'Piercing damage': '94', 'Slashing damage': '94', 'Cold damage': '74', 'Earth damage': '74', 'Fire damage': '74', 'Lightning damage': '74'}, 'items_dropped': ['Jungle Troll Tusk']},
-    2314: {'name': 'Jungle Troll', 'profession': ['Warrior', 'Ranger'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Power Attack', 'Backbreaker', 'Endure Pain'], 'armor_levels': {'Blunt damage': '94', 'Piercing damage': '94', 'Slashing damage': '94', 'Cold damage': '74', 'Earth damage': '74', 'Fire damage': '74', 'Lightning damage': '74'}, 'items_dropped': ['Jungle Troll Tusk']},
-    2472: {'name': 'Horm Frostrider', 'profession': ['Elementalist'], 'attributes': [{'level': '(20', 'name': 'Earth Magic'}], 'skills_used': ['Earth Attunement', 'Ice Spear', 'Ward Against Foes', 'Aura of Restoration', 'Magnetic Aura'], 'armor_levels': {}, 'items_dropped': ['Shiverpeak Key', 'Shiverpeak Elementalist Robes', 'Shiverpeak Mane', 'Snowy Centaur Hide']},
-    2501: {'name': 'Digo Murkstalker', 'profession': ['Mesmer'], 'attributes': [{'level': '16', 'name': 'Illusion Magic'}], 'skills_used': ['Clumsiness', 'Illusion of Weakness', 'Illusionary Weaponry'], 'armor_levels': {}, 'items_dropped': ['Azure Remains']},
-    2502: {'name': 'Ceru Gloomrunner', 'profession': ['Necromancer'], 'attributes': [{'level': '19', 'name': 'Blood Magic'}, {'level': '20', 'name': 'Curses'}], 'skills_used': ['Life Siphon', 'Weaken Armor', 'Spinal Shivers', 'Spiteful Spirit'], 'armor_levels': {}, 'items_dropped': ['Azure Remains']},
-    2530: {'name': 'Enslaved Frost Giant', 'profession': ['Warrior'], 'attributes': [{'level': '7 or 8', 'name': 'Strength'}], 'skills_used': ['Crushing Blow', 'Stun Immunity', 'Earth Shaker', 'Berserker Stance', 'Giant Stomp'], 'armor_levels': {}, 'items_dropped': ["Giant's Boots", 'Huge Jawbone', "Tundra Giant's Bracer"]},
-    2532: {'name': 'Blessed Griffon', 'profession': ['Monk'], 'attributes': [{'level': '15', 'name': 'Smiting Prayers'}], 'skills_used': ["Balthazar's Aura", 'Spell Breaker', 'Holy Strike', 'Symbol of Wrath', 'Smite Hex'], 'armor_levels': {'Blunt damage': '81', 'Piercing damage': '61', 'Slashing damage': '61', 'Cold damage': '81', 'Earth damage': '81', 'Fire damage': '81', 'Lightning damage': '61'}, 'items_dropped': ['Bone', 'Feather', 'Frosted Griffon Wing', 'Monstrous Claw', 'Monstrous Eye']},
-    2533: {'name': 'Ice Imp', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Energy Storage'}, {'level': '15', 'name': 'Water Magic'}], 'skills_used': ['Ice Spear', 'Aura of Restoration', 'Water Attunement', 'Mind Freeze', 'Frigid Armor', 'Maelstrom'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '100', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Frigid Heart', 'Icy Dragon Sword', 'Mineral Springs', 'Scale']},
-    6947: {'name': 'Ice Imp', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Energy Storage'}, {'level': '15', 'name': 'Water Magic'}], 'skills_used': ['Ice Spear', 'Aura of Restoration', 'Water Attunement', 'Mind Freeze', 'Frigid Armor', 'Maelstrom'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '100', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Frigid Heart', 'Icy Dragon Sword', 'Mineral Springs', 'Scale']},
-    2535: {'name': 'Azure Shadow', 'profession': ['Monk'], 'attributes': [{'level': '11', 'name': 'Smiting Prayers'}], 'skills_used': ['Retribution', 'Life Bond', 'Signet of Judgment', 'Holy Wrath', 'Holy Strike'], 'armor_levels': {'Blunt damage': '104', 'Piercing damage': '104', 'Slashing damage': '104', 'Cold damage': '104', 'Earth damage': '104', 'Fire damage': '104', 'Lightning damage': '104'}, 'items_dropped': ['Azure Remains']},
-    2536: {'name': 'Pinesoul', 'profession': ['Ranger'], 'attributes': [{'level': '12', 'name': 'Wilderness Survival'}], 'skills_used': ['Stun Immunity', 'Barbed Trap', 'Determined Shot', 'Muddy Terrain', 'Spike Trap'], 'armor_levels': {'Blunt damage': '112', 'Piercing damage': '112', 'Slashing damage': '72', 'Cold damage': '112', 'Earth damage': '112', 'Fire damage': '72', 'Lightning damage': '112'}, 'items_dropped': ['Alpine Seed']},
-    2540: {'name': 'Avicara Brave', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Savage Slash', 'Healing Signet', 'Pure Strike', 'Flourish'], 'armor_levels': {'Blunt damage': '127', 'Piercing damage': '127', 'Slashing damage': '127', 'Cold damage': '107', 'Earth damage': '107', 'Fire damage': '107', 'Lightning damage': '87'}, 'items_dropped': ['Avicara Brave Armor', 'Feather', 'Feathered Avicara Scalp']},
-    2541: {'name': 'Avicara Fierce', 'profession': ['Ranger'], 'attributes': [{'level': '14', 'name': 'Expertise'}, {'level': '18', 'name': 'Wilderness Survival'}], 'skills_used': ['Ignite Arrows', 'Practiced Stance', 'Troll Unguent', 'Dual Shot'], 'armor_levels': {'Blunt damage': '81', 'Piercing damage': '81', 'Slashing damage': '81', 'Cold damage': '111', 'Earth damage': '111', 'Fire damage': '111', 'Lightning damage': '72'}, 'items_dropped': ['Avicara Fierce Vest', 'Feather', 'Feathered Avicara Scalp']},
-    2546: {'name': 'Mountain Troll', 'profession': ['Warrior'], 'attributes': [{'level': '15', 'name': 'Strength'}, {'level': '16', 'name': 'Tactics'}], 'skills_used': ['Mighty Blow', 'Battle Rage', 'Healing Signet', 'Disrupting Chop'], 'armor_levels': {'Blunt damage': '111', 'Piercing damage': '111', 'Slashing damage': '111', 'Cold damage': '91', 'Earth damage': '91', 'Fire damage': '91', 'Lightning damage': '91'}, 'items_dropped': ['Mountain Troll Tusk']},
-    2549: {'name': 'Seer', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2552: {'name': 'Eidolon', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Water Magic'}], 'skills_used': ['Aura of Restoration', 'Frozen Burst', 'Ice Prison', 'Mist Form'], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '80', 'Slashing damage': '80', 'Cold damage': '120', 'Earth damage': '80', 'Fire damage': '64', 'Lightning damage': '80'}, 'items_dropped': ['Frozen Remnant', 'Spectral Essence']},
-    2599: {'name': 'Enslaved Ettin', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Stun Immunity', 'Power Attack', 'Balanced Stance', 'Staggering Blow'], 'armor_levels': {'Blunt damage': '111', 'Piercing damage': '111', 'Slashing damage': '111', 'Cold damage': '91', 'Earth damage': '91', 'Fire damage': '91', 'Lightning damage': '91'}, 'items_dropped': ["Ettin's Pauldron"]},
-    2629: {'name': 'List of dolyak bosses', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2630: {'name': 'Hormak Ironcurse', 'profession': ['Necromancer'], 'attributes': [{'level': '16', 'name': 'Death Magic'}, {'level': '16', 'name': 'Blood Magic'}], 'skills_used': ['Taste of Death', 'Plague Touch', 'Offering of Blood', 'Animate Bone Fiend', 'Life Siphon'], 'armor_levels': {}, 'items_dropped': ['Stone Summit Badge']},
-    2631: {'name': 'List of elemental bosses', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2632: {'name': 'List of dolyak bosses', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2634: {'name': 'List of dolyak bosses', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2637: {'name': 'Dagnar Stonepate', 'profession': ['Elementalist'], 'attributes': [{'level': '16', 'name': 'Water Magic'}], 'skills_used': ['Aura of Restoration', 'Water Attunement', 'Healing Signet', 'Disrupting Chop', 'Frozen Burst', 'Penetrating Blow', '"For Great Justice!"', 'Ice Spikes'], 'armor_levels': {}, 'items_dropped': ['Stone Summit Badge']},
-    2648: {'name': 'Summit Beastmaster', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ["Bull's Strike", 'Devastating Hammer', 'Giant Stomp', 'Stun Immunity'], 'armor_levels': {'Blunt damage': '80', 'Piercing damage': '80', 'Slashing damage': '80', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Beastmaster Harness', 'Dwarven Warrior Armor', 'Stone Summit Badge', 'Summit Axe', 'Summit Hammer']},
-    2650: {'name': 'Stone Summit Heretic', 'profession': ['Mesmer', 'Elementalist'], 'attributes': [{'level': '12', 'name': 'Domination Magic'}, {'level': '15', 'name': 'Illusion Magic'}], 'skills_used': ['Fevered Dreams', 'Stun Immunity', 'Shrinking Armor', 'Enervating Charge', 'Arcane Echo', 'Blinding Flash', 'Shatter Enchantment', 'Conjure Phantasm', 'Energy Tap', 'Leech Signet', 'Crippling Anguish', 'Hypochondria', 'Illusion of Haste'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Dolyak Cladding', 'Dolyak Hide', 'Dwarven Sage Outfit', 'Stone Summit Badge', 'Summit Axe']},
-    2651: {'name': 'Dolyak Master', 'profession': ['Monk'], 'attributes': [{'level': '20', 'name': 'Smiting Prayers'}], 'skills_used': ['Heal Other', 'Orison of Healing', "Healer's Boon", 'Life Attunement', 'Stun Immunity', 'Mend Ailment', 'Restful Breeze', 'Mark of Protection', 'Remove Hex', 'Healing Whisper', 'Words of Comfort', 'Banish'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Dolyak Cladding', 'Dolyak Hide', 'Stone Summit Badge']},
-    2653: {'name': 'Stone Summit Gnasher', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Blood Magic'}, {'level': '12', 'name': 'Death Magic'}, {'level': '20 Death Magic in', 'name': 'Hard mode'}], 'skills_used': ['Jagged Bones', 'Animate Bone Minions', 'Taste of Death', 'Plague Touch', 'Offering of Blood', 'Animate Bone Fiend', 'Animate Shambling Horror', 'Life Siphon', 'Signet of Lost Souls', 'Deathly Swarm', 'Death Nova'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Dwarven Robes', 'Stone Summit Badge', 'Stone Summit Emblem']},
-    6698: {'name': 'Stone Summit Gnasher', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Blood Magic'}, {'level': '12', 'name': 'Death Magic'}, {'level': '20 Death Magic in', 'name': 'Hard mode'}], 'skills_used': ['Jagged Bones', 'Animate Bone Minions', 'Taste of Death', 'Plague Touch', 'Offering of Blood', 'Animate Bone Fiend', 'Animate Shambling Horror', 'Life Siphon', 'Signet of Lost Souls', 'Deathly Swarm', 'Death Nova'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Dwarven Robes', 'Stone Summit Badge', 'Stone Summit Emblem']},
-    2654: {'name': 'Stone Summit Carver', 'profession': ['Warrior', 'Ranger'], 'attributes': [], 'skills_used': ['Power Attack', 'Healing Signet', '"I Will Avenge You!"', 'Endure Pain', 'Disrupting Chop', 'Thrill of Victory', 'Cyclone Axe', "Protector's Strike", 'Counterattack', '"For Great Justice!"', 'Quivering Blade', 'Dismember', 'Dwarven Battle Stance', 'Antidote Signet', 'Whirling Axe', 'Cleave'], 'armor_levels': {'Blunt damage': '116', 'Piercing damage': '116', 'Slashing damage': '116', 'Cold damage': '96', 'Earth damage': '96', 'Fire damage': '96', 'Lightning damage': '96'}, 'items_dropped': ['Dwarven Armor', 'Stone Summit Badge', 'Stone Summit Emblem', 'Summit Axe', 'Summit Hammer', 'Summit Warlord Shield']},
-    6692: {'name': 'Stone Summit Carver', 'profession': ['Warrior', 'Ranger'], 'attributes': [], 'skills_used': ['Power Attack', 'Healing Signet', '"I Will Avenge You!"', 'Endure Pain', 'Disrupting Chop', 'Thrill of Victory', 'Cyclone Axe', "Protector's Strike", 'Counterattack', '"For Great Justice!"', 'Quivering Blade', 'Dismember', 'Dwarven Battle Stance', 'Antidote Signet', 'Whirling Axe', 'Cleave'], 'armor_levels': {'Blunt damage': '116', 'Piercing damage': '116', 'Slashing damage': '116', 'Cold damage': '96', 'Earth damage': '96', 'Fire damage': '96', 'Lightning damage': '96'}, 'items_dropped': ['Dwarven Armor', 'Stone Summit Badge', 'Stone Summit Emblem', 'Summit Axe', 'Summit Hammer', 'Summit Warlord Shield']},
-    6701: {'name': 'Stone Summit Carver', 'profession': ['Warrior', 'Ranger'], 'attributes': [], 'skills_used': ['Power Attack', 'Healing Signet', '"I Will Avenge You!"', 'Endure Pain', 'Disrupting Chop', 'Thrill of Victory', 'Cyclone Axe', "Protector's Strike", 'Counterattack', '"For Great Justice!"', 'Quivering Blade', 'Dismember', 'Dwarven Battle Stance', 'Antidote Signet', 'Whirling Axe', 'Cleave'], 'armor_levels': {'Blunt damage': '116', 'Piercing damage': '116', 'Slashing damage': '116', 'Cold damage': '96', 'Earth damage': '96', 'Fire damage': '96', 'Lightning damage': '96'}, 'items_dropped': ['Dwarven Armor', 'Stone Summit Badge', 'Stone Summit Emblem', 'Summit Axe', 'Summit Hammer', 'Summit Warlord Shield']},
-    2656: {'name': 'Siege Ice Golem', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Energy Storage'}, {'level': '12', 'name': 'Water Magic'}], 'skills_used': ['Stun Immunity', 'Rust', 'Armor of Mist', 'Water Trident', 'Deep Freeze'], 'armor_levels': {'Blunt damage': '91', 'Piercing damage': '91', 'Slashing damage': '91', 'Cold damage': '91', 'Earth damage': '91', 'Fire damage': '51', 'Lightning damage': '91'}, 'items_dropped': ['Icy Lodestone', 'Stone Summit Shield', 'Summit Axe', 'Summit Hammer', 'Summit Warlord Shield']},
-    2657: {'name': 'Summit Giant Herder', 'profession': ['Warrior'], 'attributes': [{'level': '0-1', 'name': 'Strength'}], 'skills_used': ['Mighty Blow', 'Stun Immunity', 'Rush', 'Giant Stomp', 'Devastating Hammer', 'Counter Blow'], 'armor_levels': {}, 'items_dropped': ['Beastmaster Harness', 'Dwarven Warrior Armor', 'Stone Summit Badge', 'Summit Axe', 'Summit Hammer']},
-    2658: {'name': 'Moles Quibus', 'profession': ['Mesmer'], 'attributes': [{'level': '16', 'name': 'Domination Magic'}], 'skills_used': ['Spirit of Failure', 'Ether Feast', 'Cry of Frustration', 'Panic', 'Mantra of Flame'], 'armor_levels': {}, 'items_dropped': ['Titan Armor']},
-    2659: {'name': 'Maligo Libens', 'profession': ['Necromancer'], 'attributes': [{'level': '14', 'name': 'Blood Magic'}], 'skills_used': ['Strip Enchantment', 'Shadow of Fear', 'Shadow Strike', 'Aura of the Lich', 'Life Siphon'], 'armor_levels': {}, 'items_dropped': ['Titan Armor']},
-    2660: {'name': 'Scelus Prosum', 'profession': ['Elementalist'], 'attributes': [{'level': '16', 'name': 'Fire Magic'}], 'skills_used': ['Glyph of Lesser Energy', "Rodgort's Invocation", 'Aura of Restoration', 'Mind Burn', 'Inferno'], 'armor_levels': {}, 'items_dropped': ['Titan Armor']},
-    2661: {'name': 'Tortitudo Probo', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Axe Twist', 'Eviscerate', 'Axe Rake', 'Healing Signet', 'Swift Chop'], 'armor_levels': {}, 'items_dropped': ['Titan Armor']},
-    2662: {'name': 'Valetudo Rubor', 'profession': ['Ranger'], 'attributes': [{'level': '16', 'name': 'Wilderness Survival'}], 'skills_used': ['Flame Trap', 'Greater Conflagration', 'Troll Unguent'], 'armor_levels': {}, 'items_dropped': ['Titan Armor']},
-    2668: {'name': 'Spark of the Titans', 'profession': ['Elementalist', 'Mesmer'], 'attributes': [], 'skills_used': ["Teinai's Heat", 'Glyph of Lesser Energy', 'Mind Blast', "Rodgort's Invocation", 'Aura of Restoration', 'Drain Enchantment', 'Searing Heat', 'Mantra of Resolve', 'Mind Burn', 'Fire Attunement', 'Inferno'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '63', 'Earth damage': '83', 'Fire damage': '123', 'Lightning damage': '83'}, 'items_dropped': ['Molten Claw', 'Titan Armor']},
-    2669: {'name': 'Risen Ashen Hulk', 'profession': ['Necromancer'], 'attributes': [{'level': '13', 'name': 'Blood Magic'}, {'level': '10', 'name': 'Curses'}, {'level': '16', 'name': 'Death Magic'}, {'level': '[', 'name': 'verification requested'}, {'level': '[', 'name': 'verification requested'}], 'skills_used': ['Jagged Bones', 'Titans get plus Health regen and set enemies on fire each time he is hit.', 'Stun Immunity', 'Strip Enchantment', 'Plague Touch', "Verata's Aura", 'Shadow of Fear', 'Aura of the Lich', 'Shadow Strike', 'Animate Bone Minions', 'Soul Barbs'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '63', 'Earth damage': '83', 'Fire damage': '123', 'Lightning damage': '83'}, 'items_dropped': ['Magmas Shield', 'Molten Claw', 'Titan Armor']},
-    2670: {'name': 'Burning Titan', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Wild Blow', 'Titans get plus Health regen and set enemies on fire each time he is hit.', 'Stun Immunity', 'Healing Signet', 'Irresistible Blow', 'Thrill of Victory'], 'armor_levels': {'Blunt damage': '123', 'Piercing damage': '123', 'Slashing damage': '123', 'Cold damage': '83', 'Earth damage': '103', 'Fire damage': '143', 'Lightning damage': '103'}, 'items_dropped': ['Titan Armor']},
-    2671: {'name': 'Hand of the Titans', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Axe Twist', 'Eviscerate', 'Axe Rake', 'Healing Signet', 'Swift Chop'], 'armor_levels': {'Blunt damage': '123', 'Piercing damage': '123', 'Slashing damage': '123', 'Cold damage': '83', 'Earth damage': '103', 'Fire damage': '143', 'Lightning damage': '103'}, 'items_dropped': ['Molten Claw', 'Titan Armor']},
-    2672: {'name': 'Fist of the Titans', 'profession': ['Warrior', 'Assassin'], 'attributes': [{'level': '14', 'name': 'Tactics'}], 'skills_used': ['Hundred Blades', 'Shadow Refuge', 'Sun and Moon Slash', 'Healing Signet', "Death's Charge", 'Barbarous Slice', 'Galrath Slash', 'Deadly Riposte', 'Final Thrust', 'Silverwing Slash'], 'armor_levels': {'Blunt damage': '123', 'Piercing damage': '123', 'Slashing damage': '123', 'Cold damage': '83', 'Earth damage': '103', 'Fire damage': '143', 'Lightning damage': '103'}, 'items_dropped': ['Magmas Shield']},
-    2695: {'name': 'Undead Lich', 'profession': ['Necromancer'], 'attributes': [{'level': '17', 'name': 'Blood Magic'}], 'skills_used': ['Unholy Feast', 'Life Vortex', 'Strip Enchantment', 'Soul Vortex', 'Life Siphon', 'Hunger of the Lich'], 'armor_levels': {'Blunt damage': '30 (60)', 'Piercing damage': '30 (60)', 'Slashing damage': '30 (60)', 'Cold damage': '30 (60)', 'Earth damage': '30 (60)', 'Fire damage': '30 (60)', 'Lightning damage': '30 (60)'}, 'items_dropped': ['Decayed Orr Emblem']},
-    4953: {'name': 'Undead Lich', 'profession': ['Necromancer'], 'attributes': [{'level': '17', 'name': 'Blood Magic'}], 'skills_used': ['Unholy Feast', 'Life Vortex', 'Strip Enchantment', 'Soul Vortex', 'Life Siphon', 'Hunger of the Lich'], 'armor_levels': {'Blunt damage': '30 (60)', 'Piercing damage': '30 (60)', 'Slashing damage': '30 (60)', 'Cold damage': '30 (60)', 'Earth damage': '30 (60)', 'Fire damage': '30 (60)', 'Lightning damage': '30 (60)'}, 'items_dropped': ['Decayed Orr Emblem']},
-    2698: {'name': 'Undead Prince Rurik', 'profession': ['Warrior'], 'attributes': [{'level': '0', 'name': 'Tactics'}], 'skills_used': ['Deadly Riposte', 'Hundred Blades', 'Thrill of Victory', 'Final Thrust'], 'armor_levels': {'Blunt damage': '139', 'Piercing damage': '139', 'Slashing damage': '139', 'Cold damage': '119', 'Earth damage': '119', 'Fire damage': '119', 'Lightning damage': '119'}, 'items_dropped': ['Bone', 'Decayed Orr Emblem', "Executioner's Breastplate", 'Pile of Glittering Dust']},
-    2700: {'name': 'Zaim Grimeclaw', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Signet of Weariness', 'Epidemic', 'Mantra of Inscriptions'], 'armor_levels': {}, 'items_dropped': []},
-    2729: {'name': 'Ruinwing', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Primal Echoes', 'Dodge', 'Choking Gas'], 'armor_levels': {}, 'items_dropped': ['Bone', 'Decayed Orr Emblem']},
-    2730: {'name': 'Hellhound', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Sever Artery', 'Gash', 'Frenzy', 'Endure Pain'], 'armor_levels': {'Blunt damage': '82', 'Piercing damage': '82', 'Slashing damage': '82', 'Cold damage': '82', 'Earth damage': '82', 'Fire damage': '22', 'Lightning damage': '82'}, 'items_dropped': ['Bone', 'Decayed Orr Emblem', 'Pile of Glittering Dust', 'Sephis Axe']},
-    2732: {'name': 'Grasping Ghoul', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Wild Blow', 'Crippling Attack', '"Victory Is Mine!"', 'Nibble', '"Coward!"'], 'armor_levels': {'Blunt damage': '74', 'Piercing damage': '74', 'Slashing damage': '74', 'Cold damage': '54', 'Earth damage': '54', 'Fire damage': '54', 'Lightning damage': '54'}, 'items_dropped': ['Bone', 'Dead Bow', 'Decayed Orr Emblem', "Ghoul's Collar", 'Pile of Glittering Dust', 'Sephis Axe']},
-    2731: {'name': 'Grasping Ghoul', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Wild Blow', 'Crippling Attack', '"Victory Is Mine!"', 'Nibble', '"Coward!"'], 'armor_levels': {'Blunt damage': '74', 'Piercing damage': '74', 'Slashing damage': '74', 'Cold damage': '54', 'Earth damage': '54', 'Fire damage': '54', 'Lightning damage': '54'}, 'items_dropped': ['Bone', 'Dead Bow', 'Decayed Orr Emblem', "Ghoul's Collar", 'Pile of Glittering Dust', 'Sephis Axe']},
-    2739: {'name': 'Skeleton Ranger', 'profession': ['Ranger'], 'attributes': [{'level': '9', 'name': 'Expertise'}], 'skills_used': ['Disrupting Shot', 'Troll Unguent', 'Crossfire', 'Distracting Shot', 'Broad Head Arrow', 'Apply Poison', "Hunter's Shot"], 'armor_levels': {'Blunt damage': '56', 'Piercing damage': '76', 'Slashing damage': '56', 'Cold damage': '56', 'Earth damage': '56', 'Fire damage': '56', 'Lightning damage': '56'}, 'items_dropped': ['Bone', 'Dead Bow', 'Decayed Orr Armor', 'Decayed Orr Emblem', 'Pile of Glittering Dust', 'Sephis Axe']},
-    2741: {'name': 'Bone Dragon', 'profession': ['Ranger', 'Necromancer'], 'attributes': [{'level': '7', 'name': 'Wilderness Survival'}], 'skills_used': ['Taste of Pain', 'Taste of Death', 'Choking Gas', "Verata's Sacrifice", 'Rotting Flesh', 'Dodge', 'Aura of the Lich', 'Deafening Roar', 'Enfeebling Blood'], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '100', 'Slashing damage': '100', 'Cold damage': '100', 'Earth damage': '100', 'Fire damage': '100', 'Lightning damage': '100'}, 'items_dropped': ['Bone', 'Decayed Orr Emblem', 'Pile of Glittering Dust']},
-    2748: {'name': 'Vizier Khilbron', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Chimera of Intensity', 'Claim Resource', 'Invulnerability'], 'armor_levels': {}, 'items_dropped': []},
-    2749: {'name': 'Vizier Khilbron', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Chimera of Intensity', 'Claim Resource', 'Invulnerability'], 'armor_levels': {}, 'items_dropped': []},
-    2763: {'name': 'Jyth Sprayburst', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Stoning', 'Aura of Restoration', 'Enervating Charge', 'Kinetic Armor', 'Ether Prodigy'], 'armor_levels': {}, 'items_dropped': ['Molten Eye']},
-    2766: {'name': 'Dosakaru Fevertouch', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Tainted Flesh', 'Defile Flesh', 'Life Siphon', 'Parasitic Bond', 'Malign Intervention'], 'armor_levels': {}, 'items_dropped': ['Fiery Crest']},
-    2768: {'name': 'Skintekaru Manshredder', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Wild Blow', 'Distracting Blow', "Bull's Charge"], 'armor_levels': {}, 'items_dropped': ['Fiery Crest']},
-    2770: {'name': 'Goss Darkweb', 'profession': ['Necromancer'], 'attributes': [{'level': '16', 'name': 'Blood Magic'}], 'skills_used': ['Life Siphon', 'Shadow Strike', 'Soul Leech', 'Strip Enchantment'], 'armor_levels': {}, 'items_dropped': []},
-    2773: {'name': 'Ferk Mallet', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"To the Limit!"', 'Healing Signet', 'Berserker Stance', 'Staggering Blow', 'Backbreaker'], 'armor_levels': {}, 'items_dropped': ['Igneous Ettin Hide', 'Igneous Hump']},
-    2774: {'name': 'Vulg Painbrain', 'profession': ['Ranger'], 'attributes': [{'level': '14', 'name': 'Beast Mastery'}], 'skills_used': ['Primal Echoes', 'Troll Unguent', 'Spike Trap'], 'armor_levels': {}, 'items_dropped': ['Igneous Ettin Hide', 'Igneous Hump']},
-    2780: {'name': "Grenth's Cursed", 'profession': ['Necromancer'], 'attributes': [{'level': '16', 'name': 'Curses'}, {'level': '14', 'name': 'Death Magic'}], 'skills_used': ['Animate Bone Minions', 'Lingering Curse', 'Taste of Death', 'Faintheartedness'], 'armor_levels': {}, 'items_dropped': ['Seared Ribcage']},
-    2784: {'name': 'Maxine Coldstone', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Quickening Zephyr', 'Favorable Winds', 'Kindle Arrows', 'Quick Shot'], 'armor_levels': {}, 'items_dropped': []},
-    2785: {'name': 'Rwek Khawl Mawl', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Power Drain', 'Energy Burn', 'Echo', 'Cry of Frustration'], 'armor_levels': {}, 'items_dropped': ['Mahgo Claw']},
-    2789: {'name': 'Breeze Keeper', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Domination Magic'}, {'level': '15', 'name': 'Illusion Magic'}], 'skills_used': ['Migraine', 'Power Spike', "Wastrel's Worry", 'Empathy'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Molten Eye']},
-    2790: {'name': 'Crag Behemoth', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ["Serpent's Quickness", 'Troll Unguent', 'Savage Shot', 'Barrage'], 'armor_levels': {'Blunt damage': '94', 'Piercing damage': '94', 'Slashing damage': '94', 'Cold damage': '124', 'Earth damage': '124', 'Fire damage': '124', 'Lightning damage': '124'}, 'items_dropped': ['Searing Burrower Jaw']},
-    2791: {'name': 'Drake', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    8147: {'name': 'Drake', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2792: {'name': 'Dark Flame Dryder', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Blood Magic'}], 'skills_used': ['Chilblains', 'Shadow Strike', 'Soul Leech'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Dark Flame Fang']},
-    2793: {'name': 'Igneous Ettin', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"To the Limit!"', 'Berserker Stance', 'Backbreaker', 'Staggering Blow'], 'armor_levels': {'Blunt damage': '112', 'Piercing damage': '112', 'Slashing damage': '112', 'Cold damage': '92', 'Earth damage': '92', 'Fire damage': '92', 'Lightning damage': '92'}, 'items_dropped': ['Igneous Ettin Hide', 'Igneous Hump']},
-    2794: {'name': 'Phantom', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2795: {'name': 'Flesh Golem', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2796: {'name': 'Mahgo Hydra', 'profession': ['Elementalist'], 'attributes': [{'level': '12', 'name': 'Energy Storage'}, {'level': '15', 'name': 'Fire Magic'}], 'skills_used': ['Stun Immunity', 'Phoenix', 'Inferno', 'Glyph of Renewal', 'Fire Attunement', 'Meteor Shower'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '91', 'Earth damage': '91', 'Fire damage': '91', 'Lightning damage': '91'}, 'items_dropped': ['Mahgo Claw']},
-    2798: {'name': 'Wurm', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2828: {'name': 'Projects/NPC models/Ghosts', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2833: {'name': 'Projects/NPC models/Ghosts', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2842: {'name': 'Shining Blade', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2843: {'name': 'Shining Blade', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2857: {'name': 'Firstwatch Sergio', 'profession': ['Warrior', 'Paragon'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', 'Tiger Stance', 'Healing Signet', 'Seeking Blade', '"Find Their Weakness!"', 'Triple Chop'], 'armor_levels': {}, 'items_dropped': []},
-    2859: {'name': 'Krytan Child', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2860: {'name': 'Oink', 'profession': [], 'attributes': [], 'skills_used': ['Invulnerability'], 'armor_levels': {}, 'items_dropped': []},
-    2861: {'name': 'Carlotta', 'profession': ['Ranger', 'Assassin'], 'attributes': [], 'skills_used': ['Shadow Refuge', 'Falling Spider', 'Snaring Web', 'Horns of the Ox', 'Black Spider Strike', 'Enduring Toxin', 'Vampiric Assault', 'Siphon Strength'], 'armor_levels': {}, 'items_dropped': []},
-    2862: {'name': 'King Adelbern', 'profession': ['Warrior', 'Elementalist'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', '"To the Limit!"', 'Defensive Stance', 'Healing Signet', 'Berserker Stance', 'Endure Pain', 'Sever Artery', 'Conjure Flame', 'Defy Pain', "Lion's Comfort", '"None Shall Pass!"'], 'armor_levels': {}, 'items_dropped': []},
-    2055: {'name': 'King Adelbern', 'profession': ['Warrior', 'Elementalist'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', '"To the Limit!"', 'Defensive Stance', 'Healing Signet', 'Berserker Stance', 'Endure Pain', 'Sever Artery', 'Conjure Flame', 'Defy Pain', "Lion's Comfort", '"None Shall Pass!"'], 'armor_levels': {}, 'items_dropped': []},
-    2864: {'name': 'Duke Barradin', 'profession': ['Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2865: {'name': 'Joe', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Power Shot', 'Read the Wind', 'Broad Head Arrow', 'Penetrating Attack', "Hunter's Shot"], 'armor_levels': {}, 'items_dropped': []},
-    2870: {'name': 'Shadow', 'profession': ['Ranger', 'Mesmer'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Natural Stride', 'Crossfire', 'Epidemic', 'Read the Wind', 'Broad Head Arrow', 'Poison Tip Signet', 'Penetrating Attack'], 'armor_levels': {}, 'items_dropped': []},
-    2871: {'name': 'Vanguard', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6026: {'name': 'Vanguard', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6027: {'name': 'Vanguard', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6029: {'name': 'Vanguard', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6042: {'name': 'Vanguard', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2099: {'name': 'Vanguard', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2100: {'name': 'Vanguard', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2874: {'name': 'Spirit of Winter', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2879: {'name': 'Spirit of Symbiosis', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2880: {'name': 'Spirit of Primal Echoes', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2882: {'name': 'Spirit of Frozen Soil', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2953: {'name': 'Crane', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2954: {'name': 'Tiger', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2955: {'name': 'Lurker', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2956: {'name': 'Reef Lurker', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2957: {'name': 'White Tiger', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2959: {'name': 'Reef Lurker', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2969: {'name': 'Crane', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2974: {'name': 'Tiger', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3030: {'name': 'Kurzick Noble', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3337: {'name': 'Kurzick Noble', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3396: {'name': 'Kurzick Noble', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3397: {'name': 'Kurzick Noble', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3398: {'name': 'Kurzick Noble', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3399: {'name': 'Kurzick Noble', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3055: {'name': 'Crimson Skull Healer', 'profession': ['Monk'], 'attributes': [{'level': '7', 'name': 'Smiting Prayers'}], 'skills_used': ['Signet of Rage', 'Orison of Healing', 'Healing Burst'], 'armor_levels': {'Blunt damage': '29', 'Piercing damage': '29', 'Slashing damage': '29', 'Cold damage': '29', 'Earth damage': '29', 'Fire damage': '29', 'Lightning damage': '29'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Copper Crimson Skull Coin', 'Crimson Skull Cape', 'Ruby']},
-    3058: {'name': 'Gull Hookbeak', 'profession': ['Warrior', 'Ranger'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Healing Signet', 'Splinter Shot', 'Kindle Arrows', 'Penetrating Attack', 'Silverwing Slash', 'Escape'], 'armor_levels': {}, 'items_dropped': []},
-    3059: {'name': 'Yrrg Snagtooth', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Endure Pain', 'Yeti Smash'], 'armor_levels': {}, 'items_dropped': []},
-    3060: {'name': 'Yorrt Strongjaw', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Yeti Smash', 'Healing Signet', 'Endure Pain', 'Staggering Blow'], 'armor_levels': {}, 'items_dropped': []},
-    3069: {'name': 'Canthan Guard', 'profession': ['Warrior', 'Ranger'], 'attributes': [{'level': '14...16', 'name': 'Tactics'}], 'skills_used': ['Troll Unguent', 'Endure Pain', 'Triple Chop', 'Distracting Shot', 'Healing Spring', "Protector's Defense", "Bull's Strike", '"Watch Yourself!"', 'Barrage', 'Healing Signet', 'Seeking Blade', 'Cyclone Axe', 'Lightning Touch', "Dryder's Defenses", 'Dancing Daggers', 'Dark Prison', 'Dismember', 'Gash', 'Crippling Slash', 'Poison Tip Signet', "Lion's Comfort", 'Splinter Weapon'], 'armor_levels': {}, 'items_dropped': []},
-    3229: {'name': 'Canthan Guard', 'profession': ['Warrior', 'Ranger'], 'attributes': [{'level': '14...16', 'name': 'Tactics'}], 'skills_used': ['Troll Unguent', 'Endure Pain', 'Triple Chop', 'Distracting Shot', 'Healing Spring', "Protector's Defense", "Bull's Strike", '"Watch Yourself!"', 'Barrage', 'Healing Signet', 'Seeking Blade', 'Cyclone Axe', 'Lightning Touch', "Dryder's Defenses", 'Dancing Daggers', 'Dark Prison', 'Dismember', 'Gash', 'Crippling Slash', 'Poison Tip Signet', "Lion's Comfort", 'Splinter Weapon'], 'armor_levels': {}, 'items_dropped': []},
-    3077: {'name': 'Headmaster Vhang', 'profession': ['Elementalist', 'Dervish'], 'attributes': [], 'skills_used': ['Lightning Orb', 'Glyph of Lesser Energy', 'Shock Arrow', "Teinai's Prison", 'Aura of Restoration', 'Resurrection Signet', 'Chain Lightning', 'Air Attunement', 'Lightning Surge', 'Blinding Flash', 'Glyph of Elemental Power', 'Mind Shock', 'Mystic Regeneration', 'Lightning Strike', 'Conjure Lightning', 'Armor of Sanctity', 'Arc Lightning'], 'armor_levels': {}, 'items_dropped': []},
-    3336: {'name': 'Headmaster Vhang', 'profession': ['Elementalist', 'Dervish'], 'attributes': [], 'skills_used': ['Lightning Orb', 'Glyph of Lesser Energy', 'Shock Arrow', "Teinai's Prison", 'Aura of Restoration', 'Resurrection Signet', 'Chain Lightning', 'Air Attunement', 'Lightning Surge', 'Blinding Flash', 'Glyph of Elemental Power', 'Mind Shock', 'Mystic Regeneration', 'Lightning Strike', 'Conjure Lightning', 'Armor of Sanctity', 'Arc Lightning'], 'armor_levels': {}, 'items_dropped': []},
-    3490: {'name': 'Headmaster Vhang', 'profession': ['Elementalist', 'Dervish'], 'attributes': [], 'skills_used': ['Lightning Orb', 'Glyph of Lesser Energy', 'Shock Arrow', "Teinai's Prison", 'Aura of Restoration', 'Resurrection Signet', 'Chain Lightning', 'Air Attunement', 'Lightning Surge', 'Blinding Flash', 'Glyph of Elemental Power', 'Mind Shock', 'Mystic Regeneration', 'Lightning Strike', 'Conjure Lightning', 'Armor of Sanctity', 'Arc Lightning'], 'armor_levels': {}, 'items_dropped': []},
-    3078: {'name': 'Master Togo', 'profession': ['Ritualist'], 'attributes': [{'level': '15', 'name': 'Restoration Magic'}], 'skills_used': ['Spirit Burn (Togo)', 'Spirit Burn', 'Offering of Spirit (Togo)', 'Spirit Rift (Togo)', 'Essence Strike (Togo)', 'Call to the Spirit Realm', 'Vengeful Weapon', 'Spirit Rift', 'Disenchantment (Togo)', 'Vengeful Was Khanhei', 'Mend Body and Soul (Togo)', 'Dragon Empire Rage', 'Recuperation'], 'armor_levels': {}, 'items_dropped': []},
-    3081: {'name': 'Master Togo', 'profession': ['Ritualist'], 'attributes': [{'level': '15', 'name': 'Restoration Magic'}], 'skills_used': ['Spirit Burn (Togo)', 'Spirit Burn', 'Offering of Spirit (Togo)', 'Spirit Rift (Togo)', 'Essence Strike (Togo)', 'Call to the Spirit Realm', 'Vengeful Weapon', 'Spirit Rift', 'Disenchantment (Togo)', 'Vengeful Was Khanhei', 'Mend Body and Soul (Togo)', 'Dragon Empire Rage', 'Recuperation'], 'armor_levels': {}, 'items_dropped': []},
-    3120: {'name': 'Master Togo', 'profession': ['Ritualist'], 'attributes': [{'level': '15', 'name': 'Restoration Magic'}], 'skills_used': ['Spirit Burn (Togo)', 'Spirit Burn', 'Offering of Spirit (Togo)', 'Spirit Rift (Togo)', 'Essence Strike (Togo)', 'Call to the Spirit Realm', 'Vengeful Weapon', 'Spirit Rift', 'Disenchantment (Togo)', 'Vengeful Was Khanhei', 'Mend Body and Soul (Togo)', 'Dragon Empire Rage', 'Recuperation'], 'armor_levels': {}, 'items_dropped': []},
-    3215: {'name': 'Master Togo', 'profession': ['Ritualist'], 'attributes': [{'level': '15', 'name': 'Restoration Magic'}], 'skills_used': ['Spirit Burn (Togo)', 'Spirit Burn', 'Offering of Spirit (Togo)', 'Spirit Rift (Togo)', 'Essence Strike (Togo)', 'Call to the Spirit Realm', 'Vengeful Weapon', 'Spirit Rift', 'Disenchantment (Togo)', 'Vengeful Was Khanhei', 'Mend Body and Soul (Togo)', 'Dragon Empire Rage', 'Recuperation'], 'armor_levels': {}, 'items_dropped': []},
-    3079: {'name': 'Zaishen Scout', 'profession': ['Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3082: {'name': 'Yijo Tahn', 'profession': ['Ritualist'], 'attributes': [], 'skills_used': ['Spirit Burn', 'Vengeful Weapon', 'Spirit Rift'], 'armor_levels': {}, 'items_dropped': []},
-    3094: {'name': 'Shady Luxon', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3095: {'name': 'Suspicious Kurzick', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3097: {'name': 'Zhu Hanuku', 'profession': ['Mesmer', 'Monk'], 'attributes': [], 'skills_used': ['Stun Immunity', 'Stun on Critical Hit', 'Light of Dwayna', 'Jade Fury', 'Natural Resistance', 'Resurrect (monster skill)'], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '100', 'Slashing damage': '100', 'Cold damage': '130', 'Earth damage': '130', 'Fire damage': '130', 'Lightning damage': '130'}, 'items_dropped': ['Kraken Eye', 'Monstrous Eye', 'Monstrous Fang', 'Regurgitated Mass']},
-    3122: {'name': 'Shadow Blade Assassin', 'profession': ['Assassin'], 'attributes': [{'level': '0', 'name': 'Deadly Arts'}], 'skills_used': ['Entangling Asp', 'Golden Lotus Strike', "Assassin's Promise"], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Plague Idol']},
-    3157: {'name': 'Am Fah Assassin', 'profession': ['Assassin', 'Mesmer'], 'attributes': [{'level': '15', 'name': 'Dagger Mastery'}, {'level': '7..8', 'name': 'Shadow Arts'}, {'level': '17..18 Shadow Arts in', 'name': 'Hard mode'}], 'skills_used': ['Shadow Refuge', 'Epidemic', 'Impale', 'Malicious Strike', 'Entangling Asp', 'Swap', 'Fox Fangs', 'Blinding Powder', 'Jagged Strike', 'Flashing Blades', 'Unsuspecting Strike', 'Temple Strike'], 'armor_levels': {'Blunt damage': '70', 'Piercing damage': '70', 'Slashing damage': '70', 'Cold damage': '70', 'Earth damage': '70', 'Fire damage': '70', 'Lightning damage': '70'}, 'items_dropped': ['Am Fah Cape', 'Bolt of Cloth', 'Bolt of Linen', 'Plague Idol', 'Sapphire']},
-    4191: {'name': 'Am Fah Assassin', 'profession': ['Assassin', 'Mesmer'], 'attributes': [{'level': '15', 'name': 'Dagger Mastery'}, {'level': '7..8', 'name': 'Shadow Arts'}, {'level': '17..18 Shadow Arts in', 'name': 'Hard mode'}], 'skills_used': ['Shadow Refuge', 'Epidemic', 'Impale', 'Malicious Strike', 'Entangling Asp', 'Swap', 'Fox Fangs', 'Blinding Powder', 'Jagged Strike', 'Flashing Blades', 'Unsuspecting Strike', 'Temple Strike'], 'armor_levels': {'Blunt damage': '70', 'Piercing damage': '70', 'Slashing damage': '70', 'Cold damage': '70', 'Earth damage': '70', 'Fire damage': '70', 'Lightning damage': '70'}, 'items_dropped': ['Am Fah Cape', 'Bolt of Cloth', 'Bolt of Linen', 'Plague Idol', 'Sapphire']},
-    3159: {'name': 'Luxon Assassin', 'profession': ['Assassin'], 'attributes': [{'level': '(20', 'name': 'Deadly Arts'}], 'skills_used': ['Horns of the Ox', 'Fox Fangs', 'Iron Palm', 'Way of the Empty Palm', 'Death Blossom'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Jadeite Shard', 'Luxon Garb', 'Luxon Pendant']},
-    3569: {'name': 'Luxon Assassin', 'profession': ['Assassin'], 'attributes': [{'level': '(20', 'name': 'Deadly Arts'}], 'skills_used': ['Horns of the Ox', 'Fox Fangs', 'Iron Palm', 'Way of the Empty Palm', 'Death Blossom'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Jadeite Shard', 'Luxon Garb', 'Luxon Pendant']},
-    3603: {'name': 'Luxon Assassin', 'profession': ['Assassin'], 'attributes': [{'level': '(20', 'name': 'Deadly Arts'}], 'skills_used': ['Horns of the Ox', 'Fox Fangs', 'Iron Palm', 'Way of the Empty Palm', 'Death Blossom'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Jadeite Shard', 'Luxon Garb', 'Luxon Pendant']},
-    3160: {'name': 'Luxon Mesmer', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Illusion Magic'}], 'skills_used': ['Ether Feast', 'Power Leech', 'Conjure Nightmare', 'Conjure Phantasm', 'Drain Enchantment'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Luxon Garb', 'Luxon Pendant']},
-    3570: {'name': 'Luxon Mesmer', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Illusion Magic'}], 'skills_used': ['Ether Feast', 'Power Leech', 'Conjure Nightmare', 'Conjure Phantasm', 'Drain Enchantment'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Luxon Garb', 'Luxon Pendant']},
-    3614: {'name': 'Luxon Mesmer', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Illusion Magic'}], 'skills_used': ['Ether Feast', 'Power Leech', 'Conjure Nightmare', 'Conjure Phantasm', 'Drain Enchantment'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Luxon Garb', 'Luxon Pendant']},
-    3161: {'name': 'Luxon Elementalist', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Water Magic'}], 'skills_used': ['Aura of Restoration', 'Rust', 'Mind Freeze', 'Vapor Blade'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Jadeite Shard', 'Luxon Garb', 'Luxon Pendant']},
-    3572: {'name': 'Luxon Elementalist', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Water Magic'}], 'skills_used': ['Aura of Restoration', 'Rust', 'Mind Freeze', 'Vapor Blade'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Jadeite Shard', 'Luxon Garb', 'Luxon Pendant']},
-    3615: {'name': 'Luxon Elementalist', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Water Magic'}], 'skills_used': ['Aura of Restoration', 'Rust', 'Mind Freeze', 'Vapor Blade'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Jadeite Shard', 'Luxon Garb', 'Luxon Pendant']},
-    3162: {'name': 'Luxon Monk', 'profession': ['Monk'], 'attributes': [], 'skills_used': ["Karei's Healing Circle", 'Word of Healing', 'Healing Breeze', 'Signet of Rejuvenation'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Luxon Garb', 'Luxon Pendant']},
-    3339: {'name': 'Luxon Monk', 'profession': ['Monk'], 'attributes': [], 'skills_used': ["Karei's Healing Circle", 'Word of Healing', 'Healing Breeze', 'Signet of Rejuvenation'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Luxon Garb', 'Luxon Pendant']},
-    3616: {'name': 'Luxon Monk', 'profession': ['Monk'], 'attributes': [], 'skills_used': ["Karei's Healing Circle", 'Word of Healing', 'Healing Breeze', 'Signet of Rejuvenation'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Luxon Garb', 'Luxon Pendant']},
-    3643: {'name': 'Luxon Monk', 'profession': ['Monk'], 'attributes': [], 'skills_used': ["Karei's Healing Circle", 'Word of Healing', 'Healing Breeze', 'Signet of Rejuvenation'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Luxon Garb', 'Luxon Pendant']},
-    3163: {'name': 'Luxon Warrior', 'profession': ['Warrior'], 'attributes': [{'level': '14-16', 'name': 'Strength'}], 'skills_used': ['Auspicious Blow', 'Healing Signet', 'Berserker Stance', 'Staggering Blow', 'Renewing Smash', '"Coward!"'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Jadeite Shard', 'Luxon Armor', 'Luxon Pendant']},
-    3574: {'name': 'Luxon Warrior', 'profession': ['Warrior'], 'attributes': [{'level': '14-16', 'name': 'Strength'}], 'skills_used': ['Auspicious Blow', 'Healing Signet', 'Berserker Stance', 'Staggering Blow', 'Renewing Smash', '"Coward!"'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Jadeite Shard', 'Luxon Armor', 'Luxon Pendant']},
-    3164: {'name': 'Luxon Ranger', 'profession': ['Ranger'], 'attributes': [{'level': '15', 'name': 'Beast Mastery'}], 'skills_used': ['Disrupting Lunge', 'Charm Animal (monster skill)', 'Heal as One', 'Pounce', 'Run as One'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Jadeite Shard', 'Luxon Bracers', 'Luxon Pendant']},
-    3575: {'name': 'Luxon Ranger', 'profession': ['Ranger'], 'attributes': [{'level': '15', 'name': 'Beast Mastery'}], 'skills_used': ['Disrupting Lunge', 'Charm Animal (monster skill)', 'Heal as One', 'Pounce', 'Run as One'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Jadeite Shard', 'Luxon Bracers', 'Luxon Pendant']},
-    3595: {'name': 'Luxon Ranger', 'profession': ['Ranger'], 'attributes': [{'level': '15', 'name': 'Beast Mastery'}], 'skills_used': ['Disrupting Lunge', 'Charm Animal (monster skill)', 'Heal as One', 'Pounce', 'Run as One'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Jadeite Shard', 'Luxon Bracers', 'Luxon Pendant']},
-    3607: {'name': 'Luxon Ranger', 'profession': ['Ranger'], 'attributes': [{'level': '15', 'name': 'Beast Mastery'}], 'skills_used': ['Disrupting Lunge', 'Charm Animal (monster skill)', 'Heal as One', 'Pounce', 'Run as One'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Jadeite Shard', 'Luxon Bracers', 'Luxon Pendant']},
-    3196: {'name': 'Emperor Kisu', 'profession': ['Ritualist', 'Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast'], 'armor_levels': {}, 'items_dropped': []},
-    3219: {'name': 'Jamei', 'profession': ['Monk'], 'attributes': [{'level': '12', 'name': 'Divine Favor'}, {'level': '12', 'name': 'Healing Prayers'}], 'skills_used': ['Purge Signet', 'Orison of Healing', 'Empathic Removal', "Heaven's Delight", 'Divine Intervention', "Jamei's Gaze", 'Resurrection Chant', 'Word of Healing', 'Healing Breeze', 'Signet of Rejuvenation'], 'armor_levels': {}, 'items_dropped': []},
-    3941: {'name': 'Jamei', 'profession': ['Monk'], 'attributes': [{'level': '12', 'name': 'Divine Favor'}, {'level': '12', 'name': 'Healing Prayers'}], 'skills_used': ['Purge Signet', 'Orison of Healing', 'Empathic Removal', "Heaven's Delight", 'Divine Intervention', "Jamei's Gaze", 'Resurrection Chant', 'Word of Healing', 'Healing Breeze', 'Signet of Rejuvenation'], 'armor_levels': {}, 'items_dropped': []},
-    3226: {'name': 'Talon Silverwing', 'profession': ['Warrior', 'Ranger'], 'attributes': [], 'skills_used': ['"Shields Up!"', 'Enraging Charge', '"Charge!"', 'Hamstring', 'Sprint', 'Riposte', 'Symbolic Strike', 'Dragon Slash', '"For Great Justice!"', "Griffon's Sweep", 'Power Attack', 'Sun and Moon Slash', 'Healing Signet', 'Seeking Blade', 'Quivering Blade', 'Tiger Stance', 'Resurrection Signet', 'Gash', 'Crippling Slash', 'Savage Slash', 'Poison Tip Signet', 'Silverwing Slash', 'Balanced Stance'], 'armor_levels': {}, 'items_dropped': []},
-    3471: {'name': 'Talon Silverwing', 'profession': ['Warrior', 'Ranger'], 'attributes': [], 'skills_used': ['"Shields Up!"', 'Enraging Charge', '"Charge!"', 'Hamstring', 'Sprint', 'Riposte', 'Symbolic Strike', 'Dragon Slash', '"For Great Justice!"', "Griffon's Sweep", 'Power Attack', 'Sun and Moon Slash', 'Healing Signet', 'Seeking Blade', 'Quivering Blade', 'Tiger Stance', 'Resurrection Signet', 'Gash', 'Crippling Slash', 'Savage Slash', 'Poison Tip Signet', 'Silverwing Slash', 'Balanced Stance'], 'armor_levels': {}, 'items_dropped': []},
-    3501: {'name': 'Talon Silverwing', 'profession': ['Warrior', 'Ranger'], 'attributes': [], 'skills_used': ['"Shields Up!"', 'Enraging Charge', '"Charge!"', 'Hamstring', 'Sprint', 'Riposte', 'Symbolic Strike', 'Dragon Slash', '"For Great Justice!"', "Griffon's Sweep", 'Power Attack', 'Sun and Moon Slash', 'Healing Signet', 'Seeking Blade', 'Quivering Blade', 'Tiger Stance', 'Resurrection Signet', 'Gash', 'Crippling Slash', 'Savage Slash', 'Poison Tip Signet', 'Silverwing Slash', 'Balanced Stance'], 'armor_levels': {}, 'items_dropped': []},
-    5992: {'name': 'Talon Silverwing', 'profession': ['Warrior', 'Ranger'], 'attributes': [], 'skills_used': ['"Shields Up!"', 'Enraging Charge', '"Charge!"', 'Hamstring', 'Sprint', 'Riposte', 'Symbolic Strike', 'Dragon Slash', '"For Great Justice!"', "Griffon's Sweep", 'Power Attack', 'Sun and Moon Slash', 'Healing Signet', 'Seeking Blade', 'Quivering Blade', 'Tiger Stance', 'Resurrection Signet', 'Gash', 'Crippling Slash', 'Savage Slash', 'Poison Tip Signet', 'Silverwing Slash', 'Balanced Stance'], 'armor_levels': {}, 'items_dropped': []},
-    3231: {'name': 'Canthan Guard Captain', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    3338: {'name': 'Canthan Guard Captain', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    3232: {'name': 'Palace Guard', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', '"Shields Up!"'], 'armor_levels': {}, 'items_dropped': []},
-    5636: {'name': 'Palace Guard', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', '"Shields Up!"'], 'armor_levels': {}, 'items_dropped': []},
-    3238: {'name': 'Canthan Child', 'profession': ['Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3241: {'name': 'Canthan Noble', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3242: {'name': 'Canthan Noble', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3243: {'name': 'Canthan Noble', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3244: {'name': 'Canthan Noble', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3304: {'name': 'Canthan Noble', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3317: {'name': 'Canthan Noble', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3333: {'name': 'Canthan Noble', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3334: {'name': 'Canthan Noble', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3247: {'name': 'Canthan Peasant', 'profession': ['Warrior', 'Ranger', 'Monk', 'Assassin'], 'attributes': [{'level': '15', 'name': 'Divine Favor'}, {'level': '15', 'name': 'Healing Prayers'}], 'skills_used': ['Healing Touch', 'Disrupting Shot', 'Crushing Blow', 'Orison of Healing', 'Power Shot', 'Troll Unguent', 'Golden Fox Strike', 'Shadow Refuge', 'Healing Signet', 'Fox Fangs', 'Hammer Bash', 'Healing Hands', 'Remove Hex', 'Healing Seed', 'Healing Breeze'], 'armor_levels': {}, 'items_dropped': []},
-    3252: {'name': 'Canthan Peasant', 'profession': ['Warrior', 'Ranger', 'Monk', 'Assassin'], 'attributes': [{'level': '15', 'name': 'Divine Favor'}, {'level': '15', 'name': 'Healing Prayers'}], 'skills_used': ['Healing Touch', 'Disrupting Shot', 'Crushing Blow', 'Orison of Healing', 'Power Shot', 'Troll Unguent', 'Golden Fox Strike', 'Shadow Refuge', 'Healing Signet', 'Fox Fangs', 'Hammer Bash', 'Healing Hands', 'Remove Hex', 'Healing Seed', 'Healing Breeze'], 'armor_levels': {}, 'items_dropped': []},
-    3248: {'name': 'Canthan Peasant', 'profession': ['Warrior', 'Ranger', 'Monk', 'Assassin'], 'attributes': [{'level': '15', 'name': 'Divine Favor'}, {'level': '15', 'name': 'Healing Prayers'}], 'skills_used': ['Healing Touch', 'Disrupting Shot', 'Crushing Blow', 'Orison of Healing', 'Power Shot', 'Troll Unguent', 'Golden Fox Strike', 'Shadow Refuge', 'Healing Signet', 'Fox Fangs', 'Hammer Bash', 'Healing Hands', 'Remove Hex', 'Healing Seed', 'Healing Breeze'], 'armor_levels': {}, 'items_dropped': []},
-    3256: {'name': 'Canthan Peasant', 'profession': ['Warrior', 'Ranger', 'Monk', 'Assassin'], 'attributes': [{'level': '15', 'name': 'Divine Favor'}, {'level': '15', 'name': 'Healing Prayers'}], 'skills_used': ['Healing Touch', 'Disrupting Shot', 'Crushing Blow', 'Orison of Healing', 'Power Shot', 'Troll Unguent', 'Golden Fox Strike', 'Shadow Refuge', 'Healing Signet', 'Fox Fangs', 'Hammer Bash', 'Healing Hands', 'Remove Hex', 'Healing Seed', 'Healing Breeze'], 'armor_levels': {}, 'items_dropped': []},
-    3258: {'name': 'Canthan Peasant', 'profession': ['Warrior', 'Ranger', 'Monk', 'Assassin'], 'attributes': [{'level': '15', 'name': 'Divine Favor'}, {'level': '15', 'name': 'Healing Prayers'}], 'skills_used': ['Healing Touch', 'Disrupting Shot', 'Crushing Blow', 'Orison of Healing', 'Power Shot', 'Troll Unguent', 'Golden Fox Strike', 'Shadow Refuge', 'Healing Signet', 'Fox Fangs', 'Hammer Bash', 'Healing Hands', 'Remove Hex', 'Healing Seed', 'Healing Breeze'], 'armor_levels': {}, 'items_dropped': []},
-    3266: {'name': 'Canthan Peasant', 'profession': ['Warrior', 'Ranger', 'Monk', 'Assassin'], 'attributes': [{'level': '15', 'name': 'Divine Favor'}, {'level': '15', 'name': 'Healing Prayers'}], 'skills_used': ['Healing Touch', 'Disrupting Shot', 'Crushing Blow', 'Orison of Healing', 'Power Shot', 'Troll Unguent', 'Golden Fox Strike', 'Shadow Refuge', 'Healing Signet', 'Fox Fangs', 'Hammer Bash', 'Healing Hands', 'Remove Hex', 'Healing Seed', 'Healing Breeze'], 'armor_levels': {}, 'items_dropped': []},
-    3289: {'name': 'Canthan Peasant', 'profession': ['Warrior', 'Ranger', 'Monk', 'Assassin'], 'attributes': [{'level': '15', 'name': 'Divine Favor'}, {'level': '15', 'name': 'Healing Prayers'}], 'skills_used': ['Healing Touch', 'Disrupting Shot', 'Crushing Blow', 'Orison of Healing', 'Power Shot', 'Troll Unguent', 'Golden Fox Strike', 'Shadow Refuge', 'Healing Signet', 'Fox Fangs', 'Hammer Bash', 'Healing Hands', 'Remove Hex', 'Healing Seed', 'Healing Breeze'], 'armor_levels': {}, 'items_dropped': []},
-    3303: {'name': 'Canthan Peasant', 'profession': ['Warrior', 'Ranger', 'Monk', 'Assassin'], 'attributes': [{'level': '15', 'name': 'Divine Favor'}, {'level': '15', 'name': 'Healing Prayers'}], 'skills_used': ['Healing Touch', 'Disrupting Shot', 'Crushing Blow', 'Orison of Healing', 'Power Shot', 'Troll Unguent', 'Golden Fox Strike', 'Shadow Refuge', 'Healing Signet', 'Fox Fangs', 'Hammer Bash', 'Healing Hands', 'Remove Hex', 'Healing Seed', 'Healing Breeze'], 'armor_levels': {}, 'items_dropped': []},
-    3249: {'name': 'Kurzick Guard', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', 'Power Attack', 'Final Thrust', 'Seeking Blade'], 'armor_levels': {}, 'items_dropped': []},
-    3388: {'name': 'Kurzick Guard', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', 'Power Attack', 'Final Thrust', 'Seeking Blade'], 'armor_levels': {}, 'items_dropped': []},
-    3430: {'name': 'Kurzick Guard', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', 'Power Attack', 'Final Thrust', 'Seeking Blade'], 'armor_levels': {}, 'items_dropped': []},
-    3431: {'name': 'Kurzick Guard', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', 'Power Attack', 'Final Thrust', 'Seeking Blade'], 'armor_levels': {}, 'items_dropped': []},
-    3429: {'name': 'Kurzick Guard', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', 'Power Attack', 'Final Thrust', 'Seeking Blade'], 'armor_levels': {}, 'items_dropped': []},
-    3255: {'name': 'Projects/NPC models/Humans/Canthans', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3310: {'name': 'Projects/NPC models/Humans/Canthans', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3267: {'name': 'Projects/NPC models/Humans/Canthans', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3269: {'name': 'Canthan Trader', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3270: {'name': 'Canthan Trader', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3275: {'name': 'Canthan Trader', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3279: {'name': 'Canthan Trader', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3288: {'name': 'Canthan Trader', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3295: {'name': 'Canthan Trader', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3311: {'name': 'Canthan Trader', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3272: {'name': 'Projects/NPC models/Humans/Canthans', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3273: {'name': 'Projects/NPC models/Humans/Canthans', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3281: {'name': 'Projects/NPC models/Humans/Canthans', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3274: {'name': 'Fireworks Master', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3280: {'name': 'Projects/NPC models/Humans/Canthans', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3290: {'name': 'Projects/NPC models/Humans/Canthans', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3292: {'name': 'Projects/NPC models/Humans/Canthans', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3309: {'name': 'Su', 'profession': ['Necromancer'], 'attributes': [{'level': '11', 'name': 'Soul Reaping'}, {'level': '12', 'name': 'Death Magic'}], 'skills_used': ['Vile Miasma', 'Animate Flesh Golem', 'Animate Vampiric Horror', 'Resurrection Signet', 'Taste of Death', 'Rising Bile', 'Barbs', 'Life Siphon', 'Putrid Explosion', 'Deathly Swarm'], 'armor_levels': {}, 'items_dropped': []},
-    3468: {'name': 'Su', 'profession': ['Necromancer'], 'attributes': [{'level': '11', 'name': 'Soul Reaping'}, {'level': '12', 'name': 'Death Magic'}], 'skills_used': ['Vile Miasma', 'Animate Flesh Golem', 'Animate Vampiric Horror', 'Resurrection Signet', 'Taste of Death', 'Rising Bile', 'Barbs', 'Life Siphon', 'Putrid Explosion', 'Deathly Swarm'], 'armor_levels': {}, 'items_dropped': []},
-    3498: {'name': 'Su', 'profession': ['Necromancer'], 'attributes': [{'level': '11', 'name': 'Soul Reaping'}, {'level': '12', 'name': 'Death Magic'}], 'skills_used': ['Vile Miasma', 'Animate Flesh Golem', 'Animate Vampiric Horror', 'Resurrection Signet', 'Taste of Death', 'Rising Bile', 'Barbs', 'Life Siphon', 'Putrid Explosion', 'Deathly Swarm'], 'armor_levels': {}, 'items_dropped': []},
-    3315: {'name': 'Sister Tai', 'profession': ['Monk'], 'attributes': [{'level': '12', 'name': 'Divine Favor'}, {'level': '12', 'name': 'Healing Prayers'}, {'level': '15 Healing Prayers as ally in', 'name': 'Unwaking Waters'}], 'skills_used': ['Orison of Healing', 'Blessed Light', 'Star Shine', "Heaven's Delight", 'Divine Intervention', "Jamei's Gaze", 'Resurrection Chant', 'Healing Breeze', 'Signet of Rejuvenation'], 'armor_levels': {}, 'items_dropped': []},
-    3470: {'name': 'Sister Tai', 'profession': ['Monk'], 'attributes': [{'level': '12', 'name': 'Divine Favor'}, {'level': '12', 'name': 'Healing Prayers'}, {'level': '15 Healing Prayers as ally in', 'name': 'Unwaking Waters'}], 'skills_used': ['Orison of Healing', 'Blessed Light', 'Star Shine', "Heaven's Delight", 'Divine Intervention', "Jamei's Gaze", 'Resurrection Chant', 'Healing Breeze', 'Signet of Rejuvenation'], 'armor_levels': {}, 'items_dropped': []},
-    3500: {'name': 'Sister Tai', 'profession': ['Monk'], 'attributes': [{'level': '12', 'name': 'Divine Favor'}, {'level': '12', 'name': 'Healing Prayers'}, {'level': '15 Healing Prayers as ally in', 'name': 'Unwaking Waters'}], 'skills_used': ['Orison of Healing', 'Blessed Light', 'Star Shine', "Heaven's Delight", 'Divine Intervention', "Jamei's Gaze", 'Resurrection Chant', 'Healing Breeze', 'Signet of Rejuvenation'], 'armor_levels': {}, 'items_dropped': []},
-    3512: {'name': 'Sister Tai', 'profession': ['Monk'], 'attributes': [{'level': '12', 'name': 'Divine Favor'}, {'level': '12', 'name': 'Healing Prayers'}, {'level': '15 Healing Prayers as ally in', 'name': 'Unwaking Waters'}], 'skills_used': ['Orison of Healing', 'Blessed Light', 'Star Shine', "Heaven's Delight", 'Divine Intervention', "Jamei's Gaze", 'Resurrection Chant', 'Healing Breeze', 'Signet of Rejuvenation'], 'armor_levels': {}, 'items_dropped': []},
-    3320: {'name': 'Weng Gha', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Drunken Blow', 'Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    3326: {'name': 'Projects/NPC models/Humans/Canthans', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3330: {'name': 'Professor Gai', 'profession': ['Ritualist'], 'attributes': [{'level': '9', 'name': 'Communing'}, {'level': '12', 'name': 'Restoration Magic'}, {'level': '9', 'name': 'Spawning Power'}], 'skills_used': ['Spirit Light', 'Union', 'Shelter', 'Mend Body and Soul', 'Soothing Memories', 'Weapon of Warding', 'Vengeful Weapon', 'Flesh of My Flesh', 'Attuned Was Songkai'], 'armor_levels': {}, 'items_dropped': []},
-    3473: {'name': 'Professor Gai', 'profession': ['Ritualist'], 'attributes': [{'level': '9', 'name': 'Communing'}, {'level': '12', 'name': 'Restoration Magic'}, {'level': '9', 'name': 'Spawning Power'}], 'skills_used': ['Spirit Light', 'Union', 'Shelter', 'Mend Body and Soul', 'Soothing Memories', 'Weapon of Warding', 'Vengeful Weapon', 'Flesh of My Flesh', 'Attuned Was Songkai'], 'armor_levels': {}, 'items_dropped': []},
-    3503: {'name': 'Professor Gai', 'profession': ['Ritualist'], 'attributes': [{'level': '9', 'name': 'Communing'}, {'level': '12', 'name': 'Restoration Magic'}, {'level': '9', 'name': 'Spawning Power'}], 'skills_used': ['Spirit Light', 'Union', 'Shelter', 'Mend Body and Soul', 'Soothing Memories', 'Weapon of Warding', 'Vengeful Weapon', 'Flesh of My Flesh', 'Attuned Was Songkai'], 'armor_levels': {}, 'items_dropped': []},
-    3332: {'name': 'Projects/NPC models/Ghosts', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3335: {'name': 'Fortune Teller', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Power Drain', 'Crippling Anguish', 'Ether Feast', 'Conjure Phantasm'], 'armor_levels': {}, 'items_dropped': []},
-    3340: {'name': 'Projects/NPC models/Humans/Canthans', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3348: {'name': 'General Kaimer Vasburg', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', 'Power Attack', 'Healing Signet', 'Seeking Blade', 'Savage Slash'], 'armor_levels': {}, 'items_dropped': ['Kurzick Bauble']},
-    3349: {'name': 'Kurzick Juggernaut', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Juggernaut Toss', 'Aura of the Juggernaut', 'Stun Immunity'], 'armor_levels': {}, 'items_dropped': ['Amber Chunk', 'Bolt of Cloth', 'Bolt of Silk', 'Kurzick Bauble']},
-    3350: {'name': 'Kurzick Assassin', 'profession': ['Assassin'], 'attributes': [], 'skills_used': ["Viper's Defense", 'Fox Fangs', 'Moebius Strike', 'Iron Palm', 'Death Blossom', 'Dark Prison'], 'armor_levels': {}, 'items_dropped': ['Kurzick Attire', 'Kurzick Bauble']},
-    3405: {'name': 'Kurzick Assassin', 'profession': ['Assassin'], 'attributes': [], 'skills_used': ["Viper's Defense", 'Fox Fangs', 'Moebius Strike', 'Iron Palm', 'Death Blossom', 'Dark Prison'], 'armor_levels': {}, 'items_dropped': ['Kurzick Attire', 'Kurzick Bauble']},
-    3351: {'name': 'Kurzick Mesmer', 'profession': ['Mesmer'], 'attributes': [{'level': '(20', 'name': 'Domination Magic'}], 'skills_used': ['Psychic Instability', 'Complicate', 'Mind Wrack', 'Power Spike', 'Feedback'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Kurzick Bauble']},
-    3393: {'name': 'Kurzick Mesmer', 'profession': ['Mesmer'], 'attributes': [{'level': '(20', 'name': 'Domination Magic'}], 'skills_used': ['Psychic Instability', 'Complicate', 'Mind Wrack', 'Power Spike', 'Feedback'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Kurzick Bauble']},
-    3352: {'name': 'Kurzick Necromancer', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Reckless Haste', 'Rising Bile', 'Defile Enchantments', 'Plague Signet', 'Death Nova'], 'armor_levels': {}, 'items_dropped': ['Kurzick Attire', 'Kurzick Bauble']},
-    3353: {'name': 'Kurzick Elementalist', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Earth Magic'}], 'skills_used': ['Obsidian Flame', 'Sliver Armor', 'Ward Against Melee', 'Unsteady Ground'], 'armor_levels': {}, 'items_dropped': ['Amber Chunk', 'Bolt of Cloth', 'Kurzick Attire', 'Kurzick Bauble']},
-    3354: {'name': 'Kurzick Monk', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Healing Seed', 'Signet of Devotion', 'Protective Spirit', 'Word of Healing'], 'armor_levels': {}, 'items_dropped': ['Amber Chunk', 'Kurzick Attire', 'Kurzick Bauble']},
-    3355: {'name': 'Kurzick Warrior', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', 'Power Attack', 'Seeking Blade', 'Sever Artery', 'Savage Slash'], 'armor_levels': {}, 'items_dropped': ['Amber Chunk', 'Bolt of Cloth', 'Bolt of Silk', 'Kurzick Armor', 'Kurzick Bauble']},
-    3356: {'name': 'Kurzick Ranger', 'profession': ['Ranger'], 'attributes': [{'level': '15', 'name': 'Marksmanship'}], 'skills_used': ['Bestial Fury', 'Power Shot', "Melandru's Shot", 'Pin Down', 'Sundering Attack'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Kurzick Armguard', 'Kurzick Bauble']},
-    3382: {'name': 'Kurzick Ranger', 'profession': ['Ranger'], 'attributes': [{'level': '15', 'name': 'Marksmanship'}], 'skills_used': ['Bestial Fury', 'Power Shot', "Melandru's Shot", 'Pin Down', 'Sundering Attack'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Kurzick Armguard', 'Kurzick Bauble']},
-    3357: {'name': 'Kurzick Ritualist', 'profession': ['Ritualist'], 'attributes': [{'level': '20', 'name': 'Communing'}], 'skills_used': ['Wanderlust', 'Pain', 'Disenchantment', 'Spirit Channeling'], 'armor_levels': {}, 'items_dropped': ['Kurzick Attire', 'Kurzick Bauble']},
-    3367: {'name': 'Kurzick Juggernaut', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Juggernaut Toss', 'Aura of the Juggernaut', 'Stun Immunity'], 'armor_levels': {}, 'items_dropped': ['Amber Chunk', 'Bolt of Cloth', 'Bolt of Silk', 'Kurzick Bauble']},
-    3384: {'name': 'Kurzick Quartermaster', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3385: {'name': 'War Captain Womack', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': ['Kurzick Bauble']},
-    3392: {'name': 'Kurzick Peasant', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3394: {'name': 'Kurzick Traveler', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3395: {'name': 'Kurzick Traveler', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3400: {'name': 'Kurzick Priest', 'profession': ['Monk'], 'attributes': [{'level': '14', 'name': 'Divine Favor'}, {'level': '15', 'name': 'Healing Prayers'}, {'level': '9', 'name': 'Protection Prayers'}], 'skills_used': ['Signet of Devotion', 'Protective Spirit', 'Word of Healing'], 'armor_levels': {}, 'items_dropped': []},
-    3426: {'name': 'Kurzick Priest', 'profession': ['Monk'], 'attributes': [{'level': '14', 'name': 'Divine Favor'}, {'level': '15', 'name': 'Healing Prayers'}, {'level': '9', 'name': 'Protection Prayers'}], 'skills_used': ['Signet of Devotion', 'Protective Spirit', 'Word of Healing'], 'armor_levels': {}, 'items_dropped': []},
-    3403: {'name': 'Projects/NPC models/Humans/Kurzicks', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3408: {'name': 'Kurzick Merchant', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    3427: {'name': 'Kurzick Merchant', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    3409: {'name': 'Projects/NPC models/Humans/Kurzicks', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3410: {'name': 'Projects/NPC models/Humans/Kurzicks', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3411: {'name': 'Projects/NPC models/Humans/Kurzicks', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3419: {'name': 'Projects/NPC models/Humans/Kurzicks', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3420: {'name': 'Projects/NPC models/Humans/Kurzicks', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3422: {'name': 'Projects/NPC models/Humans/Kurzicks', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3425: {'name': 'Projects/NPC models/Humans/Kurzicks', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3414: {'name': 'Kurzick Bureaucrat', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3416: {'name': 'Baron Mirek Vasburg', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3417: {'name': 'Count zu Heltzer', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3434: {'name': 'Mai', 'profession': ['Assassin'], 'attributes': [], 'skills_used': ['Shadow Refuge', "Viper's Defense", 'Entangling Asp', 'Resurrection Signet', 'Fox Fangs', 'Jagged Strike', 'Nine Tail Strike', 'Siphon Strength'], 'armor_levels': {}, 'items_dropped': []},
-    3440: {'name': 'Mai', 'profession': ['Assassin'], 'attributes': [], 'skills_used': ['Shadow Refuge', "Viper's Defense", 'Entangling Asp', 'Resurrection Signet', 'Fox Fangs', 'Jagged Strike', 'Nine Tail Strike', 'Siphon Strength'], 'armor_levels': {}, 'items_dropped': []},
-    3446: {'name': 'Mai', 'profession': ['Assassin'], 'attributes': [], 'skills_used': ['Shadow Refuge', "Viper's Defense", 'Entangling Asp', 'Resurrection Signet', 'Fox Fangs', 'Jagged Strike', 'Nine Tail Strike', 'Siphon Strength'], 'armor_levels': {}, 'items_dropped': []},
-    3452: {'name': 'Mai', 'profession': ['Assassin'], 'attributes': [], 'skills_used': ['Shadow Refuge', "Viper's Defense", 'Entangling Asp', 'Resurrection Signet', 'Fox Fangs', 'Jagged Strike', 'Nine Tail Strike', 'Siphon Strength'], 'armor_levels': {}, 'items_dropped': []},
-    3435: {'name': 'Kisai', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Air Magic'}], 'skills_used': ['Lightning Orb', "Teinai's Prison", 'Shock Arrow', 'Aura of Restoration', 'Resurrection Signet', 'Air Attunement', 'Lightning Strike', 'Lightning Javelin', 'Arc Lightning', 'Lightning Bolt', 'Blinding Surge', 'Gust'], 'armor_levels': {}, 'items_dropped': []},
-    3441: {'name': 'Kisai', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Air Magic'}], 'skills_used': ['Lightning Orb', "Teinai's Prison", 'Shock Arrow', 'Aura of Restoration', 'Resurrection Signet', 'Air Attunement', 'Lightning Strike', 'Lightning Javelin', 'Arc Lightning', 'Lightning Bolt', 'Blinding Surge', 'Gust'], 'armor_levels': {}, 'items_dropped': []},
-    3447: {'name': 'Kisai', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Air Magic'}], 'skills_used': ['Lightning Orb', "Teinai's Prison", 'Shock Arrow', 'Aura of Restoration', 'Resurrection Signet', 'Air Attunement', 'Lightning Strike', 'Lightning Javelin', 'Arc Lightning', 'Lightning Bolt', 'Blinding Surge', 'Gust'], 'armor_levels': {}, 'items_dropped': []},
-    3453: {'name': 'Kisai', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Air Magic'}], 'skills_used': ['Lightning Orb', "Teinai's Prison", 'Shock Arrow', 'Aura of Restoration', 'Resurrection Signet', 'Air Attunement', 'Lightning Strike', 'Lightning Javelin', 'Arc Lightning', 'Lightning Bolt', 'Blinding Surge', 'Gust'], 'armor_levels': {}, 'items_dropped': []},
-    3436: {'name': 'Taya', 'profession': ['Monk'], 'attributes': [{'level': 'Level 13 has 8-10', 'name': 'Healing Prayers'}], 'skills_used': ['Orison of Healing', 'Resurrect', 'Healing Light', "Jamei's Gaze", 'Remove Hex', 'Signet of Devotion', 'Healing Breeze', 'Signet of Rejuvenation'], 'armor_levels': {}, 'items_dropped': []},
-    3442: {'name': 'Taya', 'profession': ['Monk'], 'attributes': [{'level': 'Level 13 has 8-10', 'name': 'Healing Prayers'}], 'skills_used': ['Orison of Healing', 'Resurrect', 'Healing Light', "Jamei's Gaze", 'Remove Hex', 'Signet of Devotion', 'Healing Breeze', 'Signet of Rejuvenation'], 'armor_levels': {}, 'items_dropped': []},
-    3448: {'name': 'Taya', 'profession': ['Monk'], 'attributes': [{'level': 'Level 13 has 8-10', 'name': 'Healing Prayers'}], 'skills_used': ['Orison of Healing', 'Resurrect', 'Healing Light', "Jamei's Gaze", 'Remove Hex', 'Signet of Devotion', 'Healing Breeze', 'Signet of Rejuvenation'], 'armor_levels': {}, 'items_dropped': []},
-    3454: {'name': 'Taya', 'profession': ['Monk'], 'attributes': [{'level': 'Level 13 has 8-10', 'name': 'Healing Prayers'}], 'skills_used': ['Orison of Healing', 'Resurrect', 'Healing Light', "Jamei's Gaze", 'Remove Hex', 'Signet of Devotion', 'Healing Breeze', 'Signet of Rejuvenation'], 'armor_levels': {}, 'items_dropped': []},
-    3437: {'name': 'Lukas', 'profession': ['Warrior'], 'attributes': [{'level': '6', 'name': 'Tactics'}], 'skills_used': ['"Watch Yourself!"', 'Auspicious Parry', 'Power Attack', 'Healing Signet', 'Sprint', 'Resurrection Signet', 'Galrath Slash', 'Riposte', 'Deadly Riposte', 'Jaizhenju Strike', 'Quivering Blade', 'Standing Slash', 'Storm of Swords', '"Shields Up!"'], 'armor_levels': {}, 'items_dropped': []},
-    3443: {'name': 'Lukas', 'profession': ['Warrior'], 'attributes': [{'level': '6', 'name': 'Tactics'}], 'skills_used': ['"Watch Yourself!"', 'Auspicious Parry', 'Power Attack', 'Healing Signet', 'Sprint', 'Resurrection Signet', 'Galrath Slash', 'Riposte', 'Deadly Riposte', 'Jaizhenju Strike', 'Quivering Blade', 'Standing Slash', 'Storm of Swords', '"Shields Up!"'], 'armor_levels': {}, 'items_dropped': []},
-    3449: {'name': 'Lukas', 'profession': ['Warrior'], 'attributes': [{'level': '6', 'name': 'Tactics'}], 'skills_used': ['"Watch Yourself!"', 'Auspicious Parry', 'Power Attack', 'Healing Signet', 'Sprint', 'Resurrection Signet', 'Galrath Slash', 'Riposte', 'Deadly Riposte', 'Jaizhenju Strike', 'Quivering Blade', 'Standing Slash', 'Storm of Swords', '"Shields Up!"'], 'armor_levels': {}, 'items_dropped': []},
-    3455: {'name': 'Lukas', 'profession': ['Warrior'], 'attributes': [{'level': '6', 'name': 'Tactics'}], 'skills_used': ['"Watch Yourself!"', 'Auspicious Parry', 'Power Attack', 'Healing Signet', 'Sprint', 'Resurrection Signet', 'Galrath Slash', 'Riposte', 'Deadly Riposte', 'Jaizhenju Strike', 'Quivering Blade', 'Standing Slash', 'Storm of Swords', '"Shields Up!"'], 'armor_levels': {}, 'items_dropped': []},
-    3479: {'name': 'Lukas', 'profession': ['Warrior'], 'attributes': [{'level': '6', 'name': 'Tactics'}], 'skills_used': ['"Watch Yourself!"', 'Auspicious Parry', 'Power Attack', 'Healing Signet', 'Sprint', 'Resurrection Signet', 'Galrath Slash', 'Riposte', 'Deadly Riposte', 'Jaizhenju Strike', 'Quivering Blade', 'Standing Slash', 'Storm of Swords', '"Shields Up!"'], 'armor_levels': {}, 'items_dropped': []},
-    3508: {'name': 'Lukas', 'profession': ['Warrior'], 'attributes': [{'level': '6', 'name': 'Tactics'}], 'skills_used': ['"Watch Yourself!"', 'Auspicious Parry', 'Power Attack', 'Healing Signet', 'Sprint', 'Resurrection Signet', 'Galrath Slash', 'Riposte', 'Deadly Riposte', 'Jaizhenju Strike', 'Quivering Blade', 'Standing Slash', 'Storm of Swords', '"Shields Up!"'], 'armor_levels': {}, 'items_dropped': []},
-    3438: {'name': 'Yuun', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Power Shot', 'Troll Unguent', 'Resurrection Signet', 'Read the Wind', 'Needling Shot', "Melandru's Shot"], 'armor_levels': {}, 'items_dropped': []},
-    3444: {'name': 'Yuun', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Power Shot', 'Troll Unguent', 'Resurrection Signet', 'Read the Wind', 'Needling Shot', "Melandru's Shot"], 'armor_levels': {}, 'items_dropped': []},
-    3450: {'name': 'Yuun', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Power Shot', 'Troll Unguent', 'Resurrection Signet', 'Read the Wind', 'Needling Shot', "Melandru's Shot"], 'armor_levels': {}, 'items_dropped': []},
-    3456: {'name': 'Yuun', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Power Shot', 'Troll Unguent', 'Resurrection Signet', 'Read the Wind', 'Needling Shot', "Melandru's Shot"], 'armor_levels': {}, 'items_dropped': []},
-    3439: {'name': 'Aeson', 'profession': ['Ritualist'], 'attributes': [{'level': '12', 'name': 'Communing'}, {'level': '11', 'name': 'Spawning Power'}], 'skills_used': ['Pain', 'Doom', 'Disenchantment', 'Spirit Channeling', 'Union', 'Signet of Spirits', 'Essence Strike', 'Mend Body and Soul', 'Soothing Memories', 'Protective Was Kaolai', 'Spirit Siphon', 'Vengeful Weapon', 'Boon of Creation', 'Shadowsong', 'Celestial Summoning', 'Flesh of My Flesh'], 'armor_levels': {}, 'items_dropped': []},
-    3445: {'name': 'Aeson', 'profession': ['Ritualist'], 'attributes': [{'level': '12', 'name': 'Communing'}, {'level': '11', 'name': 'Spawning Power'}], 'skills_used': ['Pain', 'Doom', 'Disenchantment', 'Spirit Channeling', 'Union', 'Signet of Spirits', 'Essence Strike', 'Mend Body and Soul', 'Soothing Memories', 'Protective Was Kaolai', 'Spirit Siphon', 'Vengeful Weapon', 'Boon of Creation', 'Shadowsong', 'Celestial Summoning', 'Flesh of My Flesh'], 'armor_levels': {}, 'items_dropped': []},
-    3451: {'name': 'Aeson', 'profession': ['Ritualist'], 'attributes': [{'level': '12', 'name': 'Communing'}, {'level': '11', 'name': 'Spawning Power'}], 'skills_used': ['Pain', 'Doom', 'Disenchantment', 'Spirit Channeling', 'Union', 'Signet of Spirits', 'Essence Strike', 'Mend Body and Soul', 'Soothing Memories', 'Protective Was Kaolai', 'Spirit Siphon', 'Vengeful Weapon', 'Boon of Creation', 'Shadowsong', 'Celestial Summoning', 'Flesh of My Flesh'], 'armor_levels': {}, 'items_dropped': []},
-    3457: {'name': 'Aeson', 'profession': ['Ritualist'], 'attributes': [{'level': '12', 'name': 'Communing'}, {'level': '11', 'name': 'Spawning Power'}], 'skills_used': ['Pain', 'Doom', 'Disenchantment', 'Spirit Channeling', 'Union', 'Signet of Spirits', 'Essence Strike', 'Mend Body and Soul', 'Soothing Memories', 'Protective Was Kaolai', 'Spirit Siphon', 'Vengeful Weapon', 'Boon of Creation', 'Shadowsong', 'Celestial Summoning', 'Flesh of My Flesh'], 'armor_levels': {}, 'items_dropped': []},
-    3515: {'name': 'Aeson', 'profession': ['Ritualist'], 'attributes': [{'level': '12', 'name': 'Communing'}, {'level': '11', 'name': 'Spawning Power'}], 'skills_used': ['Pain', 'Doom', 'Disenchantment', 'Spirit Channeling', 'Union', 'Signet of Spirits', 'Essence Strike', 'Mend Body and Soul', 'Soothing Memories', 'Protective Was Kaolai', 'Spirit Siphon', 'Vengeful Weapon', 'Boon of Creation', 'Shadowsong', 'Celestial Summoning', 'Flesh of My Flesh'], 'armor_levels': {}, 'items_dropped': []},
-    3486: {'name': 'Aeson', 'profession': ['Ritualist'], 'attributes': [{'level': '12', 'name': 'Communing'}, {'level': '11', 'name': 'Spawning Power'}], 'skills_used': ['Pain', 'Doom', 'Disenchantment', 'Spirit Channeling', 'Union', 'Signet of Spirits', 'Essence Strike', 'Mend Body and Soul', 'Soothing Memories', 'Protective Was Kaolai', 'Spirit Siphon', 'Vengeful Weapon', 'Boon of Creation', 'Shadowsong', 'Celestial Summoning', 'Flesh of My Flesh'], 'armor_levels': {}, 'items_dropped': []},
-    3466: {'name': 'Panaku', 'profession': ['Assassin'], 'attributes': [{'level': '15', 'name': 'Dagger Mastery'}], 'skills_used': ['Shadow Refuge', 'Wild Strike', 'Seeping Wound', "Viper's Defense", 'Beguiling Haze', 'Resurrection Signet', 'Entangling Asp', 'Fox Fangs', 'Moebius Strike', 'Iron Palm', 'Blinding Powder', 'Jagged Strike', 'Critical Strike', 'Signet of Malice', 'Jungle Strike', 'Death Blossom'], 'armor_levels': {}, 'items_dropped': []},
-    3495: {'name': 'Panaku', 'profession': ['Assassin'], 'attributes': [{'level': '15', 'name': 'Dagger Mastery'}], 'skills_used': ['Shadow Refuge', 'Wild Strike', 'Seeping Wound', "Viper's Defense", 'Beguiling Haze', 'Resurrection Signet', 'Entangling Asp', 'Fox Fangs', 'Moebius Strike', 'Iron Palm', 'Blinding Powder', 'Jagged Strike', 'Critical Strike', 'Signet of Malice', 'Jungle Strike', 'Death Blossom'], 'armor_levels': {}, 'items_dropped': []},
-    3467: {'name': 'Lo Sha', 'profession': ['Mesmer', 'Necromancer'], 'attributes': [{'level': '15', 'name': 'Illusion Magic'}], 'skills_used': ['Mantra of Persistence', 'Ineptitude', "Lyssa's Aura", 'Hex Eater Signet', 'Shadow of Fear', 'Conjure Phantasm', 'Power Return', 'Waste Not, Want Not', 'Images of Remorse', 'Ether Feast', 'Clumsiness', 'Drain Enchantment', 'Arcane Conundrum', 'Recurring Insecurity', 'Resurrection Signet', 'Power Drain', "Kitah's Burden", 'Empathy', 'Crippling Anguish'], 'armor_levels': {}, 'items_dropped': []},
-    3497: {'name': 'Lo Sha', 'profession': ['Mesmer', 'Necromancer'], 'attributes': [{'level': '15', 'name': 'Illusion Magic'}], 'skills_used': ['Mantra of Persistence', 'Ineptitude', "Lyssa's Aura", 'Hex Eater Signet', 'Shadow of Fear', 'Conjure Phantasm', 'Power Return', 'Waste Not, Want Not', 'Images of Remorse', 'Ether Feast', 'Clumsiness', 'Drain Enchantment', 'Arcane Conundrum', 'Recurring Insecurity', 'Resurrection Signet', 'Power Drain', "Kitah's Burden", 'Empathy', 'Crippling Anguish'], 'armor_levels': {}, 'items_dropped': []},
-    5986: {'name': 'Lo Sha', 'profession': ['Mesmer', 'Necromancer'], 'attributes': [{'level': '15', 'name': 'Illusion Magic'}], 'skills_used': ['Mantra of Persistence', 'Ineptitude', "Lyssa's Aura", 'Hex Eater Signet', 'Shadow of Fear', 'Conjure Phantasm', 'Power Return', 'Waste Not, Want Not', 'Images of Remorse', 'Ether Feast', 'Clumsiness', 'Drain Enchantment', 'Arcane Conundrum', 'Recurring Insecurity', 'Resurrection Signet', 'Power Drain', "Kitah's Burden", 'Empathy', 'Crippling Anguish'], 'armor_levels': {}, 'items_dropped': []},
-    3469: {'name': 'Kai Ying', 'profession': ['Elementalist'], 'attributes': [{'level': '12', 'name': 'Earth Magic'}], 'skills_used': ['Earth Attunement', 'Ward Against Melee', 'Aura of Restoration', 'Resurrection Signet', "Dragon's Stomp", 'Celestial Storm', 'Stone Daggers', 'Unsteady Ground'], 'armor_levels': {}, 'items_dropped': []},
-    3499: {'name': 'Kai Ying', 'profession': ['Elementalist'], 'attributes': [{'level': '12', 'name': 'Earth Magic'}], 'skills_used': ['Earth Attunement', 'Ward Against Melee', 'Aura of Restoration', 'Resurrection Signet', "Dragon's Stomp", 'Celestial Storm', 'Stone Daggers', 'Unsteady Ground'], 'armor_levels': {}, 'items_dropped': []},
-    3511: {'name': 'Kai Ying', 'profession': ['Elementalist'], 'attributes': [{'level': '12', 'name': 'Earth Magic'}], 'skills_used': ['Earth Attunement', 'Ward Against Melee', 'Aura of Restoration', 'Resurrection Signet', "Dragon's Stomp", 'Celestial Storm', 'Stone Daggers', 'Unsteady Ground'], 'armor_levels': {}, 'items_dropped': []},
-    3472: {'name': 'Zho', 'profession': ['Ranger', 'Warrior', 'Dervish'], 'attributes': [{'level': '14', 'name': 'Beast Mastery'}], 'skills_used': ['Disrupting Shot', 'Power Shot', 'Troll Unguent', 'Natural Healing', 'Read the Wind', 'Charm Animal', 'Kindle Arrows', "Hunter's Shot", 'Rampage as One', 'Whirling Defense', 'Savage Shot', 'Dual Shot', 'Determined Shot', 'Disrupting Lunge', "Melandru's Shot", 'Celestial Stance', 'Counter Blow', 'Resurrection Signet', 'Broad Head Arrow', 'Comfort Animal'], 'armor_levels': {}, 'items_dropped': []},
-    3502: {'name': 'Zho', 'profession': ['Ranger', 'Warrior', 'Dervish'], 'attributes': [{'level': '14', 'name': 'Beast Mastery'}], 'skills_used': ['Disrupting Shot', 'Power Shot', 'Troll Unguent', 'Natural Healing', 'Read the Wind', 'Charm Animal', 'Kindle Arrows', "Hunter's Shot", 'Rampage as One', 'Whirling Defense', 'Savage Shot', 'Dual Shot', 'Determined Shot', 'Disrupting Lunge', "Melandru's Shot", 'Celestial Stance', 'Counter Blow', 'Resurrection Signet', 'Broad Head Arrow', 'Comfort Animal'], 'armor_levels': {}, 'items_dropped': []},
-    3514: {'name': 'Zho', 'profession': ['Ranger', 'Warrior', 'Dervish'], 'attributes': [{'level': '14', 'name': 'Beast Mastery'}], 'skills_used': ['Disrupting Shot', 'Power Shot', 'Troll Unguent', 'Natural Healing', 'Read the Wind', 'Charm Animal', 'Kindle Arrows', "Hunter's Shot", 'Rampage as One', 'Whirling Defense', 'Savage Shot', 'Dual Shot', 'Determined Shot', 'Disrupting Lunge', "Melandru's Shot", 'Celestial Stance', 'Counter Blow', 'Resurrection Signet', 'Broad Head Arrow', 'Comfort Animal'], 'armor_levels': {}, 'items_dropped': []},
-    5995: {'name': 'Zho', 'profession': ['Ranger', 'Warrior', 'Dervish'], 'attributes': [{'level': '14', 'name': 'Beast Mastery'}], 'skills_used': ['Disrupting Shot', 'Power Shot', 'Troll Unguent', 'Natural Healing', 'Read the Wind', 'Charm Animal', 'Kindle Arrows', "Hunter's Shot", 'Rampage as One', 'Whirling Defense', 'Savage Shot', 'Dual Shot', 'Determined Shot', 'Disrupting Lunge', "Melandru's Shot", 'Celestial Stance', 'Counter Blow', 'Resurrection Signet', 'Broad Head Arrow', 'Comfort Animal'], 'armor_levels': {}, 'items_dropped': []},
-    3474: {'name': 'Erys Vasburg', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Celestial Haste', 'Psychic Instability', 'Resurrection Signet', 'Cry of Frustration', 'Empathy', 'Leech Signet', 'Shatter Hex'], 'armor_levels': {}, 'items_dropped': []},
-    3504: {'name': 'Erys Vasburg', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Celestial Haste', 'Psychic Instability', 'Resurrection Signet', 'Cry of Frustration', 'Empathy', 'Leech Signet', 'Shatter Hex'], 'armor_levels': {}, 'items_dropped': []},
-    3475: {'name': 'Brutus', 'profession': ['Necromancer'], 'attributes': [{'level': '6', 'name': 'Soul Reaping'}], 'skills_used': ['Unholy Feast', 'Blood Ritual', 'Icy Veins', 'Vampiric Gaze', 'Lifebane Strike', 'Star Servant', "Wallow's Bite", 'Resurrection Signet', 'Shadow Strike', 'Vampiric Swarm'], 'armor_levels': {}, 'items_dropped': []},
-    3505: {'name': 'Brutus', 'profession': ['Necromancer'], 'attributes': [{'level': '6', 'name': 'Soul Reaping'}], 'skills_used': ['Unholy Feast', 'Blood Ritual', 'Icy Veins', 'Vampiric Gaze', 'Lifebane Strike', 'Star Servant', "Wallow's Bite", 'Resurrection Signet', 'Shadow Strike', 'Vampiric Swarm'], 'armor_levels': {}, 'items_dropped': []},
-    3476: {'name': 'Sheena', 'profession': ['Necromancer'], 'attributes': [{'level': '11', 'name': 'Soul Reaping'}], 'skills_used': ['Vile Touch', 'Star Servant', 'Resurrection Signet', 'Lingering Curse', 'Rising Bile', 'Putrid Explosion', 'Parasitic Bond', 'Weaken Armor', 'Deathly Swarm', 'Death Nova'], 'armor_levels': {}, 'items_dropped': []},
-    3506: {'name': 'Sheena', 'profession': ['Necromancer'], 'attributes': [{'level': '11', 'name': 'Soul Reaping'}], 'skills_used': ['Vile Touch', 'Star Servant', 'Resurrection Signet', 'Lingering Curse', 'Rising Bile', 'Putrid Explosion', 'Parasitic Bond', 'Weaken Armor', 'Deathly Swarm', 'Death Nova'], 'armor_levels': {}, 'items_dropped': []},
-    3477: {'name': 'Danika', 'profession': ['Monk'], 'attributes': [{'level': '12', 'name': 'Divine Favor'}, {'level': '12', 'name': 'Healing Prayers'}], 'skills_used': ['Healing Touch', 'Purge Signet', 'Orison of Healing', 'Heal Other', 'Heal Area', "Heaven's Delight", 'Divine Intervention', 'Blood of zu Heltzer', 'Resurrection Chant', 'Healing Burst', 'Word of Healing', 'Remove Hex', 'Healing Breeze', 'Signet of Rejuvenation'], 'armor_levels': {}, 'items_dropped': []},
-    3478: {'name': 'Redemptor Karl', 'profession': ['Monk'], 'attributes': [{'level': '12', 'name': 'Divine Favor'}, {'level': '12', 'name': 'Protection Prayers'}], 'skills_used': ['Draw Conditions', 'Mend Ailment', 'Star Shine', 'Spirit Bond', 'Resurrection Chant', 'Boon Signet', 'Reversal of Fortune', 'Aegis'], 'armor_levels': {}, 'items_dropped': []},
-    3507: {'name': 'Redemptor Karl', 'profession': ['Monk'], 'attributes': [{'level': '12', 'name': 'Divine Favor'}, {'level': '12', 'name': 'Protection Prayers'}], 'skills_used': ['Draw Conditions', 'Mend Ailment', 'Star Shine', 'Spirit Bond', 'Resurrection Chant', 'Boon Signet', 'Reversal of Fortune', 'Aegis'], 'armor_levels': {}, 'items_dropped': []},
-    3487: {'name': 'Emi', 'profession': ['Assassin'], 'attributes': [], 'skills_used': ['Shadow Refuge', 'Resurrection Signet', 'Golden Lotus Strike', 'Exhausting Assault', 'Nine Tail Strike', 'Signet of Malice', 'Temple Strike', 'Way of Perfection'], 'armor_levels': {}, 'items_dropped': []},
-    3494: {'name': 'Chiyo', 'profession': ['Ritualist'], 'attributes': [{'level': '11', 'name': 'Channeling Magic'}, {'level': '12', 'name': 'Restoration Magic'}], 'skills_used': ['Displacement', 'Spirit Light', 'Signet of Spirits', 'Union', 'Essence Strike', 'Spirit Light Weapon', 'Mend Body and Soul', 'Soothing Memories', 'Protective Was Kaolai', 'Spirit Siphon', 'Vengeful Weapon', 'Flesh of My Flesh', 'Recuperation'], 'armor_levels': {}, 'items_dropped': []},
-    3496: {'name': 'Nika', 'profession': ['Assassin'], 'attributes': [{'level': '13-14', 'name': 'Deadly Arts'}], 'skills_used': ['Shadow Refuge', 'Siphon Speed', 'Resurrection Signet', 'Horns of the Ox', 'Black Mantis Thrust', 'Return', 'Flashing Blades', 'Unsuspecting Strike', 'Black Lotus Strike', 'Jungle Strike', 'Death Blossom', 'Shattering Assault', 'Mark of Instability', 'Expose Defenses'], 'armor_levels': {}, 'items_dropped': []},
-    3510: {'name': 'Seaguard Hala', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Shared Burden', 'Celestial Haste', 'Power Leech', 'Hex Eater Signet', 'Resurrection Signet', 'Accumulated Pain', 'Power Drain', 'Clumsiness', 'Conjure Phantasm', 'Images of Remorse'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk']},
-    3561: {'name': 'Seaguard Hala', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Shared Burden', 'Celestial Haste', 'Power Leech', 'Hex Eater Signet', 'Resurrection Signet', 'Accumulated Pain', 'Power Drain', 'Clumsiness', 'Conjure Phantasm', 'Images of Remorse'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk']},
-    3649: {'name': 'Seaguard Hala', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Shared Burden', 'Celestial Haste', 'Power Leech', 'Hex Eater Signet', 'Resurrection Signet', 'Accumulated Pain', 'Power Drain', 'Clumsiness', 'Conjure Phantasm', 'Images of Remorse'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk']},
-    3480: {'name': 'Seaguard Hala', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Shared Burden', 'Celestial Haste', 'Power Leech', 'Hex Eater Signet', 'Resurrection Signet', 'Accumulated Pain', 'Power Drain', 'Clumsiness', 'Conjure Phantasm', 'Images of Remorse'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk']},
-    3513: {'name': 'Daeman', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Savage Shot', 'Troll Unguent', 'Determined Shot', 'Resurrection Signet', 'Read the Wind', 'Choking Gas', 'Broad Head Arrow', 'Celestial Stance', 'Distracting Shot'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Luxon Bracers']},
-    3567: {'name': 'Daeman', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Savage Shot', 'Troll Unguent', 'Determined Shot', 'Resurrection Signet', 'Read the Wind', 'Choking Gas', 'Broad Head Arrow', 'Celestial Stance', 'Distracting Shot'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Luxon Bracers']},
-    3645: {'name': 'Daeman', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Savage Shot', 'Troll Unguent', 'Determined Shot', 'Resurrection Signet', 'Read the Wind', 'Choking Gas', 'Broad Head Arrow', 'Celestial Stance', 'Distracting Shot'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Luxon Bracers']},
-    3484: {'name': 'Daeman', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Savage Shot', 'Troll Unguent', 'Determined Shot', 'Resurrection Signet', 'Read the Wind', 'Choking Gas', 'Broad Head Arrow', 'Celestial Stance', 'Distracting Shot'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Luxon Bracers']},
-    3524: {'name': 'Projects/NPC models/Humans/Canthans', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3254: {'name': 'Projects/NPC models/Humans/Canthans', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3563: {'name': 'Argo', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Earth Magic'}], 'skills_used': ['Meteor', "Argo's Cry", 'Earth Attunement', 'Sliver Armor', 'Bed of Coals', 'Smoldering Embers', 'Aura of Restoration', 'Mind Burn', 'Resurrection Signet', 'Stoneflesh Aura', 'Armor of Earth', 'Mystic Regeneration', 'Sandstorm', 'Lava Arrows', 'Stone Daggers', 'Fire Attunement', 'Fireball'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Jadeite Shard', 'Luxon Garb', 'Luxon Pendant']},
-    3646: {'name': 'Argo', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Earth Magic'}], 'skills_used': ['Meteor', "Argo's Cry", 'Earth Attunement', 'Sliver Armor', 'Bed of Coals', 'Smoldering Embers', 'Aura of Restoration', 'Mind Burn', 'Resurrection Signet', 'Stoneflesh Aura', 'Armor of Earth', 'Mystic Regeneration', 'Sandstorm', 'Lava Arrows', 'Stone Daggers', 'Fire Attunement', 'Fireball'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Jadeite Shard', 'Luxon Garb', 'Luxon Pendant']},
-    3481: {'name': 'Argo', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Earth Magic'}], 'skills_used': ['Meteor', "Argo's Cry", 'Earth Attunement', 'Sliver Armor', 'Bed of Coals', 'Smoldering Embers', 'Aura of Restoration', 'Mind Burn', 'Resurrection Signet', 'Stoneflesh Aura', 'Armor of Earth', 'Mystic Regeneration', 'Sandstorm', 'Lava Arrows', 'Stone Daggers', 'Fire Attunement', 'Fireball'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Jadeite Shard', 'Luxon Garb', 'Luxon Pendant']},
-    3564: {'name': 'Seaguard Gita', 'profession': ['Monk'], 'attributes': [{'level': '12', 'name': 'Divine Favor'}, {'level': '12', 'name': 'Protection Prayers'}], 'skills_used': ['Resurrection Signet', 'Spirit Bond', 'Resurrection Chant', 'Shielding Hands', 'Life Sheath', 'Remove Hex', 'Aegis'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk']},
-    3647: {'name': 'Seaguard Gita', 'profession': ['Monk'], 'attributes': [{'level': '12', 'name': 'Divine Favor'}, {'level': '12', 'name': 'Protection Prayers'}], 'skills_used': ['Resurrection Signet', 'Spirit Bond', 'Resurrection Chant', 'Shielding Hands', 'Life Sheath', 'Remove Hex', 'Aegis'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk']},
-    3482: {'name': 'Seaguard Gita', 'profession': ['Monk'], 'attributes': [{'level': '12', 'name': 'Divine Favor'}, {'level': '12', 'name': 'Protection Prayers'}], 'skills_used': ['Resurrection Signet', 'Spirit Bond', 'Resurrection Chant', 'Shielding Hands', 'Life Sheath', 'Remove Hex', 'Aegis'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk']},
-    3565: {'name': 'Seaguard Eli', 'profession': ['Warrior'], 'attributes': [{'level': '9-11', 'name': 'Tactics'}], 'skills_used': ['"Watch Yourself!"', "Leviathan's Sweep", "Protector's Defense", 'Healing Signet', 'Sprint', 'Resurrection Signet', 'Dragon Slash', 'Standing Slash', 'Hamstring', '"Coward!"', '"Shields Up!"'], 'armor_levels': {}, 'items_dropped': []},
-    3483: {'name': 'Seaguard Eli', 'profession': ['Warrior'], 'attributes': [{'level': '9-11', 'name': 'Tactics'}], 'skills_used': ['"Watch Yourself!"', "Leviathan's Sweep", "Protector's Defense", 'Healing Signet', 'Sprint', 'Resurrection Signet', 'Dragon Slash', 'Standing Slash', 'Hamstring', '"Coward!"', '"Shields Up!"'], 'armor_levels': {}, 'items_dropped': []},
-    3566: {'name': 'Aurora', 'profession': ['Ranger'], 'attributes': [{'level': '15', 'name': 'Marksmanship'}], 'skills_used': ['Bestial Mauling', 'Troll Unguent', 'Favorable Winds', 'Barrage', 'Dual Shot', 'Resurrection Signet', 'Savage Pounce', 'Heal as One', 'Call of Haste', "Hunter's Shot", 'Pounce', 'Charm Animal (monster)'], 'armor_levels': {}, 'items_dropped': ['Luxon Bracers']},
-    3644: {'name': 'Aurora', 'profession': ['Ranger'], 'attributes': [{'level': '15', 'name': 'Marksmanship'}], 'skills_used': ['Bestial Mauling', 'Troll Unguent', 'Favorable Winds', 'Barrage', 'Dual Shot', 'Resurrection Signet', 'Savage Pounce', 'Heal as One', 'Call of Haste', "Hunter's Shot", 'Pounce', 'Charm Animal (monster)'], 'armor_levels': {}, 'items_dropped': ['Luxon Bracers']},
-    3485: {'name': 'Aurora', 'profession': ['Ranger'], 'attributes': [{'level': '15', 'name': 'Marksmanship'}], 'skills_used': ['Bestial Mauling', 'Troll Unguent', 'Favorable Winds', 'Barrage', 'Dual Shot', 'Resurrection Signet', 'Savage Pounce', 'Heal as One', 'Call of Haste', "Hunter's Shot", 'Pounce', 'Charm Animal (monster)'], 'armor_levels': {}, 'items_dropped': ['Luxon Bracers']},
-    3568: {'name': 'Siege Turtle', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Siege Turtle Attack (The Eternal Grove)', 'Siege Turtle Attack (Gyala Hatchery)', 'Siege Turtle Attack (Fort Aspenwood)', 'Carrier Defense', 'Turtle Shell'], 'armor_levels': {}, 'items_dropped': ['Kappa Shield', 'Luxon Pendant', 'Monstrous Eye']},
-    3586: {'name': 'Siege Turtle', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Siege Turtle Attack (The Eternal Grove)', 'Siege Turtle Attack (Gyala Hatchery)', 'Siege Turtle Attack (Fort Aspenwood)', 'Carrier Defense', 'Turtle Shell'], 'armor_levels': {}, 'items_dropped': ['Kappa Shield', 'Luxon Pendant', 'Monstrous Eye']},
-    3571: {'name': 'Luxon Necromancer', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Curses'}, {'level': '14', 'name': 'Death Magic'}, {'level': '20 Death Magic in', 'name': 'hard mode'}], 'skills_used': ['Suffering', 'Lingering Curse', 'Well of the Profane'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Luxon Garb', 'Luxon Pendant']},
-    3621: {'name': 'Luxon Necromancer', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Curses'}, {'level': '14', 'name': 'Death Magic'}, {'level': '20 Death Magic in', 'name': 'hard mode'}], 'skills_used': ['Suffering', 'Lingering Curse', 'Well of the Profane'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Luxon Garb', 'Luxon Pendant']},
-    3585: {'name': 'Giant Turtle', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3587: {'name': 'Young Turtle', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Turtle Shell'], 'armor_levels': {}, 'items_dropped': []},
-    3598: {'name': 'Luxon Ritualist', 'profession': ['Ritualist'], 'attributes': [{'level': '15', 'name': 'Communing'}], 'skills_used': ['Displacement', 'Doom', 'Shelter', 'Wanderlust', 'Flesh of My Flesh'], 'armor_levels': {}, 'items_dropped': ['Luxon Pendant']},
-    3600: {'name': 'Luxon Commander', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3642: {'name': 'Luxon Commander', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3608: {'name': 'Luxon Ambassador', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3609: {'name': 'Luxon', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3611: {'name': 'Luxon', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3610: {'name': 'Projects/NPC models/Humans/Luxons', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3612: {'name': 'Luxon Traveler', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3613: {'name': 'Projects/NPC models/Humans/Luxons', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3619: {'name': 'Projects/NPC models/Humans/Luxons', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3622: {'name': 'Luxon Merchant', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    3623: {'name': 'Luxon Merchant', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    3627: {'name': 'Luxon Merchant', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    3636: {'name': 'Luxon Merchant', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    3624: {'name': 'Projects/NPC models/Humans/Luxons', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3648: {'name': 'Projects/NPC models/Humans/Luxons', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3628: {'name': 'Projects/NPC models/Humans/Luxons', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3631: {'name': 'Projects/NPC models/Humans/Luxons', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3633: {'name': 'Projects/NPC models/Humans/Luxons', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3634: {'name': 'Projects/NPC models/Humans/Luxons', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3638: {'name': 'Luxon Guard', 'profession': ['Warrior'], 'attributes': [{'level': '14-16', 'name': 'Strength'}], 'skills_used': ['Auspicious Blow', 'Berserker Stance', 'Staggering Blow', 'Renewing Smash', '"Coward!"'], 'armor_levels': {}, 'items_dropped': []},
-    3639: {'name': 'Luxon Guard', 'profession': ['Warrior'], 'attributes': [{'level': '14-16', 'name': 'Strength'}], 'skills_used': ['Auspicious Blow', 'Berserker Stance', 'Staggering Blow', 'Renewing Smash', '"Coward!"'], 'armor_levels': {}, 'items_dropped': []},
-    3640: {'name': 'Luxon Guard', 'profession': ['Warrior'], 'attributes': [{'level': '14-16', 'name': 'Strength'}], 'skills_used': ['Auspicious Blow', 'Berserker Stance', 'Staggering Blow', 'Renewing Smash', '"Coward!"'], 'armor_levels': {}, 'items_dropped': []},
-    3641: {'name': 'Luxon Priest', 'profession': ['Monk'], 'attributes': [{'level': '15', 'name': 'Divine Favor'}, {'level': '15', 'name': 'Healing Prayers'}], 'skills_used': ["Karei's Healing Circle", 'Resurrection Chant', 'Word of Healing', 'Protective Spirit', 'Healing Breeze', 'Signet of Rejuvenation'], 'armor_levels': {}, 'items_dropped': []},
-    3651: {'name': 'Elder Rhea', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3662: {'name': 'Chkkr Locust Lord', 'profession': ['Assassin'], 'attributes': [], 'skills_used': ['Shadow Refuge', 'Jungle Strike', "Locust's Fury", 'Leaping Mantis Sting', 'Twisting Fangs'], 'armor_levels': {}, 'items_dropped': ['Chitin Fragment', "Chkkr's Pincers", 'unique', 'Mantis Pincer', 'Monstrous Eye']},
-    3663: {'name': 'Bezzr Wingstorm', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Illusion Magic'}], 'skills_used': ['Fragility', 'Ether Feast', 'Conjure Nightmare', 'Accumulated Pain', 'Crippling Anguish'], 'armor_levels': {}, 'items_dropped': ['Amber Chunk', 'Monstrous Eye', 'Ruby', 'Wingstorm', 'unique']},
-    3669: {'name': 'Chkkr Brightclaw', 'profession': ['Ritualist'], 'attributes': [{'level': '16', 'name': 'Restoration Magic'}], 'skills_used': ['Ghostly Haste', 'Spirit Light', 'Spirit Light Weapon', 'Splinter Weapon', 'Recuperation'], 'armor_levels': {}, 'items_dropped': ['Brightclaw', 'unique', 'Chitin Fragment', 'Mantis Pincer', 'Monstrous Eye']},
-    3670: {'name': 'Konrru, Tainted Stone', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Blessing of the Kirin', 'Tainted Flesh', 'Animate Vampiric Horror', 'Defile Flesh', 'Barbs'], 'armor_levels': {}, 'items_dropped': ["Konrru's Fervor", 'unique', 'Stone Horn']},
-    3671: {'name': 'Nandet, Glass Weaver', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Lightning Reflexes', 'Splinter Shot', "Zojun's Shot", 'Glass Arrows'], 'armor_levels': {}, 'items_dropped': ['Dredge Incisor', 'Dredge Spaulder', "Nandet's Recurve Bow", 'unique']},
-    3674: {'name': 'Hargg Plaguebinder', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Rotting Flesh', 'Animate Bone Fiend', 'Life Siphon', 'Plague Signet', 'Signet of Agony'], 'armor_levels': {}, 'items_dropped': ['Dredge Incisor', 'Plaguebinder', 'unique']},
-    3675: {'name': 'Tarlok Evermind', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ["Teinai's Heat", 'Energy Boon', 'Bed of Coals', 'Aura of Restoration', 'Fireball'], 'armor_levels': {}, 'items_dropped': ['Dredge Garment', 'Dredge Incisor', "Tarlok's Flagon", 'unique']},
-    3676: {'name': 'Mungri Magicbox', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Shield Guardian', 'Life Bond', 'Shielding Hands', 'Boon Signet', 'Reversal of Fortune'], 'armor_levels': {}, 'items_dropped': ['Dredge Garment', 'Dredge Incisor', "Mungri's Flame", 'unique']},
-    3677: {'name': 'Tarnen the Bully', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Wild Blow', 'Shove', 'Healing Signet', 'Endure Pain', 'Final Thrust'], 'armor_levels': {}, 'items_dropped': ['Dredge Plating', "Tarnen's Shield", 'unique']},
-    3679: {'name': 'Wagg Spiritspeak', 'profession': ['Ritualist'], 'attributes': [{'level': '(20', 'name': 'Channeling Magic'}, {'level': '20', 'name': 'Communing'}], 'skills_used': ['Spirit Light', 'Signet of Spirits', 'Spirit Burn', 'Earthbind', 'Destruction'], 'armor_levels': {}, 'items_dropped': ['Dredge Incisor', 'Spiritspeaker', 'unique']},
-    3682: {'name': 'Strongroot Tanglebranch', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Healing Signet', "Bull's Strike", 'Swift Chop', 'Lacerating Chop', 'Primal Rage'], 'armor_levels': {}, 'items_dropped': ['Dragon Root', 'Plant Fiber', 'Spiritwood Plank', "Strongroot's Shelter", 'unique']},
-    3696: {'name': 'Inallay Splintercall', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Barbed Trap', 'Splinter Shot', 'Brambles', 'Quick Shot'], 'armor_levels': {}, 'items_dropped': ["Inallay's Hornbow", 'unique', 'Warden Horn']},
-    3700: {'name': 'Arbor Earthcall', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Stoning', 'Glyph of Lesser Energy', 'Aura of Restoration', 'Churning Earth', 'Shockwave'], 'armor_levels': {}, 'items_dropped': ["Arbor's Earth Staff", 'unique', 'Fur Square', 'Warden Horn']},
-    3704: {'name': 'Salke Fur Friend', 'profession': ['Ranger'], 'attributes': [{'level': '16', 'name': 'Beast Mastery'}], 'skills_used': ['Scavenger Strike', 'Precision Shot', 'Primal Echoes', 'Charm Animal', 'Heal as One', 'Maiming Strike'], 'armor_levels': {}, 'items_dropped': ['Fur Square', 'Tanned Hide Square', 'Warden Armguard', 'Warden Horn', 'Sapphire']},
-    3708: {'name': 'Blood Drinker', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3709: {'name': 'Fungal Wallow', 'profession': ['Necromancer'], 'attributes': [{'level': '11', 'name': 'Curses'}, {'level': '15', 'name': 'Blood Magic'}, {'level': '16', 'name': 'Soul Reaping'}], 'skills_used': ['Weaken Knees', 'Vampiric Gaze', 'Stun on Critical Hit', 'Vampiric Bite', 'Fetid Ground'], 'armor_levels': {'Blunt damage': '72 (78)', 'Piercing damage': '72 (78)', 'Slashing damage': '72 (78)', 'Cold damage': '72 (78)', 'Earth damage': '72 (78)', 'Fire damage': '72 (78)', 'Lightning damage': '72 (78)'}, 'items_dropped': ['Truffle']},
-    3711: {'name': 'Mantis Hunter', 'profession': ['Assassin'], 'attributes': [], 'skills_used': ['Shadow Refuge', 'Jungle Strike', "Locust's Fury", 'Leaping Mantis Sting', 'Twisting Fangs'], 'armor_levels': {'Blunt damage': '82', 'Piercing damage': '82', 'Slashing damage': '82', 'Cold damage': '82', 'Earth damage': '82', 'Fire damage': '82', 'Lightning damage': '82'}, 'items_dropped': ['Amber Chunk', 'Chitin Fragment', 'Mantis Pincer', 'Monstrous Eye', 'Ruby']},
-    3712: {'name': 'Mantis Dreamweaver', 'profession': ['Mesmer'], 'attributes': [{'level': '14', 'name': 'Illusion Magic'}], 'skills_used': ['Fragility', 'Ether Feast', 'Conjure Nightmare', 'Accumulated Pain', 'Crippling Anguish'], 'armor_levels': {'Blunt damage': '72', 'Piercing damage': '72', 'Slashing damage': '72', 'Cold damage': '72', 'Earth damage': '72', 'Fire damage': '72', 'Lightning damage': '72'}, 'items_dropped': ['Amber Chunk', 'Chitin Fragment', 'Mantis Pincer', 'Monstrous Eye', 'Ruby']},
-    3713: {'name': 'Mantis Stormcaller', 'profession': ['Elementalist'], 'attributes': [{'level': '(19', 'name': 'Earth Magic'}, {'level': '20', 'name': 'Water Magic'}], 'skills_used': ['Icy Prism', 'Obsidian Flesh', 'Ash Blast', "Teinai's Crystals", 'Maelstrom'], 'armor_levels': {'Blunt damage': '69', 'Piercing damage': '69', 'Slashing damage': '69', 'Cold damage': '69', 'Earth damage': '69', 'Fire damage': '69', 'Lightning damage': '69'}, 'items_dropped': ['Amber Chunk', 'Chitin Fragment', 'Mantis Pincer', 'Monstrous Eye']},
-    3714: {'name': 'Mantis Mender', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Healing Whisper', 'Empathic Removal', 'Healing Breeze', 'Signet of Rejuvenation'], 'armor_levels': {'Blunt damage': '72', 'Piercing damage': '72', 'Slashing damage': '72', 'Cold damage': '72', 'Earth damage': '72', 'Fire damage': '72', 'Lightning damage': '72'}, 'items_dropped': ['Amber Chunk', 'Chitin Fragment', 'Mantis Pincer', 'Monstrous Eye', 'Ruby']},
-    3715: {'name': 'Pain Hungry Gaki', 'profession': ['Ritualist'], 'attributes': [{'level': '15', 'name': 'Channeling Magic'}, {'level': '14', 'name': 'Communing'}], 'skills_used': ['Pain', 'Clamor of Souls', 'Bloodsong', 'Painful Bond', 'Destruction'], 'armor_levels': {'Blunt damage': '88', 'Piercing damage': '88', 'Slashing damage': '88', 'Cold damage': '88', 'Earth damage': '88', 'Fire damage': '88', 'Lightning damage': '88'}, 'items_dropped': ['Skull Juju', 'Tanned Hide Square']},
-    3716: {'name': 'Skill Hungry Gaki', 'profession': ['Ritualist'], 'attributes': [{'level': '15', 'name': 'Channeling Magic'}, {'level': '14', 'name': 'Communing'}], 'skills_used': ['Dissonance', 'Disenchantment', 'Shadowsong', 'Painful Bond', 'Attuned Was Songkai'], 'armor_levels': {'Blunt damage': '88', 'Piercing damage': '88', 'Slashing damage': '88', 'Cold damage': '88', 'Earth damage': '88', 'Fire damage': '88', 'Lightning damage': '88'}, 'items_dropped': ['Fur Square', 'Skull Juju', 'Tanned Hide Square']},
-    3717: {'name': 'Stone Scale Kirin', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Curses'}, {'level': '15', 'name': 'Death Magic'}, {'level': '20 Death Magic in', 'name': 'Hard mode'}], 'skills_used': ['Blessing of the Kirin', 'Tainted Flesh', 'Animate Vampiric Horror', 'Taste of Pain', 'Defile Flesh', 'Barbs'], 'armor_levels': {'Blunt damage': '69', 'Piercing damage': '69', 'Slashing damage': '69', 'Cold damage': '69', 'Earth damage': '69', 'Fire damage': '69', 'Lightning damage': '69'}, 'items_dropped': ['Granite Slab', 'Pile of Glittering Dust', 'Ruby', 'Sapphire', 'Stone Horn']},
-    3718: {'name': 'Dredge Gutter', 'profession': ['Assassin'], 'attributes': [{'level': '(14 to 16', 'name': 'Deadly Arts'}], 'skills_used': ['Shadow Refuge', 'Aura of Displacement', 'Horns of the Ox', 'Disrupting Stab', 'Fox Fangs', 'Ceiling Collapse', 'Jungle Strike', 'Shattering Assault', 'Dark Prison'], 'armor_levels': {'Blunt damage': '82', 'Piercing damage': '82', 'Slashing damage': '82', 'Cold damage': '82', 'Earth damage': '82', 'Fire damage': '82', 'Lightning damage': '82'}, 'items_dropped': ['Dredge Garment', 'Dredge Incisor', 'Dredge Charm']},
-    3719: {'name': 'Dredge Gardener', 'profession': ['Monk'], 'attributes': [{'level': '16', 'name': 'Protection Prayers'}], 'skills_used': ['Shield Guardian', 'Life Bond', 'Ceiling Collapse', 'Shielding Hands', 'Boon Signet', 'Blessed Signet', 'Reversal of Fortune', 'Guardian', 'Shield of Absorption'], 'armor_levels': {'Blunt damage': '72', 'Piercing damage': '72', 'Slashing damage': '72', 'Cold damage': '72', 'Earth damage': '72', 'Fire damage': '72', 'Lightning damage': '72'}, 'items_dropped': ['Dredge Charm', 'Dredge Garment', 'Dredge Incisor', 'Dredge Spaulder']},
-    3720: {'name': 'Dredge Guardian', 'profession': ['Warrior'], 'attributes': [{'level': '15', 'name': 'Tactics'}], 'skills_used': ['Wild Blow', 'Shove', 'Healing Signet', 'Savage Slash', 'Final Thrust'], 'armor_levels': {'Blunt damage': '128', 'Piercing damage': '128', 'Slashing damage': '128', 'Cold damage': '108', 'Earth damage': '108', 'Fire damage': '108', 'Lightning damage': '108'}, 'items_dropped': ['Dredge Incisor', 'Dredge Plating']},
-    3723: {'name': 'Undergrowth', 'profession': ['Warrior'], 'attributes': [{'level': '15', 'name': 'Strength'}, {'level': '15', 'name': 'Axe Mastery'}], 'skills_used': ['Wild Blow', "Bull's Strike", 'Swift Chop', 'Lacerating Chop', 'Primal Rage'], 'armor_levels': {'Blunt damage': '109', 'Piercing damage': '109', 'Slashing damage': '89', 'Cold damage': '89', 'Earth damage': '89', 'Fire damage': '69', 'Lightning damage': '89'}, 'items_dropped': ['Dragon Root', 'Plant Fiber', 'Spiritwood Plank', 'Wood Plank']},
-    3724: {'name': 'Stone Rain', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ["Teinai's Wind", 'Gale', 'Shockwave', 'Stone Daggers'], 'armor_levels': {'Blunt damage': '69', 'Piercing damage': '109', 'Slashing damage': '109', 'Cold damage': '69', 'Earth damage': '109', 'Fire damage': '109', 'Lightning damage': '109'}, 'items_dropped': ['Pile of Glittering Dust', 'Ruby', 'Stone Carving', 'Stone Remnants']},
-    3726: {'name': 'Stone Soul', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Stonesoul Strike', 'Shield of Regeneration', 'Stun Immunity', 'Spirit Bond', 'Reversal of Fortune', 'Signet of Rage', 'Smite Hex'], 'armor_levels': {'Blunt damage': '72', 'Piercing damage': '112', 'Slashing damage': '112', 'Cold damage': '72', 'Earth damage': '112', 'Fire damage': '112', 'Lightning damage': '112'}, 'items_dropped': ['Pile of Glittering Dust', 'Sapphire', 'Stone Carving']},
-    3729: {'name': 'Warden of the Mind', 'profession': ['Mesmer'], 'attributes': [{'level': '(20', 'name': 'Domination Magic'}], 'skills_used': ['Shatter Enchantment', 'Shatter Hex', 'Cry of Frustration'], 'armor_levels': {'Blunt damage': '54 (75)', 'Piercing damage': '54 (75)', 'Slashing damage': '54 (75)', 'Cold damage': '54 (75)', 'Earth damage': '54 (75)', 'Fire damage': '54 (75)', 'Lightning damage': '54 (75)'}, 'items_dropped': ['Fur Square', 'Sapphire', 'Tanned Hide Square', 'Warden Horn', 'Warden Vestments']},
-    3730: {'name': 'Warden of Earth', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Earth Magic'}], 'skills_used': ['Stoning', 'Glyph of Lesser Energy', 'Aura of Restoration', 'Ash Blast', 'Churning Earth', 'Shockwave'], 'armor_levels': {'Blunt damage': '72 (78)', 'Piercing damage': '72 (78)', 'Slashing damage': '72 (78)', 'Cold damage': '72 (78)', 'Earth damage': '72 (78)', 'Fire damage': '72 (78)', 'Lightning damage': '72 (78)'}, 'items_dropped': ['Fur Square', 'Sapphire', 'Tanned Hide Square', 'Warden Horn', 'Warden Vestments']},
-    3733: {'name': 'Warden of the Trunk', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"None Shall Pass!"', 'Counter Blow'], 'armor_levels': {'Blunt damage': '94 (115)', 'Piercing damage': '94 (115)', 'Slashing damage': '94 (115)', 'Cold damage': '74 (95)', 'Earth damage': '74 (95)', 'Fire damage': '74 (95)', 'Lightning damage': '74 (95)'}, 'items_dropped': ['Fur Square', 'Sapphire', 'Tanned Hide Square', 'Warden Horn', 'Warden Pauldron']},
-    3736: {'name': 'Warden of the Leaf', 'profession': ['Ranger'], 'attributes': [{'level': '12', 'name': 'Wilderness Survival'}], 'skills_used': ['Snare', 'Brambles', 'Lacerate', 'Barbed Trap'], 'armor_levels': {'Blunt damage': '67 (85)', 'Piercing damage': '67 (85)', 'Slashing damage': '67 (85)', 'Cold damage': '97 (115)', 'Earth damage': '97 (115)', 'Fire damage': '97 (115)', 'Lightning damage': '97 (115)'}, 'items_dropped': ['Fur Square', 'Sapphire', 'Tanned Hide Square', 'Warden Armguard', 'Warden Horn']},
-    3737: {'name': 'Warden of the Summer', 'profession': ['Ritualist'], 'attributes': [{'level': '0', 'name': 'Spawning Power'}], 'skills_used': ['Spirit Light', 'Splinter Weapon', 'Consume Soul'], 'armor_levels': {'Blunt damage': '60 (78)', 'Piercing damage': '60 (78)', 'Slashing damage': '60 (78)', 'Cold damage': '60 (78)', 'Earth damage': '60 (78)', 'Fire damage': '60 (78)', 'Lightning damage': '60 (78)'}, 'items_dropped': ['Fur Square', 'Sapphire', 'Tanned Hide Square', 'Warden Horn', 'Warden Vestments']},
-    3741: {'name': 'Projects/NPC models/Dredge', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3765: {'name': 'Sickened Lynx', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Power Attack', '"I Will Avenge You!"', 'Endure Pain', "Bull's Strike", 'Frenzy', 'Primal Rage'], 'armor_levels': {'Blunt damage': '16', 'Piercing damage': '16', 'Slashing damage': '16', 'Cold damage': '16', 'Earth damage': '16', 'Fire damage': '16', 'Lightning damage': '16'}, 'items_dropped': ['Animal Hide']},
-    3766: {'name': 'Sickened Moa', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Power Attack', '"I Will Avenge You!"', 'Endure Pain', "Bull's Strike", 'Frenzy', 'Primal Rage'], 'armor_levels': {'Blunt damage': '16', 'Piercing damage': '16', 'Slashing damage': '16', 'Cold damage': '16', 'Earth damage': '16', 'Fire damage': '16', 'Lightning damage': '16'}, 'items_dropped': ['Animal Hide']},
-    3767: {'name': 'Sickened Stalker', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Power Attack', '"I Will Avenge You!"', 'Endure Pain', "Bull's Strike", 'Frenzy', 'Primal Rage'], 'armor_levels': {'Blunt damage': '16', 'Piercing damage': '16', 'Slashing damage': '16', 'Cold damage': '16', 'Earth damage': '16', 'Fire damage': '16', 'Lightning damage': '16'}, 'items_dropped': ['Animal Hide']},
-    3768: {'name': 'Sickened Wolf', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Power Attack', '"I Will Avenge You!"', 'Endure Pain', "Bull's Strike", 'Frenzy', 'Primal Rage'], 'armor_levels': {'Blunt damage': '16', 'Piercing damage': '16', 'Slashing damage': '16', 'Cold damage': '16', 'Earth damage': '16', 'Fire damage': '16', 'Lightning damage': '16'}, 'items_dropped': ['Animal Hide']},
-    3769: {'name': 'Sickened Warthog', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Power Attack', '"I Will Avenge You!"', 'Endure Pain', "Bull's Strike", 'Frenzy', 'Primal Rage'], 'armor_levels': {'Blunt damage': '16', 'Piercing damage': '16', 'Slashing damage': '16', 'Cold damage': '16', 'Earth damage': '16', 'Fire damage': '16', 'Lightning damage': '16'}, 'items_dropped': ['Animal Hide']},
-    3770: {'name': 'Sickened Bear', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Power Attack', '"I Will Avenge You!"', 'Endure Pain', "Bull's Strike", 'Frenzy', 'Primal Rage'], 'armor_levels': {'Blunt damage': '16', 'Piercing damage': '16', 'Slashing damage': '16', 'Cold damage': '16', 'Earth damage': '16', 'Fire damage': '16', 'Lightning damage': '16'}, 'items_dropped': ['Animal Hide']},
-    3771: {'name': 'Sickened Guard', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3774: {'name': 'Sickened Guard', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3772: {'name': 'Sickened Servant', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Star Burst', 'Breath of Fire', 'Flare'], 'armor_levels': {}, 'items_dropped': ['Forgotten Trinket Box']},
-    3773: {'name': 'Sickened Scribe', 'profession': ['Ritualist'], 'attributes': [{'level': '9', 'name': 'Communing'}], 'skills_used': ['Spirit Burn', 'Pain', 'Brutal Weapon'], 'armor_levels': {}, 'items_dropped': ['Forgotten Trinket Box']},
-    3780: {'name': 'Afflicted Yijo', 'profession': ['Ritualist'], 'attributes': [{'level': '12', 'name': 'Communing'}, {'level': '14', 'name': 'Restoration Magic'}], 'skills_used': ['Pain', 'Afflicted Soul Explosion', 'Spirit Burn', 'Vengeful Weapon', 'Spirit Rift'], 'armor_levels': {}, 'items_dropped': ['Augmented Flesh', 'Monstrous Eye']},
-    3781: {'name': 'The Afflicted Kana', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Draw Conditions', 'Afflicted Soul Explosion', 'Retribution', 'Reversal of Fortune', 'Aegis'], 'armor_levels': {}, 'items_dropped': ['Augmented Flesh', 'Plagueborn Scepter']},
-    3783: {'name': 'List of afflicted bosses', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3784: {'name': 'Diseased Minister', 'profession': ['Necromancer'], 'attributes': [{'level': '9', 'name': 'Death Magic'}], 'skills_used': ['Bitter Chill', 'Afflicted Soul Explosion', 'Animate Vampiric Horror'], 'armor_levels': {}, 'items_dropped': ['Augmented Flesh', 'Bone', 'Monstrous Eye', 'Plagueborn Armor']},
-    3785: {'name': 'Afflicted Horror', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Hammer Bash', 'Afflicted Soul Explosion', 'Renewing Smash', 'Frenzy'], 'armor_levels': {}, 'items_dropped': ['Augmented Flesh', 'Bone', 'Monstrous Eye', 'Monstrous Fang', 'Plagueborn Armor', 'Plagueborn Maul', 'Plagueborn Shield']},
-    3795: {'name': 'The Afflicted Li Yun', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Afflicted Soul Explosion', 'Accumulated Pain', 'Stolen Speed', "Kitah's Burden", 'Images of Remorse', 'Drain Enchantment'], 'armor_levels': {}, 'items_dropped': ['Plagueborn Armor']},
-    3797: {'name': 'The Afflicted Kam', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Lightning Orb', 'Afflicted Soul Explosion', 'Aura of Restoration', 'Lava Arrows', 'Mind Burn', 'Fire Attunement'], 'armor_levels': {}, 'items_dropped': ['Putrid Cyst']},
-    3798: {'name': 'The Afflicted Miju', 'profession': ['Monk'], 'attributes': [{'level': '15', 'name': 'Smiting Prayers'}], 'skills_used': ['Draw Conditions', 'Afflicted Soul Explosion', 'Retribution', 'Ray of Judgment', 'Reversal of Fortune', 'Aegis'], 'armor_levels': {}, 'items_dropped': ['Bone', 'Putrid Cyst']},
-    3801: {'name': 'The Afflicted Hakaru', 'profession': ['Ritualist'], 'attributes': [{'level': '15', 'name': 'Channeling Magic'}, {'level': '15', 'name': 'Restoration Magic'}], 'skills_used': ['Afflicted Soul Explosion', 'Spirit Transfer', 'Nightmare Weapon', 'Life', 'Weapon of Quickening', 'Recuperation'], 'armor_levels': {}, 'items_dropped': ['Bone', 'Monstrous Eye', 'Putrid Cyst']},
-    3802: {'name': 'The Afflicted Senku', 'profession': ['Assassin'], 'attributes': [], 'skills_used': ['Shadow Refuge', 'Afflicted Soul Explosion', 'Wild Strike', 'Shadow Form', 'Jagged Strike', 'Dancing Daggers', 'Death Blossom'], 'armor_levels': {}, 'items_dropped': ['Augmented Flesh', 'Bone', 'Pulsating Growth']},
-    3803: {'name': 'The Afflicted Hsin Jun', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Afflicted Soul Explosion', 'Accumulated Pain', 'Stolen Speed', "Kitah's Burden", 'Images of Remorse', 'Drain Enchantment'], 'armor_levels': {}, 'items_dropped': []},
-    3806: {'name': 'The Afflicted Jingme', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Draw Conditions', 'Afflicted Soul Explosion', 'Retribution', 'Ray of Judgment', 'Reversal of Fortune', 'Aegis'], 'armor_levels': {}, 'items_dropped': []},
-    3807: {'name': 'The Afflicted Maaka', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Auspicious Blow', '"On Your Knees!"', 'Afflicted Soul Explosion', 'Endure Pain', 'Enraged Smash', 'Frenzy'], 'armor_levels': {}, 'items_dropped': []},
-    3809: {'name': 'The Afflicted Xenxo', 'profession': ['Ritualist'], 'attributes': [{'level': '16-17', 'name': 'Restoration Magic'}], 'skills_used': ['Afflicted Soul Explosion', 'Spirit Transfer', 'Nightmare Weapon', 'Life', 'Weapon of Quickening', 'Recuperation'], 'armor_levels': {}, 'items_dropped': []},
-    3818: {'name': 'Afflicted Assassin', 'profession': ['Assassin', 'Ranger'], 'attributes': [{'level': 'Level 20: 6', 'name': 'Dagger Mastery'}], 'skills_used': ['Shadow Refuge', 'Impale', 'Signet of Deadly Corruption', 'Signet of Toxic Shock', 'Shadowy Soul Explosion', 'Jagged Strike', 'Afflicted Soul Explosion', 'Blades of Steel', 'Wild Strike', 'Shadow Form', "Death's Charge", 'Horns of the Ox', 'Fox Fangs', 'Golden Lotus Strike', 'Moebius Strike', 'Temple Strike', 'Death Blossom', 'Twisting Fangs', 'Falling Spider', 'Iron Palm', 'Poison Tip Signet'], 'armor_levels': {'Blunt damage': '70', 'Piercing damage': '70', 'Slashing damage': '70', 'Cold damage': '70', 'Earth damage': '70', 'Fire damage': '70', 'Lightning damage': '70'}, 'items_dropped': ['Augmented Flesh', 'Bone', 'Monstrous Claw', 'Monstrous Eye', 'Monstrous Fang', 'Plagueborn Armor', 'Plagueborn Recurve Bow', 'Pulsating Growth', 'Putrid Cyst']},
-    3819: {'name': 'Afflicted Assassin', 'profession': ['Assassin', 'Ranger'], 'attributes': [{'level': 'Level 20: 6', 'name': 'Dagger Mastery'}], 'skills_used': ['Shadow Refuge', 'Impale', 'Signet of Deadly Corruption', 'Signet of Toxic Shock', 'Shadowy Soul Explosion', 'Jagged Strike', 'Afflicted Soul Explosion', 'Blades of Steel', 'Wild Strike', 'Shadow Form', "Death's Charge", 'Horns of the Ox', 'Fox Fangs', 'Golden Lotus Strike', 'Moebius Strike', 'Temple Strike', 'Death Blossom', 'Twisting Fangs', 'Falling Spider', 'Iron Palm', 'Poison Tip Signet'], 'armor_levels': {'Blunt damage': '70', 'Piercing damage': '70', 'Slashing damage': '70', 'Cold damage': '70', 'Earth damage': '70', 'Fire damage': '70', 'Lightning damage': '70'}, 'items_dropped': ['Augmented Flesh', 'Bone', 'Monstrous Claw', 'Monstrous Eye', 'Monstrous Fang', 'Plagueborn Armor', 'Plagueborn Recurve Bow', 'Pulsating Growth', 'Putrid Cyst']},
-    3823: {'name': 'Afflicted Assassin', 'profession': ['Assassin', 'Ranger'], 'attributes': [{'level': 'Level 20: 6', 'name': 'Dagger Mastery'}], 'skills_used': ['Shadow Refuge', 'Impale', 'Signet of Deadly Corruption', 'Signet of Toxic Shock', 'Shadowy Soul Explosion', 'Jagged Strike', 'Afflicted Soul Explosion', 'Blades of Steel', 'Wild Strike', 'Shadow Form', "Death's Charge", 'Horns of the Ox', 'Fox Fangs', 'Golden Lotus Strike', 'Moebius Strike', 'Temple Strike', 'Death Blossom', 'Twisting Fangs', 'Falling Spider', 'Iron Palm', 'Poison Tip Signet'], 'armor_levels': {'Blunt damage': '70', 'Piercing damage': '70', 'Slashing damage': '70', 'Cold damage': '70', 'Earth damage': '70', 'Fire damage': '70', 'Lightning damage': '70'}, 'items_dropped': ['Augmented Flesh', 'Bone', 'Monstrous Claw', 'Monstrous Eye', 'Monstrous Fang', 'Plagueborn Armor', 'Plagueborn Recurve Bow', 'Pulsating Growth', 'Putrid Cyst']},
-    3825: {'name': 'Afflicted Bull', 'profession': ['Monk'], 'attributes': [{'level': '16', 'name': 'Smiting Prayers'}], 'skills_used': ['Signet of Rage'], 'armor_levels': {'Blunt damage': '39', 'Piercing damage': '39', 'Slashing damage': '39', 'Cold damage': '39', 'Earth damage': '39', 'Fire damage': '39', 'Lightning damage': '39'}, 'items_dropped': ['Bone', 'Monstrous Eye', 'Augmented Flesh', 'Plagueborn Armor', 'Plagueborn Shield']},
-    3826: {'name': 'Afflicted Mesmer', 'profession': ['Mesmer'], 'attributes': [{'level': '10', 'name': 'Illusion Magic'}], 'skills_used': ['Unnatural Signet', 'Shatter Delusions', 'Shatter Enchantment', 'Backfire', 'Afflicted Soul Explosion', 'Chaotic Soul Explosion', 'Stolen Speed', 'Images of Remorse', 'Ether Feast', 'Diversion', 'Energy Surge', 'Mind Wrack', 'Accumulated Pain', 'Visions of Regret', 'Signet of Humility', 'Drain Enchantment', 'Cry of Frustration', 'Power Drain', "Kitah's Burden", 'Empathy'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Augmented Flesh', 'Bone', 'Monstrous Claw', 'Monstrous Fang', 'Plagueborn Armor', 'Plagueborn Scepter', 'Pulsating Growth', 'Putrid Cyst']},
-    3831: {'name': 'Afflicted Mesmer', 'profession': ['Mesmer'], 'attributes': [{'level': '10', 'name': 'Illusion Magic'}], 'skills_used': ['Unnatural Signet', 'Shatter Delusions', 'Shatter Enchantment', 'Backfire', 'Afflicted Soul Explosion', 'Chaotic Soul Explosion', 'Stolen Speed', 'Images of Remorse', 'Ether Feast', 'Diversion', 'Energy Surge', 'Mind Wrack', 'Accumulated Pain', 'Visions of Regret', 'Signet of Humility', 'Drain Enchantment', 'Cry of Frustration', 'Power Drain', "Kitah's Burden", 'Empathy'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Augmented Flesh', 'Bone', 'Monstrous Claw', 'Monstrous Fang', 'Plagueborn Armor', 'Plagueborn Scepter', 'Pulsating Growth', 'Putrid Cyst']},
-    3833: {'name': 'Afflicted Necromancer', 'profession': ['Necromancer', 'Ritualist', 'Monk'], 'attributes': [{'level': '12', 'name': 'Blood Magic'}], 'skills_used': ['Dark Soul Explosion', 'Discord', 'Aura of the Lich', 'Afflicted Soul Explosion', 'Putrid Bile', 'Soul Barbs', "Verata's Aura", 'Death Nova', 'Order of Apostasy', 'Vile Miasma', 'Animate Shambling Horror', 'Jaundiced Gaze', 'Protective Spirit', 'Bitter Chill', 'Masochism', 'Weapon of Warding', 'Protective Was Kaolai', 'Blood Drinker', 'Aegis', 'Shield of Absorption'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Augmented Flesh', 'Bone', 'Monstrous Claw', 'Monstrous Eye', 'Monstrous Fang', 'Plagueborn Armor', 'Plagueborn Focus', 'Plagueborn Scepter', 'Pulsating Growth', 'Putrid Cyst']},
-    3838: {'name': 'Afflicted Necromancer', 'profession': ['Necromancer', 'Ritualist', 'Monk'], 'attributes': [{'level': '12', 'name': 'Blood Magic'}], 'skills_used': ['Dark Soul Explosion', 'Discord', 'Aura of the Lich', 'Afflicted Soul Explosion', 'Putrid Bile', 'Soul Barbs', "Verata's Aura", 'Death Nova', 'Order of Apostasy', 'Vile Miasma', 'Animate Shambling Horror', 'Jaundiced Gaze', 'Protective Spirit', 'Bitter Chill', 'Masochism', 'Weapon of Warding', 'Protective Was Kaolai', 'Blood Drinker', 'Aegis', 'Shield of Absorption'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Augmented Flesh', 'Bone', 'Monstrous Claw', 'Monstrous Eye', 'Monstrous Fang', 'Plagueborn Armor', 'Plagueborn Focus', 'Plagueborn Scepter', 'Pulsating Growth', 'Putrid Cyst']},
-    3840: {'name': 'Afflicted Elementalist', 'profession': ['Elementalist', 'Necromancer'], 'attributes': [{'level': '9', 'name': 'Fire Magic'}], 'skills_used': ['Lightning Orb', 'Liquid Flame', 'Afflicted Soul Explosion', 'Glowing Gaze', 'Invoke Lightning', 'Aura of Restoration', 'Fiery Soul Explosion', 'Chain Lightning', 'Air Attunement', 'Strip Enchantment', 'Lava Arrows', 'Order of Pain', 'Mark of Rodgort', 'Searing Flames', 'Mind Burn', 'Fire Attunement', 'Meteor Shower'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Augmented Flesh', 'Bone', 'Monstrous Claw', 'Monstrous Eye', 'Monstrous Fang', 'Plagueborn Armor', 'Plagueborn Scepter', 'Pulsating Growth', 'Putrid Cyst']},
-    3841: {'name': 'Afflicted Elementalist', 'profession': ['Elementalist', 'Necromancer'], 'attributes': [{'level': '9', 'name': 'Fire Magic'}], 'skills_used': ['Lightning Orb', 'Liquid Flame', 'Afflicted Soul Explosion', 'Glowing Gaze', 'Invoke Lightning', 'Aura of Restoration', 'Fiery Soul Explosion', 'Chain Lightning', 'Air Attunement', 'Strip Enchantment', 'Lava Arrows', 'Order of Pain', 'Mark of Rodgort', 'Searing Flames', 'Mind Burn', 'Fire Attunement', 'Meteor Shower'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Augmented Flesh', 'Bone', 'Monstrous Claw', 'Monstrous Eye', 'Monstrous Fang', 'Plagueborn Armor', 'Plagueborn Scepter', 'Pulsating Growth', 'Putrid Cyst']},
-    3845: {'name': 'Afflicted Elementalist', 'profession': ['Elementalist', 'Necromancer'], 'attributes': [{'level': '9', 'name': 'Fire Magic'}], 'skills_used': ['Lightning Orb', 'Liquid Flame', 'Afflicted Soul Explosion', 'Glowing Gaze', 'Invoke Lightning', 'Aura of Restoration', 'Fiery Soul Explosion', 'Chain Lightning', 'Air Attunement', 'Strip Enchantment', 'Lava Arrows', 'Order of Pain', 'Mark of Rodgort', 'Searing Flames', 'Mind Burn', 'Fire Attunement', 'Meteor Shower'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Augmented Flesh', 'Bone', 'Monstrous Claw', 'Monstrous Eye', 'Monstrous Fang', 'Plagueborn Armor', 'Plagueborn Scepter', 'Pulsating Growth', 'Putrid Cyst']},
-    3847: {'name': 'Afflicted Monk', 'profession': ['Monk', 'Mesmer'], 'attributes': [{'level': 'Level 20: 14', 'name': 'Smiting Prayers'}], 'skills_used': ['Draw Conditions', 'Afflicted Soul Explosion', 'Shield of Regeneration', 'Retribution', 'Smite Condition', 'Holy Wrath', 'Rejuvenating Soul Explosion', 'Arcane Echo', 'Spirit Bond', 'Reversal of Damage', 'Ray of Judgment', "Zealot's Fire", 'Reversal of Fortune', 'Aegis', 'Shield of Absorption', 'Smite Hex'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Augmented Flesh', 'Bone', 'Monstrous Claw', 'Monstrous Eye', 'Monstrous Fang', 'Plagueborn Armor', 'Pulsating Growth', 'Putrid Cyst']},
-    3848: {'name': 'Afflicted Monk', 'profession': ['Monk', 'Mesmer'], 'attributes': [{'level': 'Level 20: 14', 'name': 'Smiting Prayers'}], 'skills_used': ['Draw Conditions', 'Afflicted Soul Explosion', 'Shield of Regeneration', 'Retribution', 'Smite Condition', 'Holy Wrath', 'Rejuvenating Soul Explosion', 'Arcane Echo', 'Spirit Bond', 'Reversal of Damage', 'Ray of Judgment', "Zealot's Fire", 'Reversal of Fortune', 'Aegis', 'Shield of Absorption', 'Smite Hex'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Augmented Flesh', 'Bone', 'Monstrous Claw', 'Monstrous Eye', 'Monstrous Fang', 'Plagueborn Armor', 'Pulsating Growth', 'Putrid Cyst']},
-    3854: {'name': 'Afflicted Warrior', 'profession': ['Warrior', 'Elementalist'], 'attributes': [], 'skills_used': ['Auspicious Blow', '"On Your Knees!"', 'Crushing Blow', 'Afflicted Soul Explosion', 'Aftershock', 'Grasping Earth', 'Unbalancing Soul Explosion', 'Enraging Charge', 'Earth Shaker', '"I Will Avenge You!"', 'Berserker Stance', 'Endure Pain', 'Enraged Smash', 'Frenzy', 'Backbreaker', "Lion's Comfort", 'Crude Swing'], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '100', 'Slashing damage': '100', 'Cold damage': '80', 'Earth damage': '80', 'Fire damage': '80', 'Lightning damage': '80'}, 'items_dropped': ['Augmented Flesh', 'Bone', 'Monstrous Claw', 'Monstrous Eye', 'Monstrous Fang', 'Plagueborn Armor', 'Pulsating Growth', 'Putrid Cyst']},
-    3859: {'name': 'Afflicted Warrior', 'profession': ['Warrior', 'Elementalist'], 'attributes': [], 'skills_used': ['Auspicious Blow', '"On Your Knees!"', 'Crushing Blow', 'Afflicted Soul Explosion', 'Aftershock', 'Grasping Earth', 'Unbalancing Soul Explosion', 'Enraging Charge', 'Earth Shaker', '"I Will Avenge You!"', 'Berserker Stance', 'Endure Pain', 'Enraged Smash', 'Frenzy', 'Backbreaker', "Lion's Comfort", 'Crude Swing'], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '100', 'Slashing damage': '100', 'Cold damage': '80', 'Earth damage': '80', 'Fire damage': '80', 'Lightning damage': '80'}, 'items_dropped': ['Augmented Flesh', 'Bone', 'Monstrous Claw', 'Monstrous Eye', 'Monstrous Fang', 'Plagueborn Armor', 'Pulsating Growth', 'Putrid Cyst']},
-    3861: {'name': 'Afflicted Ranger', 'profession': ['Ranger', 'Warrior', 'Elementalist'], 'attributes': [{'level': '14', 'name': 'Wilderness Survival'}], 'skills_used': ['Troll Unguent', 'Favorable Winds', 'Kindle Arrows', 'Ignite Arrows', 'Distracting Shot', "Marauder's Shot", 'Healing Spring', 'Afflicted Soul Explosion', 'Burning Arrow', 'Apply Poison', 'Throw Dirt', 'Savage Shot', 'Dual Shot', 'Conjure Flame', "Melandru's Shot", "Dryder's Defenses", 'Plague Spring', 'Broad Head Arrow', 'Frenzy', 'Antidote Signet'], 'armor_levels': {'Blunt damage': '70', 'Piercing damage': '70', 'Slashing damage': '70', 'Cold damage': '100', 'Earth damage': '100', 'Fire damage': '100', 'Lightning damage': '100'}, 'items_dropped': ['Augmented Flesh', 'Bone', 'Monstrous Claw', 'Monstrous Eye', 'Monstrous Fang', 'Plagueborn Armor', 'Pulsating Growth', 'Putrid Cyst']},
-    3862: {'name': 'Afflicted Ranger', 'profession': ['Ranger', 'Warrior', 'Elementalist'], 'attributes': [{'level': '14', 'name': 'Wilderness Survival'}], 'skills_used': ['Troll Unguent', 'Favorable Winds', 'Kindle Arrows', 'Ignite Arrows', 'Distracting Shot', "Marauder's Shot", 'Healing Spring', 'Afflicted Soul Explosion', 'Burning Arrow', 'Apply Poison', 'Throw Dirt', 'Savage Shot', 'Dual Shot', 'Conjure Flame', "Melandru's Shot", "Dryder's Defenses", 'Plague Spring', 'Broad Head Arrow', 'Frenzy', 'Antidote Signet'], 'armor_levels': {'Blunt damage': '70', 'Piercing damage': '70', 'Slashing damage': '70', 'Cold damage': '100', 'Earth damage': '100', 'Fire damage': '100', 'Lightning damage': '100'}, 'items_dropped': ['Augmented Flesh', 'Bone', 'Monstrous Claw', 'Monstrous Eye', 'Monstrous Fang', 'Plagueborn Armor', 'Pulsating Growth', 'Putrid Cyst']},
-    3866: {'name': 'Afflicted Ranger', 'profession': ['Ranger', 'Warrior', 'Elementalist'], 'attributes': [{'level': '14', 'name': 'Wilderness Survival'}], 'skills_used': ['Troll Unguent', 'Favorable Winds', 'Kindle Arrows', 'Ignite Arrows', 'Distracting Shot', "Marauder's Shot", 'Healing Spring', 'Afflicted Soul Explosion', 'Burning Arrow', 'Apply Poison', 'Throw Dirt', 'Savage Shot', 'Dual Shot', 'Conjure Flame', "Melandru's Shot", "Dryder's Defenses", 'Plague Spring', 'Broad Head Arrow', 'Frenzy', 'Antidote Signet'], 'armor_levels': {'Blunt damage': '70', 'Piercing damage': '70', 'Slashing damage': '70', 'Cold damage': '100', 'Earth damage': '100', 'Fire damage': '100', 'Lightning damage': '100'}, 'items_dropped': ['Augmented Flesh', 'Bone', 'Monstrous Claw', 'Monstrous Eye', 'Monstrous Fang', 'Plagueborn Armor', 'Pulsating Growth', 'Putrid Cyst']},
-    3868: {'name': 'Afflicted Ravager', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Sever Artery', 'Gash', 'Frenzy'], 'armor_levels': {'Blunt damage': '53', 'Piercing damage': '53', 'Slashing damage': '53', 'Cold damage': '53', 'Earth damage': '53', 'Fire damage': '53', 'Lightning damage': '53'}, 'items_dropped': ['Bone', 'Plagueborn Armor', 'Augmented Flesh']},
-    3869: {'name': 'Afflicted Ritualist', 'profession': ['Ritualist', 'Mesmer'], 'attributes': [{'level': '9', 'name': 'Restoration Magic'}], 'skills_used': ['Pain', 'Signet of Spirits', 'Ethereal Soul Explosion', 'Life', 'Renewing Surge', 'Weapon of Quickening', 'Afflicted Soul Explosion', 'Spirit Transfer', 'Dulled Weapon', 'Nightmare Weapon', "Ancestors' Rage", 'Agony', 'Bloodsong', 'Flesh of My Flesh', 'Recuperation', 'Armor of Unfeeling', 'Echo', 'Spirit Rift', 'Boon of Creation', 'Splinter Weapon'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Augmented Flesh', 'Bone', 'Monstrous Claw', 'Monstrous Fang', 'Plagueborn Armor', 'Plagueborn Scepter', 'Pulsating Growth', 'Putrid Cyst']},
-    3878: {'name': 'Ahvha Sankii', 'profession': ['Ranger'], 'attributes': [{'level': '7', 'name': 'Beast Mastery'}], 'skills_used': ['Primal Echoes', "Viper's Nest", 'Snare'], 'armor_levels': {}, 'items_dropped': ["Ahvha's Longbow", 'unique', 'Bolt of Cloth', 'Stolen Supplies', 'Tanned Hide Square', 'Yeti Armguard']},
-    3879: {'name': 'Pei the Skull Blade', 'profession': ['Assassin'], 'attributes': [], 'skills_used': ['Golden Phoenix Strike', 'Shroud of Distress', 'Golden Lotus Strike', 'Blades of Steel'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Crimson Skull Cape', "Pei's Blades", 'unique', 'Ruby', 'Silver Crimson Skull Coin']},
-    3881: {'name': 'Yingko the Skull Claw', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Demonic Flesh', 'Enfeebling Blood', 'Oppressive Gaze'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Copper Crimson Skull Coin', 'Crimson Skull Cape', "Yingko's Claw", 'unique']},
-    3883: {'name': 'Feng the Skull Symbol', 'profession': ['Monk'], 'attributes': [{'level': '12', 'name': 'Smiting Prayers'}], 'skills_used': ['Signet of Rage', 'Orison of Healing', 'Natural Resistance', 'Reverse Hex'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Crimson Skull Cape', "Feng's Focus", 'unique', 'Ruby', 'Silver Crimson Skull Coin']},
-    3884: {'name': 'Captain Quimang', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Furious Axe', 'Penetrating Chop', '"For Great Justice!"'], 'armor_levels': {}, 'items_dropped': ["Cho Wei's Axe", 'unique', 'Crimson Skull Cape', 'Silver Crimson Skull Coin']},
-    3885: {'name': 'Jin the Skull Bow', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Kindle Arrows', 'Called Shot', "Marauder's Shot"], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Copper Crimson Skull Coin', 'Crimson Skull Boots', "Jin's Hornbow", 'unique', 'Silver Crimson Skull Coin']},
-    3886: {'name': 'Miki the Skull Spirit', 'profession': ['Ritualist'], 'attributes': [{'level': '11', 'name': 'Communing'}], 'skills_used': ['Shelter', 'Pain', 'Painful Bond'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Copper Crimson Skull Coin', 'Crimson Skull Cape', "Miki's Staff", 'unique', 'Silver Crimson Skull Coin']},
-    3887: {'name': 'Tahkayun Tsi', 'profession': ['Assassin'], 'attributes': [{'level': '5-7', 'name': 'Deadly Arts'}], 'skills_used': ['Mantis Touch', 'Nine Tail Strike', 'Dark Prison', 'Leaping Mantis Sting'], 'armor_levels': {}, 'items_dropped': ['Amber Chunk', 'Chitin Fragment', 'Mantid Pincer', 'Monstrous Eye', 'Ruby', "Tahkayun's Pincers", 'unique']},
-    3888: {'name': 'Yunlai Deathkeeper', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Parasitic Bond', 'Deathly Swarm', 'Vile Touch'], 'armor_levels': {}, 'items_dropped': ['Chitin Fragment', 'Mantid Pincer', 'The Deathkeeper', 'unique']},
-    3889: {'name': 'Ziinjuu Life Crawler', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Ethereal Light', 'Draw Conditions', 'Spear of Light'], 'armor_levels': {}, 'items_dropped': ['Chitin Fragment', 'Mantid Pincer', 'Monstrous Eye', 'Ruby', "Ziinjuu's Sanctuary", 'unique']},
-    3892: {'name': 'Cow', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3895: {'name': 'Bonesnap Turtle', 'profession': ['Necromancer'], 'attributes': [{'level': '10', 'name': 'Curses'}, {'level': '7-8', 'name': 'Death Magic'}], 'skills_used': ['Gaze of Contempt', 'Weaken Armor', 'Animate Bone Minions', 'Barbs'], 'armor_levels': {'Blunt damage': '33', 'Piercing damage': '33', 'Slashing damage': '33', 'Cold damage': '33', 'Earth damage': '33', 'Fire damage': '33', 'Lightning damage': '33'}, 'items_dropped': ['Bone', 'Bonesnap Shell']},
-    3896: {'name': 'Crimson Skull Ether Fiend', 'profession': ['Mesmer'], 'attributes': [{'level': '7-8', 'name': 'Illusion Magic'}], 'skills_used': ['Imagined Burden', 'Crippling Anguish', 'Accumulated Pain'], 'armor_levels': {'Blunt damage': '33', 'Piercing damage': '33', 'Slashing damage': '33', 'Cold damage': '33', 'Earth damage': '33', 'Fire damage': '33', 'Lightning damage': '33'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Crimson Skull Cape', 'Ruby', 'Silver Crimson Skull Coin']},
-    3898: {'name': 'Crimson Skull Mentalist', 'profession': ['Mesmer'], 'attributes': [{'level': '14', 'name': 'Illusion Magic'}], 'skills_used': ['Imagined Burden', 'Crippling Anguish', 'Conjure Phantasm', 'Accumulated Pain'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Bolt of Cloth', 'Crimson Skull Cape', 'Gold Crimson Skull Coin']},
-    3899: {'name': 'Crimson Skull Mesmer', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Crippling Anguish', 'Accumulated Pain'], 'armor_levels': {'Blunt damage': '13', 'Piercing damage': '13', 'Slashing damage': '13', 'Cold damage': '13', 'Earth damage': '13', 'Fire damage': '13', 'Lightning damage': '13'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Copper Crimson Skull Coin', 'Crimson Skull Cape']},
-    3900: {'name': 'Crimson Skull Healer', 'profession': ['Monk'], 'attributes': [{'level': '7', 'name': 'Smiting Prayers'}], 'skills_used': ['Signet of Rage', 'Orison of Healing', 'Healing Burst'], 'armor_levels': {'Blunt damage': '29', 'Piercing damage': '29', 'Slashing damage': '29', 'Cold damage': '29', 'Earth damage': '29', 'Fire damage': '29', 'Lightning damage': '29'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Copper Crimson Skull Coin', 'Crimson Skull Cape', 'Ruby']},
-    3903: {'name': 'Crimson Skull Mender', 'profession': ['Monk', 'Mesmer'], 'attributes': [{'level': '5', 'name': 'Smiting Prayers'}], 'skills_used': ['Mantra of Inscriptions', 'Castigation Signet', 'Reversal of Damage', 'Healing Burst', 'Boon Signet', "Judge's Intervention", 'Signet of Rage', 'Signet of Devotion', 'Bane Signet'], 'armor_levels': {'Blunt damage': '13', 'Piercing damage': '13', 'Slashing damage': '13', 'Cold damage': '13', 'Earth damage': '13', 'Fire damage': '13', 'Lightning damage': '13'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Ruby', 'Copper Crimson Skull Coin', 'Crimson Skull Cape', 'Gold Crimson Skull Coin']},
-    3904: {'name': 'Crimson Skull Hunter', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ["Melandru's Shot", 'Kindle Arrows', 'Called Shot'], 'armor_levels': {'Blunt damage': '31', 'Piercing damage': '31', 'Slashing damage': '31', 'Cold damage': '61', 'Earth damage': '61', 'Fire damage': '61', 'Lightning damage': '61'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Copper Crimson Skull Coin', 'Crimson Skull Boots', 'Ruby']},
-    3906: {'name': 'Crimson Skull Longbow', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ["Melandru's Shot", 'Kindle Arrows', 'Called Shot', "Marauder's Shot"], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Crimson Skull Boots', 'Gold Crimson Skull Coin', 'Ruby']},
-    3907: {'name': 'Crimson Skull Raider', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ["Melandru's Shot", 'Called Shot'], 'armor_levels': {'Blunt damage': '19', 'Piercing damage': '19', 'Slashing damage': '19', 'Cold damage': '49', 'Earth damage': '49', 'Fire damage': '49', 'Lightning damage': '49'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Copper Crimson Skull Coin', 'Crimson Skull Boots', 'Crimson Skull Cape', 'Ruby']},
-    3908: {'name': 'Crimson Skull Seer', 'profession': ['Ritualist'], 'attributes': [{'level': '7-8', 'name': 'Channeling Magic'}, {'level': '7', 'name': 'Communing'}], 'skills_used': ['Wanderlust', 'Pain', 'Painful Bond'], 'armor_levels': {'Blunt damage': '33', 'Piercing damage': '33', 'Slashing damage': '33', 'Cold damage': '33', 'Earth damage': '33', 'Fire damage': '33', 'Lightning damage': '33'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Crimson Skull Cape', 'Ruby', 'Silver Crimson Skull Coin']},
-    3910: {'name': 'Crimson Skull Spirit Lord', 'profession': ['Ritualist'], 'attributes': [{'level': '13-14', 'name': 'Communing'}], 'skills_used': ['Shelter', 'Wanderlust', 'Pain', 'Painful Bond'], 'armor_levels': {}, 'items_dropped': ['Crimson Skull Cape', 'Gold Crimson Skull Coin', 'Bolt of Linen']},
-    3911: {'name': 'Crimson Skull Ritualist', 'profession': ['Ritualist'], 'attributes': [{'level': '4', 'name': 'Communing'}], 'skills_used': ['Wanderlust', 'Pain'], 'armor_levels': {'Blunt damage': '14', 'Piercing damage': '14', 'Slashing damage': '14', 'Cold damage': '14', 'Earth damage': '14', 'Fire damage': '14', 'Lightning damage': '14'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Copper Crimson Skull Coin', 'Crimson Skull Cape']},
-    3914: {'name': 'Mantid Drone', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Deathly Swarm'], 'armor_levels': {'Blunt damage': '7', 'Piercing damage': '7', 'Slashing damage': '7', 'Cold damage': '7', 'Earth damage': '7', 'Fire damage': '7', 'Lightning damage': '7'}, 'items_dropped': ['Amber Chunk', 'Chitin Fragment', 'Mantid Pincer', 'Monstrous Eye', 'Ruby']},
-    4168: {'name': 'Mantid Drone', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Deathly Swarm'], 'armor_levels': {'Blunt damage': '7', 'Piercing damage': '7', 'Slashing damage': '7', 'Cold damage': '7', 'Earth damage': '7', 'Fire damage': '7', 'Lightning damage': '7'}, 'items_dropped': ['Amber Chunk', 'Chitin Fragment', 'Mantid Pincer', 'Monstrous Eye', 'Ruby']},
-    3921: {'name': 'Mantid Drone Hatchling', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Deathly Swarm'], 'armor_levels': {}, 'items_dropped': ['Chitin Fragment', 'Mantid Pincer', 'Monstrous Eye']},
-    3924: {'name': 'Mantid Monitor', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Shield of Regeneration'], 'armor_levels': {'Blunt damage': '4 (66)', 'Piercing damage': '4 (66)', 'Slashing damage': '4 (66)', 'Cold damage': '4 (66)', 'Earth damage': '4 (66)', 'Fire damage': '4 (66)', 'Lightning damage': '4 (66)'}, 'items_dropped': ['Amber Chunk', 'Mantid Pincer', 'Monstrous Eye', 'Ruby']},
-    4169: {'name': 'Mantid Monitor', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Shield of Regeneration'], 'armor_levels': {'Blunt damage': '4 (66)', 'Piercing damage': '4 (66)', 'Slashing damage': '4 (66)', 'Cold damage': '4 (66)', 'Earth damage': '4 (66)', 'Fire damage': '4 (66)', 'Lightning damage': '4 (66)'}, 'items_dropped': ['Amber Chunk', 'Mantid Pincer', 'Monstrous Eye', 'Ruby']},
-    3929: {'name': 'Mantid Glitterfang', 'profession': ['Monk'], 'attributes': [{'level': '7', 'name': 'Smiting Prayers'}], 'skills_used': ['Ethereal Light', 'Shield of Regeneration', 'Spear of Light'], 'armor_levels': {}, 'items_dropped': ['Amber Chunk', 'Chitin Fragment', 'Mantid Pincer', 'Monstrous Eye', 'Ruby']},
-    3933: {'name': 'Mantid Monitor Hatchling', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Shield of Regeneration'], 'armor_levels': {'Blunt damage': '1', 'Piercing damage': '1', 'Slashing damage': '1', 'Cold damage': '1', 'Earth damage': '1', 'Fire damage': '1', 'Lightning damage': '1'}, 'items_dropped': ['Mantid Pincer']},
-    3936: {'name': 'Naga Welp', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Thrill of Victory', 'Quivering Blade'], 'armor_levels': {'Blunt damage': '50 to 54', 'Piercing damage': '50 to 54', 'Slashing damage': '50 to 54', 'Cold damage': '50 to 54', 'Earth damage': '50 to 54', 'Fire damage': '50 to 54', 'Lightning damage': '50 to 54'}, 'items_dropped': ['Bolt of Cloth', 'Monstrous Claw', 'Monstrous Fang', 'Naga Hide', 'Naga Vambrace', 'Scale']},
-    3939: {'name': 'Naga Spellblade', 'profession': ['Elementalist'], 'attributes': [{'level': '4', 'name': 'Water Magic'}], 'skills_used': ['Arc Lightning', 'Shatterstone'], 'armor_levels': {'Blunt damage': '7', 'Piercing damage': '7', 'Slashing damage': '7', 'Cold damage': '7', 'Earth damage': '7', 'Fire damage': '7', 'Lightning damage': '7'}, 'items_dropped': ['Bolt of Cloth', 'Monstrous Claw', 'Monstrous Fang', 'Naga Hide', 'Naga Longbow', 'Naga Trappings', 'Scale']},
-    3940: {'name': 'Naga Witch', 'profession': ['Ritualist'], 'attributes': [], 'skills_used': ['Defiant Was Xinrae', 'Spirit Rift', 'Union'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Naga Hide', 'Scale']},
-    3942: {'name': 'Naga Sibyl', 'profession': ['Ritualist'], 'attributes': [{'level': '(20', 'name': 'Channeling Magic'}, {'level': '18', 'name': 'Restoration Magic'}], 'skills_used': ['Defiant Was Xinrae', 'Spirit Rift'], 'armor_levels': {'Blunt damage': '7', 'Piercing damage': '7', 'Slashing damage': '7', 'Cold damage': '7', 'Earth damage': '7', 'Fire damage': '7', 'Lightning damage': '7'}, 'items_dropped': ['Bolt of Cloth', 'Monstrous Claw', 'Monstrous Fang', 'Naga Hide', 'Naga Shortbow', 'Naga Trappings', 'Scale']},
-    3943: {'name': 'Sensali Assassin', 'profession': ['Assassin'], 'attributes': [], 'skills_used': ['Critical Eye', 'Wild Strike', 'Palm Strike', 'Critical Defenses', 'Blades of Steel', 'Golden Lotus Strike', 'Black Spider Strike', "Locust's Fury", 'Critical Strike', 'Leaping Mantis Sting', 'Repeating Strike', 'Jungle Strike', 'Way of Perfection', 'Crippling Dagger', 'Twisting Fangs', 'Desperate Strike', 'Way of the Assassin', 'Augury of Death'], 'armor_levels': {'Blunt damage': '25', 'Piercing damage': '25', 'Slashing damage': '25', 'Cold damage': '25', 'Earth damage': '25', 'Fire damage': '25', 'Lightning damage': '25'}, 'items_dropped': ['Bone', 'Feather', 'Feathered Scalp', 'Sensali Garb']},
-    3945: {'name': 'Sensali Blood', 'profession': ['Necromancer'], 'attributes': [{'level': '7', 'name': 'Curses'}], 'skills_used': ['Wail of Doom', 'Faintheartedness', 'Enfeebling Touch'], 'armor_levels': {'Blunt damage': '16', 'Piercing damage': '16', 'Slashing damage': '16', 'Cold damage': '16', 'Earth damage': '16', 'Fire damage': '16', 'Lightning damage': '16'}, 'items_dropped': ['Feather', 'Feathered Scalp', 'Monstrous Claw', 'Sensali Garb']},
-    3947: {'name': 'Sensali Fighter', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Swift Chop', 'Triple Chop', 'Cyclone Axe'], 'armor_levels': {'Blunt damage': '57 to 58', 'Piercing damage': '57 to 58', 'Slashing damage': '57 to 58', 'Cold damage': '52 to 53', 'Earth damage': '52 to 53', 'Fire damage': '52 to 53', 'Lightning damage': '52 to 53'}, 'items_dropped': ['Bone', 'Feather', 'Feathered Scalp', 'Monstrous Eye', 'Sensali Crestguard']},
-    3950: {'name': 'Kappa', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3951: {'name': 'Kappa', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4040: {'name': 'Kappa', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3954: {'name': 'Mountain Yeti', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Devastating Hammer', 'Yeti Smash', 'Endure Pain', 'Staggering Blow'], 'armor_levels': {'Blunt damage': '86', 'Piercing damage': '86', 'Slashing damage': '86', 'Cold damage': '66', 'Earth damage': '66', 'Fire damage': '66', 'Lightning damage': '66'}, 'items_dropped': ['Bolt of Cloth', 'Fur Square', 'Stolen Supplies', 'Tanned Hide Square', 'Yeti Plating']},
-    3955: {'name': 'Longhair Yeti', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Mending', 'Signet of Devotion', 'Healing Light', 'Signet of Rejuvenation'], 'armor_levels': {'Blunt damage': '39', 'Piercing damage': '39', 'Slashing damage': '39', 'Cold damage': '39', 'Earth damage': '39', 'Fire damage': '39', 'Lightning damage': '39'}, 'items_dropped': ['Bolt of Cloth', 'Fur Square', 'Sapphire', 'Stolen Supplies', 'Tanned Hide Square', 'Yeti Rags']},
-    3956: {'name': 'Red Yeti', 'profession': ['Necromancer'], 'attributes': [{'level': '9', 'name': 'Death Magic'}], 'skills_used': ["Verata's Gaze", 'Vile Touch', 'Oppressive Gaze', 'Spoil Victor', 'Bitter Chill', 'Discord', 'Rising Bile', 'Animate Shambling Horror', 'Enfeebling Blood', 'Mark of Fury', 'Death Nova'], 'armor_levels': {'Blunt damage': '36', 'Piercing damage': '36', 'Slashing damage': '36', 'Cold damage': '36', 'Earth damage': '36', 'Fire damage': '36', 'Lightning damage': '36'}, 'items_dropped': ['Bolt of Cloth', 'Fur Square', 'Sapphire', 'Stolen Supplies', 'Tanned Hide Square', 'Yeti Rags']},
-    3958: {'name': 'Zunraa', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Blessing of the Kirin', "Balthazar's Aura"], 'armor_levels': {}, 'items_dropped': []},
-    3965: {'name': 'Kuunavang', 'profession': [], 'attributes': [], 'skills_used': ['Corrupted Dragon Spores', 'Renewing Corruption', 'Corrupted Breath', 'Stun Immunity', 'Corrupted Dragon Scales', 'Dark Chain Lightning'], 'armor_levels': {}, 'items_dropped': []},
-    3970: {'name': 'Razortongue Frothspit', 'profession': ['Ranger'], 'attributes': [{'level': '12-13', 'name': 'Wilderness Survival'}], 'skills_used': ['Determined Shot', 'Choking Gas', 'Needling Shot', "Melandru's Shot", 'Storm Chaser'], 'armor_levels': {}, 'items_dropped': ['Black Pearl', 'Decaying Mass', "Razortongue's Recurve Bow", 'unique']},
-    3971: {'name': 'KaySey Stormray', 'profession': ['Monk'], 'attributes': [{'level': '16', 'name': 'Smiting Prayers'}], 'skills_used': ['Healing Touch', "Balthazar's Aura", "Dwayna's Sorrow", 'Healing Light', 'Banish'], 'armor_levels': {}, 'items_dropped': ['Black Pearl', 'Stormray', 'unique']},
-    3981: {'name': 'Miella Lightwing', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Air of Enchantment', 'Spell Shield', 'Shielding Hands', 'Guardian', 'Reversal of Fortune'], 'armor_levels': {}, 'items_dropped': ['Azure Crest', "Miella's Focus", 'unique', 'Scale']},
-    3982: {'name': 'Snapjaw Windshell', 'profession': ['Elementalist'], 'attributes': [{'level': '16', 'name': 'Air Magic'}], 'skills_used': ["Teinai's Wind", 'Aura of Restoration', "Dragon's Stomp", 'Gale', 'Aftershock', 'Second Wind'], 'armor_levels': {}, 'items_dropped': ['Azure Crest', 'Scale', "Snapjaw's Powerstone", 'unique']},
-    3987: {'name': 'Arrahhsh Mountainclub', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Healing Signet', 'Staggering Blow', 'Heavy Blow', 'Yeti Smash', 'Battle Rage', 'Counter Blow'], 'armor_levels': {}, 'items_dropped': ["Arrahhsh's Aegis", 'unique', 'Fur Square', 'Golden Lantern', 'Stolen Provisions', 'Yeti Plating']},
-    3993: {'name': 'Amadis, Wind of the Sea', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ["Teinai's Wind", 'Blurred Vision', 'Arc Lightning', 'Maelstrom', 'Gust'], 'armor_levels': {}, 'items_dropped': ["Amadis' Air Staff", 'unique', 'Bone Charm']},
-    3998: {'name': 'Geoffer Pain Bringer', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Axe Rake', 'Disrupting Chop', 'Shield Bash', 'Dismember', 'Whirling Axe'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Bone Charm', "Geoffer's Bulwark", 'unique', 'Outcast Bracers']},
-    4005: {'name': 'Kenrii Sea Sorrow', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Backfire', 'Blessing of the Kirin', 'Shared Burden', 'Overload', 'Hex Breaker'], 'armor_levels': {}, 'items_dropped': ["Kenrii's Sorrow", 'unique']},
-    4007: {'name': 'Siska Scalewand', 'profession': ['Mesmer'], 'attributes': [{'level': '16', 'name': 'Domination Magic'}, {'level': '16', 'name': 'Inspiration Magic'}], 'skills_used': ['Backfire', 'Ether Feast', 'Spirit Shackles', 'Mind Wrack', 'Energy Drain', 'Leech Signet'], 'armor_levels': {}, 'items_dropped': ['Naga Skin', "Siska's Staff", 'unique']},
-    4009: {'name': 'Sarss, Stormscale', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Shock Arrow', 'Aura of Restoration', 'Enervating Charge', 'Lightning Surge', 'Lightning Strike'], 'armor_levels': {}, 'items_dropped': ['Monstrous Fang', 'Naga Skin', 'Naga Trappings', 'Scale']},
-    4011: {'name': "Sskai, Dragon's Birth", 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Signet of Strength', 'Healing Signet', 'Seeking Blade', 'Jaizhenju Strike', 'Distracting Blow', 'Dragon Slash'], 'armor_levels': {}, 'items_dropped': ['Monstrous Claw', 'Monstrous Fang', 'Naga Skin', 'Naga Vambrace', 'Scale', "Sskai's Sword", 'unique']},
-    4013: {'name': 'Ssyn Coiled Grasp', 'profession': ['Ritualist'], 'attributes': [], 'skills_used': ['Draw Spirit', 'Nightmare Weapon', 'Destruction', "Ancestors' Rage", 'Grasping Was Kuurong'], 'armor_levels': {}, 'items_dropped': ['Monstrous Fang', 'Naga Skin', 'Naga Trappings', "Ssyn's Staff", 'unique']},
-    4018: {'name': 'Scuttle Fish', 'profession': ['Monk'], 'attributes': [{'level': '14', 'name': 'Smiting Prayers'}], 'skills_used': ["Dwayna's Sorrow", "Balthazar's Aura", 'Healing Touch', 'Healing Light'], 'armor_levels': {'Blunt damage': '66', 'Piercing damage': '66', 'Slashing damage': '66', 'Cold damage': '66', 'Earth damage': '66', 'Fire damage': '66', 'Lightning damage': '66'}, 'items_dropped': ['Black Pearl', 'Decaying Mass', 'Jellyfish Wand']},
-    4020: {'name': 'Creeping Carp', 'profession': ['Assassin'], 'attributes': [{'level': '15', 'name': 'Deadly Arts'}], 'skills_used': ['Dash', 'Siphon Speed', 'Wild Strike', 'Jagged Strike', 'Expunge Enchantments', 'Siphon Strength'], 'armor_levels': {'Blunt damage': '76', 'Piercing damage': '76', 'Slashing damage': '76', 'Cold damage': '76', 'Earth damage': '76', 'Fire damage': '76', 'Lightning damage': '76'}, 'items_dropped': ['Black Pearl', 'Decaying Mass', 'Jellyfish Wand']},
-    4021: {'name': 'Irukandji', 'profession': ['Ritualist'], 'attributes': [{'level': '15', 'name': 'Communing'}], 'skills_used': ['Pain', 'Binding Chains', 'Disenchantment', 'Soothing', 'Ritual Lord'], 'armor_levels': {'Blunt damage': '88', 'Piercing damage': '88', 'Slashing damage': '88', 'Cold damage': '88', 'Earth damage': '88', 'Fire damage': '88', 'Lightning damage': '88'}, 'items_dropped': ['Black Pearl', 'Decaying Mass', 'Jellyfish Wand']},
-    4023: {'name': 'Yeti', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4024: {'name': 'Yeti', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4025: {'name': 'Rot Wallow', 'profession': ['Necromancer'], 'attributes': [{'level': '14', 'name': 'Blood Magic'}, {'level': '11', 'name': 'Curses'}, {'level': '16', 'name': 'Soul Reaping'}], 'skills_used': ['Weaken Knees', 'Vampiric Gaze', 'Stun on Critical Hit', 'Vampiric Bite', 'Fetid Ground'], 'armor_levels': {'Blunt damage': '96 (103)', 'Piercing damage': '96 (103)', 'Slashing damage': '96 (103)', 'Cold damage': '96 (103)', 'Earth damage': '96 (103)', 'Fire damage': '96 (103)', 'Lightning damage': '96 (103)'}, 'items_dropped': ['Rot Wallow Tusk']},
-    4027: {'name': 'Leviathan Claw', 'profession': ['Warrior'], 'attributes': [{'level': '15', 'name': 'Strength'}], 'skills_used': ["Leviathan's Sweep", 'Distracting Blow', 'Irresistible Blow', 'Primal Rage'], 'armor_levels': {'Blunt damage': '72', 'Piercing damage': '152', 'Slashing damage': '112', 'Cold damage': '92', 'Earth damage': '92', 'Fire damage': '92', 'Lightning damage': '92'}, 'items_dropped': ['Moon Shell', 'Pungent Mass']},
-    4028: {'name': 'Leviathan Mouth', 'profession': ['Ranger'], 'attributes': [{'level': '(18', 'name': 'Wilderness Survival'}], 'skills_used': ['Precision Shot', 'Troll Unguent', 'Quick Shot', 'Storm Chaser', "Hunter's Shot"], 'armor_levels': {'Blunt damage': '32', 'Piercing damage': '112', 'Slashing damage': '72', 'Cold damage': '72', 'Earth damage': '72', 'Fire damage': '72', 'Lightning damage': '72'}, 'items_dropped': ['Moon Shell', 'Pungent Mass']},
-    4029: {'name': 'Kraken Spawn', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Illusion Magic'}, {'level': '15', 'name': 'Inspiration Magic'}], 'skills_used': ['Ether Feast', 'Mantra of Persistence', 'Accumulated Pain', 'Clumsiness', 'Illusion of Pain', 'Expel Hexes'], 'armor_levels': {'Blunt damage': '72', 'Piercing damage': '72', 'Slashing damage': '72', 'Cold damage': '72', 'Earth damage': '72', 'Fire damage': '72', 'Lightning damage': '72'}, 'items_dropped': ['Bone', 'Kraken Eye', 'Monstrous Claw', 'Monstrous Eye', 'Monstrous Fang', 'Regurgitated Mass']},
-    4032: {'name': 'Saltspray Dragon', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Breath of Fire', 'Aura of Restoration', 'Lightning Touch', 'Ride the Lightning', 'Inferno'], 'armor_levels': {'Blunt damage': '72', 'Piercing damage': '72', 'Slashing damage': '72', 'Cold damage': '72', 'Earth damage': '72', 'Fire damage': '72', 'Lightning damage': '72'}, 'items_dropped': ['Azure Crest', 'Jadeite Shard', 'Monstrous Eye', 'Scale']},
-    4033: {'name': 'Albax', 'profession': [], 'attributes': [], 'skills_used': ['Aura of Restoration'], 'armor_levels': {}, 'items_dropped': []},
-    4034: {'name': 'Rockhide Dragon', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ["Teinai's Wind", 'Aura of Restoration', "Dragon's Stomp", 'Gale', 'Aftershock', 'Second Wind'], 'armor_levels': {'Blunt damage': '72', 'Piercing damage': '72', 'Slashing damage': '72', 'Cold damage': '72', 'Earth damage': '72', 'Fire damage': '72', 'Lightning damage': '72'}, 'items_dropped': ['Azure Crest', 'Bone', 'Jadeite Shard', 'Scale']},
-    4035: {'name': 'Outcast Assassin', 'profession': ['Assassin'], 'attributes': [], 'skills_used': ['Critical Eye', 'Wild Strike', 'Critical Defenses', 'Exhausting Assault', 'Leaping Mantis Sting', 'Dark Apostasy'], 'armor_levels': {'Blunt damage': '76', 'Piercing damage': '76', 'Slashing damage': '76', 'Cold damage': '76', 'Earth damage': '76', 'Fire damage': '76', 'Lightning damage': '76'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Bone Charm', 'Jadeite Shard', 'Outcast Staff', 'Outcast Wrappings']},
-    4036: {'name': 'Outcast Deathhand', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Blood Magic'}], 'skills_used': ['Unholy Feast', 'Animate Flesh Golem', "Cultist's Fervor", 'Chilblains', 'Soul Feast', 'Plague Touch', 'Putrid Explosion', 'Well of Blood', 'Death Nova'], 'armor_levels': {'Blunt damage': '63', 'Piercing damage': '63', 'Slashing damage': '63', 'Cold damage': '63', 'Earth damage': '63', 'Fire damage': '63', 'Lightning damage': '63'}, 'items_dropped': ['Bolt of Cloth', 'Bone Charm', 'Jadeite Shard', 'Outcast Staff', 'Outcast Wrappings']},
-    4037: {'name': 'Outcast Warrior', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ["Executioner's Strike", 'Axe Rake', 'Disrupting Chop', '"Charge!"', 'Dismember'], 'armor_levels': {'Blunt damage': '121', 'Piercing damage': '121', 'Slashing damage': '121', 'Cold damage': '101', 'Earth damage': '101', 'Fire damage': '101', 'Lightning damage': '101'}, 'items_dropped': ['Bolt of Cloth', 'Bone Charm', 'Jadeite Shard', 'Outcast Bracers', 'Outcast Shield', 'Outcast Staff']},
-    4039: {'name': 'Outcast Ritualist', 'profession': ['Ritualist'], 'attributes': [{'level': '0', 'name': 'Channeling Magic'}, {'level': '15', 'name': 'Communing'}, {'level': '15', 'name': 'Restoration Magic'}, {'level': '20 Restoration Magic in', 'name': 'hard mode'}], 'skills_used': ['Wailing Weapon', 'Displacement', 'Binding Chains', 'Nightmare Weapon', 'Vengeful Was Khanhei'], 'armor_levels': {'Blunt damage': '69', 'Piercing damage': '69', 'Slashing damage': '69', 'Cold damage': '69', 'Earth damage': '69', 'Fire damage': '69', 'Lightning damage': '69'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Bone Charm', 'Jadeite Shard', 'Outcast Staff', 'Outcast Wrappings']},
-    4042: {'name': 'Naga Warrior', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Signet of Strength', 'Seeking Blade', 'Jaizhenju Strike', 'Distracting Blow', 'Dragon Slash'], 'armor_levels': {'Blunt damage': '124 to 125', 'Piercing damage': '124 to 125', 'Slashing damage': '124 to 125', 'Cold damage': '104 to 105', 'Earth damage': '104 to 105', 'Fire damage': '104 to 105', 'Lightning damage': '104 to 105'}, 'items_dropped': ['Bolt of Cloth', 'Monstrous Claw', 'Monstrous Fang', 'Naga Skin', 'Naga Vambrace', 'Scale']},
-    4043: {'name': 'Naga Archer', 'profession': ['Ranger'], 'attributes': [{'level': '14-16', 'name': 'Expertise'}, {'level': '20', 'name': 'Marksmanship'}], 'skills_used': ['Troll Unguent', 'Seeking Arrows', 'Escape', 'Concussion Shot', 'Sundering Attack'], 'armor_levels': {'Blunt damage': '82', 'Piercing damage': '82', 'Slashing damage': '82', 'Cold damage': '112', 'Earth damage': '112', 'Fire damage': '112', 'Lightning damage': '112'}, 'items_dropped': ['Bolt of Cloth', 'Monstrous Claw', 'Monstrous Fang', 'Naga Skin', 'Naga Spaulder', 'Scale']},
-    4044: {'name': 'Naga Ritualist', 'profession': ['Ritualist'], 'attributes': [{'level': '15', 'name': 'Channeling Magic'}], 'skills_used': ['Draw Spirit', 'Nightmare Weapon', 'Destruction', "Ancestors' Rage", 'Grasping Was Kuurong'], 'armor_levels': {'Blunt damage': '72', 'Piercing damage': '72', 'Slashing damage': '72', 'Cold damage': '72', 'Earth damage': '72', 'Fire damage': '72', 'Lightning damage': '72'}, 'items_dropped': ['Bolt of Cloth', 'Monstrous Fang', 'Monstrous Claw', 'Naga Skin', 'Naga Trappings']},
-    4045: {'name': 'Island Guardian', 'profession': ['Monk'], 'attributes': [{'level': '16', 'name': 'Smiting Prayers'}], 'skills_used': ['Stun Immunity', 'Signet of Judgment', 'Divine Intervention', 'Healing Seed', 'Spear of Light', 'Resurrect (monster skill)', 'Healing Breeze'], 'armor_levels': {'Blunt damage': '124', 'Piercing damage': '124', 'Slashing damage': '84', 'Cold damage': '124', 'Earth damage': '124', 'Fire damage': '84', 'Lightning damage': '124'}, 'items_dropped': ['Bramble Longbow', 'Archaic Axe', 'Guardian Moss', 'Plant Fiber', 'Ruby', 'Spiritwood Plank', 'Wood Plank']},
-    4056: {'name': 'Senkai, Lord of the 1,000 Daggers Guild', 'profession': ['Assassin'], 'attributes': [], 'skills_used': ['Horns of the Ox', 'Fox Fangs', 'Iron Palm', 'Way of the Empty Palm', 'Repeating Strike', 'Enduring Toxin', 'Black Lotus Strike'], 'armor_levels': {}, 'items_dropped': []},
-    4080: {'name': "Ritualist's Construct", 'profession': ['Ritualist'], 'attributes': [{'level': '15', 'name': 'Restoration Magic'}], 'skills_used': ['Spirit Transfer', 'Nightmare Weapon', 'Life', 'Soul Twisting', 'Song of the Mists', 'Recuperation'], 'armor_levels': {}, 'items_dropped': ['Kaolin Wand', 'unique', 'Soul Stone']},
-    4097: {'name': "Ritualist's Construct", 'profession': ['Ritualist'], 'attributes': [{'level': '15', 'name': 'Restoration Magic'}], 'skills_used': ['Spirit Transfer', 'Nightmare Weapon', 'Life', 'Soul Twisting', 'Song of the Mists', 'Recuperation'], 'armor_levels': {}, 'items_dropped': ['Kaolin Wand', 'unique', 'Soul Stone']},
-    4081: {'name': "Assassin's Construct", 'profession': ['Assassin'], 'attributes': [], 'skills_used': ['Shadow Refuge', 'Sharpen Daggers', 'Temple Strike', 'Dancing Daggers', 'Song of the Mists'], 'armor_levels': {}, 'items_dropped': ['Kaolin Daggers', 'unique', 'Oni Blade', 'Soul Stone']},
-    4090: {'name': "Assassin's Construct", 'profession': ['Assassin'], 'attributes': [], 'skills_used': ['Shadow Refuge', 'Sharpen Daggers', 'Temple Strike', 'Dancing Daggers', 'Song of the Mists'], 'armor_levels': {}, 'items_dropped': ['Kaolin Daggers', 'unique', 'Oni Blade', 'Soul Stone']},
-    4093: {'name': "Elemental's Construct", 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Aura of Restoration', 'Blurred Vision', 'Lightning Touch', 'Mirror of Ice', 'Arc Lightning', 'Song of the Mists'], 'armor_levels': {}, 'items_dropped': ['Kaolin Water Staff', 'unique', 'Soul Stone']},
-    4096: {'name': "Ranger's Construct", 'profession': ['Ranger'], 'attributes': [{'level': '15', 'name': 'Wilderness Survival'}], 'skills_used': ['Throw Dirt', 'Equinox', 'Troll Unguent', 'Kindle Arrows', 'Song of the Mists', 'Distracting Shot'], 'armor_levels': {}, 'items_dropped': ['Kaolin Longbow', 'unique', 'Soul Stone']},
-    4120: {'name': 'Shiro Tagachi', 'profession': ['Assassin'], 'attributes': [], 'skills_used': ['Impossible Odds', 'Natural Resistance', 'Meditation of the Reaper', 'Riposting Shadows', 'Invulnerability', 'Battle Scars', 'Echoing Banishment'], 'armor_levels': {'Blunt damage': '103 (103)', 'Piercing damage': '103 (103)', 'Slashing damage': '103 (103)', 'Cold damage': '103 (103)', 'Earth damage': '103 (103)', 'Fire damage': '103 (103)', 'Lightning damage': '103 (103)'}, 'items_dropped': []},
-    4952: {'name': 'Shiro Tagachi', 'profession': ['Assassin'], 'attributes': [], 'skills_used': ['Impossible Odds', 'Natural Resistance', 'Meditation of the Reaper', 'Riposting Shadows', 'Invulnerability', 'Battle Scars', 'Echoing Banishment'], 'armor_levels': {'Blunt damage': '103 (103)', 'Piercing damage': '103 (103)', 'Slashing damage': '103 (103)', 'Cold damage': '103 (103)', 'Earth damage': '103 (103)', 'Fire damage': '103 (103)', 'Lightning damage': '103 (103)'}, 'items_dropped': []},
-    4125: {'name': "Shiro'ken Assassin", 'profession': ['Assassin'], 'attributes': [{'level': '0...3', 'name': 'Deadly Arts'}], 'skills_used': ['Shadow Refuge', 'Shroud of Silence', 'Wild Strike', 'Malicious Strike', 'Disrupting Stab', 'Jagged Strike', 'Twisting Fangs', 'Shattering Assault', 'Song of the Mists'], 'armor_levels': {'Blunt damage': '94', 'Piercing damage': '94', 'Slashing damage': '94', 'Cold damage': '94', 'Earth damage': '94', 'Fire damage': '94', 'Lightning damage': '94'}, 'items_dropped': ['Forbidden Staff', 'Oni Blade', 'Oni Daggers', 'Soul Stone']},
-    4127: {'name': "Shiro'ken Necromancer", 'profession': ['Necromancer'], 'attributes': [{'level': 'Level 28 (30): 15', 'name': 'Curses'}, {'level': '13..17', 'name': 'Soul Reaping'}, {'level': '18..20 Soul Reaping in', 'name': 'Hard Mode'}], 'skills_used': ['Wail of Doom', 'Taste of Pain', 'Faintheartedness', 'Well of Weariness', 'Rotting Flesh', 'Song of the Mists'], 'armor_levels': {'Blunt damage': '84', 'Piercing damage': '84', 'Slashing damage': '84', 'Cold damage': '84', 'Earth damage': '84', 'Fire damage': '84', 'Lightning damage': '84'}, 'items_dropped': ['Forbidden Staff', 'Soul Stone']},
-    4130: {'name': "Shiro'ken Warrior", 'profession': ['Warrior'], 'attributes': [{'level': '14..16', 'name': 'Tactics'}], 'skills_used': ['Auspicious Parry', 'Sun and Moon Slash', 'Healing Signet', 'Sever Artery', 'Gash', 'Song of the Mists'], 'armor_levels': {'Blunt damage': '124', 'Piercing damage': '124', 'Slashing damage': '124', 'Cold damage': '104', 'Earth damage': '104', 'Fire damage': '104', 'Lightning damage': '104'}, 'items_dropped': ['Forbidden Staff', 'Soul Stone']},
-    4131: {'name': "Shiro'ken Ranger", 'profession': ['Ranger'], 'attributes': [{'level': '16-17', 'name': 'Marksmanship'}, {'level': '16', 'name': 'Wilderness Survival'}, {'level': '20 Wilderness Survival in', 'name': 'Hard mode'}], 'skills_used': ['Troll Unguent', 'Savage Shot', 'Determined Shot', 'Debilitating Shot', 'Song of the Mists', 'Famine'], 'armor_levels': {'Blunt damage': '94', 'Piercing damage': '94', 'Slashing damage': '94', 'Cold damage': '124', 'Earth damage': '124', 'Fire damage': '124', 'Lightning damage': '124'}, 'items_dropped': ['Forbidden Staff', 'Soul Stone']},
-    4133: {'name': 'Spirit of Portals', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4174: {'name': 'Xuekao, the Deceptive', 'profession': ['Assassin'], 'attributes': [{'level': '(20', 'name': 'Deadly Arts'}], 'skills_used': ['Shadow Refuge', 'Golden Phoenix Strike', "Assassin's Promise", 'Unsuspecting Strike', 'Repeating Strike'], 'armor_levels': {}, 'items_dropped': ['Am Fah Cape', 'Bolt of Cloth', 'Bolt of Linen', 'Daggers of Xuekao', 'unique', 'Plague Idol', 'Sapphire']},
-    4176: {'name': 'Mina Shatter Storm', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Shatter Storm', 'Conjure Nightmare', 'Power Drain', 'Soothing Images'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', "Mina's Gaze", 'unique', 'Plague Idol']},
-    4179: {'name': 'Am Fah Leader', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Gift of Health', "Dwayna's Sorrow", "Heaven's Delight", 'Purge Conditions', 'Martyr'], 'armor_levels': {}, 'items_dropped': ['Orrian Tome', 'Plague Idol', "Rien's Sacrifice", 'unique']},
-    4181: {'name': 'Meynsang the Sadistic', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Focused Shot', 'Needling Shot', 'Apply Poison', "Hunter's Shot", 'Spike Trap'], 'armor_levels': {}, 'items_dropped': ['Am Fah Vambrace', "Meynsang's Longbow", 'unique', 'Plague Idol', 'Sapphire']},
-    4184: {'name': 'Jin, the Purifier', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Domination Magic'}], 'skills_used': ['Ether Feast', 'Unnatural Signet', 'Signet of Disruption', 'Empathy', 'Power Return', 'Expel Hexes'], 'armor_levels': {}, 'items_dropped': ['Jadeite Shard', 'The Purifier', 'unique']},
-    4186: {'name': "Lian, Dragon's Petal", 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Earth Magic'}], 'skills_used': ['Ward Against Foes', 'Aura of Restoration', "Dragon's Stomp", 'Conjure Flame', 'Double Dragon'], 'armor_levels': {}, 'items_dropped': ['Jade Bracelet', 'Jade Brotherhood Garb', 'Jadeite Shard', "Lian's Lantern", 'unique']},
-    4187: {'name': 'Shen, the Magistrate', 'profession': ['Monk'], 'attributes': [{'level': '(20', 'name': 'Smiting Prayers'}], 'skills_used': ['Word of Censure', 'Retribution', 'Reverse Hex', 'Signet of Devotion', 'Signet of Rejuvenation'], 'armor_levels': {}, 'items_dropped': ['Jade Bracelet', "Shen's Censure", 'unique', 'Tattered Fan']},
-    4188: {'name': 'Wing, Three Blade', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', 'Furious Axe', 'Healing Signet', 'Cyclone Axe', 'Triple Chop'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Jadeite Shard', 'Jade Bracelet', 'Jade Brotherhood Armguard', "Wing's Axe", 'unique']},
-    4192: {'name': 'Am Fah Necromancer', 'profession': ['Necromancer', 'Monk'], 'attributes': [{'level': '15', 'name': 'Blood Magic'}, {'level': '14', 'name': 'Death Magic'}, {'level': 'and 9', 'name': 'Soul Reaping'}], 'skills_used': ['Soul Barbs', 'Draw Conditions', "Verata's Gaze", 'Vile Miasma', 'Soul Feast', 'Barbed Signet', "Verata's Sacrifice", 'Shielding Hands', 'Blood is Power', 'Plague Signet', 'Foul Feast', 'Death Nova'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Am Fah Cape', 'Bolt of Cloth', 'Bolt of Linen', 'Plague Idol', 'Sapphire']},
-    4193: {'name': 'Am Fah Healer', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Purge Conditions', 'Infuse Health', 'Martyr', "Heaven's Delight"], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Am Fah Cape', 'Am Fah Vambrace', 'Bolt of Cloth', 'Bolt of Linen', 'Plague Idol', 'Sapphire']},
-    4194: {'name': 'Am Fah Marksman', 'profession': ['Ranger'], 'attributes': [{'level': '(17', 'name': 'Beast Mastery'}, {'level': '20', 'name': 'Wilderness Survival'}], 'skills_used': ['Focused Shot', 'Apply Poison', "Viper's Nest", 'Spike Trap'], 'armor_levels': {'Blunt damage': '70', 'Piercing damage': '70', 'Slashing damage': '70', 'Cold damage': '100', 'Earth damage': '100', 'Fire damage': '100', 'Lightning damage': '100'}, 'items_dropped': ['Am Fah Vambrace', 'Bolt of Cloth', 'Bolt of Linen', 'Plague Idol', 'Sapphire']},
-    4195: {'name': 'Jade Brotherhood Mesmer', 'profession': ['Mesmer', 'Necromancer'], 'attributes': [{'level': '15', 'name': 'Domination Magic'}, {'level': '14-16', 'name': 'Fast Casting'}], 'skills_used': ['Ether Feast', 'Dark Pact', 'Vampiric Gaze', 'Unnatural Signet', 'Signet of Disruption', 'Ravenous Gaze', 'Shadow Strike', 'Empathy', 'Energy Tap', 'Power Return', 'Expel Hexes', 'Vampiric Swarm', 'Drain Enchantment'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Jade Bracelet', 'Jade Brotherhood Garb', 'Jadeite Shard']},
-    4196: {'name': 'Jade Brotherhood Mage', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Earth Magic'}], 'skills_used': ['Ward Against Foes', 'Aura of Restoration', "Dragon's Stomp", 'Conjure Flame', 'Double Dragon'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Jade Bracelet', 'Jade Brotherhood Garb', 'Jadeite Shard']},
-    4197: {'name': 'Jade Brotherhood Knight', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', 'Triple Chop', 'Cyclone Axe', 'Furious Axe'], 'armor_levels': {'Blunt damage': '115', 'Piercing damage': '115', 'Slashing damage': '115', 'Cold damage': '95', 'Earth damage': '95', 'Fire damage': '95', 'Lightning damage': '95'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Jade Bracelet', 'Jade Brotherhood Armguard', 'Jadeite Shard']},
-    4198: {'name': 'Jade Brotherhood Ritualist', 'profession': ['Ritualist', 'Paragon'], 'attributes': [{'level': '15', 'name': 'Channeling Magic'}], 'skills_used': ['Weapon of Shadow', '"Stand Your Ground!"', 'Tranquil Was Tanasen', 'Mend Body and Soul', 'Soothing Memories', 'Weapon of Warding', 'Channeled Strike', 'Preservation', 'Vocal Was Sogolon', "Ancestors' Rage", '"Never Surrender!"'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Jade Bracelet', 'Jade Brotherhood Garb', 'Jadeite Shard', 'Tattered Fan', 'unique', 'Wajjun Bazaar']},
-    4214: {'name': 'Spirit of Pain', 'profession': ['Ritualist'], 'attributes': [], 'skills_used': ['Pain (attack)'], 'armor_levels': {}, 'items_dropped': []},
-    4215: {'name': 'Spirit of Destruction', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4217: {'name': 'Spirit of Union', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4224: {'name': 'Spirit of Union', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4218: {'name': 'Spirit of Life', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4227: {'name': 'Spirit of Blood Song', 'profession': [], 'attributes': [], 'skills_used': ['Bloodsong (attack)'], 'armor_levels': {}, 'items_dropped': []},
-    4228: {'name': 'Spirit of Wanderlust', 'profession': [], 'attributes': [], 'skills_used': ['Wanderlust (attack)'], 'armor_levels': {}, 'items_dropped': []},
-    4232: {'name': 'Spirit of Laceration', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4236: {'name': 'Spirit of Equinox', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4238: {'name': 'Spirit of Famine', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4239: {'name': 'Spirit of Brambles', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4242: {'name': 'Flamingo', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4268: {'name': 'Crocodile', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4330: {'name': 'Tarom Rockbreaker', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Wild Blow', 'Burst of Aggression'], 'armor_levels': {}, 'items_dropped': ['Lustrous Stone', 'Mandragor Carapace', 'The Rockbreaker', 'unique']},
-    4332: {'name': 'Haioss, Blessed Wind', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ['Victorious Sweep', "Lyssa's Assault", 'Whirling Charge'], 'armor_levels': {}, 'items_dropped': ["Haioss' Blessing", 'unique', 'Water Djinn Essence']},
-    4333: {'name': 'Chineh Soaring Light', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Orison of Healing', 'Healing Breeze'], 'armor_levels': {}, 'items_dropped': ['Fledgling Skree Wing', 'Skree Mask', 'The Lifegiver', 'unique']},
-    4335: {'name': 'Apocrypha', 'profession': ['Mesmer', 'Dervish', 'Paragon'], 'attributes': [{'level': '20', 'name': 'Illusion Magic'}], 'skills_used': ['Dust Cloak', 'Anthem of Guidance', 'Ether Feast', 'Mighty Throw', 'Mending Refrain', 'Aura of Thorns', 'Ballad of Restoration', 'Clumsiness', 'Mystic Vigor', 'Conjure Phantasm', "Eremite's Attack", 'Crippling Anguish', 'Rending Sweep', 'Signet of Humility', 'Reform Carvings'], 'armor_levels': {'Blunt damage': '80', 'Piercing damage': '80', 'Slashing damage': '80', 'Cold damage': '40', 'Earth damage': '40', 'Fire damage': '40', 'Lightning damage': '40'}, 'items_dropped': []},
-    4336: {'name': 'Hassin Softskin', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['Vicious Attack', 'Anthem of Envy'], 'armor_levels': {}, 'items_dropped': ["Hassin's Shell", 'unique', 'Juvenile Termite Leg']},
-    4338: {'name': 'Suneh Stormbringer', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Lightning Bolt', 'Lightning Strike'], 'armor_levels': {}, 'items_dropped': ['Fetid Mass', 'Sentient Root', 'The Stormbringer', 'unique']},
-    4346: {'name': 'Stalking Nephila', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Called Shot', 'Quick Shot', 'Apply Poison', 'Natural Stride'], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '100', 'Slashing damage': '100', 'Cold damage': '100', 'Earth damage': '100', 'Fire damage': '100', 'Lightning damage': '100'}, 'items_dropped': ['Silken Spider Web', 'Spider Web']},
-    4349: {'name': 'Water Djinn', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ['Mystic Sweep', 'Zealous Vow', "Lyssa's Assault", 'Whirling Charge', 'Heart of Holy Flame', 'Mystic Vigor', "Eremite's Attack"], 'armor_levels': {'Blunt damage': '73', 'Piercing damage': '73', 'Slashing damage': '73', 'Cold damage': '93', 'Earth damage': '73', 'Fire damage': '53', 'Lightning damage': '73'}, 'items_dropped': ['Ethereal Garment', 'Pile of Glittering Dust', 'Water Djinn Essence']},
-    4907: {'name': 'Water Djinn', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ['Mystic Sweep', 'Zealous Vow', "Lyssa's Assault", 'Whirling Charge', 'Heart of Holy Flame', 'Mystic Vigor', "Eremite's Attack"], 'armor_levels': {'Blunt damage': '73', 'Piercing damage': '73', 'Slashing damage': '73', 'Cold damage': '93', 'Earth damage': '73', 'Fire damage': '53', 'Lightning damage': '73'}, 'items_dropped': ['Ethereal Garment', 'Pile of Glittering Dust', 'Water Djinn Essence']},
-    4354: {'name': 'Rinkhal Monitor', 'profession': ['Monk'], 'attributes': [{'level': '10', 'name': 'Smiting Prayers'}], 'skills_used': ['Signet of Mystic Wrath', 'Signet of Removal', 'Reversal of Damage', "Zealot's Fire", 'Mending Touch'], 'armor_levels': {'Blunt damage': '80', 'Piercing damage': '80', 'Slashing damage': '80', 'Cold damage': '40', 'Earth damage': '40', 'Fire damage': '40', 'Lightning damage': '40'}, 'items_dropped': ['Rinkhal Talon']},
-    4356: {'name': 'Irontooth Drake', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ["Bull's Strike", 'Thrill of Victory', 'Burst of Aggression'], 'armor_levels': {'Blunt damage': '72', 'Piercing damage': '72', 'Slashing damage': '72', 'Cold damage': '32', 'Earth damage': '32', 'Fire damage': '32', 'Lightning damage': '32'}, 'items_dropped': ['Chunk of Drake Flesh', 'Half-Digested Armor']},
-    4360: {'name': 'Skree Hatchling', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Orison of Healing', "Healer's Boon"], 'armor_levels': {'Blunt damage': '26', 'Piercing damage': '26', 'Slashing damage': '26', 'Cold damage': '26', 'Earth damage': '26', 'Fire damage': '26', 'Lightning damage': '26'}, 'items_dropped': ['Bolt of Cloth', 'Fledgling Skree Wing', 'Skree Mask', 'Tanned Hide Square']},
-    4361: {'name': 'Skree Fledgeling', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ["Expert's Dexterity", 'Read the Wind', 'Keen Arrow'], 'armor_levels': {'Blunt damage': '34', 'Piercing damage': '34', 'Slashing damage': '34', 'Cold damage': '64', 'Earth damage': '64', 'Fire damage': '64', 'Lightning damage': '64'}, 'items_dropped': ['Bolt of Cloth', 'Fledgling Skree Wing', 'Skree Helmet', 'Skree Vambrace', 'Tanned Hide Square']},
-    4362: {'name': 'Skree Griffon', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Healing Touch', 'Orison of Healing', 'Renew Life', "Healer's Boon", 'Words of Comfort', 'Healing Breeze'], 'armor_levels': {'Blunt damage': '43', 'Piercing damage': '43', 'Slashing damage': '43', 'Cold damage': '43', 'Earth damage': '43', 'Fire damage': '43', 'Lightning damage': '43'}, 'items_dropped': ['Bolt of Cloth', 'Fledgling Skree Wing', 'Skree Mask']},
-    4363: {'name': 'Skree Talon', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"You\'re All Alone!"', 'Hamstring', "Soldier's Strike", '"Shields Up!"'], 'armor_levels': {'Blunt damage': '87', 'Piercing damage': '87', 'Slashing damage': '87', 'Cold damage': '67', 'Earth damage': '67', 'Fire damage': '67', 'Lightning damage': '67'}, 'items_dropped': ['Fledgling Skree Wing']},
-    4364: {'name': 'Skree Hunter', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ["Expert's Dexterity", 'Pin Down', 'Read the Wind', 'Keen Arrow'], 'armor_levels': {'Blunt damage': '43', 'Piercing damage': '43', 'Slashing damage': '43', 'Cold damage': '73', 'Earth damage': '73', 'Fire damage': '73', 'Lightning damage': '73'}, 'items_dropped': ['Feather', 'Fledgling Skree Wing', 'Skree Vambrace']},
-    4365: {'name': 'Skree Warbler', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['Zealous Anthem', '"Incoming!"', 'Song of Power', 'Unblockable Throw'], 'armor_levels': {'Blunt damage': '49', 'Piercing damage': '49', 'Slashing damage': '49', 'Cold damage': '54', 'Earth damage': '54', 'Fire damage': '54', 'Lightning damage': '54'}, 'items_dropped': ['Fledgling Skree Wing', 'Skree Vambrace']},
-    4366: {'name': 'Ridgeback Skale', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Dismember', 'Enraging Charge', 'Decapitate', 'Agonizing Chop'], 'armor_levels': {'Blunt damage': '40', 'Piercing damage': '40', 'Slashing damage': '40', 'Cold damage': '40', 'Earth damage': '40', 'Fire damage': '40', 'Lightning damage': '40'}, 'items_dropped': ['Half-Digested Boots', 'Skale Claw', 'Skale Fin', 'Skale Tooth']},
-    4369: {'name': 'Ridgeback Skale', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Dismember', 'Enraging Charge', 'Decapitate', 'Agonizing Chop'], 'armor_levels': {'Blunt damage': '40', 'Piercing damage': '40', 'Slashing damage': '40', 'Cold damage': '40', 'Earth damage': '40', 'Fire damage': '40', 'Lightning damage': '40'}, 'items_dropped': ['Half-Digested Boots', 'Skale Claw', 'Skale Fin', 'Skale Tooth']},
-    4377: {'name': 'Ridgeback Skale', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Dismember', 'Enraging Charge', 'Decapitate', 'Agonizing Chop'], 'armor_levels': {'Blunt damage': '40', 'Piercing damage': '40', 'Slashing damage': '40', 'Cold damage': '40', 'Earth damage': '40', 'Fire damage': '40', 'Lightning damage': '40'}, 'items_dropped': ['Half-Digested Boots', 'Skale Claw', 'Skale Fin', 'Skale Tooth']},
-    4378: {'name': 'Ridgeback Skale', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Dismember', 'Enraging Charge', 'Decapitate', 'Agonizing Chop'], 'armor_levels': {'Blunt damage': '40', 'Piercing damage': '40', 'Slashing damage': '40', 'Cold damage': '40', 'Earth damage': '40', 'Fire damage': '40', 'Lightning damage': '40'}, 'items_dropped': ['Half-Digested Boots', 'Skale Claw', 'Skale Fin', 'Skale Tooth']},
-    4367: {'name': 'Skale Lasher', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4370: {'name': 'Skale Lasher', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4368: {'name': 'Skale Blighter', 'profession': ['Necromancer'], 'attributes': [{'level': '6', 'name': 'Death Magic'}], 'skills_used': ['Well of Blood', 'Rotting Flesh', 'Vile Touch', "Grenth's Balance"], 'armor_levels': {'Blunt damage': '40', 'Piercing damage': '40', 'Slashing damage': '40', 'Cold damage': '40', 'Earth damage': '40', 'Fire damage': '40', 'Lightning damage': '40'}, 'items_dropped': ['Half-Digested Boots', 'Skale Claw', 'Skale Fin', 'Skale Tooth']},
-    4376: {'name': 'Skale Blighter', 'profession': ['Necromancer'], 'attributes': [{'level': '6', 'name': 'Death Magic'}], 'skills_used': ['Well of Blood', 'Rotting Flesh', 'Vile Touch', "Grenth's Balance"], 'armor_levels': {'Blunt damage': '40', 'Piercing damage': '40', 'Slashing damage': '40', 'Cold damage': '40', 'Earth damage': '40', 'Fire damage': '40', 'Lightning damage': '40'}, 'items_dropped': ['Half-Digested Boots', 'Skale Claw', 'Skale Fin', 'Skale Tooth']},
-    4371: {'name': 'Frigid Skale', 'profession': ['Elementalist'], 'attributes': [{'level': 'Level 14 (24): 12', 'name': 'Water Magic'}], 'skills_used': ['Icy Shackles', 'Ice Spikes', 'Freezing Gust', 'Ice Spear'], 'armor_levels': {'Blunt damage': '41', 'Piercing damage': '41', 'Slashing damage': '41', 'Cold damage': '41', 'Earth damage': '41', 'Fire damage': '41', 'Lightning damage': '41'}, 'items_dropped': ['Half-Digested Boots', 'Skale Claw', 'Skale Fin', 'Skale Tooth']},
-    4379: {'name': 'Frigid Skale', 'profession': ['Elementalist'], 'attributes': [{'level': 'Level 14 (24): 12', 'name': 'Water Magic'}], 'skills_used': ['Icy Shackles', 'Ice Spikes', 'Freezing Gust', 'Ice Spear'], 'armor_levels': {'Blunt damage': '41', 'Piercing damage': '41', 'Slashing damage': '41', 'Cold damage': '41', 'Earth damage': '41', 'Fire damage': '41', 'Lightning damage': '41'}, 'items_dropped': ['Half-Digested Boots', 'Skale Claw', 'Skale Fin', 'Skale Tooth']},
-    4380: {'name': 'Juvenile Bladed Termite', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Cleave'], 'armor_levels': {'Blunt damage': '29', 'Piercing damage': '29', 'Slashing damage': '29', 'Cold damage': '29', 'Earth damage': '29', 'Fire damage': '29', 'Lightning damage': '29'}, 'items_dropped': ['Insect Appendage', 'Juvenile Termite Leg']},
-    4381: {'name': 'Grub Lance', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Signet of Devotion', 'Orison of Healing', 'Light of Deliverance'], 'armor_levels': {'Blunt damage': '26', 'Piercing damage': '26', 'Slashing damage': '26', 'Cold damage': '26', 'Earth damage': '26', 'Fire damage': '26', 'Lightning damage': '26'}, 'items_dropped': ['Insect Appendage']},
-    4382: {'name': 'Bladed Termite', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Swift Chop', 'Power Attack', 'Frenzy', 'Cleave'], 'armor_levels': {'Blunt damage': '22', 'Piercing damage': '22', 'Slashing damage': '22', 'Cold damage': '22', 'Earth damage': '22', 'Fire damage': '22', 'Lightning damage': '22'}, 'items_dropped': ['Insect Appendage', 'Juvenile Termite Leg']},
-    4383: {'name': 'Preying Lance', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['Vicious Attack', "Harrier's Toss", 'Cruel Spear', 'Anthem of Envy'], 'armor_levels': {'Blunt damage': '46', 'Piercing damage': '46', 'Slashing damage': '46', 'Cold damage': '46', 'Earth damage': '46', 'Fire damage': '46', 'Lightning damage': '46'}, 'items_dropped': ['Insect Appendage']},
-    4387: {'name': 'Stormseed Jacaranda', 'profession': ['Elementalist'], 'attributes': [{'level': '11', 'name': 'Energy Storage'}], 'skills_used': ['Lightning Bolt', 'Lightning Strike', 'Conjure Lightning', 'Lightning Surge'], 'armor_levels': {'Blunt damage': '32', 'Piercing damage': '32', 'Slashing damage': '32', 'Cold damage': '32', 'Earth damage': '32', 'Fire damage': '32', 'Lightning damage': '32'}, 'items_dropped': ['Briar Blade', 'Fetid Mass', 'Sentient Root', 'Sentient Seed', 'Spiritwood Plank', 'Hopeless Romantic', 'Wood Plank']},
-    4389: {'name': 'Stormseed Jacaranda', 'profession': ['Elementalist'], 'attributes': [{'level': '11', 'name': 'Energy Storage'}], 'skills_used': ['Lightning Bolt', 'Lightning Strike', 'Conjure Lightning', 'Lightning Surge'], 'armor_levels': {'Blunt damage': '32', 'Piercing damage': '32', 'Slashing damage': '32', 'Cold damage': '32', 'Earth damage': '32', 'Fire damage': '32', 'Lightning damage': '32'}, 'items_dropped': ['Briar Blade', 'Fetid Mass', 'Sentient Root', 'Sentient Seed', 'Spiritwood Plank', 'Hopeless Romantic', 'Wood Plank']},
-    4391: {'name': 'Stormseed Jacaranda', 'profession': ['Elementalist'], 'attributes': [{'level': '11', 'name': 'Energy Storage'}], 'skills_used': ['Lightning Bolt', 'Lightning Strike', 'Conjure Lightning', 'Lightning Surge'], 'armor_levels': {'Blunt damage': '32', 'Piercing damage': '32', 'Slashing damage': '32', 'Cold damage': '32', 'Earth damage': '32', 'Fire damage': '32', 'Lightning damage': '32'}, 'items_dropped': ['Briar Blade', 'Fetid Mass', 'Sentient Root', 'Sentient Seed', 'Spiritwood Plank', 'Hopeless Romantic', 'Wood Plank']},
-    4388: {'name': 'Fanged Iboga', 'profession': ['Mesmer'], 'attributes': [{'level': '7', 'name': 'Illusion Magic'}], 'skills_used': ['Imagined Burden', 'Crippling Anguish', 'Soothing Images', 'Conjure Phantasm'], 'armor_levels': {'Blunt damage': '32', 'Piercing damage': '32', 'Slashing damage': '32', 'Cold damage': '32', 'Earth damage': '32', 'Fire damage': '32', 'Lightning damage': '32'}, 'items_dropped': ['Bramble Flatbow', 'Bramble Longbow', 'Bramble Recurve Bow', 'Briar Blade', 'Iboga Petal', 'Sentient Root', 'Sentient Seed', 'Spiritwood Plank', 'Wood Plank']},
-    4392: {'name': 'Fanged Iboga', 'profession': ['Mesmer'], 'attributes': [{'level': '7', 'name': 'Illusion Magic'}], 'skills_used': ['Imagined Burden', 'Crippling Anguish', 'Soothing Images', 'Conjure Phantasm'], 'armor_levels': {'Blunt damage': '32', 'Piercing damage': '32', 'Slashing damage': '32', 'Cold damage': '32', 'Earth damage': '32', 'Fire damage': '32', 'Lightning damage': '32'}, 'items_dropped': ['Bramble Flatbow', 'Bramble Longbow', 'Bramble Recurve Bow', 'Briar Blade', 'Iboga Petal', 'Sentient Root', 'Sentient Seed', 'Spiritwood Plank', 'Wood Plank']},
-    4395: {'name': 'Mandragor Imp', 'profession': ['Necromancer'], 'attributes': [{'level': '11', 'name': 'Blood Magic'}], 'skills_used': ['Chilblains', 'Plague Touch', 'Ravenous Gaze', 'Blood of the Aggressor', 'Signet of Agony'], 'armor_levels': {'Blunt damage': '66', 'Piercing damage': '66', 'Slashing damage': '66', 'Cold damage': '66', 'Earth damage': '66', 'Fire damage': '66', 'Lightning damage': '66'}, 'items_dropped': ['Luminous Stone', 'Lustrous Stone', 'Mandragor Carapace', 'Mandragor Root', 'Mandragor Swamproot']},
-    4400: {'name': 'Mandragor Imp', 'profession': ['Necromancer'], 'attributes': [{'level': '11', 'name': 'Blood Magic'}], 'skills_used': ['Chilblains', 'Plague Touch', 'Ravenous Gaze', 'Blood of the Aggressor', 'Signet of Agony'], 'armor_levels': {'Blunt damage': '66', 'Piercing damage': '66', 'Slashing damage': '66', 'Cold damage': '66', 'Earth damage': '66', 'Fire damage': '66', 'Lightning damage': '66'}, 'items_dropped': ['Luminous Stone', 'Lustrous Stone', 'Mandragor Carapace', 'Mandragor Root', 'Mandragor Swamproot']},
-    4930: {'name': 'Mandragor Imp', 'profession': ['Necromancer'], 'attributes': [{'level': '11', 'name': 'Blood Magic'}], 'skills_used': ['Chilblains', 'Plague Touch', 'Ravenous Gaze', 'Blood of the Aggressor', 'Signet of Agony'], 'armor_levels': {'Blunt damage': '66', 'Piercing damage': '66', 'Slashing damage': '66', 'Cold damage': '66', 'Earth damage': '66', 'Fire damage': '66', 'Lightning damage': '66'}, 'items_dropped': ['Luminous Stone', 'Lustrous Stone', 'Mandragor Carapace', 'Mandragor Root', 'Mandragor Swamproot']},
-    4396: {'name': 'Mandragor Slither', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Wild Blow', 'Burst of Aggression', 'Headbutt', 'Distracting Blow'], 'armor_levels': {'Blunt damage': '86', 'Piercing damage': '86', 'Slashing damage': '86', 'Cold damage': '66', 'Earth damage': '66', 'Fire damage': '66', 'Lightning damage': '66'}, 'items_dropped': ['Luminous Stone', 'Lustrous Stone', 'Mandragor Carapace', 'Mandragor Root', 'Mandragor Swamproot']},
-    4402: {'name': 'Mandragor Slither', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Wild Blow', 'Burst of Aggression', 'Headbutt', 'Distracting Blow'], 'armor_levels': {'Blunt damage': '86', 'Piercing damage': '86', 'Slashing damage': '86', 'Cold damage': '66', 'Earth damage': '66', 'Fire damage': '66', 'Lightning damage': '66'}, 'items_dropped': ['Luminous Stone', 'Lustrous Stone', 'Mandragor Carapace', 'Mandragor Root', 'Mandragor Swamproot']},
-    4932: {'name': 'Mandragor Slither', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Wild Blow', 'Burst of Aggression', 'Headbutt', 'Distracting Blow'], 'armor_levels': {'Blunt damage': '86', 'Piercing damage': '86', 'Slashing damage': '86', 'Cold damage': '66', 'Earth damage': '66', 'Fire damage': '66', 'Lightning damage': '66'}, 'items_dropped': ['Luminous Stone', 'Lustrous Stone', 'Mandragor Carapace', 'Mandragor Root', 'Mandragor Swamproot']},
-    4401: {'name': 'Stoneflesh Mandragor', 'profession': ['Elementalist'], 'attributes': [{'level': 'Istan at level 13: 12', 'name': 'Earth Magic'}], 'skills_used': ['Stoning', 'Stone Sheath', 'Stoneflesh Aura', 'Ebon Hawk'], 'armor_levels': {'Blunt damage': '66', 'Piercing damage': '66', 'Slashing damage': '66', 'Cold damage': '66', 'Earth damage': '66', 'Fire damage': '66', 'Lightning damage': '66'}, 'items_dropped': ['Lustrous Stone', 'Mandragor Swamproot']},
-    4931: {'name': 'Stoneflesh Mandragor', 'profession': ['Elementalist'], 'attributes': [{'level': 'Istan at level 13: 12', 'name': 'Earth Magic'}], 'skills_used': ['Stoning', 'Stone Sheath', 'Stoneflesh Aura', 'Ebon Hawk'], 'armor_levels': {'Blunt damage': '66', 'Piercing damage': '66', 'Slashing damage': '66', 'Cold damage': '66', 'Earth damage': '66', 'Fire damage': '66', 'Lightning damage': '66'}, 'items_dropped': ['Lustrous Stone', 'Mandragor Swamproot']},
-    4404: {'name': 'Grasp of Chaos', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Dismember', 'Fingers of Chaos', '"Fear Me!"'], 'armor_levels': {}, 'items_dropped': []},
-    4406: {'name': 'Dehjah', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ['Mystic Sweep', 'Heart of Holy Flame', 'Whirling Charge'], 'armor_levels': {}, 'items_dropped': []},
-    4414: {'name': 'Boklon Blackwater', 'profession': ['Necromancer'], 'attributes': [{'level': '(20', 'name': 'Death Magic'}], 'skills_used': ['Well of Blood', 'Rotting Flesh', 'Vile Touch'], 'armor_levels': {}, 'items_dropped': ['Skale Claw']},
-    4420: {'name': 'Glug Klugg', 'profession': ['Necromancer'], 'attributes': [{'level': '(20', 'name': 'Death Magic'}], 'skills_used': ['Well of Blood', 'Rotting Flesh', 'Vile Touch'], 'armor_levels': {}, 'items_dropped': ['Half-Digested Boots']},
-    4437: {'name': 'Zhed Shadowhoof', 'profession': ['Elementalist'], 'attributes': [{'level': '11', 'name': 'Water Magic'}, {'level': '9', 'name': 'Earth Magic'}, {'level': '7', 'name': 'Energy Storage'}], 'skills_used': ['Ward Against Foes', 'Ward Against Melee', 'Aura of Restoration', 'Resurrection Signet', 'Blurred Vision', 'Freezing Gust'], 'armor_levels': {}, 'items_dropped': []},
-    4940: {'name': 'Zhed Shadowhoof', 'profession': ['Elementalist'], 'attributes': [{'level': '11', 'name': 'Water Magic'}, {'level': '9', 'name': 'Earth Magic'}, {'level': '7', 'name': 'Energy Storage'}], 'skills_used': ['Ward Against Foes', 'Ward Against Melee', 'Aura of Restoration', 'Resurrection Signet', 'Blurred Vision', 'Freezing Gust'], 'armor_levels': {}, 'items_dropped': []},
-    4440: {'name': 'Zhed Shadowhoof', 'profession': ['Elementalist'], 'attributes': [{'level': '11', 'name': 'Water Magic'}, {'level': '9', 'name': 'Earth Magic'}, {'level': '7', 'name': 'Energy Storage'}], 'skills_used': ['Ward Against Foes', 'Ward Against Melee', 'Aura of Restoration', 'Resurrection Signet', 'Blurred Vision', 'Freezing Gust'], 'armor_levels': {}, 'items_dropped': []},
-    4456: {'name': 'Tahlkora', 'profession': ['Monk'], 'attributes': [{'level': '11', 'name': 'Protection Prayers'}, {'level': '9', 'name': 'Divine Favor'}], 'skills_used': ['Mend Ailment', 'Resurrect', 'Reversal of Fortune', 'Remove Hex', 'Shield of Absorption', 'Protective Spirit'], 'armor_levels': {}, 'items_dropped': []},
-    4459: {'name': 'Tahlkora', 'profession': ['Monk'], 'attributes': [{'level': '11', 'name': 'Protection Prayers'}, {'level': '9', 'name': 'Divine Favor'}], 'skills_used': ['Mend Ailment', 'Resurrect', 'Reversal of Fortune', 'Remove Hex', 'Shield of Absorption', 'Protective Spirit'], 'armor_levels': {}, 'items_dropped': []},
-    4464: {'name': 'Master of Whispers', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Envenom Enchantments', 'Vampiric Gaze', 'Faintheartedness', 'Resurrection Signet', 'Life Siphon', 'Enfeebling Blood'], 'armor_levels': {}, 'items_dropped': []},
-    4469: {'name': 'Acolyte Jin', 'profession': ['Ranger'], 'attributes': [{'level': '4', 'name': 'Expertise'}, {'level': '6', 'name': 'Wilderness Survival'}, {'level': '8', 'name': 'Marksmanship'}], 'skills_used': ['Power Shot', 'Troll Unguent', 'Resurrection Signet', 'Lightning Reflexes', 'Kindle Arrows', 'Distracting Shot'], 'armor_levels': {}, 'items_dropped': []},
-    4487: {'name': 'Acolyte Sousuke', 'profession': ['Elementalist'], 'attributes': [{'level': '4', 'name': 'Earth Magic'}, {'level': '8', 'name': 'Fire Magic'}, {'level': '6', 'name': 'Energy Storage'}], 'skills_used': ['Liquid Flame', 'Glyph of Lesser Energy', 'Flare', 'Ward Against Melee', 'Aura of Restoration', 'Resurrection Signet', 'Inferno'], 'armor_levels': {}, 'items_dropped': []},
-    4490: {'name': 'Acolyte Sousuke', 'profession': ['Elementalist'], 'attributes': [{'level': '4', 'name': 'Earth Magic'}, {'level': '8', 'name': 'Fire Magic'}, {'level': '6', 'name': 'Energy Storage'}], 'skills_used': ['Liquid Flame', 'Glyph of Lesser Energy', 'Flare', 'Ward Against Melee', 'Aura of Restoration', 'Resurrection Signet', 'Inferno'], 'armor_levels': {}, 'items_dropped': []},
-    4493: {'name': 'Melonni', 'profession': ['Dervish'], 'attributes': [{'level': '6', 'name': 'Earth Prayers'}, {'level': '2', 'name': 'Mysticism'}, {'level': '4', 'name': 'Scythe Mastery'}], 'skills_used': ['Mystic Sweep', 'Chilling Victory', 'Vital Boon', 'Imbue Health', 'Resurrection Signet', 'Mystic Regeneration', 'Heart of Holy Flame', 'Armor of Sanctity', 'Avatar of Dwayna', 'Veil of Thorns'], 'armor_levels': {}, 'items_dropped': []},
-    4496: {'name': 'Melonni', 'profession': ['Dervish'], 'attributes': [{'level': '6', 'name': 'Earth Prayers'}, {'level': '2', 'name': 'Mysticism'}, {'level': '4', 'name': 'Scythe Mastery'}], 'skills_used': ['Mystic Sweep', 'Chilling Victory', 'Vital Boon', 'Imbue Health', 'Resurrection Signet', 'Mystic Regeneration', 'Heart of Holy Flame', 'Armor of Sanctity', 'Avatar of Dwayna', 'Veil of Thorns'], 'armor_levels': {}, 'items_dropped': []},
-    4531: {'name': 'Khim', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Auspicious Blow', 'Healing Signet', 'Berserker Stance', 'Staggering Blow', 'Renewing Smash', '"Coward!"'], 'armor_levels': {}, 'items_dropped': []},
-    4549: {'name': 'Khim', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Auspicious Blow', 'Healing Signet', 'Berserker Stance', 'Staggering Blow', 'Renewing Smash', '"Coward!"'], 'armor_levels': {}, 'items_dropped': []},
-    4578: {'name': 'Khim', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Auspicious Blow', 'Healing Signet', 'Berserker Stance', 'Staggering Blow', 'Renewing Smash', '"Coward!"'], 'armor_levels': {}, 'items_dropped': []},
-    4532: {'name': 'Herta', 'profession': ['Elementalist', 'Monk'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4537: {'name': 'Herta', 'profession': ['Elementalist', 'Monk'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4544: {'name': 'Herta', 'profession': ['Elementalist', 'Monk'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4551: {'name': 'Herta', 'profession': ['Elementalist', 'Monk'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4566: {'name': 'Herta', 'profession': ['Elementalist', 'Monk'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4576: {'name': 'Herta', 'profession': ['Elementalist', 'Monk'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5989: {'name': 'Herta', 'profession': ['Elementalist', 'Monk'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4586: {'name': 'Herta', 'profession': ['Elementalist', 'Monk'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4533: {'name': 'Gehraz', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ['Banishing Strike', 'Rending Aura', 'Heart of Fury', 'Resurrection Signet', 'Heart of Holy Flame', "Reaper's Sweep", "Eremite's Zeal", 'Twin Moon Sweep'], 'armor_levels': {}, 'items_dropped': []},
-    4540: {'name': 'Gehraz', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ['Banishing Strike', 'Rending Aura', 'Heart of Fury', 'Resurrection Signet', 'Heart of Holy Flame', "Reaper's Sweep", "Eremite's Zeal", 'Twin Moon Sweep'], 'armor_levels': {}, 'items_dropped': []},
-    4547: {'name': 'Gehraz', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ['Banishing Strike', 'Rending Aura', 'Heart of Fury', 'Resurrection Signet', 'Heart of Holy Flame', "Reaper's Sweep", "Eremite's Zeal", 'Twin Moon Sweep'], 'armor_levels': {}, 'items_dropped': []},
-    4554: {'name': 'Gehraz', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ['Banishing Strike', 'Rending Aura', 'Heart of Fury', 'Resurrection Signet', 'Heart of Holy Flame', "Reaper's Sweep", "Eremite's Zeal", 'Twin Moon Sweep'], 'armor_levels': {}, 'items_dropped': []},
-    4571: {'name': 'Gehraz', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ['Banishing Strike', 'Rending Aura', 'Heart of Fury', 'Resurrection Signet', 'Heart of Holy Flame', "Reaper's Sweep", "Eremite's Zeal", 'Twin Moon Sweep'], 'armor_levels': {}, 'items_dropped': []},
-    4581: {'name': 'Gehraz', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ['Banishing Strike', 'Rending Aura', 'Heart of Fury', 'Resurrection Signet', 'Heart of Holy Flame', "Reaper's Sweep", "Eremite's Zeal", 'Twin Moon Sweep'], 'armor_levels': {}, 'items_dropped': []},
-    4591: {'name': 'Gehraz', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ['Banishing Strike', 'Rending Aura', 'Heart of Fury', 'Resurrection Signet', 'Heart of Holy Flame', "Reaper's Sweep", "Eremite's Zeal", 'Twin Moon Sweep'], 'armor_levels': {}, 'items_dropped': []},
-    4534: {'name': 'Sogolon', 'profession': ['Paragon', 'Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', "Leader's Comfort", 'Ballad of Restoration', 'Aria of Restoration', 'Spear of Lightning', 'Hexbreaker Aria', "Soldier's Fury", 'Signet of Return', 'Cautery Signet', 'Mending Refrain', 'Signet of Synergy', '"Shields Up!"'], 'armor_levels': {}, 'items_dropped': []},
-    4541: {'name': 'Sogolon', 'profession': ['Paragon', 'Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', "Leader's Comfort", 'Ballad of Restoration', 'Aria of Restoration', 'Spear of Lightning', 'Hexbreaker Aria', "Soldier's Fury", 'Signet of Return', 'Cautery Signet', 'Mending Refrain', 'Signet of Synergy', '"Shields Up!"'], 'armor_levels': {}, 'items_dropped': []},
-    4548: {'name': 'Sogolon', 'profession': ['Paragon', 'Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', "Leader's Comfort", 'Ballad of Restoration', 'Aria of Restoration', 'Spear of Lightning', 'Hexbreaker Aria', "Soldier's Fury", 'Signet of Return', 'Cautery Signet', 'Mending Refrain', 'Signet of Synergy', '"Shields Up!"'], 'armor_levels': {}, 'items_dropped': []},
-    4555: {'name': 'Sogolon', 'profession': ['Paragon', 'Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', "Leader's Comfort", 'Ballad of Restoration', 'Aria of Restoration', 'Spear of Lightning', 'Hexbreaker Aria', "Soldier's Fury", 'Signet of Return', 'Cautery Signet', 'Mending Refrain', 'Signet of Synergy', '"Shields Up!"'], 'armor_levels': {}, 'items_dropped': []},
-    4572: {'name': 'Sogolon', 'profession': ['Paragon', 'Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', "Leader's Comfort", 'Ballad of Restoration', 'Aria of Restoration', 'Spear of Lightning', 'Hexbreaker Aria', "Soldier's Fury", 'Signet of Return', 'Cautery Signet', 'Mending Refrain', 'Signet of Synergy', '"Shields Up!"'], 'armor_levels': {}, 'items_dropped': []},
-    4582: {'name': 'Sogolon', 'profession': ['Paragon', 'Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', "Leader's Comfort", 'Ballad of Restoration', 'Aria of Restoration', 'Spear of Lightning', 'Hexbreaker Aria', "Soldier's Fury", 'Signet of Return', 'Cautery Signet', 'Mending Refrain', 'Signet of Synergy', '"Shields Up!"'], 'armor_levels': {}, 'items_dropped': []},
-    4592: {'name': 'Sogolon', 'profession': ['Paragon', 'Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', "Leader's Comfort", 'Ballad of Restoration', 'Aria of Restoration', 'Spear of Lightning', 'Hexbreaker Aria', "Soldier's Fury", 'Signet of Return', 'Cautery Signet', 'Mending Refrain', 'Signet of Synergy', '"Shields Up!"'], 'armor_levels': {}, 'items_dropped': []},
-    4535: {'name': 'Kihm', 'profession': ['Monk'], 'attributes': [{'level': 'Kihm specializes in', 'name': 'Healing Prayers'}, {'level': 'and in', 'name': 'Protection Prayers'}], 'skills_used': ['Orison of Healing', 'Renew Life', 'Reversal of Fortune', 'Dismiss Condition', 'Zealous Benediction', 'Word of Healing', 'Remove Hex', 'Aegis', 'Protective Spirit', 'Healing Breeze'], 'armor_levels': {}, 'items_dropped': []},
-    4542: {'name': 'Kihm', 'profession': ['Monk'], 'attributes': [{'level': 'Kihm specializes in', 'name': 'Healing Prayers'}, {'level': 'and in', 'name': 'Protection Prayers'}], 'skills_used': ['Orison of Healing', 'Renew Life', 'Reversal of Fortune', 'Dismiss Condition', 'Zealous Benediction', 'Word of Healing', 'Remove Hex', 'Aegis', 'Protective Spirit', 'Healing Breeze'], 'armor_levels': {}, 'items_dropped': []},
-    4568: {'name': 'Kihm', 'profession': ['Monk'], 'attributes': [{'level': 'Kihm specializes in', 'name': 'Healing Prayers'}, {'level': 'and in', 'name': 'Protection Prayers'}], 'skills_used': ['Orison of Healing', 'Renew Life', 'Reversal of Fortune', 'Dismiss Condition', 'Zealous Benediction', 'Word of Healing', 'Remove Hex', 'Aegis', 'Protective Spirit', 'Healing Breeze'], 'armor_levels': {}, 'items_dropped': []},
-    4536: {'name': 'Odurra', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Mistrust', 'Resurrection Signet', 'Visions of Regret', 'Cry of Frustration', 'Empathy', 'Leech Signet', 'Shatter Hex'], 'armor_levels': {}, 'items_dropped': []},
-    4543: {'name': 'Odurra', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Mistrust', 'Resurrection Signet', 'Visions of Regret', 'Cry of Frustration', 'Empathy', 'Leech Signet', 'Shatter Hex'], 'armor_levels': {}, 'items_dropped': []},
-    4550: {'name': 'Odurra', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Mistrust', 'Resurrection Signet', 'Visions of Regret', 'Cry of Frustration', 'Empathy', 'Leech Signet', 'Shatter Hex'], 'armor_levels': {}, 'items_dropped': []},
-    4563: {'name': 'Odurra', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Mistrust', 'Resurrection Signet', 'Visions of Regret', 'Cry of Frustration', 'Empathy', 'Leech Signet', 'Shatter Hex'], 'armor_levels': {}, 'items_dropped': []},
-    4573: {'name': 'Odurra', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Mistrust', 'Resurrection Signet', 'Visions of Regret', 'Cry of Frustration', 'Empathy', 'Leech Signet', 'Shatter Hex'], 'armor_levels': {}, 'items_dropped': []},
-    4583: {'name': 'Odurra', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Mistrust', 'Resurrection Signet', 'Visions of Regret', 'Cry of Frustration', 'Empathy', 'Leech Signet', 'Shatter Hex'], 'armor_levels': {}, 'items_dropped': []},
-    4538: {'name': 'Timera', 'profession': ['Warrior'], 'attributes': [{'level': '(Level 6-15)5-7', 'name': 'Strength'}, {'level': '5-7', 'name': 'Swordsmanship'}, {'level': '5-7', 'name': 'Tactics'}], 'skills_used': ['"You\'re All Alone!"', "Soldier's Strike", 'Healing Signet', 'Resurrection Signet', 'Barbarous Slice', 'Gash'], 'armor_levels': {}, 'items_dropped': []},
-    4545: {'name': 'Timera', 'profession': ['Warrior'], 'attributes': [{'level': '(Level 6-15)5-7', 'name': 'Strength'}, {'level': '5-7', 'name': 'Swordsmanship'}, {'level': '5-7', 'name': 'Tactics'}], 'skills_used': ['"You\'re All Alone!"', "Soldier's Strike", 'Healing Signet', 'Resurrection Signet', 'Barbarous Slice', 'Gash'], 'armor_levels': {}, 'items_dropped': []},
-    4552: {'name': 'Timera', 'profession': ['Warrior'], 'attributes': [{'level': '(Level 6-15)5-7', 'name': 'Strength'}, {'level': '5-7', 'name': 'Swordsmanship'}, {'level': '5-7', 'name': 'Tactics'}], 'skills_used': ['"You\'re All Alone!"', "Soldier's Strike", 'Healing Signet', 'Resurrection Signet', 'Barbarous Slice', 'Gash'], 'armor_levels': {}, 'items_dropped': []},
-    4539: {'name': 'Abasi', 'profession': ['Ranger'], 'attributes': [{'level': '(Level 6-15)5-7', 'name': 'Expertise'}, {'level': '5-7', 'name': 'Marksmanship'}, {'level': '5-7', 'name': 'Wilderness Survival'}], 'skills_used': ['Power Shot', 'Troll Unguent', 'Crossfire', "Expert's Dexterity", 'Resurrection Signet', 'Pin Down', 'Apply Poison'], 'armor_levels': {}, 'items_dropped': []},
-    4553: {'name': 'Abasi', 'profession': ['Ranger'], 'attributes': [{'level': '(Level 6-15)5-7', 'name': 'Expertise'}, {'level': '5-7', 'name': 'Marksmanship'}, {'level': '5-7', 'name': 'Wilderness Survival'}], 'skills_used': ['Power Shot', 'Troll Unguent', 'Crossfire', "Expert's Dexterity", 'Resurrection Signet', 'Pin Down', 'Apply Poison'], 'armor_levels': {}, 'items_dropped': []},
-    4546: {'name': 'Abasi', 'profession': ['Ranger'], 'attributes': [{'level': '(Level 6-15)5-7', 'name': 'Expertise'}, {'level': '5-7', 'name': 'Marksmanship'}, {'level': '5-7', 'name': 'Wilderness Survival'}], 'skills_used': ['Power Shot', 'Troll Unguent', 'Crossfire', "Expert's Dexterity", 'Resurrection Signet', 'Pin Down', 'Apply Poison'], 'armor_levels': {}, 'items_dropped': []},
-    4698: {'name': 'Sunspear', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4726: {'name': 'Sunspear', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4727: {'name': 'Sunspear', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4774: {'name': 'Sunspear', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4778: {'name': 'Sunspear', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4779: {'name': 'Sunspear', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4781: {'name': 'Sunspear', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4782: {'name': 'Sunspear', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4784: {'name': 'Sunspear', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4786: {'name': 'Sunspear', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4811: {'name': 'Sunspear', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4739: {'name': 'Sunspear', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4738: {'name': 'Sunspear', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4700: {'name': 'Projects/NPC models/Humans/Istani', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4701: {'name': 'Projects/NPC models/Humans/Istani', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4705: {'name': 'Projects/NPC models/Humans/Istani', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4723: {'name': 'Projects/NPC models/Humans/Istani', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4702: {'name': 'Dzajo', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4704: {'name': 'Shorewatcher', 'profession': ['Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4707: {'name': 'Young Child', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4708: {'name': 'Young Child', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4709: {'name': 'Istani Noble', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4710: {'name': 'Istani Noble', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4711: {'name': 'Istani Noble', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4733: {'name': 'Istani Noble', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4737: {'name': 'Istani Noble', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4712: {'name': 'Istani Commoner', 'profession': ['Monk', 'Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    4713: {'name': 'Istani Commoner', 'profession': ['Monk', 'Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    4715: {'name': 'Istani Commoner', 'profession': ['Monk', 'Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    4722: {'name': 'Istani Commoner', 'profession': ['Monk', 'Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    4724: {'name': 'Istani Commoner', 'profession': ['Monk', 'Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    4725: {'name': 'Istani Commoner', 'profession': ['Monk', 'Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    4729: {'name': 'Istani Commoner', 'profession': ['Monk', 'Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    4730: {'name': 'Istani Commoner', 'profession': ['Monk', 'Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    4719: {'name': 'Monk Sutoni', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4771: {'name': 'Hagon', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4772: {'name': 'Sunspear Quartermaster', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4773: {'name': 'Projects/NPC models/Humans/Istani', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4776: {'name': 'Kina', 'profession': ['Ranger'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4813: {'name': 'Elder Suhl', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4865: {'name': 'Kormir', 'profession': ['Paragon'], 'attributes': [{'level': '14', 'name': 'Command'}], 'skills_used': ['Ballad of Restoration', '"Incoming!"', '"Never Surrender!"', "Leader's Comfort"], 'armor_levels': {}, 'items_dropped': []},
-    4864: {'name': 'Kormir', 'profession': ['Paragon'], 'attributes': [{'level': '14', 'name': 'Command'}], 'skills_used': ['Ballad of Restoration', '"Incoming!"', '"Never Surrender!"', "Leader's Comfort"], 'armor_levels': {}, 'items_dropped': []},
-    4895: {'name': 'Dzabel Land Guardian', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Scavenger Strike', 'Troll Unguent', 'Ferocious Strike', 'Charm Animal', 'Maiming Strike', "Heket's Rampage"], 'armor_levels': {}, 'items_dropped': ["Dzabel's Hornbow", 'unique']},
-    4896: {'name': 'The Drought', 'profession': ['Elementalist'], 'attributes': [{'level': '20', 'name': 'Earth Magic'}], 'skills_used': ['Sandstorm', 'Stone Daggers', 'Stoning', 'Ebon Hawk'], 'armor_levels': {'Blunt damage': '103', 'Piercing damage': '103', 'Slashing damage': '103', 'Cold damage': '83', 'Earth damage': '123', 'Fire damage': '83', 'Lightning damage': '83'}, 'items_dropped': ['Granite Slab', 'Sentient Lodestone']},
-    4904: {'name': 'Cracked Mesa', 'profession': ['Warrior'], 'attributes': [{'level': '15', 'name': 'Strength'}], 'skills_used': ['Devastating Hammer', 'Flail', 'Overbearing Smash', 'Staggering Blow'], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '100', 'Slashing damage': '100', 'Cold damage': '100', 'Earth damage': '100', 'Fire damage': '100', 'Lightning damage': '100'}, 'items_dropped': ['Granite Slab', 'Lump of Charcoal', 'Ruby', 'Sapphire']},
-    4905: {'name': 'Stone Shard Crag', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Stoning', 'Armor of Earth', 'Sandstorm', 'Aftershock', 'Ebon Hawk'], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '100', 'Slashing damage': '100', 'Cold damage': '112', 'Earth damage': '112', 'Fire damage': '112', 'Lightning damage': '112'}, 'items_dropped': ['Granite Slab', 'Ruby', 'Sentient Lodestone', 'Lump of Charcoal']},
-    4909: {'name': 'Blood Cowl Heket', 'profession': ['Necromancer'], 'attributes': [{'level': '16', 'name': 'Curses'}], 'skills_used': ['Contagion', 'Soul Feast', 'Poisoned Heart', 'Order of Pain', 'Barbs', 'Rigor Mortis', 'Life Siphon', 'Mark of Fury', 'Signet of Agony', 'Parasitic Bond', 'Putrid Explosion'], 'armor_levels': {'Blunt damage': '63', 'Piercing damage': '63', 'Slashing damage': '63', 'Cold damage': '63', 'Earth damage': '63', 'Fire damage': '63', 'Lightning damage': '63'}, 'items_dropped': ['Heket Armor', 'verification requested', 'Heket Robe', 'Heket Tongue']},
-    4694: {'name': 'Blood Cowl Heket', 'profession': ['Necromancer'], 'attributes': [{'level': '16', 'name': 'Curses'}], 'skills_used': ['Contagion', 'Soul Feast', 'Poisoned Heart', 'Order of Pain', 'Barbs', 'Rigor Mortis', 'Life Siphon', 'Mark of Fury', 'Signet of Agony', 'Parasitic Bond', 'Putrid Explosion'], 'armor_levels': {'Blunt damage': '63', 'Piercing damage': '63', 'Slashing damage': '63', 'Cold damage': '63', 'Earth damage': '63', 'Fire damage': '63', 'Lightning damage': '63'}, 'items_dropped': ['Heket Armor', 'verification requested', 'Heket Robe', 'Heket Tongue']},
-    4910: {'name': 'Blue Tongue Heket', 'profession': ['Monk'], 'attributes': [{'level': '15', 'name': 'Healing Prayers'}], 'skills_used': ['Healing Touch', 'Purge Signet', 'Protective Spirit', 'Watchful Healing', 'Healing Ring', 'Shielding Hands', 'Word of Healing', 'Signet of Devotion', 'Martyr'], 'armor_levels': {'Blunt damage': '63', 'Piercing damage': '63', 'Slashing damage': '63', 'Cold damage': '63', 'Earth damage': '63', 'Fire damage': '63', 'Lightning damage': '63'}, 'items_dropped': ['Heket Axe', 'Heket Garment', 'Heket Tongue']},
-    4695: {'name': 'Blue Tongue Heket', 'profession': ['Monk'], 'attributes': [{'level': '15', 'name': 'Healing Prayers'}], 'skills_used': ['Healing Touch', 'Purge Signet', 'Protective Spirit', 'Watchful Healing', 'Healing Ring', 'Shielding Hands', 'Word of Healing', 'Signet of Devotion', 'Martyr'], 'armor_levels': {'Blunt damage': '63', 'Piercing damage': '63', 'Slashing damage': '63', 'Cold damage': '63', 'Earth damage': '63', 'Fire damage': '63', 'Lightning damage': '63'}, 'items_dropped': ['Heket Axe', 'Heket Garment', 'Heket Tongue']},
-    4911: {'name': 'Stoneaxe Heket', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Steady Stance', "Executioner's Strike", 'Healing Signet', 'Cyclone Axe', 'Dismember', 'Agonizing Chop'], 'armor_levels': {'Blunt damage': '133', 'Piercing damage': '133', 'Slashing damage': '133', 'Cold damage': '119', 'Earth damage': '119', 'Fire damage': '119', 'Lightning damage': '119'}, 'items_dropped': ['Heket Armor', 'Heket Axe', 'Heket Garment', 'Heket Tongue']},
-    4696: {'name': 'Stoneaxe Heket', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Steady Stance', "Executioner's Strike", 'Healing Signet', 'Cyclone Axe', 'Dismember', 'Agonizing Chop'], 'armor_levels': {'Blunt damage': '133', 'Piercing damage': '133', 'Slashing damage': '133', 'Cold damage': '119', 'Earth damage': '119', 'Fire damage': '119', 'Lightning damage': '119'}, 'items_dropped': ['Heket Armor', 'Heket Axe', 'Heket Garment', 'Heket Tongue']},
-    4912: {'name': 'Beast Sworn Heket', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Scavenger Strike', 'Rampage as One', 'Troll Unguent', 'Strike as One', 'Ferocious Strike', 'Disrupting Lunge', 'Maiming Strike', 'Call of Haste', "Heket's Rampage", 'Charm Animal (monster)'], 'armor_levels': {'Blunt damage': '89', 'Piercing damage': '89', 'Slashing damage': '89', 'Cold damage': '119', 'Earth damage': '119', 'Fire damage': '119', 'Lightning damage': '119'}, 'items_dropped': ['Heket Armor', 'verification requested', 'Heket Garment', 'verification requested', 'Heket Robe', 'verification requested', 'Heket Tongue']},
-    4697: {'name': 'Beast Sworn Heket', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Scavenger Strike', 'Rampage as One', 'Troll Unguent', 'Strike as One', 'Ferocious Strike', 'Disrupting Lunge', 'Maiming Strike', 'Call of Haste', "Heket's Rampage", 'Charm Animal (monster)'], 'armor_levels': {'Blunt damage': '89', 'Piercing damage': '89', 'Slashing damage': '89', 'Cold damage': '119', 'Earth damage': '119', 'Fire damage': '119', 'Lightning damage': '119'}, 'items_dropped': ['Heket Armor', 'verification requested', 'Heket Garment', 'verification requested', 'Heket Robe', 'verification requested', 'Heket Tongue']},
-    4918: {'name': 'Steelfang Drake', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Rage of the Ntouka', 'Steelfang Slash', 'Endure Pain', "Bull's Strike", 'Thrill of Victory'], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '100', 'Slashing damage': '100', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Chunk of Drake Flesh', 'Half-Digested Armor']},
-    4919: {'name': 'Kuskale Blighter', 'profession': ['Necromancer'], 'attributes': [{'level': '20', 'name': 'Death Magic'}], 'skills_used': ['Well of Blood', 'Rotting Flesh', 'Vile Touch', "Grenth's Balance"], 'armor_levels': {}, 'items_dropped': ['Half-Digested Boots', 'Kuskale Claw', 'Monstrous Fang']},
-    4920: {'name': 'Ridgeback Kuskale', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Dismember', 'Agonizing Chop', 'Enraging Charge', 'Decapitate'], 'armor_levels': {}, 'items_dropped': ['Half-Digested Boots', 'Kuskale Claw', 'Monstrous Claw']},
-    4921: {'name': 'Kuskale Lasher', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ['Chilling Victory', 'Reap Impurities', "Grenth's Fingers", "Grenth's Grasp"], 'armor_levels': {}, 'items_dropped': ['Half-Digested Boots', 'Kuskale Claw', 'Monstrous Fang']},
-    4922: {'name': 'Frigid Kuskale', 'profession': ['Elementalist'], 'attributes': [{'level': '20', 'name': 'Water Magic'}], 'skills_used': ['Icy Shackles', 'Freezing Gust', 'Ice Spear', 'Deep Freeze'], 'armor_levels': {}, 'items_dropped': ['Bone', 'Half-Digested Boots', 'Kuskale Claw', 'Monstrous Claw', 'Monstrous Fang', 'Scale']},
-    4934: {'name': 'Droughtling', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Earth Magic'}], 'skills_used': ['Stoning', 'Stoneflesh Aura', 'Stone Sheath', 'Ebon Hawk', 'Stone Daggers'], 'armor_levels': {'Blunt damage': '91', 'Piercing damage': '91', 'Slashing damage': '91', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Granite Slab', 'Lump of Charcoal', 'Ruby', 'Sapphire', 'Sentient Lodestone']},
-    5001: {'name': 'Xunlai Chest', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5020: {'name': 'Commander Werishakul', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Poisoned Heart', 'Envenom Enchantments', 'Defile Flesh', "Corsair's Net"], 'armor_levels': {}, 'items_dropped': ['Corsair Pauldron', 'Corsair Raiment', 'Silver Bullion Coin', 'Stolen Shipment']},
-    5023: {'name': 'Midshipman Bennis', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['Natural Resistance', "Harrier's Toss"], 'armor_levels': {}, 'items_dropped': ['Copper Shilling', 'Stolen Shipment']},
-    5033: {'name': 'Admiral Kaya', 'profession': ['Assassin'], 'attributes': [], 'skills_used': ['Wild Strike', "Death's Retreat", 'Jagged Strike', 'Hidden Caltrops', 'Death Blossom'], 'armor_levels': {}, 'items_dropped': ['Corsair Raiment', 'Corsair Trappings', "Kaya's Daggers", 'unique', 'Tanned Hide Square']},
-    5034: {'name': 'Corsair Wizard', 'profession': ['Mesmer'], 'attributes': [{'level': 'Level 14: 10', 'name': 'Domination Magic'}, {'level': '12', 'name': 'Inspiration Magic'}], 'skills_used': ['Backfire', "Wastrel's Demise", 'Spirit Shackles', 'Mind Wrack', 'Simple Thievery', 'Power Drain', 'Energy Tap', 'Energy Burn'], 'armor_levels': {'Blunt damage': '43', 'Piercing damage': '43', 'Slashing damage': '43', 'Cold damage': '43', 'Earth damage': '43', 'Fire damage': '43', 'Lightning damage': '43'}, 'items_dropped': ['Bolt of Cloth', 'Corsair Raiment', 'Corsair Trappings', 'Silver Bullion Coin', 'Tanned Hide Square']},
-    5035: {'name': 'Corsair Blackhand', 'profession': ['Necromancer', 'Mesmer'], 'attributes': [], 'skills_used': ['Deathly Chill', 'Envenom Enchantments', "Corsair's Net", 'Vile Miasma', 'Poisoned Heart', 'Taste of Pain', 'Defile Flesh', 'Accumulated Pain', "Reaper's Mark", 'Toxic Chill', 'Images of Remorse', 'Shrinking Armor'], 'armor_levels': {'Blunt damage': '46', 'Piercing damage': '46', 'Slashing damage': '46', 'Cold damage': '46', 'Earth damage': '46', 'Fire damage': '46', 'Lightning damage': '46'}, 'items_dropped': ['Corsair Pauldron', 'Corsair Raiment', 'Corsair Trappings', 'Ornate Scimitar', 'Silver Bullion Coin', 'Stolen Goods', 'Stolen Shipment', 'Tanned Hide Square']},
-    5036: {'name': 'Corsair Cook', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Immolate', 'Elemental Attunement', 'Rust', 'Steam'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Corsair Raiment', 'Corsair Trappings', 'Silver Bullion Coin']},
-    5037: {'name': 'Corsair Bosun', 'profession': ['Monk'], 'attributes': [{'level': '(20', 'name': 'Smiting Prayers'}], 'skills_used': ['Divine Boon', "Balthazar's Pendulum", 'Reversal of Damage', 'Smite Hex', 'Banish'], 'armor_levels': {'Blunt damage': '46', 'Piercing damage': '46', 'Slashing damage': '46', 'Cold damage': '46', 'Earth damage': '46', 'Fire damage': '46', 'Lightning damage': '46'}, 'items_dropped': ['Bolt of Cloth', 'Copper Shilling', 'Corsair Pauldron', 'Corsair Raiment', 'Corsair Trappings', 'Silver Bullion Coin', 'Stolen Goods', 'Stolen Shipment', 'Tanned Hide Square']},
-    5063: {'name': 'Corsair Bosun', 'profession': ['Monk'], 'attributes': [{'level': '(20', 'name': 'Smiting Prayers'}], 'skills_used': ['Divine Boon', "Balthazar's Pendulum", 'Reversal of Damage', 'Smite Hex', 'Banish'], 'armor_levels': {'Blunt damage': '46', 'Piercing damage': '46', 'Slashing damage': '46', 'Cold damage': '46', 'Earth damage': '46', 'Fire damage': '46', 'Lightning damage': '46'}, 'items_dropped': ['Bolt of Cloth', 'Copper Shilling', 'Corsair Pauldron', 'Corsair Raiment', 'Corsair Trappings', 'Silver Bullion Coin', 'Stolen Goods', 'Stolen Shipment', 'Tanned Hide Square']},
-    5041: {'name': 'Corsair Raider', 'profession': ['Ranger'], 'attributes': [{'level': '8', 'name': 'Marksmanship'}], 'skills_used': ['Toxicity', 'Healing Spring', 'Power Shot', "Corsair's Net", 'Quickening Zephyr', 'Savage Shot', 'Kindle Arrows', 'Burning Arrow', 'Apply Poison'], 'armor_levels': {'Blunt damage': '55', 'Piercing damage': '55', 'Slashing damage': '55', 'Cold damage': '85', 'Earth damage': '85', 'Fire damage': '85', 'Lightning damage': '85'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Bolt of Silk', 'Copper Shilling', 'Corsair Pauldron', 'Corsair Raiment', 'Corsair Trappings', 'Silver Bullion Coin', 'Stolen Shipment', 'Tanned Hide Square']},
-    5065: {'name': 'Corsair Raider', 'profession': ['Ranger'], 'attributes': [{'level': '8', 'name': 'Marksmanship'}], 'skills_used': ['Toxicity', 'Healing Spring', 'Power Shot', "Corsair's Net", 'Quickening Zephyr', 'Savage Shot', 'Kindle Arrows', 'Burning Arrow', 'Apply Poison'], 'armor_levels': {'Blunt damage': '55', 'Piercing damage': '55', 'Slashing damage': '55', 'Cold damage': '85', 'Earth damage': '85', 'Fire damage': '85', 'Lightning damage': '85'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Bolt of Silk', 'Copper Shilling', 'Corsair Pauldron', 'Corsair Raiment', 'Corsair Trappings', 'Silver Bullion Coin', 'Stolen Shipment', 'Tanned Hide Square']},
-    5043: {'name': 'Projects/NPC models/Humans/Istani', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5044: {'name': 'Corsair Mind Reader', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Spirit Shackles', 'Mind Wrack', 'Simple Thievery', 'Energy Tap'], 'armor_levels': {'Blunt damage': '66', 'Piercing damage': '66', 'Slashing damage': '66', 'Cold damage': '66', 'Earth damage': '66', 'Fire damage': '66', 'Lightning damage': '66'}, 'items_dropped': ['Corsair Raiment', 'Gold Doubloon', 'Stolen Goods']},
-    5047: {'name': 'Corsair Doctor', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Healing Touch', 'Orison of Healing', "Healer's Boon", 'Divine Boon', "Balthazar's Pendulum", 'Reversal of Damage', 'Words of Comfort', 'Smite Hex', 'Banish'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Corsair Raiment', 'Gold Doubloon']},
-    5048: {'name': 'Corsair Weapons Master', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"You\'re All Alone!"', "Corsair's Net", 'Sprint', 'Counterattack', "Lion's Comfort"], 'armor_levels': {'Blunt damage': '108', 'Piercing damage': '108', 'Slashing damage': '108', 'Cold damage': '88', 'Earth damage': '88', 'Fire damage': '88', 'Lightning damage': '88'}, 'items_dropped': ['Colossal Scimitar', 'Hard mode', 'Gold Doubloon', 'Stolen Goods']},
-    5050: {'name': 'Corsair Grappler', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ['Vow of Strength', "Corsair's Net", 'Vital Boon', 'Aura of Thorns', 'Armor of Sanctity', 'Reap Impurities'], 'armor_levels': {'Blunt damage': '76', 'Piercing damage': '76', 'Slashing damage': '76', 'Cold damage': '76', 'Earth damage': '76', 'Fire damage': '76', 'Lightning damage': '76'}, 'items_dropped': ['Corsair Pauldron', 'Stolen Goods']},
-    5051: {'name': 'Corsair Admiral', 'profession': ['Paragon', 'Monk'], 'attributes': [], 'skills_used': ['Blazing Spear', '"Stand Your Ground!"', 'Disrupting Throw', "Leader's Comfort", 'Purge Signet', "Corsair's Net", 'Barbed Spear', "Harrier's Toss", 'Focused Anger', 'Merciless Spear', 'Spear of Redemption', 'Crippling Anthem', 'Spear of Lightning', '"Go for the Eyes!"', 'Anthem of Envy'], 'armor_levels': {'Blunt damage': '97', 'Piercing damage': '97', 'Slashing damage': '97', 'Cold damage': '97', 'Earth damage': '97', 'Fire damage': '97', 'Lightning damage': '97'}, 'items_dropped': ['Bolt of Cloth', 'Corsair Pauldron', 'Gold Doubloon']},
-    5052: {'name': 'Corsair Seer', 'profession': ['Mesmer'], 'attributes': [{'level': '9', 'name': 'Domination Magic'}], 'skills_used': ['Simple Thievery', "Wastrel's Demise", 'Energy Tap'], 'armor_levels': {'Blunt damage': '32', 'Piercing damage': '32', 'Slashing damage': '32', 'Cold damage': '32', 'Earth damage': '32', 'Fire damage': '32', 'Lightning damage': '32'}, 'items_dropped': ['Bolt of Cloth', 'Corsair Pauldron', 'Silver Bullion Coin', 'Stolen Shipment', 'Tanned Hide Square']},
-    5053: {'name': 'Corsair Flogger', 'profession': ['Necromancer'], 'attributes': [{'level': '11', 'name': 'Curses'}], 'skills_used': ['Envenom Enchantments', "Corsair's Net", 'Poisoned Heart', 'Defile Flesh', "Reaper's Mark"], 'armor_levels': {'Blunt damage': '32', 'Piercing damage': '32', 'Slashing damage': '32', 'Cold damage': '32', 'Earth damage': '32', 'Fire damage': '32', 'Lightning damage': '32'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Corsair Pauldron', 'Corsair Raiment', 'Corsair Trappings', 'Silver Bullion Coin', 'Stolen Shipment', 'Tanned Hide Square']},
-    5054: {'name': 'Corsair Reef Finder', 'profession': ['Elementalist'], 'attributes': [{'level': '10', 'name': 'Water Magic'}], 'skills_used': ['Steam', 'Elemental Attunement', 'Rust'], 'armor_levels': {'Blunt damage': '34', 'Piercing damage': '34', 'Slashing damage': '34', 'Cold damage': '34', 'Earth damage': '34', 'Fire damage': '34', 'Lightning damage': '34'}, 'items_dropped': ['Corsair Raiment', 'Corsair Pauldron', 'Corsair Trappings', 'Silver Bullion Coin']},
-    5055: {'name': 'Corsair Medic', 'profession': ['Monk'], 'attributes': [{'level': '9', 'name': 'Smiting Prayers'}], 'skills_used': ['Smite Hex', "Balthazar's Pendulum", 'Banish'], 'armor_levels': {'Blunt damage': '29', 'Piercing damage': '29', 'Slashing damage': '29', 'Cold damage': '29', 'Earth damage': '29', 'Fire damage': '29', 'Lightning damage': '29'}, 'items_dropped': ['Bolt of Cloth', 'Copper Shilling', 'Corsair Raiment', 'Stolen Shipment']},
-    5056: {'name': 'Corsair Thug', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"You\'re All Alone!"', 'Counterattack', 'Final Thrust', "Corsair's Net"], 'armor_levels': {'Blunt damage': '80', 'Piercing damage': '80', 'Slashing damage': '80', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Corsair Pauldron', 'Corsair Raiment', 'Corsair Trappings', 'Silver Bullion Coin', 'Stolen Shipment', 'Tanned Hide Square']},
-    5057: {'name': 'Corsair Lookout', 'profession': ['Ranger'], 'attributes': [{'level': '11', 'name': 'Marksmanship'}], 'skills_used': ['Power Shot', 'Apply Poison', "Corsair's Net", 'Burning Arrow'], 'armor_levels': {'Blunt damage': '43', 'Piercing damage': '43', 'Slashing damage': '43', 'Cold damage': '73', 'Earth damage': '73', 'Fire damage': '73', 'Lightning damage': '73'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Bolt of Silk', 'Corsair Pauldron', 'Corsair Raiment', 'Corsair Trappings', 'Silver Bullion Coin', 'Stolen Shipment', 'Tanned Hide Square']},
-    5058: {'name': 'Corsair Marauder', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ['Aura of Thorns', 'Reap Impurities', 'Vow of Strength', "Corsair's Net"], 'armor_levels': {'Blunt damage': '37', 'Piercing damage': '37', 'Slashing damage': '37', 'Cold damage': '37', 'Earth damage': '37', 'Fire damage': '37', 'Lightning damage': '37'}, 'items_dropped': ['Bolt of Linen', 'Copper Shilling', 'Corsair Raiment', 'Silver Bullion Coin', 'Tanned Hide Square']},
-    5059: {'name': 'Corsair Captain', 'profession': ['Paragon', 'Warrior', 'Dervish'], 'attributes': [], 'skills_used': ['Disrupting Throw', 'Knee Cutter', "Corsair's Net", 'Enraging Charge', "Harrier's Toss", 'Victorious Sweep', 'Gash', 'Crippling Slash', 'Crippling Anthem', "Lion's Comfort", 'Reap Impurities'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Bolt of Cloth', 'Corsair Raiment', 'Corsair Trappings', 'Silver Bullion Coin', 'Stolen Shipment']},
-    5064: {'name': 'Corsair Cutthroat', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', '"You\'re All Alone!"', "Corsair's Net", 'Sprint', 'Counterattack', '"Shields Up!"'], 'armor_levels': {'Blunt damage': '71 to 72', 'Piercing damage': '71 to 72', 'Slashing damage': '71 to 72', 'Cold damage': '51 to 52', 'Earth damage': '51 to 52', 'Fire damage': '51 to 52', 'Lightning damage': '51 to 52'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Bolt of Silk', 'Colossal Scimitar', 'Copper Shilling', 'Corsair Pauldron', 'Corsair Raiment', 'Corsair Trappings', 'Istani Scimitar', 'Ornate Scimitar', 'Silver Bullion Coin', 'Stolen Shipment', 'Tanned Hide Square']},
-    5066: {'name': 'Corsair Berserker', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ["Harrier's Haste", 'Vow of Strength', "Corsair's Net", 'Aura of Thorns', 'Guiding Hands', 'Armor of Sanctity', 'Reap Impurities', 'Onslaught'], 'armor_levels': {'Blunt damage': '55', 'Piercing damage': '55', 'Slashing damage': '55', 'Cold damage': '55', 'Earth damage': '55', 'Fire damage': '55', 'Lightning damage': '55'}, 'items_dropped': ['Copper Shilling', 'Corsair Pauldron', 'Corsair Raiment', 'Silver Bullion Coin', 'Stolen Shipment']},
-    5067: {'name': 'Corsair Commandant', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['Anthem of Flame', '"Stand Your Ground!"', 'Disrupting Throw', 'Barbed Spear', "Corsair's Net", "Harrier's Toss", 'Defensive Anthem', 'Crippling Anthem', 'Bladeturn Refrain', 'Wild Throw'], 'armor_levels': {'Blunt damage': '77', 'Piercing damage': '77', 'Slashing damage': '77', 'Cold damage': '77', 'Earth damage': '77', 'Fire damage': '77', 'Lightning damage': '77'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Copper Shilling', 'Corsair Pauldron', 'Corsair Raiment', 'Silver Bullion Coin', 'Stolen Goods', 'Stolen Shipment', 'Tanned Hide Square']},
-    5072: {'name': 'Corsair', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5079: {'name': 'Corsair', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5073: {'name': 'Gatekeeper Kahno', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5074: {'name': 'Unlucky Simon', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5076: {'name': 'Projects/NPC models/Humans/Istani', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5077: {'name': 'Ironhook Hube', 'profession': ['Ranger'], 'attributes': [{'level': '0', 'name': 'Beast Mastery'}], 'skills_used': ['Toxicity'], 'armor_levels': {}, 'items_dropped': []},
-    5078: {'name': 'One-Eyed Rugger', 'profession': ['Dervish'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5218: {'name': 'Order of Whispers', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5683: {'name': 'Order of Whispers', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5229: {'name': 'Colonel Chaklin', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Sprint', 'Magehunter Strike', "Executioner's Strike", 'Disrupting Chop'], 'armor_levels': {}, 'items_dropped': ["Chaklin's Axe", 'unique', 'Kournan Pendant']},
-    5230: {'name': 'Colonel Custo', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Savage Shot', 'Crossfire', 'Infuriating Heat', 'Pin Down'], 'armor_levels': {}, 'items_dropped': ["Custo's Hornbow", 'unique', 'Kournan Tunic']},
-    5231: {'name': 'Corporal Luluh', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['"Stand Your Ground!"', 'Mighty Throw', 'Cautery Signet', '"Never Surrender!"', 'Wild Throw'], 'armor_levels': {}, 'items_dropped': ['Bolts of Cloth', 'Kournan Pendant', "Luluh's Spear", 'unique']},
-    5237: {'name': 'Acolyte of Dwayna', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ["Harrier's Haste", "Dwayna's Touch", 'Faithful Intervention', 'Vow of Piety', 'Mystic Healing', 'Avatar of Dwayna', 'Mystic Vigor'], 'armor_levels': {}, 'items_dropped': ["Dwayna's Grace", 'unique', 'Kournan Bracer', 'Kournan Pendant']},
-    5241: {'name': 'General Kahyet', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ['Mirage Cloak', 'Veil of Thorns', "Lyssa's Assault"], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Kournan Bracer', 'Kournan Spaulder', 'Tanned Hide Square']},
-    5271: {'name': 'Captain Besuz', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Ice Spikes', 'Maelstrom', 'Deep Freeze'], 'armor_levels': {}, 'items_dropped': []},
-    5278: {'name': 'Dreamer Hahla', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5282: {'name': 'Kournan Spotter', 'profession': ['Ranger'], 'attributes': [{'level': '0-1', 'name': 'Beast Mastery'}], 'skills_used': ["Heket's Rampage", 'Savage Shot', 'Antidote Signet'], 'armor_levels': {'Blunt damage': '70', 'Piercing damage': '70', 'Slashing damage': '70', 'Cold damage': '100', 'Earth damage': '100', 'Fire damage': '100', 'Lightning damage': '100'}, 'items_dropped': ['Bolt of Silk', 'Kournan Pendant', 'Tanned Hide Square']},
-    5305: {'name': 'Kournan Engineer', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Master of Magic', 'Aura of Restoration'], 'armor_levels': {}, 'items_dropped': []},
-    5321: {'name': 'Kournan Seer', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Domination Magic'}, {'level': '14', 'name': 'Inspiration Magic'}], 'skills_used': ["Enchanter's Conundrum", 'Shatter Enchantment', 'Power Spike', 'Drain Enchantment'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Kournan Pendant', 'Kournan Spaulder', 'Kournan Tunic', 'Tanned Hide Square']},
-    5319: {'name': 'Kournan Seer', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Domination Magic'}, {'level': '14', 'name': 'Inspiration Magic'}], 'skills_used': ["Enchanter's Conundrum", 'Shatter Enchantment', 'Power Spike', 'Drain Enchantment'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Kournan Pendant', 'Kournan Spaulder', 'Kournan Tunic', 'Tanned Hide Square']},
-    5325: {'name': 'Kournan Oppressor', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Blood Magic'}], 'skills_used': ['Life Siphon', 'Signet of Lost Souls', 'Blood is Power', 'Strip Enchantment'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Bolt of Silk', 'Kournan Bracer', 'Kournan Pendant', 'Kournan Spaulder', 'Kournan Tunic', 'Tanned Hide Square']},
-    5323: {'name': 'Kournan Oppressor', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Blood Magic'}], 'skills_used': ['Life Siphon', 'Signet of Lost Souls', 'Blood is Power', 'Strip Enchantment'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Bolt of Silk', 'Kournan Bracer', 'Kournan Pendant', 'Kournan Spaulder', 'Kournan Tunic', 'Tanned Hide Square']},
-    5329: {'name': 'Kournan Scribe', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Fire Magic'}], 'skills_used': ['Meteor', 'Aftershock', 'Aura of Restoration', 'Master of Magic', 'Fireball'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Bolt of Silk', 'Kournan Pendant', 'Tanned Hide Square']},
-    5327: {'name': 'Kournan Scribe', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Fire Magic'}], 'skills_used': ['Meteor', 'Aftershock', 'Aura of Restoration', 'Master of Magic', 'Fireball'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Bolt of Silk', 'Kournan Pendant', 'Tanned Hide Square']},
-    5333: {'name': 'Kournan Priest', 'profession': ['Monk'], 'attributes': [{'level': 'Level 20:15', 'name': 'Divine Favor'}, {'level': '15', 'name': 'Protection Prayers'}], 'skills_used': ['Shielding Hands', 'Convert Hexes', 'Zealous Benediction', 'Reversal of Fortune'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Kournan Bracer', 'Kournan Pendant', 'Kournan Spaulder', 'Kournan Tunic', 'Tanned Hide Square']},
-    5331: {'name': 'Kournan Priest', 'profession': ['Monk'], 'attributes': [{'level': 'Level 20:15', 'name': 'Divine Favor'}, {'level': '15', 'name': 'Protection Prayers'}], 'skills_used': ['Shielding Hands', 'Convert Hexes', 'Zealous Benediction', 'Reversal of Fortune'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Kournan Bracer', 'Kournan Pendant', 'Kournan Spaulder', 'Kournan Tunic', 'Tanned Hide Square']},
-    5336: {'name': 'Kournan Guard', 'profession': ['Warrior'], 'attributes': [{'level': '14', 'name': 'Strength'}], 'skills_used': ['"Watch Yourself!"', 'Mighty Blow', "Executioner's Strike", 'Magehunter Strike', 'Sprint', 'Healing Signet', 'Disrupting Chop', 'Staggering Blow', 'Seeking Blade', '"Shields Up!"'], 'armor_levels': {'Blunt damage': '116', 'Piercing damage': '116', 'Slashing damage': '116', 'Cold damage': '96', 'Earth damage': '96', 'Fire damage': '96', 'Lightning damage': '96'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Bolt of Silk', 'Kournan Bracer', 'Kournan Pendant', 'Kournan Spaulder', 'Kournan Tunic', 'Tanned Hide Square']},
-    5340: {'name': 'Kournan Guard', 'profession': ['Warrior'], 'attributes': [{'level': '14', 'name': 'Strength'}], 'skills_used': ['"Watch Yourself!"', 'Mighty Blow', "Executioner's Strike", 'Magehunter Strike', 'Sprint', 'Healing Signet', 'Disrupting Chop', 'Staggering Blow', 'Seeking Blade', '"Shields Up!"'], 'armor_levels': {'Blunt damage': '116', 'Piercing damage': '116', 'Slashing damage': '116', 'Cold damage': '96', 'Earth damage': '96', 'Fire damage': '96', 'Lightning damage': '96'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Bolt of Silk', 'Kournan Bracer', 'Kournan Pendant', 'Kournan Spaulder', 'Kournan Tunic', 'Tanned Hide Square']},
-    5364: {'name': 'Kournan Guard', 'profession': ['Warrior'], 'attributes': [{'level': '14', 'name': 'Strength'}], 'skills_used': ['"Watch Yourself!"', 'Mighty Blow', "Executioner's Strike", 'Magehunter Strike', 'Sprint', 'Healing Signet', 'Disrupting Chop', 'Staggering Blow', 'Seeking Blade', '"Shields Up!"'], 'armor_levels': {'Blunt damage': '116', 'Piercing damage': '116', 'Slashing damage': '116', 'Cold damage': '96', 'Earth damage': '96', 'Fire damage': '96', 'Lightning damage': '96'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Bolt of Silk', 'Kournan Bracer', 'Kournan Pendant', 'Kournan Spaulder', 'Kournan Tunic', 'Tanned Hide Square']},
-    5365: {'name': 'Kournan Guard', 'profession': ['Warrior'], 'attributes': [{'level': '14', 'name': 'Strength'}], 'skills_used': ['"Watch Yourself!"', 'Mighty Blow', "Executioner's Strike", 'Magehunter Strike', 'Sprint', 'Healing Signet', 'Disrupting Chop', 'Staggering Blow', 'Seeking Blade', '"Shields Up!"'], 'armor_levels': {'Blunt damage': '116', 'Piercing damage': '116', 'Slashing damage': '116', 'Cold damage': '96', 'Earth damage': '96', 'Fire damage': '96', 'Lightning damage': '96'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Bolt of Silk', 'Kournan Bracer', 'Kournan Pendant', 'Kournan Spaulder', 'Kournan Tunic', 'Tanned Hide Square']},
-    5370: {'name': 'Kournan Guard', 'profession': ['Warrior'], 'attributes': [{'level': '14', 'name': 'Strength'}], 'skills_used': ['"Watch Yourself!"', 'Mighty Blow', "Executioner's Strike", 'Magehunter Strike', 'Sprint', 'Healing Signet', 'Disrupting Chop', 'Staggering Blow', 'Seeking Blade', '"Shields Up!"'], 'armor_levels': {'Blunt damage': '116', 'Piercing damage': '116', 'Slashing damage': '116', 'Cold damage': '96', 'Earth damage': '96', 'Fire damage': '96', 'Lightning damage': '96'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Bolt of Silk', 'Kournan Bracer', 'Kournan Pendant', 'Kournan Spaulder', 'Kournan Tunic', 'Tanned Hide Square']},
-    5337: {'name': 'Kournan Guard', 'profession': ['Warrior'], 'attributes': [{'level': '14', 'name': 'Strength'}], 'skills_used': ['"Watch Yourself!"', 'Mighty Blow', "Executioner's Strike", 'Magehunter Strike', 'Sprint', 'Healing Signet', 'Disrupting Chop', 'Staggering Blow', 'Seeking Blade', '"Shields Up!"'], 'armor_levels': {'Blunt damage': '116', 'Piercing damage': '116', 'Slashing damage': '116', 'Cold damage': '96', 'Earth damage': '96', 'Fire damage': '96', 'Lightning damage': '96'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Bolt of Silk', 'Kournan Bracer', 'Kournan Pendant', 'Kournan Spaulder', 'Kournan Tunic', 'Tanned Hide Square']},
-    5368: {'name': 'Kournan Guard', 'profession': ['Warrior'], 'attributes': [{'level': '14', 'name': 'Strength'}], 'skills_used': ['"Watch Yourself!"', 'Mighty Blow', "Executioner's Strike", 'Magehunter Strike', 'Sprint', 'Healing Signet', 'Disrupting Chop', 'Staggering Blow', 'Seeking Blade', '"Shields Up!"'], 'armor_levels': {'Blunt damage': '116', 'Piercing damage': '116', 'Slashing damage': '116', 'Cold damage': '96', 'Earth damage': '96', 'Fire damage': '96', 'Lightning damage': '96'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Bolt of Silk', 'Kournan Bracer', 'Kournan Pendant', 'Kournan Spaulder', 'Kournan Tunic', 'Tanned Hide Square']},
-    5345: {'name': 'Kournan Bowman', 'profession': ['Ranger'], 'attributes': [{'level': '12', 'name': 'Expertise'}], 'skills_used': ['Precision Shot', 'Troll Unguent', 'Prepared Shot', 'Crossfire', 'Infuriating Heat', 'Keen Arrow', 'Resurrection Signet', 'Read the Wind', 'Forked Arrow', 'Whirling Defense', 'Pin Down'], 'armor_levels': {'Blunt damage': '70', 'Piercing damage': '70', 'Slashing damage': '70', 'Cold damage': '100', 'Earth damage': '100', 'Fire damage': '100', 'Lightning damage': '100'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Bolt of Silk', 'Kournan Bracer', 'Kournan Pendant', 'Tanned Hide Square']},
-    5343: {'name': 'Kournan Bowman', 'profession': ['Ranger'], 'attributes': [{'level': '12', 'name': 'Expertise'}], 'skills_used': ['Precision Shot', 'Troll Unguent', 'Prepared Shot', 'Crossfire', 'Infuriating Heat', 'Keen Arrow', 'Resurrection Signet', 'Read the Wind', 'Forked Arrow', 'Whirling Defense', 'Pin Down'], 'armor_levels': {'Blunt damage': '70', 'Piercing damage': '70', 'Slashing damage': '70', 'Cold damage': '100', 'Earth damage': '100', 'Fire damage': '100', 'Lightning damage': '100'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Bolt of Silk', 'Kournan Bracer', 'Kournan Pendant', 'Tanned Hide Square']},
-    5349: {'name': 'Kournan Zealot', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ["Eremite's Attack", 'Armor of Sanctity', 'Veil of Thorns', 'Pious Renewal'], 'armor_levels': {'Blunt damage': '70', 'Piercing damage': '70', 'Slashing damage': '70', 'Cold damage': '70', 'Earth damage': '70', 'Fire damage': '70', 'Lightning damage': '70'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Bolt of Silk', 'Kournan Bracer', 'Kournan Defender', 'Kournan Pendant', 'Kournan Spaulder', 'Kournan Tunic', 'Tanned Hide Square']},
-    5347: {'name': 'Kournan Zealot', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ["Eremite's Attack", 'Armor of Sanctity', 'Veil of Thorns', 'Pious Renewal'], 'armor_levels': {'Blunt damage': '70', 'Piercing damage': '70', 'Slashing damage': '70', 'Cold damage': '70', 'Earth damage': '70', 'Fire damage': '70', 'Lightning damage': '70'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Bolt of Silk', 'Kournan Bracer', 'Kournan Defender', 'Kournan Pendant', 'Kournan Spaulder', 'Kournan Tunic', 'Tanned Hide Square']},
-    5351: {'name': 'Kournan Phalanx', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['"Stand Your Ground!"', 'Mighty Throw', 'Cautery Signet', '"Never Surrender!"', 'Wild Throw'], 'armor_levels': {'Blunt damage': '95', 'Piercing damage': '95', 'Slashing damage': '95', 'Cold damage': '95', 'Earth damage': '95', 'Fire damage': '95', 'Lightning damage': '95'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Kournan Bracer', 'Kournan Pendant', 'Kournan Spaulder', 'Kournan Tunic', 'Tanned Hide Square']},
-    5354: {'name': 'Kournan Phalanx', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['"Stand Your Ground!"', 'Mighty Throw', 'Cautery Signet', '"Never Surrender!"', 'Wild Throw'], 'armor_levels': {'Blunt damage': '95', 'Piercing damage': '95', 'Slashing damage': '95', 'Cold damage': '95', 'Earth damage': '95', 'Fire damage': '95', 'Lightning damage': '95'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Kournan Bracer', 'Kournan Pendant', 'Kournan Spaulder', 'Kournan Tunic', 'Tanned Hide Square']},
-    5353: {'name': 'Kournan Field Commander', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['"Stand Your Ground!"', 'Cautery Signet', 'Mighty Throw', 'Kournan Siege'], 'armor_levels': {'Blunt damage': '107', 'Piercing damage': '107', 'Slashing damage': '107', 'Cold damage': '107', 'Earth damage': '107', 'Fire damage': '107', 'Lightning damage': '107'}, 'items_dropped': ['Bolt of Cloth', 'Kournan Tunic']},
-    5362: {'name': 'Kournan Child', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5363: {'name': 'Kournan Child', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5373: {'name': 'Kournan Noble', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5374: {'name': 'Kournan Noble', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5375: {'name': 'Kournan Peasant', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5376: {'name': 'Kournan Peasant', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5377: {'name': 'Kournan Peasant', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5378: {'name': 'Kournan Peasant', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5379: {'name': 'Kournan Peasant', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5380: {'name': 'Kournan Peasant', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5383: {'name': 'Wandering Priest', 'profession': ['Monk'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5384: {'name': 'Wandering Priest', 'profession': ['Monk'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5389: {'name': 'Ashnod', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5390: {'name': 'Raleva', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5402: {'name': 'Projects/NPC models/Humans/Kournans', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5396: {'name': 'Projects/NPC models/Humans/Kournans', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5397: {'name': 'Projects/NPC models/Humans/Kournans', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5400: {'name': 'Projects/NPC models/Humans/Kournans', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5405: {'name': 'Harbinger of Twilight', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ["Executioner's Strike", 'Wave of Torment', 'Disrupting Chop', 'Distracting Blow', 'Dismember'], 'armor_levels': {'Blunt damage': '123', 'Piercing damage': '123', 'Slashing damage': '123', 'Cold damage': '103', 'Earth damage': '103', 'Fire damage': '103', 'Lightning damage': '103'}, 'items_dropped': ['Demonic Relic', 'Margonite Key']},
-    5409: {'name': 'Harbinger of Twilight', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ["Executioner's Strike", 'Wave of Torment', 'Disrupting Chop', 'Distracting Blow', 'Dismember'], 'armor_levels': {'Blunt damage': '123', 'Piercing damage': '123', 'Slashing damage': '123', 'Cold damage': '103', 'Earth damage': '103', 'Fire damage': '103', 'Lightning damage': '103'}, 'items_dropped': ['Demonic Relic', 'Margonite Key']},
-    5541: {'name': 'Restless Dead', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5542: {'name': 'Relentless Corpse', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Sever Artery', 'Crippling Slash', 'Seeking Blade'], 'armor_levels': {'Blunt damage': '92 to 94', 'Piercing damage': '92 to 94', 'Slashing damage': '92 to 94', 'Cold damage': '72 to 74', 'Earth damage': '72 to 74', 'Fire damage': '72 to 74', 'Lightning damage': '72 to 74'}, 'items_dropped': ['Ancient Shield', 'Battered Armor', 'Bolt of Cloth', 'Bone', 'Copperleaf Shield', 'Dead Bow', 'Dead Sword', 'Decayed Garment', 'Pile of Glittering Dust', 'Rusted Greave', 'Sephis Axe', 'Skeleton Bone', 'Tanned Hide Square']},
-    5545: {'name': 'Ghostly Sunspear Commander', 'profession': ['Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5546: {'name': 'Kahdash', 'profession': ['Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5632: {'name': 'Vabbian Guard', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5639: {'name': 'Vabbian Guard', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5645: {'name': 'Vabbian Guard', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5634: {'name': 'Vabbian Guard', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5647: {'name': 'Vabbian Guard', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5637: {'name': 'Vabbian Guard', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5649: {'name': 'Vabbian Child', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5648: {'name': 'Vabbian Child', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5650: {'name': 'Vabbian Noble', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    5652: {'name': 'Vabbian Noble', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    5654: {'name': 'Royal Chef Hatundo', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5670: {'name': 'Projects/NPC models/Humans/Vabbians', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5673: {'name': 'Projects/NPC models/Humans/Vabbians', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5669: {'name': 'Projects/NPC models/Humans/Vabbians', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5681: {'name': 'Projects/NPC models/Humans/Vabbians', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5675: {'name': 'Projects/NPC models/Humans/Vabbians', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5676: {'name': 'Projects/NPC models/Humans/Vabbians', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5677: {'name': 'Projects/NPC models/Humans/Vabbians', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5715: {'name': 'Spirit of Infuriating Heat', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5716: {'name': 'Spirit of Toxicity', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5722: {'name': 'Spirit of Fury', 'profession': [], 'attributes': [], 'skills_used': ['Gaze of Fury (attack)'], 'armor_levels': {}, 'items_dropped': []},
-    5777: {'name': 'Albino Rat', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5778: {'name': 'White Crab', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5780: {'name': 'Black Wolf', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5781: {'name': 'White Wolf', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5782: {'name': 'Mountain Eagle', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5783: {'name': 'Polar Bear', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5784: {'name': 'White Moa', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5842: {'name': 'Rabbit', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5843: {'name': 'Arctic Wolf', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Power Attack', 'Enraging Charge', 'Sprint', 'Gash', 'Crippling Slash'], 'armor_levels': {'Blunt damage': '80', 'Piercing damage': '80', 'Slashing damage': '80', 'Cold damage': '80', 'Earth damage': '80', 'Fire damage': '80', 'Lightning damage': '80'}, 'items_dropped': []},
-    5844: {'name': 'Stonewolf', 'profession': ['Warrior'], 'attributes': [{'level': '15', 'name': 'Strength'}], 'skills_used': ['Power Attack', 'Enraging Charge', 'Savage Slash', 'Hamstring', 'Primal Rage'], 'armor_levels': {'Blunt damage': '80', 'Piercing damage': '80', 'Slashing damage': '80', 'Cold damage': '80', 'Earth damage': '80', 'Fire damage': '80', 'Lightning damage': '80'}, 'items_dropped': []},
-    5913: {'name': 'Vekk', 'profession': ['Elementalist'], 'attributes': [{'level': '12', 'name': 'Air Magic'}, {'level': '11', 'name': 'Water Magic'}, {'level': '6', 'name': 'Energy Storage'}], 'skills_used': ['Lightning Orb', 'Ice Spear', 'Aura of Restoration', 'Resurrection Signet', 'Air Attunement', 'Blinding Flash', 'Vapor Blade', 'Lightning Strike', 'Blurred Vision', 'Shatterstone', 'Armor of Mist'], 'armor_levels': {}, 'items_dropped': []},
-    5932: {'name': 'Ogden Stonehealer', 'profession': ['Monk'], 'attributes': [{'level': '12', 'name': 'Healing Prayers'}, {'level': '12', 'name': 'Divine Favor'}], 'skills_used': ['Healing Touch', 'Orison of Healing', 'Holy Veil', 'Resurrect', 'Signet of Devotion', 'Healing Breeze'], 'armor_levels': {}, 'items_dropped': []},
-    5948: {'name': 'Livia', 'profession': ['Necromancer'], 'attributes': [{'level': '12', 'name': 'Blood Magic'}, {'level': 'during', 'name': 'Finding the Bloodstone'}, {'level': '12', 'name': 'Soul Reaping'}], 'skills_used': ['Unholy Feast', 'Vampiric Gaze', 'Extract Inscription', 'Resurrection Signet', 'Blood of the Aggressor', 'Strip Enchantment', 'Ravenous Gaze', 'Shadow Strike', 'Life Siphon', 'Well of Blood'], 'armor_levels': {}, 'items_dropped': []},
-    5974: {'name': 'Xandra', 'profession': ['Ritualist'], 'attributes': [{'level': '12', 'name': 'Channeling Magic'}, {'level': '12', 'name': 'Restoration Magic'}], 'skills_used': ['Cruel Was Daoshen', 'Resurrection Signet', 'Soothing Memories', 'Channeled Strike', 'Renewing Surge', 'Vengeful Weapon', 'Spirit Rift', 'Destructive Was Glaive'], 'armor_levels': {}, 'items_dropped': []},
-    5983: {'name': 'Jora', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', 'Healing Signet', 'Resurrection Signet', 'Sever Artery', 'Savage Slash', 'Gash', 'Shield Bash'], 'armor_levels': {}, 'items_dropped': []},
-    6058: {'name': 'Bartholos', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ["Griffon's Sweep", 'Hundred Blades', 'Sun and Moon Slash', 'Shield Bash', 'Standing Slash', 'Disarm'], 'armor_levels': {}, 'items_dropped': []},
-    6064: {'name': 'Projects/NPC models/Humans/Kryta', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6174: {'name': 'Kilroy Stonekin', 'profession': ['Warrior', 'Monk'], 'attributes': [], 'skills_used': ['Mending', 'Brawling Combo Punch', 'Wild Blow', '"Kilroy Stonekin"', 'Brawling Straight Right', 'Brawling Headbutt', 'Brawling Jab', 'Brawling Hook', 'Sever Artery', 'Cyclone Axe', 'Distracting Blow', 'Gash', 'Frenzy', 'Final Thrust', 'Healing Hands', 'Brawling Uppercut'], 'armor_levels': {}, 'items_dropped': []},
-    6181: {'name': 'Dwarven Miner', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6256: {'name': 'Wilderm Wrathspew', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Migraine', 'Auspicious Incantation', 'Ether Feast', 'Conjure Nightmare', 'Power Drain', 'Conjure Phantasm'], 'armor_levels': {}, 'items_dropped': ["Wilderm's Wand", 'unique']},
-    6258: {'name': 'Flannuss Broadwing', 'profession': ['Monk'], 'attributes': [], 'skills_used': ["Karei's Healing Circle", 'Word of Healing', 'Healing Breeze', 'Signet of Rejuvenation'], 'armor_levels': {}, 'items_dropped': ["Flannuss' Rod", 'unique']},
-    6261: {'name': 'Mobrin, Lord of the Marsh', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Power Attack', 'Twisting Jaws', 'Stun Immunity', 'Enraging Charge', 'Gash', 'Crippling Slash', 'Chomp', 'Sweeping Strikes'], 'armor_levels': {}, 'items_dropped': ["Mobrin's Blade", 'unique', 'Saurian Bone']},
-    6262: {'name': 'Pywatt the Swift', 'profession': ['Assassin'], 'attributes': [], 'skills_used': ['Twisting Jaws', 'Critical Defenses', 'Disrupting Stab', 'Golden Skull Strike', 'Death Blossom'], 'armor_levels': {}, 'items_dropped': ["Pywatt's Talons", 'unique', 'Saurian Bone']},
-    6268: {'name': 'Brynn Earthporter', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ['Mystic Sweep', 'Staggering Force', 'Victorious Sweep', 'Ebon Dust Aura', "Eremite's Attack"], 'armor_levels': {}, 'items_dropped': ["Brynn's Scythe", 'unique']},
-    6287: {'name': 'Krait Hypnoss', 'profession': ['Mesmer'], 'attributes': [{'level': '20', 'name': 'Illusion Magic'}], 'skills_used': ['Power Leech', 'Sum of All Fears', 'Accumulated Pain', 'Power Drain', 'Clumsiness', 'Frustration'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Krait Skin']},
-    6288: {'name': 'Krait Arcanoss', 'profession': ['Elementalist'], 'attributes': [{'level': '20', 'name': 'Air Magic'}], 'skills_used': ['Lightning Orb', 'Shell Shock', 'Chain Lightning', 'Air Attunement', 'Glyph of Restoration', 'Blinding Surge'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Krait Skin']},
-    6289: {'name': 'Krait Devouss', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Healing Touch', 'Orison of Healing', 'Light of Deliverance', 'Cure Hex', 'Healing Whisper', 'Healing Ribbon'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Krait Skin']},
-    6290: {'name': 'Krait Necross', 'profession': ['Necromancer'], 'attributes': [{'level': '20', 'name': 'Death Magic'}], 'skills_used': ['Putrid Bile', 'Taste of Pain', 'Rising Bile', 'Well of Power', 'Withering Aura', 'Deathly Swarm'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Krait Skin']},
-    6293: {'name': 'Krait Neoss', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Metamorphosis', 'Sun and Moon Slash', 'Berserker Stance', 'Savage Slash', 'Distracting Blow', 'Dragon Slash', 'Silverwing Slash'], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '100', 'Slashing damage': '100', 'Cold damage': '80', 'Earth damage': '80', 'Fire damage': '80', 'Lightning damage': '80'}, 'items_dropped': ['Krait Skin']},
-    6301: {'name': 'Savage Oakheart', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['Mighty Throw', 'Unblockable Throw', 'Natural Temper', 'Stunning Strike', 'Wild Throw'], 'armor_levels': {'Blunt damage': '104', 'Piercing damage': '104', 'Slashing damage': '104', 'Cold damage': '104', 'Earth damage': '104', 'Fire damage': '104', 'Lightning damage': '104'}, 'items_dropped': ['Sentient Vine', 'Darkwing Defender']},
-    6303: {'name': 'Skelk Afflictor', 'profession': ['Necromancer'], 'attributes': [{'level': '16', 'name': 'Curses'}, {'level': '14...16', 'name': 'Death Magic'}, {'level': '20 Death Magic in', 'name': 'Hard mode'}], 'skills_used': ['Soul Feast', 'Rising Bile', 'Shadow of Fear', 'Malaise', 'Rotting Flesh', 'Wither'], 'armor_levels': {'Blunt damage': '103', 'Piercing damage': '103', 'Slashing damage': '103', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '83', 'Lightning damage': '83'}, 'items_dropped': ['Skelk Claw']},
-    6304: {'name': 'Skelk Scourger', 'profession': ['Monk'], 'attributes': [{'level': '15', 'name': 'Smiting Prayers'}], 'skills_used': ["Balthazar's Aura", 'Scourge Healing', "Heaven's Delight", 'Withdraw Hexes', 'Watchful Healing', 'Symbol of Wrath'], 'armor_levels': {'Blunt damage': '91', 'Piercing damage': '91', 'Slashing damage': '91', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Skelk Claw']},
-    6305: {'name': 'Skelk Reaper', 'profession': ['Assassin'], 'attributes': [{'level': '15', 'name': 'Deadly Arts'}, {'level': '20 Deadly Arts in', 'name': 'Hard mode'}], 'skills_used': ['Moebius Strike', 'Black Spider Strike', 'Shameful Fear', 'Death Blossom', 'Mark of Death', 'Augury of Death'], 'armor_levels': {'Blunt damage': '114', 'Piercing damage': '114', 'Slashing damage': '114', 'Cold damage': '94', 'Earth damage': '94', 'Fire damage': '94', 'Lightning damage': '94'}, 'items_dropped': ['Skelk Claw']},
-    6306: {'name': 'Angorodon', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Blood Magic'}, {'level': '15', 'name': 'Death Magic'}, {'level': '11', 'name': 'Soul Reaping'}], 'skills_used': ['Unholy Feast', 'Twisting Jaws', "Angorodon's Gaze", 'Vampiric Bite', 'Ravenous Gaze', 'Putrid Explosion', 'Deathly Swarm'], 'armor_levels': {'Blunt damage': '82', 'Piercing damage': '82', 'Slashing damage': '82', 'Cold damage': '82', 'Earth damage': '82', 'Fire damage': '82', 'Lightning damage': '82'}, 'items_dropped': ['Saurian Bone']},
-    6307: {'name': 'Ferothrax', 'profession': ['Dervish'], 'attributes': [{'level': '16', 'name': 'Scythe Mastery'}, {'level': '0', 'name': 'Wind Prayers'}, {'level': '19...20 Wind Prayers in', 'name': 'hard mode'}], 'skills_used': ['Chilling Victory', "Harrier's Haste", 'Rending Aura', 'Twisting Jaws', 'Stun Immunity', 'Victorious Sweep', "Reaper's Sweep", 'Chomp'], 'armor_levels': {'Blunt damage': '97', 'Piercing damage': '97', 'Slashing damage': '97', 'Cold damage': '97', 'Earth damage': '97', 'Fire damage': '97', 'Lightning damage': '97'}, 'items_dropped': ['Saurian Bone']},
-    6308: {'name': 'Ceratadon', 'profession': ['Elementalist'], 'attributes': [{'level': '16', 'name': 'Earth Magic'}, {'level': '16', 'name': 'Energy Storage'}], 'skills_used': ['Sliver Armor', 'Grasping Earth', 'Twisting Jaws', 'Stun Immunity', 'Stoneflesh Aura', 'Armor of Earth', 'Chomp', 'Shockwave'], 'armor_levels': {'Blunt damage': '120', 'Piercing damage': '120', 'Slashing damage': '120', 'Cold damage': '80', 'Earth damage': '80', 'Fire damage': '80', 'Lightning damage': '80'}, 'items_dropped': ['Saurian Bone']},
-    6309: {'name': 'Tyrannus', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Power Attack', "Leviathan's Sweep", 'Twisting Jaws', 'Stun Immunity', 'Enraging Charge', 'Gash', 'Crippling Slash', 'Chomp'], 'armor_levels': {'Blunt damage': '104', 'Piercing damage': '104', 'Slashing damage': '104', 'Cold damage': '104', 'Earth damage': '104', 'Fire damage': '104', 'Lightning damage': '104'}, 'items_dropped': ['Saurian Bone']},
-    6310: {'name': 'Raptor', 'profession': ['Assassin'], 'attributes': [{'level': '8', 'name': 'Dagger Mastery'}], 'skills_used': ['Death Blossom', 'Critical Defenses', 'Wild Strike', 'Disrupting Stab'], 'armor_levels': {'Blunt damage': '82', 'Piercing damage': '82', 'Slashing damage': '82', 'Cold damage': '82', 'Earth damage': '82', 'Fire damage': '82', 'Lightning damage': '82'}, 'items_dropped': ['Saurian Bone']},
-    6316: {'name': 'Agari Tlamatini', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Illusion Magic'}, {'level': '14', 'name': 'Inspiration Magic'}], 'skills_used': ['Migraine', 'Ether Feast', 'Mantra of Persistence', 'Spirit Shackles', 'Ehzah from Above', 'Power Drain', 'Illusion of Pain', 'Conjure Phantasm'], 'armor_levels': {'Blunt damage': '80', 'Piercing damage': '80', 'Slashing damage': '80', 'Cold damage': '80', 'Earth damage': '80', 'Fire damage': '80', 'Lightning damage': '80'}, 'items_dropped': ['Amphibian Armor', 'verification requested', 'Amphibian Robe', 'Amphibian Garment', 'Amphibian Tongue']},
-    6317: {'name': 'Agari Amini', 'profession': ['Warrior'], 'attributes': [{'level': '14..16', 'name': 'Tactics'}], 'skills_used': ['"Watch Yourself!"', "Soldier's Strike", 'Axe Rake', "Soldier's Stance", 'Healing Signet', 'Ehzah from Above', 'Dismember', '"Shields Up!"'], 'armor_levels': {'Blunt damage': '95', 'Piercing damage': '95', 'Slashing damage': '95', 'Cold damage': '95', 'Earth damage': '95', 'Fire damage': '95', 'Lightning damage': '95'}, 'items_dropped': ['Amphibian Armor', 'Amphibian Garment', 'verification requested', 'Amphibian Robe', 'verification requested', 'Amphibian Tongue']},
-    6318: {'name': 'Agari Nahualli', 'profession': ['Ritualist'], 'attributes': [{'level': '15', 'name': 'Channeling Magic'}], 'skills_used': ['Weapon of Aggression', "Spirit's Strength", 'Ehzah from Above', 'Mending Grip', "Wielder's Strike", 'Sight Beyond Sight', "Warmonger's Weapon", 'Splinter Weapon'], 'armor_levels': {'Blunt damage': '74', 'Piercing damage': '74', 'Slashing damage': '74', 'Cold damage': '74', 'Earth damage': '74', 'Fire damage': '74', 'Lightning damage': '74'}, 'items_dropped': ['Amphibian Tongue', 'Amphibian Armor', 'verification requested']},
-    6319: {'name': 'Agari Cuicani', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ["Leader's Comfort", 'Blazing Finale', 'Ballad of Restoration', 'Ehzah from Above', 'Hexbreaker Aria', 'Song of Restoration', 'Aria of Zeal', 'Mending Refrain'], 'armor_levels': {'Blunt damage': '95', 'Piercing damage': '95', 'Slashing damage': '95', 'Cold damage': '95', 'Earth damage': '95', 'Fire damage': '95', 'Lightning damage': '95'}, 'items_dropped': ['Amphibian Armor', 'verification requested', 'Amphibian Garment', 'Amphibian Robe', 'Amphibian Tongue']},
-    6328: {'name': 'Bloodweaver', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['Anthem of Disruption', 'Barbed Spear', "Leader's Comfort", 'Snaring Web', 'Stunning Strike', 'Vicious Attack', 'Wild Throw'], 'armor_levels': {'Blunt damage': '91', 'Piercing damage': '91', 'Slashing damage': '91', 'Cold damage': '91', 'Earth damage': '91', 'Fire damage': '91', 'Lightning damage': '91'}, 'items_dropped': ['Weaver Leg']},
-    6329: {'name': 'Bloodweaver', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['Anthem of Disruption', 'Barbed Spear', "Leader's Comfort", 'Snaring Web', 'Stunning Strike', 'Vicious Attack', 'Wild Throw'], 'armor_levels': {'Blunt damage': '91', 'Piercing damage': '91', 'Slashing damage': '91', 'Cold damage': '91', 'Earth damage': '91', 'Fire damage': '91', 'Lightning damage': '91'}, 'items_dropped': ['Weaver Leg']},
-    6330: {'name': 'Lifeweaver', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Snaring Web', 'Spirit Bond', 'Pensive Guardian', 'Guardian', 'Reversal of Fortune', 'Shield of Absorption', 'Divert Hexes'], 'armor_levels': {'Blunt damage': '72', 'Piercing damage': '72', 'Slashing damage': '72', 'Cold damage': '72', 'Earth damage': '72', 'Fire damage': '72', 'Lightning damage': '72'}, 'items_dropped': ['Weaver Leg']},
-    6331: {'name': 'Lifeweaver', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Snaring Web', 'Spirit Bond', 'Pensive Guardian', 'Guardian', 'Reversal of Fortune', 'Shield of Absorption', 'Divert Hexes'], 'armor_levels': {'Blunt damage': '72', 'Piercing damage': '72', 'Slashing damage': '72', 'Cold damage': '72', 'Earth damage': '72', 'Fire damage': '72', 'Lightning damage': '72'}, 'items_dropped': ['Weaver Leg']},
-    6333: {'name': 'Venomweaver', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Rapid Fire', 'Natural Stride', 'Troll Unguent', 'Snaring Web', 'Debilitating Shot', 'Crippling Shot', 'Apply Poison', "Hunter's Shot"], 'armor_levels': {'Blunt damage': '82', 'Piercing damage': '82', 'Slashing damage': '82', 'Cold damage': '82', 'Earth damage': '82', 'Fire damage': '82', 'Lightning damage': '82'}, 'items_dropped': ['Weaver Leg']},
-    6334: {'name': 'Cloudtouched Simian', 'profession': ['Elementalist'], 'attributes': [{'level': '20', 'name': 'Air Magic'}, {'level': '20', 'name': 'Water Magic'}], 'skills_used': ['Chilling Winds', 'Lightning Touch', 'Arc Lightning', 'Freezing Gust', 'Monkey See, Monkey Do', 'Gust', 'Ice Prison'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Patch of Simian Fur']},
-    6335: {'name': 'Redhand Simian', 'profession': ['Dervish'], 'attributes': [{'level': '20', 'name': 'Earth Prayers'}], 'skills_used': ['Mystic Sweep', 'Staggering Force', 'Victorious Sweep', 'Ebon Dust Aura', "Eremite's Attack", 'Monkey See, Monkey Do'], 'armor_levels': {'Blunt damage': '70', 'Piercing damage': '70', 'Slashing damage': '70', 'Cold damage': '70', 'Earth damage': '70', 'Fire damage': '70', 'Lightning damage': '70'}, 'items_dropped': ['Patch of Simian Fur']},
-    6337: {'name': 'Quetzal Sly', 'profession': ['Mesmer'], 'attributes': [{'level': '20', 'name': 'Domination Magic'}, {'level': '20', 'name': 'Illusion Magic'}, {'level': '19..20', 'name': 'Inspiration Magic'}, {'level': '19..20 Inspiration Magic in', 'name': 'Hard Mode'}], 'skills_used': ['Spirit of Failure', 'Ether Feast', "Tengu's Mimicry", 'Ineptitude', 'Waste Not, Want Not', 'Frustration', 'Wandering Eye'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Quetzal Crest', 'Quetzal Crestguard']},
-    6338: {'name': 'Quetzal Dark', 'profession': ['Necromancer'], 'attributes': [{'level': '20', 'name': 'Blood Magic'}, {'level': '20', 'name': 'Death Magic'}, {'level': '20', 'name': 'Soul Reaping'}, {'level': '20 Soul Reaping in', 'name': 'Hard mode'}], 'skills_used': ['Signet of Sorrow', 'Well of Suffering', 'Strip Enchantment', 'Well of Power', "Tengu's Mimicry", 'Life Siphon'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Quetzal Crest']},
-    6339: {'name': 'Quetzal Stark', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', 'Seeking Blade', 'Savage Slash', 'Quivering Blade', "Tengu's Mimicry", 'Silverwing Slash', '"None Shall Pass!"'], 'armor_levels': {'Blunt damage': '114', 'Piercing damage': '114', 'Slashing damage': '114', 'Cold damage': '94', 'Earth damage': '94', 'Fire damage': '94', 'Lightning damage': '94'}, 'items_dropped': ['Quetzal Bracer', 'Quetzal Crest', 'Quetzal Crestguard', 'Quetzal Garb', 'Elemental Sword']},
-    6340: {'name': 'Quetzal Keen', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Dual Shot', 'Determined Shot', 'Forked Arrow', "Tengu's Mimicry", 'Glass Arrows'], 'armor_levels': {'Blunt damage': '70', 'Piercing damage': '70', 'Slashing damage': '70', 'Cold damage': '100', 'Earth damage': '100', 'Fire damage': '100', 'Lightning damage': '100'}, 'items_dropped': ['Quetzal Bracer', 'Quetzal Crest', 'Quetzal Garb']},
-    6347: {'name': 'Sif Shadowhunter', 'profession': [], 'attributes': [], 'skills_used': ['Read the Wind', 'Bear Form', 'Lightning Reflexes', "Melandru's Shot", 'Sundering Attack'], 'armor_levels': {}, 'items_dropped': []},
-    6348: {'name': 'Sif Shadowhunter', 'profession': [], 'attributes': [], 'skills_used': ['Read the Wind', 'Bear Form', 'Lightning Reflexes', "Melandru's Shot", 'Sundering Attack'], 'armor_levels': {}, 'items_dropped': []},
-    6349: {'name': 'Norn Commoner', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6385: {'name': 'Norn Commoner', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6390: {'name': 'Norn Commoner', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6398: {'name': 'Norn Commoner', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6404: {'name': 'Norn Commoner', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6352: {'name': 'Olaf Olafson', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Healing Signet', 'Pure Strike', 'Barbarous Slice', 'Galrath Slash', 'Bear Form', 'Gash', 'Dragon Slash', "Lion's Comfort"], 'armor_levels': {}, 'items_dropped': []},
-    6353: {'name': 'Gunnar Poundfist', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Backbreaker'], 'armor_levels': {}, 'items_dropped': []},
-    6357: {'name': 'Norn Guard', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Axe Twist', 'Healing Signet', 'Pure Strike', 'Galrath Slash', 'Disrupting Chop', 'Bear Form', 'Gash', 'Crippling Slash', 'Dismember', 'Cleave'], 'armor_levels': {}, 'items_dropped': []},
-    6380: {'name': 'Norn Guard', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Axe Twist', 'Healing Signet', 'Pure Strike', 'Galrath Slash', 'Disrupting Chop', 'Bear Form', 'Gash', 'Crippling Slash', 'Dismember', 'Cleave'], 'armor_levels': {}, 'items_dropped': []},
-    6374: {'name': 'Jora', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', 'Healing Signet', 'Resurrection Signet', 'Sever Artery', 'Savage Slash', 'Gash', 'Shield Bash'], 'armor_levels': {}, 'items_dropped': []},
-    6384: {'name': 'Eyja', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6387: {'name': 'Projects/NPC models/Norn', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6392: {'name': 'Projects/NPC models/Norn', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6393: {'name': 'Projects/NPC models/Norn', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6394: {'name': 'Projects/NPC models/Norn', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6395: {'name': 'Projects/NPC models/Norn', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6396: {'name': 'Projects/NPC models/Norn', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6399: {'name': 'Projects/NPC models/Norn', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6400: {'name': 'Projects/NPC models/Norn', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6389: {'name': 'Projects/NPC models/Norn', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6397: {'name': 'Projects/NPC models/Norn', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6411: {'name': 'Glacial Griffon', 'profession': ['Ritualist'], 'attributes': [{'level': '14', 'name': 'Channeling Magic'}, {'level': '16', 'name': 'Communing'}, {'level': '20 Communing in', 'name': 'hard mode'}], 'skills_used': ['Pain', 'Dissonance', 'Bloodsong', 'Shadowsong', 'Ritual Lord'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '83', 'Lightning damage': '83'}, 'items_dropped': []},
-    6418: {'name': 'Nornbear', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Spirit World Retreat', 'Spirit Roar', 'Spirit Senses', 'Shattered Spirit', 'Charging Spirit', 'Unseen Aggression'], 'armor_levels': {'Blunt damage': '111', 'Piercing damage': '111', 'Slashing damage': '111', 'Cold damage': '91', 'Earth damage': '91', 'Fire damage': '91', 'Lightning damage': '91'}, 'items_dropped': []},
-    6432: {'name': 'Inscribed Ettin', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Crushing Blow', 'Inscribed Ettin Aura', 'Enraging Charge', 'Healing Signet', 'Fierce Blow', 'Endure Pain', 'Heavy Blow', 'Devastating Hammer'], 'armor_levels': {}, 'items_dropped': ['Jotun Armguard', 'Jotun Pelt', 'Jotun Plating', 'Jotun Rags']},
-    6445: {'name': 'Nulfastu Earthbound', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Illusion Magic'}], 'skills_used': ["Lyssa's Aura", 'Ether Feast', 'Accumulated Pain', 'Clumsiness', 'Conjure Phantasm', 'Images of Remorse'], 'armor_levels': {}, 'items_dropped': ['Earthbound Staff', 'unique', 'Glacial Stone']},
-    6447: {'name': 'Myish, Lady of the Lake', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ['Mystic Sweep', 'Chilling Victory', 'Rending Sweep', 'Mystic Vigor', 'Onslaught', "Grenth's Fingers"], 'armor_levels': {}, 'items_dropped': ["Myish's Scythe", 'unique', 'Pile of Elemental Dust']},
-    6448: {'name': 'Whiteout', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Water Attunement', 'Frigid Armor', 'Frozen Burst', 'Shatterstone', 'Maelstrom', 'Ice Prison'], 'armor_levels': {}, 'items_dropped': ["Whiteout's Focus", 'unique']},
-    6454: {'name': 'Avarr the Fallen', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Jagged Bones', 'Taste of Death', 'Strip Enchantment', 'Animate Bone Fiend', 'Blood of the Master', 'Dark Bond', "Verata's Aura"], 'armor_levels': {}, 'items_dropped': ["Avarr's Scepter", 'unique']},
-    6473: {'name': 'Modniir Priest', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Healing Touch', "Dwayna's Kiss", 'Vigorous Spirit', 'Trample', "Dwayna's Sorrow", 'Word of Healing', 'Signet of Rejuvenation'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Modniir Armor', 'Modniir Mane', 'Modniir Robe', 'Modniir Tunic']},
-    6475: {'name': 'Modniir Berserker', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ["Protector's Defense", 'Healing Signet', 'Seeking Blade', 'Gash', 'Crippling Slash', 'Savage Slash', 'Trample'], 'armor_levels': {'Blunt damage': '98 to 99', 'Piercing damage': '98 to 99', 'Slashing damage': '98 to 99', 'Cold damage': '78 to 79', 'Earth damage': '78 to 79', 'Fire damage': '78 to 79', 'Lightning damage': '78 to 79'}, 'items_dropped': ['Modniir Armor', 'Modniir Mane', 'Modniir Robe', 'Modniir Tunic']},
-    6476: {'name': 'Modniir Hunter', 'profession': ['Ranger'], 'attributes': [{'level': '13', 'name': 'Beast Mastery'}, {'level': '14', 'name': 'Marksmanship'}], 'skills_used': ['Troll Unguent', 'Trample', 'Symbiosis', 'Needling Shot', 'Barbed Arrows', 'Crippling Shot'], 'armor_levels': {'Blunt damage': '70', 'Piercing damage': '70', 'Slashing damage': '70', 'Cold damage': '100', 'Earth damage': '100', 'Fire damage': '100', 'Lightning damage': '100'}, 'items_dropped': ['Modniir Armor', 'Modniir Mane', 'Modniir Robe', 'Modniir Tunic']},
-    6477: {'name': 'Avalanche', 'profession': ['Elementalist'], 'attributes': [{'level': '16', 'name': 'Energy Storage'}, {'level': '16', 'name': 'Water Magic'}], 'skills_used': ['Water Attunement', 'Frigid Armor', 'Frozen Burst', 'Shatterstone', 'Maelstrom', 'Ice Prison'], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '140', 'Slashing damage': '140', 'Cold damage': '140', 'Earth damage': '100', 'Fire damage': '76', 'Lightning damage': '100'}, 'items_dropped': ['Pile of Elemental Dust']},
-    6478: {'name': 'Frozen Elemental', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Energy Storage'}, {'level': '15', 'name': 'Water Magic'}], 'skills_used': ['Glyph of Lesser Energy', 'Water Attunement', 'Blurred Vision', 'Ice Spikes', 'Water Trident', 'Deep Freeze'], 'armor_levels': {'Blunt damage': '72', 'Piercing damage': '72', 'Slashing damage': '72', 'Cold damage': '112', 'Earth damage': '72', 'Fire damage': '48', 'Lightning damage': '72'}, 'items_dropped': ['Pile of Elemental Dust']},
-    6479: {'name': 'Chilling Wisp', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ['Mystic Sweep', 'Chilling Victory', 'Mystic Vigor', 'Onslaught', "Grenth's Fingers"], 'armor_levels': {'Blunt damage': '82', 'Piercing damage': '82', 'Slashing damage': '82', 'Cold damage': '122', 'Earth damage': '82', 'Fire damage': '58', 'Lightning damage': '82'}, 'items_dropped': ['Pile of Elemental Dust']},
-    6480: {'name': 'Jotun Skullsmasher', 'profession': ['Warrior'], 'attributes': [{'level': 'Level 28:16', 'name': 'Hammer Mastery'}, {'level': '15 or 16', 'name': 'Strength'}, {'level': '20 Strength in', 'name': 'hard mode'}], 'skills_used': ['Skull Crack', 'Stun Immunity', 'Berserker Stance', 'Irresistible Blow', 'Giant Stomp', 'Yeti Smash', "Lion's Comfort"], 'armor_levels': {'Blunt damage': '133', 'Piercing damage': '133', 'Slashing damage': '133', 'Cold damage': '103', 'Earth damage': '103', 'Fire damage': '103', 'Lightning damage': '103'}, 'items_dropped': ['Jotun Armguard', 'Jotun Plating', 'Jotun Pelt', 'Jotun Rags']},
-    6481: {'name': 'Jotun Mindbreaker', 'profession': ['Mesmer'], 'attributes': [{'level': 'Level 28:16', 'name': 'Domination Magic'}, {'level': '12', 'name': 'Inspiration Magic'}, {'level': '16 Inspiration Magic in', 'name': 'hard mode'}], 'skills_used': ['Backfire', 'Spirit of Failure', 'Shame', 'Guilt', 'Hex Eater Signet', 'Stun Immunity', 'Power Drain', 'Visions of Regret'], 'armor_levels': {'Blunt damage': '94', 'Piercing damage': '94', 'Slashing damage': '94', 'Cold damage': '94', 'Earth damage': '94', 'Fire damage': '94', 'Lightning damage': '94'}, 'items_dropped': ['Jotun Pelt', 'Jotun Plating']},
-    6482: {'name': 'Jotun Bladeturner', 'profession': ['Mesmer'], 'attributes': [{'level': '16', 'name': 'Illusion Magic'}], 'skills_used': ['Arcane Conundrum', 'Hex Eater Signet', 'Stun Immunity', 'Clumsiness', 'Ineptitude', 'Frustration', 'Channeling'], 'armor_levels': {'Blunt damage': '94', 'Piercing damage': '94', 'Slashing damage': '94', 'Cold damage': '94', 'Earth damage': '94', 'Fire damage': '94', 'Lightning damage': '94'}, 'items_dropped': ['Jotun Armguard', 'Jotun Pelt', 'Jotun Plating']},
-    6483: {'name': 'Jotun Bloodcurdler', 'profession': ['Necromancer'], 'attributes': [{'level': 'Level 28:16', 'name': 'Blood Magic'}], 'skills_used': ['Unholy Feast', 'Oppressive Gaze', 'Stun Immunity', 'Well of Blood', 'Vampiric Spirit', 'Blood of the Aggressor', 'Enfeebling Blood'], 'armor_levels': {'Blunt damage': '94', 'Piercing damage': '94', 'Slashing damage': '94', 'Cold damage': '94', 'Earth damage': '94', 'Fire damage': '94', 'Lightning damage': '94'}, 'items_dropped': ['Jotun Armguard', 'Jotun Pelt', 'Jotun Plating', 'Jotun Rags']},
-    6484: {'name': 'Berserking Wendigo', 'profession': ['Assassin'], 'attributes': [{'level': '13', 'name': 'Deadly Arts'}, {'level': '20 Deadly Arts in', 'name': 'Hard mode'}], 'skills_used': ['Shadow Refuge', 'Golden Phoenix Strike', 'Berserk', 'Blinding Powder', 'Critical Strike', 'Shroud of Distress', 'Shattering Assault', 'Augury of Death'], 'armor_levels': {'Blunt damage': '86', 'Piercing damage': '86', 'Slashing damage': '86', 'Cold damage': '86', 'Earth damage': '86', 'Fire damage': '86', 'Lightning damage': '86'}, 'items_dropped': ['Berserker Horn']},
-    6485: {'name': 'Berserking Aurochs', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Contemplation of Purity', 'Divine Healing', 'Vigorous Spirit', 'Berserk', 'Healing Hands', 'Deny Hexes', 'Healing Whisper', 'Healing Seed'], 'armor_levels': {'Blunt damage': '76', 'Piercing damage': '76', 'Slashing damage': '76', 'Cold damage': '76', 'Earth damage': '76', 'Fire damage': '76', 'Lightning damage': '76'}, 'items_dropped': ['Berserker Horn']},
-    6486: {'name': 'Berserking Minotaur', 'profession': ['Warrior'], 'attributes': [{'level': '15', 'name': 'Strength'}], 'skills_used': ['Auspicious Blow', 'Berserk', 'Fierce Blow', 'Endure Pain', "Bull's Strike", 'Enraged Smash', 'Staggering Blow', 'Flail'], 'armor_levels': {'Blunt damage': '116', 'Piercing damage': '116', 'Slashing damage': '116', 'Cold damage': '96', 'Earth damage': '96', 'Fire damage': '96', 'Lightning damage': '96'}, 'items_dropped': ['Berserker Horn']},
-    6487: {'name': 'Berserking Bison', 'profession': ['Dervish'], 'attributes': [{'level': '11', 'name': 'Mysticism'}, {'level': '13..14', 'name': 'Wind Prayers'}, {'level': '19..20 Wind Prayers in', 'name': 'Hard Mode'}], 'skills_used': ["Harrier's Haste", 'Intimidating Aura', 'Berserk', 'Victorious Sweep', "Reaper's Sweep", 'Zealous Renewal', 'Mystic Vigor', "Harrier's Grasp"], 'armor_levels': {'Blunt damage': '86', 'Piercing damage': '86', 'Slashing damage': '86', 'Cold damage': '86', 'Earth damage': '86', 'Fire damage': '86', 'Lightning damage': '86'}, 'items_dropped': ['Berserker Horn']},
-    6488: {'name': 'Mountain Pinesoul', 'profession': ['Ranger'], 'attributes': [{'level': '16', 'name': 'Wilderness Survival'}, {'level': '20 Wilderness Survival in', 'name': 'Hard Mode'}], 'skills_used': ['Quicksand', 'Power Shot', 'Barbed Trap', 'Determined Shot', 'Pin Down'], 'armor_levels': {'Blunt damage': '94', 'Piercing damage': '94', 'Slashing damage': '94', 'Cold damage': '124', 'Earth damage': '124', 'Fire damage': '124', 'Lightning damage': '124'}, 'items_dropped': ['Mountain Root', 'Oaken Recurve Bow']},
-    6489: {'name': 'Mountain Aloe', 'profession': ['Monk'], 'attributes': [{'level': '15', 'name': 'Smiting Prayers'}], 'skills_used': ['Retribution', 'Holy Wrath', 'Signet of Judgment', 'Reversal of Damage', 'Signet of Devotion', 'Bane Signet'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Mountain Root']},
-    6490: {'name': 'Spectral Vaettir', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Illusion Magic'}, {'level': '14-16', 'name': 'Inspiration Magic'}, {'level': '12-13 Inspiration Magic in', 'name': 'hard mode'}], 'skills_used': ["Lyssa's Aura", 'Ether Feast', 'Phantom Pain', 'Mind Wrack', 'Clumsiness', 'Conjure Phantasm'], 'armor_levels': {'Blunt damage': '160', 'Piercing damage': '160', 'Slashing damage': '160', 'Cold damage': '160', 'Earth damage': '160', 'Fire damage': '160', 'Lightning damage': '160'}, 'items_dropped': ['Glacial Stone']},
-    6491: {'name': 'Frost Wurm', 'profession': ['Warrior', 'Necromancer'], 'attributes': [{'level': '14', 'name': 'Curses'}], 'skills_used': ['Suffering', 'Stun on Critical Hit', 'Natural Resistance', 'Wurm Bile', 'Feast of Corruption'], 'armor_levels': {'Blunt damage': '120', 'Piercing damage': '120', 'Slashing damage': '120', 'Cold damage': '120', 'Earth damage': '120', 'Fire damage': '120', 'Lightning damage': '120'}, 'items_dropped': ['Frozen Shell', 'Frozen Wurm Husk']},
-    6624: {'name': 'Charr Prophet', 'profession': ['Monk', 'Mesmer'], 'attributes': [], 'skills_used': ["Dwayna's Kiss", 'Vigorous Spirit', 'Healing Light', 'Power Drain', 'Gloat', 'Healing Breeze', 'Signet of Rejuvenation'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Charr Armor', 'Charr Garment', 'Superb Charr Carving']},
-    6690: {'name': 'Fronis Irontoe', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Power Attack', 'Counterattack', "Protector's Strike", 'Cleave'], 'armor_levels': {}, 'items_dropped': ['Dwarven Armor', 'Summit Axe', 'Stone Summit Emblem']},
-    6695: {'name': 'Stone Summit Ranger', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Precision Shot', 'Savage Shot', 'Ferocious Strike', 'Charm Animal', "Tiger's Fury", 'Broad Head Arrow', "Melandru's Assault", "Melandru's Arrows", 'Penetrating Attack', 'Antidote Signet', 'Point Blank Shot', "Hunter's Shot", "Marauder's Shot"], 'armor_levels': {'Blunt damage': '70', 'Piercing damage': '70', 'Slashing damage': '70', 'Cold damage': '100', 'Earth damage': '100', 'Fire damage': '100', 'Lightning damage': '100'}, 'items_dropped': ['Dwarven Scout Armor', 'Stone Summit Armor', 'Eye of the North', 'Stone Summit Badge', 'Prophecies', 'Stone Summit Emblem', 'Stone Summit Spaulder', 'Stone Summit Robe', 'Summit Axe', 'Summit Hammer', 'Summit Warlord Shield']},
-    6699: {'name': 'Stone Summit Healer', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Orison of Healing', 'Contemplation of Purity', "Healer's Boon", 'Restful Breeze', 'Healing Whisper', 'Words of Comfort'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Dwarven Healer Outfit', 'Stone Summit Spaulder']},
-    6702: {'name': 'Stone Summit Crusher', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ["Griffon's Sweep", 'Power Attack', 'Enraging Charge', 'Forceful Blow', 'Healing Signet', 'Endure Pain', 'Staggering Blow', "Protector's Strike", 'Dwarven Battle Stance', 'Counterattack', '"For Great Justice!"'], 'armor_levels': {'Blunt damage': '99', 'Piercing damage': '99', 'Slashing damage': '99', 'Cold damage': '79', 'Earth damage': '79', 'Fire damage': '79', 'Lightning damage': '79'}, 'items_dropped': ['Dwarven Armor', 'Stone Summit Badge', 'Stone Summit Emblem', 'Summit Axe', 'Summit Hammer']},
-    6993: {'name': 'Stone Summit Crusher', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ["Griffon's Sweep", 'Power Attack', 'Enraging Charge', 'Forceful Blow', 'Healing Signet', 'Endure Pain', 'Staggering Blow', "Protector's Strike", 'Dwarven Battle Stance', 'Counterattack', '"For Great Justice!"'], 'armor_levels': {'Blunt damage': '99', 'Piercing damage': '99', 'Slashing damage': '99', 'Cold damage': '79', 'Earth damage': '79', 'Fire damage': '79', 'Lightning damage': '79'}, 'items_dropped': ['Dwarven Armor', 'Stone Summit Badge', 'Stone Summit Emblem', 'Summit Axe', 'Summit Hammer']},
-    2645: {'name': 'Stone Summit Crusher', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ["Griffon's Sweep", 'Power Attack', 'Enraging Charge', 'Forceful Blow', 'Healing Signet', 'Endure Pain', 'Staggering Blow', "Protector's Strike", 'Dwarven Battle Stance', 'Counterattack', '"For Great Justice!"'], 'armor_levels': {'Blunt damage': '99', 'Piercing damage': '99', 'Slashing damage': '99', 'Cold damage': '79', 'Earth damage': '79', 'Fire damage': '79', 'Lightning damage': '79'}, 'items_dropped': ['Dwarven Armor', 'Stone Summit Badge', 'Stone Summit Emblem', 'Summit Axe', 'Summit Hammer']},
-    6712: {'name': 'Projects/NPC models/Asura', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6718: {'name': 'Lork', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6721: {'name': 'Gadd', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Lightning Orb', 'Glyph of Energy', 'Glyph of Lesser Energy', 'Air Attunement', 'Lightning Hammer', 'Decipher Inscriptions'], 'armor_levels': {}, 'items_dropped': []},
-    6756: {'name': 'Purifier Krewe Member', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6757: {'name': 'Blorf', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6771: {'name': 'Projects/NPC models/Asura', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6774: {'name': 'Projects/NPC models/Asura', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6775: {'name': 'Asura', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6777: {'name': 'Projects/NPC models/Asura', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6782: {'name': 'Fonk', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6815: {'name': 'Enchanted Scythe', 'profession': ['Dervish'], 'attributes': [{'level': '0', 'name': 'Mysticism'}], 'skills_used': ['Banishing Strike', 'Wounding Strike', 'Enchanted Haste'], 'armor_levels': {'Blunt damage': '120', 'Piercing damage': '120', 'Slashing damage': '120', 'Cold damage': '120', 'Earth damage': '120', 'Fire damage': '120', 'Lightning damage': '120'}, 'items_dropped': []},
-    6816: {'name': 'Enchanted Shield', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Defensive Stance', "Protector's Defense", 'Deflect Arrows'], 'armor_levels': {'Blunt damage': '136', 'Piercing damage': '136', 'Slashing damage': '136', 'Cold damage': '136', 'Earth damage': '136', 'Fire damage': '136', 'Lightning damage': '136'}, 'items_dropped': []},
-    6837: {'name': 'Projects/NPC models/Dredge', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6845: {'name': 'Bloodthirst Incubus', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Blood Magic'}], 'skills_used': ['Vampiric Touch', 'Vampiric Gaze', 'Vampiric Bite', 'Soulrending Shriek', 'Ravenous Gaze', 'Blood Drinker', 'Vampiric Swarm'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Incubus Wing']},
-    6849: {'name': 'Cryptwing Incubus', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Burst of Aggression', 'Magehunter Strike', 'Enraging Charge', 'Soulrending Shriek', 'Sever Artery', 'Savage Slash', 'Gash'], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '100', 'Slashing damage': '100', 'Cold damage': '80', 'Earth damage': '80', 'Fire damage': '80', 'Lightning damage': '80'}, 'items_dropped': ['Incubus Wing']},
-    6851: {'name': 'Stormcloud Incubus', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Air Magic'}], 'skills_used': ['Glyph of Lesser Energy', 'Whirlwind', 'Mind Shock', 'Blinding Flash', 'Soulrending Shriek', 'Shock', 'Lightning Touch'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Incubus Wing']},
-    6853: {'name': 'Skelk Slasher', 'profession': ['Assassin'], 'attributes': [], 'skills_used': ['Shadow Refuge', 'Wild Strike', "Viper's Defense", "Locust's Fury", 'Unsuspecting Strike', 'Twisting Fangs'], 'armor_levels': {'Blunt damage': '102', 'Piercing damage': '102', 'Slashing damage': '102', 'Cold damage': '82', 'Earth damage': '82', 'Fire damage': '82', 'Lightning damage': '82'}, 'items_dropped': ['Skelk Fang']},
-    6854: {'name': 'Skelk Corrupter', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Curses'}], 'skills_used': ['Suffering', 'Tainted Flesh', 'Chilblains', 'Soul Feast', 'Enfeebling Blood', "Verata's Aura"], 'armor_levels': {'Blunt damage': '91', 'Piercing damage': '91', 'Slashing damage': '91', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Skelk Fang']},
-    6855: {'name': 'Skelk Rampager', 'profession': ['Warrior'], 'attributes': [{'level': '15', 'name': 'Strength'}], 'skills_used': ["Bull's Strike", 'Power Attack', 'Flail', "Bull's Charge"], 'armor_levels': {'Blunt damage': '131', 'Piercing damage': '131', 'Slashing damage': '131', 'Cold damage': '91', 'Earth damage': '91', 'Fire damage': '91', 'Lightning damage': '91'}, 'items_dropped': ['Skelk Fang']},
-    6862: {'name': 'Enchanted Axe', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Dismember', 'Axe Twist', 'Cyclone Axe', 'Axe Rake'], 'armor_levels': {'Blunt damage': '120', 'Piercing damage': '120', 'Slashing damage': '120', 'Cold damage': '120', 'Earth damage': '120', 'Fire damage': '120', 'Lightning damage': '120'}, 'items_dropped': []},
-    6888: {'name': 'Shimmering Ooze', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Domination Magic'}], 'skills_used': ['Auspicious Incantation', 'Energy Surge', 'Spiritual Pain', 'Ooze Division', 'Power Spike', 'Channeling', 'Energy Burn', 'Ooze Combination'], 'armor_levels': {'Blunt damage': '80', 'Piercing damage': '80', 'Slashing damage': '80', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Blob of Ooze']},
-    6889: {'name': 'Shimmering Ooze', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Domination Magic'}], 'skills_used': ['Auspicious Incantation', 'Energy Surge', 'Spiritual Pain', 'Ooze Division', 'Power Spike', 'Channeling', 'Energy Burn', 'Ooze Combination'], 'armor_levels': {'Blunt damage': '80', 'Piercing damage': '80', 'Slashing damage': '80', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Blob of Ooze']},
-    6890: {'name': 'Shimmering Ooze', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Domination Magic'}], 'skills_used': ['Auspicious Incantation', 'Energy Surge', 'Spiritual Pain', 'Ooze Division', 'Power Spike', 'Channeling', 'Energy Burn', 'Ooze Combination'], 'armor_levels': {'Blunt damage': '80', 'Piercing damage': '80', 'Slashing damage': '80', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Blob of Ooze']},
-    6891: {'name': 'Ominous Ooze', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Death Magic'}, {'level': '15', 'name': 'Soul Reaping'}, {'level': '20 Soul Reaping in', 'name': 'Hard mode'}], 'skills_used': ['Signet of Sorrow', 'Wail of Doom', 'Vile Touch', 'Ooze Division', 'Consume Corpse', 'Putrid Explosion', "Verata's Aura", 'Ooze Combination'], 'armor_levels': {'Blunt damage': '80', 'Piercing damage': '80', 'Slashing damage': '80', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': []},
-    6894: {'name': 'Earthbound Ooze', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Earth Magic'}], 'skills_used': ['Earth Attunement', 'Grasping Earth', 'Crystal Wave', 'Earthquake', 'Ooze Division', 'Aftershock', 'Shockwave', 'Ooze Combination'], 'armor_levels': {'Blunt damage': '80', 'Piercing damage': '80', 'Slashing damage': '80', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Blob of Ooze']},
-    6896: {'name': 'Earthbound Ooze', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Earth Magic'}], 'skills_used': ['Earth Attunement', 'Grasping Earth', 'Crystal Wave', 'Earthquake', 'Ooze Division', 'Aftershock', 'Shockwave', 'Ooze Combination'], 'armor_levels': {'Blunt damage': '80', 'Piercing damage': '80', 'Slashing damage': '80', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Blob of Ooze']},
-    6905: {'name': 'Corrupted Aloe', 'profession': ['Ritualist'], 'attributes': [{'level': '15', 'name': 'Channeling Magic'}], 'skills_used': ['Clamor of Souls', 'Spirit Burn', 'Essence Strike', 'Gaze of Fury', 'Spirit Boon Strike', 'Destruction'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Fungal Root']},
-    6906: {'name': 'Fungal Bloom', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['Finale of Restoration', 'Ballad of Restoration', 'Dormant Husk', 'Song of Restoration', 'Song of Concentration', 'Aria of Zeal', 'Mending Refrain'], 'armor_levels': {'Blunt damage': '116', 'Piercing damage': '116', 'Slashing damage': '116', 'Cold damage': '95', 'Earth damage': '95', 'Fire damage': '95', 'Lightning damage': '95'}, 'items_dropped': ['Fungal Root']},
-    6909: {'name': 'Inscribed Guardian', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Suffering', 'Shadow of Fear', 'Desecrate Enchantments', 'Defile Enchantments', 'Ulcerous Lungs', 'Feast of Corruption'], 'armor_levels': {}, 'items_dropped': []},
-    6933: {'name': 'Fragment of Antiquities', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Water Magic'}], 'skills_used': ['Aura of Restoration', 'Water Attunement', 'Frozen Burst', 'Shatterstone', 'Ice Spikes', 'Deep Freeze'], 'armor_levels': {}, 'items_dropped': ['Glacial Stone']},
-    6934: {'name': 'Remnant of Antiquities', 'profession': ['Elementalist'], 'attributes': [{'level': '16', 'name': 'Water Magic'}], 'skills_used': ['Water Attunement', 'Frozen Burst', 'Shatterstone', 'Ice Spikes', 'Deep Freeze', 'Diamondshard Mist'], 'armor_levels': {}, 'items_dropped': []},
-    6935: {'name': 'Regent of Ice', 'profession': ['Elementalist'], 'attributes': [{'level': '16', 'name': 'Water Magic'}], 'skills_used': ['Ice Spear', 'Water Attunement', 'Shatterstone', 'Armor of Mist', 'Deep Freeze'], 'armor_levels': {}, 'items_dropped': ['Pile of Elemental Dust']},
-    6938: {'name': 'Chromatic Drake', 'profession': ['Elementalist'], 'attributes': [{'level': 'When attuned to', 'name': 'Air Magic'}], 'skills_used': ['Chilling Winds', 'Stoneflesh Aura', 'Frigid Armor', 'Obsidian Flesh', 'Steam', 'Elemental Shift', 'Obsidian Flame', 'Shard Storm', 'Lightning Strike', 'Liquid Flame', 'Fire Storm', 'Glowing Gaze', 'Ward Against Melee', 'Incendiary Bonds', 'Mind Freeze', 'Mind Shock', 'Blurred Vision', 'Lightning Touch', 'Freezing Gust', 'Lightning Orb', 'Sliver Armor', 'Elemental Flame', 'Crystal Wave', 'Mind Burn', 'Arc Lightning'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '101', 'Earth damage': '101', 'Fire damage': '101', 'Lightning damage': '101'}, 'items_dropped': ['Chromatic Scale', 'Scale']},
-    6942: {'name': 'Terrorbond Dryder', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Curses'}], 'skills_used': ["Dryder's Feast", 'Suffering', 'Faintheartedness', 'Defile Flesh', 'Corrupt Enchantment', 'Parasitic Bond', 'Soul Barbs'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Dryder Web']},
-    6943: {'name': 'Dreadgaze Dryder', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Curses'}], 'skills_used': ["Dryder's Feast", 'Reckless Haste', 'Vocal Minority', 'Price of Failure', 'Malaise', 'Soul Barbs', 'Feast of Corruption'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Dryder Web']},
-    6944: {'name': 'Bloodtaint Dryder', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Blood Magic'}], 'skills_used': ['Life Transfer', "Dryder's Feast", 'Blood Renewal', 'Strip Enchantment', 'Life Siphon', 'Blood Bond', 'Vampiric Swarm'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Dryder Web']},
-    6945: {'name': 'Soulfire Dryder', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Blood Magic'}, {'level': '11..13', 'name': 'Death Magic'}], 'skills_used': ["Dryder's Feast", 'Blood Renewal', 'Soul Leech', 'Rising Bile', 'Life Siphon', 'Well of Blood', 'Malign Intervention'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Dryder Web']},
-    6948: {'name': 'Shattered Elemental', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Water Magic'}], 'skills_used': ['Ice Spear', 'Glyph of Lesser Energy', 'Water Attunement', 'Shatterstone', 'Armor of Mist', 'Deep Freeze'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '100', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Pile of Elemental Dust']},
-    6949: {'name': 'Whirling Wisp', 'profession': ['Dervish'], 'attributes': [{'level': '15', 'name': 'Scythe Mastery'}], 'skills_used': ['Chilling Victory', 'Banishing Strike', 'Vow of Silence', "Lyssa's Assault", 'Heart of Fury', 'Victorious Sweep'], 'armor_levels': {'Blunt damage': '70', 'Piercing damage': '70', 'Slashing damage': '70', 'Cold damage': '110', 'Earth damage': '70', 'Fire damage': '70', 'Lightning damage': '70'}, 'items_dropped': ['Pile of Elemental Dust']},
-    6950: {'name': 'Icy Stalagmite', 'profession': ['Ranger'], 'attributes': [{'level': '15', 'name': 'Expertise'}, {'level': '15', 'name': 'Wilderness Survival'}], 'skills_used': ['Equinox', 'Quickening Zephyr', 'Frozen Soil', 'Winter', 'Whirling Defense'], 'armor_levels': {'Blunt damage': '70', 'Piercing damage': '70', 'Slashing damage': '70', 'Cold damage': '140', 'Earth damage': '100', 'Fire damage': '100', 'Lightning damage': '100'}, 'items_dropped': ['Pile of Elemental Dust']},
-    6953: {'name': 'Shadow Vaettir', 'profession': ['Necromancer'], 'attributes': [{'level': '', 'name': 'normal mode'}, {'level': '', 'name': 'hard mode'}, {'level': '20', 'name': 'Death Magic'}], 'skills_used': ['Unholy Feast', 'Vampiric Gaze', "Cultist's Fervor", 'Mark of Subversion', 'Dark Aura'], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '100', 'Slashing damage': '100', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Vaettir Essence']},
-    6956: {'name': 'Scourge Vaettir', 'profession': ['Monk'], 'attributes': [{'level': '(20', 'name': 'Smiting Prayers'}], 'skills_used': ['Spear of Light', 'Signet of Judgment', 'Smite Hex', 'Holy Strike', 'Reversal of Damage', 'Scourge Healing'], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '100', 'Slashing damage': '100', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Vaettir Essence']},
-    6959: {'name': 'Mist Vaettir', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Illusion Magic'}], 'skills_used': ['Ether Feast', 'Illusionary Weaponry', 'Elemental Resistance', 'Sympathetic Visage', 'Mantra of Concentration', 'Channeling'], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '100', 'Slashing damage': '100', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Vaettir Essence']},
-    7009: {'name': 'Cursed Brigand', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Aura of Restoration', 'Enervating Charge', 'Air Attunement', 'Shock', 'Aftershock', 'Blinding Surge'], 'armor_levels': {}, 'items_dropped': []},
-    7012: {'name': 'Damned Crewman', 'profession': ['Ritualist'], 'attributes': [{'level': '15', 'name': 'Communing'}, {'level': '20 Communing in', 'name': 'Hard Mode'}], 'skills_used': ['Gaze from Beyond', 'Pain', 'Clamor of Souls', 'Destruction', 'Anguish'], 'armor_levels': {}, 'items_dropped': []},
-    7013: {'name': 'Fendi Nin', 'profession': ['Necromancer'], 'attributes': [{'level': '16', 'name': 'Curses'}], 'skills_used': ['Suffering', 'Chilblains', 'Desecrate Enchantments', 'Ulcerous Lungs', 'Insidious Parasite', 'Feast of Corruption'], 'armor_levels': {}, 'items_dropped': []},
-    7014: {'name': 'Soul of Fendi Nin', 'profession': ['Necromancer'], 'attributes': [{'level': '16', 'name': 'Curses'}], 'skills_used': ['Chilblains', 'Ulcerous Lungs', 'Toxic Chill', 'Suffering'], 'armor_levels': {}, 'items_dropped': []},
-    7020: {'name': 'Projects/NPC models/Ghosts', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    7028: {'name': 'Crypt Wraith', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Domination Magic'}], 'skills_used': ['Mind Wrack', 'Cry of Frustration', 'Power Flux', 'Power Drain', 'Power Spike', "Wastrel's Worry", 'Power Leak'], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '100', 'Slashing damage': '100', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Bone', 'Dead Bow', 'Pile of Glittering Dust']},
-    7032: {'name': 'Shock Phantom', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Shell Shock', 'Invoke Lightning', 'Enervating Charge', 'Chain Lightning', 'Air Attunement', 'Blinding Flash', 'Lightning Bolt'], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '100', 'Slashing damage': '100', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Dead Bow', 'Decayed Garment', 'Sephis Axe']},
-    7036: {'name': 'Skeleton Illusionist', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Domination Magic'}, {'level': '11..13', 'name': 'Fast Casting'}, {'level': '15', 'name': 'Illusion Magic'}], 'skills_used': ['Fragility', 'Phantom Pain', 'Epidemic', 'Hex Eater Vortex', 'Shatter Delusions', 'Power Return', 'Frustration'], 'armor_levels': {'Blunt damage': '40', 'Piercing damage': '80', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Sephis Axe']},
-    7037: {'name': 'Skeleton Wizard', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Air Magic'}, {'level': '15', 'name': 'Earth Magic'}], 'skills_used': ['Eruption', 'Aura of Restoration', 'Enervating Charge', 'Air Attunement', 'Shock', 'Aftershock', 'Blinding Surge'], 'armor_levels': {'Blunt damage': '40', 'Piercing damage': '80', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Bone', 'Undead Bone']},
-    7038: {'name': 'Skeletal Hound', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Skull Crack', 'Enraging Charge', 'Endure Pain', 'Sever Artery', 'Gash', 'Hamstring'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '120', 'Slashing damage': '100', 'Cold damage': '80', 'Earth damage': '80', 'Fire damage': '80', 'Lightning damage': '80'}, 'items_dropped': ['Pile of Glittering Dust', 'Sephis Axe', 'Undead Bone']},
-    7040: {'name': 'Skeleton Priest', 'profession': ['Monk'], 'attributes': [{'level': '11', 'name': 'Smiting Prayers'}], 'skills_used': ['Scourge Sacrifice', "Smiter's Boon", 'Shield of Deflection', 'Reversal of Fortune', 'Shield of Absorption', 'Smite Hex', 'Bane Signet'], 'armor_levels': {'Blunt damage': '40', 'Piercing damage': '80', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Dead Bow', 'Pile of Glittering Dust', 'Undead Bone']},
-    7041: {'name': 'Skeleton Archer', 'profession': ['Ranger'], 'attributes': [{'level': '15', 'name': 'Marksmanship'}], 'skills_used': ['Disrupting Shot', 'Screaming Shot', 'Throw Dirt', 'Debilitating Shot', 'Barbed Arrows', 'Poison Arrow'], 'armor_levels': {}, 'items_dropped': ['Decayed Orr Armor', 'Undead Bone']},
-    7042: {'name': 'Decayed Dragon', 'profession': ['Necromancer'], 'attributes': [{'level': 'Level 28 version: 16', 'name': 'Death Magic'}], 'skills_used': ['Wail of Doom', 'Vile Miasma', 'Deafening Roar', 'Chilblains', 'Putrid Explosion', 'Deathly Swarm'], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '100', 'Slashing damage': '100', 'Cold damage': '101', 'Earth damage': '101', 'Fire damage': '101', 'Lightning damage': '101'}, 'items_dropped': ['Undead Bone']},
-    7043: {'name': 'Zombie Brute', 'profession': ['Warrior'], 'attributes': [{'level': '14..16', 'name': 'Strength'}], 'skills_used': ['Forceful Blow', 'Berserker Stance', 'Staggering Blow', 'Heavy Blow', 'Overbearing Smash'], 'armor_levels': {'Blunt damage': '111', 'Piercing damage': '111', 'Slashing damage': '111', 'Cold damage': '91', 'Earth damage': '91', 'Fire damage': '91', 'Lightning damage': '91'}, 'items_dropped': ["Executioner's Breastplate", 'Undead Bone']},
-    7044: {'name': 'Zombie Necromancer', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Death Magic'}, {'level': '15', 'name': 'Soul Reaping'}], 'skills_used': ['Vile Miasma', 'Withering Aura', 'Virulence', 'Putrid Explosion', 'Signet of Lost Souls', 'Death Nova'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Dead Bow', 'Dead Staff', 'Necrid Robes', 'Undead Bone']},
-    7046: {'name': 'Chained Cleric', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Smite Condition', 'Smite Hex', 'Reversal of Damage', 'Zealous Benediction', 'Reversal of Fortune', 'Protective Spirit'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Bone']},
-    7374: {'name': 'Wintersday Moa', 'profession': ['Ranger'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    7376: {'name': 'Blessed Snowman', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ['Avatar of Dwayna (snow fighting skill)', 'Snowball', 'Mega Snowball'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': []},
-    7379: {'name': 'Cordial Snowman', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Ice Breaker', 'Snowball', 'Mega Snowball'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': []},
-    7386: {'name': 'Pious Snowman', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Snowball', '"Mmmm. Snowcone!"', 'Mega Snowball'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': []},
-    7411: {'name': 'Angry Snowman', 'profession': ['Elementalist'], 'attributes': [{'level': '18', 'name': 'Water Magic'}], 'skills_used': ['Frozen Burst', 'Ward Against Harm', 'Ice Fort', 'Ice Spikes', 'Ice Prison'], 'armor_levels': {}, 'items_dropped': ['Dungeon Key']},
-    7435: {'name': 'Jack Frost', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    7604: {'name': 'Valgar Tempestcrafter', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    7659: {'name': 'Nicholas Sandford', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    7660: {'name': 'Professor Yakkington', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    7670: {'name': 'Sadie Salvitas', 'profession': ['Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    7748: {'name': 'Zenjal', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    7757: {'name': 'Lieutenant Langmar', 'profession': ['Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    7795: {'name': 'Blazefiend Griefblade', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Sever Artery', 'Healing Signet', 'Gash', 'Frenzy'], 'armor_levels': {}, 'items_dropped': []},
-    7801: {'name': 'Charr Stalker', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Ignite Arrows', 'Penetrating Attack', 'Dual Shot'], 'armor_levels': {'Blunt damage': '32', 'Piercing damage': '32', 'Slashing damage': '32', 'Cold damage': '32', 'Earth damage': '32', 'Fire damage': '32', 'Lightning damage': '32'}, 'items_dropped': ['Charr Carvings', 'Charr Hides', 'Stalker Armor']},
-    7803: {'name': 'Charr Fire Caller', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Fire Storm', 'Flare', 'Aura of Restoration', 'Lava Font', 'Conjure Flame', 'Meteor Shower'], 'armor_levels': {'Blunt damage': '20', 'Piercing damage': '20', 'Slashing damage': '20', 'Cold damage': '20', 'Earth damage': '20', 'Fire damage': '20', 'Lightning damage': '20'}, 'items_dropped': ['Charr Carving', 'Charr Hide', 'Fiery Unguent', "Shalev's Task", 'Flame Wielder Trappings']},
-    1643: {'name': 'Charr Fire Caller', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Fire Storm', 'Flare', 'Aura of Restoration', 'Lava Font', 'Conjure Flame', 'Meteor Shower'], 'armor_levels': {'Blunt damage': '20', 'Piercing damage': '20', 'Slashing damage': '20', 'Cold damage': '20', 'Earth damage': '20', 'Fire damage': '20', 'Lightning damage': '20'}, 'items_dropped': ['Charr Carving', 'Charr Hide', 'Fiery Unguent', "Shalev's Task", 'Flame Wielder Trappings']},
-    7974: {'name': 'Foreman the Crier', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    7987: {'name': 'Salma', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Healing Touch', 'Heal Other', 'Orison of Healing', 'Smite', 'Word of Healing', 'Bane Signet', 'Healing Breeze', 'Signet of Rejuvenation'], 'armor_levels': {}, 'items_dropped': []},
-    8054: {'name': 'Scout Melthoran', 'profession': ['Ranger', 'Paragon'], 'attributes': [{'level': '13', 'name': 'Command'}], 'skills_used': ['Troll Unguent', 'Dual Shot', "Expert's Dexterity", 'Kindle Arrows', 'Forked Arrow', 'Antidote Signet', 'Anthem of Weariness', '"Go for the Eyes!"'], 'armor_levels': {}, 'items_dropped': []},
-    8058: {'name': 'Shining Blade Recruit', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    8059: {'name': 'Shining Blade Recruit', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    8103: {'name': 'Charming Peacekeeper', 'profession': ['Mesmer', 'Necromancer', 'Elementalist', 'Monk', 'Ritualist'], 'attributes': [{'level': '14', 'name': 'Domination Magic'}, {'level': '10-11', 'name': 'Inspiration Magic'}, {'level': '20 Domination Magic in', 'name': 'Hard mode'}], 'skills_used': ['Shame', 'Glyph of Immolation', 'Spiritual Pain', 'Castigation Signet', 'Shatter Enchantment', 'Backfire', 'Mantra of Inscriptions', 'Shadow of Fear', 'Power Spike', 'Conjure Phantasm', 'Waste Not, Want Not', 'Shatter Hex', 'Power Leak', 'Phantom Pain', 'Ether Feast', 'Power Leech', 'Shared Burden', 'Guilt', 'Energy Surge', 'Signet of Disruption', 'Light of Dwayna', 'Gaze of Fury', 'Signet of Rage', 'Signet of Humility', 'Drain Enchantment', 'Shrinking Armor', 'Fragility', 'Arcane Conundrum', 'Keystone Signet', 'Drain Delusions', 'Cry of Frustration', 'Spirit Rift', 'Vengeance', 'Empathy', 'Energy Drain', 'Leech Signet', 'Overload'], 'armor_levels': {'Blunt damage': '60 (60)', 'Piercing damage': '60 (60)', 'Slashing damage': '60 (60)', 'Cold damage': '60 (60)', 'Earth damage': '60 (60)', 'Fire damage': '60 (60)', 'Lightning damage': '60 (60)'}, 'items_dropped': ["Confessor's Orders", 'The Rapture', 'unique']},
-    8105: {'name': 'Charming Peacekeeper', 'profession': ['Mesmer', 'Necromancer', 'Elementalist', 'Monk', 'Ritualist'], 'attributes': [{'level': '14', 'name': 'Domination Magic'}, {'level': '10-11', 'name': 'Inspiration Magic'}, {'level': '20 Domination Magic in', 'name': 'Hard mode'}], 'skills_used': ['Shame', 'Glyph of Immolation', 'Spiritual Pain', 'Castigation Signet', 'Shatter Enchantment', 'Backfire', 'Mantra of Inscriptions', 'Shadow of Fear', 'Power Spike', 'Conjure Phantasm', 'Waste Not, Want Not', 'Shatter Hex', 'Power Leak', 'Phantom Pain', 'Ether Feast', 'Power Leech', 'Shared Burden', 'Guilt', 'Energy Surge', 'Signet of Disruption', 'Light of Dwayna', 'Gaze of Fury', 'Signet of Rage', 'Signet of Humility', 'Drain Enchantment', 'Shrinking Armor', 'Fragility', 'Arcane Conundrum', 'Keystone Signet', 'Drain Delusions', 'Cry of Frustration', 'Spirit Rift', 'Vengeance', 'Empathy', 'Energy Drain', 'Leech Signet', 'Overload'], 'armor_levels': {'Blunt damage': '60 (60)', 'Piercing damage': '60 (60)', 'Slashing damage': '60 (60)', 'Cold damage': '60 (60)', 'Earth damage': '60 (60)', 'Fire damage': '60 (60)', 'Lightning damage': '60 (60)'}, 'items_dropped': ["Confessor's Orders", 'The Rapture', 'unique']},
-    8110: {'name': 'Peacekeeper Firebrand', 'profession': ['Elementalist', 'Mesmer', 'Dervish', 'Monk'], 'attributes': [{'level': '15', 'name': 'Fire Magic'}], 'skills_used': ['Glyph of Immolation', 'Aura of Restoration', 'Smoldering Embers', 'Frigid Armor', 'Ward of Weakness', 'Ice Spikes', 'Steam', 'Breath of Fire', 'Mark of Rodgort', 'Ash Blast', 'Slippery Ground', 'Lava Arrows', 'Elemental Attunement', 'Liquid Flame', 'Glyph of Energy', 'Fire Storm', 'Epidemic', "Rodgort's Invocation", 'Incendiary Bonds', 'Blinding Flash', 'Glyph of Restoration', 'Master of Magic', 'Fire Attunement', 'Fragility', 'Meteor', 'Mind Blast', 'Earthen Shackles', 'Enervating Charge', 'Mystic Regeneration', 'Convert Hexes', 'Extinguish', 'Searing Flames'], 'armor_levels': {'Blunt damage': '60 (60)', 'Piercing damage': '60 (60)', 'Slashing damage': '60 (60)', 'Cold damage': '60 (60)', 'Earth damage': '60 (60)', 'Fire damage': '60 (60)', 'Lightning damage': '60 (60)'}, 'items_dropped': ["Confessor's Orders", 'Firebrand', 'unique']},
-    8111: {'name': 'Peacekeeper Firebrand', 'profession': ['Elementalist', 'Mesmer', 'Dervish', 'Monk'], 'attributes': [{'level': '15', 'name': 'Fire Magic'}], 'skills_used': ['Glyph of Immolation', 'Aura of Restoration', 'Smoldering Embers', 'Frigid Armor', 'Ward of Weakness', 'Ice Spikes', 'Steam', 'Breath of Fire', 'Mark of Rodgort', 'Ash Blast', 'Slippery Ground', 'Lava Arrows', 'Elemental Attunement', 'Liquid Flame', 'Glyph of Energy', 'Fire Storm', 'Epidemic', "Rodgort's Invocation", 'Incendiary Bonds', 'Blinding Flash', 'Glyph of Restoration', 'Master of Magic', 'Fire Attunement', 'Fragility', 'Meteor', 'Mind Blast', 'Earthen Shackles', 'Enervating Charge', 'Mystic Regeneration', 'Convert Hexes', 'Extinguish', 'Searing Flames'], 'armor_levels': {'Blunt damage': '60 (60)', 'Piercing damage': '60 (60)', 'Slashing damage': '60 (60)', 'Cold damage': '60 (60)', 'Earth damage': '60 (60)', 'Fire damage': '60 (60)', 'Lightning damage': '60 (60)'}, 'items_dropped': ["Confessor's Orders", 'Firebrand', 'unique']},
-    8113: {'name': 'Peacekeeper Firebrand', 'profession': ['Elementalist', 'Mesmer', 'Dervish', 'Monk'], 'attributes': [{'level': '15', 'name': 'Fire Magic'}], 'skills_used': ['Glyph of Immolation', 'Aura of Restoration', 'Smoldering Embers', 'Frigid Armor', 'Ward of Weakness', 'Ice Spikes', 'Steam', 'Breath of Fire', 'Mark of Rodgort', 'Ash Blast', 'Slippery Ground', 'Lava Arrows', 'Elemental Attunement', 'Liquid Flame', 'Glyph of Energy', 'Fire Storm', 'Epidemic', "Rodgort's Invocation", 'Incendiary Bonds', 'Blinding Flash', 'Glyph of Restoration', 'Master of Magic', 'Fire Attunement', 'Fragility', 'Meteor', 'Mind Blast', 'Earthen Shackles', 'Enervating Charge', 'Mystic Regeneration', 'Convert Hexes', 'Extinguish', 'Searing Flames'], 'armor_levels': {'Blunt damage': '60 (60)', 'Piercing damage': '60 (60)', 'Slashing damage': '60 (60)', 'Cold damage': '60 (60)', 'Earth damage': '60 (60)', 'Fire damage': '60 (60)', 'Lightning damage': '60 (60)'}, 'items_dropped': ["Confessor's Orders", 'Firebrand', 'unique']},
-    8117: {'name': 'Divine Peacekeeper', 'profession': ['Monk', 'Elementalist', 'Ritualist', 'Paragon'], 'attributes': [{'level': '14', 'name': 'Smiting Prayers'}], 'skills_used': ['Heal Other', 'Castigation Signet', 'Shield of Deflection', 'Cure Hex', "Dwayna's Kiss", "Smiter's Boon", 'Light of Deliverance', 'Purge Conditions', 'Healing Ribbon', 'Mending Refrain', 'Smite Hex', 'Bane Signet', 'Displacement', 'Ballad of Restoration', "Judge's Insight", 'Blessed Light', 'Dismiss Condition', 'Guardian', 'Word of Healing', 'Signet of Synergy', 'Signet of Rejuvenation', 'Smite Condition', 'Magnetic Aura', 'Vengeful Weapon', 'Reversal of Fortune', 'Aegis', 'Shield of Absorption'], 'armor_levels': {'Blunt damage': '60 (60)', 'Piercing damage': '60 (60)', 'Slashing damage': '60 (60)', 'Cold damage': '60 (60)', 'Earth damage': '60 (60)', 'Fire damage': '60 (60)', 'Lightning damage': '60 (60)'}, 'items_dropped': ["Confessor's Orders", 'Harmony', 'unique', 'Peace']},
-    8115: {'name': 'Divine Peacekeeper', 'profession': ['Monk', 'Elementalist', 'Ritualist', 'Paragon'], 'attributes': [{'level': '14', 'name': 'Smiting Prayers'}], 'skills_used': ['Heal Other', 'Castigation Signet', 'Shield of Deflection', 'Cure Hex', "Dwayna's Kiss", "Smiter's Boon", 'Light of Deliverance', 'Purge Conditions', 'Healing Ribbon', 'Mending Refrain', 'Smite Hex', 'Bane Signet', 'Displacement', 'Ballad of Restoration', "Judge's Insight", 'Blessed Light', 'Dismiss Condition', 'Guardian', 'Word of Healing', 'Signet of Synergy', 'Signet of Rejuvenation', 'Smite Condition', 'Magnetic Aura', 'Vengeful Weapon', 'Reversal of Fortune', 'Aegis', 'Shield of Absorption'], 'armor_levels': {'Blunt damage': '60 (60)', 'Piercing damage': '60 (60)', 'Slashing damage': '60 (60)', 'Cold damage': '60 (60)', 'Earth damage': '60 (60)', 'Fire damage': '60 (60)', 'Lightning damage': '60 (60)'}, 'items_dropped': ["Confessor's Orders", 'Harmony', 'unique', 'Peace']},
-    8135: {'name': 'Peacekeeper Goon', 'profession': ['Warrior', 'Mesmer', 'Elementalist', 'Ritualist'], 'attributes': [], 'skills_used': ['Signet of Disenchantment', 'Critical Chop', "Warmonger's Weapon", 'Signet of Strength', 'Axe Twist', 'Axe Rake', "Griffon's Sweep", '"Fear Me!"', "Soldier's Strike", 'Healing Signet', 'Signet of Disruption', 'Conjure Lightning', 'Agonizing Chop', '"To the Limit!"', 'Eviscerate', 'Burst of Aggression', "Soldier's Stance", 'Dismember', 'Furious Axe', 'Tiger Stance', 'Resurrection Signet', 'Disrupting Chop', "Lion's Comfort", 'Battle Rage', 'Cleave'], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '100', 'Slashing damage': '100', 'Cold damage': '80', 'Earth damage': '80', 'Fire damage': '80', 'Lightning damage': '80'}, 'items_dropped': ["Confessor's Orders", 'The Peacekeeper', 'unique']},
-    8133: {'name': 'Peacekeeper Goon', 'profession': ['Warrior', 'Mesmer', 'Elementalist', 'Ritualist'], 'attributes': [], 'skills_used': ['Signet of Disenchantment', 'Critical Chop', "Warmonger's Weapon", 'Signet of Strength', 'Axe Twist', 'Axe Rake', "Griffon's Sweep", '"Fear Me!"', "Soldier's Strike", 'Healing Signet', 'Signet of Disruption', 'Conjure Lightning', 'Agonizing Chop', '"To the Limit!"', 'Eviscerate', 'Burst of Aggression', "Soldier's Stance", 'Dismember', 'Furious Axe', 'Tiger Stance', 'Resurrection Signet', 'Disrupting Chop', "Lion's Comfort", 'Battle Rage', 'Cleave'], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '100', 'Slashing damage': '100', 'Cold damage': '80', 'Earth damage': '80', 'Fire damage': '80', 'Lightning damage': '80'}, 'items_dropped': ["Confessor's Orders", 'The Peacekeeper', 'unique']},
-    8137: {'name': 'Peacekeeper Marksman', 'profession': ['Ranger', 'Mesmer', 'Necromancer', 'Ritualist', 'Assassin'], 'attributes': [{'level': '14', 'name': 'Marksmanship'}], 'skills_used': ['Magebane Shot', 'Favorable Winds', 'Troll Unguent', "Sloth Hunter's Shot", "Hunter's Shot", 'Healing Spring', 'Critical Eye', 'Burning Arrow', 'Apply Poison', 'Savage Shot', 'Epidemic', 'Crossfire', "Serpent's Quickness", 'Barrage', 'Determined Shot', "Expert's Dexterity", 'Winnowing', 'Gaze of Fury', 'Arcing Shot', 'Rend Enchantments', 'Keen Arrow', 'Resurrection Signet', 'Body Shot', 'Antidote Signet', 'Frustration', 'Weaken Armor', 'Splinter Weapon'], 'armor_levels': {'Blunt damage': '70 (70)', 'Piercing damage': '70 (70)', 'Slashing damage': '70 (70)', 'Cold damage': '100 (100)', 'Earth damage': '100 (100)', 'Fire damage': '100 (100)', 'Lightning damage': '100 (100)'}, 'items_dropped': ["Confessor's Orders"]},
-    8138: {'name': 'Peacekeeper Marksman', 'profession': ['Ranger', 'Mesmer', 'Necromancer', 'Ritualist', 'Assassin'], 'attributes': [{'level': '14', 'name': 'Marksmanship'}], 'skills_used': ['Magebane Shot', 'Favorable Winds', 'Troll Unguent', "Sloth Hunter's Shot", "Hunter's Shot", 'Healing Spring', 'Critical Eye', 'Burning Arrow', 'Apply Poison', 'Savage Shot', 'Epidemic', 'Crossfire', "Serpent's Quickness", 'Barrage', 'Determined Shot', "Expert's Dexterity", 'Winnowing', 'Gaze of Fury', 'Arcing Shot', 'Rend Enchantments', 'Keen Arrow', 'Resurrection Signet', 'Body Shot', 'Antidote Signet', 'Frustration', 'Weaken Armor', 'Splinter Weapon'], 'armor_levels': {'Blunt damage': '70 (70)', 'Piercing damage': '70 (70)', 'Slashing damage': '70 (70)', 'Cold damage': '100 (100)', 'Earth damage': '100 (100)', 'Fire damage': '100 (100)', 'Lightning damage': '100 (100)'}, 'items_dropped': ["Confessor's Orders"]},
-    8151: {'name': 'Peacekeeper Clairvoyant', 'profession': ['Ritualist', 'Elementalist', 'Necromancer'], 'attributes': [{'level': '13', 'name': 'Channeling Magic'}, {'level': '15', 'name': 'Restoration Magic'}, {'level': '20 Restoration Magic in', 'name': 'Hard mode'}], 'skills_used': ['Pain', 'Binding Chains', 'Life', 'Spirit Light Weapon', 'Renewing Surge', 'Empowerment', "Caretaker's Charge", 'Dulled Weapon', 'Rupture Soul', 'Union', 'Destruction', 'Destructive Was Glaive', 'Rejuvenation', 'Animate Shambling Horror', 'Signet of Creation', 'Conjure Lightning', 'Bloodsong', 'Signet of Ghostly Might', 'Soothing', 'Armor of Unfeeling', 'Gaze from Beyond', 'Disenchantment', 'Spirit Burn', 'Anguished Was Lingwah', 'Spirit Rift', 'Boon of Creation', 'Shadowsong', 'Lamentation', 'Ritual Lord'], 'armor_levels': {'Blunt damage': '60 (60)', 'Piercing damage': '60 (60)', 'Slashing damage': '60 (60)', 'Cold damage': '60 (60)', 'Earth damage': '60 (60)', 'Fire damage': '60 (60)', 'Lightning damage': '60 (60)'}, 'items_dropped': ["Confessor's Orders"]},
-    8154: {'name': 'Peacekeeper Clairvoyant', 'profession': ['Ritualist', 'Elementalist', 'Necromancer'], 'attributes': [{'level': '13', 'name': 'Channeling Magic'}, {'level': '15', 'name': 'Restoration Magic'}, {'level': '20 Restoration Magic in', 'name': 'Hard mode'}], 'skills_used': ['Pain', 'Binding Chains', 'Life', 'Spirit Light Weapon', 'Renewing Surge', 'Empowerment', "Caretaker's Charge", 'Dulled Weapon', 'Rupture Soul', 'Union', 'Destruction', 'Destructive Was Glaive', 'Rejuvenation', 'Animate Shambling Horror', 'Signet of Creation', 'Conjure Lightning', 'Bloodsong', 'Signet of Ghostly Might', 'Soothing', 'Armor of Unfeeling', 'Gaze from Beyond', 'Disenchantment', 'Spirit Burn', 'Anguished Was Lingwah', 'Spirit Rift', 'Boon of Creation', 'Shadowsong', 'Lamentation', 'Ritual Lord'], 'armor_levels': {'Blunt damage': '60 (60)', 'Piercing damage': '60 (60)', 'Slashing damage': '60 (60)', 'Cold damage': '60 (60)', 'Earth damage': '60 (60)', 'Fire damage': '60 (60)', 'Lightning damage': '60 (60)'}, 'items_dropped': ["Confessor's Orders"]},
-    8152: {'name': 'Peacekeeper Clairvoyant', 'profession': ['Ritualist', 'Elementalist', 'Necromancer'], 'attributes': [{'level': '13', 'name': 'Channeling Magic'}, {'level': '15', 'name': 'Restoration Magic'}, {'level': '20 Restoration Magic in', 'name': 'Hard mode'}], 'skills_used': ['Pain', 'Binding Chains', 'Life', 'Spirit Light Weapon', 'Renewing Surge', 'Empowerment', "Caretaker's Charge", 'Dulled Weapon', 'Rupture Soul', 'Union', 'Destruction', 'Destructive Was Glaive', 'Rejuvenation', 'Animate Shambling Horror', 'Signet of Creation', 'Conjure Lightning', 'Bloodsong', 'Signet of Ghostly Might', 'Soothing', 'Armor of Unfeeling', 'Gaze from Beyond', 'Disenchantment', 'Spirit Burn', 'Anguished Was Lingwah', 'Spirit Rift', 'Boon of Creation', 'Shadowsong', 'Lamentation', 'Ritual Lord'], 'armor_levels': {'Blunt damage': '60 (60)', 'Piercing damage': '60 (60)', 'Slashing damage': '60 (60)', 'Cold damage': '60 (60)', 'Earth damage': '60 (60)', 'Fire damage': '60 (60)', 'Lightning damage': '60 (60)'}, 'items_dropped': ["Confessor's Orders"]},
-    8155: {'name': 'Peacekeeper Mentor', 'profession': ['Paragon', 'Ranger', 'Elementalist'], 'attributes': [], 'skills_used': ['Mighty Throw', "Leader's Comfort", 'Aggressive Refrain', "Soldier's Fury", '"Find Their Weakness!"', 'Signet of Return', '"Go for the Eyes!"', 'Charm Drake', 'Blazing Finale', 'Mending Refrain', 'Wild Throw', 'Cruel Spear', '"The Power Is Yours!"', '"Can\'t Touch This!"', 'Conjure Lightning', 'Spear of Lightning', 'Blazing Spear', '"We Shall Return!"', 'Finale of Restoration', 'Anthem of Weariness', 'Anthem of Envy'], 'armor_levels': {'Blunt damage': '95 (113)', 'Piercing damage': '95 (113)', 'Slashing damage': '95 (113)', 'Cold damage': '95 (113)', 'Earth damage': '95 (113)', 'Fire damage': '95 (113)', 'Lightning damage': '95 (113)'}, 'items_dropped': ["Confessor's Orders"]},
-    8156: {'name': 'Peacekeeper Mentor', 'profession': ['Paragon', 'Ranger', 'Elementalist'], 'attributes': [], 'skills_used': ['Mighty Throw', "Leader's Comfort", 'Aggressive Refrain', "Soldier's Fury", '"Find Their Weakness!"', 'Signet of Return', '"Go for the Eyes!"', 'Charm Drake', 'Blazing Finale', 'Mending Refrain', 'Wild Throw', 'Cruel Spear', '"The Power Is Yours!"', '"Can\'t Touch This!"', 'Conjure Lightning', 'Spear of Lightning', 'Blazing Spear', '"We Shall Return!"', 'Finale of Restoration', 'Anthem of Weariness', 'Anthem of Envy'], 'armor_levels': {'Blunt damage': '95 (113)', 'Piercing damage': '95 (113)', 'Slashing damage': '95 (113)', 'Cold damage': '95 (113)', 'Earth damage': '95 (113)', 'Fire damage': '95 (113)', 'Lightning damage': '95 (113)'}, 'items_dropped': ["Confessor's Orders"]},
-    8172: {'name': 'Insatiable Vakar', 'profession': ['Paragon', 'Elementalist'], 'attributes': [], 'skills_used': ['Mighty Throw', "Leader's Comfort", '"Can\'t Touch This!"', 'Conjure Lightning', 'Anthem of Weariness', "Soldier's Fury", 'Spear of Lightning'], 'armor_levels': {}, 'items_dropped': ["Confessor's Orders"]},
-    8249: {'name': 'White Mantle Ritualist', 'profession': ['Necromancer', 'Elementalist', 'Ritualist', 'Assassin'], 'attributes': [{'level': '13', 'name': 'Blood Magic'}, {'level': '9', 'name': 'Death Magic'}, {'level': '17 Death Magic in', 'name': 'Hard mode'}], 'skills_used': ['Shell Shock', 'Discord', 'Mark of Subversion', 'Order of Pain', 'Glyph of Swiftness', 'Animate Flesh Golem', 'Vampiric Gaze', 'Oppressive Gaze', 'Spoil Victor', 'Taste of Pain', 'Strip Enchantment', 'Animate Bone Horror', 'Barbed Signet', 'Shadow Strike', 'Life Siphon', "Verata's Aura", 'Weaken Knees', 'Infuse Condition', 'Reckless Haste', 'Vile Miasma', 'Jaundiced Gaze', 'Blood of the Aggressor', 'Well of Blood', 'Shameful Fear', 'Bitter Chill', 'Rising Bile', 'Death Pact Signet', 'Enduring Toxin', 'Well of the Profane', 'Splinter Weapon'], 'armor_levels': {'Blunt damage': '49', 'Piercing damage': '49', 'Slashing damage': '49', 'Cold damage': '49', 'Earth damage': '49', 'Fire damage': '49', 'Lightning damage': '49'}, 'items_dropped': ["Ritualist's Tunic", 'Shining Maul', 'The Soul Reaper', 'unique', 'War in Kryta', 'White Mantle Badge', 'White Mantle Emblem']},
-    8582: {'name': 'Ministry of Purity', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    41: {'name': 'Julyia', 'profession': ['Monk', 'Warrior'], 'attributes': [], 'skills_used': ['Balanced Stance', 'Shielding Hands', 'Spirit Bond (PvP)', 'Guardian', 'Reversal of Fortune', 'Remove Hex', 'Restore Condition', 'Aura of Stability'], 'armor_levels': {}, 'items_dropped': []},
-    49: {'name': 'Narcissia', 'profession': ['Ritualist'], 'attributes': [], 'skills_used': ['Recuperation (PvP)', "Wielder's Boon", 'Spirit Siphon', 'Mend Body and Soul', 'Protective Was Kaolai', 'Weapon of Warding (PvP)', "Xinrae's Weapon", 'Resilient Weapon'], 'armor_levels': {}, 'items_dropped': []},
-    50: {'name': 'Zen Siert', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ['Chilling Victory', 'Heart of Fury', 'Resurrection Signet', 'Staggering Force', 'Victorious Sweep', 'Wounding Strike', 'Fleeting Stability', 'Crippling Victory'], 'armor_levels': {}, 'items_dropped': []},
-    44: {'name': 'Vincent Evan', 'profession': ['Elementalist', 'Ritualist'], 'attributes': [], 'skills_used': ['Flesh of My Flesh (PvP)', 'Glyph of Lesser Energy', 'Air Attunement', 'Protective Was Kaolai', 'Weapon of Warding (PvP)', 'Gale', 'Lightning Bolt', 'Blinding Surge'], 'armor_levels': {}, 'items_dropped': []},
-    39: {'name': 'Cassie Santi', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ["Lyssa's Aura", 'Phantom Pain', 'Discharge Enchantment', 'Hex Eater Signet', 'Ether Phantom', 'Resurrection Signet', 'Conjure Nightmare', 'Illusion of Pain'], 'armor_levels': {}, 'items_dropped': []},
-    43: {'name': 'Dirk Shadowrise', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Suffering', 'Rip Enchantment', 'Faintheartedness', 'Lingering Curse', 'Resurrection Signet', 'Barbs', 'Signet of Lost Souls', 'Insidious Parasite'], 'armor_levels': {}, 'items_dropped': []},
-    45: {'name': 'Luzy Fiera', 'profession': ['Elementalist', 'Mesmer'], 'attributes': [], 'skills_used': ['Immolate', 'Meteor', 'Mind Blast', "Rodgort's Invocation", 'Aura of Restoration', 'Resurrection Signet', 'Distortion', 'Fire Attunement'], 'armor_levels': {}, 'items_dropped': []},
-    190: {'name': 'Rune trader', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    191: {'name': 'Crafting Material Trader', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    192: {'name': 'Rare material trader', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    193: {'name': 'Dye trader', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    194: {'name': 'Scroll Trader', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    31: {'name': 'Pudash', 'profession': ['Warrior', 'Elementalist'], 'attributes': [], 'skills_used': ['Sun and Moon Slash', 'Resurrection Signet', "Bull's Strike", 'Conjure Flame', 'Gash', 'Frenzy', 'Crippling Slash', 'Rush'], 'armor_levels': {}, 'items_dropped': []},
-    53: {'name': 'Blenkeh', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['Finale of Restoration (PvP)', 'Anthem of Flame', 'Resurrection Signet', '"The Power Is Yours!"', 'Aggressive Refrain', 'Mending Refrain (PvP)', 'Spear of Lightning', 'Wild Throw'], 'armor_levels': {}, 'items_dropped': []},
-    46: {'name': 'Motoko Kai', 'profession': ['Elementalist', 'Ritualist'], 'attributes': [], 'skills_used': ['Flesh of My Flesh (PvP)', 'Glowing Ice', 'Aura of Restoration', 'Water Attunement', 'Blurred Vision', 'Shatterstone', "Winter's Embrace", 'Freezing Gust'], 'armor_levels': {}, 'items_dropped': []},
-    34: {'name': 'Errol Hyl', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Savage Shot', 'Natural Stride', "Serpent's Quickness", 'Determined Shot', 'Resurrection Signet', 'Crippling Shot', 'Apply Poison', 'Distracting Shot'], 'armor_levels': {}, 'items_dropped': []},
-    196: {'name': 'Merchant', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    197: {'name': 'Weaponsmith', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    195: {'name': 'Skill trainer', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    32: {'name': 'Dahlia', 'profession': ['Warrior', 'Assassin'], 'attributes': [], 'skills_used': ["Magehunter's Smash", 'Crushing Blow', 'Enraging Charge', "Death's Charge", 'Resurrection Signet', "Bull's Strike", 'Hammer Bash', 'Flail'], 'armor_levels': {}, 'items_dropped': []},
-    40: {'name': 'Redemptor Frohs', 'profession': ['Monk', 'Dervish'], 'attributes': [], 'skills_used': ['Infuse Health', 'Conviction', 'Cure Hex', 'Armor of Sanctity', 'Guardian', 'Patient Spirit', 'Word of Healing', 'Signet of Rejuvenation'], 'armor_levels': {}, 'items_dropped': []},
-    54: {'name': 'Aurora Allesandra', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['"Stand Your Ground!" (PvP)', 'Cruel Spear', 'Resurrection Signet', '"Go for the Eyes!" (PvP)', 'Aggressive Refrain', 'Anthem of Weariness', 'Spear of Lightning', 'Vicious Attack'], 'armor_levels': {}, 'items_dropped': []},
-    47: {'name': 'Hinata', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Aura of Restoration', 'Water Attunement', 'Resurrection Signet', 'Rust', 'Blurred Vision', 'Mirror of Ice', 'Freezing Gust', 'Ice Spikes'], 'armor_levels': {}, 'items_dropped': []},
-    36: {'name': 'Lulu Xan', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Magebane Shot', 'Natural Stride', 'Resurrection Signet', 'Debilitating Shot', 'Pin Down', 'Apply Poison', 'Distracting Shot', 'Lightning Reflexes (PvP)'], 'armor_levels': {}, 'items_dropped': []},
-    42: {'name': 'Bellicus', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Rip Enchantment', 'Enfeeble (PvP)', 'Faintheartedness', 'Resurrection Signet', 'Defile Defenses', 'Corrupt Enchantment', 'Foul Feast', 'Plague Sending'], 'armor_levels': {}, 'items_dropped': []},
-    198: {'name': 'Festival Hat Keeper', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    199: {'name': 'Guild Emblemer', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    38: {'name': 'Tannaros', 'profession': ['Mesmer', 'Dervish'], 'attributes': [], 'skills_used': ['Backfire', 'Empathy (PvP)', 'Pious Concentration', 'Resurrection Signet', 'Power Drain', 'Waste Not, Want Not', 'Visions of Regret (PvP)', 'Signet of Humility'], 'armor_levels': {}, 'items_dropped': []},
-    33: {'name': 'Disenmaedel', 'profession': ['Warrior', 'Elementalist'], 'attributes': [], 'skills_used': ['Resurrection Signet', 'Disrupting Chop', "Bull's Strike", 'Body Blow', 'Shock', 'Rush', 'Dismember', 'Primal Rage'], 'armor_levels': {}, 'items_dropped': []},
-    48: {'name': 'Kah Xan', 'profession': ['Assassin', 'Warrior'], 'attributes': [], 'skills_used': ['Dash', "Wastrel's Collapse", 'Falling Spider', 'Resurrection Signet', 'Horns of the Ox', 'Falling Lotus Strike', 'Flurry', 'Twisting Fangs'], 'armor_levels': {}, 'items_dropped': []},
-    4821: {'name': 'Lonai', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Death Magic'}], 'skills_used': ['Jagged Bones', 'Animate Bone Minions', 'Death Nova', 'Ravenous Gaze'], 'armor_levels': {}, 'items_dropped': []},
-    4475: {'name': 'Koss', 'profession': ['Warrior', 'Elementalist'], 'attributes': [{'level': '2', 'name': 'Swordsmanship'}, {'level': '1', 'name': 'Tactics'}, {'level': '9', 'name': 'Tactics'}], 'skills_used': ['"Watch Yourself!"', 'Power Attack', 'Eviscerate', 'Healing Signet', 'Resurrection Signet', 'Critical Chop', 'Sprint', 'Sever Artery', 'Counterattack', 'Shock', 'Final Thrust', 'Flail'], 'armor_levels': {}, 'items_dropped': []},
-    4483: {'name': 'Dunkoro', 'profession': ['Monk'], 'attributes': [{'level': '5', 'name': 'Healing Prayers'}, {'level': '4', 'name': 'Divine Favor'}], 'skills_used': ['Healing Touch', 'Orison of Healing', 'Resurrect', 'Remove Hex', 'Words of Comfort', 'Healing Breeze'], 'armor_levels': {}, 'items_dropped': []},
-    5075: {'name': 'Smuggler', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4742: {'name': 'Dalzid', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5386: {'name': 'Burreh', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5393: {'name': 'Benera', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5399: {'name': 'Megundeh', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4740: {'name': 'Shausha', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4741: {'name': 'Ahamid', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5398: {'name': 'Stasheh', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4743: {'name': 'Marlani', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5382: {'name': 'Sinbi', 'profession': ['Ranger'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5401: {'name': 'Kerendu', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4814: {'name': 'Nerashi', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Prepared Shot', "Scavenger's Focus", 'Pin Down', 'Escape'], 'armor_levels': {}, 'items_dropped': []},
-    4926: {'name': 'Veldt Beetle Lance', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['Vicious Attack', "Harrier's Toss", 'Cruel Spear', 'Anthem of Envy'], 'armor_levels': {'Blunt damage': '80', 'Piercing damage': '80', 'Slashing damage': '80', 'Cold damage': '80', 'Earth damage': '80', 'Fire damage': '80', 'Lightning damage': '80'}, 'items_dropped': ['Chitin Fragment', 'Insect Carapace', 'Monstrous Claw']},
-    4902: {'name': 'Veldt Nephila', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Called Shot', 'Screaming Shot', 'Quick Shot', 'Apply Poison'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': []},
-    4923: {'name': 'Veldt Beetle Queen', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Signet of Devotion', 'Orison of Healing', 'Light of Deliverance', 'Words of Comfort'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Chitin Fragment', 'Insect Carapace', 'Monstrous Claw']},
-    4924: {'name': 'Bladed Veldt Termite', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Power Attack', 'Swift Chop', 'Frenzy', "Lion's Comfort", 'Cleave'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Chitin Fragment', 'Insect Carapace', 'Monstrous Claw']},
-    4915: {'name': 'Rampaging Ntouka', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ['Chilling Victory', 'Banishing Strike', 'Rending Aura', "Reaper's Sweep"], 'armor_levels': {'Blunt damage': '70', 'Piercing damage': '70', 'Slashing damage': '70', 'Cold damage': '70', 'Earth damage': '70', 'Fire damage': '70', 'Lightning damage': '70'}, 'items_dropped': ['Half-Digested Armor']},
-    4913: {'name': 'Crested Ntouka Bird', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Fast Casting'}, {'level': '15', 'name': 'Illusion Magic'}], 'skills_used': ['Arcane Conundrum', 'Clumsiness', 'Conjure Phantasm', 'Mantra of Recovery'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Half-Digested Armor']},
-    5269: {'name': 'Kournan Elite Zealot', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ["Eremite's Attack", 'Armor of Sanctity', 'Veil of Thorns', 'Pious Renewal'], 'armor_levels': {'Blunt damage': '76', 'Piercing damage': '76', 'Slashing damage': '76', 'Cold damage': '76', 'Earth damage': '76', 'Fire damage': '76', 'Lightning damage': '76'}, 'items_dropped': ['Bolt of Linen', 'Kournan Bracer', 'Kournan Pendant']},
-    5270: {'name': 'Kournan Elite Spear', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['"Stand Your Ground!"', 'Mighty Throw', 'Cautery Signet', '"Never Surrender!"', 'Wild Throw'], 'armor_levels': {'Blunt damage': '101', 'Piercing damage': '101', 'Slashing damage': '101', 'Cold damage': '101', 'Earth damage': '101', 'Fire damage': '101', 'Lightning damage': '101'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Linen', 'Kournan Bracer', 'Kournan Pendant', 'Kournan Spaulder', 'Kournan Tunic', 'Tanned Hide Square']},
-    5268: {'name': 'Kournan Elite Guard', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Mighty Blow', 'Sprint', 'Staggering Blow', 'Magehunter Strike'], 'armor_levels': {'Blunt damage': '106', 'Piercing damage': '106', 'Slashing damage': '106', 'Cold damage': '86', 'Earth damage': '86', 'Fire damage': '86', 'Lightning damage': '86'}, 'items_dropped': ['Bolt of Cloth', 'Kournan Bracer', 'Kournan Pendant', 'Kournan Tunic', 'Tanned Hide Square']},
-    5267: {'name': 'Kournan Elite Scribe', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Meteor', 'Aura of Restoration', 'Master of Magic', 'Aftershock', 'Fireball'], 'armor_levels': {'Blunt damage': '66', 'Piercing damage': '66', 'Slashing damage': '66', 'Cold damage': '66', 'Earth damage': '66', 'Fire damage': '66', 'Lightning damage': '66'}, 'items_dropped': ['Bolt of Cloth', 'Kournan Bracer', 'Kournan Pendant', 'Kournan Spaulder', 'Kournan Tunic']},
-    4223: {'name': 'Spirit of Shelter', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5226: {'name': 'Admiral Kantoh', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Meteor', 'Aura of Restoration', 'Master of Magic', 'Aftershock', 'Fireball'], 'armor_levels': {}, 'items_dropped': ['Bolt of Silk', "Kantoh's Walking Stick", 'unique', 'Kournan Pendant', 'Kournan Spaulder']},
-    4950: {'name': 'Mirza Veldrunner', 'profession': ['Paragon'], 'attributes': [{'level': '12', 'name': 'Command'}], 'skills_used': ["Leader's Comfort", 'Ballad of Restoration', 'Song of Purification', '"Go for the Eyes!"', '"Never Surrender!"'], 'armor_levels': {}, 'items_dropped': []},
-    5045: {'name': 'Corsair Torturer', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Envenom Enchantments', "Corsair's Net", 'Poisoned Heart', 'Defile Flesh', "Reaper's Mark", 'Parasitic Bond'], 'armor_levels': {'Blunt damage': '63', 'Piercing damage': '63', 'Slashing damage': '63', 'Cold damage': '63', 'Earth damage': '63', 'Fire damage': '63', 'Lightning damage': '63'}, 'items_dropped': ['Gold Doubloon', 'Tanned Hide Square']},
-    5049: {'name': 'Corsair Lieutenant', 'profession': ['Ranger', 'Necromancer'], 'attributes': [{'level': '15', 'name': 'Marksmanship'}], 'skills_used': ['Toxicity', 'Power Shot', 'Troll Unguent', 'Prepared Shot', 'Dual Shot', 'Savage Shot', "Corsair's Net", 'Crossfire', "Sloth Hunter's Shot", 'Read the Wind', 'Kindle Arrows', 'Barbs', 'Defile Defenses', 'Burning Arrow', 'Pin Down', 'Apply Poison', "Hunter's Shot"], 'armor_levels': {'Blunt damage': '70', 'Piercing damage': '70', 'Slashing damage': '70', 'Cold damage': '100', 'Earth damage': '100', 'Fire damage': '100', 'Lightning damage': '100'}, 'items_dropped': ['Bolt of Cloth', 'Bolt of Silk', 'Corsair Pauldron', 'Corsair Raiment', 'Corsair Trappings', 'Gold Doubloon', 'Stolen Goods']},
-    5046: {'name': 'Corsair Wind Master', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Immolate', 'Steam', 'Aura of Restoration', 'Enervating Charge', 'Air Attunement', 'Rust', 'Lightning Strike', 'Ride the Lightning', 'Elemental Attunement', 'Lightning Javelin'], 'armor_levels': {'Blunt damage': '63', 'Piercing damage': '63', 'Slashing damage': '63', 'Cold damage': '63', 'Earth damage': '63', 'Fire damage': '63', 'Lightning damage': '63'}, 'items_dropped': ['Corsair Trappings', 'Gold Doubloon', 'Stolen Goods', 'Tanned Hide Square']},
-    5723: {'name': 'Spirit of Vampirism', 'profession': [], 'attributes': [], 'skills_used': ['Vampirism (attack)'], 'armor_levels': {}, 'items_dropped': []},
-    4231: {'name': 'Spirit of Suffering', 'profession': ['Ritualist'], 'attributes': [], 'skills_used': ['Pain (attack) (Togo)', 'Pain (attack) (Signet of Spirits)'], 'armor_levels': {}, 'items_dropped': []},
-    4230: {'name': 'Spirit of Hate', 'profession': [], 'attributes': [], 'skills_used': ['Pain (attack) (Togo)', 'Pain (attack) (Signet of Spirits)'], 'armor_levels': {}, 'items_dropped': []},
-    4229: {'name': 'Spirit of Anger', 'profession': [], 'attributes': [], 'skills_used': ['Pain (attack) (Togo)', 'Pain (attack) (Signet of Spirits)'], 'armor_levels': {}, 'items_dropped': []},
-    4917: {'name': 'Tusked Hunter', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['Focused Anger', 'Natural Temper', 'Merciless Spear', 'Wild Throw'], 'armor_levels': {'Blunt damage': '86', 'Piercing damage': '86', 'Slashing damage': '86', 'Cold damage': '86', 'Earth damage': '86', 'Fire damage': '86', 'Lightning damage': '86'}, 'items_dropped': ['Half-Digested Armor']},
-    4916: {'name': 'Tusked Howler', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['Focused Anger', 'Barbed Spear', 'Song of Power', 'Wild Throw'], 'armor_levels': {'Blunt damage': '86', 'Piercing damage': '86', 'Slashing damage': '86', 'Cold damage': '86', 'Earth damage': '86', 'Fire damage': '86', 'Lightning damage': '86'}, 'items_dropped': ['Half-Digested Armor']},
-    5391: {'name': 'Projects/NPC models/Humans/Kournans', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4949: {'name': 'Veldrunner Centaur', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Flame Trap', 'Troll Unguent', 'Natural Stride', 'Barbed Trap'], 'armor_levels': {}, 'items_dropped': []},
-    4951: {'name': 'Veldrunner Centaur', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Flame Trap', 'Troll Unguent', 'Natural Stride', 'Barbed Trap'], 'armor_levels': {}, 'items_dropped': []},
-    4948: {'name': 'Veldrunner Centaur', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Flame Trap', 'Troll Unguent', 'Natural Stride', 'Barbed Trap'], 'armor_levels': {}, 'items_dropped': []},
-    5276: {'name': 'Kournan Taskmaster', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ["Executioner's Strike", "Bull's Strike", 'Swift Chop', "Lion's Comfort", 'Cleave'], 'armor_levels': {'Blunt damage': '127', 'Piercing damage': '127', 'Slashing damage': '127', 'Cold damage': '107', 'Earth damage': '107', 'Fire damage': '107', 'Lightning damage': '107'}, 'items_dropped': ['Bolt of Cloth', 'Cell Key', 'Kournan Bracer', 'Kournan Defender', 'Kournan Pendant', 'Kournan Tunic']},
-    5243: {'name': 'Taskmaster Sadi-Belai', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Shielding Hands', 'Convert Hexes', 'Zealous Benediction', 'Reversal of Fortune'], 'armor_levels': {}, 'items_dropped': []},
-    5242: {'name': 'Taskmaster Vanahk', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Life Siphon', 'Signet of Lost Souls', 'Blood is Power', 'Strip Enchantment'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Kournan Pendant']},
-    5246: {'name': 'Overseer Haubeh', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Strip Enchantment', 'Blood is Power', 'Life Siphon', 'Blood of the Aggressor', 'Signet of Lost Souls'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth']},
-    5245: {'name': 'Overseer Boktek', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['"Stand Your Ground!"', 'Mighty Throw', 'Cautery Signet', '"Never Surrender!"', 'Wild Throw'], 'armor_levels': {}, 'items_dropped': ['Kournan Tunic']},
-    5244: {'name': 'Taskmaster Suli', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ["Eremite's Attack", 'Armor of Sanctity', 'Veil of Thorns', 'Pious Renewal'], 'armor_levels': {}, 'items_dropped': ['Kournan Pendant']},
-    4898: {'name': 'Kehmak the Tranquil', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Signet of Devotion', 'Orison of Healing', 'Light of Deliverance', 'Words of Comfort'], 'armor_levels': {}, 'items_dropped': []},
-    5406: {'name': 'General Bayel', 'profession': ['Monk'], 'attributes': [{'level': '20', 'name': 'Smiting Prayers'}], 'skills_used': ['Scourge Enchantment', "Judge's Insight", 'Reversal of Damage', 'Signet of Devotion', 'Smite Hex', "Abaddon's Conspiracy", "Defender's Zeal"], 'armor_levels': {}, 'items_dropped': []},
-    3978: {'name': 'Focus of Hanaku', 'profession': ['Mesmer'], 'attributes': [{'level': '20', 'name': 'Domination Magic'}], 'skills_used': ['Ether Feast', 'Spirit Shackles', 'Energy Surge', 'Mind Wrack', 'Hex Breaker'], 'armor_levels': {}, 'items_dropped': ['Bone', "Hanaku's Focus", 'unique', 'Kraken Eye', 'Monstrous Claw', 'Monstrous Eye', 'Monstrous Fang', 'Regurgitated Mass']},
-    4225: {'name': 'Spirit of Disenchantment', 'profession': ['Ritualist'], 'attributes': [], 'skills_used': ['Disenchantment (attack)'], 'armor_levels': {}, 'items_dropped': []},
-    4210: {'name': 'Vampiric Horror', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    3722: {'name': 'Dragon Moss', 'profession': ['Elementalist'], 'attributes': [{'level': '14', 'name': 'Water Magic'}], 'skills_used': ['Aura of Restoration', 'Water Attunement', 'Blurred Vision', 'Shatterstone', 'Arc Lightning'], 'armor_levels': {'Blunt damage': '82', 'Piercing damage': '82', 'Slashing damage': '62', 'Cold damage': '82', 'Earth damage': '82', 'Fire damage': '62', 'Lightning damage': '82'}, 'items_dropped': ['Dragon Root', 'Plant Fiber', 'Ruby', 'Spiritwood Plank', 'Wood Plank']},
-    4221: {'name': 'Spirit of Dissonance', 'profession': [], 'attributes': [], 'skills_used': ['Dissonance (attack)'], 'armor_levels': {}, 'items_dropped': []},
-    4677: {'name': 'Skree Griffin', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Healing Touch', 'Orison of Healing', 'Renew Life', "Healer's Boon", 'Words of Comfort'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Bolt of Cloth', 'Skree Mask', 'Skree Wing']},
-    4679: {'name': 'Skree Tracker', 'profession': ['Ranger'], 'attributes': [{'level': '15', 'name': 'Expertise'}, {'level': '15', 'name': 'Marksmanship'}, {'level': '20 Marksmanship in', 'name': 'hard mode'}], 'skills_used': ['Screaming Shot', 'Favorable Winds', 'Determined Shot', "Expert's Dexterity", 'Distracting Shot'], 'armor_levels': {'Blunt damage': '82', 'Piercing damage': '82', 'Slashing damage': '82', 'Cold damage': '112', 'Earth damage': '112', 'Fire damage': '112', 'Lightning damage': '112'}, 'items_dropped': ['Bolt of Cloth', 'Feather', 'Monstrous Claw', 'Skree Helmet', 'Skree Rags', 'Skree Vambrace', 'Skree Wing', 'Tanned Hide Square']},
-    4680: {'name': 'Skree Singer', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['"Incoming!"', "Harrier's Toss", 'Aggressive Refrain', '"We Shall Return!"', 'Wild Throw'], 'armor_levels': {'Blunt damage': '82', 'Piercing damage': '82', 'Slashing damage': '82', 'Cold damage': '82', 'Earth damage': '82', 'Fire damage': '82', 'Lightning damage': '82'}, 'items_dropped': ['Bolt of Cloth', 'Feather', 'Monstrous Claw', 'Skree Helmet', 'Skree Rags', 'Skree Wing', 'Tanned Hide Square']},
-    4243: {'name': 'Lioness', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5689: {'name': 'Kehanni', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4669: {'name': 'Scytheclaw Behemoth', 'profession': ['Dervish'], 'attributes': [{'level': '15', 'name': 'Mysticism'}], 'skills_used': ['Banishing Strike', 'Heart of Fury', 'Victorious Sweep', 'Wounding Strike', 'Zealous Renewal'], 'armor_levels': {'Blunt damage': '122', 'Piercing damage': '122', 'Slashing damage': '122', 'Cold damage': '82', 'Earth damage': '82', 'Fire damage': '82', 'Lightning damage': '82'}, 'items_dropped': ['Behemoth Hide', 'Bone', 'Half-Digested Armor', 'Monstrous Claw', 'Monstrous Fang', 'Scale']},
-    4667: {'name': 'Behemoth Gravebane', 'profession': ['Necromancer'], 'attributes': [{'level': 'Level 20:14', 'name': 'Curses'}, {'level': '15', 'name': 'Death Magic'}, {'level': '20 Death Magic in', 'name': 'Hard mode'}, {'level': '11', 'name': 'Soul Reaping'}], 'skills_used': ['Suffering', 'Taste of Death', 'Toxic Chill', 'Animate Bone Minions', 'Death Nova'], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '100', 'Slashing damage': '100', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Behemoth Hide', 'Bone', 'Half-Digested Armor', 'Monstrous Claw', 'Monstrous Fang', 'Scale']},
-    4687: {'name': 'Rock Beetle', 'profession': ['Elementalist'], 'attributes': [{'level': '(20', 'name': 'Earth Magic'}], 'skills_used': ['Stoning', 'Aura of Restoration', 'Armor of Earth', 'Master of Magic', 'Stone Daggers'], 'armor_levels': {'Blunt damage': '110', 'Piercing damage': '110', 'Slashing damage': '110', 'Cold damage': '70', 'Earth damage': '70', 'Fire damage': '70', 'Lightning damage': '70'}, 'items_dropped': ['Chitin Fragment', 'Geode', 'Monstrous Claw']},
-    4685: {'name': 'Rain Beetle', 'profession': ['Ranger'], 'attributes': [{'level': '11', 'name': 'Expertise'}, {'level': '15', 'name': 'Marksmanship'}, {'level': '20 Marksmanship in', 'name': 'Hard mode'}], 'skills_used': ['Arcing Shot', 'Power Shot', 'Troll Unguent', 'Escape', 'Distracting Shot'], 'armor_levels': {'Blunt damage': '110', 'Piercing damage': '110', 'Slashing damage': '110', 'Cold damage': '70', 'Earth damage': '70', 'Fire damage': '70', 'Lightning damage': '70'}, 'items_dropped': ['Chitin Fragment', 'Geode', 'Monstrous Claw']},
-    5535: {'name': 'Margonite Sorcerer', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Air Magic'}, {'level': '11', 'name': 'Energy Storage'}, {'level': '15', 'name': 'Water Magic'}, {'level': '19 Water Magic in', 'name': 'Hard Mode'}], 'skills_used': ['Invoke Lightning', 'Aura of Restoration', 'Chilling Winds', "Abaddon's Favor", 'Air Attunement', "Abaddon's Chosen", 'Freezing Gust'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Margonite Mask', 'Margonite Robes']},
-    5533: {'name': 'Margonite Seer', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Inspiration Magic'}], 'skills_used': ['Ether Feast', 'Ether Phantom', "Abaddon's Favor", 'Drain Delusions', "Abaddon's Chosen", 'Energy Drain', 'Mirror of Disenchantment'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Margonite Mask', 'Margonite Robes', 'Margonite Tunic']},
-    4646: {'name': 'Hajok Earthguardian', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5536: {'name': 'Margonite Cleric', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Spell Breaker', "Abaddon's Favor", 'Divine Intervention', 'Watchful Healing', 'Dismiss Condition', "Abaddon's Chosen", 'Aegis'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Margonite Armor', 'Margonite Mask', 'Margonite Robes', 'Margonite Tunic']},
-    5516: {'name': 'Tain the Corrupter', 'profession': ['Necromancer'], 'attributes': [{'level': '16', 'name': 'Curses'}], 'skills_used': ['Well of Silence', 'Faintheartedness', 'Corrupt Enchantment', 'Parasitic Bond', 'Weaken Armor'], 'armor_levels': {}, 'items_dropped': ['Margonite Mask', 'Margonite Robes', "Tain's Corruption", 'unique']},
-    4678: {'name': 'Skree Raider', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', '"Charge!"', 'Hamstring', 'Savage Slash'], 'armor_levels': {'Blunt damage': '128', 'Piercing damage': '128', 'Slashing damage': '128', 'Cold damage': '108', 'Earth damage': '108', 'Fire damage': '108', 'Lightning damage': '108'}, 'items_dropped': ['Bolt of Cloth', 'Feather', 'Monstrous Claw', 'Skree Helmet', 'Skree Rags', 'Skree Vambrace', 'Skree Wing', 'Tanned Hide Square']},
-    4638: {'name': 'Makdeh the Aggravating', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Spirit Shackles', 'Signet of Clumsiness', 'Tease', 'Clumsiness'], 'armor_levels': {}, 'items_dropped': ["Makdeh's Focus", 'unique', 'Skree Helmet']},
-    5534: {'name': 'Margonite Warlock', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Curses'}], 'skills_used': ['Well of Silence', 'Faintheartedness', "Abaddon's Favor", "Abaddon's Chosen", 'Corrupt Enchantment', 'Parasitic Bond', 'Weaken Armor'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Margonite Armor', 'Margonite Mask', 'Margonite Tunic']},
-    5537: {'name': 'Margonite Executioner', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ["Magehunter's Smash", 'Healing Signet', "Abaddon's Favor", 'Staggering Blow', "Abaddon's Chosen", 'Overbearing Smash'], 'armor_levels': {'Blunt damage': '111', 'Piercing damage': '111', 'Slashing damage': '111', 'Cold damage': '91', 'Earth damage': '91', 'Fire damage': '91', 'Lightning damage': '91'}, 'items_dropped': ['Margonite Armor', 'Margonite Mask', 'Margonite Robes', 'Margonite Tunic']},
-    5540: {'name': 'Margonite Ascendant', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['"Brace Yourself!"', 'Anthem of Guidance', "Leader's Comfort", "Abaddon's Favor", "Abaddon's Chosen", '"Go for the Eyes!"', 'Swift Javelin'], 'armor_levels': {'Blunt damage': '91', 'Piercing damage': '91', 'Slashing damage': '91', 'Cold damage': '91', 'Earth damage': '91', 'Fire damage': '91', 'Lightning damage': '91'}, 'items_dropped': ['Margonite Armor', 'Margonite Mask', 'Margonite Robes', 'Margonite Tunic']},
-    5517: {'name': 'Lushivahr the Invoker', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Invoke Lightning', 'Aura of Restoration', 'Chilling Winds', 'Air Attunement', 'Freezing Gust'], 'armor_levels': {}, 'items_dropped': ["Lushivahr's Prism", 'unique', 'Margonite Armor', 'Margonite Mask']},
-    5539: {'name': 'Margonite Reaper', 'profession': ['Dervish'], 'attributes': [{'level': '15', 'name': 'Wind Prayers'}], 'skills_used': ['Mystic Twister', "Abaddon's Favor", 'Faithful Intervention', 'Arcane Zeal', 'Vow of Piety', 'Mystic Healing', "Abaddon's Chosen"], 'armor_levels': {'Blunt damage': '82', 'Piercing damage': '82', 'Slashing damage': '82', 'Cold damage': '82', 'Earth damage': '82', 'Fire damage': '82', 'Lightning damage': '82'}, 'items_dropped': ['Margonite Armor', 'Margonite Mask', 'Margonite Robes', 'Margonite Tunic']},
-    5224: {'name': 'Corporal Suli', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ["Eremite's Attack", 'Armor of Sanctity', 'Veil of Thorns', 'Pious Renewal'], 'armor_levels': {}, 'items_dropped': ['Bolt of Linen', 'Kournan Bracer', 'Kournan Pendant', 'Kournan Spaulder', "Suli's Scythe", 'unique', 'Tanned Hide Square']},
-    5223: {'name': 'Lieutenant Vanahk', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Soul Reaping'}], 'skills_used': ['Life Siphon', 'Signet of Lost Souls', 'Blood is Power', 'Strip Enchantment'], 'armor_levels': {}, 'items_dropped': ['Bolt of Cloth', 'Kournan Bracer', 'Kournan Pendant', 'Kournan Spaulder', "Vanahk's Staff", 'unique']},
-    4244: {'name': 'Lion', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2883: {'name': 'Spirit of Favorable Winds', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4690: {'name': 'Mirage Iboga', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Mantra of Persistence', 'Soothing Images', 'Conjure Phantasm', 'Crippling Anguish'], 'armor_levels': {}, 'items_dropped': ['Iboga Petal', 'Monstrous Eye', 'Plant Fiber', 'Sentient Spore', 'Wood Plank']},
-    4691: {'name': 'Storm Jacaranda', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Air Magic'}], 'skills_used': ['Aura of Restoration', 'Lightning Bolt', 'Lightning Strike', 'Lightning Surge'], 'armor_levels': {'Blunt damage': '66', 'Piercing damage': '66', 'Slashing damage': '66', 'Cold damage': '66', 'Earth damage': '66', 'Fire damage': '66', 'Lightning damage': '66'}, 'items_dropped': ['Bramble Shortbow', 'Malodorous Mass', 'Monstrous Eye', 'Plant Fiber', 'Sentient Spore']},
-    4692: {'name': 'Enchanted Brambles', 'profession': ['Dervish'], 'attributes': [{'level': '14', 'name': 'Earth Prayers'}], 'skills_used': ['Crippling Sweep', 'Aura of Thorns', 'Staggering Force', 'Irresistible Sweep', 'Ebon Dust Aura'], 'armor_levels': {'Blunt damage': '76', 'Piercing damage': '76', 'Slashing damage': '76', 'Cold damage': '76', 'Earth damage': '76', 'Fire damage': '76', 'Lightning damage': '76'}, 'items_dropped': ['Malodorous Mass', 'Monstrous Eye', 'Plant Fiber', 'Sentient Spore', 'Wood Plank']},
-    4693: {'name': 'Whistling Thornbrush', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['Barbed Spear', 'Ballad of Restoration', 'Hexbreaker Aria', 'Song of Restoration', 'Mending Refrain'], 'armor_levels': {'Blunt damage': '86', 'Piercing damage': '86', 'Slashing damage': '86', 'Cold damage': '86', 'Earth damage': '86', 'Fire damage': '86', 'Lightning damage': '86'}, 'items_dropped': ['Malodorous Mass', 'Monstrous Eye', 'Plant Fiber', 'Sentient Spore', 'Wood Plank']},
-    5538: {'name': 'Margonite Bowmaster', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Magebane Shot', 'Crossfire', "Abaddon's Favor", "Abaddon's Chosen", 'Barbed Arrows', "Storm's Embrace"], 'armor_levels': {'Blunt damage': '82', 'Piercing damage': '82', 'Slashing damage': '82', 'Cold damage': '112', 'Earth damage': '112', 'Fire damage': '112', 'Lightning damage': '112'}, 'items_dropped': ['Margonite Armor', 'Margonite Mask', 'Margonite Robes', 'Margonite Tunic']},
-    5674: {'name': 'Projects/NPC models/Humans/Vabbians', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5671: {'name': 'Projects/NPC models/Humans/Vabbians', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5672: {'name': 'Projects/NPC models/Humans/Vabbians', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4658: {'name': 'Chumab the Prideful', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Wild Blow', 'Steady Stance', 'Burst of Aggression', 'Healing Signet', "Bull's Strike"], 'armor_levels': {}, 'items_dropped': ["Chumab's Pride", 'unique', 'Heket Garment', 'Heket Robe', 'Heket Tongue']},
-    4653: {'name': 'Yamesh Mindclouder', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Mantra of Persistence', 'Soothing Images', 'Conjure Phantasm', 'Crippling Anguish'], 'armor_levels': {}, 'items_dropped': ["Yamesh's Anguish", 'unique']},
-    4245: {'name': 'Jahai Rat', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4656: {'name': 'Bolten Largebelly', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Scavenger Strike', 'Troll Unguent', 'Ferocious Strike', 'Charm Animal', 'Call of Haste', 'Maiming Strike'], 'armor_levels': {}, 'items_dropped': ["Bolten's Recurve Bow", 'unique']},
-    5664: {'name': 'Vabbian Priest', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    5702: {'name': 'Vabbian Priest', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    4446: {'name': 'General Morgahn', 'profession': ['Paragon', 'Ranger'], 'attributes': [{'level': '10', 'name': 'Command'}, {'level': '12', 'name': 'Leadership'}, {'level': '8', 'name': 'Spear Mastery'}], 'skills_used': ['Anthem of Flame', "Leader's Comfort", 'Barbed Spear', 'Troll Unguent', 'Resurrection Signet', "Slayer's Spear", '"Find Their Weakness!"', 'Blazing Spear', '"Go for the Eyes!"', '"Never Surrender!"', 'Apply Poison'], 'armor_levels': {}, 'items_dropped': []},
-    5699: {'name': 'Projects/NPC models/Humans/Vabbians', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5679: {'name': 'Projects/NPC models/Humans/Vabbians', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5678: {'name': 'Projects/NPC models/Humans/Vabbians', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5682: {'name': 'Projects/NPC models/Humans/Vabbians', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5697: {'name': 'The Great Zehtuka', 'profession': ['Ranger', 'Mesmer'], 'attributes': [{'level': '15', 'name': 'Expertise'}, {'level': '15', 'name': 'Wilderness Survival'}, {'level': '9', 'name': 'Illusion Magic'}], 'skills_used': ['Fragility', 'Healing Spring', 'Barbed Trap', "Trapper's Speed", 'Flame Trap', 'Smoke Trap', 'Whirling Defense'], 'armor_levels': {}, 'items_dropped': []},
-    5640: {'name': 'Vabbi Guard Captain', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', 'Endure Pain', '"Shields Up!"', 'Healing Signet'], 'armor_levels': {}, 'items_dropped': []},
-    5692: {'name': 'Prince Ahmtur the Mighty', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5641: {'name': 'Lieutenant Murunda', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', 'Healing Signet', 'Endure Pain'], 'armor_levels': {}, 'items_dropped': []},
-    5691: {'name': 'Prince Bokka the Magnificent', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4431: {'name': 'Goren', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', 'Mighty Blow', 'Resurrection Signet', 'Irresistible Blow', "Lion's Comfort", "Soldier's Defense"], 'armor_levels': {}, 'items_dropped': []},
-    4434: {'name': 'Goren', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', 'Mighty Blow', 'Resurrection Signet', 'Irresistible Blow', "Lion's Comfort", "Soldier's Defense"], 'armor_levels': {}, 'items_dropped': []},
-    5693: {'name': 'Prince Mehtu the Wise', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5667: {'name': 'Projects/NPC models/Humans/Vabbians', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4675: {'name': 'Roaring Ether', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4676: {'name': 'Roaring Ether', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4673: {'name': 'Sapphire Djinn', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ['Mystic Sweep', 'Mystic Vigor', 'Zealous Vow', 'Heart of Holy Flame'], 'armor_levels': {'Blunt damage': '82', 'Piercing damage': '82', 'Slashing damage': '82', 'Cold damage': '102', 'Earth damage': '82', 'Fire damage': '62', 'Lightning damage': '82'}, 'items_dropped': ['Ethereal Garment', 'Pile of Glittering Dust', 'Sapphire Djinn Essence']},
-    4312: {'name': 'Sapphire Djinn', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ['Mystic Sweep', 'Mystic Vigor', 'Zealous Vow', 'Heart of Holy Flame'], 'armor_levels': {'Blunt damage': '82', 'Piercing damage': '82', 'Slashing damage': '82', 'Cold damage': '102', 'Earth damage': '82', 'Fire damage': '62', 'Lightning damage': '82'}, 'items_dropped': ['Ethereal Garment', 'Pile of Glittering Dust', 'Sapphire Djinn Essence']},
-    4670: {'name': 'Ruby Djinn', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Fire Magic'}], 'skills_used': ['Immolate', 'Liquid Flame', 'Glowing Gaze', 'Savannah Heat', 'Searing Flames', 'Fire Attunement'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '51', 'Earth damage': '71', 'Fire damage': '91', 'Lightning damage': '71'}, 'items_dropped': ['Ethereal Garment', 'Pile of Glittering Dust', 'Ruby Djinn Essence']},
-    4311: {'name': 'Ruby Djinn', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Fire Magic'}], 'skills_used': ['Immolate', 'Liquid Flame', 'Glowing Gaze', 'Savannah Heat', 'Searing Flames', 'Fire Attunement'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '51', 'Earth damage': '71', 'Fire damage': '91', 'Lightning damage': '71'}, 'items_dropped': ['Ethereal Garment', 'Pile of Glittering Dust', 'Ruby Djinn Essence']},
-    4664: {'name': 'Cobalt Mokele', 'profession': ['Warrior'], 'attributes': [{'level': '15', 'name': 'Strength'}], 'skills_used': ["Lion's Comfort", 'Mokele Smash', 'Hammer Bash', 'Charging Strike', 'Counter Blow'], 'armor_levels': {'Blunt damage': '132', 'Piercing damage': '132', 'Slashing damage': '132', 'Cold damage': '92', 'Earth damage': '92', 'Fire damage': '92', 'Lightning damage': '92'}, 'items_dropped': ['Cobalt Talon', 'Half-Digested Armor']},
-    4626: {'name': 'Jishol Darksong', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ["Leader's Comfort", 'Song of Power', 'Blazing Finale', 'Chorus of Restoration', 'Song of Purification'], 'armor_levels': {}, 'items_dropped': ['Cobalt Talon', 'Half-Digested Armor', 'The Darksong', 'unique']},
-    4665: {'name': 'Cobalt Shrieker', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ["Leader's Comfort", 'Song of Power', 'Blazing Finale', 'Chorus of Restoration', 'Song of Purification'], 'armor_levels': {'Blunt damage': '132', 'Piercing damage': '132', 'Slashing damage': '132', 'Cold damage': '92', 'Earth damage': '92', 'Fire damage': '92', 'Lightning damage': '92'}, 'items_dropped': ['Cobalt Talon']},
-    4429: {'name': 'Norgu', 'profession': ['Mesmer'], 'attributes': [{'level': '7', 'name': 'Fast Casting'}, {'level': '11', 'name': 'Illusion Magic'}, {'level': '10', 'name': 'Inspiration Magic'}], 'skills_used': ['Backfire', 'Physical Resistance', 'Ether Feast', "Wastrel's Demise", 'Mistrust', 'Mantra of Persistence', 'Resurrection Signet', 'Elemental Resistance', 'Shatter Enchantment', 'Clumsiness', 'Conjure Phantasm', 'Empathy', 'Visions of Regret'], 'armor_levels': {}, 'items_dropped': []},
-    5712: {'name': 'Projects/NPC models/Dwarves', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5475: {'name': 'Margonite bosses', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5709: {'name': 'Lyssan Priest', 'profession': ['Monk'], 'attributes': [{'level': '15', 'name': 'Healing Prayers'}], 'skills_used': ['Orison of Healing'], 'armor_levels': {}, 'items_dropped': []},
-    5694: {'name': 'Disciple of Secrets', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Mistrust', 'Energy Surge', 'Cry of Frustration', 'Empathy'], 'armor_levels': {}, 'items_dropped': []},
-    5294: {'name': 'Varesh Ossa', 'profession': ['Dervish', 'Paragon'], 'attributes': [], 'skills_used': ['Enchantment Collapse', 'Natural Resistance', 'Earth Vortex', 'Enemies Must Die!', 'Frost Vortex', 'Call of Sacrifice'], 'armor_levels': {'Blunt damage': '97', 'Piercing damage': '97', 'Slashing damage': '97', 'Cold damage': '97', 'Earth damage': '97', 'Fire damage': '97', 'Lightning damage': '97'}, 'items_dropped': ['Margonite Armor', 'Margonite Robes', 'Margonite Tunic']},
-    5290: {'name': 'Varesh Ossa', 'profession': ['Dervish', 'Paragon'], 'attributes': [], 'skills_used': ['Enchantment Collapse', 'Natural Resistance', 'Earth Vortex', 'Enemies Must Die!', 'Frost Vortex', 'Call of Sacrifice'], 'armor_levels': {'Blunt damage': '97', 'Piercing damage': '97', 'Slashing damage': '97', 'Cold damage': '97', 'Earth damage': '97', 'Fire damage': '97', 'Lightning damage': '97'}, 'items_dropped': ['Margonite Armor', 'Margonite Robes', 'Margonite Tunic']},
-    5473: {'name': 'Margonite bosses', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5474: {'name': 'General Doriah', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ["Magehunter's Smash", 'Healing Signet', 'Staggering Blow', 'Heavy Blow', 'Overbearing Smash'], 'armor_levels': {}, 'items_dropped': []},
-    5472: {'name': 'General Tirraj', 'profession': ['Elementalist'], 'attributes': [{'level': '(20', 'name': 'Air Magic'}, {'level': '20', 'name': 'Water Magic'}], 'skills_used': ['Invoke Lightning', 'Aura of Restoration', 'Chilling Winds', 'Air Attunement', 'Freezing Gust'], 'armor_levels': {}, 'items_dropped': []},
-    4657: {'name': 'Jarimiya the Unmerciful', 'profession': ['Assassin'], 'attributes': [], 'skills_used': ["Wastrel's Collapse", 'Deadly Paradox', 'Malicious Strike', 'Disrupting Dagger', 'Lift Enchantment'], 'armor_levels': {}, 'items_dropped': ['Bottle of Rice Wine', 'Bottle of Vabbian Wine', 'Heket Tongue', "Jarimiya's Daggers", 'unique']},
-    4624: {'name': 'Riktund the Vicious', 'profession': ['Warrior'], 'attributes': [{'level': '15', 'name': 'Strength'}], 'skills_used': ["Lion's Comfort", 'Mokele Smash', 'Hammer Bash', 'Charging Strike', 'Counter Blow'], 'armor_levels': {}, 'items_dropped': ['Cobalt Talon', "Riktund's Maul", 'unique']},
-    4651: {'name': 'Setikor Fireflower', 'profession': ['Elementalist'], 'attributes': [{'level': '(20', 'name': 'Air Magic'}], 'skills_used': ['Meteor', 'Fire Storm', 'Aura of Restoration', 'Lightning Surge', 'Conjure Lightning'], 'armor_levels': {}, 'items_dropped': ['Sentient Spore', "Setikor's Scepter", 'unique']},
-    5708: {'name': 'Messenger of Lyssa', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast'], 'armor_levels': {}, 'items_dropped': []},
-    5635: {'name': 'Projects/NPC models/Humans/Vabbians', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5286: {'name': 'Elder Jonah', 'profession': ['Monk'], 'attributes': [{'level': '0', 'name': 'Divine Favor'}, {'level': '15', 'name': 'Healing Prayers'}], 'skills_used': ['Orison of Healing'], 'armor_levels': {}, 'items_dropped': []},
-    5387: {'name': 'Lormeh', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4970: {'name': 'Madness Titan', 'profession': ['Dervish'], 'attributes': [{'level': '16', 'name': 'Mysticism'}], 'skills_used': ['Aura of Thorns', 'Mirage Cloak', 'Mystic Regeneration', 'Heart of Holy Flame'], 'armor_levels': {'Blunt damage': '94', 'Piercing damage': '94', 'Slashing damage': '94', 'Cold damage': '74', 'Earth damage': '134', 'Fire damage': '94', 'Lightning damage': '94'}, 'items_dropped': []},
-    4966: {'name': 'Shadow Ranger', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Power Shot', 'Troll Unguent', 'Dual Shot', 'Barrage', 'Forked Arrow'], 'armor_levels': {'Blunt damage': '70', 'Piercing damage': '70', 'Slashing damage': '70', 'Cold damage': '100', 'Earth damage': '100', 'Fire damage': '100', 'Lightning damage': '100'}, 'items_dropped': ['Dark Remains', 'Obsidian Shard', 'Pile of Glittering Dust', 'Ruby', 'Sapphire']},
-    2808: {'name': 'Shadow Ranger', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Power Shot', 'Troll Unguent', 'Dual Shot', 'Barrage', 'Forked Arrow'], 'armor_levels': {'Blunt damage': '70', 'Piercing damage': '70', 'Slashing damage': '70', 'Cold damage': '100', 'Earth damage': '100', 'Fire damage': '100', 'Lightning damage': '100'}, 'items_dropped': ['Dark Remains', 'Obsidian Shard', 'Pile of Glittering Dust', 'Ruby', 'Sapphire']},
-    4964: {'name': 'Shadow Monk', 'profession': ['Monk'], 'attributes': [{'level': '15', 'name': 'Healing Prayers'}], 'skills_used': ['Orison of Healing', 'Heal Area', 'Renew Life', 'Restore Life', 'Healing Ring', "Zealot's Fire", 'Word of Healing', 'Healing Breeze'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Dark Remains', 'Obsidian Shard', 'Pile of Glittering Dust']},
-    2806: {'name': 'Shadow Monk', 'profession': ['Monk'], 'attributes': [{'level': '15', 'name': 'Healing Prayers'}], 'skills_used': ['Orison of Healing', 'Heal Area', 'Renew Life', 'Restore Life', 'Healing Ring', "Zealot's Fire", 'Word of Healing', 'Healing Breeze'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Dark Remains', 'Obsidian Shard', 'Pile of Glittering Dust']},
-    4962: {'name': 'Shadow Mesmer', 'profession': ['Mesmer'], 'attributes': [{'level': 'Fissure of Woe:15', 'name': 'Domination Magic'}], 'skills_used': ['Ether Phantom', 'Shatter Enchantment', 'Empathy', 'Visions of Regret', 'Channeling', 'Price of Pride', 'Illusion of Haste'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Dark Remains', 'Obsidian Shard', 'Pile of Glittering Dust', 'Ruby']},
-    2804: {'name': 'Shadow Mesmer', 'profession': ['Mesmer'], 'attributes': [{'level': 'Fissure of Woe:15', 'name': 'Domination Magic'}], 'skills_used': ['Ether Phantom', 'Shatter Enchantment', 'Empathy', 'Visions of Regret', 'Channeling', 'Price of Pride', 'Illusion of Haste'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Dark Remains', 'Obsidian Shard', 'Pile of Glittering Dust', 'Ruby']},
-    4316: {'name': 'Graven Monolith', 'profession': ['Mesmer', 'Dervish', 'Paragon'], 'attributes': [{'level': '16', 'name': 'Illusion Magic'}], 'skills_used': ['Dust Cloak', 'Anthem of Guidance', 'Ether Feast', 'Mighty Throw', 'Mending Refrain', 'Ballad of Restoration', 'Aura of Thorns', 'Clumsiness', 'Mystic Vigor', 'Conjure Phantasm', 'Ebon Dust Aura', "Eremite's Attack", 'Crippling Anguish', 'Rending Sweep', 'Signet of Humility', 'Reform Carvings', 'Anthem of Envy'], 'armor_levels': {'Blunt damage': '106', 'Piercing damage': '106', 'Slashing damage': '106', 'Cold damage': '66', 'Earth damage': '66', 'Fire damage': '66', 'Lightning damage': '66'}, 'items_dropped': ['Inscribed Shard']},
-    4315: {'name': 'Graven Monolith', 'profession': ['Mesmer', 'Dervish', 'Paragon'], 'attributes': [{'level': '16', 'name': 'Illusion Magic'}], 'skills_used': ['Dust Cloak', 'Anthem of Guidance', 'Ether Feast', 'Mighty Throw', 'Mending Refrain', 'Ballad of Restoration', 'Aura of Thorns', 'Clumsiness', 'Mystic Vigor', 'Conjure Phantasm', 'Ebon Dust Aura', "Eremite's Attack", 'Crippling Anguish', 'Rending Sweep', 'Signet of Humility', 'Reform Carvings', 'Anthem of Envy'], 'armor_levels': {'Blunt damage': '106', 'Piercing damage': '106', 'Slashing damage': '106', 'Cold damage': '66', 'Earth damage': '66', 'Fire damage': '66', 'Lightning damage': '66'}, 'items_dropped': ['Inscribed Shard']},
-    4317: {'name': 'Graven Monolith', 'profession': ['Mesmer', 'Dervish', 'Paragon'], 'attributes': [{'level': '16', 'name': 'Illusion Magic'}], 'skills_used': ['Dust Cloak', 'Anthem of Guidance', 'Ether Feast', 'Mighty Throw', 'Mending Refrain', 'Ballad of Restoration', 'Aura of Thorns', 'Clumsiness', 'Mystic Vigor', 'Conjure Phantasm', 'Ebon Dust Aura', "Eremite's Attack", 'Crippling Anguish', 'Rending Sweep', 'Signet of Humility', 'Reform Carvings', 'Anthem of Envy'], 'armor_levels': {'Blunt damage': '106', 'Piercing damage': '106', 'Slashing damage': '106', 'Cold damage': '66', 'Earth damage': '66', 'Fire damage': '66', 'Lightning damage': '66'}, 'items_dropped': ['Inscribed Shard']},
-    5404: {'name': 'Harbinger', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Hundred Blades', 'Burst of Aggression', 'Sever Artery', 'Gash', 'Shield Bash'], 'armor_levels': {}, 'items_dropped': []},
-    5584: {'name': 'Spirit of Seborhin', 'profession': [], 'attributes': [], 'skills_used': ['Create Light of Seborhin'], 'armor_levels': {}, 'items_dropped': []},
-    5710: {'name': 'Horticulturist Hinon', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Create Light of Seborhin'], 'armor_levels': {}, 'items_dropped': []},
-    4851: {'name': 'Istani Peasant', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Troll Unguent'], 'armor_levels': {}, 'items_dropped': []},
-    4850: {'name': 'Istani Peasant', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Troll Unguent'], 'armor_levels': {}, 'items_dropped': []},
-    4852: {'name': 'Istani Peasant', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Troll Unguent'], 'armor_levels': {}, 'items_dropped': []},
-    5467: {'name': 'Priest Zein Zuu', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Spell Breaker', 'Divine Intervention', 'Watchful Healing', 'Dismiss Condition', 'Aegis'], 'armor_levels': {}, 'items_dropped': []},
-    5466: {'name': 'Scribe Wensal', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Invoke Lightning', 'Aura of Restoration', 'Chilling Winds', 'Air Attunement', 'Freezing Gust'], 'armor_levels': {}, 'items_dropped': []},
-    5471: {'name': 'Commander Chutal', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['"Brace Yourself!"', 'Anthem of Guidance', "Leader's Comfort", '"Go for the Eyes!"', 'Swift Javelin'], 'armor_levels': {}, 'items_dropped': []},
-    5470: {'name': 'Zealot Sheoli', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ['Mystic Twister', 'Faithful Intervention', 'Arcane Zeal', 'Vow of Piety', 'Mystic Healing'], 'armor_levels': {}, 'items_dropped': ['Margonite Robes']},
-    4914: {'name': 'Ntouka Bird', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Supportive Spirit', 'Glimmer of Light', 'Healing Breeze', 'Restful Breeze'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Half-Digested Armor']},
-    4943: {'name': 'Tormented Land', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Heavy Blow', 'Irresistible Blow', 'Staggering Blow'], 'armor_levels': {}, 'items_dropped': ['Granite Slab', 'Lump of Charcoal', 'Ruby', 'Sapphire']},
-    5235: {'name': 'Sergeant Behnwa', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Savage Shot', 'Troll Unguent', 'Crossfire', 'Strike as One', 'Disrupting Lunge', 'Charm Animal'], 'armor_levels': {}, 'items_dropped': ["Benwah's Recurve Bow", 'unique', 'Bolt of Linen', 'Kournan Bracer', 'Kournan Spaulder']},
-    4258: {'name': 'Elder Hyena', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4906: {'name': 'Immolated Djinn', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Fire Magic'}], 'skills_used': ['Immolate', 'Searing Flames', 'Glowing Gaze', 'Liquid Flame'], 'armor_levels': {}, 'items_dropped': ['Ethereal Garment', 'Immolated Djinn Essence', 'Pile of Glittering Dust']},
-    5007: {'name': 'Ascension Pilgrim', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5006: {'name': 'Dynastic Spirit', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5611: {'name': 'Dynastic Spirit', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5005: {'name': 'Dynastic Spirit', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5613: {'name': 'Dynastic Spirit', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4671: {'name': 'Diamond Djinn', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['Anthem of Flame', "Leader's Comfort", 'Angelic Bond', 'Merciless Spear', 'Spear of Lightning'], 'armor_levels': {'Blunt damage': '107', 'Piercing damage': '107', 'Slashing damage': '107', 'Cold damage': '107', 'Earth damage': '87', 'Fire damage': '107', 'Lightning damage': '107'}, 'items_dropped': ['Diamond Djinn Essence', 'Ethereal Garment', 'Pile of Glittering Dust']},
-    5566: {'name': 'Vahlen the Silent', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ['Crippling Sweep', 'Vow of Silence', 'Faithful Intervention', 'Reap Impurities', 'Rending Sweep'], 'armor_levels': {}, 'items_dropped': ['Battered Armor', 'Bone', 'Mummy Wrapping', "Vahlen's Vow", 'unique']},
-    5577: {'name': 'Awakened Acolyte', 'profession': ['Monk'], 'attributes': [{'level': '15', 'name': 'Smiting Prayers'}], 'skills_used': ['Renew Life', "Scribe's Insight", 'Life Bond', 'Signet of Devotion', 'Banish', 'Signet of Judgment', 'Castigation Signet', 'Watchful Healing', 'Reversal of Damage', 'Dismiss Condition', 'Ray of Judgment', 'Blessed Signet', 'Signet of Rage', 'Shield of Absorption', 'Scourge Healing', 'Bane Signet', 'Heal Party', 'Signet of Rejuvenation'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Battered Armor', 'Bone', 'Crescent Axe', 'Dead Staff', 'Monstrous Eye', 'Monstrous Fang', 'Mummy Wrapping', 'Pile of Glittering Dust', 'Rusted Greave']},
-    5575: {'name': 'Awakened Defiler', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Curses'}], 'skills_used': ['Icy Veins', 'Dark Pact', 'Animate Flesh Golem', 'Vocal Minority', 'Putrid Bile', 'Faintheartedness', 'Taste of Death', 'Bitter Chill', 'Barbed Signet', 'Signet of Suffering', 'Well of Darkness', 'Blood of the Master', 'Withering Aura', 'Parasitic Bond', 'Animate Bone Minions', 'Deathly Swarm', 'Death Nova'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Bone', 'Crescent Axe', 'Dead Scepter', 'Dead Staff', 'Monstrous Claw', 'Monstrous Eye', 'Monstrous Fang', 'Mummy Wrapping', 'Necrid Robes', 'Pile of Glittering Dust']},
-    5582: {'name': 'Awakened Dune Carver', 'profession': ['Dervish'], 'attributes': [{'level': '15', 'name': 'Earth Prayers'}, {'level': '15', 'name': 'Scythe Mastery'}], 'skills_used': ['Mystic Sweep', 'Zealous Vow', 'Banishing Strike', 'Vow of Silence', 'Conviction', 'Staggering Force', "Balthazar's Rage", 'Faithful Intervention', "Eremite's Attack", 'Ebon Dust Aura', 'Reap Impurities', 'Rending Sweep'], 'armor_levels': {'Blunt damage': '82', 'Piercing damage': '82', 'Slashing damage': '82', 'Cold damage': '82', 'Earth damage': '82', 'Fire damage': '82', 'Lightning damage': '82'}, 'items_dropped': ['Battered Armor', 'Bone', 'Crescent Axe', 'Dead Staff', 'Monstrous Eye', 'Monstrous Fang', 'Mummy Wrapping', 'Pile of Glittering Dust', 'Rusted Greave']},
-    5574: {'name': 'Awakened Thought Leech', 'profession': ['Mesmer'], 'attributes': [{'level': '(20', 'name': 'Domination Magic'}], 'skills_used': ['Arcane Conundrum', 'Ether Feast', 'Phantom Pain', 'Migraine', 'Hex Eater Vortex', 'Ignorance', 'Cry of Frustration', 'Arcane Echo', 'Accumulated Pain', 'Symbolic Posture', 'Conjure Phantasm', 'Ethereal Burden', 'Leech Signet', 'Images of Remorse', 'Signet of Humility', 'Shrinking Armor'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Battered Armor', 'Bone', 'Crescent Axe', 'Dead Bow', 'Monstrous Claw', 'Monstrous Eye', 'Monstrous Fang', 'Mummy Wrapping', 'Pile of Glittering Dust', 'Rusted Greave']},
-    5576: {'name': 'Carven Effigy', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Earth Magic'}], 'skills_used': ['Glowstone', 'Earth Attunement', 'Stoning', 'Aura of Restoration', 'Enervating Charge', 'Stoneflesh Aura', 'Earthquake', 'Obsidian Flame', 'Obsidian Flesh', 'Gale', 'Aftershock', 'Stone Sheath', 'Ebon Hawk', 'Stone Daggers'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Battered Armor', 'Lump of Charcoal', 'Dead Bow', 'Decayed Garment', 'Granite Slab', 'Lump of Charcoal', 'Mummy Wrapping', 'Ruby', 'Sapphire']},
-    5587: {'name': 'Carven Effigy', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Earth Magic'}], 'skills_used': ['Glowstone', 'Earth Attunement', 'Stoning', 'Aura of Restoration', 'Enervating Charge', 'Stoneflesh Aura', 'Earthquake', 'Obsidian Flame', 'Obsidian Flesh', 'Gale', 'Aftershock', 'Stone Sheath', 'Ebon Hawk', 'Stone Daggers'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Battered Armor', 'Lump of Charcoal', 'Dead Bow', 'Decayed Garment', 'Granite Slab', 'Lump of Charcoal', 'Mummy Wrapping', 'Ruby', 'Sapphire']},
-    5623: {'name': 'Carven Effigy', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Earth Magic'}], 'skills_used': ['Glowstone', 'Earth Attunement', 'Stoning', 'Aura of Restoration', 'Enervating Charge', 'Stoneflesh Aura', 'Earthquake', 'Obsidian Flame', 'Obsidian Flesh', 'Gale', 'Aftershock', 'Stone Sheath', 'Ebon Hawk', 'Stone Daggers'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Battered Armor', 'Lump of Charcoal', 'Dead Bow', 'Decayed Garment', 'Granite Slab', 'Lump of Charcoal', 'Mummy Wrapping', 'Ruby', 'Sapphire']},
-    5579: {'name': 'Awakened Gray Giant', 'profession': ['Ranger'], 'attributes': [{'level': '15', 'name': 'Wilderness Survival'}], 'skills_used': ['Quicksand', 'Troll Unguent', 'Barrage', 'Roaring Winds', 'Choking Gas', 'Debilitating Shot', 'Lightning Reflexes', 'Concussion Shot'], 'armor_levels': {'Blunt damage': '82', 'Piercing damage': '82', 'Slashing damage': '82', 'Cold damage': '112', 'Earth damage': '112', 'Fire damage': '112', 'Lightning damage': '112'}, 'items_dropped': ['Battered Armor', 'Bone', 'Crescent Axe', 'Monstrous Eye', 'Monstrous Fang', 'Mummy Wrapping', 'Pile of Glittering Dust', 'Rusted Greave']},
-    5628: {'name': 'Awakened Gray Giant', 'profession': ['Ranger'], 'attributes': [{'level': '15', 'name': 'Wilderness Survival'}], 'skills_used': ['Quicksand', 'Troll Unguent', 'Barrage', 'Roaring Winds', 'Choking Gas', 'Debilitating Shot', 'Lightning Reflexes', 'Concussion Shot'], 'armor_levels': {'Blunt damage': '82', 'Piercing damage': '82', 'Slashing damage': '82', 'Cold damage': '112', 'Earth damage': '112', 'Fire damage': '112', 'Lightning damage': '112'}, 'items_dropped': ['Battered Armor', 'Bone', 'Crescent Axe', 'Monstrous Eye', 'Monstrous Fang', 'Mummy Wrapping', 'Pile of Glittering Dust', 'Rusted Greave']},
-    5718: {'name': 'Spirit of Quicksand', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4321: {'name': 'Shambling Mesa', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Mighty Blow', 'Stun Immunity', 'Irresistible Blow', 'Devastating Hammer', 'Flail'], 'armor_levels': {'Blunt damage': '101', 'Piercing damage': '101', 'Slashing damage': '101', 'Cold damage': '101', 'Earth damage': '101', 'Fire damage': '101', 'Lightning damage': '101'}, 'items_dropped': ['Granite Slab', 'Lump of Charcoal', 'Ruby', 'Sandblasted Lodestone', 'Sapphire']},
-    4322: {'name': 'Sandstorm Crag', 'profession': ['Elementalist'], 'attributes': [{'level': '13', 'name': 'Earth Magic'}], 'skills_used': ['Stoning', 'Stun Immunity', 'Aura of Restoration', 'Stun on Critical Hit', 'Sandstorm', 'Aftershock', 'Stone Daggers'], 'armor_levels': {'Blunt damage': '101', 'Piercing damage': '101', 'Slashing damage': '101', 'Cold damage': '101', 'Earth damage': '101', 'Fire damage': '101', 'Lightning damage': '101'}, 'items_dropped': ['Granite Slab', 'Lump of Charcoal', 'Ruby', 'Sandblasted Lodestone', 'Sapphire']},
-    5090: {'name': 'Shahai the Cunning', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Smite Hex', 'Divine Boon'], 'armor_levels': {}, 'items_dropped': []},
-    5607: {'name': 'Palawa Joko', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Blood Magic'}], 'skills_used': ['Icy Veins', 'Lifebane Strike', 'Vampiric Gaze', 'Order of the Lich (Palawa Joko)', 'Faintheartedness', 'Discord', 'Motivating Insults', 'Animate Undead (Palawa Joko)', 'Scourge of Candy', 'Signet of Suffering', 'Blood Drinker', 'Well of Darkness', 'Shadow Strike', 'Aura of the Lich', 'Taste of Undeath', 'Life Siphon', 'Order of Unholy Vigor (Palawa Joko)', 'Feast of Corruption'], 'armor_levels': {}, 'items_dropped': []},
-    5568: {'name': 'Queen Aijundu', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Queen Siege', 'Queen Heal', 'Blinding Breath', 'Choking Breath', 'Queen Bite', 'Burning Breath', 'Queen Thump'], 'armor_levels': {'Blunt damage': '140', 'Piercing damage': '140', 'Slashing damage': '140', 'Cold damage': '100', 'Earth damage': '100', 'Fire damage': '100', 'Lightning damage': '100'}, 'items_dropped': []},
-    5578: {'name': 'Awakened Blademaster', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Signet of Strength', '"Watch Yourself!"', "Soldier's Strike", "Soldier's Stance", 'Barbarous Slice', 'Galrath Slash', 'Distracting Blow', 'Final Thrust', '"For Great Justice!"', 'Quivering Blade'], 'armor_levels': {'Blunt damage': '127', 'Piercing damage': '127', 'Slashing damage': '127', 'Cold damage': '107', 'Earth damage': '107', 'Fire damage': '107', 'Lightning damage': '107'}, 'items_dropped': ['Crescent Axe', 'Dead Bow', 'Dead Staff', "Executioner's Breastplate", 'Monstrous Eye', 'Monstrous Fang', 'Mummy Wrapping', 'Pile of Glittering Dust']},
-    5583: {'name': 'Awakened Cavalier', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['Blazing Spear', 'Disrupting Throw', 'Mighty Throw', 'Anthem of Fury', "Harrier's Toss", "Soldier's Fury", '"Make Your Time!"', 'Spear of Redemption', 'Signet of Return', '"Go for the Eyes!"', '"We Shall Return!"'], 'armor_levels': {'Blunt damage': '107', 'Piercing damage': '107', 'Slashing damage': '107', 'Cold damage': '107', 'Earth damage': '107', 'Fire damage': '107', 'Lightning damage': '107'}, 'items_dropped': ['Battered Armor', 'Bone', 'Crescent Axe', 'Dead Staff', 'Decayed Garment', 'Monstrous Claw', 'Monstrous Fang', 'Mummy Wrapping', 'Pile of Glittering Dust', 'Rusted Greave']},
-    5573: {'name': 'Chakeh the Lonely', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['Disrupting Throw', "Soldier's Fury", '"Make Your Time!"', 'Signet of Return', '"Go for the Eyes!"', '"We Shall Return!"'], 'armor_levels': {}, 'items_dropped': ['Crescent Axe']},
-    5571: {'name': 'Avah the Crafty', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ["Soldier's Strike", "Soldier's Stance", 'Distracting Blow', 'Final Thrust', '"For Great Justice!"'], 'armor_levels': {}, 'items_dropped': ["Executioner's Breastplate"]},
-    5572: {'name': 'Chundu the Meek', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ['Crippling Sweep', 'Vow of Silence', 'Faithful Intervention', 'Reap Impurities', 'Rending Sweep'], 'armor_levels': {}, 'items_dropped': []},
-    5569: {'name': 'Amind the Bitter', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Hex Eater Vortex', 'Ignorance', 'Cry of Frustration', 'Signet of Humility'], 'armor_levels': {}, 'items_dropped': []},
-    5570: {'name': 'Nehmak the Unpleasant', 'profession': ['Necromancer'], 'attributes': [{'level': '16', 'name': 'Curses'}], 'skills_used': ['Vocal Minority', 'Faintheartedness', 'Signet of Suffering', 'Well of Darkness', 'Parasitic Bond'], 'armor_levels': {}, 'items_dropped': ['Mummy Wrapping']},
-    5599: {'name': 'Junundu Young', 'profession': [], 'attributes': [], 'skills_used': ['Queen Siege', 'Queen Heal', 'Blinding Breath', 'Choking Breath', 'Queen Bite', 'Burning Breath', 'Queen Thump', 'Junundu Tunnel (monster skill)'], 'armor_levels': {}, 'items_dropped': []},
-    4828: {'name': 'Sahlahjar the Dead', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5592: {'name': 'Minion of Joko', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4305: {'name': 'Ravenous Mandragor', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Blood Magic'}, {'level': '0', 'name': 'Death Magic'}, {'level': '16 Death Magic in', 'name': 'hard mode'}], 'skills_used': ['Unholy Feast', 'Barbed Signet', 'Ravenous Gaze', 'Blood of the Aggressor', 'Dark Aura'], 'armor_levels': {'Blunt damage': '66', 'Piercing damage': '66', 'Slashing damage': '66', 'Cold damage': '66', 'Earth damage': '66', 'Fire damage': '66', 'Lightning damage': '66'}, 'items_dropped': ['Luminous Stone', 'Mandragor Husk']},
-    4307: {'name': 'Mandragor Terror', 'profession': ['Warrior'], 'attributes': [{'level': '15', 'name': 'Strength'}], 'skills_used': ['Dismember', 'Headbutt', "Lion's Comfort", 'Burst of Aggression'], 'armor_levels': {'Blunt damage': '86', 'Piercing damage': '86', 'Slashing damage': '86', 'Cold damage': '66', 'Earth damage': '66', 'Fire damage': '66', 'Lightning damage': '66'}, 'items_dropped': ['Luminous Stone', 'Mandragor Husk']},
-    4306: {'name': 'Mandragor Sand Devil', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Earth Magic'}], 'skills_used': ['Ward Against Foes', 'Aura of Restoration', 'Stoneflesh Aura', 'Obsidian Flame', 'Stone Sheath'], 'armor_levels': {'Blunt damage': '66', 'Piercing damage': '66', 'Slashing damage': '66', 'Cold damage': '66', 'Earth damage': '66', 'Fire damage': '66', 'Lightning damage': '66'}, 'items_dropped': ['Luminous Stone', 'Mandragor Husk']},
-    5547: {'name': 'Ghostly Scout', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['Anthem of Flame', 'Cruel Spear'], 'armor_levels': {}, 'items_dropped': []},
-    5548: {'name': 'Ghostly Scout', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['Anthem of Flame', 'Cruel Spear'], 'armor_levels': {}, 'items_dropped': []},
-    4319: {'name': 'Bladed Dune Termite', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Swift Chop', 'Critical Chop', 'Disrupting Chop', 'Cleave'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Chitin Fragment', 'Dusty Insect Carapace', 'Monstrous Claw']},
-    4320: {'name': 'Dune Beetle Lance', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['Cruel Spear', "Harrier's Toss", "Slayer's Spear", 'Vicious Attack', 'Anthem of Envy'], 'armor_levels': {'Blunt damage': '80', 'Piercing damage': '80', 'Slashing damage': '80', 'Cold damage': '80', 'Earth damage': '80', 'Fire damage': '80', 'Lightning damage': '80'}, 'items_dropped': ['Chitin Fragment', 'Dusty Insect Carapace']},
-    4303: {'name': 'Dune Spider', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Screaming Shot', 'Troll Unguent', 'Debilitating Shot', 'Quick Shot', 'Apply Poison'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Dusty Insect Carapace', 'Silken Spider Web']},
-    5580: {'name': 'Awakened Head', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Illusion Magic'}], 'skills_used': ['Frustration', 'Leech Signet', 'Web of Disruption', 'Drain Delusions'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': []},
-    5606: {'name': 'Projects/NPC models/Skeletons', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5272: {'name': 'Chirah', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5626: {'name': 'Awakened', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5625: {'name': 'Awakened', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5630: {'name': 'Awakened', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5624: {'name': 'Awata', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5588: {'name': 'Thrall', 'profession': [], 'attributes': [], 'skills_used': ['Awakened Acolyte', 'Awakened Dune Carver', 'Carven Effigy', 'Awakened Thought Leech', 'Awakened Cavalier', 'Awakened Defiler', 'Awakened Gray Giant', 'Awakened Blademaster'], 'armor_levels': {}, 'items_dropped': []},
-    5589: {'name': 'Thrall', 'profession': [], 'attributes': [], 'skills_used': ['Awakened Acolyte', 'Awakened Dune Carver', 'Carven Effigy', 'Awakened Thought Leech', 'Awakened Cavalier', 'Awakened Defiler', 'Awakened Gray Giant', 'Awakened Blademaster'], 'armor_levels': {}, 'items_dropped': []},
-    5585: {'name': 'Thrall', 'profession': [], 'attributes': [], 'skills_used': ['Awakened Acolyte', 'Awakened Dune Carver', 'Carven Effigy', 'Awakened Thought Leech', 'Awakened Cavalier', 'Awakened Defiler', 'Awakened Gray Giant', 'Awakened Blademaster'], 'armor_levels': {}, 'items_dropped': []},
-    5590: {'name': 'Thrall', 'profession': [], 'attributes': [], 'skills_used': ['Awakened Acolyte', 'Awakened Dune Carver', 'Carven Effigy', 'Awakened Thought Leech', 'Awakened Cavalier', 'Awakened Defiler', 'Awakened Gray Giant', 'Awakened Blademaster'], 'armor_levels': {}, 'items_dropped': []},
-    5615: {'name': 'Ghostly Priest', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5596: {'name': 'Primeval King Jahnus', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Swift Chop', 'Cyclone Axe', 'Disrupting Chop'], 'armor_levels': {}, 'items_dropped': []},
-    4314: {'name': 'Nomad Giant', 'profession': ['Ranger'], 'attributes': [{'level': '15', 'name': 'Wilderness Survival'}], 'skills_used': ['Troll Unguent', 'Barbed Trap', "Trapper's Speed", 'Flame Trap', 'Smoke Trap', 'Giant Stomp', 'Whirling Defense'], 'armor_levels': {'Blunt damage': '82', 'Piercing damage': '82', 'Slashing damage': '82', 'Cold damage': '112', 'Earth damage': '112', 'Fire damage': '112', 'Lightning damage': '112'}, 'items_dropped': ['Giant Tusk', "Giant's Boots"]},
-    5559: {'name': 'Koahm the Weary', 'profession': ['Ranger'], 'attributes': [{'level': '16', 'name': 'Wilderness Survival'}], 'skills_used': ['Quicksand', 'Troll Unguent', 'Choking Gas', 'Debilitating Shot', 'Concussion Shot'], 'armor_levels': {}, 'items_dropped': ["Koahm's Flatbow", 'unique', 'Mummy Wrapping']},
-    4313: {'name': 'Sadistic Giant', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Blood Magic'}, {'level': '0', 'name': 'Curses'}, {'level': '16 Curses in', 'name': 'Hard mode'}], 'skills_used': ['Ulcerous Lungs', 'Vampiric Gaze', 'Chilblains', 'Giant Stomp', 'Plague Signet', 'Signet of Agony'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ["Giant's Boots", 'Giant Tusk']},
-    4300: {'name': 'Uhiwi the Smoky', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Barbed Trap', "Trapper's Speed", 'Flame Trap', 'Smoke Trap', 'Giant Stomp'], 'armor_levels': {}, 'items_dropped': ['Giant Tusk', "Giant's Boots", "Uhiwi's Shortbow", 'unique']},
-    5610: {'name': 'Elder Siege Wurm', 'profession': [], 'attributes': [], 'skills_used': ['Queen Heal', 'Blinding Breath', 'Choking Breath', 'Queen Bite', 'Burning Breath', 'Queen Thump', 'Junundu Tunnel (monster skill)'], 'armor_levels': {}, 'items_dropped': ['Battered Armor', 'Dead Bow', 'Decayed Garment', 'Rusted Greave']},
-    5563: {'name': 'Amiresh the Pious', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Draw Conditions', 'Watchful Healing', 'Purge Conditions', 'Guardian', 'Divert Hexes'], 'armor_levels': {}, 'items_dropped': ["Amiresh's Piety", 'unique', 'Bone']},
-    5486: {'name': 'Horde of Darkness', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4323: {'name': 'Desert Wurm', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5447: {'name': 'Blade of Corruption', 'profession': ['Warrior'], 'attributes': [{'level': '16', 'name': 'Strength'}], 'skills_used': ['Hundred Blades', 'Burst of Aggression', 'Sever Artery', 'Shield Bash', 'Call to the Torment', "Lion's Comfort"], 'armor_levels': {'Blunt damage': '124', 'Piercing damage': '124', 'Slashing damage': '124', 'Cold damage': '104', 'Earth damage': '104', 'Fire damage': '104', 'Lightning damage': '104'}, 'items_dropped': ['Demonic Relic']},
-    5366: {'name': 'Captain Mehhan', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5631: {'name': 'Projects/NPC models/Zombies', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4983: {'name': 'Tormented Soul', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4984: {'name': 'Tormented Soul', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4988: {'name': 'Tormented Soul', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4989: {'name': 'Tormented Soul', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4985: {'name': 'Secret Keeper', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5446: {'name': 'Word of Madness', 'profession': ['Monk'], 'attributes': [{'level': '16', 'name': 'Smiting Prayers'}], 'skills_used': ['Scourge Enchantment', "Judge's Insight", 'Reversal of Damage', 'Call to the Torment', 'Signet of Devotion', 'Smite Hex', "Defender's Zeal"], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '83', 'Lightning damage': '83'}, 'items_dropped': ['Demonic Relic']},
-    5445: {'name': 'Rain of Terror', 'profession': ['Elementalist'], 'attributes': [{'level': '16', 'name': 'Energy Storage'}, {'level': '16', 'name': 'Water Magic'}], 'skills_used': ['Mind Freeze', 'Glyph of Restoration', 'Blurred Vision', 'Call to the Torment', 'Ice Spikes', 'Deep Freeze'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '83', 'Lightning damage': '83'}, 'items_dropped': ['Demonic Relic']},
-    5444: {'name': 'Shadow of Fear', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5449: {'name': 'Scythe of Chaos', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4959: {'name': 'Scythe of Chaos', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    7316: {'name': 'Scythe of Chaos', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5450: {'name': 'Spear of Torment', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['Barbed Spear', 'Ballad of Restoration', 'Anthem of Fury', "Harrier's Toss", 'Aggressive Refrain', 'Call to the Torment', 'Wild Throw'], 'armor_levels': {'Blunt damage': '103', 'Piercing damage': '103', 'Slashing damage': '103', 'Cold damage': '103', 'Earth damage': '103', 'Fire damage': '103', 'Lightning damage': '103'}, 'items_dropped': ['Demonic Relic']},
-    5443: {'name': 'Herald of Nightmares', 'profession': ['Mesmer'], 'attributes': [{'level': '16', 'name': 'Domination Magic'}], 'skills_used': ['Ether Feast', "Wastrel's Demise", 'Shatter Enchantment', 'Power Drain', 'Power Flux', 'Call to the Torment'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '83', 'Lightning damage': '83'}, 'items_dropped': ['Demonic Relic']},
-    5448: {'name': 'Arm of Insanity', 'profession': ['Ranger'], 'attributes': [{'level': 'Level 20 (26):(14-16', 'name': 'Expertise'}, {'level': '16-17', 'name': 'Marksmanship'}, {'level': '16', 'name': 'Wilderness Survival'}], 'skills_used': ['Troll Unguent', 'Quickening Zephyr', 'Barrage', 'Debilitating Shot', 'Lightning Reflexes', 'Call to the Torment'], 'armor_levels': {'Blunt damage': '94', 'Piercing damage': '94', 'Slashing damage': '94', 'Cold damage': '124', 'Earth damage': '124', 'Fire damage': '124', 'Lightning damage': '124'}, 'items_dropped': ['Demonic Relic']},
-    5430: {'name': 'Onslaught of Terror', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ['Chilling Victory', "Lyssa's Assault", 'Zealous Renewal', 'Onslaught', "Eremite's Attack", "Attacker's Insight"], 'armor_levels': {}, 'items_dropped': ['Demonic Relic', 'Terror Scythe', 'unique']},
-    5003: {'name': 'Projects/NPC models/Zombies', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5520: {'name': 'Chimor the Lightblooded', 'profession': ['Assassin'], 'attributes': [], 'skills_used': ['Deadly Paradox', 'Deadly Haste', 'Disrupting Dagger', "Abaddon's Chosen", 'Dancing Daggers', 'Mark of Insecurity'], 'armor_levels': {}, 'items_dropped': ["Chimor's Daggers", 'unique', 'Margonite Armor', 'Margonite Mask']},
-    5017: {'name': 'Scout Ahktum', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Savage Shot', 'Crossfire', 'Burning Arrow', 'Pin Down'], 'armor_levels': {}, 'items_dropped': []},
-    5018: {'name': 'Thenemi', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Mistrust', 'Spiritual Pain', 'Simple Thievery', 'Power Spike', 'Power Drain'], 'armor_levels': {}, 'items_dropped': []},
-    5014: {'name': 'Garfaz Steelfur', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ["Executioner's Strike", 'Cyclone Axe', 'Headbutt', "Lion's Comfort", 'Flail'], 'armor_levels': {}, 'items_dropped': []},
-    5013: {'name': 'Captain Yithlis', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Signet of Removal', 'Pensive Guardian', 'Guardian'], 'armor_levels': {}, 'items_dropped': []},
-    5015: {'name': 'Igraine', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Aura of Restoration', 'Frigid Armor', 'Freezing Gust', 'Ice Spikes', 'Deep Freeze', 'Ether Prism'], 'armor_levels': {}, 'items_dropped': []},
-    5016: {'name': 'The Lost', 'profession': ['Paragon'], 'attributes': [{'level': '14', 'name': 'Command'}], 'skills_used': ['"Go for the Eyes!"', '"Stand Your Ground!"', 'Anthem of Guidance', '"Find Their Weakness!"'], 'armor_levels': {}, 'items_dropped': []},
-    5483: {'name': "Abaddon's Adjutant", 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Magebane Shot', 'Crossfire', 'Barbed Arrows', "Storm's Embrace"], 'armor_levels': {}, 'items_dropped': ['Margonite Mask']},
-    5412: {'name': 'Emissary of Dhuum', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5425: {'name': 'Emissary of Dhuum', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2321: {'name': 'Terrorweb Dryder', 'profession': ['Elementalist'], 'attributes': [{'level': '16', 'name': 'Fire Magic'}], 'skills_used': ['Immolate', 'Aura of Restoration', 'Lava Font', 'Mark of Rodgort', 'Meteor Shower', 'Fireball'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '83', 'Lightning damage': '83'}, 'items_dropped': ['Tomb of the Primeval Kings', 'Demonic Fang', 'Glob of Ectoplasm', 'Pile of Glittering Dust', 'Ruby', 'Sapphire', 'Storm Bow', 'Eternal Bow', 'Eternal Shield']},
-    4973: {'name': 'Rukkassa', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Healing Touch', 'Signet of Judgment', 'Reversal of Damage', "Zealot's Fire", 'Words of Comfort'], 'armor_levels': {}, 'items_dropped': []},
-    5427: {'name': 'Tortureweb Dryder', 'profession': ['Elementalist'], 'attributes': [{'level': '16', 'name': 'Fire Magic'}], 'skills_used': ['Liquid Flame', 'Meteor', 'Mark of Rodgort', 'Searing Flames', 'Enraged', 'Glyph of Concentration', 'Fire Attunement'], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '100', 'Slashing damage': '100', 'Cold damage': '101', 'Earth damage': '101', 'Fire damage': '101', 'Lightning damage': '101'}, 'items_dropped': ['Titan Gemstone']},
-    5215: {'name': 'Tortureweb Dryder', 'profession': ['Elementalist'], 'attributes': [{'level': '16', 'name': 'Fire Magic'}], 'skills_used': ['Liquid Flame', 'Meteor', 'Mark of Rodgort', 'Searing Flames', 'Enraged', 'Glyph of Concentration', 'Fire Attunement'], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '100', 'Slashing damage': '100', 'Cold damage': '101', 'Earth damage': '101', 'Fire damage': '101', 'Lightning damage': '101'}, 'items_dropped': ['Titan Gemstone']},
-    2358: {'name': 'Lost Soul', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5491: {'name': 'Apostate', 'profession': ['Monk'], 'attributes': [{'level': '11', 'name': 'Divine Favor'}, {'level': '12', 'name': 'Protection Prayers'}], 'skills_used': ['Spell Breaker', "Abaddon's Favor", 'Divine Intervention', 'Watchful Healing', 'Dismiss Condition', "Abaddon's Chosen", 'Aegis'], 'armor_levels': {}, 'items_dropped': []},
-    5436: {'name': 'Storm of Anguish', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Mind Freeze', 'Glyph of Restoration', 'Blurred Vision', 'Ice Spikes', 'Deep Freeze'], 'armor_levels': {}, 'items_dropped': ['Stormborn Artifact', 'unique']},
-    5439: {'name': 'Shrieker of Dread', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['Anthem of Flame', 'Barbed Spear', "Leader's Comfort", 'Stunning Strike', 'Vicious Attack'], 'armor_levels': {}, 'items_dropped': ['Shrieking Spear', 'unique']},
-    4128: {'name': "Shiro'ken Elementalist", 'profession': ['Elementalist'], 'attributes': [{'level': 'Level 28 (30): 16', 'name': 'Earth Magic'}, {'level': '16', 'name': 'Fire Magic'}, {'level': '20 Fire Magic in', 'name': 'Hard Mode'}], 'skills_used': ['Sliver Armor', 'Burning Speed', 'Aura of Restoration', 'Star Burst', 'Obsidian Flame', 'Song of the Mists'], 'armor_levels': {'Blunt damage': '84', 'Piercing damage': '84', 'Slashing damage': '84', 'Cold damage': '84', 'Earth damage': '84', 'Fire damage': '84', 'Lightning damage': '84'}, 'items_dropped': ['Soul Stone']},
-    4969: {'name': 'Pain Titan', 'profession': ['Elementalist'], 'attributes': [{'level': '16', 'name': 'Fire Magic'}], 'skills_used': ['Liquid Flame', 'Mind Blast', 'Aura of Restoration', 'Fire Attunement', 'Fireball'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '63', 'Earth damage': '83', 'Fire damage': '123', 'Lightning damage': '83'}, 'items_dropped': []},
-    4129: {'name': "Shiro'ken Monk", 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Shield Guardian', 'Spell Breaker', 'Spell Shield', 'Divine Intervention', 'Reverse Hex', 'Song of the Mists'], 'armor_levels': {'Blunt damage': '84', 'Piercing damage': '84', 'Slashing damage': '84', 'Cold damage': '84', 'Earth damage': '84', 'Fire damage': '84', 'Lightning damage': '84'}, 'items_dropped': ['Soul Stone']},
-    4126: {'name': "Shiro'ken Mesmer", 'profession': ['Mesmer'], 'attributes': [{'level': 'Level 28 (30): 16', 'name': 'Domination Magic'}, {'level': '15', 'name': 'Fast Casting'}, {'level': '16', 'name': 'Illusion Magic'}, {'level': '20 Illusion Magic in', 'name': 'Hard Mode'}], 'skills_used': ['Ether Feast', 'Diversion', 'Song of the Mists', 'Images of Remorse', 'Shatter Hex', 'Arcane Languor'], 'armor_levels': {'Blunt damage': '84', 'Piercing damage': '84', 'Slashing damage': '84', 'Cold damage': '84', 'Earth damage': '84', 'Fire damage': '84', 'Lightning damage': '84'}, 'items_dropped': ['Soul Stone']},
-    4968: {'name': 'Titan Abomination', 'profession': ['Warrior'], 'attributes': [{'level': '11', 'name': 'Hammer Mastery'}], 'skills_used': ['Mighty Blow', 'Stun Immunity', 'Irresistible Blow', 'Battle Rage', 'Counter Blow'], 'armor_levels': {'Blunt damage': '123', 'Piercing damage': '123', 'Slashing damage': '123', 'Cold damage': '103', 'Earth damage': '143', 'Fire damage': '103', 'Lightning damage': '103'}, 'items_dropped': []},
-    4087: {'name': 'Bound Tiendi', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Auspicious Parry', 'Sun and Moon Slash', 'Healing Signet', 'Sever Artery', 'Gash'], 'armor_levels': {}, 'items_dropped': []},
-    4085: {'name': 'Bound Kaichen', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Sliver Armor', 'Burning Speed', 'Aura of Restoration', 'Star Burst', 'Obsidian Flame'], 'armor_levels': {}, 'items_dropped': []},
-    4961: {'name': 'Wrathful Storm', 'profession': ['Elementalist'], 'attributes': [{'level': '16', 'name': 'Fire Magic'}], 'skills_used': ['Fire Storm', 'Incendiary Bonds', 'Fingers of Chaos', 'Double Dragon', 'Meteor Shower'], 'armor_levels': {}, 'items_dropped': []},
-    7320: {'name': 'Wrathful Storm', 'profession': ['Elementalist'], 'attributes': [{'level': '16', 'name': 'Fire Magic'}], 'skills_used': ['Fire Storm', 'Incendiary Bonds', 'Fingers of Chaos', 'Double Dragon', 'Meteor Shower'], 'armor_levels': {}, 'items_dropped': []},
-    4960: {'name': 'Grasp of Insanity', 'profession': ['Warrior'], 'attributes': [{'level': '14-17', 'name': 'Tactics'}], 'skills_used': ['"Fear Me!"', 'Eviscerate', '"To the Limit!"', 'Disrupting Chop', 'Fingers of Chaos'], 'armor_levels': {'Blunt damage': '123', 'Piercing damage': '123', 'Slashing damage': '123', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '83', 'Lightning damage': '83'}, 'items_dropped': []},
-    7317: {'name': 'Grasp of Insanity', 'profession': ['Warrior'], 'attributes': [{'level': '14-17', 'name': 'Tactics'}], 'skills_used': ['"Fear Me!"', 'Eviscerate', '"To the Limit!"', 'Disrupting Chop', 'Fingers of Chaos'], 'armor_levels': {'Blunt damage': '123', 'Piercing damage': '123', 'Slashing damage': '123', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '83', 'Lightning damage': '83'}, 'items_dropped': []},
-    5461: {'name': 'Torment Claw', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Fingers of Chaos', 'Torment Slash'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Demonic Relic', 'Torment Gemstone']},
-    7319: {'name': 'Torment Claw', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Fingers of Chaos', 'Torment Slash'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Demonic Relic', 'Torment Gemstone']},
-    4082: {'name': 'Bound Hao Li', 'profession': ['Assassin'], 'attributes': [], 'skills_used': ['Shadow Refuge', 'Shroud of Silence', 'Wild Strike', 'Disrupting Stab', 'Twisting Fangs'], 'armor_levels': {}, 'items_dropped': []},
-    4978: {'name': 'Ignis Cruor', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Immolate', 'Fire Storm', 'Mind Burn', 'Fire Attunement', 'Fireball'], 'armor_levels': {}, 'items_dropped': []},
-    4967: {'name': 'Shadow Beast', 'profession': ['Necromancer'], 'attributes': [{'level': 'Fissure of Woe16', 'name': 'Curses'}, {'level': '15', 'name': 'Soul Reaping'}, {'level': '0', 'name': 'Blood Magic'}, {'level': '15 Blood Magic in', 'name': 'Hard Mode'}], 'skills_used': ['Dark Pact', 'Suffering', 'Depravity', 'Mark of Pain', 'Consume Corpse', 'Spiteful Spirit', 'Meekness'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '83', 'Lightning damage': '83'}, 'items_dropped': ['Dark Remains', 'Obsidian Shard', 'Pile of Glittering Dust', 'Ruby', 'Sapphire']},
-    2809: {'name': 'Shadow Beast', 'profession': ['Necromancer'], 'attributes': [{'level': 'Fissure of Woe16', 'name': 'Curses'}, {'level': '15', 'name': 'Soul Reaping'}, {'level': '0', 'name': 'Blood Magic'}, {'level': '15 Blood Magic in', 'name': 'Hard Mode'}], 'skills_used': ['Dark Pact', 'Suffering', 'Depravity', 'Mark of Pain', 'Consume Corpse', 'Spiteful Spirit', 'Meekness'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '83', 'Lightning damage': '83'}, 'items_dropped': ['Dark Remains', 'Obsidian Shard', 'Pile of Glittering Dust', 'Ruby', 'Sapphire']},
-    4957: {'name': 'Creo Vulnero', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Vocal Minority', 'Lingering Curse', 'Mark of Pain', 'Parasitic Bond', 'Meekness'], 'armor_levels': {}, 'items_dropped': ["Vulnero's Curse", 'unique']},
-    2764: {'name': 'Portal Wraith', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Glyph of Energy', 'Eruption', 'Aura of Restoration', 'Enervating Charge', 'Chain Lightning'], 'armor_levels': {'Blunt damage': '87', 'Piercing damage': '87', 'Slashing damage': '87', 'Cold damage': '47', 'Earth damage': '47', 'Fire damage': '47', 'Lightning damage': '47'}, 'items_dropped': ['Decayed Orr Emblem', 'Sephis Axe']},
-    2674: {'name': 'Armageddon Lord', 'profession': ['Warrior', 'Elementalist'], 'attributes': [{'level': '15', 'name': 'Fire Magic'}], 'skills_used': ['Flame Burst', 'Smash of the Titans', 'Stun Immunity', 'Aura of Restoration', 'Lava Font', 'Mind Burn', 'Fire Attunement'], 'armor_levels': {'Blunt damage': '84', 'Piercing damage': '84', 'Slashing damage': '84', 'Cold damage': '64', 'Earth damage': '84', 'Fire damage': '124', 'Lightning damage': '84'}, 'items_dropped': ['Molten Claw']},
-    5011: {'name': 'Joyous Soul', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5009: {'name': 'Joyous Soul', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5010: {'name': 'Joyous Soul', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5012: {'name': 'Joyous Soul', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5008: {'name': 'Joyous Soul', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    4451: {'name': 'Margrid the Sly', 'profession': ['Ranger'], 'attributes': [{'level': '7', 'name': 'Expertise'}, {'level': '10', 'name': 'Wilderness Survival'}, {'level': '11', 'name': 'Marksmanship'}], 'skills_used': ['Troll Unguent', 'Natural Stride', 'Crossfire', 'Resurrection Signet', 'Apply Poison', 'Distracting Shot'], 'armor_levels': {}, 'items_dropped': []},
-    3552: {'name': 'Zenmai', 'profession': ['Assassin'], 'attributes': [{'level': 'which is similar in appearance to', 'name': 'Assassin Shing Jea armor'}], 'skills_used': ['Dash', 'Shadow Refuge', 'Critical Eye', 'Resurrection Signet', 'Fox Fangs', 'Return', 'Flashing Blades', 'Unsuspecting Strike', 'Jungle Strike', 'Death Blossom'], 'armor_levels': {}, 'items_dropped': []},
-    5142: {'name': 'Abaddon', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Corrupt Power', 'Words of Madness', 'Earth Shattering Blow'], 'armor_levels': {'Blunt damage': '110 (110)', 'Piercing damage': '110 (110)', 'Slashing damage': '110 (110)', 'Cold damage': '110 (110)', 'Earth damage': '110 (110)', 'Fire damage': '110 (110)', 'Lightning damage': '110 (110)'}, 'items_dropped': ['Margonite Key']},
-    5091: {'name': 'Corsair Runner', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ["Corsair's Net", 'Storm Chaser', 'Antidote Signet', 'Natural Stride'], 'armor_levels': {'Blunt damage': '76', 'Piercing damage': '76', 'Slashing damage': '76', 'Cold damage': '106', 'Earth damage': '106', 'Fire damage': '106', 'Lightning damage': '106'}, 'items_dropped': ['Corsair Trappings', 'Gold Doubloon', 'Stolen Goods']},
-    2810: {'name': 'Abyssal', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Crushing Blow', 'Earth Shaker', 'Stun on Critical Hit', 'Berserker Stance', "Bull's Strike", 'Overbearing Smash', 'Enraged', 'Battle Rage'], 'armor_levels': {'Blunt damage': '112', 'Piercing damage': '112', 'Slashing damage': '112', 'Cold damage': '112', 'Earth damage': '112', 'Fire damage': '112', 'Lightning damage': '112'}, 'items_dropped': ['Dark Remains', 'Obsidian Shard', 'Pile of Glittering Dust', 'Ruby', 'Sapphire']},
-    5194: {'name': 'Abyssal', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Crushing Blow', 'Earth Shaker', 'Stun on Critical Hit', 'Berserker Stance', "Bull's Strike", 'Overbearing Smash', 'Enraged', 'Battle Rage'], 'armor_levels': {'Blunt damage': '112', 'Piercing damage': '112', 'Slashing damage': '112', 'Cold damage': '112', 'Earth damage': '112', 'Fire damage': '112', 'Lightning damage': '112'}, 'items_dropped': ['Dark Remains', 'Obsidian Shard', 'Pile of Glittering Dust', 'Ruby', 'Sapphire']},
-    2826: {'name': 'Projects/NPC models/Ghosts', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2807: {'name': 'Shadow Warrior', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ["Griffon's Sweep", 'Hundred Blades', 'Healing Signet', '"I Will Avenge You!"', 'Final Thrust', 'Shield Bash'], 'armor_levels': {'Blunt damage': '128', 'Piercing damage': '128', 'Slashing damage': '128', 'Cold damage': '108', 'Earth damage': '108', 'Fire damage': '108', 'Lightning damage': '108'}, 'items_dropped': ['Dark Remains', 'Obsidian Shard', 'Pile of Glittering Dust', 'Sapphire']},
-    4965: {'name': 'Shadow Warrior', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ["Griffon's Sweep", 'Hundred Blades', 'Healing Signet', '"I Will Avenge You!"', 'Final Thrust', 'Shield Bash'], 'armor_levels': {'Blunt damage': '128', 'Piercing damage': '128', 'Slashing damage': '128', 'Cold damage': '108', 'Earth damage': '108', 'Fire damage': '108', 'Lightning damage': '108'}, 'items_dropped': ['Dark Remains', 'Obsidian Shard', 'Pile of Glittering Dust', 'Sapphire']},
-    2805: {'name': 'Shadow Elemental', 'profession': ['Elementalist'], 'attributes': [{'level': 'Fissure of Woe:15', 'name': 'Fire Magic'}], 'skills_used': ['Liquid Flame', 'Fire Storm', 'Mind Blast', 'Aura of Restoration', 'Incendiary Bonds', 'Fireball'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Dark Remains', 'Obsidian Shard', 'Pile of Glittering Dust', 'Ruby']},
-    4963: {'name': 'Shadow Elemental', 'profession': ['Elementalist'], 'attributes': [{'level': 'Fissure of Woe:15', 'name': 'Fire Magic'}], 'skills_used': ['Liquid Flame', 'Fire Storm', 'Mind Blast', 'Aura of Restoration', 'Incendiary Bonds', 'Fireball'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Dark Remains', 'Obsidian Shard', 'Pile of Glittering Dust', 'Ruby']},
-    2816: {'name': 'Skeletal Ether Breaker', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Domination Magic'}], 'skills_used': ['Energy Surge', 'Chaos Storm', 'Cry of Frustration', 'Shatter Enchantment', 'Sympathetic Visage'], 'armor_levels': {'Blunt damage': '53', 'Piercing damage': '93', 'Slashing damage': '73', 'Cold damage': '73', 'Earth damage': '73', 'Fire damage': '73', 'Lightning damage': '73'}, 'items_dropped': ['Obsidian Shard', 'Pile of Glittering Dust', 'Umbral Skeletal Limb']},
-    2817: {'name': 'Skeletal Icehand', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Water Magic'}], 'skills_used': ['Glyph of Energy', 'Windborne Speed', 'Blurred Vision', 'Lightning Touch', 'Maelstrom', 'Deep Freeze'], 'armor_levels': {}, 'items_dropped': ['Obsidian Shard', 'Pile of Glittering Dust', 'Umbral Skeletal Limb']},
-    2818: {'name': 'Skeletal Bond', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Life Bond', 'Live Vicariously', 'Infuse Health', 'Spell Breaker'], 'armor_levels': {}, 'items_dropped': ['Obsidian Shard', 'Pile of Glittering Dust', 'Umbral Skeletal Limb']},
-    2819: {'name': 'Skeletal Berserker', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Axe Twist', 'Wild Blow', 'Axe Rake', '"Victory Is Mine!"', 'Cyclone Axe', 'Dismember'], 'armor_levels': {'Blunt damage': '107', 'Piercing damage': '107', 'Slashing damage': '107', 'Cold damage': '107', 'Earth damage': '107', 'Fire damage': '107', 'Lightning damage': '107'}, 'items_dropped': ['Chaos Axe', 'Pile of Glittering Dust', 'Obsidian Shard', 'Ruby', 'Sapphire', 'Umbral Skeletal Limb']},
-    2813: {'name': 'Spirit Shepherd', 'profession': ['Elementalist'], 'attributes': [{'level': '14', 'name': 'Air Magic'}, {'level': '15', 'name': 'Earth Magic'}], 'skills_used': ['Aura of Restoration', 'Chain Lightning', 'Lightning Strike', 'Lightning Touch', 'Iron Mist'], 'armor_levels': {'Blunt damage': '99', 'Piercing damage': '99', 'Slashing damage': '59', 'Cold damage': '99', 'Earth damage': '99', 'Fire damage': '59', 'Lightning damage': '99'}, 'items_dropped': ['Gloom Seed', 'Obsidian Shard', 'Pile of Glittering Dust', 'Ruby', 'Sapphire']},
-    2812: {'name': 'Spirit Wood', 'profession': ['Ranger'], 'attributes': [{'level': '15', 'name': 'Beast Mastery'}, {'level': '15', 'name': 'Wilderness Survival'}, {'level': '20 Wilderness Survival in', 'name': 'Hard mode'}], 'skills_used': ["Nature's Renewal", 'Primal Echoes', 'Troll Unguent', 'Edge of Extinction'], 'armor_levels': {'Blunt damage': '95', 'Piercing damage': '95', 'Slashing damage': '55', 'Cold damage': '95', 'Earth damage': '95', 'Fire damage': '55', 'Lightning damage': '95'}, 'items_dropped': ['Gloom Seed', 'Obsidian Shard', 'Pile of Glittering Dust', 'Ruby', 'Sapphire', 'Spiritwood Plank']},
-    2887: {'name': "Spirit of Nature's Renewal", 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2821: {'name': 'Rock Borer Worm', 'profession': ['Ranger'], 'attributes': [{'level': '14', 'name': 'Marksmanship'}], 'skills_used': ['Throw Dirt', 'Power Shot', 'Choking Gas', 'Called Shot', 'Lightning Reflexes', 'Apply Poison', 'Pin Down', 'Concussion Shot'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Shadowy Husk']},
-    2876: {'name': 'Spirit of Extinction', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2800: {'name': 'Armored Cave Spider', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Healing Spring', 'Savage Shot', 'Called Shot', "Melandru's Resilience", 'Apply Poison'], 'armor_levels': {}, 'items_dropped': ['Corrosive Spider Leg', 'Obsidian Shard', 'Pile of Glittering Dust', 'Ruby', 'Sapphire']},
-    2326: {'name': 'Banshee', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': ['Glob of Ectoplasm', 'Phantom Key', 'Phantom Residue', 'Piles of Glittering Dust']},
-    2827: {'name': 'Forest Griffon', 'profession': ['Monk'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2820: {'name': 'Skeletal Impaler', 'profession': ['Ranger'], 'attributes': [{'level': '15', 'name': 'Expertise'}, {'level': '15', 'name': 'Wilderness Survival'}, {'level': '20 Wilderness Survival in', 'name': 'Hard mode'}], 'skills_used': ['Dust Trap', 'Barbed Trap', 'Flame Trap', 'Distracting Shot', 'Spike Trap'], 'armor_levels': {}, 'items_dropped': ['Grinning Recurve Bow', 'Obsidian Shard', 'Pile of Glittering Dust', 'Sapphire', 'Umbral Skeletal Limb']},
-    2832: {'name': 'Projects/NPC models/Ghosts', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2829: {'name': 'Eternal Forgemaster', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2834: {'name': 'Eternal Ranger', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Flurry of Ice', 'Power Shot', 'Troll Unguent', 'Dual Shot', 'Snowball', 'Resurrection Signet', 'Mega Snowball', 'Kindle Arrows'], 'armor_levels': {}, 'items_dropped': []},
-    2811: {'name': 'Seed of Corruption', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'curses'}, {'level': '15', 'name': 'Death Magic'}], 'skills_used': ["Verata's Gaze", 'Lingering Curse', 'Defile Flesh', 'Consume Corpse', 'Malign Intervention'], 'armor_levels': {}, 'items_dropped': ['Gloom Seed', 'Obsidian Shard', 'Pile of Glittering Dust', 'Sapphire']},
-    2803: {'name': "Doubter's Dryder", 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Domination Magic'}], 'skills_used': ['Guilt', 'Shame', 'Shatter Enchantment', "Wastrel's Worry", 'Drain Enchantment'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': []},
-    2802: {'name': 'Obsidian Furnace Drake', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Earth Magic'}, {'level': '15', 'name': 'Fire Magic'}, {'level': '20 Fire Magic in', 'name': 'Hard mode'}], 'skills_used': ['Ward Against Foes', 'Flare', 'Aura of Restoration', 'Obsidian Flesh', 'Mark of Rodgort', 'Fire Attunement'], 'armor_levels': {'Blunt damage': '91', 'Piercing damage': '91', 'Slashing damage': '91', 'Cold damage': '91', 'Earth damage': '91', 'Fire damage': '91', 'Lightning damage': '91'}, 'items_dropped': ['Chaos Axe', 'Half-Digested Armor', 'Obsidian Shard', 'Shadow Bow', 'Shadowy Crest']},
-    2801: {'name': 'Smoke Walker', 'profession': ['Monk'], 'attributes': [{'level': '15', 'name': 'Healing Prayers'}], 'skills_used': ['Healing Touch', 'Mend Condition', 'Heal Area', 'Healing Seed', 'Healing Breeze'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Obsidian Shard', 'Ruby', 'Umbral Eye']},
-    2822: {'name': 'Infernal Wurm', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Wurm Siege (Core)', 'Stun on Critical Hit'], 'armor_levels': {'Blunt damage': '160', 'Piercing damage': '160', 'Slashing damage': '160', 'Cold damage': '160', 'Earth damage': '160', 'Fire damage': '160', 'Lightning damage': '160'}, 'items_dropped': ['Ashen Wurm Husk']},
-    2814: {'name': 'Ancient Skale', 'profession': ['Necromancer'], 'attributes': [{'level': '16', 'name': 'Blood Magic'}, {'level': '19', 'name': 'Soul Reaping'}], 'skills_used': ['Life Transfer', 'Blood Ritual', "Grenth's Balance", 'Rend Enchantments', 'Life Siphon'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '83', 'Lightning damage': '83'}, 'items_dropped': []},
-    2823: {'name': 'Dragon Lich', 'profession': ['Necromancer'], 'attributes': [{'level': '0', 'name': 'Blood Magic'}, {'level': '17', 'name': 'Curses'}], 'skills_used': ['Unholy Feast', 'Stun Immunity', 'Chilblains', 'Plague Touch', 'Deafening Roar'], 'armor_levels': {'Blunt damage': '80', 'Piercing damage': '80', 'Slashing damage': '80', 'Cold damage': '80', 'Earth damage': '80', 'Fire damage': '80', 'Lightning damage': '80'}, 'items_dropped': ['Dark Claw', 'Obsidian Shard']},
-    5440: {'name': 'Vision of Despair', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', "Wastrel's Demise", 'Power Flux', 'Shatter Enchantment', 'Power Drain'], 'armor_levels': {}, 'items_dropped': ['Staff of Despair', 'unique']},
-    4956: {'name': 'Saevio Proelium', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Mighty Blow', 'Irresistible Blow', "Bull's Strike", 'Battle Rage', 'Counter Blow'], 'armor_levels': {}, 'items_dropped': ["Saevio's Maul", 'unique']},
-    5441: {'name': 'Bringer of Deceit', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Healing Touch', "Healer's Covenant", 'Heal Party', 'Healing Seed', 'Healing Breeze'], 'armor_levels': {}, 'items_dropped': ['Deceitful Scepter', 'unique']},
-    2886: {'name': 'Spirit of Quickening Zephyr', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5437: {'name': 'Flame of Fervor', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Scourge Enchantment', "Judge's Insight", 'Reversal of Damage', 'Signet of Devotion', 'Smite Hex', "Defender's Zeal"], 'armor_levels': {}, 'items_dropped': ['Fervorborn Staff', 'unique', 'Demonic Relic']},
-    2677: {'name': 'Water Born Titan', 'profession': ['Elementalist'], 'attributes': [{'level': '16', 'name': 'Water Magic'}], 'skills_used': ['Glyph of Lesser Energy', 'Aura of Restoration', 'Water Attunement', 'Vapor Blade', 'Frozen Burst', 'Shard Storm', 'Blurred Vision', 'Mirror of Ice', 'Ice Spikes', 'Maelstrom', 'Deep Freeze'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '63', 'Lightning damage': '83'}, 'items_dropped': ['Molten Claw']},
-    2678: {'name': 'Wild Growth', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Dust Trap', 'Healing Spring', 'Troll Unguent', "Trapper's Focus", 'Stun Immunity', 'Barbed Trap', "Trapper's Speed", 'Flame Trap', "Viper's Nest", 'Tripwire', 'Whirling Defense', 'Apply Poison', 'Spike Trap'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '63', 'Lightning damage': '83'}, 'items_dropped': []},
-    5438: {'name': 'Seed of Suffering', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Prepared Shot', 'Crossfire', 'Lightning Reflexes', 'Barbed Arrows'], 'armor_levels': {}, 'items_dropped': ['Seedborn Flatbow', 'unique']},
-    4977: {'name': 'Fortune Teller', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Power Drain', 'Crippling Anguish', 'Ether Feast', 'Conjure Phantasm'], 'armor_levels': {}, 'items_dropped': []},
-    2676: {'name': 'Earth Born Titan', 'profession': ['Elementalist', 'Dervish'], 'attributes': [{'level': '16', 'name': 'Earth Magic'}], 'skills_used': ['Earth Attunement', 'Grasping Earth', 'Glyph of Lesser Energy', 'Aura of Restoration', 'Conviction', 'Mystic Regeneration', 'Armor of Earth', 'Obsidian Flame', 'Sandstorm', 'Ward Against Elements', 'Stone Daggers'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '63', 'Lightning damage': '83'}, 'items_dropped': ['Molten Claw', 'Titan Armor']},
-    2675: {'name': 'Wind Born Titan', 'profession': ['Elementalist', 'Mesmer'], 'attributes': [], 'skills_used': ["Teinai's Wind", 'Glyph of Lesser Energy', 'Whirlwind', 'Aura of Restoration', 'Enervating Charge', 'Chain Lightning', 'Air Attunement', 'Blinding Flash', 'Lightning Touch', 'Ride the Lightning', 'Mantra of Lightning', 'Channeling'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '63', 'Lightning damage': '83'}, 'items_dropped': ['Molten Claw', 'Titan Armor']},
-    2679: {'name': 'Rotting Titan', 'profession': ['Necromancer', 'Ritualist'], 'attributes': [{'level': '13', 'name': 'Curses'}, {'level': '16', 'name': 'Death Magic'}], 'skills_used': ['Well of Suffering', 'Smash of the Titans', 'Stun Immunity', 'Putrid Bile', 'Lingering Curse', 'Discord', 'Protective Was Kaolai', 'Weapon of Warding', 'Rotting Flesh', 'Animate Shambling Horror', 'Parasitic Bond', 'Death Nova'], 'armor_levels': {'Blunt damage': '123', 'Piercing damage': '123', 'Slashing damage': '123', 'Cold damage': '103', 'Earth damage': '103', 'Fire damage': '83', 'Lightning damage': '103'}, 'items_dropped': []},
-    4974: {'name': 'Forgotten Illusionist', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Domination Magic'}, {'level': '12-13', 'name': 'Illusion Magic'}, {'level': '11', 'name': 'Fast Casting'}], 'skills_used': ['Chaos Storm', 'Mantra of Recovery', 'Power Drain', 'Ethereal Burden', 'Energy Burn'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Forgotten Seal', 'Illusionist Wrappings', 'Monstrous Claw', 'Scale']},
-    1861: {'name': 'Forgotten Illusionist', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Domination Magic'}, {'level': '12-13', 'name': 'Illusion Magic'}, {'level': '11', 'name': 'Fast Casting'}], 'skills_used': ['Chaos Storm', 'Mantra of Recovery', 'Power Drain', 'Ethereal Burden', 'Energy Burn'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Forgotten Seal', 'Illusionist Wrappings', 'Monstrous Claw', 'Scale']},
-    5523: {'name': 'Wieshur the Inspiring', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Mantra of Inscriptions', 'Symbols of Inspiration', 'Leech Signet', 'Signet of Humility', 'Mirror of Disenchantment'], 'armor_levels': {}, 'items_dropped': ['Margonite Armor', "Wieshur's Inspiration", 'unique']},
-    5524: {'name': 'Hautoh the Pilferer', 'profession': ['Ritualist'], 'attributes': [], 'skills_used': ['Cruel Was Daoshen', 'Renewing Surge', 'Vengeful Weapon', 'Renewing Memories', "Caretaker's Charge"], 'armor_levels': {}, 'items_dropped': ["Hautoh's Ambition", 'unique', 'Margonite Mask']},
-    4980: {'name': 'Letum Contineo', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Mighty Blow', 'Burst of Aggression', 'Irresistible Blow'], 'armor_levels': {}, 'items_dropped': []},
-    4979: {'name': 'Securis Phasmatis', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Ether Phantom', 'Mantra of Earth', 'Cry of Frustration', 'Mirror of Disenchantment'], 'armor_levels': {}, 'items_dropped': []},
-    5426: {'name': 'Razakel', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Signet of Sorrow', 'Corrupt Enchantment', 'Putrid Explosion', 'Parasitic Bond', 'Deathly Swarm'], 'armor_levels': {}, 'items_dropped': []},
-    5222: {'name': 'Binding Guardian', 'profession': ['Monk'], 'attributes': [{'level': '15', 'name': 'Divine Favor'}, {'level': '15', 'name': 'Healing Prayers'}], 'skills_used': ['Healing Touch', 'Orison of Healing', 'Divine Intervention', 'Glimmer of Light', 'Words of Comfort', 'Healing Breeze'], 'armor_levels': {}, 'items_dropped': []},
-    4502: {'name': 'Razah', 'profession': ['Ritualist', 'Multiple'], 'attributes': [], 'skills_used': ['Pain', 'Doom', 'Boon of Creation', 'Bloodsong', 'Shadowsong', 'Wanderlust', 'Anguish'], 'armor_levels': {}, 'items_dropped': []},
-    5171: {'name': 'Margonite Anur Tuk', 'profession': ['Ranger'], 'attributes': [{'level': '15', 'name': 'Marksmanship'}, {'level': '16', 'name': 'Wilderness Survival'}], 'skills_used': ['Troll Unguent', 'Quickening Zephyr', 'Focused Shot', 'Debilitating Shot', 'Enraged', 'Whirling Defense', 'Famine'], 'armor_levels': {'Blunt damage': '94', 'Piercing damage': '94', 'Slashing damage': '94', 'Cold damage': '124', 'Earth damage': '124', 'Fire damage': '124', 'Lightning damage': '124'}, 'items_dropped': ['Margonite Gemstone']},
-    5168: {'name': 'Margonite Anur Su', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Invoke Lightning', 'Enervating Charge', 'Air Attunement', 'Lightning Hammer', 'Lightning Strike', 'Gale', 'Enraged'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '83', 'Lightning damage': '83'}, 'items_dropped': ['Margonite Gemstone']},
-    5167: {'name': 'Margonite Anur Dabi', 'profession': ['Necromancer'], 'attributes': [{'level': '16', 'name': 'Blood Magic'}, {'level': '16', 'name': 'Curses'}, {'level': '20 Curses in', 'name': 'Hard mode'}], 'skills_used': ['Vocal Minority', 'Strip Enchantment', 'Malaise', 'Enraged', 'Blood of the Aggressor', 'Wither', 'Meekness'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '83', 'Lightning damage': '83'}, 'items_dropped': ['Margonite Gemstone']},
-    5170: {'name': 'Margonite Anur Vu', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ["Magehunter's Smash", '"Fear Me!"', 'Crushing Blow', 'Enraged', "Lion's Comfort", 'Flail', 'Counter Blow'], 'armor_levels': {'Blunt damage': '123', 'Piercing damage': '123', 'Slashing damage': '123', 'Cold damage': '103', 'Earth damage': '103', 'Fire damage': '103', 'Lightning damage': '103'}, 'items_dropped': ['Margonite Gemstone']},
-    5169: {'name': 'Margonite Anur Ki', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Healing Touch', "Dwayna's Kiss", "Healer's Boon", 'Enraged', 'Healing Whisper', 'Healing Seed', 'Words of Comfort'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '83', 'Lightning damage': '83'}, 'items_dropped': ['Margonite Gemstone']},
-    5173: {'name': 'Margonite Anur Rund', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['Anthem of Flame', 'Anthem of Guidance', 'Natural Temper', 'Merciless Spear', 'Enraged', '"Go for the Eyes!"', 'Wild Throw'], 'armor_levels': {'Blunt damage': '104', 'Piercing damage': '104', 'Slashing damage': '104', 'Cold damage': '104', 'Earth damage': '104', 'Fire damage': '104', 'Lightning damage': '104'}, 'items_dropped': ['Margonite Gemstone']},
-    5192: {'name': 'Wind of Darkness', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Savage Shot', 'Barrage', 'Winnowing', 'Forked Arrow', 'Enraged'], 'armor_levels': {}, 'items_dropped': ['Torment Gemstone']},
-    5189: {'name': 'Chill of Darkness', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Meteor', 'Incendiary Bonds', 'Searing Flames', 'Enraged', 'Fire Attunement', 'Meteor Shower'], 'armor_levels': {}, 'items_dropped': ["Menzes' Ambition", 'unique', 'Torment Gemstone']},
-    5191: {'name': 'Claw of Darkness', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Hundred Blades', 'Burst of Aggression', '"I Will Avenge You!"', 'Shield Bash', 'Enraged'], 'armor_levels': {}, 'items_dropped': ['Torment Gemstone']},
-    5188: {'name': 'Thought of Darkness', 'profession': ['Mesmer'], 'attributes': [{'level': '16', 'name': 'Domination Magic'}], 'skills_used': ['Backfire', 'Enraged', 'Cry of Frustration', 'Shatter Enchantment', 'Empathy', "Wastrel's Worry", 'Visions of Regret'], 'armor_levels': {}, 'items_dropped': ['Torment Gemstone']},
-    5193: {'name': 'Curse of Darkness', 'profession': ['Necromancer'], 'attributes': [{'level': '16', 'name': 'Curses'}], 'skills_used': ['Mark of Pain', 'Barbs', 'Spiteful Spirit', 'Enraged', 'Gaze of Contempt', 'Parasitic Bond', 'Insidious Parasite'], 'armor_levels': {}, 'items_dropped': ["Menzes' Influence", 'unique', 'Torment Gemstone']},
-    5190: {'name': 'Scourge of Darkness', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Healing Touch', 'Heal Other', 'Orison of Healing', 'Renew Life', "Healer's Covenant", 'Enraged', 'Holy Haste'], 'armor_levels': {}, 'items_dropped': ['Torment Gemstone']},
-    5172: {'name': 'Margonite Anur Ruk', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ['Mystic Twister', 'Imbue Health', 'Arcane Zeal', 'Mystic Healing', 'Mystic Vigor', 'Enraged', "Grenth's Fingers"], 'armor_levels': {'Blunt damage': '94', 'Piercing damage': '94', 'Slashing damage': '94', 'Cold damage': '94', 'Earth damage': '94', 'Fire damage': '94', 'Lightning damage': '94'}, 'items_dropped': ['Margonite Gemstone']},
-    5174: {'name': 'Margonite Anur Mank', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Prepared Shot', 'Read the Wind', 'Forked Arrow', 'Penetrating Attack', 'Enraged', 'Pin Down'], 'armor_levels': {'Blunt damage': '94', 'Piercing damage': '94', 'Slashing damage': '94', 'Cold damage': '124', 'Earth damage': '124', 'Fire damage': '124', 'Lightning damage': '124'}, 'items_dropped': ['Margonite Gemstone']},
-    5207: {'name': 'Heart Tormentor', 'profession': ['Monk'], 'attributes': [{'level': '15', 'name': 'Smiting Prayers'}], 'skills_used': ['Scourge Enchantment', 'Divine Boon', 'Blessed Light', 'Reversal of Damage', "Zealot's Fire", 'Call to the Torment', 'Enraged', 'Scourge Healing'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '83', 'Lightning damage': '83'}, 'items_dropped': ['Stygian Gemstone', 'Torment Gemstone']},
-    5206: {'name': 'Water Tormentor', 'profession': ['Elementalist'], 'attributes': [{'level': '14..16', 'name': 'Water Magic'}], 'skills_used': ['Chilling Winds', 'Mind Freeze', 'Rust', 'Blurred Vision', 'Call to the Torment', 'Enraged', 'Arc Lightning', 'Freezing Gust'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '83', 'Lightning damage': '83'}, 'items_dropped': ['Stygian Gemstone', 'Torment Gemstone']},
-    5209: {'name': 'Spirit Tormentor', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Savage Shot', 'Enraged', 'Barbed Arrows', 'Call to the Torment', 'Poison Arrow', 'Pin Down'], 'armor_levels': {'Blunt damage': '94', 'Piercing damage': '94', 'Slashing damage': '94', 'Cold damage': '124', 'Earth damage': '124', 'Fire damage': '124', 'Lightning damage': '124'}, 'items_dropped': ['Stygian Gemstone', 'Torment Gemstone']},
-    5212: {'name': 'Sanity Tormentor', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['Anthem of Flame', 'Disrupting Throw', 'Barbed Spear', 'Natural Temper', 'Call to the Torment', 'Enraged', 'Stunning Strike', 'Vicious Attack'], 'armor_levels': {'Blunt damage': '102', 'Piercing damage': '102', 'Slashing damage': '102', 'Cold damage': '102', 'Earth damage': '102', 'Fire damage': '102', 'Lightning damage': '102'}, 'items_dropped': ['Stygian Gemstone', 'Torment Gemstone']},
-    5204: {'name': 'Mind Tormentor', 'profession': ['Mesmer'], 'attributes': [{'level': '16', 'name': 'Illusion Magic'}], 'skills_used': ['Migraine', 'Mantra of Persistence', 'Enraged', 'Power Drain', 'Illusion of Pain', 'Conjure Phantasm', 'Call to the Torment', 'Soothing Images'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '83', 'Lightning damage': '83'}, 'items_dropped': ['Stygian Gemstone', 'Torment Gemstone']},
-    5205: {'name': 'Soul Tormentor', 'profession': ['Necromancer'], 'attributes': [{'level': '16', 'name': 'Curses'}], 'skills_used': ['Faintheartedness', 'Enraged', 'Defile Flesh', 'Shadow of Fear', 'Corrupt Enchantment', 'Call to the Torment', 'Parasitic Bond', 'Soul Barbs'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '83', 'Lightning damage': '83'}, 'items_dropped': ['Torment Gemstone']},
-    5208: {'name': 'Flesh Tormentor', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['"Watch Yourself!"', "Protector's Defense", 'Sever Artery', 'Gash', 'Crippling Slash', 'Call to the Torment', 'Enraged', '"Shields Up!"'], 'armor_levels': {'Blunt damage': '140', 'Piercing damage': '140', 'Slashing damage': '140', 'Cold damage': '120', 'Earth damage': '120', 'Fire damage': '120', 'Lightning damage': '120'}, 'items_dropped': ['Aegis of Terror', 'unique', 'Stygian Gemstone', 'Torment Gemstone']},
-    5166: {'name': 'Margonite Anur Kaya', 'profession': ['Mesmer'], 'attributes': [{'level': '16', 'name': 'Domination Magic'}, {'level': '16', 'name': 'Inspiration Magic'}, {'level': '20 Inspiration Magic in', 'name': 'Hard Mode'}], 'skills_used': ['Energy Surge', 'Spirit Shackles', 'Mind Wrack', 'Cry of Frustration', 'Enraged', 'Power Leak', 'Feedback'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '83', 'Lightning damage': '83'}, 'items_dropped': ['Margonite Gemstone']},
-    5176: {'name': 'Stygian Brute', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Mighty Blow', 'Crushing Blow', 'Earth Shaker', 'Irresistible Blow', 'Staggering Blow', 'Backbreaker', 'Enraged', 'Counter Blow'], 'armor_levels': {'Blunt damage': '140', 'Piercing damage': '140', 'Slashing damage': '140', 'Cold damage': '120', 'Earth damage': '120', 'Fire damage': '120', 'Lightning damage': '120'}, 'items_dropped': ['Stygian Gemstone']},
-    5177: {'name': 'Stygian Golem', 'profession': ['Dervish'], 'attributes': [], 'skills_used': ["Harrier's Haste", 'Banishing Strike', 'Rending Aura', "Reaper's Sweep", 'Enraged', "Harrier's Grasp", "Grenth's Fingers"], 'armor_levels': {'Blunt damage': '120', 'Piercing damage': '120', 'Slashing damage': '120', 'Cold damage': '120', 'Earth damage': '120', 'Fire damage': '120', 'Lightning damage': '120'}, 'items_dropped': ['Stygian Gemstone']},
-    5159: {'name': 'Shaunur the Divine', 'profession': ['Monk'], 'attributes': [{'level': '16', 'name': 'Smiting Prayers'}], 'skills_used': ['Scourge Enchantment', 'Divine Boon', 'Blessed Light', 'Reversal of Damage', "Zealot's Fire", 'Scourge Healing'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '83', 'Lightning damage': '83'}, 'items_dropped': ['Margonite Gemstone', "Shaunur's Scepter", 'unique']},
-    5144: {'name': 'Lord Jadoth', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['Anthem of Guidance', "Jadoth's Storm of Judgment", 'Natural Resistance', '"Can\'t Touch This!"', 'Enraged', '"Go for the Eyes!"'], 'armor_levels': {'Blunt damage': '109', 'Piercing damage': '109', 'Slashing damage': '109', 'Cold damage': '109', 'Earth damage': '109', 'Fire damage': '109', 'Lightning damage': '109'}, 'items_dropped': ['The Bloodspear', 'unique']},
-    5175: {'name': 'Stygian Hunger', 'profession': ['Necromancer'], 'attributes': [{'level': '19', 'name': 'Death Magic'}, {'level': '19', 'name': 'Blood Magic'}, {'level': '19', 'name': 'Soul Reaping'}], 'skills_used': ['Vampiric Touch', "Grenth's Balance", "Wallow's Bite", 'Vampiric Bite', 'Enraged', 'Touch of Agony', 'Dark Aura'], 'armor_levels': {'Blunt damage': '101', 'Piercing damage': '101', 'Slashing damage': '101', 'Cold damage': '101', 'Earth damage': '101', 'Fire damage': '101', 'Lightning damage': '101'}, 'items_dropped': ['Stygian Gemstone']},
-    4986: {'name': 'Spirit of Truth', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5152: {'name': 'The Darkness', 'profession': ['Mesmer'], 'attributes': [{'level': '16', 'name': 'Domination Magic'}], 'skills_used': ['Backfire', 'Diversion', 'Energy Surge', 'Ignorance', 'Fingers of Chaos', 'Soothing Images'], 'armor_levels': {'Blunt damage': '123', 'Piercing damage': '123', 'Slashing damage': '123', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '83', 'Lightning damage': '83'}, 'items_dropped': ['Aegis of Terror', 'unique', 'Divine Shadow Staff', 'Torment Gemstone']},
-    5201: {'name': 'Rage Titan', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Earth Attunement', 'Eruption', 'Stun Immunity', 'Enraged', 'Earthquake', 'Churning Earth', 'Aftershock', 'Shockwave'], 'armor_levels': {'Blunt damage': '123', 'Piercing damage': '123', 'Slashing damage': '123', 'Cold damage': '103', 'Earth damage': '143', 'Fire damage': '103', 'Lightning damage': '103'}, 'items_dropped': ['Titan Gemstone']},
-    5203: {'name': 'Despair Titan', 'profession': ['Necromancer'], 'attributes': [{'level': '16', 'name': 'Curses'}, {'level': '16', 'name': 'Death Magic'}], 'skills_used': ['Well of Suffering', 'Ulcerous Lungs', 'Suffering', 'Stun Immunity', 'Chilblains', 'Desecrate Enchantments', 'Enraged', 'Defile Enchantments', 'Rotting Flesh', 'Feast of Corruption'], 'armor_levels': {'Blunt damage': '123', 'Piercing damage': '123', 'Slashing damage': '123', 'Cold damage': '103', 'Earth damage': '103', 'Fire damage': '143', 'Lightning damage': '103'}, 'items_dropped': ['Titan Gemstone']},
-    5216: {'name': 'Greater Dream Rider', 'profession': ['Mesmer'], 'attributes': [{'level': '16', 'name': 'Domination Magic'}], 'skills_used': ['Ether Feast', 'Mistrust', 'Power Block', 'Cry of Frustration', 'Shatter Enchantment', 'Power Spike', 'Enraged', 'Mirror of Disenchantment'], 'armor_levels': {'Blunt damage': '120', 'Piercing damage': '120', 'Slashing damage': '120', 'Cold damage': '120', 'Earth damage': '120', 'Fire damage': '120', 'Lightning damage': '120'}, 'items_dropped': ['Titan Gemstone']},
-    5198: {'name': 'Anguish Titan', 'profession': ['Mesmer'], 'attributes': [{'level': '16', 'name': 'Illusion Magic'}], 'skills_used': ['Arcane Larceny', 'Arcane Thievery', 'Inspired Enchantment', 'Signet of Illusions', 'Stun Immunity', 'Arcane Echo', 'Enraged', 'Inspired Hex'], 'armor_levels': {'Blunt damage': '123', 'Piercing damage': '123', 'Slashing damage': '123', 'Cold damage': '103', 'Earth damage': '103', 'Fire damage': '143', 'Lightning damage': '103'}, 'items_dropped': ['Titan Gemstone']},
-    5195: {'name': 'Misery Titan', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Stun Immunity', 'Earth Shaker', 'Tiger Stance', 'Enraged', 'Berserker Stance', 'Renewing Smash', 'Yeti Smash', 'Crude Swing'], 'armor_levels': {'Blunt damage': '123', 'Piercing damage': '123', 'Slashing damage': '123', 'Cold damage': '103', 'Earth damage': '143', 'Fire damage': '103', 'Lightning damage': '103'}, 'items_dropped': ['Titan Gemstone']},
-    5200: {'name': 'Fury Titan', 'profession': ['Assassin'], 'attributes': [{'level': '15', 'name': 'Shadow Arts'}], 'skills_used': ['Stun Immunity', 'Moebius Strike', 'Black Spider Strike', 'Shadowy Burden', 'Way of Perfection', 'Enraged', 'Death Blossom', 'Twisting Fangs'], 'armor_levels': {'Blunt damage': '123', 'Piercing damage': '123', 'Slashing damage': '123', 'Cold damage': '103', 'Earth damage': '103', 'Fire damage': '143', 'Lightning damage': '103'}, 'items_dropped': ["Nihil's Daggers", 'Titan Gemstone']},
-    5197: {'name': 'Dementia Titan', 'profession': ['Dervish'], 'attributes': [{'level': '15', 'name': 'Earth Prayers'}], 'skills_used': ['Dust Cloak', 'Stun Immunity', 'Aura of Thorns', 'Mystic Regeneration', 'Pious Haste', 'Mystic Vigor', 'Enraged'], 'armor_levels': {'Blunt damage': '123', 'Piercing damage': '123', 'Slashing damage': '123', 'Cold damage': '103', 'Earth damage': '143', 'Fire damage': '103', 'Lightning damage': '103'}, 'items_dropped': ['Titan Gemstone']},
-    7321: {'name': 'Banished Dream Rider', 'profession': ['Mesmer'], 'attributes': [{'level': '16', 'name': 'Domination Magic'}, {'level': '20', 'name': 'Inspiration Magic'}], 'skills_used': ['Cry of Frustration', 'Shatter Enchantment', 'Power Drain', 'Power Spike', 'Empathy', 'Energy Drain'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '83', 'Earth damage': '83', 'Fire damage': '83', 'Lightning damage': '83'}, 'items_dropped': ['Glob of Ectoplasm', 'Phantom Residue', 'Pile of Glittering Dust', 'Ruby', 'Sapphire']},
-    7326: {'name': 'Chaos Wurm', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Wurm Siege (Core)', 'Earth Shaker', 'Wary Stance', 'Natural Resistance', 'Irresistible Blow'], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '100', 'Slashing damage': '100', 'Cold damage': '101', 'Earth damage': '101', 'Fire damage': '101', 'Lightning damage': '101'}, 'items_dropped': []},
-    5162: {'name': 'Guardian of Komalie', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5161: {'name': 'Guardian of Komalie', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5149: {'name': 'The Fury', 'profession': ['Elementalist'], 'attributes': [{'level': '16', 'name': 'Fire Magic'}], 'skills_used': ['Double Dragon', 'Fire Storm', 'Incendiary Bonds', 'Enraged', 'Fingers of Chaos', 'Meteor Shower'], 'armor_levels': {'Blunt damage': '126', 'Piercing damage': '126', 'Slashing damage': '126', 'Cold damage': '86', 'Earth damage': '86', 'Fire damage': '86', 'Lightning damage': '86'}, 'items_dropped': ['Divine Ghostly Staff', 'unique', 'Everlasting Ghostly Staff', 'Grim Ghostly Staff', 'Inspired Ghostly Staff', 'Ritualistic Ghostly Staff']},
-    5178: {'name': 'Stygian Horror', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ["Griffon's Sweep", 'Power Attack', "Bull's Charge", "Bull's Strike", 'Counterattack', 'Enraged', 'Flail'], 'armor_levels': {'Blunt damage': '140', 'Piercing damage': '140', 'Slashing damage': '140', 'Cold damage': '120', 'Earth damage': '120', 'Fire damage': '120', 'Lightning damage': '120'}, 'items_dropped': ['Stygian Gemstone']},
-    5179: {'name': 'Stygian Fiend', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Savage Shot', 'Enraged', 'Choking Gas', 'Lightning Reflexes', 'Crippling Shot', 'Concussion Shot', 'Distracting Shot'], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '100', 'Slashing damage': '100', 'Cold damage': '130', 'Earth damage': '130', 'Fire damage': '130', 'Lightning damage': '130'}, 'items_dropped': ['Stygian Gemstone']},
-    5163: {'name': 'Stygian Underlord', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5164: {'name': 'Stygian Underlord', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5148: {'name': 'Stygian Lord', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5147: {'name': 'Stygian Lord', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5146: {'name': 'Stygian Lord', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    5145: {'name': 'Stygian Lord', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6601: {'name': 'Projects/NPC models/Charr', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6600: {'name': 'Projects/NPC models/Charr', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6531: {'name': 'Siege Devourer', 'profession': [], 'attributes': [{'level': 'by defeating and talking to a', 'name': 'Siege Devourer'}], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6614: {'name': 'Siege Devourer', 'profession': [], 'attributes': [{'level': 'by defeating and talking to a', 'name': 'Siege Devourer'}], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6673: {'name': 'Mantid Digger', 'profession': ['Dervish'], 'attributes': [{'level': '(20', 'name': 'Earth Prayers'}], 'skills_used': ['Dust Cloak', 'Aura of Thorns', 'Irresistible Sweep', 'Parasitic Bite', 'Pious Renewal', 'False Death', 'Twin Moon Sweep'], 'armor_levels': {'Blunt damage': '70', 'Piercing damage': '70', 'Slashing damage': '70', 'Cold damage': '70', 'Earth damage': '70', 'Fire damage': '70', 'Lightning damage': '70'}, 'items_dropped': ['Chitin Fragment', 'Mantid Ungula']},
-    6672: {'name': 'Mantid Nymph', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Domination Magic'}], 'skills_used': ['Auspicious Incantation', 'Ether Feast', 'Conjure Nightmare', 'False Death', 'Crippling Anguish', 'Images of Remorse'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Chitin Fragment', 'Mantid Ungula']},
-    6646: {'name': 'Horai Wingshielder', 'profession': ['Monk'], 'attributes': [{'level': '15', 'name': 'Smiting Prayers'}], 'skills_used': ['Shield of Regeneration', 'Smite Condition', 'Mend Condition', 'Spear of Light', 'Guardian', 'Smite Hex'], 'armor_levels': {}, 'items_dropped': ['Mantid Ungula', 'The Wingshielder', 'unique']},
-    6674: {'name': 'Mantid Queen', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6618: {'name': 'Charr Hexreaper', 'profession': ['Necromancer', 'Ritualist'], 'attributes': [{'level': '14', 'name': 'Communing'}, {'level': '15', 'name': 'Curses'}, {'level': '9', 'name': 'Soul Reaping'}, {'level': '17 Soul Reaping in', 'name': 'Hard mode'}], 'skills_used': ['Guided Weapon', 'Suffering', 'Faintheartedness', "Reaper's Mark", 'Parasitic Bond', 'Anguish'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Charr Bracers', 'Charr Garment', 'Superb Charr Carving']},
-    6634: {'name': 'Charr Seeker', 'profession': ['Ranger', 'Elementalist'], 'attributes': [{'level': '11', 'name': 'Wilderness Survival'}], 'skills_used': ['Troll Unguent', 'Savage Shot', 'Dual Shot', 'Prepared Shot', 'Conjure Flame', 'Flame Call', 'Gloat', 'Burning Arrow', 'Ignite Arrows'], 'armor_levels': {'Blunt damage': '70', 'Piercing damage': '70', 'Slashing damage': '70', 'Cold damage': '100', 'Earth damage': '100', 'Fire damage': '100', 'Lightning damage': '100'}, 'items_dropped': ['Charr Armor', 'Charr Bracers', 'Charr Garment', 'Superb Charr Carving']},
-    6627: {'name': 'Charr Axemaster', 'profession': ['Warrior', 'Elementalist'], 'attributes': [], 'skills_used': ['Eviscerate', "Executioner's Strike", 'Resurrection Signet', "Bull's Strike", 'Conjure Flame', 'Gloat', "Lion's Comfort", 'Flail'], 'armor_levels': {'Blunt damage': '116', 'Piercing damage': '116', 'Slashing damage': '116', 'Cold damage': '96', 'Earth damage': '96', 'Fire damage': '96', 'Lightning damage': '96'}, 'items_dropped': ['Charr Armor', 'Charr Bracers', 'Charr Garment', 'Superb Charr Carving']},
-    6621: {'name': 'Charr Flameshielder', 'profession': ['Elementalist', 'Monk'], 'attributes': [{'level': '15', 'name': 'Fire Magic'}], 'skills_used': ['Fire Storm', 'Extinguish', 'Mark of Rodgort', 'Gloat', 'Aegis', 'Meteor Shower', 'Ether Prodigy'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Charr Armor', 'Charr Bracers', 'Superb Charr Carving']},
-    6616: {'name': 'Charr Dominator', 'profession': ['Mesmer', 'Monk'], 'attributes': [{'level': '15', 'name': 'Domination Magic'}], 'skills_used': ['Backfire', 'Power Block', 'Shatter Enchantment', 'Power Spike', 'Resurrection Chant', 'Shatter Hex'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Charr Bracers', 'Charr Garment', 'Superb Charr Carving']},
-    6631: {'name': 'Charr Blademaster', 'profession': ['Warrior', 'Elementalist'], 'attributes': [{'level': '15', 'name': 'Swordsmanship'}, {'level': '14', 'name': 'Tactics'}, {'level': '16 Tactics in', 'name': 'Hard mode'}], 'skills_used': ['Healing Signet', 'Resurrection Signet', 'Sever Artery', '"Charge!"', 'Deadly Riposte', 'Gash', 'Conjure Flame'], 'armor_levels': {'Blunt damage': '116', 'Piercing damage': '116', 'Slashing damage': '116', 'Cold damage': '96', 'Earth damage': '96', 'Fire damage': '96', 'Lightning damage': '96'}, 'items_dropped': ['Charr Armor', 'Charr Bracers', 'Charr Garment', 'Superb Charr Carving']},
-    6649: {'name': 'Molotov Rocktail', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Devourer Siege', "Leviathan's Sweep", 'Power Attack', 'Enraging Charge', 'Endure Pain', 'Headbutt', 'Flail'], 'armor_levels': {}, 'items_dropped': ["Rocktail's Stinger", 'unique']},
-    6653: {'name': 'Armored Saurus', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Sliver Armor', 'Grasping Earth', 'Twisting Jaws', 'Stun Immunity', 'Stoneflesh Aura', 'Armor of Earth', 'Shockwave'], 'armor_levels': {}, 'items_dropped': []},
-    6652: {'name': 'Armored Saurus', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Sliver Armor', 'Grasping Earth', 'Twisting Jaws', 'Stun Immunity', 'Stoneflesh Aura', 'Armor of Earth', 'Shockwave'], 'armor_levels': {}, 'items_dropped': []},
-    6593: {'name': 'Gron Fierceclaw', 'profession': ['Assassin'], 'attributes': [], 'skills_used': ['Shadow Refuge', 'Critical Defenses', 'Golden Lotus Strike', 'Golden Skull Strike', 'Way of Perfection', 'Death Blossom'], 'armor_levels': {}, 'items_dropped': []},
-    6590: {'name': 'Bonwor Fierceblade', 'profession': ['Warrior'], 'attributes': [{'level': '15', 'name': 'Tactics'}], 'skills_used': ['Healing Signet', 'Barbarous Slice', '"Charge!"', 'Gash', 'Final Thrust', "Lion's Comfort", '"Retreat!"'], 'armor_levels': {}, 'items_dropped': []},
-    6584: {'name': 'Seer Fiercereign', 'profession': ['Ritualist'], 'attributes': [{'level': '15', 'name': 'Channeling Magic'}], 'skills_used': ['Gaze from Beyond', "Wielder's Zeal", 'Weapon of Warding', 'Vengeful Weapon', 'Bloodsong', 'Spirit Boon Strike'], 'armor_levels': {}, 'items_dropped': []},
-    6586: {'name': 'Cowl Fiercetongue', 'profession': ['Elementalist', 'Monk'], 'attributes': [{'level': '8-10', 'name': 'Protection Prayers'}, {'level': '15', 'name': 'Water Magic'}, {'level': '20 Water Magic in', 'name': 'Hard mode'}], 'skills_used': ['Glyph of Lesser Energy', 'Aura of Restoration', 'Vapor Blade', 'Icy Prism', 'Blurred Vision', 'Ward Against Harm', 'Guardian', 'Ice Spikes'], 'armor_levels': {}, 'items_dropped': []},
-    6588: {'name': 'Roan Fierceheart', 'profession': ['Monk', 'Mesmer'], 'attributes': [{'level': '14', 'name': 'Divine Favor'}, {'level': '15', 'name': 'Smiting Prayers'}], 'skills_used': ['Smite Condition', 'Inspired Enchantment', "Smiter's Boon", 'Blessed Light', 'Reversal of Damage', 'Smite Hex', 'Inspired Hex'], 'armor_levels': {}, 'items_dropped': []},
-    6637: {'name': 'Charr Wardkeeper', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Water Magic'}], 'skills_used': ['Ward Against Melee', 'Aura of Restoration', 'Ward Against Harm', 'Blurred Vision', 'Gloat', 'Deep Freeze', 'Ward Against Elements'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Charr Armor', 'Charr Bracers']},
-    6574: {'name': 'Elite Charr Guard', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6043: {'name': 'Captured Vanguard Soldier', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6044: {'name': 'Captured Vanguard Soldier', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6045: {'name': 'Captured Vanguard Soldier', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6554: {'name': 'Hierophant Burntsoul', 'profession': ['Elementalist', 'Monk'], 'attributes': [], 'skills_used': ['Fire Storm', 'Flare', 'Extinguish', 'Aegis', 'Meteor Shower', 'Ether Prodigy'], 'armor_levels': {}, 'items_dropped': ['Charr Armor', 'Charr Garment']},
-    6639: {'name': 'Charr Avenger', 'profession': ['Ritualist', 'Necromancer'], 'attributes': [{'level': '15', 'name': 'Communing'}, {'level': '9 or 10', 'name': 'Restoration Magic'}], 'skills_used': ['Pain', 'Rend Enchantments', 'Resurrection Signet', 'Mend Body and Soul', 'Enfeeble', 'Protective Was Kaolai', "Caretaker's Charge", 'Weapon of Warding', 'Vengeful Weapon', 'Shadowsong', 'Wanderlust', 'Flesh of My Flesh', "Ancestors' Rage", 'Recovery'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Superb Charr Carving']},
-    6145: {'name': 'Destroyer of Thoughts', 'profession': ['Mesmer'], 'attributes': [{'level': '16', 'name': 'Domination Magic'}], 'skills_used': ['Ether Feast', 'Guilt', 'Chaos Storm', 'Energy Surge', 'Spiritual Pain', 'Hex Eater Vortex', 'Burning Immunity', 'Shatter Enchantment', 'Power Leak', 'Inner Fire', 'Shatter Hex', 'Mirror of Disenchantment'], 'armor_levels': {'Blunt damage': '103', 'Piercing damage': '103', 'Slashing damage': '103', 'Cold damage': '83', 'Earth damage': '103', 'Fire damage': '123', 'Lightning damage': '103'}, 'items_dropped': ['Destroyer Core']},
-    6168: {'name': 'Destroyer of Deeds', 'profession': ['Ranger'], 'attributes': [{'level': '16', 'name': 'Marksmanship'}, {'level': '20', 'name': 'Expertise'}], 'skills_used': ['Savage Shot', 'Punishing Shot', 'Seeking Arrows', 'Debilitating Shot', 'Lightning Reflexes', 'Inner Fire', 'Concussion Shot', 'Distracting Shot'], 'armor_levels': {'Blunt damage': '114', 'Piercing damage': '114', 'Slashing damage': '114', 'Cold damage': '124', 'Earth damage': '144', 'Fire damage': '164', 'Lightning damage': '144'}, 'items_dropped': ['Destroyer Core']},
-    6169: {'name': 'Destroyer of Hordes', 'profession': ['Ranger'], 'attributes': [{'level': 'Level 28 (30): 14-16', 'name': 'Expertise'}, {'level': '15', 'name': 'Wilderness Survival'}], 'skills_used': ['Crossfire', 'Barrage', 'Winnowing', 'Lightning Reflexes', 'Splinter Shot (monster skill)', 'Inner Fire', 'Burning Immunity'], 'armor_levels': {'Blunt damage': '114', 'Piercing damage': '114', 'Slashing damage': '114', 'Cold damage': '124', 'Earth damage': '144', 'Fire damage': '164', 'Lightning damage': '144'}, 'items_dropped': ['Destroyer Core']},
-    6157: {'name': 'Destroyer of Bones', 'profession': ['Warrior'], 'attributes': [{'level': '14-16', 'name': 'Strength'}], 'skills_used': ['Crushing Blow', 'Tiger Stance', 'Renewing Smash', 'Heavy Blow', 'Devastating Hammer', "Warrior's Cunning", 'Inner Fire', 'Burning Immunity'], 'armor_levels': {'Blunt damage': '143', 'Piercing damage': '143', 'Slashing damage': '143', 'Cold damage': '103', 'Earth damage': '123', 'Fire damage': '143', 'Lightning damage': '123'}, 'items_dropped': ['Destroyer Core']},
-    6156: {'name': 'Destroyer of Sinew', 'profession': ['Warrior'], 'attributes': [{'level': '14-16', 'name': 'Strength'}], 'skills_used': ["Executioner's Strike", 'Tiger Stance', 'Inner Fire', 'Cyclone Axe', "Warrior's Cunning", 'Triple Chop', 'Burning Immunity'], 'armor_levels': {'Blunt damage': '159', 'Piercing damage': '159', 'Slashing damage': '159', 'Cold damage': '119', 'Earth damage': '139', 'Fire damage': '159', 'Lightning damage': '139'}, 'items_dropped': ['Destroyer Core']},
-    6032: {'name': 'Captain Langmar', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Sever Artery'], 'armor_levels': {}, 'items_dropped': []},
-    6656: {'name': 'Vile Mandragor', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Curses'}, {'level': '15', 'name': 'Death Magic'}], 'skills_used': ['Weaken Knees', 'Vile Touch', 'Ground Cover', 'Chilblains', "Mandragor's Charge", 'Mark of Pain', 'Consume Corpse'], 'armor_levels': {'Blunt damage': '95', 'Piercing damage': '95', 'Slashing damage': '95', 'Cold damage': '71', 'Earth damage': '47', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Fibrous Mandragor Root']},
-    6658: {'name': 'Mandragor Smoke Devil', 'profession': ['Ranger'], 'attributes': [{'level': '14..16', 'name': 'Expertise'}, {'level': '15', 'name': 'Wilderness Survival'}, {'level': '20 Wilderness Survival in', 'name': 'Hard Mode'}], 'skills_used': ['Snare', 'Healing Spring', 'Ground Cover', 'Flame Trap', "Mandragor's Charge", 'Smoke Trap', 'Tripwire', 'Whirling Defense'], 'armor_levels': {'Blunt damage': '106', 'Piercing damage': '106', 'Slashing damage': '106', 'Cold damage': '112', 'Earth damage': '88', 'Fire damage': '112', 'Lightning damage': '112'}, 'items_dropped': ['Fibrous Mandragor Root']},
-    6657: {'name': 'Mandragor Dust Devil', 'profession': ['Ranger'], 'attributes': [{'level': '11', 'name': 'Beast Mastery'}, {'level': '15', 'name': 'Wilderness Survival'}], 'skills_used': ['Healing Spring', 'Dust Trap', 'Ground Cover', "Trapper's Focus", "Trapper's Speed", "Mandragor's Charge", "Viper's Nest"], 'armor_levels': {'Blunt damage': '106', 'Piercing damage': '106', 'Slashing damage': '106', 'Cold damage': '112', 'Earth damage': '88', 'Fire damage': '112', 'Lightning damage': '112'}, 'items_dropped': ['Fibrous Mandragor Root']},
-    6675: {'name': 'Deadly Skale', 'profession': ['Assassin'], 'attributes': [{'level': '15', 'name': 'Deadly Arts'}], 'skills_used': ['Shroud of Silence', 'Entangling Asp', 'Disrupting Stab', 'Iron Palm', 'Desperate Strike'], 'armor_levels': {'Blunt damage': '82', 'Piercing damage': '82', 'Slashing damage': '82', 'Cold damage': '82', 'Earth damage': '82', 'Fire damage': '82', 'Lightning damage': '82'}, 'items_dropped': ['Skale Fang']},
-    6626: {'name': 'Charr Mender', 'profession': ['Monk', 'Paragon'], 'attributes': [], 'skills_used': ['Mend Condition', 'Chorus of Restoration', "Leader's Zeal", 'Life Sheath', 'Reversal of Fortune', 'Protective Spirit'], 'armor_levels': {'Blunt damage': '60', 'Piercing damage': '60', 'Slashing damage': '60', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Charr Armor', 'Superb Charr Carving']},
-    6644: {'name': 'Thraexis Thundermaw', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Stoning', 'Whirlwind', 'Enervating Charge', 'Glyph of Restoration', 'Ash Blast', 'Ride the Lightning'], 'armor_levels': {}, 'items_dropped': ['The Thundermaw', 'unique']},
-    6551: {'name': 'Katye Bloodburner', 'profession': ['Necromancer', 'Elementalist'], 'attributes': [], 'skills_used': ['Life Transfer', 'Fire Storm', 'Mark of Rodgort', 'Life Siphon', 'Signet of Lost Souls', 'Meteor Shower'], 'armor_levels': {}, 'items_dropped': ['Charr Garment', 'Superb Charr Carving', 'The Bloodburner', 'unique']},
-    6550: {'name': 'Anmat the Trickster', 'profession': ['Mesmer', 'Monk'], 'attributes': [{'level': '(20', 'name': 'Domination Magic'}], 'skills_used': ['Backfire', 'Power Block', 'Shatter Enchantment', 'Resurrection Chant', 'Power Spike', 'Shatter Hex'], 'armor_levels': {}, 'items_dropped': ['Charr Armor', 'Superb Charr Carving', 'The Trickster', 'unique']},
-    6670: {'name': 'Grawl Champion', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Mighty Blow', 'Blood Rage', 'Mokele Smash', 'Staggering Blow', 'Overbearing Smash', 'Battle Rage', 'Counter Blow'], 'armor_levels': {'Blunt damage': '81', 'Piercing damage': '111', 'Slashing damage': '111', 'Cold damage': '91', 'Earth damage': '91', 'Fire damage': '91', 'Lightning damage': '91'}, 'items_dropped': ['Grawl Spaulder', 'Grawl Trappings', 'Grawl Vambrace', 'Stone Grawl Necklace']},
-    6669: {'name': 'Grawl Dark Priest', 'profession': ['Ritualist'], 'attributes': [{'level': '11', 'name': 'Restoration Magic'}, {'level': '17 Restoration Magic in', 'name': 'Hard Mode'}], 'skills_used': ['Spirit Transfer', 'Rupture Soul', 'Mend Body and Soul', 'Preservation', 'Boon of Creation', 'Restoration', 'Soothing'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Grawl Trappings', 'Grawl Vambrace', 'Stone Grawl Necklace']},
-    4219: {'name': 'Spirit of Preservation', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    6678: {'name': 'Tumbled Elemental', 'profession': ['Warrior'], 'attributes': [{'level': '(20', 'name': 'Hammer Mastery'}], 'skills_used': ['Earth Shaker', 'Healing Signet', 'Crude Swing', 'Irresistible Blow'], 'armor_levels': {'Blunt damage': '111', 'Piercing damage': '111', 'Slashing damage': '111', 'Cold damage': '91', 'Earth damage': '91', 'Fire damage': '91', 'Lightning damage': '91'}, 'items_dropped': []},
-    6915: {'name': 'Flowstone Elemental', 'profession': ['Elementalist'], 'attributes': [{'level': '19', 'name': 'Fire Magic'}], 'skills_used': ['Fire Storm', 'Glyph of Lesser Energy', 'Flare', "Rodgort's Invocation", 'Savannah Heat', 'Fire Attunement', 'Burning Immunity'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '51', 'Earth damage': '71', 'Fire damage': '111', 'Lightning damage': '71'}, 'items_dropped': ['Pile of Elemental Dust']},
-    6916: {'name': 'Magma Blister', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Blood Magic'}, {'level': '11', 'name': 'Soul Reaping'}], 'skills_used': ['Signet of Sorrow', 'Mark of Subversion', 'Consume Corpse', 'Blood is Power', 'Life Siphon', 'Signet of Lost Souls', 'Burning Immunity'], 'armor_levels': {'Blunt damage': '115', 'Piercing damage': '115', 'Slashing damage': '115', 'Cold damage': '71', 'Earth damage': '91', 'Fire damage': '131', 'Lightning damage': '91'}, 'items_dropped': ['Blob of Ooze']},
-    6671: {'name': 'Grawl Demagogue', 'profession': ['Paragon'], 'attributes': [], 'skills_used': ['"Brace Yourself!"', 'Blood Rage', 'Aggressive Refrain', 'Focused Anger', 'Song of Concentration', '"Go for the Eyes!"', 'Anthem of Envy'], 'armor_levels': {'Blunt damage': '91', 'Piercing damage': '91', 'Slashing damage': '91', 'Cold damage': '91', 'Earth damage': '91', 'Fire damage': '91', 'Lightning damage': '91'}, 'items_dropped': ['Grawl Trappings', 'Grawl Vambrace', 'Stone Grawl Necklace']},
-    6918: {'name': 'Burning Spirit', 'profession': ['Elementalist'], 'attributes': [{'level': '15', 'name': 'Fire Magic'}], 'skills_used': ['Glowing Gaze', 'Glyph of Lesser Energy', 'Aura of Restoration', "Flame Djinn's Haste", 'Mark of Rodgort', 'Searing Flames', 'Burning Immunity'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '51', 'Earth damage': '71', 'Fire damage': '111', 'Lightning damage': '71'}, 'items_dropped': ['Pile of Elemental Dust']},
-    6654: {'name': 'Ignus the Eternal', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Forceful Blow', 'Thrill of Victory', 'Wild Blow', 'Irresistible Blow'], 'armor_levels': {}, 'items_dropped': []},
-    6640: {'name': 'Swarm of Bees', 'profession': [], 'attributes': [], 'skills_used': ['Invulnerability'], 'armor_levels': {}, 'items_dropped': []},
-    1723: {'name': 'Mergoyle Wavebreaker', 'profession': ['Elementalist'], 'attributes': [{'level': '8', 'name': 'Earth Magic'}, {'level': '11', 'name': 'Water Magic'}, {'level': '20 Water Magic in', 'name': 'Hard mode'}], 'skills_used': ['Grasping Earth', 'Glyph of Lesser Energy', 'Aura of Restoration', 'Crystal Wave', 'Deep Freeze'], 'armor_levels': {'Blunt damage': '25', 'Piercing damage': '25', 'Slashing damage': '25', 'Cold damage': '65', 'Earth damage': '25', 'Fire damage': '25', 'Lightning damage': '25'}, 'items_dropped': ['Mergoyle Skull']},
-    2491: {'name': 'Snow Ettin', 'profession': ['Warrior'], 'attributes': [{'level': '11', 'name': 'Hammer Mastery'}], 'skills_used': ['Power Attack', 'Stun Immunity', 'Staggering Blow', 'Devastating Hammer', 'Balanced Stance'], 'armor_levels': {'Blunt damage': '74', 'Piercing damage': '74', 'Slashing damage': '74', 'Cold damage': '54', 'Earth damage': '54', 'Fire damage': '54', 'Lightning damage': '54'}, 'items_dropped': ['Half-Chewed Mass', 'Icy Hump', 'Snowy Ettin Hide']},
-    2647: {'name': 'Ice Golem', 'profession': ['Elementalist'], 'attributes': [{'level': '10', 'name': 'Energy Storage'}, {'level': '6', 'name': 'Water Magic'}], 'skills_used': ['Frozen Burst', 'Ice Spikes', 'Water Trident', 'Water Attunement'], 'armor_levels': {'Blunt damage': '52', 'Piercing damage': '52', 'Slashing damage': '52', 'Cold damage': '52', 'Earth damage': '52', 'Fire damage': '12', 'Lightning damage': '52'}, 'items_dropped': ['Icy Lodestone', 'Summit Axe', 'Summit Hammer']},
-    2479: {'name': 'Whiskar Featherstorm', 'profession': ['Elementalist'], 'attributes': [{'level': '11', 'name': 'Water Magic'}], 'skills_used': ['Whirlwind', 'Aura of Restoration', 'Enervating Charge', 'Glyph of Concentration', 'Ice Prison'], 'armor_levels': {}, 'items_dropped': []},
-    2548: {'name': 'Snow', 'profession': ['Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2229: {'name': 'Master Seeker Nathaniel', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2481: {'name': 'Snow Ettin', 'profession': ['Warrior'], 'attributes': [{'level': '11', 'name': 'Hammer Mastery'}], 'skills_used': ['Power Attack', 'Stun Immunity', 'Staggering Blow', 'Devastating Hammer', 'Balanced Stance'], 'armor_levels': {'Blunt damage': '74', 'Piercing damage': '74', 'Slashing damage': '74', 'Cold damage': '54', 'Earth damage': '54', 'Fire damage': '54', 'Lightning damage': '54'}, 'items_dropped': ['Half-Chewed Mass', 'Icy Hump', 'Snowy Ettin Hide']},
-    2487: {'name': 'Shiverpeak Protector', 'profession': ['Monk'], 'attributes': [{'level': '5-6', 'name': 'Divine Favor'}, {'level': '2', 'name': 'Healing Prayers'}, {'level': '16', 'name': 'Protection Prayers'}], 'skills_used': ['Aura of Faith', 'Vigorous Spirit', 'Mend Ailment', 'Purge Conditions', 'Healing Breeze'], 'armor_levels': {'Blunt damage': '21', 'Piercing damage': '21', 'Slashing damage': '21', 'Cold damage': '41', 'Earth damage': '21', 'Fire damage': '21', 'Lightning damage': '21'}, 'items_dropped': ['Shiverpeak Lifeband Robes', 'Shiverpeak Mane', 'Snowy Centaur Hide']},
-    2488: {'name': 'Shiverpeak Warrior', 'profession': ['Warrior'], 'attributes': [{'level': '3', 'name': 'Axe Mastery'}, {'level': '6', 'name': 'Swordsmanship'}, {'level': '8-10', 'name': 'Tactics'}], 'skills_used': ['Dismember', 'Sever Artery', 'Power Attack', 'Shield Stance'], 'armor_levels': {'Blunt damage': '63 to 65', 'Piercing damage': '63 to 65', 'Slashing damage': '63 to 65', 'Cold damage': '64 to 67', 'Earth damage': '43 to 45', 'Fire damage': '43 to 45', 'Lightning damage': '43 to 45'}, 'items_dropped': ['Shiverpeak Bladehand Armor', 'Shiverpeak Mane', 'Snowy Centaur Hide']},
-    2489: {'name': 'Shiverpeak Longbow', 'profession': ['Ranger'], 'attributes': [{'level': '7', 'name': 'Expertise'}, {'level': '5', 'name': 'Wilderness Survival'}, {'level': '16 Wilderness Survival in', 'name': 'hard mode'}], 'skills_used': ['Power Shot', "Serpent's Quickness", 'Distracting Shot', 'Winter'], 'armor_levels': {'Blunt damage': '26', 'Piercing damage': '26', 'Slashing damage': '26', 'Cold damage': '66', 'Earth damage': '26', 'Fire damage': '56', 'Lightning damage': '56'}, 'items_dropped': ['Shiverpeak Bowmaster Vest', 'Shiverpeak Mane', 'Snowy Centaur Hide']},
-    2475: {'name': 'Moro Stormcalf', 'profession': ['Elementalist'], 'attributes': [{'level': '(20', 'name': 'Earth Magic'}], 'skills_used': ['Earth Attunement', 'Ice Spear', 'Ward Against Foes', 'Aura of Restoration', 'Magnetic Aura'], 'armor_levels': {}, 'items_dropped': ['Shiverpeak Mane']},
-    2476: {'name': 'Jolo Lighthaunch', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Purge Conditions', 'Vigorous Spirit', 'Healing Breeze', 'Mend Ailment'], 'armor_levels': {}, 'items_dropped': ['Shiverpeak Lifeband Robes', 'Shiverpeak Mane', 'Snowy Centaur Hide']},
-    1350: {'name': 'Wolf', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2490: {'name': 'Frostfire Dryder', 'profession': ['Necromancer'], 'attributes': [{'level': '10', 'name': 'Curses'}, {'level': '6', 'name': 'Blood Magic'}, {'level': '16 Blood Magic in', 'name': 'Hard mode'}], 'skills_used': ['Suffering', 'Faintheartedness', 'Soul Leech', 'Defile Flesh', 'Shadow Strike'], 'armor_levels': {'Blunt damage': '30', 'Piercing damage': '30', 'Slashing damage': '30', 'Cold damage': '30', 'Earth damage': '30', 'Fire damage': '30', 'Lightning damage': '30'}, 'items_dropped': ['Frostfire Fang']},
-    2483: {'name': 'Frostfire Dryder', 'profession': ['Necromancer'], 'attributes': [{'level': '10', 'name': 'Curses'}, {'level': '6', 'name': 'Blood Magic'}, {'level': '16 Blood Magic in', 'name': 'Hard mode'}], 'skills_used': ['Suffering', 'Faintheartedness', 'Soul Leech', 'Defile Flesh', 'Shadow Strike'], 'armor_levels': {'Blunt damage': '30', 'Piercing damage': '30', 'Slashing damage': '30', 'Cold damage': '30', 'Earth damage': '30', 'Fire damage': '30', 'Lightning damage': '30'}, 'items_dropped': ['Frostfire Fang']},
-    2485: {'name': 'Frostfire Dryder', 'profession': ['Necromancer'], 'attributes': [{'level': '10', 'name': 'Curses'}, {'level': '6', 'name': 'Blood Magic'}, {'level': '16 Blood Magic in', 'name': 'Hard mode'}], 'skills_used': ['Suffering', 'Faintheartedness', 'Soul Leech', 'Defile Flesh', 'Shadow Strike'], 'armor_levels': {'Blunt damage': '30', 'Piercing damage': '30', 'Slashing damage': '30', 'Cold damage': '30', 'Earth damage': '30', 'Fire damage': '30', 'Lightning damage': '30'}, 'items_dropped': ['Frostfire Fang']},
-    2484: {'name': 'Frostfire Dryder', 'profession': ['Necromancer'], 'attributes': [{'level': '10', 'name': 'Curses'}, {'level': '6', 'name': 'Blood Magic'}, {'level': '16 Blood Magic in', 'name': 'Hard mode'}], 'skills_used': ['Suffering', 'Faintheartedness', 'Soul Leech', 'Defile Flesh', 'Shadow Strike'], 'armor_levels': {'Blunt damage': '30', 'Piercing damage': '30', 'Slashing damage': '30', 'Cold damage': '30', 'Earth damage': '30', 'Fire damage': '30', 'Lightning damage': '30'}, 'items_dropped': ['Frostfire Fang']},
-    2641: {'name': 'Stone Summit Sage', 'profession': ['Mesmer'], 'attributes': [{'level': '10', 'name': 'Domination Magic'}, {'level': '19', 'name': 'Illusion Magic'}], 'skills_used': ['Ether Feast', 'Discharge Enchantment', 'Shatter Enchantment', 'Power Drain', 'Clumsiness', 'Images of Remorse', 'Empathy', 'Crippling Anguish', 'Channeling', 'Illusion of Haste'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '71', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '71', 'Lightning damage': '71'}, 'items_dropped': ['Dwarven Robes', 'Stone Summit Badge', 'Stone Summit Emblem', 'Summit Axe']},
-    2640: {'name': 'Dolyak Rider', 'profession': ['Monk'], 'attributes': [{'level': '10', 'name': 'Protection Prayers'}], 'skills_used': ['Heal Other', 'Stun Immunity', 'Mark of Protection', 'Shielding Hands', 'Strength of Honor', 'Remove Hex', 'Banish'], 'armor_levels': {'Blunt damage': '34', 'Piercing damage': '34', 'Slashing damage': '34', 'Cold damage': '34', 'Earth damage': '34', 'Fire damage': '34', 'Lightning damage': '34'}, 'items_dropped': ['Dolyak Cladding', 'Dolyak Hide', 'Stone Summit Badge', 'Summit Axe', 'Summit Hammer']},
-    2642: {'name': 'Stone Summit Howler', 'profession': ['Necromancer'], 'attributes': [{'level': '10', 'name': 'Blood Magic'}, {'level': '4', 'name': 'Death Magic'}, {'level': '6', 'name': 'Soul Reaping'}, {'level': '16 Soul Reaping in', 'name': 'Hard mode'}], 'skills_used': ['Vampiric Touch', 'Vile Touch', 'Soul Feast', 'Strip Enchantment', 'Plague Touch', 'Offering of Blood'], 'armor_levels': {'Blunt damage': '32', 'Piercing damage': '32', 'Slashing damage': '32', 'Cold damage': '32', 'Earth damage': '32', 'Fire damage': '32', 'Lightning damage': '32'}, 'items_dropped': ['Dwarven Howler Outfit', 'Dwarven Robes', 'Stone Summit Badge', 'Summit Axe', 'Summit Hammer']},
-    2646: {'name': 'Stone Summit Scout', 'profession': ['Ranger'], 'attributes': [{'level': '(24', 'name': 'Wilderness Survival'}], 'skills_used': ["Melandru's Arrows", 'Called Shot', 'Pin Down'], 'armor_levels': {'Blunt damage': '37', 'Piercing damage': '37', 'Slashing damage': '37', 'Cold damage': '67', 'Earth damage': '67', 'Fire damage': '67', 'Lightning damage': '67'}, 'items_dropped': ['Dwarven Scout Armor', 'Stone Summit Badge', 'Summit Axe', 'Summit Hammer']},
-    2622: {'name': 'Shalis Ironmantle', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Remove Hex', 'Heal Other', 'Shielding Hands', 'Strength of Honor'], 'armor_levels': {}, 'items_dropped': ['Dolyak Cladding', 'Stone Summit Badge', 'Summit Axe']},
-    2643: {'name': 'Summit Axe Wielder', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Penetrating Blow', 'Disrupting Chop', '"For Great Justice!"', 'Cleave'], 'armor_levels': {'Blunt damage': '77', 'Piercing damage': '77', 'Slashing damage': '77', 'Cold damage': '57', 'Earth damage': '57', 'Fire damage': '57', 'Lightning damage': '57'}, 'items_dropped': ['Dwarven Armor', 'Stone Summit Badge', 'Summit Axe']},
-    2612: {'name': 'Saris Headstaver', 'profession': ['Mesmer'], 'attributes': [{'level': '11', 'name': 'Domination Magic'}], 'skills_used': ['Shatter Enchantment', 'Ether Feast', 'Empathy', 'Illusion of Haste'], 'armor_levels': {}, 'items_dropped': ['Dwarven Robes', 'Stone Summit Badge']},
-    2616: {'name': 'Toris Stonehammer', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ["Bull's Strike", 'Mighty Blow', 'Dolyak Signet', 'Healing Signet'], 'armor_levels': {}, 'items_dropped': ['Dwarven Armor', 'Stone Summit Badge', 'Summit Hammer']},
-    2614: {'name': 'The Judge', 'profession': ['Elementalist'], 'attributes': [{'level': 'Level 12:7', 'name': 'Water Magic'}], 'skills_used': ['Aura of Restoration', 'Water Attunement', 'Frozen Burst', 'Rust', 'Ice Spikes', 'Water Trident', 'Deep Freeze'], 'armor_levels': {}, 'items_dropped': ['Icy Lodestone', 'Stone Summit Badge', 'verification requested']},
-    2439: {'name': 'Boulder Elemental', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Crude Swing', "Warrior's Endurance"], 'armor_levels': {'Blunt damage': '18', 'Piercing damage': '58', 'Slashing damage': '58', 'Cold damage': '58', 'Earth damage': '58', 'Fire damage': '58', 'Lightning damage': '58'}, 'items_dropped': ['Granite Slab', 'Lump of Charcoal', 'Sapphire', 'Scorched Lodestone']},
-    2442: {'name': 'Stone Fury', 'profession': ['Elementalist'], 'attributes': [{'level': '7', 'name': 'Earth Magic'}], 'skills_used': ['Ward Against Melee', 'Glyph of Energy', 'Eruption', 'Earthquake'], 'armor_levels': {'Blunt damage': '18', 'Piercing damage': '18', 'Slashing damage': '18', 'Cold damage': '18', 'Earth damage': '18', 'Fire damage': '18', 'Lightning damage': '18'}, 'items_dropped': ['Granite Slab', 'Lump of Charcoal', 'Scorched Lodestone', 'Ruby']},
-    1648: {'name': 'Charr Martyr', 'profession': ['Monk'], 'attributes': [{'level': '(16', 'name': 'Healing Prayers'}, {'level': '17', 'name': 'Smiting Prayers'}], 'skills_used': ['Orison of Healing', 'Shield of Judgment', 'Infuse Health', 'Bane Signet'], 'armor_levels': {'Blunt damage': '17', 'Piercing damage': '17', 'Slashing damage': '17', 'Cold damage': '17', 'Earth damage': '17', 'Fire damage': '17', 'Lightning damage': '17'}, 'items_dropped': ['Charr Carving', 'Charr Hide', 'Shaman Garb']},
-    1641: {'name': 'Charr Flame Wielder', 'profession': ['Elementalist', 'Mesmer'], 'attributes': [{'level': '16', 'name': 'Fire Magic'}], 'skills_used': ['Liquid Flame', 'Glowing Gaze', 'Flare', 'Aura of Restoration', 'Lava Font', 'Power Drain', 'Conjure Flame', 'Searing Flames', 'Glyph of Sacrifice', 'Fire Attunement', 'Meteor Shower'], 'armor_levels': {'Blunt damage': '26', 'Piercing damage': '26', 'Slashing damage': '26', 'Cold damage': '26', 'Earth damage': '26', 'Fire damage': '26', 'Lightning damage': '26'}, 'items_dropped': ['Charr Carving', 'Charr Hide', 'Flame Wielder Trappings']},
-    1636: {'name': 'Charr Mind Spark', 'profession': ['Mesmer'], 'attributes': [{'level': '4', 'name': 'Domination Magic'}], 'skills_used': ['Power Block', 'Energy Burn', 'Shatter Hex'], 'armor_levels': {'Blunt damage': '20', 'Piercing damage': '20', 'Slashing damage': '20', 'Cold damage': '20', 'Earth damage': '20', 'Fire damage': '20', 'Lightning damage': '20'}, 'items_dropped': ['Charr Carving', 'Charr Hide', 'Mind Spark Garb', 'Shaman Garb']},
-    1639: {'name': 'Charr Ash Walker', 'profession': ['Necromancer'], 'attributes': [{'level': '0', 'name': 'Blood Magic'}, {'level': '3', 'name': 'Curses'}, {'level': '20 Soul Reaping in', 'name': 'Hard mode'}], 'skills_used': ['Jagged Bones', 'Faintheartedness', 'Lingering Curse', 'Blood of the Master', 'Life Siphon', 'Animate Bone Minions'], 'armor_levels': {'Blunt damage': '20', 'Piercing damage': '20', 'Slashing damage': '20', 'Cold damage': '20', 'Earth damage': '20', 'Fire damage': '20', 'Lightning damage': '20'}, 'items_dropped': ['Ash Fiend Trappings', 'Charr Carving', 'Charr Hide']},
-    2425: {'name': 'Storm Rider', 'profession': ['Mesmer'], 'attributes': [{'level': '3', 'name': 'Domination Magic'}, {'level': '13-17', 'name': 'Inspiration Magic'}], 'skills_used': ['Backfire', 'Panic', 'Shatter Hex', 'Energy Tap'], 'armor_levels': {'Blunt damage': '20', 'Piercing damage': '20', 'Slashing damage': '20', 'Cold damage': '20', 'Earth damage': '20', 'Fire damage': '20', 'Lightning damage': '20'}, 'items_dropped': ['Stormy Eye']},
-    2447: {'name': 'Flash Gargoyle', 'profession': ['Elementalist'], 'attributes': [{'level': '(16', 'name': 'Air Magic'}], 'skills_used': ['Lightning Orb', 'Lightning Strike', 'Lightning Surge'], 'armor_levels': {'Blunt damage': '18', 'Piercing damage': '18', 'Slashing damage': '18', 'Cold damage': '18', 'Earth damage': '18', 'Fire damage': '18', 'Lightning damage': '58'}, 'items_dropped': ['Granite Slab', 'Monstrous Claw', 'Scale', 'Singed Gargoyle Skull']},
-    2060: {'name': 'Ascalonian Warrior', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Hundred Blades', 'Eviscerate', "Executioner's Strike", 'Axe Rake', 'Healing Signet', 'Hammer Bash', 'Sever Artery', 'Gash', 'Hamstring'], 'armor_levels': {}, 'items_dropped': []},
-    2451: {'name': 'Resurrect Gargoyle', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Resurrect (Gargoyle)', 'Shield of Deflection'], 'armor_levels': {'Blunt damage': '3', 'Piercing damage': '3', 'Slashing damage': '3', 'Cold damage': '3', 'Earth damage': '3', 'Fire damage': '3', 'Lightning damage': '43'}, 'items_dropped': ['Granite Slab', 'Scale', 'Singed Gargoyle Skull']},
-    2432: {'name': 'Whiptail Devourer', 'profession': ['Ranger'], 'attributes': [{'level': 'Level 4:3', 'name': 'Expertise'}], 'skills_used': ['Lightning Reflexes', 'Quick Shot', 'Called Shot'], 'armor_levels': {'Blunt damage': '32', 'Piercing damage': '32', 'Slashing damage': '32', 'Cold damage': '13', 'Earth damage': '33', 'Fire damage': '33', 'Lightning damage': '33'}, 'items_dropped': ['Chitin Fragment', 'Fetid Carapace', 'Half-Eaten Mass', 'Monstrous Claw']},
-    2394: {'name': 'Mallet Runecolumn', 'profession': ['Elementalist'], 'attributes': [{'level': '0', 'name': 'Earth Magic'}], 'skills_used': ['Aura of Restoration', 'Grasping Earth'], 'armor_levels': {}, 'items_dropped': ['Granite Slab', 'Scorched Lodestone']},
-    2455: {'name': 'Crown of Thorns', 'profession': ['Monk'], 'attributes': [{'level': '(17', 'name': 'Smiting Prayers'}], 'skills_used': ['Heal Other', 'Orison of Healing', 'Mend Condition', 'Holy Wrath', 'Signet of Judgment'], 'armor_levels': {}, 'items_dropped': ['Scorched Seed']},
-    1601: {'name': 'Drim Cindershot', 'profession': ['Ranger'], 'attributes': [{'level': '18', 'name': 'Marksmanship'}], 'skills_used': ['Ignite Arrows', 'Troll Unguent', 'Penetrating Attack', 'Favorable Winds'], 'armor_levels': {}, 'items_dropped': ['Charr Carving', 'Charr Hide', 'Stalker Armor']},
-    2052: {'name': 'Ascalonian Hunter', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Dual Shot'], 'armor_levels': {}, 'items_dropped': []},
-    1596: {'name': 'Mirash Dreambreaker', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Energy Burn', 'Mantra of Flame', 'Illusion of Haste'], 'armor_levels': {}, 'items_dropped': ['Charr Carving', 'Charr Hide', 'Mind Spark Garb']},
-    2068: {'name': 'Projects/NPC models/Humans/Ascalon', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2087: {'name': 'Projects/NPC models/Humans/Ascalon', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2101: {'name': 'Projects/NPC models/Humans/Ascalon', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2015: {'name': 'Projects/NPC models/Humans/Ascalon', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2139: {'name': 'Viggo', 'profession': ['Warrior'], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1600: {'name': 'Gorgaan Hatemonger', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Wild Blow', 'Eviscerate', "Executioner's Strike", 'Shield Stance', 'Healing Signet', "Bull's Strike", 'Frenzy', "Lion's Comfort", 'Flail'], 'armor_levels': {}, 'items_dropped': ['Axe Fiend Armor', 'Charr Carving', 'Charr Hide']},
-    2431: {'name': 'Plague Devourer', 'profession': ['Necromancer'], 'attributes': [{'level': 'Level 3:2', 'name': 'Death Magic'}, {'level': '16 Death Magic in hard mode)53+', 'name': 'energy'}], 'skills_used': ['Putrid Explosion', 'Parasitic Bond', 'Weaken Armor', 'Virulence'], 'armor_levels': {'Blunt damage': '16', 'Piercing damage': '16', 'Slashing damage': '16', 'Cold damage': '-2', 'Earth damage': '18', 'Fire damage': '18', 'Lightning damage': '18'}, 'items_dropped': ['Dull Carapace', 'Poisonous Stinger', 'The Poison Devourer']},
-    2404: {'name': 'Flint Touchstone', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Ward Against Melee', 'Aura of Restoration', 'Eruption', 'Whirlwind'], 'armor_levels': {}, 'items_dropped': ['Granite Slab', 'Lump of Charcoal', 'Scorched Lodestone']},
-    2458: {'name': 'Grawl', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2457: {'name': 'Grawl Ulodyte', 'profession': ['Monk'], 'attributes': [{'level': '0', 'name': 'Healing Prayers'}], 'skills_used': ['Heal Other', 'Heal Area', 'Healing Hands'], 'armor_levels': {'Blunt damage': '15', 'Piercing damage': '15', 'Slashing damage': '15', 'Cold damage': '15', 'Earth damage': '15', 'Fire damage': '15', 'Lightning damage': '15'}, 'items_dropped': ['Grawl Shaman Gear', 'Ornate Grawl Necklace']},
-    2437: {'name': 'Renegade', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Mind Burn'], 'armor_levels': {'Blunt damage': '52', 'Piercing damage': '52', 'Slashing damage': '52', 'Cold damage': '32', 'Earth damage': '32', 'Fire damage': '32', 'Lightning damage': '32'}, 'items_dropped': ['Rawhide Belt']},
-    2436: {'name': 'Renegade Elementalist', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Lightning Orb', 'Fire Storm', 'Mind Burn', 'Inferno'], 'armor_levels': {'Blunt damage': '14', 'Piercing damage': '14', 'Slashing damage': '14', 'Cold damage': '14', 'Earth damage': '14', 'Fire damage': '14', 'Lightning damage': '14'}, 'items_dropped': ['Rawhide Belt']},
-    2434: {'name': 'Crimson Devourer', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Lightning Reflexes', 'Quick Shot', 'Called Shot'], 'armor_levels': {'Blunt damage': '10', 'Piercing damage': '10', 'Slashing damage': '10', 'Cold damage': '-10', 'Earth damage': '10', 'Fire damage': '10', 'Lightning damage': '10'}, 'items_dropped': ['Chitin Fragment', 'Fetid Carapace', 'Half-Eaten Mass']},
-    2375: {'name': 'Larrk Etherburn', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Backfire', 'Ether Feast', 'Shatter Hex', 'Energy Tap'], 'armor_levels': {}, 'items_dropped': ['Stormy Eye']},
-    1942: {'name': 'Projects/NPC models/Humans/Ascalon', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2067: {'name': 'Priestess Rashenna', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2406: {'name': 'Ignis Phanaura', 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Ether Feast', 'Chaos Storm', 'Empathy', 'Ether Lord', 'Hex Breaker'], 'armor_levels': {}, 'items_dropped': ['Granite Slab', 'Scale', 'Singed Gargoyle Skull']},
-    2051: {'name': 'Ascalon Striker', 'profession': ['Warrior', 'Ranger'], 'attributes': [], 'skills_used': ['Dual Shot'], 'armor_levels': {}, 'items_dropped': []},
-    1681: {'name': 'Ryn Cursewing', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Life Siphon', 'Soul Feast', 'Suffering', 'Mark of Subversion'], 'armor_levels': {}, 'items_dropped': ['Feathered Caromi Scalp']},
-    2721: {'name': 'Boulad the Perverse', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Infuse Health', 'Symbol of Wrath', 'Smite Hex', 'Healing Breeze'], 'armor_levels': {}, 'items_dropped': ['Decayed Orr Emblem']},
-    2737: {'name': 'Skeleton Sorcerer', 'profession': ['Elementalist'], 'attributes': [{'level': '(20', 'name': 'Earth Magic'}], 'skills_used': ['Earthquake', 'Blinding Flash', 'Frozen Burst', 'Lightning Touch', 'Mirror of Ice', 'Aftershock', 'Freezing Gust', 'Ice Spikes', 'Armor of Mist', 'Deep Freeze'], 'armor_levels': {'Blunt damage': '14', 'Piercing damage': '54', 'Slashing damage': '34', 'Cold damage': '34', 'Earth damage': '34', 'Fire damage': '34', 'Lightning damage': '34'}, 'items_dropped': ['Bone', 'Dead Bow', 'Decayed Orr Emblem', 'Decayed Orr Robes', 'Pile of Glittering Dust']},
-    2743: {'name': 'Zombie Warlock', 'profession': ['Necromancer'], 'attributes': [{'level': 'Level 14:9', 'name': 'Death Magic'}], 'skills_used': ['Vampiric Gaze', 'Spoil Victor', 'Strip Enchantment', 'Plague Sending', 'Signet of Agony', 'Dark Bond', 'Vampiric Swarm', 'Animate Bone Minions', 'Death Nova'], 'armor_levels': {'Blunt damage': '43', 'Piercing damage': '43', 'Slashing damage': '43', 'Cold damage': '43', 'Earth damage': '43', 'Fire damage': '43', 'Lightning damage': '43'}, 'items_dropped': ['Bone', 'Dead Bow', 'Dead Staff', 'Decayed Orr Emblem', 'Decayed Orr Robes', 'Necrid Robes', 'Pile of Glittering Dust', 'Sephis Axe', "Warlock's Robes"]},
-    2738: {'name': 'Skeleton Monk', 'profession': ['Monk'], 'attributes': [{'level': '(16', 'name': 'Smiting Prayers'}], 'skills_used': ['Infuse Health', 'Smite Condition', 'Reversal of Damage', 'Ray of Judgment', 'Vengeance', 'Smite Hex', 'Healing Breeze'], 'armor_levels': {'Blunt damage': '11', 'Piercing damage': '51', 'Slashing damage': '31', 'Cold damage': '31', 'Earth damage': '31', 'Fire damage': '31', 'Lightning damage': '31'}, 'items_dropped': ['Bone', 'Corrupted Orr Vestments', 'Dead Bow', 'Decayed Orr Emblem', 'Pile of Glittering Dust', 'Undead Bone']},
-    2736: {'name': 'Skeleton Mesmer', 'profession': ['Mesmer'], 'attributes': [{'level': '11', 'name': 'Illusion Magic'}, {'level': '16', 'name': 'Domination Magic'}], 'skills_used': ['Fragility', 'Phantom Pain', 'Arcane Conundrum', 'Migraine', 'Signet of Disenchantment', 'Accumulated Pain', 'Ineptitude', 'Soothing Images', 'Shatter Hex', 'Signet of Humility'], 'armor_levels': {'Blunt damage': '26', 'Piercing damage': '66', 'Slashing damage': '46', 'Cold damage': '46', 'Earth damage': '46', 'Fire damage': '46', 'Lightning damage': '46'}, 'items_dropped': ['Bone', 'Corrupted Orr Collar', 'Decayed Orr Emblem', 'Pile of Glittering Dust', 'Sephis Axe']},
-    8055: {'name': 'Snakebite', 'profession': ['Warrior', 'Ranger'], 'attributes': [], 'skills_used': ['"You\'re All Alone!"', 'Knee Cutter', "Serpent's Quickness", 'Sever Artery', 'Counterattack', "Lion's Comfort", 'Apply Poison', 'Disarm'], 'armor_levels': {}, 'items_dropped': []},
-    8107: {'name': 'Grim Peacekeeper', 'profession': ['Necromancer', 'Assassin', 'Dervish'], 'attributes': [{'level': '15', 'name': 'Blood Magic'}, {'level': '13', 'name': 'Deadly Arts'}], 'skills_used': ['Signet of Deadly Corruption', 'Vow of Piety', 'Aura of the Lich', 'Dark Bond', 'Mark of Fury', 'Blood Bond', "Verata's Gaze", 'Rip Enchantment', 'Oppressive Gaze', 'Barbed Signet', 'Ravenous Gaze', 'Shadow Strike', 'Defile Defenses', 'Life Siphon', 'Death Nova', 'Order of Apostasy', 'Vile Miasma', 'Jaundiced Gaze', 'Animate Vampiric Horror', 'Parasitic Bond', 'Weaken Armor', 'Insidious Parasite'], 'armor_levels': {'Blunt damage': '60 (60)', 'Piercing damage': '60 (60)', 'Slashing damage': '60 (60)', 'Cold damage': '60 (60)', 'Earth damage': '60 (60)', 'Fire damage': '60 (60)', 'Lightning damage': '60 (60)'}, 'items_dropped': ["Confessor's Orders", 'The Soul Reaper', 'unique']},
-    8148: {'name': 'Peacekeeper Sibyl', 'profession': ['Dervish', 'Warrior', 'Necromancer', 'Ritualist'], 'attributes': [], 'skills_used': ['Mystic Sweep', 'Conviction', 'Victorious Sweep', 'Sand Shards', 'Chilling Victory', "Lyssa's Assault", 'Zealous Sweep', 'Irresistible Sweep', 'Armor of Sanctity', 'Wounding Strike', 'Avatar of Grenth', 'Onslaught', 'Wild Blow', '"Fear Me!"', 'Vital Boon', "Dwayna's Touch", 'Faithful Intervention', 'Crippling Victory', 'Aura Slicer', 'Unholy Feast', 'Rending Aura', 'Heart of Fury', 'Mystic Regeneration', 'Death Pact Signet', 'Mystic Vigor', 'Ebon Dust Aura', 'Demonic Flesh', "Attacker's Insight"], 'armor_levels': {'Blunt damage': '70 (88)', 'Piercing damage': '70 (88)', 'Slashing damage': '70 (88)', 'Cold damage': '70 (88)', 'Earth damage': '70 (88)', 'Fire damage': '70 (88)', 'Lightning damage': '70 (88)'}, 'items_dropped': ["Confessor's Orders", 'Long Arm of the Law', 'unique']},
-    1734: {'name': 'Ancient Oakheart', 'profession': ['Monk'], 'attributes': [{'level': '13', 'name': 'Smiting Prayers'}], 'skills_used': ["Balthazar's Aura", 'Signet of Judgment', 'Retribution', 'Healing Breeze'], 'armor_levels': {'Blunt damage': '71', 'Piercing damage': '71', 'Slashing damage': '31', 'Cold damage': '71', 'Earth damage': '71', 'Fire damage': '31', 'Lightning damage': '71'}, 'items_dropped': ['Abnormal Seed', 'Monstrous Eye', 'Plant Fiber', 'Wood Plank']},
-    1730: {'name': 'Reed Stalker', 'profession': ['Mesmer'], 'attributes': [{'level': '9', 'name': 'Domination Magic'}, {'level': '13', 'name': 'Illusion Magic'}, {'level': '20 Illusion Magic in', 'name': 'Hard mode'}], 'skills_used': ['Power Leak', 'Sympathetic Visage', 'Clumsiness', "Wastrel's Worry"], 'armor_levels': {'Blunt damage': '51', 'Piercing damage': '51', 'Slashing damage': '51', 'Cold damage': '51', 'Earth damage': '51', 'Fire damage': '51', 'Lightning damage': '51'}, 'items_dropped': ['Abnormal Seed', 'Monstrous Eye', 'Plant Fiber', 'Wood Plank']},
-    1731: {'name': 'Spined Aloe', 'profession': ['Monk'], 'attributes': [{'level': '(16', 'name': 'Smiting Prayers'}], 'skills_used': ['Heal Other', 'Orison of Healing', 'Mend Condition', 'Holy Wrath', 'Signet of Judgment'], 'armor_levels': {}, 'items_dropped': ['Abnormal Seed', 'Monstrous Eye', 'Plant Fiber', 'Sapphire', 'Wood Plank']},
-    8098: {'name': 'Silent Peacekeeper', 'profession': ['Assassin', 'Elementalist', 'Mesmer', 'Paragon'], 'attributes': [{'level': '15', 'name': 'Critical Strikes'}], 'skills_used': ['Golden Fang Strike', 'Fevered Dreams', 'Barbed Spear', "Death's Retreat", 'Way of the Master', "Viper's Defense", 'Signet of Deadly Corruption', 'Assault Enchantments', 'Maiming Spear', 'Mark of Insecurity', 'Vampiric Assault', "Sadist's Signet", 'Seeping Wound', 'Blades of Steel', 'Disrupting Stab', 'Blinding Powder', 'Shock', 'Golden Phoenix Strike', 'Epidemic', 'Entangling Asp', 'Horns of the Ox', 'Fox Fangs', 'Black Mantis Thrust', 'Sharpen Daggers', 'Conjure Lightning', 'Signet of Malice', 'Way of Perfection', 'Blazing Spear', 'Vicious Attack', 'Twisting Fangs', 'Deadly Haste', 'Resurrection Signet', 'Exhausting Assault', 'Lift Enchantment', 'Heart of Shadow'], 'armor_levels': {'Blunt damage': '70 (88)', 'Piercing damage': '70 (88)', 'Slashing damage': '70 (88)', 'Cold damage': '70 (88)', 'Earth damage': '70 (88)', 'Fire damage': '70 (88)', 'Lightning damage': '70 (88)'}, 'items_dropped': ["Confessor's Orders", 'Law and Order', 'unique']},
-    2740: {'name': 'Skeleton Bowmaster', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Pin Down', 'Apply Poison', "Hunter's Shot"], 'armor_levels': {'Blunt damage': '46', 'Piercing damage': '86', 'Slashing damage': '66', 'Cold damage': '66', 'Earth damage': '66', 'Fire damage': '66', 'Lightning damage': '66'}, 'items_dropped': ['Bone', 'Decayed Orr Armor', 'Decayed Orr Emblem']},
-    1736: {'name': 'Bog Skale Blighter', 'profession': ['Necromancer'], 'attributes': [{'level': '13', 'name': 'Curses'}, {'level': '9', 'name': 'Death Magic'}, {'level': '12', 'name': 'Soul Reaping'}, {'level': '16 Soul Reaping in', 'name': 'hard mode'}], 'skills_used': ['Chilblains', 'Price of Failure', 'Spiteful Spirit', 'Putrid Explosion', 'Soul Barbs'], 'armor_levels': {'Blunt damage': '43', 'Piercing damage': '43', 'Slashing damage': '43', 'Cold damage': '73', 'Earth damage': '43', 'Fire damage': '43', 'Lightning damage': '43'}, 'items_dropped': ['Bog Skale Fin', 'Half-Eaten Blob', 'Monstrous Claw', 'Monstrous Fang', 'Scale']},
-    2212: {'name': 'Abbot Ramoth', 'profession': ['Monk'], 'attributes': [], 'skills_used': ["Judge's Insight", 'Restore Life', 'Convert Hexes', 'Divine Intervention', 'Shielding Hands'], 'armor_levels': {}, 'items_dropped': ['Leather Belt', 'Litanies of the Unseen', 'White Mantle Badge']},
-    1703: {'name': 'Winglord Caromi', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Troll Unguent', 'Whirling Defense', 'Read the Wind', 'Distracting Shot'], 'armor_levels': {}, 'items_dropped': ['Feathered Caromi Scalp']},
-    1745: {'name': 'Caromi Tengu Elite', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ["Executioner's Strike", 'Defensive Stance', 'Riposte', 'Swift Chop', 'Galrath Slash', 'Seeking Blade'], 'armor_levels': {'Blunt damage': '108', 'Piercing damage': '108', 'Slashing damage': '108', 'Cold damage': '88', 'Earth damage': '88', 'Fire damage': '88', 'Lightning damage': '68'}, 'items_dropped': ['Bone', 'Feather', 'Feathered Caromi Scalp', 'Heavy Tengu Armor', 'Monstrous Claw']},
-    8119: {'name': 'Peacekeeper Enforcer', 'profession': ['Warrior', 'Multiple'], 'attributes': [{'level': '13-14', 'name': 'Mysticism'}, {'level': '11', 'name': 'Strength'}], 'skills_used': ['Aftershock', 'Forceful Blow', 'Irresistible Blow', 'Plague Touch', 'Renewing Smash', 'Mighty Blow', 'Intimidating Aura', 'Enfeebling Touch', "Protector's Strike", '"For Great Justice!"', 'Overbearing Smash', 'Flail', '"Fear Me!"', 'Earth Shaker', 'Healing Signet', 'Fierce Blow', 'Staggering Blow', 'Yeti Smash', 'Crude Swing', 'Counter Blow', 'Belly Smash', 'Auspicious Blow', 'Tiger Stance', 'Death Pact Signet', 'Dwarven Battle Stance', 'Backbreaker', 'Antidote Signet', "Lion's Comfort", '"None Shall Pass!"'], 'armor_levels': {'Blunt damage': '100 (100)', 'Piercing damage': '100 (100)', 'Slashing damage': '100 (100)', 'Cold damage': '100 (100)', 'Earth damage': '100 (100)', 'Fire damage': '100 (100)', 'Lightning damage': '100 (100)'}, 'items_dropped': ["Confessor's Orders", 'The Peacekeeper', 'unique']},
-    8127: {'name': 'Peacekeeper Enforcer', 'profession': ['Warrior', 'Multiple'], 'attributes': [{'level': '13-14', 'name': 'Mysticism'}, {'level': '11', 'name': 'Strength'}], 'skills_used': ['Aftershock', 'Forceful Blow', 'Irresistible Blow', 'Plague Touch', 'Renewing Smash', 'Mighty Blow', 'Intimidating Aura', 'Enfeebling Touch', "Protector's Strike", '"For Great Justice!"', 'Overbearing Smash', 'Flail', '"Fear Me!"', 'Earth Shaker', 'Healing Signet', 'Fierce Blow', 'Staggering Blow', 'Yeti Smash', 'Crude Swing', 'Counter Blow', 'Belly Smash', 'Auspicious Blow', 'Tiger Stance', 'Death Pact Signet', 'Dwarven Battle Stance', 'Backbreaker', 'Antidote Signet', "Lion's Comfort", '"None Shall Pass!"'], 'armor_levels': {'Blunt damage': '100 (100)', 'Piercing damage': '100 (100)', 'Slashing damage': '100 (100)', 'Cold damage': '100 (100)', 'Earth damage': '100 (100)', 'Fire damage': '100 (100)', 'Lightning damage': '100 (100)'}, 'items_dropped': ["Confessor's Orders", 'The Peacekeeper', 'unique']},
-    1728: {'name': 'Forest Minotaur', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ["Bull's Strike", 'Wary Stance', 'Flurry', 'Rush'], 'armor_levels': {'Blunt damage': '97', 'Piercing damage': '97', 'Slashing damage': '97', 'Cold damage': '77', 'Earth damage': '77', 'Fire damage': '77', 'Lightning damage': '77'}, 'items_dropped': ['Forest Minotaur Hide', 'Forest Minotaur Horn']},
-    1486: {'name': 'Projects/NPC models/Humans/Kryta', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    1729: {'name': 'Fog Nightmare', 'profession': ['Necromancer'], 'attributes': [{'level': '11', 'name': 'Blood Magic'}, {'level': '15', 'name': 'Death Magic'}, {'level': '20 Death Magic in', 'name': 'Hard mode'}], 'skills_used': ['Touch of Agony', 'Dark Aura', 'Mark of Subversion', "Grenth's Balance"], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '100', 'Slashing damage': '100', 'Cold damage': '60', 'Earth damage': '60', 'Fire damage': '60', 'Lightning damage': '60'}, 'items_dropped': ['Pile of Glittering Dust', 'Shadowy Remnants']},
-    8146: {'name': 'Peacekeeper Huntsman', 'profession': ['Ranger', 'Paragon', 'Warrior'], 'attributes': [], 'skills_used': ['Barbed Spear', '"I Will Avenge You!"', 'Read the Wind', 'Symbiotic Bond', 'Charm Drake', 'Rampage as One', 'Savage Pounce', 'Heal as One', 'Scavenger Strike', 'Rapid Fire', 'Spear of Lightning', 'Pounce', 'Brutal Strike', 'Bestial Mauling', 'Crushing Blow', 'Arcing Shot', 'Enraged Lunge', 'Hammer Bash', 'Call of Haste'], 'armor_levels': {'Blunt damage': '70 (70)', 'Piercing damage': '70 (70)', 'Slashing damage': '70 (70)', 'Cold damage': '100 (100)', 'Earth damage': '100 (100)', 'Fire damage': '100 (100)', 'Lightning damage': '100 (100)'}, 'items_dropped': ["Confessor's Orders"]},
-    1748: {'name': 'Fen Troll', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Savage Slash', 'Skull Crack', 'Pure Strike', 'Endure Pain'], 'armor_levels': {}, 'items_dropped': ['Half-Digested Mass', 'Ivory Troll Tusk', 'Scale']},
-    1720: {'name': 'Bandit', 'profession': [], 'attributes': [], 'skills_used': [], 'armor_levels': {}, 'items_dropped': []},
-    2191: {'name': 'Galrath', 'profession': ['Warrior', 'Elementalist'], 'attributes': [], 'skills_used': ["Lion's Comfort", 'Hundred Blades', 'Wild Blow', 'Ward Against Foes', 'Healing Signet', 'Galrath Slash', 'Cyclone Axe', '"For Great Justice!"', "Bonetti's Defense", 'Dismember', 'Ward Against Elements'], 'armor_levels': {}, 'items_dropped': ['Broken Armor', 'Leather Belt', "Knight's Armor", 'White Mantle Badge', 'White Mantle Emblem', "Zealot's Armor"]},
-    1717: {'name': 'Apprentice of Verata', 'profession': ['Necromancer'], 'attributes': [{'level': '15', 'name': 'Death Magic'}], 'skills_used': ["Verata's Gaze", 'Animate Bone Fiend', 'Taste of Death', "Grenth's Balance"], 'armor_levels': {}, 'items_dropped': ['Torn Robes']},
-    1718: {'name': 'Shepherd of Verata', 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Purge Signet', 'Divine Healing', 'Light of Dwayna', 'Healing Hands', 'Essence Bond'], 'armor_levels': {}, 'items_dropped': ['Torn Robes']},
-    1719: {'name': 'Eyes of Verata', 'profession': ['Ranger'], 'attributes': [{'level': '11', 'name': 'Wilderness Survival'}], 'skills_used': ['Flame Trap', 'Choking Gas', 'Punishing Shot', 'Barbed Trap'], 'armor_levels': {}, 'items_dropped': ['Bloodstained Jerkin', 'Leather Belt']},
-    1716: {'name': 'Sage of Verata', 'profession': ['Mesmer'], 'attributes': [{'level': '15', 'name': 'Illusion Magic'}], 'skills_used': ['Imagined Burden', 'Distortion', 'Migraine', 'Phantom Pain'], 'armor_levels': {}, 'items_dropped': ['Torn Robes']},
-    2745: {'name': 'Damned Cleric', 'profession': ['Monk'], 'attributes': [{'level': '9', 'name': 'Smiting Prayers'}, {'level': '18 Smiting Prayers in', 'name': 'hard mode'}], 'skills_used': ['Infuse Health', "Zealot's Fire", 'Bane Signet', 'Reversal of Fortune'], 'armor_levels': {'Blunt damage': '33', 'Piercing damage': '33', 'Slashing damage': '33', 'Cold damage': '33', 'Earth damage': '33', 'Fire damage': '33', 'Lightning damage': '33'}, 'items_dropped': ['Bolt of Cloth', 'Dead Staff', 'Decayed Orr Emblem']},
-    2734: {'name': 'Wraith', 'profession': ['Mesmer'], 'attributes': [{'level': '9', 'name': 'Domination Magic'}], 'skills_used': ['Backfire', 'Diversion', 'Epidemic', 'Guilt', 'Chaos Storm', 'Signet of Weariness', 'Cry of Frustration', 'Empathy'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '43', 'Earth damage': '43', 'Fire damage': '43', 'Lightning damage': '43'}, 'items_dropped': ['Decayed Orr Emblem', 'Pile of Glittering Dust']},
-    2838: {'name': 'Rotting Dragon', 'profession': ['Ranger'], 'attributes': [{'level': '15', 'name': 'Wilderness Survival'}], 'skills_used': ['Quickening Zephyr', 'Troll Unguent', 'Dual Shot', 'Frozen Soil', 'Lightning Reflexes', 'Incendiary Arrows', 'Deafening Roar'], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '140', 'Slashing damage': '100', 'Cold damage': '101', 'Earth damage': '101', 'Fire damage': '101', 'Lightning damage': '101'}, 'items_dropped': ['Decayed Orr Emblem', 'Pile of Glittering Dust', 'Rotwing Recurve Bow', 'unique']},
-    2837: {'name': 'Rotscale', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Stun Immunity', 'Desecrate Enchantments', 'Malaise', 'Deafening Roar', 'Deathly Swarm', 'Feast of Corruption'], 'armor_levels': {'Blunt damage': '100', 'Piercing damage': '140', 'Slashing damage': '100', 'Cold damage': '101', 'Earth damage': '101', 'Fire damage': '101', 'Lightning damage': '101'}, 'items_dropped': ['Bone', 'Necrid Robes', 'Pile of Glittering Dust', 'Rotwing Recurve Bow', 'unique']},
-    2744: {'name': 'Necrid Horseman', 'profession': ['Necromancer'], 'attributes': [{'level': '14', 'name': 'Curses'}, {'level': '11', 'name': 'Death Magic'}, {'level': '16 Death Magic in', 'name': 'hard mode'}], 'skills_used': ['Reckless Haste', 'Tainted Flesh', 'Price of Failure', 'Rising Bile', 'Animate Bone Fiend', 'Desecrate Enchantments', 'Barbs', 'Spiteful Spirit', 'Deathly Swarm'], 'armor_levels': {'Blunt damage': '54', 'Piercing damage': '54', 'Slashing damage': '54', 'Cold damage': '54', 'Earth damage': '54', 'Fire damage': '54', 'Lightning damage': '54'}, 'items_dropped': ['Bone', 'Dead Staff', 'Decayed Orr Emblem', 'Necrid Robes', 'Pile of Glittering Dust']},
-    2277: {'name': 'Fryn Rageflame', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Aura of Restoration', 'Ice Spikes', 'Maelstrom', 'Glyph of Lesser Energy'], 'armor_levels': {}, 'items_dropped': []},
-    2510: {'name': 'Arkhel Havenwood', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Aura of Restoration', 'Ward Against Harm', 'Blurred Vision', 'Ice Prison'], 'armor_levels': {}, 'items_dropped': ['Alpine Seed']},
-    2521: {'name': 'Edibbo Kepkep', 'profession': ['Elementalist'], 'attributes': [{'level': '16', 'name': 'Air Magic'}], 'skills_used': ['Glimmering Mark', 'Conjure Lightning', 'Whirlwind'], 'armor_levels': {}, 'items_dropped': ['Intricate Grawl Necklace']},
-    2506: {'name': 'Hail Blackice', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Crushing Blow', 'Skull Crack', 'Irresistible Blow'], 'armor_levels': {}, 'items_dropped': ['Pile of Glittering Dust']},
-    2505: {'name': 'Rune Ethercrash', 'profession': ['Mesmer'], 'attributes': [{'level': '0', 'name': 'Fast Casting'}], 'skills_used': ['Leech Signet', 'Keystone Signet', 'Signet of Weariness', 'Signet of Humility'], 'armor_levels': {}, 'items_dropped': ['Pile of Glittering Dust']},
-    2683: {'name': 'Dark Titan', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Well of Weariness', 'Reckless Haste', 'Vampiric Gaze', 'Price of Failure', 'Necrotic Traversal', 'Malaise', 'Shadow Strike', 'Spiteful Spirit', 'Life Siphon', 'Soul Barbs', 'Insidious Parasite'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '123', 'Earth damage': '83', 'Fire damage': '63', 'Lightning damage': '83'}, 'items_dropped': ['Molten Claw']},
-    2681: {'name': "Titan's Heart", 'profession': ['Monk'], 'attributes': [], 'skills_used': ['Orison of Healing', "Dwayna's Kiss", 'Life Attunement', 'Mend Ailment', 'Mark of Protection', 'Cure Hex', 'Shielding Hands', 'Healing Burst', 'Reversal of Fortune', 'Shield of Absorption', 'Protective Spirit'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '123', 'Earth damage': '83', 'Fire damage': '63', 'Lightning damage': '83'}, 'items_dropped': ['Magmas Arm']},
-    2680: {'name': "Titan's Malice", 'profession': ['Mesmer'], 'attributes': [], 'skills_used': ['Backfire', 'Ether Feast', 'Diversion', 'Shame', 'Panic', 'Shatter Enchantment', 'Power Drain', 'Empathy', 'Leech Signet'], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '123', 'Earth damage': '83', 'Fire damage': '63', 'Lightning damage': '83'}, 'items_dropped': ['Magmas Shield', 'Molten Claw', 'Titan Armor']},
-    2682: {'name': 'Icy Brute', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Signet of Strength', 'Wild Blow', 'Crushing Blow', 'Irresistible Blow', 'Endure Pain', "Bull's Strike", 'Thrill of Victory', 'Renewing Smash', 'Backbreaker', "Lion's Comfort"], 'armor_levels': {'Blunt damage': '83', 'Piercing damage': '83', 'Slashing damage': '83', 'Cold damage': '123', 'Earth damage': '83', 'Fire damage': '63', 'Lightning damage': '83'}, 'items_dropped': ['Molten Claw', 'Titan Armor']},
-    2519: {'name': 'Ryk Arrowwing', 'profession': ['Ranger'], 'attributes': [], 'skills_used': ['Ignite Arrows', 'Practiced Stance', 'Troll Unguent', 'Dual Shot'], 'armor_levels': {}, 'items_dropped': ['Avicara Fierce Vest', 'Feathered Avicara Scalp']},
-    2518: {'name': 'Syr Honorcrest', 'profession': ['Warrior'], 'attributes': [], 'skills_used': ['Savage Slash', 'Healing Signet', 'Pure Strike', 'Flourish'], 'armor_levels': {}, 'items_dropped': ['Feathered Avicara Scalp']},
-    2684: {'name': 'Frost Titan', 'profession': ['Elementalist'], 'attributes': [], 'skills_used': ['Smash of the Titans', 'Glyph of Lesser Energy', 'Stun Immunity', 'Aura of Restoration', 'Frozen Burst', 'Blurred Vision', 'Mirror of Ice', 'Ice Spikes', 'Deep Freeze', 'Water Trident', 'Maelstrom', 'Ice Prison'], 'armor_levels': {'Blunt damage': '123', 'Piercing damage': '123', 'Slashing damage': '123', 'Cold damage': '143', 'Earth damage': '103', 'Fire damage': '83', 'Lightning damage': '103'}, 'items_dropped': ['Molten Claw', 'Titan Armor']},
-    2664: {'name': 'Evirso Sectus', 'profession': ['Necromancer'], 'attributes': [], 'skills_used': ['Smash of the Titans', 'Stun Immunity', 'Soul Feast', 'Desecrate Enchantments', 'Malaise', 'Rotting Flesh', 'Wither'], 'armor_levels': {}, 'items_dropped': []},
-}
+import json
+import os
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
+
+__all__ = ["ModelData"]
+
+# model_data.json is the normalized form of the scraped model database:
+#   strings  every distinct string once (names, professions, skills, items, ...)
+#   records  the distinct model records, their fields as indexes into strings:
+#            [name, [profession...], [[level, attribute name]...], [skill...], [[damage type, armor]...], [item...]]
+#   models   flat [model_id, record index, model_id, record index, ...] in the original order
+# Identical records (every Canthan Guard id, every Vabbian Commoner id, ...) are stored once.
+_DATA_PATH = os.path.join(os.path.dirname(__file__), "model_data.json")
+_VERSION = 1
+
+
+def normalize(model_data: Dict[int, dict]) -> dict:
+    """Convert a {model_id: record} dict, as written by the wiki scraper, into the model_data.json layout."""
+    strings: List[str] = []
+    string_index: Dict[str, int] = {}
+    records: List[list] = []
+    record_index: Dict[str, int] = {}
+    models: List[int] = []
+
+    def intern(value: str) -> int:
+        index = string_index.get(value)
+        if index is None:
+            index = string_index[value] = len(strings)
+            strings.append(value)
+        return index
+
+    for model_id, data in model_data.items():
+        record = [
+            intern(data.get("name", "")),
+            [intern(p) for p in data.get("profession", [])],
+            [[intern(a.get("level", "")), intern(a.get("name", ""))] for a in data.get("attributes", [])],
+            [intern(s) for s in data.get("skills_used", [])],
+            [[intern(k), intern(v)] for k, v in data.get("armor_levels", {}).items()],
+            [intern(i) for i in data.get("items_dropped", [])],
+        ]
+        key = json.dumps(record)
+        index = record_index.get(key)
+        if index is None:
+            index = record_index[key] = len(records)
+            records.append(record)
+        models += (int(model_id), index)
+
+    return {"version": _VERSION, "strings": strings, "records": records, "models": models}
+
+
+class _ModelDatabase(Mapping):
+    """
+    Read-only {model_id: record} mapping over model_data.json, loaded on first access.
+    Records keep the scraped layout (name, profession, attributes, skills_used, armor_levels,
+    items_dropped) but are shared between model ids with identical data, so they are
+    read-only views with tuples instead of lists.
+    """
+    def __init__(self, path: str):
+        self._path = path
+        self._models: Optional[Dict[int, int]] = None           # model_id -> record index
+        self._raw_records: List[list] = []
+        self._strings: List[str] = []
+        self._records: Dict[int, MappingProxyType] = {}         # record index -> decoded record
+        self._by_skill: Optional[Dict[str, Tuple[int, ...]]] = None
+        self._by_profession: Optional[Dict[str, Tuple[int, ...]]] = None
+        self._by_name: Optional[Dict[str, Tuple[int, ...]]] = None
+
+    def _load(self) -> Dict[int, int]:
+        if self._models is None:
+            with open(self._path, encoding="utf-8") as f:
+                data = json.load(f)
+            self._strings = [sys.intern(s) for s in data["strings"]]
+            self._raw_records = data["records"]
+            flat = data["models"]
+            self._models = dict(zip(flat[0::2], flat[1::2]))
+        return self._models
+
+    def _record(self, index: int) -> MappingProxyType:
+        record = self._records.get(index)
+        if record is None:
+            s = self._strings
+            name, professions, attributes, skills, armor, items = self._raw_records[index]
+            record = MappingProxyType({
+                "name": s[name],
+                "profession": tuple(s[i] for i in professions),
+                "attributes": tuple(MappingProxyType({"level": s[level], "name": s[attr]}) for level, attr in attributes),
+                "skills_used": tuple(s[i] for i in skills),
+                "armor_levels": MappingProxyType({s[k]: s[v] for k, v in armor}),
+                "items_dropped": tuple(s[i] for i in items),
+            })
+            self._records[index] = record
+        return record
+
+    # === Mapping API ===
+    def __getitem__(self, model_id: int) -> MappingProxyType:
+        return self._record(self._load()[model_id])
+
+    def __contains__(self, model_id) -> bool:
+        return model_id in self._load()
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    # === inverted indexes ===
+    def _build_index(self, field: int) -> Dict[str, Tuple[int, ...]]:
+        models_by_record: Dict[int, List[int]] = {}
+        for model_id, index in self._load().items():
+            models_by_record.setdefault(index, []).append(model_id)
+        s = self._strings
+        index: Dict[str, List[int]] = {}
+        for record_index, model_ids in models_by_record.items():
+            values = self._raw_records[record_index][field]
+            for value in ([values] if isinstance(values, int) else values):
+                index.setdefault(s[value], []).extend(model_ids)
+        return {key: tuple(sorted(ids)) for key, ids in index.items()}
+
+    def GetModelsUsingSkill(self, skill_name: str) -> Tuple[int, ...]:
+        """Model ids whose wiki skill list contains skill_name (as written on the wiki, e.g. "Healing Signet")."""
+        if self._by_skill is None:
+            self._by_skill = self._build_index(3)
+        return self._by_skill.get(skill_name, ())
+
+    def GetModelsByProfession(self, profession: str) -> Tuple[int, ...]:
+        """Model ids listing profession (e.g. "Warrior") as one of their professions."""
+        if self._by_profession is None:
+            self._by_profession = self._build_index(1)
+        return self._by_profession.get(profession, ())
+
+    def GetModelsByName(self, name: str) -> Tuple[int, ...]:
+        """Model ids sharing the wiki name, e.g. every "Canthan Guard" model."""
+        if self._by_name is None:
+            self._by_name = self._build_index(0)
+        return self._by_name.get(name, ())
+
+    def GetStats(self) -> dict:
+        models = self._load()
+        return {
+            "models": len(models),
+            "records": len(self._raw_records),
+            "strings": len(self._strings),
+            "decoded_records": len(self._records),
+        }
+
+
+ModelData = _ModelDatabase(_DATA_PATH)
+
+
+if __name__ == "__main__":
+    # python model_data.py scraped_model_data.py [model_data.json]
+    # The scraper writes a module holding a ModelData = {...} literal; this rewrites it as model_data.json.
+    import runpy
+    source = runpy.run_path(sys.argv[1])["ModelData"]
+    target = sys.argv[2] if len(sys.argv) > 2 else _DATA_PATH
+    normalized = normalize(source)
+    compact = lambda value: json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    with open(target, "w", encoding="utf-8") as f:
+        # one string / record / model per line so regenerating it gives a readable diff
+        f.write('{"version":%d,\n"strings":[\n' % normalized["version"])
+        f.write(",\n".join(compact(value) for value in normalized["strings"]))
+        f.write('],\n"records":[\n')
+        f.write(",\n".join(compact(record) for record in normalized["records"]))
+        f.write('],\n"models":[\n')
+        models = normalized["models"]
+        f.write(",\n".join(f"{models[i]},{models[i + 1]}" for i in range(0, len(models), 2)))
+        f.write("]}\n")
+    print(f"Wrote {len(source)} models, {len(normalized['records'])} records, {len(normalized['strings'])} strings to {target}")
@@ -71,39 +71,40 @@ class AutoInventoryHandler():
         self._initialized = True
            
     def save_to_ini(self, section: str = "AutoLootOptions"):
-        self.ini.write_key(section, "module_active", str(self.module_active))
-        self.ini.write_key(section, "lookup_time", str(self._LOOKUP_TIME))
-        self.ini.write_key(section, "id_whites", str(self.id_whites))
-        self.ini.write_key(section, "id_blues", str(self.id_blues))
-        self.ini.write_key(section, "id_purples", str(self.id_purples))
-        self.ini.write_key(section, "id_golds", str(self.id_golds))
-        self.ini.write_key(section, "id_greens", str(self.id_greens))
-        self.ini.write_key(section, "id_model_blacklist", ",".join(str(x) for x in sorted(set(self.id_model_blacklist))))
-
-        self.ini.write_key(section, "salvage_whites", str(self.salvage_whites))
-        self.ini.write_key(section, "salvage_rare_materials", str(self.salvage_rare_materials))
-        self.ini.write_key(section, "salvage_blues", str(self.salvage_blues))
-        self.ini.write_key(section, "salvage_purples", str(self.salvage_purples))
-        self.ini.write_key(section, "salvage_golds", str(self.salvage_golds))
-
-        self.ini.write_key(section, "item_type_blacklist", ",".join(str(i) for i in sorted(set(self.item_type_blacklist))))
-        self.ini.write_key(section, "salvage_blacklist", ",".join(str(i) for i in sorted(set(self.salvage_blacklist))))
-
-        self.ini.write_key(section, "deposit_trophies", str(self.deposit_trophies))
-        self.ini.write_key(section, "deposit_materials", str(self.deposit_materials))
-        self.ini.write_key(section, "deposit_event_items", str(self.deposit_event_items))
-        self.ini.write_key(section, "deposit_dyes", str(self.deposit_dyes))
-        self.ini.write_key(section, "deposit_blues", str(self.deposit_blues))
-        self.ini.write_key(section, "deposit_purples", str(self.deposit_purples))
-        self.ini.write_key(section, "deposit_golds", str(self.deposit_golds))
-        self.ini.write_key(section, "deposit_greens", str(self.deposit_greens))
-        self.ini.write_key(section, "keep_gold", str(self.keep_gold))
+        with self.ini.batch():
+            self.ini.write_key(section, "module_active", str(self.module_active))
+            self.ini.write_key(section, "lookup_time", str(self._LOOKUP_TIME))
+            self.ini.write_key(section, "id_whites", str(self.id_whites))
+            self.ini.write_key(section, "id_blues", str(self.id_blues))
+            self.ini.write_key(section, "id_purples", str(self.id_purples))
+            self.ini.write_key(section, "id_golds", str(self.id_golds))
+            self.ini.write_key(section, "id_greens", str(self.id_greens))
+            self.ini.write_key(section, "id_model_blacklist", ",".join(str(x) for x in sorted(set(self.id_model_blacklist))))
+
+            self.ini.write_key(section, "salvage_whites", str(self.salvage_whites))
+            self.ini.write_key(section, "salvage_rare_materials", str(self.salvage_rare_materials))
+            self.ini.write_key(section, "salvage_blues", str(self.salvage_blues))
+            self.ini.write_key(section, "salvage_purples", str(self.salvage_purples))
+            self.ini.write_key(section, "salvage_golds", str(self.salvage_golds))
+
+            self.ini.write_key(section, "item_type_blacklist", ",".join(str(i) for i in sorted(set(self.item_type_blacklist))))
+            self.ini.write_key(section, "salvage_blacklist", ",".join(str(i) for i in sorted(set(self.salvage_blacklist))))
+
+            self.ini.write_key(section, "deposit_trophies", str(self.deposit_trophies))
+            self.ini.write_key(section, "deposit_materials", str(self.deposit_materials))
+            self.ini.write_key(section, "deposit_event_items", str(self.deposit_event_items))
+            self.ini.write_key(section, "deposit_dyes", str(self.deposit_dyes))
+            self.ini.write_key(section, "deposit_blues", str(self.deposit_blues))
+            self.ini.write_key(section, "deposit_purples", str(self.deposit_purples))
+            self.ini.write_key(section, "deposit_golds", str(self.deposit_golds))
+            self.ini.write_key(section, "deposit_greens", str(self.deposit_greens))
+            self.ini.write_key(section, "keep_gold", str(self.keep_gold))
         
-        self.ini.write_key(section, "deposit_trophies_blacklist", ",".join(str(x) for x in sorted(set(self.deposit_trophies_blacklist))))
-        self.ini.write_key(section, "deposit_materials_blacklist", ",".join(str(x) for x in sorted(set(self.deposit_materials_blacklist))))
-        self.ini.write_key(section, "deposit_event_items_blacklist", ",".join(str(x) for x in sorted(set(self.deposit_event_items_blacklist))))
-        self.ini.write_key(section, "deposit_dyes_blacklist", ",".join(str(x) for x in sorted(set(self.deposit_dyes_blacklist))))
-        self.ini.write_key(section, "deposit_model_blacklist", ",".join(str(x) for x in sorted(set(self.deposit_model_blacklist))))
+            self.ini.write_key(section, "deposit_trophies_blacklist", ",".join(str(x) for x in sorted(set(self.deposit_trophies_blacklist))))
+            self.ini.write_key(section, "deposit_materials_blacklist", ",".join(str(x) for x in sorted(set(self.deposit_materials_blacklist))))
+            self.ini.write_key(section, "deposit_event_items_blacklist", ",".join(str(x) for x in sorted(set(self.deposit_event_items_blacklist))))
+            self.ini.write_key(section, "deposit_dyes_blacklist", ",".join(str(x) for x in sorted(set(self.deposit_dyes_blacklist))))
+            self.ini.write_key(section, "deposit_model_blacklist", ",".join(str(x) for x in sorted(set(self.deposit_model_blacklist))))
 
 
     def load_from_ini(self, ini:IniHandler | None, section: str = "AutoLootOptions"):
@@ -143,126 +144,110 @@ class AutoInventoryHandler():
 
         self.keep_gold = ini.read_int(section, "keep_gold", self.keep_gold)
                 
-    def IdentifyItems(self,progress_callback: Optional[Callable[[float], None]] = None, log: bool = False):
-        from ..ItemArray import ItemArray
+    def _should_identify(self, item) -> bool:
+        if item.is_identified:
+            return False
+        rarity = item.rarity
+        return ((rarity == "White" and self.id_whites) or
+                (rarity == "Blue" and self.id_blues) or
+                (rarity == "Green" and self.id_greens) or
+                (rarity == "Purple" and self.id_purples) or
+                (rarity == "Gold" and self.id_golds))
+
+    def _should_salvage(self, item) -> bool:
+        if item.quantity == 0 or item.is_customized:
+            return False
+
+        is_white = item.rarity == "White"
+        if not ((is_white and item.is_salvageable) or (item.is_identified and item.is_salvageable)):
+            return False
+        if item.item_type in self.item_type_blacklist:
+            return False
+        if item.model_id in self.salvage_blacklist:
+            return False
+        if is_white and item.is_material and item.is_material_salvageable and not self.salvage_rare_materials:
+            return False
+        if is_white and not item.is_material and not self.salvage_whites:
+            return False
+        if item.rarity == "Blue" and not self.salvage_blues:
+            return False
+        if item.rarity == "Purple" and not self.salvage_purples:
+            return False
+        if item.rarity == "Gold" and not self.salvage_golds:
+            return False
+        return True
+
+    def PlanIdentify(self, bag_list=None) -> list:
+        """Items of the given bags (the inventory by default) that IdentifyItems would identify."""
+        from ..enums import Bags
+        from ..GlobalCache import GLOBAL_CACHE
+        if bag_list is None:
+            bag_list = [Bags.Backpack, Bags.BeltPouch, Bags.Bag1, Bags.Bag2]
+        return [item for item in GLOBAL_CACHE.Item.GetInventorySnapshot(bag_list) if self._should_identify(item)]
+
+    def PlanSalvage(self, bag_list=None) -> list:
+        """Items of the given bags (the inventory by default) that SalvageItems would salvage."""
         from ..enums import Bags
+        from ..GlobalCache import GLOBAL_CACHE
+        if bag_list is None:
+            bag_list = [Bags.Backpack, Bags.BeltPouch, Bags.Bag1, Bags.Bag2]
+        return [item for item in GLOBAL_CACHE.Item.GetInventorySnapshot(bag_list) if self._should_salvage(item)]
+                
+    def IdentifyItems(self,progress_callback: Optional[Callable[[float], None]] = None, log: bool = False):
         from ..Inventory import Inventory
         import PyItem
-        from ..Item import Item
         from ..Routines import Routines
         
-        bag_list = ItemArray.CreateBagList(Bags.Backpack, Bags.BeltPouch, Bags.Bag1, Bags.Bag2)
-        item_array = ItemArray.GetItemArray(bag_list)
+        # The work list is decided up front; afterwards only the items being identified are re-read
+        work_list = self.PlanIdentify()
         
         identified_items = 0
             
-        for item_id in item_array:
+        for item in work_list:
             first_id_kit = Inventory.GetFirstIDKit()
              
             if first_id_kit == 0:
                 Console.Log("AutoIdentify", "No ID Kit found in inventory.", Console.MessageType.Warning)
                 return   
                 
-            item_instance = PyItem.PyItem(item_id)
-            is_identified = item_instance.is_identified
-                
-            if is_identified:
-                continue
-                
-            _,rarity = Item.Rarity.GetRarity(item_id)
-            if ((rarity == "White" and self.id_whites) or
-                (rarity == "Blue" and self.id_blues) or
-                (rarity == "Green" and self.id_greens) or
-                (rarity == "Purple" and self.id_purples) or
-                (rarity == "Gold" and self.id_golds)):
-                ActionQueueManager().AddAction("ACTION", Inventory.IdentifyItem,item_id, first_id_kit)
-                identified_items += 1
-                while True:
-                    yield from Routines.Yield.wait(50)
-                    item_instance.GetContext()
-                    if item_instance.is_identified:
-                        break
+            item_instance = PyItem.PyItem(item.item_id)
+            ActionQueueManager().AddAction("ACTION", Inventory.IdentifyItem, item.item_id, first_id_kit)
+            identified_items += 1
+            while True:
+                yield from Routines.Yield.wait(50)
+                item_instance.GetContext()
+                if item_instance.is_identified:
+                    break
                     
         if identified_items > 0 and log:
             ConsoleLog(self.module_name, f"Identified {identified_items} items", Console.MessageType.Success)
             
     def SalvageItems(self, progress_callback: Optional[Callable[[float], None]] = None, log: bool = False):
-        from ..ItemArray import ItemArray
-        from ..enums import Bags
         from ..Inventory import Inventory
-        import PyItem
         from ..GlobalCache import GLOBAL_CACHE
         from ..Routines import Routines
 
-        bag_list = ItemArray.CreateBagList(Bags.Backpack, Bags.BeltPouch, Bags.Bag1, Bags.Bag2)
-        item_array = ItemArray.GetItemArray(bag_list)
+        # The work list is decided up front; afterwards only the item being salvaged is re-read
+        work_list = self.PlanSalvage()
 
         salvaged_items = 0
 
-        for item_id in item_array:
-            item_instance = PyItem.PyItem(item_id)
-            item_instance.GetContext()
-            quantity = item_instance.quantity
-            if quantity == 0:
-                continue
-
-            is_customized = GLOBAL_CACHE.Item.Properties.IsCustomized(item_id)
-            if is_customized:
-                # Skip customized items
-                continue
-            _, rarity = GLOBAL_CACHE.Item.Rarity.GetRarity(item_id)
-            is_white = rarity == "White"
-            is_blue = rarity == "Blue"
-            is_green = rarity == "Green"
-            is_purple = rarity == "Purple"
-            is_gold = rarity == "Gold"
-
-            is_material = GLOBAL_CACHE.Item.Type.IsMaterial(item_id)
-            is_material_salvageable = GLOBAL_CACHE.Item.Usage.IsMaterialSalvageable(item_id)
-            is_identified = GLOBAL_CACHE.Item.Usage.IsIdentified(item_id)
-            is_salvageable = GLOBAL_CACHE.Item.Usage.IsSalvageable(item_id)
-            model_id = GLOBAL_CACHE.Item.GetModelID(item_id)
-            item_type,_ = GLOBAL_CACHE.Item.GetItemType(item_id)
-
-            # Filtering logic
-            if not ((is_white and is_salvageable) or (is_identified and is_salvageable)):
-                continue
-            if item_type in self.item_type_blacklist:
-                continue
-            if model_id in self.salvage_blacklist:
-                continue
-            if is_white and is_material and is_material_salvageable and not self.salvage_rare_materials:
-                continue
-            if is_white and not is_material and not self.salvage_whites:
-                continue
-            if is_blue and not self.salvage_blues:
-                continue
-            if is_purple and not self.salvage_purples:
-                continue
-            if is_gold and not self.salvage_golds:
-                continue
-
-            require_materials_confirmation = is_purple or is_gold
+        for item in work_list:
+            require_materials_confirmation = item.rarity in ("Purple", "Gold")
 
             # Repeat until item no longer exists
             while True:
-                
-                bag_list = ItemArray.CreateBagList(Bags.Backpack, Bags.BeltPouch, Bags.Bag1, Bags.Bag2)
-                item_array = ItemArray.GetItemArray(bag_list)
-                if item_id not in item_array:
+                current = GLOBAL_CACHE.Item.RecheckItem(item)
+                if current is None or current.quantity == 0:
                     break  # Fully consumed / disappeared
-    
-                item_instance.GetContext()
-                quantity = item_instance.quantity
-                if quantity == 0:
-                    break
+                quantity = current.quantity
 
                 salvage_kit = Inventory.GetFirstSalvageKit(use_lesser=True)
                 if salvage_kit == 0:
                     Console.Log("AutoSalvage", "No Salvage Kit found in inventory.", Console.MessageType.Warning)
                     return
 
-                ActionQueueManager().AddAction("ACTION", Inventory.SalvageItem, item_id, salvage_kit)
+                ActionQueueManager().AddAction("ACTION", Inventory.SalvageItem, item.item_id, salvage_kit)
                 if require_materials_confirmation:
                     yield from Routines.Yield.wait(150)
                     yield from Routines.Yield.Items._wait_for_salvage_materials_window()
@@ -273,15 +258,12 @@ class AutoInventoryHandler():
                 while True:
                     yield from Routines.Yield.wait(50)
 
-                    bag_list = ItemArray.CreateBagList(Bags.Backpack, Bags.BeltPouch, Bags.Bag1, Bags.Bag2)
-                    item_array = ItemArray.GetItemArray(bag_list)
-
-                    if item_id not in item_array:
+                    current = GLOBAL_CACHE.Item.RecheckItem(item)
+                    if current is None:
                         salvaged_items += 1
                         break  # Fully consumed
 
-                    item_instance.GetContext()
-                    if item_instance.quantity < quantity:
+                    if current.quantity < quantity:
                         salvaged_items += 1
                         break  # Successfully salvaged one item
 
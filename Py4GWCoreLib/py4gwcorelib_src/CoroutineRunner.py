@@ -0,0 +1,161 @@
+import heapq
+import time
+import traceback
+from typing import Callable, Dict, Generator, List, Optional
+
+from .Console import ConsoleLog, Console
+
+
+def now_ms() -> float:
+    """Clock shared by WaitUntil tokens and CoroutineRunner."""
+    return time.monotonic() * 1000
+
+
+#region WaitUntil
+class WaitUntil:
+    """
+    Yielded by sleeping coroutines (see Routines.Yield.wait) to say when they next have work to do.
+    A CoroutineRunner parks the generator until the deadline instead of resuming it every frame;
+    any other driver can keep calling next() on it, the generator checks the clock itself.
+    Falsy, so code that looks at the last yielded value still sees what a bare yield gave it.
+    """
+    __slots__ = ("deadline",)
+
+    def __init__(self, deadline: float):
+        self.deadline = deadline
+
+    def __bool__(self):
+        return False
+
+    def __repr__(self):
+        return f"<WaitUntil {self.deadline:.0f}ms>"
+
+#endregion
+
+#region CoroutineRunner
+class _CoroutineStats:
+    __slots__ = ("name", "resumes", "total_ms", "max_ms")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.resumes = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+
+class CoroutineRunner(list):
+    """
+    List of generators driven one step per Tick().
+    Still a plain list for append/remove/in/clear, so code that manages GLOBAL_CACHE.Coroutines
+    or FSM.managed_coroutines by hand keeps working. Generators that yield a WaitUntil are parked
+    in a timer heap and skipped until their deadline instead of being resumed to find out they
+    are still asleep.
+    """
+    def __init__(self, name: str = "Coroutines", on_error: Optional[Callable[[Generator, Exception], None]] = None):
+        super().__init__()
+        self.name = name
+        self.on_error = on_error                       # called instead of logging when a coroutine raises
+        self._parked: Dict[Generator, float] = {}      # generator -> deadline
+        self._timers: List[tuple] = []                 # (deadline, sequence, generator)
+        self._sequence = 0
+        self._stats: Dict[Generator, _CoroutineStats] = {}
+
+    # === list API, kept in sync with the parking state ===
+    def append(self, routine: Generator):
+        self._parked.pop(routine, None)
+        super().append(routine)
+
+    def remove(self, routine: Generator):
+        super().remove(routine)
+        self._forget(routine)
+
+    def clear(self):
+        super().clear()
+        self._parked.clear()
+        self._timers.clear()
+        self._stats.clear()
+
+    def _forget(self, routine: Generator):
+        if routine not in self:
+            self._parked.pop(routine, None)
+            self._stats.pop(routine, None)
+
+    # === scheduling ===
+    def _park(self, routine: Generator, deadline: float):
+        self._parked[routine] = deadline
+        self._sequence += 1
+        heapq.heappush(self._timers, (deadline, self._sequence, routine))
+
+    def _wake_due(self, now: float):
+        timers = self._timers
+        parked = self._parked
+        while timers and timers[0][0] <= now:
+            deadline, _, routine = heapq.heappop(timers)
+            if parked.get(routine) == deadline:
+                del parked[routine]
+
+    def _record(self, routine: Generator, elapsed_ms: float):
+        stats = self._stats.get(routine)
+        if stats is None:
+            stats = _CoroutineStats(getattr(routine, "__qualname__", repr(routine)))
+            self._stats[routine] = stats
+        stats.resumes += 1
+        stats.total_ms += elapsed_ms
+        if elapsed_ms > stats.max_ms:
+            stats.max_ms = elapsed_ms
+
+    def Tick(self):
+        """Advance every coroutine that is not parked by one step."""
+        self._wake_due(now_ms())
+        parked = self._parked
+        for routine in self[:]:
+            if routine in parked:
+                continue
+            start = time.perf_counter()
+            try:
+                value = next(routine)
+            except StopIteration:
+                self._record(routine, (time.perf_counter() - start) * 1000)
+                self._drop(routine)
+                continue
+            except Exception as e:
+                self._drop(routine)
+                if self.on_error is not None:
+                    self.on_error(routine, e)
+                else:
+                    ConsoleLog(self.name, f"Error in coroutine {getattr(routine, '__qualname__', routine)}: {e}\nTraceback:\n{traceback.format_exc()}", Console.MessageType.Error)
+                continue
+            self._record(routine, (time.perf_counter() - start) * 1000)
+            if type(value) is WaitUntil and value.deadline > now_ms():
+                self._park(routine, value.deadline)
+
+    def _drop(self, routine: Generator):
+        try:
+            self.remove(routine)
+        except ValueError:
+            pass  # already removed by the coroutine itself
+
+    # === stats ===
+    def GetStats(self) -> dict:
+        """Active/parked counts and per-coroutine CPU time, most expensive first."""
+        now = now_ms()
+        coroutines = []
+        for routine in self:
+            stats = self._stats.get(routine)
+            deadline = self._parked.get(routine)
+            coroutines.append({
+                "name": stats.name if stats else getattr(routine, "__qualname__", repr(routine)),
+                "resumes": stats.resumes if stats else 0,
+                "total_ms": stats.total_ms if stats else 0.0,
+                "max_ms": stats.max_ms if stats else 0.0,
+                "parked_for_ms": max(0.0, deadline - now) if deadline is not None else 0.0,
+            })
+        coroutines.sort(key=lambda c: c["total_ms"], reverse=True)
+        parked = sum(1 for routine in self if routine in self._parked)
+        return {
+            "active": len(self) - parked,
+            "parked": parked,
+            "coroutines": coroutines,
+        }
+
+#endregion
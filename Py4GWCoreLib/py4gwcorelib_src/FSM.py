@@ -6,6 +6,7 @@ from typing import Optional
 
 from .Timer import Timer, ThrottledTimer
 from .Console import ConsoleLog, Console
+from .CoroutineRunner import CoroutineRunner
 
 class FSM:
 
@@ -23,7 +24,7 @@ class FSM:
         self.paused = False
         self.on_transition = None
         self.on_complete = None
-        self.managed_coroutines = []   # already added for self-managed coroutines
+        self.managed_coroutines = CoroutineRunner(f"FSM {name}", on_error=self._on_coroutine_error)   # self-managed coroutines
         self._named_managed = {}       # key -> generator instance
         self.delay_timer = ThrottledTimer()
     
@@ -330,6 +331,15 @@ class FSM:
         self.states.append(condition_node)
         self.state_counter += 1
             
+    def _on_coroutine_error(self, routine, e: Exception):
+        state_name = self.current_state.name if self.current_state else "Unknown"
+        tb = traceback.format_exc()
+        ConsoleLog(
+            "FSM",
+            f"Error in self-managed coroutine at state '{state_name}': {e}\nTraceback:\n{tb}",
+            Console.MessageType.Error
+        )
+
     def _cleanup_coroutines(self):
         """Detach any generators this FSM started, to avoid duplicates on start/reset/stop."""
         # clear the central list
@@ -563,23 +573,7 @@ class FSM:
             return
         
         # Advance self-managed coroutines (same pattern as GLOBAL_CACHE.Coroutines)
-        for routine in self.managed_coroutines[:]:
-            try:
-                next(routine)
-            except StopIteration:
-                self.managed_coroutines.remove(routine)
-            except Exception as e:
-                state_name = self.current_state.name if self.current_state else "Unknown"
-                tb = traceback.format_exc()
-                ConsoleLog(
-                    "FSM",
-                    f"Error in self-managed coroutine at state '{state_name}': {e}\nTraceback:\n{tb}",
-                    Console.MessageType.Error
-                )
-                try:
-                    self.managed_coroutines.remove(routine)
-                except ValueError:
-                    pass
+        self.managed_coroutines.Tick()
                 
         if self.paused:
             if self.log_actions:
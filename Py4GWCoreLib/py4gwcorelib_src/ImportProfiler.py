@@ -0,0 +1,106 @@
+import builtins
+import importlib.util
+import sys
+import time
+from typing import Dict, List
+
+
+#region ImportProfiler
+class ImportRecord:
+    __slots__ = ("name", "cumulative_ms", "self_ms", "lazy")
+
+    def __init__(self, name: str, lazy: bool):
+        self.name = name
+        self.cumulative_ms = 0.0
+        self.self_ms = 0.0
+        self.lazy = lazy
+
+
+class ImportProfiler:
+    """
+    Times the first import of every module while active, the way python -X importtime does,
+    so the startup cost of each Py4GWCoreLib submodule can be read from inside the client.
+    cumulative_ms includes the modules a module pulled in; self_ms does not.
+    """
+    def __init__(self, package: str):
+        self.package = package
+        self.records: Dict[str, ImportRecord] = {}
+        self._original_import = None
+        self._stack: List[list] = []   # [name, start, children_ms] of the imports in progress
+        self._lazy = False
+
+    def _resolve(self, name: str, globals, level: int) -> str:
+        if level == 0:
+            return name
+        package = (globals or {}).get("__package__") or ""
+        try:
+            return importlib.util.resolve_name("." * level + name, package)
+        except (ImportError, ValueError):
+            return name
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        full_name = self._resolve(name, globals, level)
+        if full_name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        frame = [full_name, time.perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            self._stack.pop()
+            elapsed_ms = (time.perf_counter() - frame[1]) * 1000
+            if self._stack:
+                self._stack[-1][2] += elapsed_ms
+            record = self.records.get(full_name)
+            if record is None:
+                record = ImportRecord(full_name, self._lazy)
+                self.records[full_name] = record
+            record.cumulative_ms += elapsed_ms
+            record.self_ms += elapsed_ms - frame[2]
+
+    def start(self, lazy: bool = False):
+        if self._original_import is not None:
+            return
+        self._lazy = lazy
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._import
+
+    def stop(self):
+        if self._original_import is None:
+            return
+        builtins.__import__ = self._original_import
+        self._original_import = None
+
+    def import_lazy(self, relative_name: str):
+        """Import a submodule of the package on first use and record it as a lazy load."""
+        level = len(relative_name) - len(relative_name.lstrip("."))
+        was_active = self._original_import is not None
+        self.start(lazy=True)
+        try:
+            # A non-empty fromlist makes __import__ hand back the submodule itself
+            return builtins.__import__(relative_name[level:], {"__package__": self.package}, None, ("__name__",), level)
+        finally:
+            if not was_active:
+                self.stop()
+
+    def GetReport(self, package_only: bool = True) -> List[dict]:
+        """Per-module import cost, most expensive first."""
+        report = [{
+            "module": record.name,
+            "cumulative_ms": record.cumulative_ms,
+            "self_ms": record.self_ms,
+            "lazy": record.lazy,
+        } for record in self.records.values()
+            if not package_only or record.name == self.package or record.name.startswith(self.package + ".")]
+        report.sort(key=lambda entry: entry["cumulative_ms"], reverse=True)
+        return report
+
+    def LogReport(self, limit: int = 25):
+        """Print the report to the Py4GW console."""
+        from .Console import ConsoleLog
+        for entry in self.GetReport()[:limit]:
+            lazy = " (lazy)" if entry["lazy"] else ""
+            ConsoleLog("ImportProfiler", f"{entry['cumulative_ms']:8.1f} ms {entry['self_ms']:8.1f} ms self  {entry['module']}{lazy}")
+
+#endregion
@@ -1,26 +1,51 @@
 import os
+import time
+import atexit
+import weakref
 import configparser
+from contextlib import contextmanager
 
 #region IniHandler
 class IniHandler:
-    def __init__(self, filename: str):
+    # Handlers holding writes that have not reached the disk yet, see FlushPending
+    _dirty_handlers: "weakref.WeakSet[IniHandler]" = weakref.WeakSet()
+
+    def __init__(self, filename: str, reload_interval_ms: int = 100, flush_delay_ms: int = 0):
         """
         Initialize the handler with the given INI file.
+        reload_interval_ms: the file's mtime is checked at most this often; 0 checks on every access.
+        flush_delay_ms: writes stay in memory and reach the disk at most this often; 0 writes right away.
         """
         self.filename = filename
         self.last_modified = 0
         self.config = configparser.ConfigParser()
-        self.reload()  # Load the config initially
+        self.reload_interval_ms = reload_interval_ms
+        self.flush_delay_ms = flush_delay_ms
+        self._last_check = 0.0
+        self._pending: list[tuple] = []   # writes not yet on disk, replayed over external changes
+        self._batch_depth = 0
+        self._flush_deadline = 0.0
+        self.reload(force=True)  # Load the config initially
 
     # ----------------------------
     # Core Methods
     # ----------------------------
     
-    def reload(self) -> configparser.ConfigParser:
+    @staticmethod
+    def _now_ms() -> float:
+        return time.monotonic() * 1000
+
+    def reload(self, force: bool = False) -> configparser.ConfigParser:
         """Reload the INI file only if it has changed.
         
         If the file doesn't exist, create an empty file.
+        The file is looked at no more than once per reload_interval_ms unless force is set.
         """
+        now = self._now_ms()
+        if not force and now - self._last_check < self.reload_interval_ms:
+            return self.config
+        self._last_check = now
+
         if not os.path.exists(self.filename):
             # Create an empty file if it doesn't exist.
             with open(self.filename, 'w') as f:
@@ -33,14 +58,103 @@ class IniHandler:
         if current_mtime != self.last_modified:
             self.last_modified = current_mtime
             self.config.read(self.filename)
+            # Our unsaved writes win over whatever another client saved meanwhile
+            for operation in self._pending:
+                self._apply(operation)
         return self.config
 
     def save(self, config: configparser.ConfigParser) -> None:
         """
         Save changes to the INI file.
+        The file is written next to the target and renamed over it, so readers never see half a file.
         """
-        with open(self.filename, 'w') as configfile:
-            config.write(configfile)
+        temp_filename = f"{self.filename}.{os.getpid()}.tmp"
+        try:
+            with open(temp_filename, 'w') as configfile:
+                config.write(configfile)
+            for attempt in range(5):
+                try:
+                    os.replace(temp_filename, self.filename)
+                    break
+                except PermissionError:
+                    # Windows refuses the rename while another client has the file open
+                    time.sleep(0.01)
+            else:
+                with open(self.filename, 'w') as configfile:
+                    config.write(configfile)
+        finally:
+            if os.path.exists(temp_filename):
+                os.remove(temp_filename)
+        self.last_modified = os.path.getmtime(self.filename)
+        self._last_check = self._now_ms()
+
+    # ----------------------------
+    # Write-behind
+    # ----------------------------
+
+    def _apply(self, operation: tuple) -> None:
+        action, section = operation[0], operation[1]
+        config = self.config
+        if action == "set":
+            if not config.has_section(section):
+                config.add_section(section)
+            config.set(section, operation[2], operation[3])
+        elif action == "add_section":
+            if not config.has_section(section):
+                config.add_section(section)
+        elif action == "remove_option":
+            if config.has_section(section):
+                config.remove_option(section, operation[2])
+        elif action == "remove_section":
+            config.remove_section(section)
+
+    def _write(self, operation: tuple) -> None:
+        """Apply a change in memory and send it to disk now, at the end of the batch, or after flush_delay_ms."""
+        self.reload()
+        self._apply(operation)
+        if not self._pending:
+            self._flush_deadline = self._now_ms() + self.flush_delay_ms
+            IniHandler._dirty_handlers.add(self)
+        self._pending.append(operation)
+        # Also flushed from here, so a delayed handler reaches the disk even without the GLOBAL_CACHE job
+        if self._batch_depth == 0 and (self.flush_delay_ms <= 0 or self._now_ms() >= self._flush_deadline):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending changes to disk in a single save."""
+        if not self._pending:
+            return
+        self.reload(force=True)  # picks up external changes and replays ours on top
+        self.save(self.config)
+        self._pending.clear()
+        IniHandler._dirty_handlers.discard(self)
+
+    def has_pending_writes(self) -> bool:
+        return bool(self._pending)
+
+    @contextmanager
+    def batch(self):
+        """
+        Group writes into one save:
+            with ini.batch():
+                ini.write_key("Section", "a", 1)
+                ini.write_key("Section", "b", 2)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self.flush_delay_ms <= 0:
+                self.flush()
+
+    @classmethod
+    def FlushPending(cls, force: bool = False) -> None:
+        """Flush every handler whose flush_delay_ms has run out (all of them with force)."""
+        now = cls._now_ms()
+        for handler in list(cls._dirty_handlers):
+            if handler._batch_depth == 0 and (force or now >= handler._flush_deadline):
+                handler.flush()
 
     # ----------------------------
     # Read Methods
@@ -94,11 +208,7 @@ class IniHandler:
         """
         Write or update a key-value pair.
         """
-        config = self.reload()
-        if not config.has_section(section):
-            config.add_section(section)
-        config.set(section, key, str(value))
-        self.save(config)
+        self._write(("set", section, key, str(value)))
 
     # ----------------------------
     # Delete Methods
@@ -110,8 +220,7 @@ class IniHandler:
         """
         config = self.reload()
         if config.has_section(section) and config.has_option(section, key):
-            config.remove_option(section, key)
-            self.save(config)
+            self._write(("remove_option", section, key))
 
     def delete_section(self, section: str) -> None:
         """
@@ -119,8 +228,7 @@ class IniHandler:
         """
         config = self.reload()
         if config.has_section(section):
-            config.remove_section(section)
-            self.save(config)
+            self._write(("remove_section", section))
 
     # ----------------------------
     # Utility Methods
@@ -155,10 +263,11 @@ class IniHandler:
         """
         config = self.reload()
         if config.has_section(source_section):
-            if not config.has_section(target_section):
-                config.add_section(target_section)
-            for key, value in config.items(source_section):
-                config.set(target_section, key, value)
-            self.save(config)
+            with self.batch():
+                self._write(("add_section", target_section))
+                for key, value in config.items(source_section):
+                    self._write(("set", target_section, key, value))
+
+atexit.register(IniHandler.FlushPending, True)
 
 #endregion
\ No newline at end of file
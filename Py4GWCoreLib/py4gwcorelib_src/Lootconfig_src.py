@@ -1,9 +1,9 @@
 from typing import Callable
 
-from Py4GWCoreLib.enums_src.Item_enums import ItemType
 from Py4GWCoreLib.py4gwcorelib_src.Console import ConsoleLog
 from ..enums_src.GameData_enums import Range
 from ..enums_src.Model_enums import ModelID
+import heapq
 from typing import Dict, List
 
 LootGroups: Dict[str, Dict[str, List[ModelID]]] = {
@@ -535,9 +535,112 @@ LootGroups: Dict[str, Dict[str, List[ModelID]]] = {
 }
 
 #region ConfigCalsses
+_loot_dependencies = None
+
+def _get_loot_dependencies():
+    """Modules the loot filter needs. They import this module themselves, so they are bound on first use."""
+    global _loot_dependencies
+    if _loot_dependencies is None:
+        from ..AgentArray import AgentArray
+        from ..GlobalCache import GLOBAL_CACHE
+        from ..Routines import Routines
+        from ..Agent import Agent
+        from ..Item import Item
+        from ..Player import Player
+        _loot_dependencies = (AgentArray, GLOBAL_CACHE, Routines, Agent, Item, Player)
+    return _loot_dependencies
+
+class _RuleSet(set):
+    """A set that tells its LootConfig to recompile its rules whenever it is modified."""
+    def __init__(self, owner: "LootConfig", items=()):
+        super().__init__(items)
+        self._owner = owner
+
+    def _changed(self):
+        self._owner._config_version += 1
+
+    def add(self, item):
+        super().add(item)
+        self._changed()
+
+    def discard(self, item):
+        super().discard(item)
+        self._changed()
+
+    def remove(self, item):
+        super().remove(item)
+        self._changed()
+
+    def pop(self):
+        item = super().pop()
+        self._changed()
+        return item
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def update(self, *others):
+        super().update(*others)
+        self._changed()
+
+    def difference_update(self, *others):
+        super().difference_update(*others)
+        self._changed()
+
+    def intersection_update(self, *others):
+        super().intersection_update(*others)
+        self._changed()
+
+    def symmetric_difference_update(self, other):
+        super().symmetric_difference_update(other)
+        self._changed()
+
+
+class _LootRules:
+    """
+    Decision table compiled from a LootConfig. Everything that only depends on the drop
+    itself (ids, model, rarity) is decided here; custom checks are left to the caller.
+    """
+    __slots__ = ("version", "item_id_blacklist", "model_blacklist", "item_id_whitelist", "model_whitelist", "rarities")
+
+    def __init__(self, config: "LootConfig"):
+        self.version = config._config_version
+        self.item_id_blacklist = frozenset(config.item_id_blacklist)
+        self.model_blacklist = frozenset(config.blacklist)
+        self.item_id_whitelist = frozenset(config.item_id_whitelist)
+        self.model_whitelist = frozenset(config.whitelist)
+        self.rarities = frozenset(name for name, enabled in (
+            ("White", config.loot_whites),
+            ("Blue", config.loot_blues),
+            ("Purple", config.loot_purples),
+            ("Gold", config.loot_golds),
+            ("Green", config.loot_greens),
+        ) if enabled)
+
+    def Evaluate(self, agent_id: int, item_id: int, model_id: int, rarity: str) -> bool | None:
+        """True/False when the table decides the drop, None when it is up to the custom checks."""
+        # Item id blacklist is matched against the agent id, as it always has been
+        if agent_id in self.item_id_blacklist or model_id in self.model_blacklist:
+            return False
+        if item_id in self.item_id_whitelist or model_id in self.model_whitelist:
+            return True
+        if rarity in self.rarities:
+            return True
+        return None
+
+
 class LootConfig:
     _instance = None
     _initialized = False
+    _config_version = 0
+
+    # Assigning any of these (or mutating one of the sets) recompiles the loot rules
+    _RULE_FIELDS = frozenset((
+        "loot_gold_coins", "loot_whites", "loot_blues", "loot_purples", "loot_golds", "loot_greens",
+        "whitelist", "blacklist", "item_id_blacklist", "item_id_whitelist", "dye_whitelist", "dye_blacklist",
+    ))
+    _RULE_SETS = frozenset(("whitelist", "blacklist", "item_id_blacklist", "item_id_whitelist", "dye_whitelist", "dye_blacklist"))
 
     def __new__(cls):        
         if cls._instance is None:
@@ -551,9 +654,27 @@ class LootConfig:
         
         self._initialized = True
         
+        self._rules: _LootRules | None = None
+        self._verdicts: Dict[int, tuple[int, bool | None]] = {}  # agent_id -> (item_id, table verdict)
         self.reset()
         self.LootGroups: Dict[str, Dict[str, List[ModelID]]] = LootGroups
 
+    def __setattr__(self, name, value):
+        if name in LootConfig._RULE_SETS and not isinstance(value, _RuleSet):
+            value = _RuleSet(self, value)
+        object.__setattr__(self, name, value)
+        if name in LootConfig._RULE_FIELDS:
+            object.__setattr__(self, "_config_version", self._config_version + 1)
+
+    def _get_rules(self) -> _LootRules:
+        """The compiled decision table, rebuilt only when the config changed since the last call."""
+        rules = self._rules
+        if rules is None or rules.version != self._config_version:
+            rules = _LootRules(self)
+            self._rules = rules
+            self._verdicts.clear()
+        return rules
+
     def reset(self):
         self.loot_gold_coins = False
         self.loot_whites = False
@@ -704,8 +825,6 @@ class LootConfig:
             self.custom_item_checks.remove(check_function)
             
     def CustomItemChecks(self, item_id: int) -> bool:
-        from ..Item import Item
-        
         for check in self.custom_item_checks:
             pick_up = check(item_id)
             if pick_up is not None:
@@ -715,135 +834,67 @@ class LootConfig:
         return False
     
     # ------- Loot Filtering Logic -------
-    def GetfilteredLootArray(self, distance: float = Range.SafeCompass.value, multibox_loot: bool = False, allow_unasigned_loot=False) -> list[int]:
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..Routines import Routines
-        from ..Agent import Agent
-        from ..Item import Item
-        from ..Player import Player
-        from ..Party import Party
-        
-        def IsValidItem(item_id):
-            if not Agent.IsValid(item_id):
-                return False    
-            player_agent_id = Player.GetAgentID()
-            owner_id = Agent.GetItemAgentOwnerID(item_id)
-            return ((owner_id == player_agent_id) or (owner_id == 0))
-        
-        def IsValidLeaderItem(item_id, allow_unasigned_loot: bool):
-            if not Agent.IsValid(item_id):
-                return False
-            
-            player_agent_id = Player.GetAgentID()
-            owner_id = Agent.GetItemAgentOwnerID(item_id)
-
-            # Always pick up own items
-            if owner_id == player_agent_id:
-                return True
+    def _build_loot_heap(self, distance: float) -> list[tuple[float, int]]:
+        """(squared distance, agent_id) of every drop to pick up, heap ordered nearest first."""
+        AgentArray, GLOBAL_CACHE, Routines, Agent, Item, Player = _get_loot_dependencies()
 
-            # Always pick up gold coins (if unassigned)
-            agent = Agent.agent_instance(item_id)
-            item_agent_id = agent.item_agent.item_id
-            item_type, _ = Item.GetItemType(item_agent_id)
-            if item_type == ItemType.Gold_Coin and owner_id == 0:
-                return True
-
-            # If allowed, pick up other unassigned items
-            if allow_unasigned_loot and owner_id == 0:
-                return True
-
-            return False
-
-        def IsValidFollowerItem(item_id):
-            if not Agent.IsValid(item_id):
-                return False
-            
-            player_agent_id = Player.GetAgentID()
-            owner_id = Agent.GetItemAgentOwnerID(item_id)
-
-            # Followers only pick up their own items
-            return owner_id == player_agent_id
-
-        
         if not Routines.Checks.Map.MapValid():
             return []
-            
-        loot_array = AgentArray.GetItemArray()
-        loot_array = AgentArray.Filter.ByDistance(loot_array, Player.GetXY(), distance)
 
-        """party_leader_id = Party.GetPartyLeaderID()
+        rules = self._get_rules()
+        verdicts = self._verdicts
         player_agent_id = Player.GetAgentID()
+        player_x, player_y = Player.GetXY()
+        max_distance_sq = distance * distance
+
+        item_array = AgentArray.GetItemArray()
+        # Forget the verdicts of drops that are gone
+        if len(verdicts) > len(item_array):
+            present = set(item_array)
+            for agent_id in [agent_id for agent_id in verdicts if agent_id not in present]:
+                del verdicts[agent_id]
+
+        heap = []
+        for agent_id in item_array:
+            x, y = GLOBAL_CACHE.Agent.GetXY(agent_id)
+            dx = x - player_x
+            dy = y - player_y
+            distance_sq = dx * dx + dy * dy
+            if distance_sq > max_distance_sq:
+                continue
 
-        if party_leader_id == player_agent_id:  # Leader or solo
-            loot_array = AgentArray.Filter.ByCondition(
-                loot_array, lambda item_id: IsValidLeaderItem(item_id, allow_unasigned_loot)
-            )
-        else:  # Follower
-            loot_array = AgentArray.Filter.ByCondition(
-                loot_array, lambda item_id: IsValidFollowerItem(item_id)
-            )"""
-
-        loot_array = AgentArray.Filter.ByCondition(
-            loot_array,
-            lambda item_id: IsValidItem(item_id)
-        )
-        
-        pick_up_array = []
-
-        for agent_id in loot_array[:]:  # Iterate over a copy to avoid modifying while iterating
+            if not Agent.IsValid(agent_id):
+                continue
             item_data = Agent.GetItemAgent(agent_id)
-            item_id = item_data.item_id
-            model_id = Item.GetModelID(item_id)
-            
-            # --- Hard block: blacklists ---
-            if self.IsItemIDBlacklisted(agent_id):
+            owner_id = item_data.owner_id if item_data is not None else 999
+            if owner_id != player_agent_id and owner_id != 0:
                 continue
 
-            if self.IsBlacklisted(model_id):
-                continue
+            item_id = item_data.item_id
+            cached = verdicts.get(agent_id)
+            if cached is not None and cached[0] == item_id:
+                verdict = cached[1]
+            else:
+                item = Item.item_instance(item_id)
+                verdict = rules.Evaluate(agent_id, item_id, item.model_id, item.rarity.name)
+                verdicts[agent_id] = (item_id, verdict)
 
-            # --- Whitelists ---
-            if self.IsItemIDWhitelisted(item_id):
-                pick_up_array.append(agent_id)
-                continue
+            # Custom checks may depend on live state, so they are never cached
+            if verdict is None:
+                verdict = self.CustomItemChecks(item_id)
 
-            if self.IsWhitelisted(model_id):
-                pick_up_array.append(agent_id)
-                continue               
-            
-            # --- Rarity-based filtering ---
-            if Item.Rarity.IsWhite(item_id):
-                if self.loot_whites:
-                    pick_up_array.append(agent_id)
-                    continue
-
-            if Item.Rarity.IsBlue(item_id):
-                if self.loot_blues:
-                    pick_up_array.append(agent_id)
-                    continue
-
-            if Item.Rarity.IsPurple(item_id):
-                if self.loot_purples:
-                    pick_up_array.append(agent_id)
-                    continue
-
-            if Item.Rarity.IsGold(item_id):
-                if self.loot_golds:
-                    pick_up_array.append(agent_id)
-                    continue
-
-            if Item.Rarity.IsGreen(item_id):
-                if self.loot_greens:
-                    pick_up_array.append(agent_id)
-                    continue
-                
-            # --- Custom filtering ---
-            if self.CustomItemChecks(item_id):
-                pick_up_array.append(agent_id)
-                continue
-            
-        pick_up_array = AgentArray.Sort.ByDistance(pick_up_array, Player.GetXY())
+            if verdict:
+                heap.append((distance_sq, agent_id))
+
+        heapq.heapify(heap)
+        return heap
+
+    def GetfilteredLootArray(self, distance: float = Range.SafeCompass.value, multibox_loot: bool = False, allow_unasigned_loot=False) -> list[int]:
+        heap = self._build_loot_heap(distance)
+        return [heapq.heappop(heap)[1] for _ in range(len(heap))]
 
-        return pick_up_array
+    def GetNearestLoot(self, distance: float = Range.SafeCompass.value) -> int:
+        """Nearest drop GetfilteredLootArray would return first, or 0 when there is none."""
+        heap = self._build_loot_heap(distance)
+        return heap[0][1] if heap else 0
 #endregion
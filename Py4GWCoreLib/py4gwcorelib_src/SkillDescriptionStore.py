@@ -0,0 +1,136 @@
+import json
+import mmap
+import os
+import struct
+import sys
+from typing import Optional
+
+# skill_descriptions.bin layout (little endian):
+#   header   MAGIC, version u16, max_id u32, source size u64, source mtime_ns u64
+#   index    (max_id + 1) x (offset u32, length u32), length 0 = no entry for that id
+#   records  per skill: 5 field lengths u32, then the UTF-8 bytes of each field in FIELDS order;
+#            progression is kept as the JSON text of that one skill's list
+MAGIC = b"PYSD"
+VERSION = 1
+FIELDS = ("name", "url", "desc_full", "desc_concise", "progression")
+PROGRESSION = FIELDS.index("progression")
+
+_HEADER = struct.Struct("<4sHIQQ")
+_INDEX_ENTRY = struct.Struct("<II")
+_RECORD_HEADER = struct.Struct("<" + "I" * len(FIELDS))
+
+
+def _source_stamp(json_path: str):
+    stat = os.stat(json_path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def build(json_path: str, bin_path: str) -> int:
+    """Convert skill_descriptions.json into the indexed binary store. Returns the number of skills written."""
+    with open(json_path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    entries = {int(skill_id): entry for skill_id, entry in data.items()}
+    max_id = max(entries, default=0)
+    index = [(0, 0)] * (max_id + 1)
+    records = bytearray()
+    records_start = _HEADER.size + _INDEX_ENTRY.size * (max_id + 1)
+
+    for skill_id in sorted(entries):
+        entry = entries[skill_id]
+        progression = entry.get("progression")
+        values = [
+            entry.get("name", ""),
+            entry.get("url", ""),
+            entry.get("desc_full", ""),
+            entry.get("desc_concise", ""),
+            json.dumps(progression, separators=(",", ":")) if progression else "",
+        ]
+        encoded = [value.encode("utf-8") for value in values]
+        record = _RECORD_HEADER.pack(*(len(value) for value in encoded)) + b"".join(encoded)
+        index[skill_id] = (records_start + len(records), len(record))
+        records += record
+
+    size, mtime_ns = _source_stamp(json_path)
+    tmp_path = f"{bin_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, max_id, size, mtime_ns))
+        f.write(b"".join(_INDEX_ENTRY.pack(*entry) for entry in index))
+        f.write(records)
+    # Several clients may rebuild at once; each writes its own temp file and the last rename wins.
+    try:
+        os.replace(tmp_path, bin_path)
+    except OSError:
+        os.remove(tmp_path)
+        raise
+    return len(entries)
+
+
+class SkillDescriptionStore:
+    """
+    Read-only view of skill_descriptions.bin.
+    The file is memory mapped and only the record of the skill asked for is decoded,
+    so looking up one tooltip doesn't materialize the other ~1500 skills.
+    """
+    def __init__(self, bin_path: str):
+        self._file = open(bin_path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        magic, version, self.max_id, self.source_size, self.source_mtime_ns = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{bin_path} is not a version {VERSION} skill description store")
+
+    @classmethod
+    def Open(cls, json_path: str, bin_path: Optional[str] = None) -> "SkillDescriptionStore":
+        """Open the store next to json_path, (re)building it first if it is missing or older than the JSON."""
+        if bin_path is None:
+            bin_path = os.path.splitext(json_path)[0] + ".bin"
+        stamp = _source_stamp(json_path)
+        try:
+            store = cls(bin_path)
+            if (store.source_size, store.source_mtime_ns) == stamp:
+                return store
+            store.close()
+        except (OSError, ValueError, struct.error):
+            pass
+        build(json_path, bin_path)
+        return cls(bin_path)
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def _record_offset(self, skill_id: int) -> int:
+        if not 0 <= skill_id <= self.max_id:
+            return 0
+        offset, length = _INDEX_ENTRY.unpack_from(self._map, _HEADER.size + _INDEX_ENTRY.size * skill_id)
+        return offset if length else 0
+
+    def Has(self, skill_id: int) -> bool:
+        return self._record_offset(skill_id) != 0
+
+    def GetField(self, skill_id: int, field_index: int) -> Optional[str]:
+        """Decode one field of one skill, None if the skill has no entry."""
+        offset = self._record_offset(skill_id)
+        if not offset:
+            return None
+        lengths = _RECORD_HEADER.unpack_from(self._map, offset)
+        start = offset + _RECORD_HEADER.size + sum(lengths[:field_index])
+        return self._map[start:start + lengths[field_index]].decode("utf-8")
+
+    def GetProgression(self, skill_id: int) -> list:
+        text = self.GetField(skill_id, PROGRESSION)
+        return json.loads(text) if text else []
+
+
+if __name__ == "__main__":
+    # python SkillDescriptionStore.py [skill_descriptions.json] [skill_descriptions.bin]
+    default_json = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "skill_descriptions.json")
+    source = sys.argv[1] if len(sys.argv) > 1 else default_json
+    target = sys.argv[2] if len(sys.argv) > 2 else os.path.splitext(source)[0] + ".bin"
+    count = build(source, target)
+    print(f"Wrote {count} skills to {target} ({os.path.getsize(target)} bytes)")
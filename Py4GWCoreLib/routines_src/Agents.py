@@ -1,53 +1,47 @@
 import importlib
 
 class _RProxy:
+    _routines = None
+
     def __getattr__(self, name: str):
-        root_pkg = importlib.import_module("Py4GWCoreLib")
-        return getattr(root_pkg.Routines, name)
+        routines = _RProxy._routines
+        if routines is None:
+            routines = importlib.import_module("Py4GWCoreLib").Routines
+            _RProxy._routines = routines
+            # From here on the module global is Routines itself and lookups skip the proxy
+            globals()["Routines"] = routines
+        return getattr(routines, name)
 
 Routines = _RProxy()
 
+from ..AgentArray import AgentArray
+from ..GlobalCache import GLOBAL_CACHE
+from ..Py4GWcorelib import Utils
+from ..enums_src.Model_enums import GadgetModelID
+from .Party import Party
+
 #region Agents
 class Agents:    
     @staticmethod
     def GetNearestNPCXY(x,y, distance):
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
         scan_pos = (x,y)
         npc_array = GLOBAL_CACHE.AgentArray.GetNPCMinipetArray()
-        npc_array = AgentArray.Filter.ByDistance(npc_array,scan_pos, distance)
-        npc_array = AgentArray.Sort.ByDistance(npc_array, scan_pos)
-        if len(npc_array) > 0:
-            return npc_array[0]
-        return 0    
+        return AgentArray.Select.Nearest(npc_array, scan_pos, distance)
     
     @staticmethod
     def GetNearestGadgetXY(x,y, distance):
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
         scan_pos = (x,y)
         gadget_array = GLOBAL_CACHE.AgentArray.GetGadgetArray()
-        gadget_array = AgentArray.Filter.ByDistance(gadget_array,scan_pos, distance)
-        gadget_array = AgentArray.Sort.ByDistance(gadget_array, scan_pos)
-        if len(gadget_array) > 0:
-            return gadget_array[0]
-        return 0    
+        return AgentArray.Select.Nearest(gadget_array, scan_pos, distance)
                 
     @staticmethod
     def GetNearestItemXY(x,y, distance):
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
         scan_pos = (x,y)
         item_array = GLOBAL_CACHE.AgentArray.GetItemArray()
-        item_array = AgentArray.Filter.ByDistance(item_array,scan_pos, distance)
-        item_array = AgentArray.Sort.ByDistance(item_array, scan_pos)
-        if len(item_array) > 0:
-            return item_array[0]
-        return 0  
+        return AgentArray.Select.Nearest(item_array, scan_pos, distance)
     
     @staticmethod
     def GetNearestNPC(distance:float = 4500.0):
-        from ..GlobalCache import GLOBAL_CACHE
         player_pos = GLOBAL_CACHE.Player.GetXY()
         return Agents.GetNearestNPCXY(player_pos[0], player_pos[1], distance)
     
@@ -60,8 +54,6 @@ class Agents:
         Returns:
             int: The closest matching agent ID, or 0 if none found.
         """
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..Py4GWcorelib import Utils
 
         agent_ids = GLOBAL_CACHE.AgentArray.GetAgentArray()
         px, py = GLOBAL_CACHE.Player.GetXY()
@@ -88,8 +80,6 @@ class Agents:
         Returns:
             int: The closest matching item agent ID, or 0 if none found.
         """
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..Py4GWcorelib import Utils
 
         item_ids = GLOBAL_CACHE.AgentArray.GetItemArray()
         px, py = GLOBAL_CACHE.Player.GetXY()
@@ -120,8 +110,6 @@ class Agents:
         Returns:
             int: The closest matching item agent ID, or 0 if none found.
         """
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..Py4GWcorelib import Utils
 
         # Required bit rules
         BIT22 = 1 << 22
@@ -159,15 +147,12 @@ class Agents:
         
     @staticmethod
     def GetFilteredEnemyArray(x, y, max_distance=4500.0, aggressive_only = False):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
         """
         Purpose: filters enemies within the specified range.
         Args:
             range (int): The maximum distance to search for enemies.
         Returns: List of enemy agent IDs
         """
-        from ..GlobalCache import GLOBAL_CACHE
         enemy_array = AgentArray.GetEnemyArray()
         enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: Utils.Distance((x,y), GLOBAL_CACHE.Agent.GetXY(agent_id)) <= max_distance)
         enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsAlive(agent_id))
@@ -177,67 +162,44 @@ class Agents:
         return enemy_array
                     
     @staticmethod
-    def GetNearestEnemy(max_distance=4500.0, aggressive_only = False):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
+    def _GetNearestEnemyMatching(max_distance, aggressive_only, condition=None):
+        """Nearest living enemy passing the same checks as GetFilteredEnemyArray plus condition, in one pass."""
 
         player_pos = GLOBAL_CACHE.Player.GetXY()
-        enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-        enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-        return Utils.GetFirstFromArray(enemy_array)
+        player_id = GLOBAL_CACHE.Player.GetAgentID()
+        agent = GLOBAL_CACHE.Agent
+
+        def _matches(agent_id):
+            if agent_id == player_id or not agent.IsAlive(agent_id):
+                return False
+            if aggressive_only and not agent.IsAggressive(agent_id):
+                return False
+            return condition is None or condition(agent_id)
+
+        return AgentArray.Select.Nearest(AgentArray.GetEnemyArray(), player_pos, max_distance, _matches)
+
+    @staticmethod
+    def GetNearestEnemy(max_distance=4500.0, aggressive_only = False):
+        return Agents._GetNearestEnemyMatching(max_distance, aggressive_only)
     
     @staticmethod
     def GetNearestEnemyCaster(max_distance=4500.0, aggressive_only = False):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
-
-        player_pos = GLOBAL_CACHE.Player.GetXY()
-        enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-        enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsCaster(agent_id))
-        enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-        return Utils.GetFirstFromArray(enemy_array)
+        return Agents._GetNearestEnemyMatching(max_distance, aggressive_only, GLOBAL_CACHE.Agent.IsCaster)
         
     @staticmethod
     def GetNearestEnemyMartial(max_distance=4500.0, aggressive_only = False):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
-
-        player_pos = GLOBAL_CACHE.Player.GetXY()
-        enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-        enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsMartial(agent_id))
-        enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-        return Utils.GetFirstFromArray(enemy_array)   
+        return Agents._GetNearestEnemyMatching(max_distance, aggressive_only, GLOBAL_CACHE.Agent.IsMartial)
     
     @staticmethod
     def GetNearestEnemyMelee(max_distance=4500.0, aggressive_only = False):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
-
-        player_pos = GLOBAL_CACHE.Player.GetXY()
-        enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-        enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsMelee(agent_id))
-        enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-        return Utils.GetFirstFromArray(enemy_array)
+        return Agents._GetNearestEnemyMatching(max_distance, aggressive_only, GLOBAL_CACHE.Agent.IsMelee)
     
     @staticmethod
     def GetNearestEnemyRanged(max_distance=4500.0, aggressive_only = False):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
-
-        player_pos = GLOBAL_CACHE.Player.GetXY()
-        enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
-        enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsRanged(agent_id))
-        enemy_array = AgentArray.Sort.ByDistance(enemy_array, player_pos)
-        return Utils.GetFirstFromArray(enemy_array)
+        return Agents._GetNearestEnemyMatching(max_distance, aggressive_only, GLOBAL_CACHE.Agent.IsRanged)
         
     @staticmethod
     def GetFilteredAllyArray(x, y, max_distance=4500.0, other_ally=False):
-        from ..AgentArray import AgentArray
         """
         Purpose: filters allies within the specified range.
         Args:
@@ -245,7 +207,6 @@ class Agents:
             other_ally (bool): Whether to include other allies in the search.
         Returns: List of ally agent IDs
         """
-        from ..GlobalCache import GLOBAL_CACHE
         ally_array = GLOBAL_CACHE.AgentArray.GetAllyArray()
         ally_array = AgentArray.Filter.ByDistance(ally_array, (x,y), max_distance)
         ally_array = AgentArray.Filter.ByCondition(ally_array, lambda agent_id: GLOBAL_CACHE.Agent.IsAlive(agent_id))
@@ -257,38 +218,23 @@ class Agents:
     
     @staticmethod
     def GetNearestAlly(max_distance=4500.0, exclude_self=True):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
 
         self_id = GLOBAL_CACHE.Player.GetAgentID()
         player_pos = GLOBAL_CACHE.Player.GetXY()
         ally_array = GLOBAL_CACHE.AgentArray.GetAllyArray()
-        ally_array = AgentArray.Filter.ByDistance(ally_array, player_pos, max_distance)
-        ally_array = AgentArray.Filter.ByCondition(ally_array, lambda agent_id: GLOBAL_CACHE.Agent.IsAlive(agent_id))
-        if exclude_self:
-            ally_array = AgentArray.Filter.ByCondition(ally_array, lambda agent_id: agent_id != self_id)
-        ally_array = AgentArray.Sort.ByDistance(ally_array, player_pos)
-        return Utils.GetFirstFromArray(ally_array)
+        return AgentArray.Select.Nearest(
+            ally_array, player_pos, max_distance,
+            lambda agent_id: GLOBAL_CACHE.Agent.IsAlive(agent_id) and not (exclude_self and agent_id == self_id))
     
     @staticmethod   
     def GetDeadAlly(max_distance=4500.0):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
 
         distance = max_distance
         ally_array = AgentArray.GetAllyArray()
-        ally_array = AgentArray.Filter.ByDistance(ally_array, GLOBAL_CACHE.Player.GetXY(), distance)
-        ally_array = AgentArray.Filter.ByCondition(ally_array, lambda agent_id: GLOBAL_CACHE.Agent.IsDead(agent_id))
-        ally_array = AgentArray.Sort.ByDistance(ally_array, GLOBAL_CACHE.Player.GetXY())
-        return Utils.GetFirstFromArray(ally_array)
+        return AgentArray.Select.Nearest(ally_array, GLOBAL_CACHE.Player.GetXY(), distance, GLOBAL_CACHE.Agent.IsDead)
     
     @staticmethod
     def GetNearestCorpse(max_distance=4500.0):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
         
         def _AllowedAlliegance(agent_id):
             _, alliegance = GLOBAL_CACHE.Agent.GetAllegiance(agent_id)
@@ -303,35 +249,26 @@ class Agents:
 
         distance = max_distance
         corpse_array = GLOBAL_CACHE.AgentArray.GetAgentArray()
-        corpse_array = AgentArray.Filter.ByDistance(corpse_array, GLOBAL_CACHE.Player.GetXY(), distance)
-        corpse_array = AgentArray.Filter.ByCondition(corpse_array, lambda agent_id: GLOBAL_CACHE.Agent.IsDead(agent_id))
-        corpse_array = AgentArray.Filter.ByCondition(corpse_array, lambda agent_id: _AllowedAlliegance(agent_id))
-        corpse_array = AgentArray.Sort.ByDistance(corpse_array, GLOBAL_CACHE.Player.GetXY())
-        return Utils.GetFirstFromArray(corpse_array)
+        return AgentArray.Select.Nearest(
+            corpse_array, GLOBAL_CACHE.Player.GetXY(), distance,
+            lambda agent_id: GLOBAL_CACHE.Agent.IsDead(agent_id) and _AllowedAlliegance(agent_id))
         
     @staticmethod
     def GetNearestSpirit(max_distance=4500.0):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
         distance = max_distance
         spirit_array = GLOBAL_CACHE.AgentArray.GetSpiritPetArray()
-        spirit_array = AgentArray.Filter.ByDistance(spirit_array, GLOBAL_CACHE.Player.GetXY(), distance)
-        spirit_array = AgentArray.Filter.ByCondition(spirit_array, lambda agent_id: GLOBAL_CACHE.Agent.IsAlive(agent_id))
-        spirit_array = AgentArray.Filter.ByCondition(spirit_array, lambda agent_id: GLOBAL_CACHE.Agent.IsSpawned(agent_id))
-        spirit_array = AgentArray.Sort.ByDistance(spirit_array, GLOBAL_CACHE.Player.GetXY())
-        return Utils.GetFirstFromArray(spirit_array)
+        return AgentArray.Select.Nearest(
+            spirit_array, GLOBAL_CACHE.Player.GetXY(), distance,
+            lambda agent_id: GLOBAL_CACHE.Agent.IsAlive(agent_id) and GLOBAL_CACHE.Agent.IsSpawned(agent_id))
     
     @staticmethod
     def GetFilteredSpiritArray(x, y, max_distance=4500.0):
-        from ..AgentArray import AgentArray
         """
         Purpose: filters spirits within the specified range.
         Args:
             range (int): The maximum distance to search for spirits.
         Returns: List of spirit agent IDs
         """
-        from ..GlobalCache import GLOBAL_CACHE
         spirit_array = GLOBAL_CACHE.AgentArray.GetSpiritPetArray()
         spirit_array = AgentArray.Filter.ByDistance(spirit_array, (x,y), max_distance)
         spirit_array = AgentArray.Filter.ByCondition(spirit_array, lambda agent_id: GLOBAL_CACHE.Agent.IsAlive(agent_id))
@@ -340,27 +277,20 @@ class Agents:
         
     @staticmethod
     def GetLowestMinion(max_distance=4500.0):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
         
         distance = max_distance
         minion_array = GLOBAL_CACHE.AgentArray.GetMinionArray()
         minion_array = AgentArray.Filter.ByDistance(minion_array, GLOBAL_CACHE.Player.GetXY(), distance)
-        minion_array = AgentArray.Filter.ByCondition(minion_array, lambda agent_id: GLOBAL_CACHE.Agent.IsAlive(agent_id))
-        minion_array = AgentArray.Sort.ByHealth(minion_array)
-        return Utils.GetFirstFromArray(minion_array)            
+        return AgentArray.Select.LowestHealth(minion_array, GLOBAL_CACHE.Agent.IsAlive)
         
     @staticmethod
     def GetFilteredMinionArray(x, y, max_distance=4500.0):
-        from ..AgentArray import AgentArray
         """
         Purpose: filters minions within the specified range.
         Args:
             range (int): The maximum distance to search for minions.
         Returns: List of minion agent IDs
         """
-        from ..GlobalCache import GLOBAL_CACHE
         minion_array = GLOBAL_CACHE.AgentArray.GetMinionArray()
         minion_array = AgentArray.Filter.ByDistance(minion_array, (x,y), max_distance)
         minion_array = AgentArray.Filter.ByCondition(minion_array, lambda agent_id: GLOBAL_CACHE.Agent.IsAlive(agent_id))
@@ -369,43 +299,26 @@ class Agents:
     
     @staticmethod
     def GetNearestItem(max_distance=4500.0):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
 
         item_array = AgentArray.GetItemArray()
-        item_array = AgentArray.Filter.ByDistance(item_array, GLOBAL_CACHE.Player.GetXY(), max_distance)
-        item_array = AgentArray.Sort.ByDistance(item_array,GLOBAL_CACHE.Player.GetXY())
-        return Utils.GetFirstFromArray(item_array)   
+        return AgentArray.Select.Nearest(item_array, GLOBAL_CACHE.Player.GetXY(), max_distance)
 
     @staticmethod
     def GetNearestGadget(max_distance=4500.0):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
 
         gadget_array = GLOBAL_CACHE.AgentArray.GetGadgetArray()
-        gadget_array = AgentArray.Filter.ByDistance(gadget_array, GLOBAL_CACHE.Player.GetXY(), max_distance)
-        gadget_array = AgentArray.Sort.ByDistance(gadget_array,GLOBAL_CACHE.Player.GetXY())
-        return Utils.GetFirstFromArray(gadget_array)
+        return AgentArray.Select.Nearest(gadget_array, GLOBAL_CACHE.Player.GetXY(), max_distance)
     
     @staticmethod
     def GetNearestGadgetByID(gadget_id: int, max_distance=4500.0):
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
 
         gadget_array = GLOBAL_CACHE.AgentArray.GetGadgetArray()
-        gadget_array = AgentArray.Filter.ByCondition(gadget_array, lambda agent_id: GLOBAL_CACHE.Agent.GetGadgetID(agent_id) == gadget_id)
-        gadget_array = AgentArray.Filter.ByDistance(gadget_array, GLOBAL_CACHE.Player.GetXY(), max_distance)
-        gadget_array = AgentArray.Sort.ByDistance(gadget_array,GLOBAL_CACHE.Player.GetXY())
-        return Utils.GetFirstFromArray(gadget_array)
+        return AgentArray.Select.Nearest(
+            gadget_array, GLOBAL_CACHE.Player.GetXY(), max_distance,
+            lambda agent_id: GLOBAL_CACHE.Agent.GetGadgetID(agent_id) == gadget_id)
         
     @staticmethod
     def GetNearestChest(max_distance=5000):
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from ..enums_src.Model_enums import GadgetModelID
         """
         Purpose: Get the nearest chest within the specified range.
         Args:
@@ -416,15 +329,9 @@ class Agents:
         valid_chest_ids = {e.value for e in GadgetModelID if e.name.startswith("CHEST_")}
 
         gadget_array = AgentArray.GetGadgetArray()
-        gadget_array = AgentArray.Filter.ByDistance(gadget_array, GLOBAL_CACHE.Player.GetXY(), max_distance)
-        gadget_array = AgentArray.Sort.ByDistance(gadget_array, GLOBAL_CACHE.Player.GetXY())
-
-        for agent_id in gadget_array:
-            gadget_id = GLOBAL_CACHE.Agent.GetGadgetID(agent_id)
-            if gadget_id in valid_chest_ids:
-                return agent_id
-
-        return 0
+        return AgentArray.Select.Nearest(
+            gadget_array, GLOBAL_CACHE.Player.GetXY(), max_distance,
+            lambda agent_id: GLOBAL_CACHE.Agent.GetGadgetID(agent_id) in valid_chest_ids)
 
 
     @staticmethod
@@ -438,9 +345,6 @@ class Agents:
             enchanted_only (bool): If True, only select agents that are enchanted.
         Returns: PyAgent.PyAgent: The best target agent object, or None if no target matches.
         """
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
 
         best_target = None
         lowest_sum = float('inf')
@@ -505,9 +409,6 @@ class Agents:
             enchanted_only (bool): If True, only select agents that are enchanted.
         Returns: PyAgent.PyAgent: The best melee target agent object, or None if no target matches.
         """
-        from ..AgentArray import AgentArray
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
 
         best_target = None
         lowest_sum = float('inf')
@@ -566,12 +467,10 @@ class Agents:
     
     @staticmethod
     def GetPartyTargetID():
-        from .Party import Party
         return Party.GetPartyTargetID()
     
     @staticmethod
     def SafeInteract(target_id):
-        from ..GlobalCache import GLOBAL_CACHE
         if GLOBAL_CACHE.Agent.IsValid(target_id):
             GLOBAL_CACHE.Player.ChangeTarget(target_id)
             GLOBAL_CACHE.Player.Interact(target_id, False)
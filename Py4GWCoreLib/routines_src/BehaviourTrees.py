@@ -14,9 +14,16 @@ from .Checks import Checks
 import importlib
 
 class _RProxy:
+    _routines = None
+
     def __getattr__(self, name: str):
-        root_pkg = importlib.import_module("Py4GWCoreLib")
-        return getattr(root_pkg.Routines, name)
+        routines = _RProxy._routines
+        if routines is None:
+            routines = importlib.import_module("Py4GWCoreLib").Routines
+            _RProxy._routines = routines
+            # From here on the module global is Routines itself and lookups skip the proxy
+            globals()["Routines"] = routines
+        return getattr(routines, name)
 
 Routines = _RProxy()
 
@@ -4,12 +4,30 @@ from typing import Tuple
 import importlib
 
 class _RProxy:
+    _routines = None
+
     def __getattr__(self, name: str):
-        root_pkg = importlib.import_module("Py4GWCoreLib")
-        return getattr(root_pkg.Routines, name)
+        routines = _RProxy._routines
+        if routines is None:
+            routines = importlib.import_module("Py4GWCoreLib").Routines
+            _RProxy._routines = routines
+            # From here on the module global is Routines itself and lookups skip the proxy
+            globals()["Routines"] = routines
+        return getattr(routines, name)
 
 Routines = _RProxy()
 
+import PyMap
+import PyParty
+import math
+from ..GlobalCache import GLOBAL_CACHE
+from ..Py4GWcorelib import Utils
+from ..enums_src.GameData_enums import Range
+from ..Item import Item
+from ..AgentArray import AgentArray
+from ..Skill import Skill
+from ..Agent import Agent
+
 class Checks:
 #region Player
     class Player:
@@ -27,24 +45,20 @@ class Checks:
         
         @staticmethod
         def IsDead():
-            from ..GlobalCache import GLOBAL_CACHE
             return GLOBAL_CACHE.Agent.IsDead(GLOBAL_CACHE.Player.GetAgentID())
         
         @staticmethod
         def IsCasting():
-            from ..GlobalCache import GLOBAL_CACHE
             return GLOBAL_CACHE.Agent.IsCasting(GLOBAL_CACHE.Player.GetAgentID())
         
         @staticmethod
         def IsKnockedDown():
-            from ..GlobalCache import GLOBAL_CACHE
             return GLOBAL_CACHE.Agent.IsKnockedDown(GLOBAL_CACHE.Player.GetAgentID())
 
 #region Party
     class Party:
         @staticmethod
         def IsPartyMemberDead():
-            from ..GlobalCache import GLOBAL_CACHE
             if not Checks.Map.MapValid():
                 return False
             is_someone_dead = False
@@ -71,9 +85,6 @@ class Checks:
         
         @staticmethod
         def IsPartyMemberBehind(range_value: int = 3500): #spirit
-            from ..GlobalCache import GLOBAL_CACHE
-            from ..Py4GWcorelib import Utils
-            from ..enums_src.GameData_enums import Range
             if not Checks.Map.MapValid():
                 return False
 
@@ -105,10 +116,6 @@ class Checks:
         
         @staticmethod
         def IsDeadPartyMemberBehind():
-            from ..GlobalCache import GLOBAL_CACHE
-            from ..Py4GWcorelib import Utils
-            from ..enums_src.GameData_enums import Range
-            from ..Routines import Checks
 
             if not Checks.Map.MapValid():
                 return False
@@ -142,7 +149,6 @@ class Checks:
         
         @staticmethod
         def IsPartyWiped():
-            from ..GlobalCache import GLOBAL_CACHE
             if not Checks.Map.MapValid():
                 return False
             
@@ -174,15 +180,12 @@ class Checks:
         
         @staticmethod
         def IsPartyLoaded():
-            from ..GlobalCache import GLOBAL_CACHE
             if not Checks.Map.MapValid():
                 return False
             return GLOBAL_CACHE.Party.IsPartyLoaded()
         
         @staticmethod
         def IsAllPartyMembersInRange(range_value):
-            from ..GlobalCache import GLOBAL_CACHE
-            from ..Py4GWcorelib import Utils
             if not Checks.Map.MapValid():
                 return False
 
@@ -222,8 +225,6 @@ class Checks:
     class Map:
         @staticmethod
         def MapValid():
-            import PyMap
-            import PyParty
             current_map = PyMap.PyMap()
 
             if  current_map.instance_type.GetName() == "Loading":
@@ -239,21 +240,18 @@ class Checks:
         
         @staticmethod
         def IsExplorable():
-            from ..GlobalCache import GLOBAL_CACHE
             if not Checks.Map.MapValid():
                 return False
             return GLOBAL_CACHE.Map.IsExplorable()
         
         @staticmethod
         def IsOutpost():
-            from ..GlobalCache import GLOBAL_CACHE
             if not Checks.Map.MapValid():
                 return False
             return GLOBAL_CACHE.Map.IsOutpost()
         
         @staticmethod
         def IsLoading():
-            import PyMap
             if not Checks.Map.MapValid():
                 return True
             current_map = PyMap.PyMap()
@@ -263,7 +261,6 @@ class Checks:
         
         @staticmethod
         def IsMapReady():
-            import PyMap
             if not Checks.Map.MapValid():
                 return False
             current_map = PyMap.PyMap()
@@ -271,7 +268,6 @@ class Checks:
         
         @staticmethod
         def IsInCinematic():
-            import PyMap
             if not Checks.Map.MapValid():
                 return False
             current_map = PyMap.PyMap()
@@ -281,44 +277,35 @@ class Checks:
     class Inventory:
         @staticmethod
         def InventoryAndLockpickCheck():
-            from ..GlobalCache import GLOBAL_CACHE
             return GLOBAL_CACHE.Inventory.GetFreeSlotCount() > 0 and GLOBAL_CACHE.Inventory.GetModelCount(22751) > 0 
         
         @staticmethod
         def IsModelInInventory(model_id: int):
-            from ..GlobalCache import GLOBAL_CACHE
             return GLOBAL_CACHE.Inventory.GetModelCount(model_id) > 0
         
         @staticmethod
         def IsItemInInventory(item_id: int):
-            from ..GlobalCache import GLOBAL_CACHE
             return GLOBAL_CACHE.Inventory.GetItemCount(item_id) > 0
         
         @staticmethod
         def IsModelEquipped(model_id: int):
-            from ..GlobalCache import GLOBAL_CACHE
             return GLOBAL_CACHE.Inventory.GetModelCountInEquipped(model_id) > 0
         
         @staticmethod
         def IsModelInBank(model_id: int):
-            from ..GlobalCache import GLOBAL_CACHE
             return GLOBAL_CACHE.Inventory.GetModelCountInStorage(model_id) > 0
         
         @staticmethod
         def IsModelInInventoryOrBank(model_id: int):
-            from ..GlobalCache import GLOBAL_CACHE
             return (GLOBAL_CACHE.Inventory.GetModelCount(model_id) + GLOBAL_CACHE.Inventory.GetModelCountInStorage(model_id)) > 0
         
         @staticmethod
         def IsModelInInventoryOrEquipped(model_id: int):
-            from ..GlobalCache import GLOBAL_CACHE
             return (GLOBAL_CACHE.Inventory.GetModelCount(model_id) + GLOBAL_CACHE.Inventory.GetModelCountInEquipped(model_id)) > 0
     
     class Items:
         @staticmethod
         def IsSalvageable(item_id: int):
-            from ..GlobalCache import GLOBAL_CACHE
-            from ..Item import Item
             item_instance = Item.item_instance(item_id)
             return item_instance.is_salvageable  
         
@@ -327,7 +314,6 @@ class Checks:
     class Effects:
         @staticmethod
         def HasBuff(agent_id, skill_id):
-            from ..GlobalCache import GLOBAL_CACHE
             if GLOBAL_CACHE.Effects.HasEffect(agent_id, skill_id):
                 return True
             return False
@@ -338,13 +324,9 @@ class Checks:
         
 #region Agents
     class Agents:
-        from ..enums_src.GameData_enums import Range
 
         @staticmethod
         def InDanger(aggro_area=Range.Earshot, aggressive_only = False):
-            from ..AgentArray import AgentArray
-            from ..GlobalCache import GLOBAL_CACHE
-            from ..Py4GWcorelib import Utils
             if not Checks.Map.MapValid():
                 return False
             
@@ -362,9 +344,6 @@ class Checks:
         
         @staticmethod
         def InAggro(aggro_area=Range.Earshot.value, aggressive_only = False):
-            from ..AgentArray import AgentArray
-            from ..GlobalCache import GLOBAL_CACHE
-            from ..Py4GWcorelib import Utils
             if not Checks.Map.MapValid():
                 return False
             
@@ -383,8 +362,6 @@ class Checks:
 
         @staticmethod
         def IsEnemyBehind (agent_id):
-            from ..GlobalCache import GLOBAL_CACHE
-            import math
             player_agent_id = GLOBAL_CACHE.Player.GetAgentID()
             target = GLOBAL_CACHE.Player.GetTargetID()
             player_x, player_y = GLOBAL_CACHE.Agent.GetXY(player_agent_id)
@@ -412,15 +389,11 @@ class Checks:
         
         @staticmethod
         def IsValidItem(item_id):
-            from ..GlobalCache import GLOBAL_CACHE
             owner = GLOBAL_CACHE.Agent.GetItemAgentOwnerID(item_id)
             return (owner == GLOBAL_CACHE.Player.GetAgentID()) or (owner == 0)
         
         @staticmethod
         def HasEffect(agent_id, skill_id, exact_weapon_spell=False):
-            from ..GlobalCache import GLOBAL_CACHE
-            from ..Skill import Skill
-            from ..Agent import Agent
             result = GLOBAL_CACHE.Effects.HasEffect(agent_id, skill_id)
 
             if not result and not exact_weapon_spell:
@@ -441,7 +414,6 @@ class Checks:
                 skill_id (int): The skill ID to check.
             Returns: bool
             """
-            from ..GlobalCache import GLOBAL_CACHE
             player_energy = GLOBAL_CACHE.Agent.GetEnergy(agent_id) * GLOBAL_CACHE.Agent.GetMaxEnergy(agent_id)
             skill_energy = GLOBAL_CACHE.Skill.Data.GetEnergyCost(skill_id)
             return player_energy >= skill_energy
@@ -455,7 +427,6 @@ class Checks:
                 skill_id (int): The skill ID to check.
             Returns: bool
             """
-            from ..GlobalCache import GLOBAL_CACHE
             player_life = GLOBAL_CACHE.Agent.GetHealth(agent_id)
             skill_life = GLOBAL_CACHE.Skill.Data.GetHealthCost(skill_id)
             return player_life > skill_life
@@ -469,7 +440,6 @@ class Checks:
                 skill_id (int): The skill ID to check.
             Returns: bool
             """
-            from ..GlobalCache import GLOBAL_CACHE
             skill_adrenaline = GLOBAL_CACHE.Skill.Data.GetAdrenaline(skill_id)
             skill_adrenaline_a = GLOBAL_CACHE.Skill.Data.GetAdrenalineA(skill_id)
             if skill_adrenaline == 0:
@@ -489,7 +459,6 @@ class Checks:
                 skill_id (int): The skill ID to check.
             Returns: bool
             """
-            from ..GlobalCache import GLOBAL_CACHE
             dagger_status = GLOBAL_CACHE.Agent.GetDaggerStatus(agent_id)
             skill_combo = GLOBAL_CACHE.Skill.Data.GetCombo(skill_id)
 
@@ -506,14 +475,12 @@ class Checks:
         
         @staticmethod
         def IsSkillIDReady(skill_id):
-            from ..GlobalCache import GLOBAL_CACHE
             slot = GLOBAL_CACHE.SkillBar.GetSlotBySkillID(skill_id)
             return Checks.Skills.IsSkillSlotReady(slot)
 
 
         @staticmethod
         def IsSkillSlotReady(skill_slot):
-            from ..GlobalCache import GLOBAL_CACHE
             if skill_slot <= 0 or skill_slot > 8:
                 return False
             skill = GLOBAL_CACHE.SkillBar.GetSkillData(skill_slot)
@@ -524,7 +491,6 @@ class Checks:
             if not Checks.Map.MapValid():
                 return False
             
-            from ..GlobalCache import GLOBAL_CACHE
             player_agent_id = GLOBAL_CACHE.Player.GetAgentID()
 
             if (
@@ -538,7 +504,6 @@ class Checks:
         
         @staticmethod
         def InCastingProcess():
-            from ..GlobalCache import GLOBAL_CACHE
             player_agent_id = GLOBAL_CACHE.Player.GetAgentID()
             if GLOBAL_CACHE.Agent.IsCasting(player_agent_id) or GLOBAL_CACHE.SkillBar.GetCasting() != 0:
                 return True
@@ -553,7 +518,6 @@ class Checks:
             :param skill_id: ID of the skill being evaluated.
             :return: (adjusted_cast_time, adjusted_recharge_time)
             """
-            from ..GlobalCache import GLOBAL_CACHE
             activation_time = GLOBAL_CACHE.Skill.Data.GetActivation(skill_id)
             recharge_time = GLOBAL_CACHE.Skill.Data.GetRecharge(skill_id)
             
@@ -597,7 +561,6 @@ class Checks:
             :return: The reduced cost, rounded down to an integer.
             """
             #return base_cost  # Default to no reduction
-            from ..GlobalCache import GLOBAL_CACHE
             skill_type, _ = GLOBAL_CACHE.Skill.GetType(skill_id)
             _, skill_profession = GLOBAL_CACHE.Skill.GetProfession(skill_id)
             if (skill_type == 14 or #attack skills
@@ -630,7 +593,6 @@ class Checks:
                     Values are rounded to integers.
                     Minimum cost is 0 unless otherwise specified by an effect.
             """
-            from ..GlobalCache import GLOBAL_CACHE
             # Get base energy cost for the skill
             cost = GLOBAL_CACHE.Skill.Data.GetEnergyCost(skill_id)
             
@@ -2,18 +2,27 @@
 import importlib
 
 class _RProxy:
+    _routines = None
+
     def __getattr__(self, name: str):
-        root_pkg = importlib.import_module("Py4GWCoreLib")
-        return getattr(root_pkg.Routines, name)
+        routines = _RProxy._routines
+        if routines is None:
+            routines = importlib.import_module("Py4GWCoreLib").Routines
+            _RProxy._routines = routines
+            # From here on the module global is Routines itself and lookups skip the proxy
+            globals()["Routines"] = routines
+        return getattr(routines, name)
 
 Routines = _RProxy()
 
+from ..Py4GWcorelib import ConsoleLog, Timer, Utils
+from ..GlobalCache import GLOBAL_CACHE
+
 
 #region Movement
 class Movement:
     @staticmethod
     def FollowPath(path_handler, follow_handler, log_actions=False):
-        from ..Py4GWcorelib import ConsoleLog
         """
         Purpose: Follow a path using the path handler and follow handler objects.
         Args:
@@ -43,7 +52,6 @@ class Movement:
 
     class FollowXY:
         def __init__(self, tolerance=100):
-            from ..Py4GWcorelib import Timer
             """
             Initialize the FollowXY object with default values.
             Routine for following a waypoint.
@@ -61,7 +69,6 @@ class Movement:
             """
             Calculate the Euclidean distance between two points.
             """
-            from ..Py4GWcorelib import Utils
             return Utils.Distance(pos1, pos2)
 
         def move_to_waypoint(self, x=0, y=0, tolerance=None, use_action_queue = False):
@@ -72,7 +79,6 @@ class Movement:
                 y (float): Y coordinate of the waypoint.
                 tolerance (int, optional): The distance threshold to consider arrival. Defaults to the initialized value.
             """
-            from ..GlobalCache import GLOBAL_CACHE
             self.reset()
             self.waypoint = (x, y)
             self.tolerance = tolerance if tolerance is not None else self.tolerance
@@ -97,8 +103,6 @@ class Movement:
             Update the FollowXY object's state, check if the player has reached the waypoint,
             and issue new move commands if necessary.
             """
-            from ..GlobalCache import GLOBAL_CACHE
-            from ..Py4GWcorelib import ConsoleLog
             
             if self._paused:
                 return
@@ -146,8 +150,6 @@ class Movement:
             """
             Get the distance between the player and the current waypoint.
             """
-            from ..GlobalCache import GLOBAL_CACHE
-            from ..Py4GWcorelib import Utils
             current_position = GLOBAL_CACHE.Player.GetXY()
             return Utils.Distance(current_position, self.waypoint)
 
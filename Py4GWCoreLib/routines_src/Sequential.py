@@ -4,9 +4,16 @@ from typing import List, Tuple, Callable
 import importlib
 
 class _RProxy:
+    _routines = None
+
     def __getattr__(self, name: str):
-        root_pkg = importlib.import_module("Py4GWCoreLib")
-        return getattr(root_pkg.Routines, name)
+        routines = _RProxy._routines
+        if routines is None:
+            routines = importlib.import_module("Py4GWCoreLib").Routines
+            _RProxy._routines = routines
+            # From here on the module global is Routines itself and lookups skip the proxy
+            globals()["Routines"] = routines
+        return getattr(routines, name)
 
 Routines = _RProxy()
 
@@ -327,7 +334,6 @@ class Sequential:
             """Target and interact with chest and items."""
             from ..Py4GWcorelib import ActionQueueManager
             from ..Py4GWcorelib import LootConfig
-            from ..Py4GWcorelib import Utils
             from ..GlobalCache import GLOBAL_CACHE
             from ..enums_src.GameData_enums import Range
             from .Agents import Agents
@@ -344,8 +350,7 @@ class Sequential:
             sleep(1)
 
             Sequential.Agents.TargetNearestItem(distance=300)
-            filtered_loot = LootConfig().GetfilteredLootArray(Range.Area.value, multibox_loot= True)
-            item = Utils.GetFirstFromArray(filtered_loot)
+            item = LootConfig().GetNearestLoot(Range.Area.value)
             Sequential.Agents.ChangeTarget(item)
             Sequential.Player.InteractTarget()
             sleep(1)
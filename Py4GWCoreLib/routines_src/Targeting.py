@@ -1,34 +1,42 @@
 import importlib
 
 class _RProxy:
+    _routines = None
+
     def __getattr__(self, name: str):
-        root_pkg = importlib.import_module("Py4GWCoreLib")
-        return getattr(root_pkg.Routines, name)
+        routines = _RProxy._routines
+        if routines is None:
+            routines = importlib.import_module("Py4GWCoreLib").Routines
+            _RProxy._routines = routines
+            # From here on the module global is Routines itself and lookups skip the proxy
+            globals()["Routines"] = routines
+        return getattr(routines, name)
 
 Routines = _RProxy()
 
 from ..enums_src.GameData_enums import Range
+from ..GlobalCache import GLOBAL_CACHE
+from ..Py4GWcorelib import Utils
+from ..AgentArray import AgentArray
+from .Checks import Checks
+from .Agents import Agents
 
 #region Targetting
 class Targeting:
     
     @staticmethod
     def InteractTarget():
-        from ..GlobalCache import GLOBAL_CACHE
         """Interact with the target"""
         GLOBAL_CACHE.Player.Interact(GLOBAL_CACHE.Player.GetTargetID(), False)
     
     @staticmethod
     def SafeChangeTarget( target_id):
-        from ..GlobalCache import GLOBAL_CACHE
         
         if GLOBAL_CACHE.Agent.IsValid(target_id):
             GLOBAL_CACHE.Player.ChangeTarget(target_id)
         
     @staticmethod
     def HasArrivedToTarget():
-        from ..Py4GWcorelib import Utils
-        from ..GlobalCache import GLOBAL_CACHE
         """Check if the player has arrived at the target."""
         player_x, player_y = GLOBAL_CACHE.Player.GetXY()
         target_id = GLOBAL_CACHE.Player.GetTargetID()
@@ -37,8 +45,6 @@ class Targeting:
     
     @staticmethod
     def GetAllAlliesArray(distance=Range.SafeCompass.value):
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
 
         ally_array = GLOBAL_CACHE.AgentArray.GetAllyArray()
         ally_array = AgentArray.Filter.ByDistance(ally_array, GLOBAL_CACHE.Player.GetXY(), distance)
@@ -54,52 +60,61 @@ class Targeting:
     
     @staticmethod
     def GetNearestSpirit(distance=Range.Earshot.value):
-        from ..Routines import Routines
         v_target = Routines.Agents.GetNearestSpirit(distance)
         return v_target
 
+    @staticmethod
+    def AllyCondition(distance, other_ally=False, filter_skill_id=0):
+        """The checks of FilterAllyArray fused into one predicate, for the single pass selectors."""
+
+        px, py = GLOBAL_CACHE.Player.GetXY()
+        player_id = GLOBAL_CACHE.Player.GetAgentID()
+        max_sq = distance * distance
+
+        def _condition(agent_id):
+            x, y = GLOBAL_CACHE.Agent.GetXY(agent_id)
+            if (x - px) * (x - px) + (y - py) * (y - py) > max_sq:
+                return False
+            if not GLOBAL_CACHE.Agent.IsAlive(agent_id):
+                return False
+            if other_ally and agent_id == player_id:
+                return False
+            if filter_skill_id != 0 and Checks.Agents.HasEffect(agent_id, filter_skill_id):
+                return False
+            return True
+
+        return _condition
+
     @staticmethod
     def FilterAllyArray(array, distance, other_ally=False, filter_skill_id=0):
-        from .Checks import Checks
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
+        return AgentArray.Filter.ByCondition(array, Targeting.AllyCondition(distance, other_ally, filter_skill_id))
 
-        array = AgentArray.Filter.ByDistance(array, GLOBAL_CACHE.Player.GetXY(), distance)
-        array = AgentArray.Filter.ByCondition(array, lambda agent_id: GLOBAL_CACHE.Agent.IsAlive(agent_id))
-            
-        if other_ally:
-            array = AgentArray.Filter.ByCondition(array, lambda agent_id: GLOBAL_CACHE.Player.GetAgentID() != agent_id)
-        
-        if filter_skill_id != 0:
-            array = AgentArray.Filter.ByCondition(array, lambda agent_id: not Checks.Agents.HasEffect(agent_id, filter_skill_id))
-        
-        return array
+    @staticmethod
+    def _LowestAllyOrPet(distance, other_ally, filter_skill_id, condition=None):
+        """Lowest health ally (or pet) passing condition, one pass over the ally and spirit/pet arrays."""
+
+        is_valid = Targeting.AllyCondition(distance, other_ally, filter_skill_id)
+        if condition is not None:
+            ally_condition = lambda agent_id: is_valid(agent_id) and condition(agent_id)
+        else:
+            ally_condition = is_valid
+        # condition (IsMartial/IsMelee) reads weapon data pets don't have, so pets are only checked for validity
+        pet_condition = lambda agent_id: is_valid(agent_id) and not GLOBAL_CACHE.Agent.IsSpawned(agent_id) #filter spirits
+
+        lowest_ally = AgentArray.Select.LowestHealth(GLOBAL_CACHE.AgentArray.GetAllyArray(), ally_condition)
+        lowest_pet = AgentArray.Select.LowestHealth(GLOBAL_CACHE.AgentArray.GetSpiritPetArray(), pet_condition)
+        if lowest_ally == 0 or lowest_pet == 0:
+            return lowest_ally or lowest_pet
+        if GLOBAL_CACHE.Agent.GetHealth(lowest_pet) < GLOBAL_CACHE.Agent.GetHealth(lowest_ally):
+            return lowest_pet
+        return lowest_ally
 
     @staticmethod
     def TargetLowestAlly(other_ally=False,filter_skill_id=0):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-
-        distance = Range.Spellcast.value
-        ally_array = GLOBAL_CACHE.AgentArray.GetAllyArray()
-        ally_array = Targeting.FilterAllyArray(ally_array, distance, other_ally, filter_skill_id) 
-        
-        
-        spirit_pet_array = GLOBAL_CACHE.AgentArray.GetSpiritPetArray()
-        spirit_pet_array = Targeting.FilterAllyArray(spirit_pet_array, distance, other_ally, filter_skill_id)
-        spirit_pet_array = AgentArray.Filter.ByCondition(spirit_pet_array, lambda agent_id: not GLOBAL_CACHE.Agent.IsSpawned(agent_id)) #filter spirits
-        ally_array = AgentArray.Manipulation.Merge(ally_array, spirit_pet_array) #added Pets
-        
-        ally_array = AgentArray.Sort.ByHealth(ally_array)   
-        return Utils.GetFirstFromArray(ally_array)
+        return Targeting._LowestAllyOrPet(Range.Spellcast.value, other_ally, filter_skill_id)
         
     @staticmethod
     def TargetLowestAllyEnergy(other_ally=False, filter_skill_id=0):
-        from ..Py4GWcorelib import Utils
-        from .Checks import Checks
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
 
         BLOOD_IS_POWER = GLOBAL_CACHE.Skill.GetID("Blood_is_Power")
         BLOOD_RITUAL = GLOBAL_CACHE.Skill.GetID("Blood_Ritual")
@@ -110,86 +125,38 @@ class Targeting:
                 return energy
             return 1.0 #default return full energy to prevent issues
         
-        distance = Range.Spellcast.value
+        is_valid = Targeting.AllyCondition(Range.Spellcast.value, other_ally, filter_skill_id)
         ally_array = GLOBAL_CACHE.AgentArray.GetAllyArray()
-        ally_array = Targeting.FilterAllyArray(ally_array, distance, other_ally, filter_skill_id)
-        ally_array = AgentArray.Filter.ByCondition(ally_array, lambda agent_id: not Checks.Agents.HasEffect(agent_id, BLOOD_IS_POWER))
-        ally_array = AgentArray.Filter.ByCondition(ally_array, lambda agent_id: not Checks.Agents.HasEffect(agent_id, BLOOD_RITUAL))
-        
-        ally_array = AgentArray.Sort.ByCondition(ally_array, lambda agent_id: GetEnergyValues(agent_id))
-        return Utils.GetFirstFromArray(ally_array)
+        return AgentArray.Select.ArgMin(
+            ally_array, GetEnergyValues,
+            lambda agent_id: (is_valid(agent_id)
+                              and not Checks.Agents.HasEffect(agent_id, BLOOD_IS_POWER)
+                              and not Checks.Agents.HasEffect(agent_id, BLOOD_RITUAL)))
 
     @staticmethod
     def TargetLowestAllyCaster(other_ally=False, filter_skill_id=0):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
 
-        distance = Range.Spellcast.value
+        is_valid = Targeting.AllyCondition(Range.Spellcast.value, other_ally, filter_skill_id)
         ally_array = GLOBAL_CACHE.AgentArray.GetAllyArray()
-        ally_array = Targeting.FilterAllyArray(ally_array, distance, other_ally, filter_skill_id)
-        ally_array = AgentArray.Filter.ByCondition(ally_array, lambda agent_id: GLOBAL_CACHE.Agent.IsCaster(agent_id))
-
-        ally_array = AgentArray.Sort.ByHealth(ally_array)
-        return Utils.GetFirstFromArray(ally_array)
+        return AgentArray.Select.LowestHealth(ally_array, lambda agent_id: is_valid(agent_id) and GLOBAL_CACHE.Agent.IsCaster(agent_id))
 
     @staticmethod
     def TargetLowestAllyMartial(other_ally=False, filter_skill_id=0):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-
-        distance = Range.Spellcast.value
-        ally_array = GLOBAL_CACHE.AgentArray.GetAllyArray()
-        ally_array = Targeting.FilterAllyArray(ally_array, distance, other_ally, filter_skill_id)
-        ally_array = AgentArray.Filter.ByCondition(ally_array, lambda agent_id: GLOBAL_CACHE.Agent.IsMartial(agent_id))
-        
-        spirit_pet_array = GLOBAL_CACHE.AgentArray.GetSpiritPetArray()
-        spirit_pet_array = Targeting.FilterAllyArray(spirit_pet_array, distance, other_ally, filter_skill_id)
-        spirit_pet_array = AgentArray.Filter.ByCondition(spirit_pet_array, lambda agent_id: not GLOBAL_CACHE.Agent.IsSpawned(agent_id)) #filter spirits
-        ally_array = AgentArray.Manipulation.Merge(ally_array, spirit_pet_array) #added Pets
-        
-        ally_array = AgentArray.Sort.ByHealth(ally_array)
-        return Utils.GetFirstFromArray(ally_array)
+        return Targeting._LowestAllyOrPet(Range.Spellcast.value, other_ally, filter_skill_id, GLOBAL_CACHE.Agent.IsMartial)
 
     @staticmethod
     def TargetLowestAllyMelee(other_ally=False, filter_skill_id=0):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-
-        distance = Range.Spellcast.value
-        ally_array = GLOBAL_CACHE.AgentArray.GetAllyArray()
-        ally_array = Targeting.FilterAllyArray(ally_array, distance, other_ally, filter_skill_id)
-        ally_array = AgentArray.Filter.ByCondition(ally_array, lambda agent_id: GLOBAL_CACHE.Agent.IsMelee(agent_id))
-        
-        spirit_pet_array = GLOBAL_CACHE.AgentArray.GetSpiritPetArray()
-        spirit_pet_array = Targeting.FilterAllyArray(spirit_pet_array, distance, other_ally, filter_skill_id)
-        spirit_pet_array = AgentArray.Filter.ByCondition(spirit_pet_array, lambda agent_id: not GLOBAL_CACHE.Agent.IsSpawned(agent_id)) #filter spirits
-        ally_array = AgentArray.Manipulation.Merge(ally_array, spirit_pet_array) #added Pets
-        
-        ally_array = AgentArray.Sort.ByHealth(ally_array)
-        return Utils.GetFirstFromArray(ally_array)
+        return Targeting._LowestAllyOrPet(Range.Spellcast.value, other_ally, filter_skill_id, GLOBAL_CACHE.Agent.IsMelee)
 
     @staticmethod
     def TargetLowestAllyRanged(other_ally=False, filter_skill_id=0):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
 
-        distance = Range.Spellcast.value
+        is_valid = Targeting.AllyCondition(Range.Spellcast.value, other_ally, filter_skill_id)
         ally_array = GLOBAL_CACHE.AgentArray.GetAllyArray()
-        ally_array = Targeting.FilterAllyArray(ally_array, distance, other_ally, filter_skill_id)
-        ally_array = AgentArray.Filter.ByCondition(ally_array, lambda agent_id: GLOBAL_CACHE.Agent.IsRanged(agent_id))
-        
-        ally_array = AgentArray.Sort.ByHealth(ally_array)
-        return Utils.GetFirstFromArray(ally_array)
+        return AgentArray.Select.LowestHealth(ally_array, lambda agent_id: is_valid(agent_id) and GLOBAL_CACHE.Agent.IsRanged(agent_id))
 
     @staticmethod  
     def TargetNearestItem():
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
 
         def IsValidItem(item_id):
             if item_id == 0:
@@ -211,9 +178,6 @@ class Targeting:
 
     @staticmethod
     def TargetClusteredEnemy(area=4500.0):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
 
         distance = area
         enemy_array = GLOBAL_CACHE.AgentArray.GetEnemyArray()
@@ -226,10 +190,6 @@ class Targeting:
 
     @staticmethod
     def GetEnemyAttacking(max_distance=4500.0, aggressive_only = False):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from .Agents import Agents
         player_pos = GLOBAL_CACHE.Player.GetXY()
         enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
         enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsAttacking(agent_id))
@@ -238,10 +198,6 @@ class Targeting:
 
     @staticmethod
     def GetEnemyCasting(max_distance=4500.0, aggressive_only = False):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from .Agents import Agents
         player_pos = GLOBAL_CACHE.Player.GetXY()
         enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
         enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsCasting(agent_id))
@@ -250,10 +206,6 @@ class Targeting:
 
     @staticmethod
     def GetEnemyCastingSpell(max_distance=4500.0, aggressive_only = False):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from .Agents import Agents
         def _filter_spells(enemy_array):
             result_array = []
             for enemy_id in enemy_array:
@@ -273,10 +225,6 @@ class Targeting:
 
     @staticmethod
     def GetEnemyInjured(max_distance=4500.0, aggressive_only = False): 
-        from ..Py4GWcorelib import Utils 
-        from ..AgentArray import AgentArray 
-        from ..GlobalCache import GLOBAL_CACHE 
-        from .Agents import Agents 
         player_pos = GLOBAL_CACHE.Player.GetXY() 
         enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only) 
         # sort by lowest HP, then by distance 
@@ -291,10 +239,6 @@ class Targeting:
 
     @staticmethod
     def GetEnemyHealthy(max_distance=4500.0, aggressive_only = False):
-        from ..Py4GWcorelib import Utils 
-        from ..AgentArray import AgentArray 
-        from ..GlobalCache import GLOBAL_CACHE 
-        from .Agents import Agents 
         player_pos = GLOBAL_CACHE.Player.GetXY() 
         enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only) 
         # sort by lowest HP, then by distance 
@@ -309,10 +253,6 @@ class Targeting:
 
     @staticmethod
     def GetEnemyConditioned(max_distance=4500.0, aggressive_only = False):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from .Agents import Agents
         player_pos = GLOBAL_CACHE.Player.GetXY()
         enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
         enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsConditioned(agent_id))
@@ -321,10 +261,6 @@ class Targeting:
 
     @staticmethod
     def GetEnemyBleeding(max_distance=4500.0, aggressive_only = False):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from .Agents import Agents
         player_pos = GLOBAL_CACHE.Player.GetXY()
         enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
         enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsBleeding(agent_id))
@@ -333,10 +269,6 @@ class Targeting:
 
     @staticmethod
     def GetEnemyPoisoned(max_distance=4500.0, aggressive_only = False):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from .Agents import Agents
         player_pos = GLOBAL_CACHE.Player.GetXY()
         enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
         enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsPoisoned(agent_id))
@@ -345,10 +277,6 @@ class Targeting:
      
     @staticmethod   
     def GetEnemyCrippled(max_distance=4500.0, aggressive_only = False):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from .Agents import Agents
         player_pos = GLOBAL_CACHE.Player.GetXY()
         enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
         enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsCrippled(agent_id))
@@ -357,10 +285,6 @@ class Targeting:
 
     @staticmethod
     def GetEnemyHexed(max_distance=4500.0, aggressive_only = False):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from .Agents import Agents
         player_pos = GLOBAL_CACHE.Player.GetXY()
         enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
         enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsHexed(agent_id))
@@ -369,10 +293,6 @@ class Targeting:
 
     @staticmethod
     def GetEnemyDegenHexed(max_distance=4500.0, aggressive_only = False):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from .Agents import Agents
         player_pos = GLOBAL_CACHE.Player.GetXY()
         enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
         enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsDegenHexed(agent_id))
@@ -381,10 +301,6 @@ class Targeting:
 
     @staticmethod
     def GetEnemyEnchanted(max_distance=4500.0, aggressive_only = False):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from .Agents import Agents
         player_pos = GLOBAL_CACHE.Player.GetXY()
         enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
         enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsEnchanted(agent_id))
@@ -393,10 +309,6 @@ class Targeting:
 
     @staticmethod
     def GetEnemyMoving(max_distance=4500.0, aggressive_only = False):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from .Agents import Agents
         player_pos = GLOBAL_CACHE.Player.GetXY()
         enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
         enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsMoving(agent_id))
@@ -405,10 +317,6 @@ class Targeting:
 
     @staticmethod
     def GetEnemyKnockedDown(max_distance=4500.0, aggressive_only = False):
-        from ..Py4GWcorelib import Utils
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from .Agents import Agents
         player_pos = GLOBAL_CACHE.Player.GetXY()
         enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
         enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: GLOBAL_CACHE.Agent.IsKnockedDown(agent_id))
@@ -417,11 +325,6 @@ class Targeting:
 
     @staticmethod
     def GetEnemyWithEffect(effect_skill_id, max_distance=4500.0, aggressive_only = False):
-        from ..Py4GWcorelib import Utils
-        from .Checks import Checks
-        from ..AgentArray import AgentArray
-        from ..GlobalCache import GLOBAL_CACHE
-        from .Agents import Agents
         player_pos = GLOBAL_CACHE.Player.GetXY()
         enemy_array = Agents.GetFilteredEnemyArray(player_pos[0], player_pos[1], max_distance, aggressive_only)
         enemy_array = AgentArray.Filter.ByCondition(enemy_array, lambda agent_id: Checks.Effects.HasEffect(agent_id, effect_skill_id))
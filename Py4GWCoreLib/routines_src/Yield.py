@@ -10,6 +10,7 @@ from Py4GWCoreLib.routines_src import Checks
 
 from ..GlobalCache import GLOBAL_CACHE
 from ..Py4GWcorelib import ConsoleLog, Console, Utils, ActionQueueManager
+from ..py4gwcorelib_src.CoroutineRunner import WaitUntil, now_ms
 
 from ..enums_src.Model_enums import ModelID
 from ..enums_src.UI_enums import ControlAction
@@ -19,9 +20,16 @@ import functools
 import importlib
 
 class _RProxy:
+    _routines = None
+
     def __getattr__(self, name: str):
-        root_pkg = importlib.import_module("Py4GWCoreLib")
-        return getattr(root_pkg.Routines, name)
+        routines = _RProxy._routines
+        if routines is None:
+            routines = importlib.import_module("Py4GWCoreLib").Routines
+            _RProxy._routines = routines
+            # From here on the module global is Routines itself and lookups skip the proxy
+            globals()["Routines"] = routines
+        return getattr(routines, name)
 
 Routines = _RProxy()
 
@@ -50,10 +58,11 @@ def _run_bt_tree(tree, return_bool: bool=False, throttle_ms: int = 100):
 class Yield:
     @staticmethod
     def wait(ms: int):
-        import time
-        start = time.time()
-        while (time.time() - start) * 1000 < ms:
-            yield
+        # Yielding the deadline lets a CoroutineRunner park us until then;
+        # drivers that resume us every frame still get the same wait from the clock check.
+        token = WaitUntil(now_ms() + ms)
+        while now_ms() < token.deadline:
+            yield token
 
 #region Player
     class Player:
@@ -701,7 +710,7 @@ class Yield:
             """Target and interact with chest and items."""
             from .Agents import Agents
             
-            from ..Py4GWcorelib import LootConfig, Utils
+            from ..Py4GWcorelib import LootConfig
             from ..enums_src.GameData_enums import Range
 
             nearest_chest = Agents.GetNearestChest(2500)
@@ -717,8 +726,7 @@ class Yield:
             yield from Yield.wait(1000)
 
             yield from Yield.Agents.TargetNearestItem(distance=300)
-            filtered_loot = LootConfig().GetfilteredLootArray(Range.Area.value, multibox_loot= True)
-            item = Utils.GetFirstFromArray(filtered_loot)
+            item = LootConfig().GetNearestLoot(Range.Area.value)
             yield from Yield.Agents.ChangeTarget(item)
             yield from Yield.Player.InteractTarget()
             yield from Yield.wait(1000)
@@ -9,7 +9,7 @@ import sys
 
 module_name = "Widget Manager"
 ini_file_location = "Py4GW.ini"
-ini_handler = IniHandler(ini_file_location)
+ini_handler = IniHandler(ini_file_location, flush_delay_ms=1000)
 
 class Widget:
     def __init__(self, name : str, module: ModuleType, widget_data: dict):
@@ -0,0 +1,118 @@
+from Py4GWCoreLib import Routines, LootConfig, ConsoleLog
+from Py4GWCoreLib.enums_src.GameData_enums import Range
+import PyImGui
+import builtins
+import importlib
+import time
+
+module_name = "Routines Import Benchmark"
+
+# Counts how often the import machinery is entered while the routines a combat frame
+# typically calls run, so a function-level import or a proxy lookup that creeps back
+# into the per-frame path shows up as a non-zero count instead of a vague slowdown.
+
+def simulated_combat_tick():
+    Routines.Checks.Map.MapValid()
+    Routines.Checks.Agents.InDanger(Range.Earshot)
+    Routines.Checks.Party.IsPartyWiped()
+    Routines.Checks.Party.IsDeadPartyMemberBehind()
+    Routines.Agents.GetNearestEnemy(Range.Spellcast.value)
+    Routines.Agents.GetNearestEnemyCaster(Range.Spellcast.value)
+    Routines.Agents.GetNearestCorpse(Range.Spellcast.value)
+    Routines.Agents.GetNearestSpirit(Range.Spellcast.value)
+    Routines.Agents.GetLowestMinion(Range.Spellcast.value)
+    Routines.Targeting.TargetLowestAlly()
+    Routines.Targeting.TargetLowestAllyEnergy()
+    Routines.Targeting.TargetClusteredEnemy(Range.Spellcast.value)
+    LootConfig().GetfilteredLootArray(Range.Earshot.value)
+
+
+class ImportCounter:
+    """Wraps builtins.__import__ and importlib.import_module while active."""
+    def __init__(self):
+        self.imports = 0
+        self.import_modules = 0
+        self.by_name: dict[str, int] = {}
+        self._original_import = None
+        self._original_import_module = None
+
+    def __enter__(self):
+        self._original_import = builtins.__import__
+        self._original_import_module = importlib.import_module
+        original_import = self._original_import
+        original_import_module = self._original_import_module
+
+        def counting_import(name, globals=None, locals=None, fromlist=(), level=0):
+            self.imports += 1
+            key = ("." * level) + name
+            self.by_name[key] = self.by_name.get(key, 0) + 1
+            return original_import(name, globals, locals, fromlist, level)
+
+        def counting_import_module(name, package=None):
+            self.import_modules += 1
+            key = f"import_module({name})"
+            self.by_name[key] = self.by_name.get(key, 0) + 1
+            return original_import_module(name, package)
+
+        builtins.__import__ = counting_import
+        importlib.import_module = counting_import_module
+        return self
+
+    def __exit__(self, *exc):
+        builtins.__import__ = self._original_import
+        importlib.import_module = self._original_import_module
+        return False
+
+
+class BenchmarkState:
+    def __init__(self):
+        self.ticks = 100
+        self.result: dict | None = None
+
+state = BenchmarkState()
+
+
+def run_benchmark(ticks: int) -> dict:
+    simulated_combat_tick()  # first call binds lazily resolved references, not counted
+    counter = ImportCounter()
+    start = time.perf_counter()
+    with counter:
+        for _ in range(ticks):
+            simulated_combat_tick()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    top = sorted(counter.by_name.items(), key=lambda item: item[1], reverse=True)[:15]
+    return {
+        "ticks": ticks,
+        "imports_per_tick": counter.imports / ticks,
+        "import_module_per_tick": counter.import_modules / ticks,
+        "ms_per_tick": elapsed_ms / ticks,
+        "top": top,
+    }
+
+
+def draw_window():
+    if PyImGui.begin(module_name):
+        state.ticks = PyImGui.input_int("Ticks", state.ticks)
+        if PyImGui.button("Run"):
+            state.result = run_benchmark(max(1, state.ticks))
+            ConsoleLog(module_name, f"{state.result['imports_per_tick']:.2f} imports, {state.result['import_module_per_tick']:.2f} import_module calls, {state.result['ms_per_tick']:.3f} ms per tick")
+
+        result = state.result
+        if result:
+            PyImGui.separator()
+            PyImGui.text(f"Ticks: {result['ticks']}")
+            PyImGui.text(f"__import__ per tick: {result['imports_per_tick']:.2f}")
+            PyImGui.text(f"import_module per tick: {result['import_module_per_tick']:.2f}")
+            PyImGui.text(f"Time per tick: {result['ms_per_tick']:.3f} ms")
+            for name, count in result["top"]:
+                PyImGui.text(f"{count:>6}  {name}")
+
+    PyImGui.end()
+
+
+def main():
+    draw_window()
+
+
+if __name__ == "__main__":
+    main()
@@ -86,7 +86,7 @@ widget_handler = get_widget_handler()
 
 
 # ——— Window Persistence Setup ———
-ini_window = IniHandler(INI_WIDGET_WINDOW_PATH)
+ini_window = IniHandler(INI_WIDGET_WINDOW_PATH, flush_delay_ms=1000)
 save_window_timer = Timer()
 save_window_timer.Start()
 
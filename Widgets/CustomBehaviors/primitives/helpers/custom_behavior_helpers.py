@@ -300,7 +300,7 @@ class Resources:
             for account in accounts:
                 if account.PlayerID == agent_id:
 
-                    for buff in account.PlayerData.BuffData:
+                    for buff in account.PlayerData.BuffData[:account.BuffCount]:
                         if buff.SkillId == skill_id:
                             return True
 
@@ -64,11 +64,7 @@ def main():
     else:
         LootConfig().ClearItemIDBlacklist()
     
-    for routine in GLOBAL_CACHE.Coroutines[:]:
-        try:
-            next(routine)
-        except StopIteration:
-            GLOBAL_CACHE.Coroutines.remove(routine)
+    GLOBAL_CACHE.Coroutines.Tick()
     
     if GLOBAL_CACHE.Map.IsMapLoading() or GLOBAL_CACHE.Map.IsInCinematic():
         if widget_config.throttle_transition_queue.IsExpired():
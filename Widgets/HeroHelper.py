@@ -11,7 +11,7 @@ script_directory = os.path.dirname(os.path.abspath(__file__))
 root_directory = os.path.normpath(os.path.join(script_directory, ".."))
 INI_FILE_LOCATION = os.path.join(root_directory, "Widgets/Config/HeroHelper.ini")
 
-ini_handler = IniHandler(INI_FILE_LOCATION)
+ini_handler = IniHandler(INI_FILE_LOCATION, flush_delay_ms=1000)
 
 action_queue = ActionQueue()
 
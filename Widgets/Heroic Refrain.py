@@ -36,7 +36,7 @@ if project_root not in sys.path:
 
 # ─── Window Persistence Setup ───────────────────────────────────────────
 WINDOW_SECTION = "Heroic Refrain"
-ini_window = IniHandler(os.path.join(script_directory, "Config", "Heroic_Refrain_window.ini"))
+ini_window = IniHandler(os.path.join(script_directory, "Config", "Heroic_Refrain_window.ini"), flush_delay_ms=1000)
 save_window_timer = Timer()
 save_window_timer.Start()
 
@@ -70,7 +70,7 @@ AUTO_RUN_ALL   = cfg.getboolean("HeroicRefrain","AutoRunAll",  fallback=True)
 
 # ─── Window Persistence Setup ───────────────────────────────────────────
 WINDOW_SECTION = "Heroic Refrain"
-ini_window = IniHandler(os.path.join(script_directory, "Config", "Heroic_Refrain_window.ini"))
+ini_window = IniHandler(os.path.join(script_directory, "Config", "Heroic_Refrain_window.ini"), flush_delay_ms=1000)
 save_window_timer = Timer()
 save_window_timer.Start()
 
@@ -14,7 +14,7 @@ script_directory = os.path.dirname(os.path.abspath(__file__))
 root_directory = os.path.normpath(os.path.join(script_directory, ".."))
 ini_file_location = os.path.join(root_directory, "Widgets/Config/InstanceTimer.ini")
 
-ini_handler = IniHandler(ini_file_location)
+ini_handler = IniHandler(ini_file_location, flush_delay_ms=1000)
 sync_interval = 1000
 
 class Config:
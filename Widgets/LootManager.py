@@ -27,7 +27,7 @@ last_rarity_timestamp = 0
 
 script_directory = os.path.dirname(os.path.abspath(__file__))
 # ——— Window Persistence Setup ———
-ini_window = IniHandler(os.path.join(script_directory, "Config", "loot_window.ini"))
+ini_window = IniHandler(os.path.join(script_directory, "Config", "loot_window.ini"), flush_delay_ms=1000)
 save_window_timer = Timer()
 save_window_timer.Start()
 
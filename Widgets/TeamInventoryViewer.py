@@ -51,7 +51,7 @@ INI_WIDGET_WINDOW_PATH = os.path.join(BASE_DIR, "team_inventory_viewer.ini")
 os.makedirs(BASE_DIR, exist_ok=True)
 
 # ——— Window Persistence Setup ———
-ini_window = IniHandler(INI_WIDGET_WINDOW_PATH)
+ini_window = IniHandler(INI_WIDGET_WINDOW_PATH, flush_delay_ms=1000)
 save_window_timer = Timer()
 save_window_timer.Start()
 inventory_write_timer = ThrottledTimer(3000)
@@ -21,7 +21,7 @@ X_POS = "x"
 Y_POS = "y"
 
 # === Persistent Window State ===
-ini_window = IniHandler(INI_WIDGET_WINDOW_PATH)
+ini_window = IniHandler(INI_WIDGET_WINDOW_PATH, flush_delay_ms=1000)
 save_window_timer = Timer()
 save_window_timer.Start()
 first_run = True
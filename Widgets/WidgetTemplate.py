@@ -27,7 +27,7 @@ os.makedirs(BASE_DIR, exist_ok=True)
 cached_data = CacheData()
 
 # ——— Window Persistence Setup ———
-ini_window = IniHandler(INI_WIDGET_WINDOW_PATH)
+ini_window = IniHandler(INI_WIDGET_WINDOW_PATH, flush_delay_ms=1000)
 save_window_timer = Timer()
 save_window_timer.Start()
 